@@ -179,6 +179,11 @@ def _display_results(result: LoadResult, validate_only: bool):
     click.echo(f"  Loaded:  {result.loaded_count}")
     click.echo(f"  Skipped: {result.skipped_count}")
     click.echo(f"  Errors:  {result.error_count}")
+    if result.added or result.changed or result.unchanged:
+        click.echo(
+            f"  Diff:    {len(result.added)} added, {len(result.changed)} changed, "
+            f"{len(result.unchanged)} unchanged"
+        )
 
     # Warnings
     if result.warnings:
@@ -1028,14 +1028,18 @@ def sync(ctx, force: bool):
 
             # Generate memory files from database
             if db_service:
-                from agentpm.core.database.methods import work_items as wi_methods
-                from agentpm.core.database.methods import tasks as task_methods
+                from agentpm.core.database.methods import project_tree
                 from agentpm.cli.utils.project import get_current_project_id
 
                 project_id = get_current_project_id(ctx)
 
-                # Get active work items
-                work_items = wi_methods.list_work_items(db_service, project_id=project_id, status_filter=["active", "in_progress"])
+                # Get active work items with their tasks
+                tree = project_tree.load_project_tree(
+                    db_service,
+                    project_id=project_id,
+                    statuses=["active", "in_progress"]
+                )
+                work_items = [node.work_item for node in tree.work_items]
 
                 progress.update(task, description="Generating project context...")
 
@@ -1057,9 +1061,7 @@ def sync(ctx, force: bool):
 
                 # Generate recent_work.md
                 recent_content = "# Recent Work\n\n"
-                all_tasks = []
-                for wi in work_items:
-                    all_tasks.extend(task_methods.list_tasks(db_service, work_item_id=wi.id))
+                all_tasks = tree.all_tasks()
 
                 recent_tasks = sorted(all_tasks, key=lambda t: t.updated_at or t.created_at, reverse=True)[:20]
                 recent_content += f"## Recent Tasks ({len(recent_tasks)})\n\n"
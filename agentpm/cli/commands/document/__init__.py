@@ -94,6 +94,7 @@ from .migrate_visibility import migrate_visibility
 from .publish import publish
 from .unpublish import unpublish
 from .list_unpublished import list_unpublished
+from .sync import sync
 
 # Register subcommands
 document.add_command(add)
@@ -107,3 +108,4 @@ document.add_command(migrate_visibility)
 document.add_command(publish)
 document.add_command(unpublish)
 document.add_command(list_unpublished)
+document.add_command(sync)
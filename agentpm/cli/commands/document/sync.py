@@ -0,0 +1,85 @@
+"""
+apm document sync - Bring published documents in line with their sources
+"""
+
+import click
+from agentpm.core.services.document_publisher import DocumentPublisher
+
+
+@click.command()
+@click.option('--check', 'check', is_flag=True,
+              help='Report drift without writing anything; exit 1 if any is found')
+@click.option('--workers', 'workers', type=int, default=None,
+              help='Copy threads (default: up to 8)')
+@click.pass_context
+def sync(ctx: click.Context, check: bool, workers: int):
+    """
+    Sync published documents with their sources.
+
+    Re-publishes documents whose public copy is missing or differs from the
+    source, and removes public copies that an earlier sync published but
+    whose source is gone. Paths are relative to the project root, so it can
+    run from any directory of the project. Hashes are cached in
+    .agentpm/publish_manifest.json, so only files whose size or modification
+    time changed are read.
+
+    \b
+    Actions Performed:
+      1. Restores missing sources from database content
+      2. Re-publishes missing or changed public copies (atomic rename)
+      3. Prunes public copies whose source was removed
+      4. Reports files in docs/ not tracked in the database
+
+    \b
+    Examples:
+      # Sync all published documents
+      apm document sync
+
+      # Report drift only (CI), non-zero exit if anything is out of sync
+      apm document sync --check
+
+    \b
+    See Also:
+      apm document publish <id>       # Publish a single document
+      apm document unpublish <id>     # Remove from public location
+    """
+    console = ctx.obj['console']
+    db = ctx.obj['db_service']
+
+    try:
+        publisher = DocumentPublisher(db)
+        result = publisher.sync_all(dry_run=check, max_workers=workers)
+    except Exception as e:
+        console.print()
+        console.print(f"❌ [red]Error syncing documents: {e}[/red]")
+        console.print()
+        raise click.Abort()
+
+    stats = result.stats
+    console.print()
+    console.print(f"📄 Checked {stats['checked']} published document(s), hashed {stats['hashed']} file(s)")
+    for label, key in (
+        ("Missing source", "missing_source"),
+        ("Missing public copy", "missing_dest"),
+        ("Content mismatch", "content_mismatch"),
+        ("Pruned", "pruned"),
+    ):
+        for entry in stats[key]:
+            path = entry["dest"] if isinstance(entry, dict) else entry
+            console.print(f"   [yellow]{label}:[/yellow] {path}")
+    if not check and stats["synced_files"]:
+        console.print(f"   [green]Re-published {len(stats['synced_files'])} file(s)[/green]")
+    if result.orphaned_files:
+        console.print(f"   [dim]{len(result.orphaned_files)} file(s) in docs/ not tracked in the database[/dim]")
+    console.print()
+
+    if not result.has_drift:
+        console.print("✅ [green]Published documents are in sync[/green]")
+    elif check:
+        console.print("⚠️  [yellow]Drift found - changes would be applied by: apm document sync[/yellow]")
+    else:
+        console.print("✅ [green]Drift corrected[/green]")
+    console.print()
+
+    if check and result.has_drift:
+        ctx.exit(1)
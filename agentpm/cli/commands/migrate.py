@@ -2,6 +2,8 @@
 apm migrate - Run pending database migrations
 """
 
+from pathlib import Path
+
 import click
 from agentpm.cli.utils.project import ensure_project_root
 from agentpm.cli.utils.services import get_database_service
@@ -12,7 +14,7 @@ from agentpm.core.database.migrations import (
 )
 
 
-@click.command(name='migrate')
+@click.group(name='migrate', invoke_without_command=True)
 @click.option('--list', 'list_only', is_flag=True, help='List pending migrations without applying')
 @click.option('--show-applied', is_flag=True, help='Show applied migrations')
 @click.pass_context
@@ -28,7 +30,12 @@ def migrate(ctx: click.Context, list_only: bool, show_applied: bool):
       apm migrate                    # Run all pending migrations
       apm migrate --list             # Show pending migrations
       apm migrate --show-applied     # Show applied migrations
+      apm migrate squash             # Regenerate the schema baseline
+      apm migrate index-advisor      # Flag full table scans in hot queries
     """
+    if ctx.invoked_subcommand is not None:
+        return
+
     console = ctx.obj['console']
     console_err = ctx.obj['console_err']
     project_root = ensure_project_root(ctx)
@@ -84,3 +91,133 @@ def migrate(ctx: click.Context, list_only: bool, show_applied: bool):
         console_err.print("💡 [yellow]Check migration files for errors[/yellow]")
         console_err.print(f"   Location: agentpm/core/database/migrations/files/\n")
         raise click.Abort()
+
+
+@migrate.command(name='squash')
+@click.option('--check', is_flag=True,
+              help='Verify the existing baseline against the migrations without writing')
+@click.option('--output', type=click.Path(path_type=Path), default=None,
+              help='Write the baseline to this file (default: packaged schema_baseline.sql)')
+@click.pass_context
+def squash(ctx: click.Context, check: bool, output: Path):
+    """
+    Regenerate the squashed schema baseline.
+
+    Replays every migration into a scratch database, dumps the resulting
+    schema and seed data as schema_baseline.sql, and verifies (SchemaDiffer
+    plus sqlite_master and seed data comparison) that a database loaded from
+    the snapshot equals the replayed one. New databases load the baseline in
+    one step and only replay migrations added after it.
+
+    \b
+    Examples:
+      apm migrate squash             # Regenerate and verify the baseline
+      apm migrate squash --check     # Fail if the baseline is stale or wrong
+    """
+    from agentpm.core.database.migrations import baseline
+
+    console = ctx.obj['console']
+    console_err = ctx.obj['console_err']
+    target = output or baseline.BASELINE_FILE
+
+    console.print("\n🔄 [bold]Replaying migrations into a scratch database...[/bold]")
+    snapshot, verification = baseline.squash(output=None if check else target)
+
+    if not verification.is_equal:
+        console_err.print("\n❌ [red]Snapshot does not match the replayed schema:[/red]")
+        for change in verification.schema_changes:
+            console_err.print(f"   • {change.change_type.value}: {change.object_name}")
+        for difference in verification.differences:
+            console_err.print(f"   • {difference}")
+        console_err.print()
+        raise click.Abort()
+
+    if check:
+        existing = baseline.load_baseline(target)
+        if existing is None or existing.sql != snapshot.sql:
+            console_err.print(f"\n❌ [red]Schema baseline is stale:[/red] {target}")
+            console_err.print("💡 [yellow]Regenerate with:[/yellow] apm migrate squash\n")
+            raise click.Abort()
+        console.print(f"\n✅ [green]Schema baseline {existing.version} is up to date[/green]\n")
+        return
+
+    console.print(f"\n✅ [green]Schema baseline {snapshot.version} written and verified[/green]")
+    console.print(f"   File: {target}")
+    console.print(f"   Size: {len(snapshot.sql.encode('utf-8')):,} bytes\n")
+
+
+@migrate.command(name='index-advisor')
+@click.option('--from', 'source', type=click.Path(exists=True, path_type=Path), default=None,
+              help='Captured queries: `apm testing db-profile --json` output or one statement per line '
+                   '(default: run the built-in list-view workload)')
+@click.option('--all', 'show_all', is_flag=True, help='Also show queries that use indexes')
+@click.option('--json', 'as_json', is_flag=True, help='Output JSON')
+@click.option('--strict', is_flag=True, help='Exit non-zero when any query scans a full table')
+@click.pass_context
+def index_advisor(ctx: click.Context, source: Path, show_all: bool, as_json: bool, strict: bool):
+    """
+    Replay captured query shapes through EXPLAIN QUERY PLAN.
+
+    Flags queries that read a whole table without an index (and sorts in a
+    temporary B-tree), with a suggested index for single-table shapes.
+
+    \b
+    Examples:
+      apm migrate index-advisor                        # Built-in list-view workload
+      apm testing db-profile --json > profile.json
+      apm migrate index-advisor --from profile.json    # Queries captured earlier
+      apm migrate index-advisor --strict               # CI: fail on full scans
+    """
+    import json
+
+    from rich.markup import escape
+
+    from agentpm.core.database.utils import index_advisor as advisor
+
+    console = ctx.obj['console']
+    console_err = ctx.obj['console_err']
+    project_root = ensure_project_root(ctx)
+    db = get_database_service(project_root)
+
+    if source:
+        try:
+            fingerprints = advisor.load_fingerprints(source)
+        except ValueError as e:
+            console_err.print(f"\n❌ [red]{e}[/red]\n")
+            raise click.Abort()
+    else:
+        profiler = db.enable_profiling()
+        try:
+            advisor.run_read_workload(db)
+        finally:
+            db.disable_profiling()
+        fingerprints = [stats.fingerprint for stats in profiler.stats()]
+
+    with db.connect() as conn:
+        results = advisor.advise(conn, fingerprints)
+    flagged = [advice for advice in results if advice.flagged]
+
+    if as_json:
+        click.echo(json.dumps([advice.to_dict() for advice in results], indent=2))
+    else:
+        console.print(f"\n🔍 [bold]Explained {len(results)} query shapes[/bold]")
+        for advice in (results if show_all else flagged):
+            marker = "⚠️ " if advice.flagged else "✅"
+            console.print(f"\n{marker} [cyan]{escape(advice.fingerprint)}[/cyan]")
+            for step in advice.plan:
+                console.print(f"     {escape(step)}", style="dim")
+            if advice.flagged:
+                console.print(f"   [yellow]Full scan:[/yellow] {', '.join(advice.full_scans)}")
+            elif advice.full_scans:
+                console.print(f"   Reads every row (unfiltered): {', '.join(advice.full_scans)}")
+            if advice.suggestion:
+                console.print(f"   [green]Suggested:[/green] {escape(advice.suggestion)}")
+            if advice.error:
+                console.print(f"   [red]Not explainable:[/red] {escape(advice.error)}")
+        if flagged:
+            console.print(f"\n⚠️  [yellow]{len(flagged)} query shape(s) scan a full table[/yellow]\n")
+        else:
+            console.print("\n✅ [green]Every query shape uses an index[/green]\n")
+
+    if strict and flagged:
+        raise click.exceptions.Exit(1)
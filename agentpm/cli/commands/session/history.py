@@ -171,6 +171,13 @@ def _show_stats(console, db, project_id: int, days: int):
         for stype, count in stats['session_type_distribution'].items():
             console.print(f"  {stype}: {count} sessions")
 
+    # Per-developer breakdown
+    if stats.get('developer_stats'):
+        console.print(f"\n[bold]By Developer:[/bold]")
+        for developer, dev_stats in sorted(stats['developer_stats'].items()):
+            console.print(f"  {developer}: {dev_stats['sessions']} sessions, "
+                          f"avg {dev_stats['avg_duration']:.1f} min")
+
     console.print()
 
 
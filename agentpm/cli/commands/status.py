@@ -18,8 +18,7 @@ from pathlib import Path
 from agentpm.cli.utils.project import ensure_project_root, get_current_project_id
 from agentpm.cli.utils.services import get_database_service
 from agentpm.core.database.methods import projects as project_methods
-from agentpm.core.database.methods import work_items as wi_methods
-from agentpm.core.database.methods import tasks as task_methods
+from agentpm.core.database.methods import project_tree
 
 
 @click.command()
@@ -53,12 +52,16 @@ def status(ctx: click.Context, format: str):
 
     # Get data
     project = project_methods.get_project(db, project_id)
-    work_items = wi_methods.list_work_items(db, project_id=project_id)
 
-    # Get all tasks
-    all_tasks = []
-    for wi in work_items:
-        all_tasks.extend(task_methods.list_tasks(db, work_item_id=wi.id))
+    # Work items and all their tasks (two queries; only the columns shown here)
+    tree = project_tree.load_project_tree(
+        db,
+        project_id=project_id,
+        work_item_columns=(),
+        task_columns=('effort_hours',)
+    )
+    work_items = [node.work_item for node in tree.work_items]
+    all_tasks = tree.all_tasks()
 
     if format == 'json':
         import json
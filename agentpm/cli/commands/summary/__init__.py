@@ -17,6 +17,7 @@ from .search import search_summaries
 from .delete import delete_summary
 from .stats import summary_stats
 from .types import types
+from .compact import compact_summaries
 
 
 @click.group()
@@ -32,6 +33,7 @@ summary.add_command(search_summaries, name='search')
 summary.add_command(delete_summary, name='delete')
 summary.add_command(summary_stats, name='stats')
 summary.add_command(types)
+summary.add_command(compact_summaries, name='compact')
 
 __all__ = [
     'summary',
@@ -40,5 +42,6 @@ __all__ = [
     'show_summary',
     'search_summaries',
     'delete_summary',
-    'summary_stats'
+    'summary_stats',
+    'compact_summaries'
 ]
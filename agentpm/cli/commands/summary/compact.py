@@ -0,0 +1,88 @@
+"""
+Summary Compaction Command
+
+Roll aged session summaries up into daily, weekly and per-work-item rollups.
+"""
+
+import json
+from datetime import date
+
+import click
+from rich.table import Table
+
+from agentpm.core.database.methods import summary_rollups
+from agentpm.cli.utils.project import ensure_project_root
+from agentpm.cli.utils.services import get_database_service
+
+
+@click.command()
+@click.option('--today', 'today', type=click.DateTime(formats=['%Y-%m-%d']),
+              help='Reference date for age thresholds (default: today)')
+@click.option('--daily-after', type=int, default=summary_rollups.RollupPolicy.daily_after_days,
+              show_default=True, help='Roll session summaries older than N days into daily rollups')
+@click.option('--weekly-after', type=int, default=summary_rollups.RollupPolicy.weekly_after_days,
+              show_default=True, help='Roll daily rollups older than N days into weekly rollups')
+@click.option('--work-item-after', type=int, default=summary_rollups.RollupPolicy.work_item_after_days,
+              show_default=True, help='Merge weekly rollups older than N days into one per work item')
+@click.option('--dry-run', is_flag=True, help='Report what would be compacted without writing')
+@click.option('--format', type=click.Choice(['table', 'json']), default='table',
+              help='Output format (default: table)')
+@click.pass_context
+def compact_summaries(
+    ctx: click.Context,
+    today,
+    daily_after: int,
+    weekly_after: int,
+    work_item_after: int,
+    dry_run: bool,
+    format: str
+):
+    """
+    Compact old session summaries into hierarchical rollups.
+
+    Rollups keep merged key decisions, next steps and the ids of the
+    summaries they replace; the replaced summaries are moved to the
+    summary archive. Milestone, decision and retrospective summaries are
+    never compacted.
+
+    \b
+    Examples:
+      apm summary compact --dry-run
+      apm summary compact --daily-after 7
+    """
+    console = ctx.obj['console']
+    project_root = ensure_project_root(ctx)
+    db_service = get_database_service(project_root)
+
+    policy = summary_rollups.RollupPolicy(
+        daily_after_days=daily_after,
+        weekly_after_days=weekly_after,
+        work_item_after_days=work_item_after,
+    )
+    try:
+        report = summary_rollups.compact_summaries(
+            db_service, today=today.date() if today else date.today(), policy=policy, dry_run=dry_run
+        )
+    except Exception as e:
+        console.print(f"[red]✗[/red] Failed to compact summaries: {e}")
+        raise click.Abort()
+
+    if format == 'json':
+        console.print_json(json.dumps(report.to_dict()))
+        return
+
+    table = Table(title="Summary Compaction" + (" (dry run)" if dry_run else ""))
+    table.add_column("Table", style="cyan")
+    table.add_column("Rows Before", justify="right")
+    table.add_column("Rows After", justify="right", style="green")
+    for name, before in report.rows_before.items():
+        table.add_row(name, str(before), str(report.rows_after[name]))
+    console.print(table)
+
+    for level in ('daily', 'weekly', 'work_item'):
+        if report.created[level]:
+            console.print(f"  {level}: {report.created[level]} rollup(s) written")
+    if sum(report.archived.values()):
+        console.print(f"  {sum(report.archived.values())} raw summary(ies) moved to the archive")
+    if not sum(report.created.values()):
+        console.print("[dim]Nothing to compact[/dim]")
@@ -11,7 +11,7 @@ from rich.panel import Panel
 from rich.text import Text
 
 from agentpm.core.database.service import DatabaseService
-from agentpm.core.database.enums import EntityType, SummaryType
+from agentpm.core.database.enums import EntityType, SummaryLevel, SummaryType
 from agentpm.core.database.methods import summaries
 from agentpm.cli.utils.project import ensure_project_root
 from agentpm.cli.utils.services import get_database_service
@@ -29,6 +29,11 @@ from agentpm.cli.utils.services import get_database_service
     type=click.Choice([s.value for s in SummaryType], case_sensitive=False),
     help='Filter by summary type'
 )
+@click.option(
+    '--level',
+    type=click.Choice(SummaryLevel.choices(), case_sensitive=False),
+    help='Filter by compaction level (session = raw summaries)'
+)
 @click.option(
     '--limit',
     type=int,
@@ -47,6 +52,7 @@ def search_summaries(
     search_text: str,
     entity_type: str,
     summary_type: str,
+    level: str,
     limit: int,
     format: str
 ):
@@ -62,7 +68,8 @@ def search_summaries(
         
         # Search summaries
         results = summaries.search_summaries(
-            db_service, search_text, entity_type_enum, summary_type_enum, limit
+            db_service, search_text, entity_type_enum, summary_type_enum, limit,
+            summary_level=SummaryLevel(level.lower()) if level else None
         )
         
         if not results:
@@ -1,5 +1,9 @@
 """
 apm task bulk - Bulk operations for tasks
+
+update and delete apply set-based statements in one transaction
+(tasks.bulk_update_tasks / bulk_delete_tasks): a batch is applied
+completely or not at all.
 """
 
 import click
@@ -9,6 +13,7 @@ from agentpm.cli.utils.project import ensure_project_root
 from agentpm.cli.utils.services import get_database_service
 from agentpm.core.database.adapters import TaskAdapter
 from agentpm.core.database.enums import TaskStatus, TaskType
+from agentpm.core.database.methods import tasks as task_methods
 
 
 @click.group(name='bulk')
@@ -45,13 +50,19 @@ def bulk():
     '--assigned-to',
     help='Assign all tasks to agent/user'
 )
+@click.option(
+    '--validate',
+    is_flag=True,
+    help='Check every status transition against the workflow first (all or nothing)'
+)
 @click.option(
     '--dry-run',
     is_flag=True,
     help='Show what would be updated without making changes'
 )
 @click.pass_context
-def bulk_update(ctx: click.Context, task_ids: str, work_item_id: int, status: str, priority: int, assigned_to: str, dry_run: bool):
+def bulk_update(ctx: click.Context, task_ids: str, work_item_id: int, status: str, priority: int, assigned_to: str,
+                validate: bool, dry_run: bool):
     """
     Bulk update multiple tasks.
 
@@ -60,6 +71,7 @@ def bulk_update(ctx: click.Context, task_ids: str, work_item_id: int, status: st
       apm task bulk update --task-ids="1,2,3" --status=in_progress
       apm task bulk update --work-item-id=5 --priority=1
       apm task bulk update --task-ids="1,2" --assigned-to=backend-agent --dry-run
+      apm task bulk update --work-item-id=5 --status=cancelled --validate
     """
     console = ctx.obj['console']
     console_err = ctx.obj['console_err']
@@ -70,20 +82,10 @@ def bulk_update(ctx: click.Context, task_ids: str, work_item_id: int, status: st
     tasks_to_update = []
     
     if task_ids:
-        try:
-            task_id_list = [int(tid.strip()) for tid in task_ids.split(',')]
-            for task_id in task_id_list:
-                task = TaskAdapter.get(db, task_id)
-                if task:
-                    tasks_to_update.append(task)
-                else:
-                    console_err.print(f"⚠️  [yellow]Task not found:[/yellow] {task_id}")
-        except ValueError:
-            console_err.print("❌ [red]Invalid task IDs format. Use comma-separated numbers.[/red]")
-            raise click.Abort()
+        tasks_to_update = _load_tasks(db, task_ids, console_err)
     
     elif work_item_id:
-        tasks_to_update = TaskAdapter.list(db, work_item_id=work_item_id)
+        tasks_to_update = task_methods.list_tasks(db, work_item_id=work_item_id)
         if not tasks_to_update:
             console_err.print(f"❌ [red]No tasks found for work item:[/red] {work_item_id}")
             raise click.Abort()
@@ -129,23 +131,26 @@ def bulk_update(ctx: click.Context, task_ids: str, work_item_id: int, status: st
         console.print("❌ [red]Bulk update cancelled.[/red]")
         raise click.Abort()
 
-    # Perform bulk update
-    updated_count = 0
-    failed_count = 0
-    
-    for task in tasks_to_update:
-        try:
-            TaskAdapter.update(db, task.id, **updates)
-            updated_count += 1
-        except Exception as e:
-            console_err.print(f"❌ [red]Failed to update task {task.id}:[/red] {e}")
-            failed_count += 1
+    # Perform bulk update (single transaction)
+    try:
+        result = task_methods.bulk_update_tasks(
+            db, [task.id for task in tasks_to_update], validate_workflow=validate, **updates
+        )
+    except Exception as e:
+        console_err.print(f"❌ [red]Bulk update failed, no tasks were changed:[/red] {e}")
+        raise click.Abort()
+
+    if not result.applied:
+        console_err.print(f"❌ [red]Workflow validation failed for {len(result.errors)} tasks, no tasks were changed:[/red]")
+        for task_id, error in result.errors.items():
+            console_err.print(f"   • #{task_id}: {error}")
+        raise click.Abort()
 
     # Show results
     console.print(f"\n✅ [green]Bulk update complete:[/green]")
-    console.print(f"   • Updated: {updated_count}")
-    if failed_count > 0:
-        console.print(f"   • Failed: {failed_count}")
+    console.print(f"   • Updated: {result.count}")
+    if result.missing_ids:
+        console.print(f"   • Not found: {len(result.missing_ids)}")
 
 
 @bulk.command(name='delete')
@@ -193,34 +198,19 @@ def bulk_delete(ctx: click.Context, task_ids: str, work_item_id: int, status: st
     tasks_to_delete = []
     
     if task_ids:
-        try:
-            task_id_list = [int(tid.strip()) for tid in task_ids.split(',')]
-            for task_id in task_id_list:
-                task = TaskAdapter.get(db, task_id)
-                if task:
-                    tasks_to_delete.append(task)
-                else:
-                    console_err.print(f"⚠️  [yellow]Task not found:[/yellow] {task_id}")
-        except ValueError:
-            console_err.print("❌ [red]Invalid task IDs format. Use comma-separated numbers.[/red]")
-            raise click.Abort()
+        tasks_to_delete = _load_tasks(db, task_ids, console_err)
     
     elif work_item_id:
-        tasks_to_delete = TaskAdapter.list(db, work_item_id=work_item_id)
+        tasks_to_delete = task_methods.list_tasks(db, work_item_id=work_item_id)
         if not tasks_to_delete:
             console_err.print(f"❌ [red]No tasks found for work item:[/red] {work_item_id}")
             raise click.Abort()
     
     elif status:
-        # Get all tasks and filter by status
+        # All tasks of the current project with this status (one query)
         from agentpm.cli.utils.project import get_current_project_id
         project_id = get_current_project_id(ctx)
-        from agentpm.core.database.adapters import WorkItemAdapter
-        work_items = WorkItemAdapter.list(db, project_id=project_id)
-        
-        for wi in work_items:
-            tasks = TaskAdapter.list(db, work_item_id=wi.id)
-            tasks_to_delete.extend([t for t in tasks if t.status.value == status])
+        tasks_to_delete = task_methods.list_tasks(db, project_id=project_id, status=TaskStatus(status))
     
     else:
         console_err.print("❌ [red]Must specify --task-ids, --work-item-id, or --status[/red]")
@@ -247,26 +237,18 @@ def bulk_delete(ctx: click.Context, task_ids: str, work_item_id: int, status: st
             console.print("❌ [red]Bulk deletion cancelled.[/red]")
             raise click.Abort()
 
-    # Perform bulk deletion
-    deleted_count = 0
-    failed_count = 0
-    
-    for task in tasks_to_delete:
-        try:
-            success = TaskAdapter.delete(db, task.id)
-            if success:
-                deleted_count += 1
-            else:
-                failed_count += 1
-        except Exception as e:
-            console_err.print(f"❌ [red]Failed to delete task {task.id}:[/red] {e}")
-            failed_count += 1
+    # Perform bulk deletion (single transaction)
+    try:
+        result = task_methods.bulk_delete_tasks(db, [task.id for task in tasks_to_delete])
+    except Exception as e:
+        console_err.print(f"❌ [red]Bulk deletion failed, no tasks were deleted:[/red] {e}")
+        raise click.Abort()
 
     # Show results
     console.print(f"\n✅ [green]Bulk deletion complete:[/green]")
-    console.print(f"   • Deleted: {deleted_count}")
-    if failed_count > 0:
-        console.print(f"   • Failed: {failed_count}")
+    console.print(f"   • Deleted: {result.count}")
+    if result.missing_ids:
+        console.print(f"   • Not found: {len(result.missing_ids)}")
 
 
 @bulk.command(name='create')
@@ -400,3 +382,19 @@ def bulk_create(ctx: click.Context, work_item_id: int, tasks_file: str, tasks_js
         console.print(f"\n📚 [cyan]Created tasks:[/cyan]")
         for task in created_tasks:
             console.print(f"   • #{task.id}: {task.name}")
+
+
+def _load_tasks(db, task_ids: str, console_err) -> List:
+    """Tasks for a comma-separated id list (one query), warning about unknown ids"""
+    try:
+        task_id_list = [int(tid.strip()) for tid in task_ids.split(',')]
+    except ValueError:
+        console_err.print("❌ [red]Invalid task IDs format. Use comma-separated numbers.[/red]")
+        raise click.Abort()
+
+    found = task_methods.get_tasks(db, task_id_list)
+    found_ids = {task.id for task in found}
+    for task_id in dict.fromkeys(task_id_list):
+        if task_id not in found_ids:
+            console_err.print(f"⚠️  [yellow]Task not found:[/yellow] {task_id}")
+    return found
@@ -363,6 +363,176 @@ def rules_status(ctx: click.Context, project_path: str):
         console.print(f"❌ [red]Error getting rules status: {e}[/red]")
 
 
+@testing_group.command(name='db-profile')
+@click.option('--project-path', '-p', type=click.Path(exists=True), default='.',
+              help='Project path (default: current directory)')
+@click.option('--iterations', '-n', type=int, default=5, show_default=True,
+              help='Times to run the read workload')
+@click.option('--slow-ms', type=float, default=50.0, show_default=True,
+              help='Show EXPLAIN QUERY PLAN for queries at least this slow')
+@click.option('--limit', type=int, default=20, show_default=True, help='Query fingerprints to show')
+@click.option('--json', 'as_json', is_flag=True, help='Output JSON')
+@click.pass_context
+def db_profile(ctx: click.Context, project_path: str, iterations: int, slow_ms: float,
+               limit: int, as_json: bool):
+    """Profile the read queries behind list views and report database storage.
+
+    Runs the list queries used by the CLI and web views (projects, work items,
+    tasks, ideas, agents, contexts, documents and events, with and without
+    their common filters) with query profiling enabled, then prints per-query timings (count, p50, p95, max,
+    query plan for slow queries) and table row counts and sizes.
+    """
+    console = Console()
+
+    try:
+        from agentpm.cli.utils.services import get_database_service
+        from agentpm.core.database.methods import database_stats
+        from agentpm.core.database.utils.index_advisor import run_read_workload
+
+        db = get_database_service(Path(project_path))
+        profiler = db.enable_profiling(slow_ms=slow_ms)
+        errors = {}
+        try:
+            for _ in range(max(1, iterations)):
+                for name, error in run_read_workload(db).items():
+                    errors.setdefault(name, error)
+            with db.connect() as conn:
+                report = profiler.report(conn, limit=limit)
+        finally:
+            db.disable_profiling()
+        stats = database_stats.get_database_stats(db)
+
+        if as_json:
+            click.echo(json.dumps({'profile': report, 'database': stats, 'errors': errors}, indent=2))
+            return
+
+        queries_table = Table(title=f"🔍 Queries ({report['statements']} statements, {report['total_ms']} ms)")
+        queries_table.add_column("Query", style="cyan", overflow="fold")
+        queries_table.add_column("Count", justify="right")
+        queries_table.add_column("p50 ms", justify="right")
+        queries_table.add_column("p95 ms", justify="right")
+        queries_table.add_column("Max ms", justify="right", style="yellow")
+        for query in report['queries']:
+            text = query['fingerprint']
+            if query['plan']:
+                text += "\n[dim]" + "\n".join(query['plan']) + "[/dim]"
+            queries_table.add_row(
+                text, str(query['count']), f"{query['p50_ms']:.2f}", f"{query['p95_ms']:.2f}",
+                f"[red]{query['max_ms']:.2f}[/red]" if query['slow'] else f"{query['max_ms']:.2f}"
+            )
+        console.print(queries_table)
+
+        tables_table = Table(title="🗄️  Tables")
+        tables_table.add_column("Table", style="cyan")
+        tables_table.add_column("Rows", justify="right")
+        tables_table.add_column("Bytes", justify="right", style="dim")
+        for table in sorted(stats['tables'], key=lambda t: t['rows'], reverse=True):
+            if table['rows'] or table['bytes']:
+                tables_table.add_row(
+                    table['name'],
+                    f"~{table['rows']}" if table['rows_estimated'] else str(table['rows']),
+                    str(table['bytes']) if table['bytes'] is not None else "-"
+                )
+        console.print(tables_table)
+
+        console.print(
+            f"📦 {stats['path']}: {stats['size_bytes']} bytes, {stats['page_count']} pages "
+            f"of {stats['page_size']} B, {stats['freelist_count']} free, journal {stats['journal_mode']}"
+        )
+        for name, error in errors.items():
+            console.print(f"⚠️  [yellow]{name} skipped: {error}[/yellow]")
+
+    except Exception as e:
+        console.print(f"❌ [red]Error profiling database: {e}[/red]")
+        raise click.Abort()
+
+
+@testing_group.command(name='startup')
+@click.option('--project-path', '-p', type=click.Path(exists=True), default='.',
+              help='Directory to run targets in (default: current directory)')
+@click.option('--target', '-t', 'target_names', multiple=True,
+              help='Only measure these targets (e.g. "apm --help", hook:session-start)')
+@click.option('--budget-ms', type=float, help='Override every target\'s import budget')
+@click.option('--repeat', type=click.IntRange(min=1), default=3, show_default=True,
+              help='Runs per target; the fastest counts')
+@click.option('--limit', type=int, default=8, show_default=True, help='Modules to show per target')
+@click.option('--json', 'as_json', is_flag=True, help='Output JSON')
+@click.option('--strict', is_flag=True, help='Exit with status 1 if any target is over budget')
+@click.pass_context
+def startup(ctx: click.Context, project_path: str, target_names: tuple, budget_ms: Optional[float],
+            repeat: int, limit: int, as_json: bool, strict: bool):
+    """Measure import time of `apm --help`, `apm status` and each hook.
+
+    Runs every target in a fresh interpreter with `python -X importtime` and
+    reports its import time (interpreter startup excluded), the packages and
+    modules that cost the most, and heavy modules it must not import
+    (pydantic, networkx, jinja2, rich.table for `apm --help`). `apm status`
+    runs against a generated fixture project. Budgets are a recorded
+    baseline times two, and the fastest of --repeat runs is compared.
+    """
+    from agentpm.core.testing.startup import check_startup, default_targets
+
+    console = Console()
+
+    targets = default_targets()
+    if target_names:
+        unknown = set(target_names) - {target.name for target in targets}
+        if unknown:
+            raise click.BadParameter(
+                f"Unknown target(s): {', '.join(sorted(unknown))}. "
+                f"Available: {', '.join(target.name for target in targets)}",
+                param_hint='--target'
+            )
+        targets = [target for target in targets if target.name in target_names]
+    if budget_ms is not None:
+        for target in targets:
+            target.budget_ms = budget_ms
+
+    results = check_startup(targets, cwd=Path(project_path), repeat=repeat)
+    over_budget = [result for result in results if not result.within_budget]
+
+    if as_json:
+        click.echo(json.dumps([result.to_dict(limit) for result in results], indent=2))
+    else:
+        summary = Table(title="⏱️  Startup Import Time")
+        summary.add_column("Target", style="cyan")
+        summary.add_column("Imports ms", justify="right")
+        summary.add_column("Budget ms", justify="right", style="dim")
+        summary.add_column("Wall ms", justify="right", style="dim")
+        summary.add_column("Heaviest packages")
+        summary.add_column("Status")
+        for result in results:
+            if result.error:
+                status_text = f"[red]error: {result.error}[/red]"
+            elif result.violations:
+                status_text = f"[red]imports {', '.join(result.violations)}[/red]"
+            elif result.import_ms > result.target.budget_ms:
+                status_text = "[red]over budget[/red]"
+            else:
+                status_text = "[green]ok[/green]"
+            summary.add_row(
+                result.target.name,
+                f"{result.import_ms:.0f}",
+                f"{result.target.budget_ms:.0f}",
+                f"{result.wall_ms:.0f}",
+                ", ".join(f"{name} {ms:.0f}" for name, ms in result.packages(3).items()),
+                status_text
+            )
+        console.print(summary)
+
+        for result in over_budget:
+            modules = Table(title=f"{result.target.name}: slowest imports")
+            modules.add_column("Module", style="cyan")
+            modules.add_column("Cumulative ms", justify="right")
+            modules.add_column("Self ms", justify="right", style="dim")
+            for record in result.top_modules(limit):
+                modules.add_row(record.module, f"{record.cumulative_us / 1000:.1f}", f"{record.self_us / 1000:.1f}")
+            console.print(modules)
+
+    if strict and over_budget:
+        ctx.exit(1)
+
+
 # Example usage
 if __name__ == "__main__":
     testing_group()
@@ -1,5 +1,9 @@
 """
 apm work-item bulk - Bulk operations for work items
+
+update and delete apply set-based statements in one transaction
+(work_items.bulk_update_work_items / bulk_delete_work_items): a batch is
+applied completely or not at all.
 """
 
 import click
@@ -9,6 +13,7 @@ from agentpm.cli.utils.project import ensure_project_root
 from agentpm.cli.utils.services import get_database_service
 from agentpm.core.database.adapters import WorkItemAdapter
 from agentpm.core.database.enums import WorkItemStatus, WorkItemType, Phase
+from agentpm.core.database.methods import work_items as work_item_methods
 
 
 @click.group(name='bulk')
@@ -71,17 +76,7 @@ def bulk_update(ctx: click.Context, work_item_ids: str, project_id: int, status:
     work_items_to_update = []
     
     if work_item_ids:
-        try:
-            wi_id_list = [int(wid.strip()) for wid in work_item_ids.split(',')]
-            for wi_id in wi_id_list:
-                work_item = WorkItemAdapter.get(db, wi_id)
-                if work_item:
-                    work_items_to_update.append(work_item)
-                else:
-                    console_err.print(f"⚠️  [yellow]Work item not found:[/yellow] {wi_id}")
-        except ValueError:
-            console_err.print("❌ [red]Invalid work item IDs format. Use comma-separated numbers.[/red]")
-            raise click.Abort()
+        work_items_to_update = _load_work_items(db, work_item_ids, console_err)
     
     elif project_id:
         work_items_to_update = WorkItemAdapter.list(db, project_id=project_id)
@@ -130,23 +125,20 @@ def bulk_update(ctx: click.Context, work_item_ids: str, project_id: int, status:
         console.print("❌ [red]Bulk update cancelled.[/red]")
         raise click.Abort()
 
-    # Perform bulk update
-    updated_count = 0
-    failed_count = 0
-    
-    for work_item in work_items_to_update:
-        try:
-            WorkItemAdapter.update(db, work_item.id, **updates)
-            updated_count += 1
-        except Exception as e:
-            console_err.print(f"❌ [red]Failed to update work item {work_item.id}:[/red] {e}")
-            failed_count += 1
+    # Perform bulk update (single transaction)
+    try:
+        result = work_item_methods.bulk_update_work_items(
+            db, [wi.id for wi in work_items_to_update], **updates
+        )
+    except Exception as e:
+        console_err.print(f"❌ [red]Bulk update failed, no work items were changed:[/red] {e}")
+        raise click.Abort()
 
     # Show results
     console.print(f"\n✅ [green]Bulk update complete:[/green]")
-    console.print(f"   • Updated: {updated_count}")
-    if failed_count > 0:
-        console.print(f"   • Failed: {failed_count}")
+    console.print(f"   • Updated: {result.count}")
+    if result.missing_ids:
+        console.print(f"   • Not found: {len(result.missing_ids)}")
 
 
 @bulk.command(name='delete')
@@ -194,17 +186,7 @@ def bulk_delete(ctx: click.Context, work_item_ids: str, project_id: int, status:
     work_items_to_delete = []
     
     if work_item_ids:
-        try:
-            wi_id_list = [int(wid.strip()) for wid in work_item_ids.split(',')]
-            for wi_id in wi_id_list:
-                work_item = WorkItemAdapter.get(db, wi_id)
-                if work_item:
-                    work_items_to_delete.append(work_item)
-                else:
-                    console_err.print(f"⚠️  [yellow]Work item not found:[/yellow] {wi_id}")
-        except ValueError:
-            console_err.print("❌ [red]Invalid work item IDs format. Use comma-separated numbers.[/red]")
-            raise click.Abort()
+        work_items_to_delete = _load_work_items(db, work_item_ids, console_err)
     
     elif project_id:
         work_items_to_delete = WorkItemAdapter.list(db, project_id=project_id)
@@ -227,12 +209,10 @@ def bulk_delete(ctx: click.Context, work_item_ids: str, project_id: int, status:
         console_err.print("❌ [red]No work items to delete[/red]")
         raise click.Abort()
 
-    # Count associated tasks
-    from agentpm.core.database.adapters import TaskAdapter
-    total_tasks = 0
-    for wi in work_items_to_delete:
-        tasks = TaskAdapter.list(db, work_item_id=wi.id)
-        total_tasks += len(tasks)
+    # Count associated tasks (one grouped query)
+    from agentpm.core.database.methods import tasks as task_methods
+    task_counts = task_methods.count_tasks_by_work_item(db, [wi.id for wi in work_items_to_delete])
+    total_tasks = sum(task_counts.values())
 
     # Show what will be deleted
     console.print(f"\n🗑️  [red]Work items to delete:[/red] {len(work_items_to_delete)}")
@@ -253,26 +233,18 @@ def bulk_delete(ctx: click.Context, work_item_ids: str, project_id: int, status:
             console.print("❌ [red]Bulk deletion cancelled.[/red]")
             raise click.Abort()
 
-    # Perform bulk deletion
-    deleted_count = 0
-    failed_count = 0
-    
-    for work_item in work_items_to_delete:
-        try:
-            success = WorkItemAdapter.delete(db, work_item.id)
-            if success:
-                deleted_count += 1
-            else:
-                failed_count += 1
-        except Exception as e:
-            console_err.print(f"❌ [red]Failed to delete work item {work_item.id}:[/red] {e}")
-            failed_count += 1
+    # Perform bulk deletion (single transaction, cascades to tasks)
+    try:
+        result = work_item_methods.bulk_delete_work_items(db, [wi.id for wi in work_items_to_delete])
+    except Exception as e:
+        console_err.print(f"❌ [red]Bulk deletion failed, no work items were deleted:[/red] {e}")
+        raise click.Abort()
 
     # Show results
     console.print(f"\n✅ [green]Bulk deletion complete:[/green]")
-    console.print(f"   • Deleted: {deleted_count}")
-    if failed_count > 0:
-        console.print(f"   • Failed: {failed_count}")
+    console.print(f"   • Deleted: {result.count}")
+    if result.missing_ids:
+        console.print(f"   • Not found: {len(result.missing_ids)}")
 
 
 @bulk.command(name='create')
@@ -410,3 +382,19 @@ def bulk_create(ctx: click.Context, project_id: int, work_items_file: str, work_
         console.print(f"\n📚 [cyan]Created work items:[/cyan]")
         for wi in created_work_items:
             console.print(f"   • #{wi.id}: {wi.name}")
+
+
+def _load_work_items(db, work_item_ids: str, console_err) -> List:
+    """Work items for a comma-separated id list (one query), warning about unknown ids"""
+    try:
+        wi_id_list = [int(wid.strip()) for wid in work_item_ids.split(',')]
+    except ValueError:
+        console_err.print("❌ [red]Invalid work item IDs format. Use comma-separated numbers.[/red]")
+        raise click.Abort()
+
+    found = work_item_methods.get_work_items(db, wi_id_list)
+    found_ids = {wi.id for wi in found}
+    for wi_id in dict.fromkeys(wi_id_list):
+        if wi_id not in found_ids:
+            console_err.print(f"⚠️  [yellow]Work item not found:[/yellow] {wi_id}")
+    return found
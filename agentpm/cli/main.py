@@ -43,36 +43,6 @@ class LazyGroup(click.Group):
         Returns:
             Command object if found, None otherwise
         """
-        # Command registry: maps command name to module path
-        COMMANDS = {
-            'init': 'agentpm.cli.commands.init:init',
-            'work-item': 'agentpm.cli.commands.work_item:work_item',
-            'task': 'agentpm.cli.commands.task:task',
-            'idea': 'agentpm.cli.commands.idea:idea',
-            'session': 'agentpm.cli.commands.session:session',
-            'hooks': 'agentpm.cli.commands.hooks:hooks',
-            'context': 'agentpm.cli.commands.context:context',
-            'status': 'agentpm.cli.commands.status:status',
-            'web': 'agentpm.cli.commands.web:web',
-            'testing': 'agentpm.cli.commands.testing:testing_group',
-            'agents': 'agentpm.cli.commands.agents:agents',
-            'rules': 'agentpm.cli.commands.rules:rules',
-            'commands': 'agentpm.cli.commands.commands:commands_group',
-            'migrate': 'agentpm.cli.commands.migrate:migrate',
-            'migrate-v1-to-v2': 'agentpm.cli.commands.migrate_v1:migrate_v1_to_v2',
-            'principles': 'agentpm.cli.commands.principles:principles',
-            'document': 'agentpm.cli.commands.document:document',
-            'template': 'agentpm.cli.commands.template:template',
-            'principle-check': 'agentpm.cli.commands.principle_check:principle_check',
-            'summary': 'agentpm.cli.commands.summary:summary',
-            'search': 'agentpm.cli.commands.search:search',
-            'skills': 'agentpm.cli.commands.skills:skills',
-            'claude-code': 'agentpm.cli.commands.claude_code:claude_code',
-            'provider': 'agentpm.cli.commands.provider:provider',
-            'memory': 'agentpm.cli.commands.memory:memory',
-            'detect': 'agentpm.cli.commands.detect:detect',
-        }
-
         if cmd_name not in COMMANDS:
             return None
 
@@ -99,6 +69,87 @@ class LazyGroup(click.Group):
         """
         return ['init', 'work-item', 'task', 'idea', 'session', 'context', 'status', 'web', 'agents', 'rules', 'testing', 'commands', 'migrate', 'migrate-v1-to-v2', 'document', 'template', 'summary', 'search', 'skills', 'claude-code', 'provider', 'memory', 'detect']
 
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """
+        List commands with their short help without importing them.
+
+        click's default implementation loads every command to read its
+        docstring, which would import every command module (and their
+        dependencies) just to print `apm --help`.
+        """
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = [
+            (name, click.utils.make_default_short_help(COMMAND_HELP.get(name, ''), limit))
+            for name in names
+        ]
+        with formatter.section('Commands'):
+            formatter.write_dl(rows)
+
+
+# Command registry: maps command name to module path
+COMMANDS = {
+    'init': 'agentpm.cli.commands.init:init',
+    'work-item': 'agentpm.cli.commands.work_item:work_item',
+    'task': 'agentpm.cli.commands.task:task',
+    'idea': 'agentpm.cli.commands.idea:idea',
+    'session': 'agentpm.cli.commands.session:session',
+    'hooks': 'agentpm.cli.commands.hooks:hooks',
+    'context': 'agentpm.cli.commands.context:context',
+    'status': 'agentpm.cli.commands.status:status',
+    'web': 'agentpm.cli.commands.web:web',
+    'testing': 'agentpm.cli.commands.testing:testing_group',
+    'agents': 'agentpm.cli.commands.agents:agents',
+    'rules': 'agentpm.cli.commands.rules:rules',
+    'commands': 'agentpm.cli.commands.commands:commands_group',
+    'migrate': 'agentpm.cli.commands.migrate:migrate',
+    'migrate-v1-to-v2': 'agentpm.cli.commands.migrate_v1:migrate_v1_to_v2',
+    'principles': 'agentpm.cli.commands.principles:principles',
+    'document': 'agentpm.cli.commands.document:document',
+    'template': 'agentpm.cli.commands.template:template',
+    'principle-check': 'agentpm.cli.commands.principle_check:principle_check',
+    'summary': 'agentpm.cli.commands.summary:summary',
+    'search': 'agentpm.cli.commands.search:search',
+    'skills': 'agentpm.cli.commands.skills:skills',
+    'claude-code': 'agentpm.cli.commands.claude_code:claude_code',
+    'provider': 'agentpm.cli.commands.provider:provider',
+    'memory': 'agentpm.cli.commands.memory:memory',
+    'detect': 'agentpm.cli.commands.detect:detect',
+}
+
+# Short help shown by `apm --help` (keep in sync with each command's docstring;
+# tests/unit/cli/test_startup.py checks it)
+COMMAND_HELP = {
+    'init': 'Initialize APM project (database + agents + rules).',
+    'work-item': 'Manage work items (features, bugs, research).',
+    'task': 'Manage tasks with quality gates.',
+    'idea': 'Manage ideas (lightweight brainstorming before work items).',
+    'session': 'Session management commands.',
+    'hooks': 'Manage Claude Code integration hooks.',
+    'context': 'Access hierarchical project context.',
+    'status': 'Show project health dashboard.',
+    'web': '🌐 Web server management commands.',
+    'testing': 'Manage testing configuration and category-specific coverage requirements.',
+    'agents': 'Manage AI agents for project specialization.',
+    'rules': 'Manage project rules and configuration.',
+    'commands': 'Manage APM slash commands for Claude Code.',
+    'migrate': 'Run pending database migrations.',
+    'migrate-v1-to-v2': 'Migrate V1 file-based systems to V2 database.',
+    'principles': 'Development principles commands based on the Pyramid of Software Development Principles.',
+    'document': '📄 Document Management Commands Manage document references for work items, tasks, and ideas.',
+    'template': 'Manage JSON templates used for workflow gating and agent instructions.',
+    'principle-check': 'Run principle-based agent analysis on code.',
+    'summary': 'Manage hierarchical summaries for projects, work items, tasks, and sessions.',
+    'search': '🔍 Unified vector search across all APM (Agent Project Manager) entities.',
+    'skills': 'Manage Claude Code Skills for APM (Agent Project Manager).',
+    'claude-code': 'Claude Code integration management commands.',
+    'provider': 'Manage LLM provider configurations.',
+    'memory': "Manage Claude's persistent memory files.",
+    'detect': '🔍 Detection Pack - Comprehensive project analysis.',
+}
+
 
 @click.group(
     cls=LazyGroup,
@@ -14,13 +14,18 @@ Benefits:
 
 from pathlib import Path
 from functools import lru_cache
-from agentpm.core.database import DatabaseService
-from agentpm.core.workflow import WorkflowService
-from agentpm.core.context import ContextService
-import click
+from typing import TYPE_CHECKING
 
+# Service classes are imported when first requested: importing this module
+# (which nearly every command does) must not load the workflow and context
+# layers for commands that never use them
+if TYPE_CHECKING:
+    from agentpm.core.context import ContextService
+    from agentpm.core.database import DatabaseService
+    from agentpm.core.workflow import WorkflowService
 
-def get_database_service(project_root: Path = None) -> DatabaseService:
+
+def get_database_service(project_root: Path = None) -> 'DatabaseService':
     """
     Get database service instance from centralized initializer.
     
@@ -58,7 +63,7 @@ def get_database_service(project_root: Path = None) -> DatabaseService:
 
 
 @lru_cache(maxsize=1)
-def get_workflow_service(project_root: Path = None) -> WorkflowService:
+def get_workflow_service(project_root: Path = None) -> 'WorkflowService':
     """
     Get workflow service with centralized database dependency.
 
@@ -77,11 +82,13 @@ def get_workflow_service(project_root: Path = None) -> WorkflowService:
         updated_task = workflow.transition_task(task_id=123, new_status="in_progress")
         ```
     """
+    from agentpm.core.workflow import WorkflowService
+
     db = get_database_service(project_root)
     return WorkflowService(db)
 
 
-def get_context_service(project_root: Path = None) -> ContextService:
+def get_context_service(project_root: Path = None) -> 'ContextService':
     """
     Get context service with centralized database and path dependencies.
 
@@ -100,6 +107,8 @@ def get_context_service(project_root: Path = None) -> ContextService:
         context = context_svc.get_task_context(task_id=123)
         ```
     """
+    from agentpm.core.context import ContextService
+
     db = get_database_service(project_root)
     return ContextService(db, project_root)
 
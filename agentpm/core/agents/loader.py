@@ -9,6 +9,8 @@ Supports:
 - Dependency checking
 - Conflict detection
 - Dry-run mode
+- Parallel directory parsing with a content-hash cache
+- Single-transaction upsert with an added/changed/unchanged diff
 
 Usage:
     loader = AgentLoader(db_service)
@@ -16,17 +18,20 @@ Usage:
     result = loader.load_all(Path(".claude/agents/"))
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Any
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Any
+from dataclasses import dataclass, field
 from datetime import datetime
 import yaml
 import hashlib
+import json
 
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from ..database.models.agent import Agent
 from ..database.enums import AgentTier
+from ..performance import TTLCache
 
 
 class AgentDefinition(BaseModel):
@@ -177,8 +182,6 @@ class AgentDefinition(BaseModel):
         Returns:
             Agent model ready for database insertion
         """
-        import json
-
         # Convert tier int to AgentTier enum
         tier_enum = AgentTier(self.tier)
 
@@ -211,7 +214,8 @@ class LoadResult:
     """
     Result of agent loading operation.
 
-    Provides statistics and validation results.
+    Provides statistics and validation results, plus the diff against the
+    agents already stored for the project (roles added, changed, unchanged).
     """
 
     success: bool
@@ -223,6 +227,31 @@ class LoadResult:
     warnings: List[str]
     conflicts: Dict[str, List[str]]  # role -> [conflict reasons]
     dependency_graph: Dict[str, List[str]]  # role -> [dependencies]
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @classmethod
+    def failure(
+        cls,
+        errors: List[str],
+        warnings: Optional[List[str]] = None,
+        conflicts: Optional[Dict[str, List[str]]] = None,
+        dependency_graph: Optional[Dict[str, List[str]]] = None,
+        skipped_count: int = 0
+    ) -> 'LoadResult':
+        """Build a result for a load that wrote nothing"""
+        return cls(
+            success=False,
+            loaded_count=0,
+            skipped_count=skipped_count,
+            error_count=len(errors),
+            agents=[],
+            errors=errors,
+            warnings=warnings or [],
+            conflicts=conflicts or {},
+            dependency_graph=dependency_graph or {}
+        )
 
     def summary(self) -> str:
         """Generate human-readable summary"""
@@ -233,6 +262,12 @@ class LoadResult:
             f"  Errors: {self.error_count}",
         ]
 
+        if self.added or self.changed or self.unchanged:
+            lines.append(
+                f"  Diff: {len(self.added)} added, {len(self.changed)} changed, "
+                f"{len(self.unchanged)} unchanged"
+            )
+
         if self.warnings:
             lines.append(f"  Warnings: {len(self.warnings)}")
             for warning in self.warnings:
@@ -253,16 +288,32 @@ class LoadResult:
         return "\n".join(lines)
 
 
+# Parsed files keyed by (sha256 of content, project_id) -> (agents, errors).
+# Unchanged YAML is neither re-parsed nor re-validated; callers get copies.
+DEFINITION_CACHE_SIZE = 512
+_definition_cache = TTLCache('agents.definitions', maxsize=DEFINITION_CACHE_SIZE)
+
+# Upper bound on parser threads for load_all
+MAX_LOAD_WORKERS = 8
+
+# Columns written by the loader and compared for the diff (when present in the schema)
+_AGENT_COLUMNS = (
+    'display_name', 'description', 'sop_content', 'capabilities',
+    'is_active', 'agent_type', 'tier', 'metadata',
+)
+
+
 class AgentLoader:
     """
     Loads agent definitions from YAML files to database.
 
     Features:
-    - Pydantic validation
+    - Pydantic validation (cached by file content hash)
+    - Parallel parsing of definition directories
     - Dependency checking
     - Conflict detection
     - Dry-run mode
-    - Batch loading
+    - Batch loading in a single transaction
 
     Usage:
         loader = AgentLoader(db_service)
@@ -315,172 +366,27 @@ class AgentLoader:
             force: Overwrite existing agents
 
         Returns:
-            LoadResult with statistics and any errors
+            LoadResult with statistics, diff and any errors
         """
         project_id = project_id or self.default_project_id
         if not project_id:
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=0,
-                error_count=1,
-                agents=[],
-                errors=["No project_id provided"],
-                warnings=[],
-                conflicts={},
-                dependency_graph={}
-            )
-
-        errors = []
-        warnings = []
-        agents = []
-
-        # Read YAML file
-        try:
-            with open(yaml_path, 'r') as f:
-                data = yaml.safe_load(f)
-        except Exception as e:
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=0,
-                error_count=1,
-                agents=[],
-                errors=[f"Failed to read YAML: {e}"],
-                warnings=[],
-                conflicts={},
-                dependency_graph={}
-            )
-
-        # Determine if single or multi-agent format
-        if isinstance(data, dict):
-            if 'agents' in data:
-                # Multi-agent format
-                agent_defs = data['agents']
-            else:
-                # Single agent format
-                agent_defs = [data]
-        elif isinstance(data, list):
-            # List of agents
-            agent_defs = data
-        else:
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=0,
-                error_count=1,
-                agents=[],
-                errors=["Invalid YAML format: expected dict or list"],
-                warnings=[],
-                conflicts={},
-                dependency_graph={}
-            )
-
-        # Parse and validate each agent
-        for idx, agent_data in enumerate(agent_defs):
-            try:
-                # Validate with Pydantic
-                agent_def = AgentDefinition(**agent_data)
-
-                # Convert to Agent model
-                agent = agent_def.to_agent_model(project_id)
-                agents.append(agent)
-
-            except ValidationError as e:
-                error_msg = f"Agent {idx + 1}: Validation failed:\n"
-                for error in e.errors():
-                    field = '.'.join(str(x) for x in error['loc'])
-                    error_msg += f"  {field}: {error['msg']}\n"
-                errors.append(error_msg.strip())
-            except Exception as e:
-                errors.append(f"Agent {idx + 1}: Unexpected error: {e}")
+            return LoadResult.failure(["No project_id provided"])
 
+        agents, errors = self._parse_file(yaml_path, project_id)
         if errors:
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=0,
-                error_count=len(errors),
-                agents=[],
-                errors=errors,
-                warnings=warnings,
-                conflicts={},
-                dependency_graph={}
-            )
-
-        # Validate dependencies
-        dependency_graph = {}
-        conflicts = {}
-
-        for agent in agents:
-            # Build dependency graph
-            import json
-            metadata = json.loads(agent.metadata or '{}')
-            deps = metadata.get('dependencies', [])
-            dependency_graph[agent.role] = deps
-
-            # Check for missing dependencies
-            missing_deps = [
-                dep for dep in deps
-                if dep not in [a.role for a in agents]
-            ]
-            if missing_deps:
-                warnings.append(
-                    f"{agent.role}: Missing dependencies: {', '.join(missing_deps)}"
-                )
-
-        # Check for conflicts with existing agents (if not force)
-        if not force and not dry_run:
-            existing_roles = self._get_existing_roles(project_id)
-            for agent in agents:
-                if agent.role in existing_roles:
-                    conflicts[agent.role] = ["Agent already exists"]
+            return LoadResult.failure(errors)
 
+        dependency_graph, warnings = self._check_dependencies(agents)
+        conflicts = self._duplicate_roles(agents, "in file")
         if conflicts and not force:
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=len(conflicts),
-                error_count=0,
-                agents=[],
-                errors=[],
+            return LoadResult.failure(
+                [],
                 warnings=warnings,
                 conflicts=conflicts,
-                dependency_graph=dependency_graph
+                dependency_graph=dependency_graph,
+                skipped_count=len(conflicts)
             )
-
-        # Insert agents (if not dry_run)
-        loaded_count = 0
-        skipped_count = 0
-
-        if not dry_run:
-            for agent in agents:
-                try:
-                    if force:
-                        # Update if exists, insert if not
-                        self._upsert_agent(agent)
-                    else:
-                        # Insert only
-                        self._insert_agent(agent)
-                    loaded_count += 1
-                except Exception as e:
-                    errors.append(f"{agent.role}: Insert failed: {e}")
-                    skipped_count += 1
-        else:
-            # Dry run - just count what would be loaded
-            loaded_count = len(agents)
-
-        return LoadResult(
-            success=(len(errors) == 0 and len(conflicts) == 0),
-            loaded_count=loaded_count,
-            skipped_count=skipped_count,
-            error_count=len(errors),
-            agents=agents if dry_run else [],
-            errors=errors,
-            warnings=warnings,
-            conflicts=conflicts,
-            dependency_graph=dependency_graph
-        )
+        return self._apply(agents, project_id, dry_run, force, warnings, conflicts, dependency_graph)
 
     def load_all(
         self,
@@ -488,13 +394,15 @@ class AgentLoader:
         project_id: Optional[int] = None,
         dry_run: bool = False,
         force: bool = False,
-        pattern: str = "*.yaml"
+        pattern: str = "*.yaml",
+        max_workers: Optional[int] = None
     ) -> LoadResult:
         """
         Load all agent definitions from directory.
 
-        Recursively scans directory for YAML files.
-        Validates all files before inserting any.
+        Recursively scans directory for YAML files and parses them in a
+        thread pool. Validates all files before inserting any, then writes
+        every agent in one transaction.
 
         Args:
             definitions_dir: Directory containing YAML files
@@ -502,213 +410,266 @@ class AgentLoader:
             dry_run: Validate only, don't insert
             force: Overwrite existing agents
             pattern: File pattern to match (default: *.yaml)
+            max_workers: Parser threads (None: up to MAX_LOAD_WORKERS; 1: sequential)
 
         Returns:
             Consolidated LoadResult from all files
         """
         project_id = project_id or self.default_project_id
         if not project_id:
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=0,
-                error_count=1,
-                agents=[],
-                errors=["No project_id provided"],
-                warnings=[],
-                conflicts={},
-                dependency_graph={}
-            )
+            return LoadResult.failure(["No project_id provided"])
 
         # Find all YAML files
-        yaml_files = list(definitions_dir.rglob(pattern))
+        yaml_files = sorted(definitions_dir.rglob(pattern))
         if not yaml_files:
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=0,
-                error_count=1,
-                agents=[],
-                errors=[f"No {pattern} files found in {definitions_dir}"],
-                warnings=[],
-                conflicts={},
-                dependency_graph={}
-            )
+            return LoadResult.failure([f"No {pattern} files found in {definitions_dir}"])
+
+        def parse(yaml_file: Path) -> Tuple[List[Agent], List[str]]:
+            return self._parse_file(yaml_file, project_id)
+
+        workers = max_workers or min(MAX_LOAD_WORKERS, len(yaml_files))
+        if workers == 1:
+            parsed = [parse(yaml_file) for yaml_file in yaml_files]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='apm-agents') as executor:
+                parsed = list(executor.map(parse, yaml_files))
 
         # Collect all agents first (validation phase)
         all_agents = []
         all_errors = []
-        all_warnings = []
-        all_conflicts = {}
-        all_dependency_graph = {}
-
-        for yaml_file in yaml_files:
-            result = self.load_from_yaml(
-                yaml_file,
-                project_id=project_id,
-                dry_run=True,  # Always dry-run first
-                force=force
-            )
 
-            all_agents.extend(result.agents)
-            all_errors.extend([f"{yaml_file.name}: {e}" for e in result.errors])
-            all_warnings.extend([f"{yaml_file.name}: {w}" for w in result.warnings])
-            all_conflicts.update({
-                f"{yaml_file.name}:{k}": v
-                for k, v in result.conflicts.items()
-            })
-            all_dependency_graph.update(result.dependency_graph)
+        for yaml_file, (agents, errors) in zip(yaml_files, parsed):
+            all_agents.extend(agents)
+            all_errors.extend([f"{yaml_file.name}: {e}" for e in errors])
 
         # Check for duplicate roles across files
-        role_counts = {}
-        for agent in all_agents:
-            role_counts[agent.role] = role_counts.get(agent.role, 0) + 1
-
-        duplicates = {role: count for role, count in role_counts.items() if count > 1}
-        if duplicates:
-            for role, count in duplicates.items():
-                all_conflicts[role] = [f"Role defined {count} times across files"]
+        all_conflicts = self._duplicate_roles(all_agents, "across files")
 
         # Validate cross-file dependencies
-        all_roles = {agent.role for agent in all_agents}
-        for role, deps in all_dependency_graph.items():
-            missing_deps = [dep for dep in deps if dep not in all_roles]
-            if missing_deps:
-                all_warnings.append(
-                    f"{role}: Missing dependencies: {', '.join(missing_deps)}"
-                )
+        all_dependency_graph, all_warnings = self._check_dependencies(all_agents)
 
         # If validation failed, stop
         if all_errors or (all_conflicts and not force):
-            return LoadResult(
-                success=False,
-                loaded_count=0,
-                skipped_count=len(all_conflicts),
-                error_count=len(all_errors),
-                agents=[],
-                errors=all_errors,
+            return LoadResult.failure(
+                all_errors,
                 warnings=all_warnings,
                 conflicts=all_conflicts,
-                dependency_graph=all_dependency_graph
+                dependency_graph=all_dependency_graph,
+                skipped_count=len(all_conflicts)
             )
 
-        # Insert all agents (if not dry_run)
-        loaded_count = 0
-        skipped_count = 0
-        insert_errors = []
-
-        if not dry_run:
-            for agent in all_agents:
-                try:
-                    if force:
-                        self._upsert_agent(agent)
-                    else:
-                        self._insert_agent(agent)
-                    loaded_count += 1
-                except Exception as e:
-                    insert_errors.append(f"{agent.role}: {e}")
-                    skipped_count += 1
-        else:
-            loaded_count = len(all_agents)
-
-        return LoadResult(
-            success=(len(insert_errors) == 0),
-            loaded_count=loaded_count,
-            skipped_count=skipped_count,
-            error_count=len(insert_errors),
-            agents=all_agents if dry_run else [],
-            errors=insert_errors,
-            warnings=all_warnings,
-            conflicts=all_conflicts,
-            dependency_graph=all_dependency_graph
+        return self._apply(
+            all_agents, project_id, dry_run, force,
+            all_warnings, all_conflicts, all_dependency_graph
         )
 
-    def _get_existing_roles(self, project_id: int) -> Set[str]:
-        """Get set of existing agent roles for project"""
-        query = """
-            SELECT role FROM agents
-            WHERE project_id = ?
+    def _parse_file(self, yaml_path: Path, project_id: int) -> Tuple[List[Agent], List[str]]:
         """
-        rows = self.db_service.execute_query(query, (project_id,))
-        return {row[0] for row in rows}
+        Parse and validate one YAML file, reusing cached results by content hash.
 
-    def _insert_agent(self, agent: Agent) -> None:
-        """Insert new agent into database"""
-        query = """
-            INSERT INTO agents (
-                project_id, role, display_name, description,
-                sop_content, capabilities, is_active,
-                agent_type, tier, metadata, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        Returns:
+            Tuple of (agent models, error messages)
         """
-        import json
-        now = datetime.utcnow()
+        try:
+            content = Path(yaml_path).read_bytes()
+        except Exception as e:
+            return [], [f"Failed to read YAML: {e}"]
 
-        self.db_service.execute_update(
-            query,
-            (
-                agent.project_id,
-                agent.role,
-                agent.display_name,
-                agent.description,
-                agent.sop_content,
-                json.dumps(agent.capabilities),
-                agent.is_active,
-                agent.agent_type,
-                agent.tier.value if agent.tier else None,
-                agent.metadata,
-                now,
-                now,
-            )
-        )
+        key = (hashlib.sha256(content).hexdigest(), project_id)
+        parsed = _definition_cache.get(key)
+        if parsed is None:
+            parsed = self._validate_yaml(content, project_id)
+            _definition_cache.set(key, parsed)
 
-    def _upsert_agent(self, agent: Agent) -> None:
-        """Update existing agent or insert if not exists"""
-        # Check if exists
-        query = "SELECT id FROM agents WHERE project_id = ? AND role = ?"
-        rows = self.db_service.execute_query(
-            query,
-            (agent.project_id, agent.role)
-        )
+        agents, errors = parsed
+        return [agent.model_copy(deep=True) for agent in agents], list(errors)
+
+    def _validate_yaml(self, content: bytes, project_id: int) -> Tuple[List[Agent], List[str]]:
+        """Parse YAML content and validate each agent definition"""
+        try:
+            data = yaml.safe_load(content)
+        except Exception as e:
+            return [], [f"Failed to read YAML: {e}"]
 
-        if rows:
-            # Update existing
-            agent_id = rows[0][0]
-            self._update_agent(agent_id, agent)
+        # Determine if single or multi-agent format
+        if isinstance(data, dict):
+            # Multi-agent format or single agent format
+            agent_defs = data['agents'] if 'agents' in data else [data]
+        elif isinstance(data, list):
+            # List of agents
+            agent_defs = data
         else:
-            # Insert new
-            self._insert_agent(agent)
-
-    def _update_agent(self, agent_id: int, agent: Agent) -> None:
-        """Update existing agent"""
-        query = """
-            UPDATE agents SET
-                display_name = ?,
-                description = ?,
-                sop_content = ?,
-                capabilities = ?,
-                is_active = ?,
-                agent_type = ?,
-                tier = ?,
-                metadata = ?,
-                updated_at = ?
-            WHERE id = ?
+            return [], ["Invalid YAML format: expected dict or list"]
+
+        agents = []
+        errors = []
+
+        # Parse and validate each agent
+        for idx, agent_data in enumerate(agent_defs):
+            try:
+                # Validate with Pydantic and convert to Agent model
+                agent_def = AgentDefinition(**agent_data)
+                agents.append(agent_def.to_agent_model(project_id))
+
+            except ValidationError as e:
+                error_msg = f"Agent {idx + 1}: Validation failed:\n"
+                for error in e.errors():
+                    loc = '.'.join(str(x) for x in error['loc'])
+                    error_msg += f"  {loc}: {error['msg']}\n"
+                errors.append(error_msg.strip())
+            except Exception as e:
+                errors.append(f"Agent {idx + 1}: Unexpected error: {e}")
+
+        if errors:
+            return [], errors
+        return agents, []
+
+    @staticmethod
+    def _duplicate_roles(agents: List[Agent], where: str) -> Dict[str, List[str]]:
+        """Conflicts for roles defined more than once"""
+        role_counts: Dict[str, int] = {}
+        for agent in agents:
+            role_counts[agent.role] = role_counts.get(agent.role, 0) + 1
+        return {
+            role: [f"Role defined {count} times {where}"]
+            for role, count in role_counts.items() if count > 1
+        }
+
+    def _check_dependencies(self, agents: List[Agent]) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Build the dependency graph and warn about dependencies not being loaded"""
+        dependency_graph = {}
+        warnings = []
+        roles = {agent.role for agent in agents}
+
+        for agent in agents:
+            metadata = json.loads(agent.metadata or '{}')
+            deps = metadata.get('dependencies', [])
+            dependency_graph[agent.role] = deps
+
+            missing_deps = [dep for dep in deps if dep not in roles]
+            if missing_deps:
+                warnings.append(
+                    f"{agent.role}: Missing dependencies: {', '.join(missing_deps)}"
+                )
+
+        return dependency_graph, warnings
+
+    def _apply(
+        self,
+        agents: List[Agent],
+        project_id: int,
+        dry_run: bool,
+        force: bool,
+        warnings: List[str],
+        conflicts: Dict[str, List[str]],
+        dependency_graph: Dict[str, List[str]]
+    ) -> LoadResult:
         """
-        import json
-        now = datetime.utcnow()
+        Diff agents against the database and write the differences in one transaction.
 
-        self.db_service.execute_update(
-            query,
-            (
-                agent.display_name,
-                agent.description,
-                agent.sop_content,
-                json.dumps(agent.capabilities),
-                agent.is_active,
-                agent.agent_type,
-                agent.tier.value if agent.tier else None,
-                agent.metadata,
-                now,
-                agent_id,
+        Unchanged agents are left untouched. Changed agents are conflicts
+        unless force is set (checked only when actually loading).
+        """
+        # Last definition wins when a role is repeated (callers reject
+        # repeated roles unless force is set)
+        by_role = {agent.role: agent for agent in agents}
+        columns, existing = self._get_existing_agents(project_id)
+
+        added, changed, unchanged = [], [], []
+        for role, agent in by_role.items():
+            values = self._agent_values(agent)
+            if role not in existing:
+                added.append(role)
+            elif existing[role] != tuple(values[column] for column in columns):
+                changed.append(role)
+            else:
+                unchanged.append(role)
+
+        if changed and not force and not dry_run:
+            conflicts = dict(conflicts)
+            for role in changed:
+                conflicts[role] = ["Agent already exists"]
+            failed = LoadResult.failure(
+                [],
+                warnings=warnings,
+                conflicts=conflicts,
+                dependency_graph=dependency_graph,
+                skipped_count=len(conflicts)
             )
+            failed.added, failed.changed, failed.unchanged = added, changed, unchanged
+            return failed
+
+        errors = []
+        to_write = [by_role[role] for role in added + changed]
+        if not dry_run and to_write:
+            try:
+                self._upsert_agents(to_write, columns)
+            except Exception as e:
+                errors.append(f"Load failed, no agents written: {e}")
+
+        return LoadResult(
+            success=not errors,
+            loaded_count=0 if errors else len(to_write),
+            skipped_count=len(by_role) if errors else len(unchanged),
+            error_count=len(errors),
+            agents=agents if dry_run else [],
+            errors=errors,
+            warnings=warnings,
+            conflicts=conflicts,
+            dependency_graph=dependency_graph,
+            added=added,
+            changed=changed,
+            unchanged=unchanged
         )
+
+    @staticmethod
+    def _agent_values(agent: Agent) -> Dict[str, Any]:
+        """Database values for the loader-managed agent columns"""
+        return {
+            'display_name': agent.display_name,
+            'description': agent.description,
+            'sop_content': agent.sop_content,
+            'capabilities': json.dumps(agent.capabilities),
+            'is_active': int(agent.is_active),
+            'agent_type': agent.agent_type,
+            'tier': agent.tier.value if agent.tier else None,
+            'metadata': agent.metadata,
+        }
+
+    def _get_existing_agents(self, project_id: int) -> Tuple[List[str], Dict[str, Tuple]]:
+        """
+        Get existing agents for project.
+
+        Only columns present in the schema are used (metadata is added by
+        migration 0011 and may be missing), matching methods/agents.py.
+
+        Returns:
+            Tuple of (writable columns, role -> values for those columns)
+        """
+        with self.db_service.connect() as conn:
+            table_columns = {row[1] for row in conn.execute("PRAGMA table_info(agents)")}
+            columns = [column for column in _AGENT_COLUMNS if column in table_columns]
+            rows = conn.execute(
+                f"SELECT role, {', '.join(columns)} FROM agents WHERE project_id = ?",
+                (project_id,)
+            ).fetchall()
+        return columns, {row[0]: tuple(row[1:]) for row in rows}
+
+    def _upsert_agents(self, agents: List[Agent], columns: List[str]) -> None:
+        """Insert or update agents in a single transaction"""
+        query = f"""
+            INSERT INTO agents (
+                project_id, role, {', '.join(columns)}, created_at, updated_at
+            ) VALUES ({', '.join('?' * (len(columns) + 4))})
+            ON CONFLICT(project_id, role) DO UPDATE SET
+                {', '.join(f'{column} = excluded.{column}' for column in columns)},
+                updated_at = excluded.updated_at
+        """
+        now = datetime.utcnow()
+        params = []
+        for agent in agents:
+            values = self._agent_values(agent)
+            params.append((agent.project_id, agent.role, *(values[column] for column in columns), now, now))
+
+        with self.db_service.transaction() as conn:
+            conn.executemany(query, params)
@@ -17,6 +17,7 @@ Main exports:
 - AgentSOPInjector: Loads agent SOPs from filesystem
 - TemporalContextLoader: Loads session summaries for continuity
 - ContextPayload: Complete context delivery model
+- ContextBudgetPacker: Fits payload sections into a token budget
 """
 
 from .assembler import ContextAssembler
@@ -28,6 +29,7 @@ from .service import ContextService
 from .sop_injector import AgentSOPInjector
 from .temporal_loader import TemporalContextLoader
 from .models import ContextPayload, AgentValidationError
+from .budget import ContextBudgetPacker, PayloadSection, estimate_tokens
 from .refresh_service import RefreshService, StaleContext, RefreshReport
 from .triggers import RefreshTriggers
 
@@ -39,6 +41,9 @@ __all__ = [
     'AgentSOPInjector',
     'TemporalContextLoader',
     'AgentValidationError',
+    'ContextBudgetPacker',
+    'PayloadSection',
+    'estimate_tokens',
     # WI-31 Task #145: Context Refresh & Staleness
     'RefreshService',
     'StaleContext',
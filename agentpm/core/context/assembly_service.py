@@ -7,6 +7,7 @@ Coordinates <200ms context assembly for AI agents:
 - Plugin intelligence integration
 - Agent SOP injection
 - Temporal context loading
+- Token-budgeted payload packing (truncated stubs for sections that don't fit)
 - Graceful degradation on component failures
 
 Pattern: Service orchestrator with sub-component delegation
@@ -18,6 +19,9 @@ from datetime import datetime
 import time
 
 from .models import ContextPayload, AgentValidationError
+from .budget import (
+    STUB_PREVIEW_TOKENS, ContextBudgetPacker, PayloadSection, Tokenizer, truncate_text
+)
 from .merger import SixWMerger
 from .scoring import ConfidenceScorer
 from .freshness import ContextFreshness
@@ -45,11 +49,24 @@ class ContextAssemblyService:
         # Returns ContextPayload with merged 6W, plugin facts, SOP, session history
     """
 
+    # Packing priority per payload section (higher = kept first). Entities,
+    # merged 6W and BLOCK rules are always kept in full.
+    SECTION_PRIORITIES = {
+        'agent_sop': 90,
+        'rule_summary': 80,
+        'temporal_context': 70,  # minus position (newest summary first)
+        'plugin_facts': 60,
+        'applicable_rules': 50,  # non-BLOCK rules (summarized by rule_summary)
+        'amalgamations': 40,
+    }
+
     def __init__(
         self,
         db,
         project_path: Path,
-        enable_cache: bool = False  # Cache disabled for MVP
+        enable_cache: bool = False,  # Cache disabled for MVP
+        token_budget: Optional[int] = None,
+        tokenizer: Optional[Tokenizer] = None
     ):
         """
         Initialize context assembly service.
@@ -58,9 +75,14 @@ class ContextAssemblyService:
             db: DatabaseService instance for entity/context queries
             project_path: Project root directory (for plugins, SOPs, amalgamations)
             enable_cache: Enable two-tier caching (default: False, MVP scope)
+            token_budget: Token budget for task payloads (None or 0: no packing,
+                e.g. budget.DEFAULT_TOKEN_BUDGET to opt in)
+            tokenizer: Token estimator text -> count (default: offline heuristic)
         """
         self.db = db
         self.project_path = project_path
+        self.token_budget = token_budget
+        self.tokenizer = tokenizer
 
         # Sub-components (pure logic, no state)
         self.merger = SixWMerger()
@@ -87,7 +109,8 @@ class ContextAssemblyService:
     def assemble_task_context(
         self,
         task_id: int,
-        agent_role: Optional[str] = None
+        agent_role: Optional[str] = None,
+        token_budget: Optional[int] = None
     ) -> ContextPayload:
         """
         Assemble complete hierarchical context for a task.
@@ -97,13 +120,17 @@ class ContextAssemblyService:
         Args:
             task_id: Task ID to assemble context for
             agent_role: Optional agent role override (uses task.assigned_to if None)
+            token_budget: Token budget for this payload (None: the service
+                budget; 0: no packing even if the service has a budget)
 
         Returns:
-            ContextPayload with complete hierarchical context
+            ContextPayload with complete hierarchical context, packed into the
+            token budget if one applies (see payload.packing_stats)
 
         Raises:
             ContextAssemblyError: If critical components fail
             AgentValidationError: If agent assignment is invalid
+            ValueError: If token_budget is negative
 
         Performance: <200ms (p95) target
 
@@ -124,14 +151,23 @@ class ContextAssemblyService:
                 warnings=[],
                 assembled_at=datetime.now(),
                 assembly_duration_ms=120.5,
-                cache_hit=False
+                cache_hit=False,
+                packing_stats={'token_budget': 8000, 'tokens_after': 5210, ...}
             )
         """
+        if token_budget is None:
+            token_budget = self.token_budget
+        if token_budget is not None and token_budget < 0:
+            raise ValueError(f"token_budget must be >= 0, got {token_budget}")
+
         start_time = time.perf_counter()
 
         # Cache disabled for MVP - go straight to assembly
         payload = self._assemble_task_context_uncached(task_id, agent_role)
 
+        # Fit optional sections into the token budget
+        self._pack_payload(payload, token_budget)
+
         # Record assembly duration
         duration_ms = (time.perf_counter() - start_time) * 1000
         payload.assembly_duration_ms = duration_ms
@@ -357,6 +393,105 @@ class ContextAssemblyService:
 
         return payload
 
+    # ─────────────────────────────────────────────────────────────────
+    # TOKEN BUDGET - Payload packing
+    # ─────────────────────────────────────────────────────────────────
+
+    def _pack_payload(self, payload: ContextPayload, token_budget: Optional[int]) -> None:
+        """
+        Fit the payload into the token budget (in place).
+
+        Optional sections that don't fit become truncated stubs referencing
+        the full content, or are dropped; stats go to payload.packing_stats.
+        No budget (None or 0) leaves the payload untouched.
+        """
+        if not token_budget:
+            return
+
+        packer = ContextBudgetPacker(token_budget, self.tokenizer)
+        packed = packer.pack(self._payload_sections(payload, packer))
+
+        if payload.agent_sop:
+            payload.agent_sop = packed.value('agent_sop')
+        if payload.rule_summary:
+            payload.rule_summary = packed.value('rule_summary', '')
+        payload.temporal_context = [
+            packed.value(f'temporal_context.{index}')
+            for index in range(len(payload.temporal_context))
+            if packed.status[f'temporal_context.{index}'] != 'dropped'
+        ]
+        payload.plugin_facts = {
+            name: packed.value(f'plugin_facts.{name}')
+            for name in payload.plugin_facts
+            if packed.status[f'plugin_facts.{name}'] != 'dropped'
+        }
+        if packed.status.get('applicable_rules') == 'dropped':
+            blocking = {id(rule) for rule in payload.blocking_rules}
+            payload.applicable_rules = [rule for rule in payload.applicable_rules if id(rule) in blocking]
+        if payload.amalgamations:
+            payload.amalgamations = packed.value('amalgamations', {})
+
+        payload.packing_stats = packed.stats
+        if packed.stats['stubbed'] or packed.stats['dropped']:
+            payload.warnings.append(
+                f"Context packed into {token_budget} token budget "
+                f"({len(packed.stats['stubbed'])} sections truncated, {len(packed.stats['dropped'])} dropped)"
+            )
+
+    def _payload_sections(self, payload: ContextPayload, packer: ContextBudgetPacker) -> List[PayloadSection]:
+        """Split a payload into prioritized sections with stubs and references."""
+        priorities = self.SECTION_PRIORITIES
+
+        def text_section(name: str, text: str, reference: str) -> PayloadSection:
+            tokens = packer.cost(text)
+
+            def truncate(preview_tokens: int) -> str:
+                return truncate_text(text, reference, tokens, packer.tokenizer, preview_tokens)
+
+            return PayloadSection(name, priorities[name], text, reference, truncate(STUB_PREVIEW_TOKENS),
+                                  truncate=truncate)
+
+        sections = [
+            PayloadSection('entities', 100, [payload.project, payload.work_item, payload.task], required=True),
+            PayloadSection('merged_6w', 100, payload.merged_6w, required=True),
+            PayloadSection('blocking_rules', 100, payload.blocking_rules, required=True),
+        ]
+
+        if payload.agent_sop:
+            sections.append(text_section('agent_sop', payload.agent_sop, f"apm agents show {payload.assigned_agent}"))
+        if payload.rule_summary:
+            sections.append(text_section('rule_summary', payload.rule_summary, "apm rules list"))
+
+        for index, summary in enumerate(payload.temporal_context):
+            reference = f"work_item_summaries #{summary.get('id')}"
+            text = summary.get('summary_text') or ''
+            stub = dict(
+                summary, metadata={}, truncated=True,
+                summary_text=truncate_text(text, reference, packer.cost(text), packer.tokenizer)
+            )
+            sections.append(PayloadSection(
+                f'temporal_context.{index}', priorities['temporal_context'] - index, summary, reference, stub
+            ))
+
+        for name, facts in payload.plugin_facts.items():
+            reference = f"project context plugin_facts.{name} (apm context show --project)"
+            stub = {'truncated': True, 'reference': reference}
+            if isinstance(facts, dict) and 'version' in facts:
+                stub['version'] = facts['version']
+            sections.append(PayloadSection(f'plugin_facts.{name}', priorities['plugin_facts'], facts, reference, stub))
+
+        blocking = {id(rule) for rule in payload.blocking_rules}
+        other_rules = [rule for rule in payload.applicable_rules if id(rule) not in blocking]
+        if other_rules:
+            sections.append(PayloadSection(
+                'applicable_rules', priorities['applicable_rules'], other_rules, "apm rules list"
+            ))
+
+        if payload.amalgamations:
+            sections.append(PayloadSection('amalgamations', priorities['amalgamations'], payload.amalgamations))
+
+        return sections
+
     # ─────────────────────────────────────────────────────────────────
     # HELPER METHODS - Component integration
     # ─────────────────────────────────────────────────────────────────
@@ -47,6 +47,8 @@ class ContextPayload(BaseModel):
         assembled_at: Assembly timestamp
         assembly_duration_ms: Performance tracking
         cache_hit: Cache performance indicator
+        packing_stats: Token budget packing result (budget, tokens before/after,
+            per-section status, stubbed/dropped sections; empty if unbudgeted)
     """
 
     model_config = ConfigDict(
@@ -88,6 +90,7 @@ class ContextPayload(BaseModel):
     assembled_at: datetime
     assembly_duration_ms: float = Field(ge=0.0)
     cache_hit: bool = False
+    packing_stats: Dict[str, Any] = Field(default_factory=dict)
 
 
 class AgentValidationError(Exception):
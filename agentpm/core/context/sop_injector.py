@@ -3,16 +3,21 @@ Agent SOP Injector - Load Agent Standard Operating Procedures
 
 Loads agent SOPs from filesystem (.claude/agents/{role}.md).
 Integrates with WI-32 agent tracking for custom SOP paths.
-Provides file-based caching with modification time tracking.
+Provides file-based caching with modification time tracking (shared
+TTLCache, registered as 'context.sops').
 
 Pattern: Filesystem read with caching and graceful degradation
 """
 
 from pathlib import Path
-from typing import Optional, Dict, Tuple
+from typing import Optional
 
+from ..performance.cache import TTLCache
 from .models import AgentValidationError
 
+# SOPs cached per injector (entries; each is one .md file)
+SOP_CACHE_SIZE = 64
+
 
 class AgentSOPInjector:
     """
@@ -36,7 +41,7 @@ class AgentSOPInjector:
             project_path: Project root directory (Path object)
         """
         self.project_path = project_path
-        self.sop_cache: Dict[str, Tuple[str, float]] = {}  # {role: (content, mtime)}
+        self.sop_cache = TTLCache('context.sops', maxsize=SOP_CACHE_SIZE)  # {role: (content, mtime)}
 
     def load_sop(
         self,
@@ -126,8 +131,9 @@ class AgentSOPInjector:
         Performance: <5ms (cache hit), <20ms (cache miss with file read)
         """
         # Check cache
-        if agent_role in self.sop_cache:
-            cached_content, cached_mtime = self.sop_cache[agent_role]
+        cached = self.sop_cache.get(agent_role)
+        if cached is not None:
+            cached_content, cached_mtime = cached
             current_mtime = sop_path.stat().st_mtime
 
             if cached_mtime == current_mtime:
@@ -138,7 +144,7 @@ class AgentSOPInjector:
         content = sop_path.read_text(encoding='utf-8')
 
         # Store in cache with mtime
-        self.sop_cache[agent_role] = (content, sop_path.stat().st_mtime)
+        self.sop_cache.set(agent_role, (content, sop_path.stat().st_mtime), tags=[f"sop:{agent_role}"])
 
         return content
 
@@ -154,6 +160,6 @@ class AgentSOPInjector:
             >>> injector.clear_cache()  # Clear all
         """
         if agent_role:
-            self.sop_cache.pop(agent_role, None)
+            self.sop_cache.delete(agent_role)
         else:
             self.sop_cache.clear()
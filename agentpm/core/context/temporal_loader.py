@@ -3,7 +3,8 @@ Temporal Context Loader - Session History for Continuity
 
 Loads session summaries from WI-0017 work_item_summaries table.
 Provides temporal context (what happened in recent sessions) for continuity
-across work sessions.
+across work sessions. Older history comes from compacted rollup rows
+(Migration 0058) once raw summaries run out.
 
 Pattern: Simple database query with formatting for agent consumption
 """
@@ -48,10 +49,13 @@ class TemporalContextLoader:
 
         Returns:
             List of summary dicts with:
+                - id: work_item_summaries row ID
                 - summary_text: Session summary text
                 - summary_type: 'session', 'milestone', 'checkpoint', 'handoff'
                 - session_date: ISO timestamp
                 - session_duration_hours: Duration (if available)
+                - summary_level: 'session' (raw) or rollup level ('daily', 'weekly', 'work_item')
+                - source_ids: Raw summary ids merged into a rollup (None for raw rows)
                 - metadata: JSON metadata (key_decisions, tasks_completed, etc.)
 
         Performance: <10ms (indexed query on work_item_id + date DESC)
@@ -82,10 +86,13 @@ class TemporalContextLoader:
             # Convert to dict format for ContextPayload
             return [
                 {
+                    'id': s.id,
                     'summary_text': s.summary_text,
                     'summary_type': s.summary_type,
                     'session_date': s.session_date.isoformat() if hasattr(s.session_date, 'isoformat') else s.session_date,
                     'session_duration_hours': s.session_duration_hours,
+                    'summary_level': s.summary_level,
+                    'source_ids': s.source_ids,
                     'metadata': s.context_metadata or {}
                 }
                 for s in summaries
@@ -134,7 +141,11 @@ class TemporalContextLoader:
 
         for idx, summary in enumerate(summaries, 1):
             # Session header
-            lines.append(f"### Session {idx}: {summary['summary_type']}")
+            level = summary.get('summary_level', 'session')
+            if level != 'session':
+                lines.append(f"### Session {idx}: {level} rollup")
+            else:
+                lines.append(f"### Session {idx}: {summary['summary_type']}")
 
             # Session metadata
             if summary.get('session_date'):
@@ -678,19 +678,15 @@ class UnifiedContextService:
     # ========================================================================
 
     def _load_documents(self, entity_type: EntityType, entity_id: int) -> List[DocumentReference]:
-        """Load document references for entity."""
-        query = """
-            SELECT * FROM document_references
-            WHERE entity_type = ? AND entity_id = ?
-            ORDER BY created_at DESC
-            LIMIT 20
-        """
-
-        with self.db.connect() as conn:
-            cursor = conn.execute(query, (entity_type.value, entity_id))
-            rows = cursor.fetchall()
+        """Load document references for entity (content read through the blob store)."""
+        from ..database.methods import document_references as doc_methods
 
-        return [DocumentReference(**dict(row)) for row in rows]
+        return doc_methods.list_document_references(
+            self.db,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            limit=20
+        )
 
     def _load_evidence(self, entity_type: EntityType, entity_id: int) -> List[EvidenceSource]:
         """Load evidence sources for entity."""
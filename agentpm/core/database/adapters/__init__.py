@@ -19,32 +19,30 @@ NOT direct methods calls:
   - work_items.create_work_item(db, work_item)  # BYPASS - Don't use
 """
 
-from .base_adapter import BaseAdapter
-from .project_adapter import ProjectAdapter
-from .work_item_adapter import WorkItemAdapter
-from .task_adapter import TaskAdapter
-from .idea_adapter import IdeaAdapter
-from .idea_element_adapter import IdeaElementAdapter
-from .session import SessionAdapter
-from .agent_adapter import AgentAdapter
-from .rule_adapter import RuleAdapter
-from .context_adapter import ContextAdapter
-from .dependencies_adapter import (
-    TaskDependencyAdapter,
-    TaskBlockerAdapter,
-    WorkItemDependencyAdapter
-)
-from .work_item_summary_adapter import WorkItemSummaryAdapter
-from .summary_adapter import SummaryAdapter
-from .search_index_adapter import SearchIndexAdapter
-from .search_metrics_adapter import SearchMetricsAdapter
-from .document_reference_adapter import DocumentReferenceAdapter
-from .provider import (
-    ProviderInstallationAdapter,
-    CursorMemoryAdapter,
-    ProviderFileAdapter,
-)
-from .skill_adapter import SkillAdapter
+from agentpm.utils.lazy import lazy_exports
+
+# Imported on first access, so using one name does not load every submodule
+_EXPORTS = {
+    '.base_adapter': ['BaseAdapter'],
+    '.project_adapter': ['ProjectAdapter'],
+    '.work_item_adapter': ['WorkItemAdapter'],
+    '.task_adapter': ['TaskAdapter'],
+    '.idea_adapter': ['IdeaAdapter'],
+    '.idea_element_adapter': ['IdeaElementAdapter'],
+    '.session': ['SessionAdapter'],
+    '.agent_adapter': ['AgentAdapter'],
+    '.rule_adapter': ['RuleAdapter'],
+    '.context_adapter': ['ContextAdapter'],
+    '.dependencies_adapter': ['TaskDependencyAdapter', 'TaskBlockerAdapter', 'WorkItemDependencyAdapter'],
+    '.work_item_summary_adapter': ['WorkItemSummaryAdapter'],
+    '.summary_adapter': ['SummaryAdapter'],
+    '.search_index_adapter': ['SearchIndexAdapter'],
+    '.search_metrics_adapter': ['SearchMetricsAdapter'],
+    '.document_reference_adapter': ['DocumentReferenceAdapter'],
+    '.provider': ['ProviderInstallationAdapter', 'CursorMemoryAdapter', 'ProviderFileAdapter'],
+    '.skill_adapter': ['SkillAdapter'],
+}
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = [
     "BaseAdapter",
@@ -14,6 +14,8 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from ..models.document_reference import DocumentReference
+from ..utils.blob_codec import decode_blob_text
+from ..utils.hydration import TrustedHydrator, enum_converter, parse_db_datetime
 from ..enums import EntityType, DocumentType, DocumentFormat, StorageMode, SyncStatus
 
 
@@ -206,6 +208,10 @@ class DocumentReferenceAdapter:
         """
         Convert database row to DocumentReference model.
 
+        Content stored in the blob store (Migration 0052) is decoded from the
+        joined content_blob_codec/content_blob_payload columns; rows without a
+        blob fall back to the inline content column.
+
         Args:
             row: Database row (dict-like from sqlite3.Row)
 
@@ -241,7 +247,8 @@ class DocumentReferenceAdapter:
             work_item_id=row.get('work_item_id'),
 
             # Content storage (Migration 0039 - WI-133)
-            content=row.get('content'),
+            content=_row_content(row),
+            content_blob_key=row.get('content_blob_key'),
             filename=row.get('filename'),
             storage_mode=StorageMode(row['storage_mode']) if row.get('storage_mode') else StorageMode.HYBRID,  # String to Enum
             content_updated_at=_parse_datetime(row.get('content_updated_at')),
@@ -262,6 +269,35 @@ class DocumentReferenceAdapter:
             auto_publish=row.get('auto_publish'),
         )
 
+    @staticmethod
+    def from_db_trusted(row: Dict[str, Any]) -> DocumentReference:
+        """
+        Convert a database row to a DocumentReference model without validation.
+
+        Same field mapping as from_db(), built by a compiled TrustedHydrator
+        for read-only list queries over rows that were validated when written
+        (the file_path structure check is not repeated).
+
+        Args:
+            row: Database row (sqlite3.Row or dict)
+
+        Returns:
+            DocumentReference model (equal to from_db(row) for valid rows)
+        """
+        return TRUSTED_DOCUMENTS.from_row(row)
+
+    @staticmethod
+    def from_rows_trusted(rows: List[Any]) -> List[DocumentReference]:
+        """Convert sqlite3.Row results of one query with from_db_trusted()"""
+        return TRUSTED_DOCUMENTS.from_rows(rows)
+
+
+def _row_content(row: Dict[str, Any]) -> Optional[str]:
+    """Read document content through the blob store, falling back to inline content"""
+    if row.get('content_blob_payload') is not None:
+        return decode_blob_text(row.get('content_blob_codec'), row['content_blob_payload'])
+    return row.get('content')
+
 
 def _parse_datetime(value: Any) -> datetime | None:
     """Parse datetime from database value"""
@@ -273,3 +309,51 @@ def _parse_datetime(value: Any) -> datetime | None:
         return datetime.fromisoformat(value.replace(' ', 'T'))
     except (ValueError, AttributeError):
         return None
+
+
+def _blob_or_inline_content(content: Any, codec: Any, payload: Any) -> Optional[str]:
+    """_row_content() over the raw content/blob columns"""
+    if payload is not None:
+        return decode_blob_text(codec, payload)
+    return content
+
+
+def _timestamp_or_now(value: Any) -> datetime:
+    return parse_db_datetime(value) or datetime.utcnow()
+
+
+# Trusted construction for read-only list queries (same mapping as from_db)
+TRUSTED_DOCUMENTS = TrustedHydrator(
+    DocumentReference,
+    columns=(
+        'id', 'entity_type', 'entity_id', 'file_path', 'document_type', 'title',
+        'description', 'file_size_bytes', 'content_hash', 'format', 'created_by',
+        'created_at', 'updated_at', 'category', 'document_type_dir', 'segment_type',
+        'component', 'domain', 'audience', 'maturity', 'priority', 'tags', 'phase',
+        'work_item_id', 'content_blob_key', 'filename', 'storage_mode',
+        'content_updated_at', 'last_synced_at', 'sync_status', 'visibility',
+        'lifecycle_stage', 'published_path', 'published_date', 'unpublished_date',
+        'review_status', 'reviewer_id', 'reviewer_assigned_at', 'review_comment',
+        'review_completed_at', 'auto_publish',
+    ),
+    converters={
+        'entity_type': enum_converter(EntityType),
+        'document_type': enum_converter(DocumentType),
+        'format': enum_converter(DocumentFormat),
+        'storage_mode': enum_converter(StorageMode, StorageMode.HYBRID),
+        'sync_status': enum_converter(SyncStatus, SyncStatus.SYNCED),
+        'tags': lambda value: json.loads(value) if value else [],
+        'auto_publish': lambda value: None if value is None else bool(value),
+        'created_at': _timestamp_or_now,
+        'updated_at': _timestamp_or_now,
+        'content_updated_at': parse_db_datetime,
+        'last_synced_at': parse_db_datetime,
+        'published_date': parse_db_datetime,
+        'unpublished_date': parse_db_datetime,
+        'reviewer_assigned_at': parse_db_datetime,
+        'review_completed_at': parse_db_datetime,
+    },
+    derived={
+        'content': (('content', 'content_blob_codec', 'content_blob_payload'), _blob_or_inline_content),
+    },
+)
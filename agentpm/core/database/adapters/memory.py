@@ -16,6 +16,7 @@ from agentpm.core.database.models.memory import (
     MemoryFileType,
     ValidationStatus,
 )
+from agentpm.core.database.utils.blob_codec import decode_blob_text
 
 
 class MemoryFileAdapter:
@@ -53,6 +54,7 @@ class MemoryFileAdapter:
             'content': memory_file.content,
             'source_tables': json.dumps(memory_file.source_tables),
             'template_version': memory_file.template_version,
+            'source_watermark': memory_file.source_watermark,
             'confidence_score': memory_file.confidence_score,
             'completeness_score': memory_file.completeness_score,
             'validation_status': memory_file.validation_status.value,
@@ -69,6 +71,9 @@ class MemoryFileAdapter:
     def from_db(row: Dict[str, Any]) -> MemoryFile:
         """Convert SQLite row to MemoryFile model.
 
+        Content stored in the blob store (Migration 0052) is decoded from the
+        joined content_blob_codec/content_blob_payload columns.
+
         Args:
             row: SQLite row as dict (use sqlite3.Row or row_factory)
 
@@ -83,6 +88,11 @@ class MemoryFileAdapter:
         # Parse source_tables JSON → List[str]
         source_tables = json.loads(row.get('source_tables', '[]'))
 
+        # Read content through the blob store, falling back to inline content
+        content = row['content']
+        if row.get('content_blob_payload') is not None:
+            content = decode_blob_text(row.get('content_blob_codec'), row['content_blob_payload'])
+
         return MemoryFile(
             id=row['id'],
             project_id=row['project_id'],
@@ -90,9 +100,11 @@ class MemoryFileAdapter:
             file_type=MemoryFileType(row['file_type']),
             file_path=row['file_path'],
             file_hash=row.get('file_hash'),
-            content=row['content'],
+            content=content,
+            content_blob_key=row.get('content_blob_key'),
             source_tables=source_tables,
             template_version=row.get('template_version', '1.0.0'),
+            source_watermark=row.get('source_watermark'),
             confidence_score=row.get('confidence_score', 1.0),
             completeness_score=row.get('completeness_score', 1.0),
             validation_status=ValidationStatus(row.get('validation_status', 'pending')),
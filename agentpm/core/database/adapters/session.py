@@ -278,7 +278,7 @@ class SessionAdapter:
             List of decision dictionaries
         """
         from ..methods import sessions as session_methods
-        return session_methods.search_decisions(db, query, project_id=project_id)
+        return session_methods.search_decisions(db, project_id, query)
 
     @staticmethod
     def get_stats(db, project_id: Optional[int] = None) -> Dict[str, Any]:
@@ -332,20 +332,20 @@ class SessionAdapter:
             'id': session.id,
             'session_id': session.session_id,
             'project_id': session.project_id,
-            'tool_name': session.tool_name.value,
+            'tool_name': (session.tool_name or session.tool).value,
             'llm_model': session.llm_model.value if session.llm_model else None,
             'tool_version': session.tool_version,
-            'start_time': session.start_time.isoformat(),
-            'end_time': session.end_time.isoformat() if session.end_time else None,
+            'start_time': _iso(session.started_at) or datetime.now().isoformat(),
+            'end_time': _iso(session.ended_at),
             'duration_minutes': session.duration_minutes,
             'status': session.status.value,  # 🔥 NEW: Session status
             'session_type': session.session_type.value,
             'exit_reason': session.exit_reason,
             'developer_name': session.developer_name,
             'developer_email': session.developer_email,
-            'metadata': json.dumps(session.metadata.model_dump()),
-            'created_at': session.created_at.isoformat() if session.created_at else None,
-            'updated_at': session.updated_at.isoformat() if session.updated_at else None,
+            'metadata': json.dumps(session.metadata.model_dump() if session.metadata else {}),
+            'created_at': _iso(session.created_at),
+            'updated_at': _iso(session.updated_at),
         }
 
     @staticmethod
@@ -429,3 +429,10 @@ class SessionAdapter:
                 result[key] = value
 
         return result
+
+
+def _iso(value: Any) -> Optional[str]:
+    """Timestamp as ISO string (model fields hold strings or datetimes)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
@@ -70,6 +70,8 @@ class SummaryAdapter:
             'session_id': summary.session_id,
             'session_date': summary.session_date,
             'session_duration_hours': summary.session_duration_hours,
+            'summary_level': summary.summary_level.value,
+            'source_ids': json.dumps(summary.source_ids) if summary.source_ids is not None else None,
         }
 
     @staticmethod
@@ -120,6 +122,8 @@ class SummaryAdapter:
             session_id=row.get('session_id'),
             session_date=row.get('session_date'),
             session_duration_hours=row.get('session_duration_hours'),
+            summary_level=row.get('summary_level') or 'session',
+            source_ids=json.loads(row['source_ids']) if row.get('source_ids') else None,
         )
 
     @staticmethod
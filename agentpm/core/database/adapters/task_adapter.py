@@ -13,6 +13,7 @@ from datetime import datetime
 
 from ..models.task import Task
 from ..enums import TaskStatus, TaskType
+from ..utils.hydration import TrustedHydrator, enum_converter, parse_db_datetime
 
 
 class TaskAdapter:
@@ -203,6 +204,27 @@ class TaskAdapter:
             completed_at=_parse_datetime(row.get('completed_at')),
         )
 
+    @staticmethod
+    def from_db_trusted(row: Dict[str, Any]) -> Task:
+        """
+        Convert a database row to a Task model without validation.
+
+        Same field mapping as from_db(), built by a compiled TrustedHydrator
+        for read-only list queries over rows that were validated when written.
+
+        Args:
+            row: Database row (sqlite3.Row or dict)
+
+        Returns:
+            Task model (equal to from_db(row) for valid rows)
+        """
+        return TRUSTED_TASKS.from_row(row)
+
+    @staticmethod
+    def from_rows_trusted(rows: List[Any]) -> List[Task]:
+        """Convert sqlite3.Row results of one query with from_db_trusted()"""
+        return TRUSTED_TASKS.from_rows(rows)
+
 
 def _parse_datetime(value: Any) -> datetime | None:
     """Parse datetime from database value"""
@@ -213,4 +235,36 @@ def _parse_datetime(value: Any) -> datetime | None:
     try:
         return datetime.fromisoformat(value.replace(' ', 'T'))
     except (ValueError, AttributeError):
-        return None
\ No newline at end of file
+        return None
+
+
+def _parse_quality_metadata(value: Any) -> Optional[dict]:
+    """Decode quality_metadata JSON (handles double-encoded values)"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = json.loads(value)
+        if isinstance(value, str):
+            value = json.loads(value)
+    return value
+
+
+# Trusted construction for read-only list queries (same mapping as from_db)
+TRUSTED_TASKS = TrustedHydrator(
+    Task,
+    columns=(
+        'id', 'work_item_id', 'name', 'description', 'type', 'quality_metadata',
+        'effort_hours', 'priority', 'assigned_to', 'status', 'blocked_reason',
+        'due_date', 'created_at', 'updated_at', 'started_at', 'completed_at',
+    ),
+    converters={
+        'type': enum_converter(TaskType, TaskType.IMPLEMENTATION),
+        'status': enum_converter(TaskStatus, TaskStatus.DRAFT),
+        'quality_metadata': _parse_quality_metadata,
+        'due_date': parse_db_datetime,
+        'created_at': parse_db_datetime,
+        'updated_at': parse_db_datetime,
+        'started_at': parse_db_datetime,
+        'completed_at': parse_db_datetime,
+    },
+)
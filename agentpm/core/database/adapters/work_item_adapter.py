@@ -11,6 +11,7 @@ from datetime import datetime
 
 from ..models.work_item import WorkItem
 from ..enums import WorkItemStatus, WorkItemType, Phase
+from ..utils.hydration import TrustedHydrator, enum_converter, parse_db_datetime
 
 
 class WorkItemAdapter:
@@ -207,6 +208,28 @@ class WorkItemAdapter:
             updated_at=_parse_datetime(row.get('updated_at')),
         )
 
+    @staticmethod
+    def from_db_trusted(row: Dict[str, Any]) -> WorkItem:
+        """
+        Convert a database row to a WorkItem model without validation.
+
+        Same field mapping as from_db() (including the continuous-type flag
+        the model validator enforces), built by a compiled TrustedHydrator
+        for read-only list queries over rows that were validated when written.
+
+        Args:
+            row: Database row (sqlite3.Row or dict)
+
+        Returns:
+            WorkItem model (equal to from_db(row) for valid rows)
+        """
+        return TRUSTED_WORK_ITEMS.from_row(row)
+
+    @staticmethod
+    def from_rows_trusted(rows: List[Any]) -> List[WorkItem]:
+        """Convert sqlite3.Row results of one query with from_db_trusted()"""
+        return TRUSTED_WORK_ITEMS.from_rows(rows)
+
 
 def _parse_datetime(value: Any) -> datetime | None:
     """Parse datetime from database value"""
@@ -218,3 +241,38 @@ def _parse_datetime(value: Any) -> datetime | None:
         return datetime.fromisoformat(value.replace(' ', 'T'))
     except (ValueError, AttributeError):
         return None
+
+
+_work_item_type = enum_converter(WorkItemType, WorkItemType.FEATURE)
+
+
+def _continuous_flag(raw_continuous: Any, raw_type: Any) -> bool:
+    """is_continuous as from_db() derives it (continuous types are always continuous)"""
+    is_continuous_flag = False
+    if raw_continuous is not None:
+        try:
+            is_continuous_flag = int(raw_continuous) == 1
+        except (TypeError, ValueError):
+            is_continuous_flag = bool(raw_continuous)
+    return is_continuous_flag or WorkItemType.is_continuous_type(_work_item_type(raw_type))
+
+
+# Trusted construction for read-only list queries (same mapping as from_db)
+TRUSTED_WORK_ITEMS = TrustedHydrator(
+    WorkItem,
+    columns=(
+        'id', 'project_id', 'parent_work_item_id', 'name', 'description', 'type',
+        'business_context', 'metadata', 'effort_estimate_hours', 'priority', 'status',
+        'phase', 'due_date', 'not_before', 'created_at', 'updated_at',
+    ),
+    converters={
+        'type': _work_item_type,
+        'status': enum_converter(WorkItemStatus, WorkItemStatus.DRAFT),
+        'phase': enum_converter(Phase),
+        'due_date': parse_db_datetime,
+        'not_before': parse_db_datetime,
+        'created_at': parse_db_datetime,
+        'updated_at': parse_db_datetime,
+    },
+    derived={'is_continuous': (('is_continuous', 'type'), _continuous_flag)},
+)
@@ -42,6 +42,8 @@ class WorkItemSummaryAdapter:
             'context_metadata': json.dumps(summary.context_metadata) if summary.context_metadata else None,
             'created_by': summary.created_by,
             'summary_type': summary.summary_type,
+            'summary_level': summary.summary_level,
+            'source_ids': json.dumps(summary.source_ids) if summary.source_ids is not None else None,
         }
 
     @staticmethod
@@ -82,9 +84,20 @@ class WorkItemSummaryAdapter:
             created_at=_parse_datetime(row.get('created_at')),
             created_by=row.get('created_by'),
             summary_type=row.get('summary_type', 'session'),
+            summary_level=row.get('summary_level') or 'session',
+            source_ids=_parse_source_ids(row.get('source_ids')),
         )
 
 
+def _parse_source_ids(value: Any) -> list[int] | None:
+    """Parse rollup lineage (JSON list of summary ids)"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return json.loads(value)
+    return list(value)
+
+
 def _parse_datetime(value: Any) -> datetime | None:
     """Parse datetime from database value"""
     if not value:
@@ -43,6 +43,7 @@ from .types import (
     AgentTier,
     AgentFunctionalCategory,
     SummaryType,
+    SummaryLevel,
     SearchResultType,
     StorageMode,
     SyncStatus,
@@ -97,6 +98,7 @@ __all__ = [
     "AgentFunctionalCategory",
     # Summary system enums
     "SummaryType",
+    "SummaryLevel",
     # Search system enums
     "SearchResultType",
     # Document storage enums (WI-133)
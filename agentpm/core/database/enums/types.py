@@ -1592,6 +1592,31 @@ class SummaryType(str, Enum):
             return list(cls)
 
 
+class SummaryLevel(str, Enum):
+    """
+    Compaction level of a session summary row (Migration 0058).
+
+    Raw per-session summaries are rolled up as they age:
+    session -> daily -> weekly -> work_item (one row per work item).
+    Rollup rows carry merged key decisions / next steps and the ids of the
+    raw summaries they replace (source_ids).
+    """
+    SESSION = "session"        # Raw per-session summary
+    DAILY = "daily"            # All sessions of one day
+    WEEKLY = "weekly"          # All days of one ISO week (Monday start)
+    WORK_ITEM = "work_item"    # Everything older, one row per work item
+
+    @classmethod
+    def choices(cls) -> list[str]:
+        """Get all enum values for CLI/form dropdowns."""
+        return [item.value for item in cls]
+
+    @classmethod
+    def rollups(cls) -> list['SummaryLevel']:
+        """Rollup levels, finest first"""
+        return [cls.DAILY, cls.WEEKLY, cls.WORK_ITEM]
+
+
 class SearchResultType(str, Enum):
     """
     Search result types for unified search system.
@@ -16,27 +16,42 @@ Usage:
     work_item = work_items.create_work_item(service, WorkItem(...))
 """
 
-from . import projects
-from . import work_items
-from . import tasks
-from . import ideas
-from . import idea_elements
-from . import agents
-from . import rules
-from . import contexts
-from . import sessions
-from . import dependencies
-from . import evidence_sources
-from . import events
-from . import document_references
-from . import summaries
-from . import provider_methods
-from . import skills
+from agentpm.utils.lazy import lazy_exports
+
+# Imported on first access, so using one name does not load every submodule
+_SUBMODULES = [
+    '.projects',
+    '.work_items',
+    '.tasks',
+    '.project_tree',
+    '.ideas',
+    '.idea_elements',
+    '.agents',
+    '.rules',
+    '.contexts',
+    '.sessions',
+    '.dependencies',
+    '.evidence_sources',
+    '.events',
+    '.document_references',
+    '.document_chunks',
+    '.content_blobs',
+    '.rendered_markdown',
+    '.table_versions',
+    '.row_pages',
+    '.database_stats',
+    '.summaries',
+    '.summary_rollups',
+    '.provider_methods',
+    '.skills',
+]
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {}, _SUBMODULES)
 
 __all__ = [
     "projects",
     "work_items",
     "tasks",
+    "project_tree",
     "ideas",
     "idea_elements",
     "agents",
@@ -47,7 +62,14 @@ __all__ = [
     "evidence_sources",
     "events",
     "document_references",
+    "document_chunks",
+    "content_blobs",
+    "rendered_markdown",
+    "table_versions",
+    "row_pages",
+    "database_stats",
     "summaries",
+    "summary_rollups",
     # Provider methods
     "provider_methods",
     # Skills methods (WI-171)
@@ -0,0 +1,226 @@
+"""
+Content Blob Store Methods - Content-Addressed Compressed Storage (Migration 0052)
+
+Stores large text content once per distinct value in content_blobs, keyed by
+the SHA-256 of the raw bytes and compressed with zlib/lzma. Owners reference
+blobs by key:
+
+- document_references.content_blob_key (document content)
+- memory_files.content_blob_key (generated memory file content)
+- session_checkpoints.snapshot_blob_key (checkpoint snapshots)
+
+Reference counts are maintained by triggers on the owning tables, and a blob
+is deleted as soon as its last reference goes away. Blobs written but never
+referenced (e.g. a rolled-back caller) are removed by collect_garbage().
+
+Reads are transparent: owner queries LEFT JOIN content_blobs (see
+blob_join/blob_columns) and the adapters decode the joined payload.
+
+Methods: put_blob, get_blob, get_blob_text, read_blob_text, collect_garbage,
+         get_blob_stats, blob_join, blob_columns
+"""
+
+import sqlite3
+from typing import Any, Dict, Optional, Union
+
+from ..utils.blob_codec import (
+    compute_blob_key,
+    decode_blob,
+    encode_blob,
+    to_bytes,
+)
+
+
+def put_blob(
+    conn: sqlite3.Connection,
+    content: Union[str, bytes],
+    codec: Optional[str] = None
+) -> str:
+    """
+    Store content (if not already stored) and return its key.
+
+    Runs inside the caller's transaction. Storing content that already exists
+    is a key lookup - nothing is compressed or written. The new blob starts
+    with ref_count 0; the owning row's trigger takes the reference.
+
+    Args:
+        conn: Open connection (typically inside service.transaction())
+        content: Text (stored as UTF-8) or raw bytes
+        codec: Force a codec (none/zlib/lzma); None selects automatically
+
+    Returns:
+        Blob key (SHA-256 hex digest of the raw content)
+
+    Example:
+        >>> with db.transaction() as conn:
+        ...     key = put_blob(conn, "# Design\\n\\n...")
+        ...     conn.execute(
+        ...         "UPDATE document_references SET content_blob_key = ? WHERE id = ?",
+        ...         (key, 1)
+        ...     )
+    """
+    raw = to_bytes(content)
+    key = compute_blob_key(raw)
+
+    exists = conn.execute(
+        "SELECT 1 FROM content_blobs WHERE blob_key = ?", (key,)
+    ).fetchone()
+    if exists:
+        return key
+
+    stored_codec, payload = encode_blob(raw, codec)
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO content_blobs (blob_key, codec, payload, raw_size, stored_size)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (key, stored_codec, sqlite3.Binary(payload), len(raw), len(payload))
+    )
+    return key
+
+
+def get_blob(conn: sqlite3.Connection, key: Optional[str]) -> Optional[bytes]:
+    """
+    Load and decompress a blob on an open connection.
+
+    Args:
+        conn: Open connection
+        key: Blob key (None returns None)
+
+    Returns:
+        Raw content bytes, or None if key is None or unknown
+    """
+    if not key:
+        return None
+    row = conn.execute(
+        "SELECT codec, payload FROM content_blobs WHERE blob_key = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+    return decode_blob(row[0], row[1])
+
+
+def get_blob_text(conn: sqlite3.Connection, key: Optional[str]) -> Optional[str]:
+    """Load a blob on an open connection and decode it as UTF-8 text."""
+    raw = get_blob(conn, key)
+    return raw.decode('utf-8') if raw is not None else None
+
+
+def read_blob_text(service, key: Optional[str]) -> Optional[str]:
+    """
+    Load a blob as UTF-8 text.
+
+    Args:
+        service: DatabaseService instance
+        key: Blob key
+
+    Returns:
+        Decoded text, or None if key is None or unknown
+    """
+    if not key:
+        return None
+    with service.connect() as conn:
+        return get_blob_text(conn, key)
+
+
+def collect_garbage(service) -> int:
+    """
+    Delete blobs that are no longer referenced.
+
+    Referenced blobs are removed by trigger when their last owner lets go;
+    this sweeps blobs that were stored but never referenced.
+
+    Args:
+        service: DatabaseService instance
+
+    Returns:
+        Number of blobs deleted
+    """
+    with service.transaction() as conn:
+        cursor = conn.execute("DELETE FROM content_blobs WHERE ref_count <= 0")
+        return cursor.rowcount
+
+
+def get_blob_stats(service) -> Dict[str, Any]:
+    """
+    Summarise blob store usage.
+
+    Args:
+        service: DatabaseService instance
+
+    Returns:
+        Dict with blob_count, references, raw_bytes, stored_bytes,
+        compression_ratio (stored/raw) and per-codec blob counts
+
+    Example:
+        >>> stats = get_blob_stats(db)
+        >>> print(f"{stats['blob_count']} blobs, ratio {stats['compression_ratio']:.2f}")
+    """
+    with service.connect() as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(ref_count), 0),
+                   COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0)
+            FROM content_blobs
+            """
+        ).fetchone()
+        codecs = {
+            codec: count
+            for codec, count in conn.execute(
+                "SELECT codec, COUNT(*) FROM content_blobs GROUP BY codec"
+            ).fetchall()
+        }
+
+    blob_count, references, raw_bytes, stored_bytes = row
+    return {
+        'blob_count': blob_count,
+        'references': references,
+        'raw_bytes': raw_bytes,
+        'stored_bytes': stored_bytes,
+        'compression_ratio': (stored_bytes / raw_bytes) if raw_bytes else 1.0,
+        'codecs': codecs,
+    }
+
+
+def blob_join(table: str, key_column: str) -> str:
+    """
+    LEFT JOIN clause attaching an owner's blob.
+
+    Args:
+        table: Owning table name
+        key_column: Column on the owning table holding the blob key
+
+    Returns:
+        SQL fragment, e.g. for use after "FROM {table}"
+    """
+    return f" LEFT JOIN content_blobs ON content_blobs.blob_key = {table}.{key_column}"
+
+
+def blob_columns(prefix: str) -> str:
+    """
+    Select-list fragment exposing the joined blob to adapters.
+
+    Adapters read {prefix}_codec and {prefix}_payload and decode them.
+
+    Args:
+        prefix: Column alias prefix (e.g. 'content_blob')
+
+    Returns:
+        SQL fragment starting with ", "
+    """
+    return (
+        f", content_blobs.codec AS {prefix}_codec"
+        f", content_blobs.payload AS {prefix}_payload"
+    )
+
+
+__all__ = [
+    'put_blob',
+    'get_blob',
+    'get_blob_text',
+    'read_blob_text',
+    'collect_garbage',
+    'get_blob_stats',
+    'blob_join',
+    'blob_columns',
+]
@@ -0,0 +1,126 @@
+"""
+Database Statistics Methods - Storage and Row Counts from SQLite Itself
+
+Reads size information from PRAGMAs (page size/count, freelist, journal
+mode), row counts per table from sqlite_stat1 when ANALYZE has been run
+(exact COUNT(*) otherwise, or when exact=True) and per-table bytes from the
+dbstat virtual table when SQLite was compiled with it.
+
+Methods: get_database_stats, get_table_row_counts
+"""
+
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+
+def get_database_stats(service, exact: bool = False, quick_check: bool = False) -> Dict[str, Any]:
+    """
+    Get storage statistics for the database.
+
+    Args:
+        service: DatabaseService instance
+        exact: Count rows with COUNT(*) even when sqlite_stat1 has estimates
+        quick_check: Also run PRAGMA quick_check (reads every page)
+
+    Returns:
+        Dict with path, size_bytes (database + WAL), page_size, page_count,
+        freelist_count, free_bytes, journal_mode, integrity (None unless
+        quick_check) and tables: [{name, rows, rows_estimated, bytes}]
+        ordered by name (bytes is None without dbstat)
+    """
+    with service.connect() as conn:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        integrity = conn.execute("PRAGMA quick_check").fetchone()[0] if quick_check else None
+        counts = get_table_row_counts(conn, exact=exact)
+        sizes = _table_bytes(conn)
+
+    tables = [
+        {
+            'name': name,
+            'rows': rows,
+            'rows_estimated': estimated,
+            'bytes': sizes.get(name) if sizes is not None else None,
+        }
+        for name, (rows, estimated) in sorted(counts.items())
+    ]
+
+    wal_path = service.db_path.with_name(service.db_path.name + '-wal')
+    size_bytes = _file_size(service.db_path) + _file_size(wal_path)
+
+    return {
+        'path': str(service.db_path),
+        'size_bytes': size_bytes,
+        'page_size': page_size,
+        'page_count': page_count,
+        'freelist_count': freelist_count,
+        'free_bytes': freelist_count * page_size,
+        'journal_mode': journal_mode,
+        'integrity': integrity,
+        'tables': tables,
+    }
+
+
+def get_table_row_counts(conn: sqlite3.Connection, exact: bool = False) -> Dict[str, tuple]:
+    """
+    Row counts of all user tables.
+
+    Args:
+        conn: Open connection
+        exact: Ignore sqlite_stat1 estimates
+
+    Returns:
+        {table: (rows, estimated)} where estimated is True for sqlite_stat1 values
+    """
+    names = [
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' AND sql NOT LIKE 'CREATE VIRTUAL TABLE%'"
+        )
+    ]
+
+    estimates: Dict[str, int] = {}
+    if not exact and _table_exists(conn, 'sqlite_stat1'):
+        # stat is "<rows> <avg rows per key>..." (first integer is the table row count)
+        for table, stat in conn.execute("SELECT tbl, stat FROM sqlite_stat1 WHERE stat IS NOT NULL"):
+            try:
+                estimates[table] = max(estimates.get(table, 0), int(str(stat).split()[0]))
+            except (ValueError, IndexError):
+                continue
+
+    counts = {}
+    for name in names:
+        if name in estimates:
+            counts[name] = (estimates[name], True)
+        else:
+            quoted = name.replace('"', '""')
+            counts[name] = (conn.execute(f'SELECT COUNT(*) FROM "{quoted}"').fetchone()[0], False)
+    return counts
+
+
+def _table_bytes(conn: sqlite3.Connection) -> Optional[Dict[str, int]]:
+    """Bytes per table including its indexes (None if dbstat is unavailable)"""
+    try:
+        rows: List = conn.execute(
+            "SELECT COALESCE(m.tbl_name, s.name), SUM(s.pgsize) "
+            "FROM dbstat s LEFT JOIN sqlite_master m ON m.name = s.name "
+            "GROUP BY 1"
+        ).fetchall()
+    except sqlite3.Error:
+        return None
+    return {row[0]: row[1] for row in rows}
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone() is not None
+
+
+def _file_size(path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
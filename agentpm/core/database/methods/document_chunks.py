@@ -0,0 +1,415 @@
+"""
+Document Content Index Methods - Chunked FTS5 Search (Migration 0051)
+
+Maintains the document content search index: document content is split into
+heading-aware chunks (document_content_chunks) mirrored into an external-content
+FTS5 table (document_chunks_fts) ranked with BM25. Snippets are produced by
+FTS5 from the indexed chunks, so searching never reads document files.
+Without FTS5 (the migration then creates only the chunk table), searches use
+LIKE over the chunks with the same result shape.
+
+The index is kept current by create_document_reference/update_document_reference
+(and therefore create_document_with_content/update_document_content). Chunk rows
+are removed automatically when their document is deleted (ON DELETE CASCADE).
+
+Methods: index_document_content, reindex_document, rebuild_document_index,
+         search_document_chunks, build_fts_query
+"""
+
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..enums import EntityType
+from ..utils.blob_codec import decode_blob_text
+from ..utils.document_chunker import chunk_document, compute_index_hash
+
+# Markers wrapped around matched terms in FTS5 snippets. Control characters
+# cannot collide with document text and are stripped by callers.
+SNIPPET_MATCH_START = '\x02'
+SNIPPET_MATCH_END = '\x03'
+
+# BM25 column weights: title, heading_path, content
+_BM25_WEIGHTS = (8.0, 4.0, 1.0)
+_SNIPPET_TOKENS = 24
+
+# Chunks read by the LIKE fallback (no FTS5) before ranking
+FALLBACK_CANDIDATE_LIMIT = 5000
+_FTS_OPERATORS = {'AND', 'OR', 'NOT', 'NEAR'}
+
+_TOKEN_RE = re.compile(r'"[^"]+"|\w+', re.UNICODE)
+
+# Document title and content, read through the blob store (Migration 0052)
+_SELECT_DOCUMENT_CONTENT = """
+    SELECT d.id, d.title, d.content, b.codec, b.payload
+    FROM document_references d
+    LEFT JOIN content_blobs b ON b.blob_key = d.content_blob_key
+"""
+
+
+def index_document_content(
+    conn: sqlite3.Connection,
+    document_id: int,
+    title: Optional[str],
+    content: Optional[str],
+    force: bool = False
+) -> int:
+    """
+    (Re)index a document's content on an open connection.
+
+    Runs inside the caller's transaction. Skips work when the indexed title and
+    content are unchanged (tracked via source_hash) unless force=True.
+
+    Args:
+        conn: Open connection (typically inside service.transaction())
+        document_id: Document reference ID
+        title: Document title (indexed with every chunk)
+        content: Document content (None/blank removes the document from the index)
+        force: Re-index even if the content hash is unchanged
+
+    Returns:
+        Number of chunks written (0 if skipped or content is empty)
+    """
+    source_hash = compute_index_hash(title, content)
+
+    if not force:
+        row = conn.execute(
+            "SELECT source_hash FROM document_content_chunks WHERE document_id = ? LIMIT 1",
+            (document_id,)
+        ).fetchone()
+        if row is not None and row[0] == source_hash:
+            return 0
+
+    conn.execute(
+        "DELETE FROM document_content_chunks WHERE document_id = ?",
+        (document_id,)
+    )
+
+    chunks = chunk_document(content)
+    if not chunks:
+        return 0
+
+    conn.executemany(
+        """
+        INSERT INTO document_content_chunks (
+            document_id, chunk_index, title, heading_path,
+            content, start_offset, source_hash
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                document_id,
+                chunk.chunk_index,
+                title or '',
+                chunk.heading_path,
+                chunk.content,
+                chunk.start_offset,
+                source_hash,
+            )
+            for chunk in chunks
+        ]
+    )
+    return len(chunks)
+
+
+def reindex_document(service, document_id: int) -> int:
+    """
+    Re-index a single document from its stored content.
+
+    Args:
+        service: DatabaseService instance
+        document_id: Document reference ID
+
+    Returns:
+        Number of chunks written (0 if document not found or has no content)
+    """
+    with service.transaction() as conn:
+        row = conn.execute(
+            _SELECT_DOCUMENT_CONTENT + " WHERE d.id = ?",
+            (document_id,)
+        ).fetchone()
+        if row is None:
+            return 0
+        return index_document_content(conn, document_id, row[1], _row_content(row), force=True)
+
+
+def rebuild_document_index(service) -> int:
+    """
+    Rebuild the whole document content index.
+
+    Args:
+        service: DatabaseService instance
+
+    Returns:
+        Total number of chunks written
+
+    Example:
+        >>> total = rebuild_document_index(db)
+        >>> print(f"Indexed {total} chunks")
+    """
+    total = 0
+    with service.transaction() as conn:
+        conn.execute("DELETE FROM document_content_chunks")
+        rows = conn.execute(
+            _SELECT_DOCUMENT_CONTENT + " WHERE d.content IS NOT NULL OR b.payload IS NOT NULL"
+        ).fetchall()
+        for row in rows:
+            total += index_document_content(conn, row[0], row[1], _row_content(row), force=True)
+        try:
+            conn.execute(
+                "INSERT INTO document_chunks_fts(document_chunks_fts) VALUES ('optimize')"
+            )
+        except sqlite3.OperationalError:
+            pass  # FTS5 unavailable - chunks stored without full-text index
+    return total
+
+
+def _row_content(row) -> Optional[str]:
+    """Decode blob-stored content, falling back to the inline column."""
+    if row[4] is not None:
+        return decode_blob_text(row[3], row[4])
+    return row[2]
+
+
+def build_fts_query(text: str) -> str:
+    """
+    Convert free text into a safe FTS5 MATCH expression.
+
+    Quoted phrases are preserved, every other word becomes a quoted term, and
+    all terms are AND-ed (FTS5 implicit AND). FTS5 operators in the input are
+    treated as plain words.
+
+    Args:
+        text: User search text
+
+    Returns:
+        FTS5 query string (empty if text has no searchable tokens)
+
+    Example:
+        >>> build_fts_query('database "hybrid storage" AND sync')
+        '"database" "hybrid storage" "AND" "sync"'
+    """
+    return ' '.join('"' + term + '"' for term in _query_terms(text))
+
+
+def search_document_chunks(
+    service,
+    query: str,
+    entity_type: Optional[EntityType] = None,
+    entity_id: Optional[int] = None,
+    document_type: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    raw_query: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Search the document content index, returning the best chunk per document.
+
+    Documents are ranked by the BM25 score of their best matching chunk.
+    Snippets come from the index (FTS5 snippet()); matched terms are wrapped in
+    SNIPPET_MATCH_START/SNIPPET_MATCH_END. Without FTS5 every term is matched
+    with LIKE instead (see _search_chunks_like).
+
+    Args:
+        service: DatabaseService instance
+        query: Search text (free text, or FTS5 syntax when raw_query=True)
+        entity_type: Filter by owning entity type
+        entity_id: Filter by owning entity ID
+        document_type: Filter by document type value
+        limit: Maximum documents to return
+        offset: Number of documents to skip
+        raw_query: Pass query to FTS5 MATCH unchanged
+
+    Returns:
+        List of dicts with keys: document_id, chunk_index, heading_path, snippet,
+        score (BM25, or negated weighted term count without FTS5; lower is
+        better), chunk_hits, title, file_path, document_type, entity_type,
+        entity_id
+
+    Raises:
+        sqlite3.OperationalError: If raw_query is malformed FTS5 syntax
+    """
+    match = query if raw_query else build_fts_query(query)
+    if not match:
+        return []
+
+    sql = f"""
+        WITH matches AS (
+            SELECT
+                c.document_id,
+                c.chunk_index,
+                c.heading_path,
+                bm25(document_chunks_fts, {', '.join(str(w) for w in _BM25_WEIGHTS)}) AS score,
+                snippet(document_chunks_fts, 2, ?, ?, '...', {_SNIPPET_TOKENS}) AS snippet
+            FROM document_chunks_fts
+            JOIN document_content_chunks c ON c.id = document_chunks_fts.rowid
+            WHERE document_chunks_fts MATCH ?
+        ),
+        ranked AS (
+            SELECT
+                m.*,
+                ROW_NUMBER() OVER (
+                    PARTITION BY m.document_id ORDER BY m.score, m.chunk_index
+                ) AS chunk_rank,
+                COUNT(*) OVER (PARTITION BY m.document_id) AS chunk_hits
+            FROM matches m
+        )
+        SELECT
+            r.document_id, r.chunk_index, r.heading_path, r.score, r.snippet,
+            r.chunk_hits, dr.title, dr.file_path, dr.document_type,
+            dr.entity_type, dr.entity_id
+        FROM ranked r
+        JOIN document_references dr ON dr.id = r.document_id
+        WHERE r.chunk_rank = 1
+    """
+    filter_sql, filter_params = _document_filters(entity_type, entity_id, document_type)
+    sql += filter_sql + " ORDER BY r.score, r.document_id LIMIT ? OFFSET ?"
+    params: List[Any] = [SNIPPET_MATCH_START, SNIPPET_MATCH_END, match, *filter_params, limit, offset]
+
+    # Capture query errors inside the connection context so callers receive the
+    # sqlite3.OperationalError itself (connect() wraps errors in ConnectionError)
+    query_error: Optional[sqlite3.OperationalError] = None
+    rows = []
+    with service.connect() as conn:
+        if not _fts_available(conn):
+            terms = [term for term in _query_terms(query) if not (raw_query and term in _FTS_OPERATORS)]
+            return _search_chunks_like(conn, terms, filter_sql, filter_params, limit, offset)
+        try:
+            rows = conn.execute(sql, tuple(params)).fetchall()
+        except sqlite3.OperationalError as e:
+            query_error = e
+
+    if query_error is not None:
+        raise query_error
+
+    return [dict(row) for row in rows]
+
+
+def _document_filters(
+    entity_type: Optional[EntityType],
+    entity_id: Optional[int],
+    document_type: Optional[str]
+) -> Tuple[str, List[Any]]:
+    """SQL conditions (on document_references dr) and parameters for search filters"""
+    sql, params = "", []
+    if entity_type:
+        sql += " AND dr.entity_type = ?"
+        params.append(entity_type.value)
+    if entity_id:
+        sql += " AND dr.entity_id = ?"
+        params.append(entity_id)
+    if document_type:
+        sql += " AND dr.document_type = ?"
+        params.append(document_type)
+    return sql, params
+
+
+def _fts_available(conn: sqlite3.Connection) -> bool:
+    """Whether Migration 0051 created the FTS5 table (FTS5 compiled in)"""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'document_chunks_fts'"
+    ).fetchone() is not None
+
+
+def _query_terms(text: str) -> List[str]:
+    """Words and quoted phrases of a query, as build_fts_query splits them"""
+    terms = []
+    for token in _TOKEN_RE.findall(text or ''):
+        token = token.replace('"', '').strip()
+        if token:
+            terms.append(token)
+    return terms
+
+
+def _search_chunks_like(
+    conn: sqlite3.Connection,
+    terms: List[str],
+    filter_sql: str,
+    filter_params: List[Any],
+    limit: int,
+    offset: int
+) -> List[Dict[str, Any]]:
+    """
+    LIKE fallback for search_document_chunks when FTS5 is unavailable.
+
+    A chunk matches when every term occurs (case-insensitive substring) in its
+    title, heading path or content. Up to FALLBACK_CANDIDATE_LIMIT matching
+    chunks are scored by term occurrences weighted like the BM25 columns and
+    negated, so lower is better as with BM25; each document keeps its best
+    chunk.
+    """
+    if not terms:
+        return []
+
+    condition = "(c.title LIKE ? ESCAPE '\\' OR c.heading_path LIKE ? ESCAPE '\\' OR c.content LIKE ? ESCAPE '\\')"
+    params: List[Any] = []
+    for term in terms:
+        pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        params.extend([pattern] * 3)
+
+    rows = conn.execute(
+        f"""
+        SELECT
+            c.document_id, c.chunk_index, c.title AS chunk_title, c.heading_path, c.content,
+            dr.title, dr.file_path, dr.document_type, dr.entity_type, dr.entity_id
+        FROM document_content_chunks c
+        JOIN document_references dr ON dr.id = c.document_id
+        WHERE {' AND '.join([condition] * len(terms))}{filter_sql}
+        LIMIT ?
+        """,
+        (*params, *filter_params, FALLBACK_CANDIDATE_LIMIT)
+    ).fetchall()
+
+    lowered = [term.lower() for term in terms]
+    best: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        score = -float(sum(
+            weight * (row[column] or '').lower().count(term)
+            for term in lowered
+            for weight, column in zip(_BM25_WEIGHTS, ('chunk_title', 'heading_path', 'content'))
+        ))
+        current = best.get(row['document_id'])
+        if current is None or (score, row['chunk_index']) < (current['score'], current['chunk_index']):
+            best[row['document_id']] = {
+                'document_id': row['document_id'],
+                'chunk_index': row['chunk_index'],
+                'heading_path': row['heading_path'],
+                'score': score,
+                'snippet': _like_snippet(row['content'] or '', terms),
+                'chunk_hits': current['chunk_hits'] if current else 0,
+                'title': row['title'],
+                'file_path': row['file_path'],
+                'document_type': row['document_type'],
+                'entity_type': row['entity_type'],
+                'entity_id': row['entity_id'],
+            }
+        best[row['document_id']]['chunk_hits'] += 1
+
+    ranked = sorted(best.values(), key=lambda match: (match['score'], match['document_id']))
+    return ranked[offset:offset + limit]
+
+
+def _like_snippet(content: str, terms: List[str]) -> str:
+    """Window of _SNIPPET_TOKENS words around the first match, terms marked like FTS5 snippet()"""
+    words = content.split()
+    pattern = re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    first = next((i for i, word in enumerate(words) if pattern.search(word)), 0)
+    start = max(0, min(first - _SNIPPET_TOKENS // 4, len(words) - _SNIPPET_TOKENS))
+    window = ' '.join(words[start:start + _SNIPPET_TOKENS])
+    # Phrases may span words; mark on the joined window
+    window = pattern.sub(lambda m: SNIPPET_MATCH_START + m.group(0) + SNIPPET_MATCH_END, window)
+    prefix = '...' if start > 0 else ''
+    suffix = '...' if start + _SNIPPET_TOKENS < len(words) else ''
+    return prefix + window + suffix
+
+
+__all__ = [
+    'SNIPPET_MATCH_START',
+    'SNIPPET_MATCH_END',
+    'index_document_content',
+    'reindex_document',
+    'rebuild_document_index',
+    'build_fts_query',
+    'search_document_chunks',
+]
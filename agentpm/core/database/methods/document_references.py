@@ -9,12 +9,49 @@ Methods: create_document_reference, get_document_reference, list_document_refere
          get_documents_by_type
 """
 
-from typing import Optional, List
+from typing import Optional, List, Sequence
 import sqlite3
 
 from ..models import DocumentReference
 from ..adapters.document_reference_adapter import DocumentReferenceAdapter
-from ..enums import EntityType, DocumentType, DocumentFormat
+from ..enums import EntityType, DocumentType, DocumentFormat, StorageMode, SyncStatus
+from ..utils.hydration import (
+    HYDRATE_MODEL,
+    HYDRATE_VIEW,
+    RowViewSpec,
+    check_hydration,
+    fetch_row_views,
+    hydrate_rows,
+)
+from .content_blobs import blob_columns, blob_join, put_blob
+from .document_chunks import (
+    index_document_content,
+    search_document_chunks,
+)
+
+# Document rows with their content blob attached (Migration 0052). The adapter
+# decodes content_blob_codec/content_blob_payload back into content.
+_SELECT_DOCUMENTS = (
+    "SELECT document_references.*" + blob_columns('content_blob')
+    + " FROM document_references" + blob_join('document_references', 'content_blob_key')
+)
+
+# Row views for read-only list queries (hydrate='view'). Content lives in
+# content_blobs (Migration 0052) and is not available in views; use
+# hydrate='model' or 'trusted' when content is needed.
+DOCUMENT_ROW_VIEW = RowViewSpec(
+    name='DocumentRow',
+    table='document_references',
+    json_columns=frozenset({'tags'}),
+    enum_columns=(
+        ('entity_type', EntityType),
+        ('document_type', DocumentType),
+        ('format', DocumentFormat),
+        ('storage_mode', StorageMode),
+        ('sync_status', SyncStatus),
+    ),
+    exclude=('content',),
+)
 
 
 def create_document_reference(service, document: DocumentReference) -> DocumentReference:
@@ -53,56 +90,64 @@ def create_document_reference(service, document: DocumentReference) -> DocumentR
             audience, maturity, priority, tags, phase, work_item_id,
             content, filename, storage_mode, content_updated_at, last_synced_at, sync_status,
             visibility, lifecycle_stage, published_path, published_date, unpublished_date,
-            review_status, reviewer_id, reviewer_assigned_at, review_comment, review_completed_at, auto_publish
+            review_status, reviewer_id, reviewer_assigned_at, review_comment, review_completed_at, auto_publish,
+            content_blob_key
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """
-    params = (
-        db_data['entity_type'],
-        db_data['entity_id'],
-        db_data['file_path'],
-        db_data['document_type'],
-        db_data['title'],
-        db_data['description'],
-        db_data['file_size_bytes'],
-        db_data['content_hash'],
-        db_data['format'],
-        db_data['created_by'],
-        db_data['created_at'],
-        db_data['updated_at'],
-        db_data.get('category'),
-        db_data.get('document_type_dir'),
-        db_data.get('segment_type'),
-        db_data.get('component'),
-        db_data.get('domain'),
-        db_data.get('audience'),
-        db_data.get('maturity'),
-        db_data.get('priority'),
-        db_data.get('tags'),
-        db_data.get('phase'),
-        db_data.get('work_item_id'),
-        db_data.get('content'),
-        db_data.get('filename'),
-        db_data.get('storage_mode'),
-        db_data.get('content_updated_at'),
-        db_data.get('last_synced_at'),
-        db_data.get('sync_status'),
-        db_data.get('visibility'),
-        db_data.get('lifecycle_stage'),
-        db_data.get('published_path'),
-        db_data.get('published_date'),
-        db_data.get('unpublished_date'),
-        db_data.get('review_status'),
-        db_data.get('reviewer_id'),
-        db_data.get('reviewer_assigned_at'),
-        db_data.get('review_comment'),
-        db_data.get('review_completed_at'),
-        db_data.get('auto_publish'),
-    )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
     with service.transaction() as conn:
+        # Content is stored once in the blob store; the inline column stays NULL
+        content_blob_key = put_blob(conn, document.content) if document.content is not None else None
+
+        params = (
+            db_data['entity_type'],
+            db_data['entity_id'],
+            db_data['file_path'],
+            db_data['document_type'],
+            db_data['title'],
+            db_data['description'],
+            db_data['file_size_bytes'],
+            db_data['content_hash'],
+            db_data['format'],
+            db_data['created_by'],
+            db_data['created_at'],
+            db_data['updated_at'],
+            db_data.get('category'),
+            db_data.get('document_type_dir'),
+            db_data.get('segment_type'),
+            db_data.get('component'),
+            db_data.get('domain'),
+            db_data.get('audience'),
+            db_data.get('maturity'),
+            db_data.get('priority'),
+            db_data.get('tags'),
+            db_data.get('phase'),
+            db_data.get('work_item_id'),
+            None,  # content (stored in content_blobs)
+            db_data.get('filename'),
+            db_data.get('storage_mode'),
+            db_data.get('content_updated_at'),
+            db_data.get('last_synced_at'),
+            db_data.get('sync_status'),
+            db_data.get('visibility'),
+            db_data.get('lifecycle_stage'),
+            db_data.get('published_path'),
+            db_data.get('published_date'),
+            db_data.get('unpublished_date'),
+            db_data.get('review_status'),
+            db_data.get('reviewer_id'),
+            db_data.get('reviewer_assigned_at'),
+            db_data.get('review_comment'),
+            db_data.get('review_completed_at'),
+            db_data.get('auto_publish'),
+            content_blob_key,
+        )
+
         cursor = conn.execute(query, params)
         doc_id = cursor.lastrowid
+        if document.content:
+            index_document_content(conn, doc_id, document.title, document.content)
 
     return get_document_reference(service, doc_id)
 
@@ -118,7 +163,7 @@ def get_document_reference(service, doc_id: int) -> Optional[DocumentReference]:
     Returns:
         DocumentReference if found, None otherwise
     """
-    query = "SELECT * FROM document_references WHERE id = ?"
+    query = _SELECT_DOCUMENTS + " WHERE id = ?"
 
     with service.connect() as conn:
         conn.row_factory = sqlite3.Row
@@ -138,7 +183,9 @@ def list_document_references(
     document_type: Optional[DocumentType] = None,
     format: Optional[DocumentFormat] = None,
     created_by: Optional[str] = None,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    hydrate: str = HYDRATE_MODEL,
+    columns: Optional[Sequence[str]] = None
 ) -> List[DocumentReference]:
     """
     List document references with optional filters.
@@ -151,9 +198,17 @@ def list_document_references(
         format: Filter by document format (markdown, yaml, etc.)
         created_by: Filter by creator identifier
         limit: Maximum number of results
+        hydrate: 'model' (validated models), 'trusted' (models built without
+            validation) or 'view' (read-only DocumentRow views without content)
+        columns: Optional column projection for hydrate='view' (not 'content')
 
     Returns:
         List of DocumentReference models sorted by creation time (newest first)
+        (DocumentRow views for hydrate='view')
+
+    Raises:
+        ValueError: If hydrate is unknown, columns is given without
+            hydrate='view', or 'content' is projected
 
     Example:
         >>> # Get all documents for a task
@@ -165,7 +220,8 @@ def list_document_references(
         ...     db, document_type=DocumentType.ARCHITECTURE
         ... )
     """
-    query = "SELECT * FROM document_references WHERE 1=1"
+    check_hydration(hydrate, columns)
+    query = " WHERE 1=1"
     params = []
 
     if entity_type:
@@ -195,11 +251,15 @@ def list_document_references(
         params.append(limit)
 
     with service.connect() as conn:
+        if hydrate == HYDRATE_VIEW:
+            return fetch_row_views(conn, DOCUMENT_ROW_VIEW, query, params, columns)
         conn.row_factory = sqlite3.Row
-        cursor = conn.execute(query, tuple(params))
+        cursor = conn.execute(_SELECT_DOCUMENTS + query, tuple(params))
         rows = cursor.fetchall()
 
-    return [DocumentReferenceAdapter.from_db(dict(row)) for row in rows]
+    return hydrate_rows(
+        rows, hydrate, DocumentReferenceAdapter.from_db, DocumentReferenceAdapter.from_rows_trusted
+    )
 
 
 def update_document_reference(service, document: DocumentReference) -> Optional[DocumentReference]:
@@ -225,12 +285,20 @@ def update_document_reference(service, document: DocumentReference) -> Optional[
 
     db_data = DocumentReferenceAdapter.to_db(document)
 
-    set_clause = ', '.join(f"{k} = ?" for k in db_data.keys())
-    query = f"UPDATE document_references SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
-    params = (*db_data.values(), document.id)
-
     with service.transaction() as conn:
+        # Unchanged content resolves to the existing blob key (no write)
+        db_data['content_blob_key'] = (
+            put_blob(conn, document.content) if document.content is not None else None
+        )
+        db_data['content'] = None
+
+        set_clause = ', '.join(f"{k} = ?" for k in db_data.keys())
+        query = f"UPDATE document_references SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
+        params = (*db_data.values(), document.id)
+
         conn.execute(query, params)
+        # No-op when title/content are unchanged (e.g. sync status updates)
+        index_document_content(conn, document.id, document.title, document.content)
 
     return get_document_reference(service, document.id)
 
@@ -288,7 +356,7 @@ def get_documents_by_entity_ids(
     
     # Create placeholders for IN clause
     placeholders = ','.join(['?' for _ in entity_ids])
-    query = f"SELECT * FROM document_references WHERE entity_type = ? AND entity_id IN ({placeholders})"
+    query = _SELECT_DOCUMENTS + f" WHERE entity_type = ? AND entity_id IN ({placeholders})"
     params = [entity_type.value] + entity_ids
     
     if document_type:
@@ -483,7 +551,7 @@ def get_document_by_path(
         ...     entity_id=240
         ... )
     """
-    query = "SELECT * FROM document_references WHERE file_path = ?"
+    query = _SELECT_DOCUMENTS + " WHERE file_path = ?"
     params = [file_path]
 
     if entity_type:
@@ -543,7 +611,7 @@ def search_documents_by_metadata(
         ...     db, category="guides", audience="developer"
         ... )
     """
-    query = "SELECT * FROM document_references WHERE 1=1"
+    query = _SELECT_DOCUMENTS + " WHERE 1=1"
     params = []
 
     if category:
@@ -551,12 +619,10 @@ def search_documents_by_metadata(
         params.append(category)
 
     if tags:
-        # Search for documents containing ANY of the provided tags
-        tag_conditions = []
-        for tag in tags:
-            tag_conditions.append("tags LIKE ?")
-            params.append(f'%"{tag}"%')
-        query += f" AND ({' OR '.join(tag_conditions)})"
+        # Documents containing ANY of the provided tags (document_tags, Migration 0056)
+        placeholders = ', '.join('?' * len(tags))
+        query += f" AND id IN (SELECT document_id FROM document_tags WHERE tag IN ({placeholders}))"
+        params.extend(tags)
 
     if component:
         query += " AND component = ?"
@@ -794,8 +860,7 @@ def get_documents_needing_sync(service) -> List[DocumentReference]:
     """
     from ..enums import SyncStatus
 
-    query = """
-        SELECT * FROM document_references
+    query = _SELECT_DOCUMENTS + """
         WHERE sync_status != ?
         ORDER BY content_updated_at DESC
     """
@@ -850,10 +915,11 @@ def search_document_content(
     limit: Optional[int] = 20
 ) -> List[DocumentReference]:
     """
-    Full-text search across document content, titles, and filenames.
+    Full-text search across document content and titles.
 
-    Uses FTS5 virtual table for fast search.
-    Searches content, title, and filename fields.
+    Uses the chunked document content index (Migration 0051) with BM25
+    ranking; each document is ranked by its best matching chunk. Queries that
+    are not valid FTS5 syntax are searched as plain words.
 
     Args:
         service: DatabaseService instance
@@ -871,29 +937,41 @@ def search_document_content(
         >>> # Search with boolean operators
         >>> docs = search_document_content(db, "database AND sync")
     """
-    # Note: FTS search requires FTS table populated
-    # This is a placeholder for future implementation when sync system is active
-    query = """
-        SELECT dr.*
-        FROM document_references dr
-        JOIN document_content_fts fts ON dr.id = fts.document_id
-        WHERE document_content_fts MATCH ?
-        ORDER BY rank
-        LIMIT ?
-    """
-
     try:
+        try:
+            matches = search_document_chunks(
+                service, search_query, limit=limit or 20, raw_query=True
+            )
+        except sqlite3.OperationalError as e:
+            if 'no such table' in str(e):
+                raise
+            # Not valid FTS5 syntax - search the words instead
+            matches = search_document_chunks(service, search_query, limit=limit or 20)
+
+        if not matches:
+            return []
+
+        # Hydrate all matches in one query, preserving rank order
+        doc_ids = [match['document_id'] for match in matches]
+        placeholders = ','.join('?' for _ in doc_ids)
         with service.connect() as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, (search_query, limit or 20))
-            rows = cursor.fetchall()
-
-        return [DocumentReferenceAdapter.from_db(dict(row)) for row in rows]
+            rows = conn.execute(
+                _SELECT_DOCUMENTS + f" WHERE id IN ({placeholders})",
+                tuple(doc_ids)
+            ).fetchall()
+
+        by_id = {row['id']: row for row in rows}
+        return [
+            DocumentReferenceAdapter.from_db(dict(by_id[doc_id]))
+            for doc_id in doc_ids if doc_id in by_id
+        ]
     except sqlite3.OperationalError:
-        # FTS table might not be populated yet, fall back to LIKE search
-        fallback_query = """
-            SELECT * FROM document_references
-            WHERE content LIKE ? OR title LIKE ? OR filename LIKE ?
+        # Content index unavailable (FTS5 missing), fall back to LIKE search
+        fallback_query = _SELECT_DOCUMENTS + """
+            WHERE id IN (
+                SELECT document_id FROM document_content_chunks WHERE content LIKE ?
+            ) OR title LIKE ? OR filename LIKE ?
             ORDER BY updated_at DESC
             LIMIT ?
         """
@@ -10,15 +10,17 @@ Methods:
 - CRUD: create_event, get_event, list_events, delete_event
 - Queries: get_session_events, get_events_by_type, get_events_by_category,
            get_events_by_severity, get_events_by_task, get_events_by_work_item,
-           get_events_by_time_range
+           get_events_by_time_range, get_events_after, get_latest_event_id
 - Analytics: count_events_by_category, get_error_events, get_workflow_events
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from agentpm.core.database.adapters.event import EventAdapter
 from agentpm.core.database.models.event import Event, EventType, EventCategory, EventSeverity
+from agentpm.core.events.adapter import EventAdapter as SessionEventAdapter
+from agentpm.core.events.models import Event as SessionEvent
 
 
 def create_event(db: 'DatabaseService', event: Event) -> Event:
@@ -417,6 +419,87 @@ def get_events_by_time_range(
         return [EventAdapter.from_db(dict(row)) for row in rows]
 
 
+def get_events_after(
+    db: 'DatabaseService',
+    last_event_id: int,
+    project_id: Optional[int] = None,
+    work_item_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    session_id: Optional[int] = None,
+    event_categories: Optional[Sequence[str]] = None,
+    up_to_event_id: Optional[int] = None,
+    limit: Optional[int] = 500
+) -> List[SessionEvent]:
+    """Get events recorded after an event ID, oldest first (incremental tail).
+
+    Scans the primary key from last_event_id, so repeated calls with the
+    last ID seen only read new rows. Rows are returned as session events
+    (agentpm.core.events.Event), the taxonomy the session_events CHECK
+    constraints enforce.
+
+    Args:
+        db: DatabaseService instance
+        last_event_id: Return events with id > last_event_id (0 for all)
+        project_id: Filter by project (optional)
+        work_item_id: Filter by work item (optional)
+        task_id: Filter by task (optional)
+        session_id: Filter by session (optional)
+        event_categories: Filter by category values or enums (optional)
+        up_to_event_id: Return events with id <= up_to_event_id (optional)
+        limit: Max events to return (optional)
+
+    Returns:
+        List of session Event models in ascending id order
+
+    Example:
+        >>> last_id = get_latest_event_id(db)
+        >>> ...
+        >>> for event in get_events_after(db, last_id, work_item_id=81):
+        ...     last_id = event.id
+    """
+    query = "SELECT * FROM session_events WHERE id > ?"
+    params: list = [last_event_id]
+
+    for column, value in (
+        ('project_id', project_id),
+        ('work_item_id', work_item_id),
+        ('task_id', task_id),
+        ('session_id', session_id),
+    ):
+        if value is not None:
+            query += f" AND {column} = ?"
+            params.append(value)
+    if event_categories:
+        query += f" AND event_category IN ({', '.join('?' * len(event_categories))})"
+        params.extend(getattr(category, 'value', category) for category in event_categories)
+    if up_to_event_id is not None:
+        query += " AND id <= ?"
+        params.append(up_to_event_id)
+
+    query += " ORDER BY id ASC"
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    with db.connect() as conn:
+        rows = conn.execute(query, params).fetchall()
+        return [SessionEventAdapter.from_row(row) for row in rows]
+
+
+def get_latest_event_id(db: 'DatabaseService') -> int:
+    """Get the highest event ID recorded (0 if there are no events).
+
+    Args:
+        db: DatabaseService instance
+
+    Returns:
+        Latest event ID
+    """
+    with db.connect() as conn:
+        row = conn.execute("SELECT MAX(id) FROM session_events").fetchone()
+        return row[0] or 0
+
+
 def delete_event(db: 'DatabaseService', event_id: int) -> bool:
     """Delete event (hard delete).
 
@@ -21,6 +21,16 @@ import sqlite3
 from ..models import Idea, WorkItem
 from ..adapters import IdeaAdapter, WorkItemAdapter
 from ..enums import IdeaStatus, WorkItemType
+from ..enums.idea import IdeaSource
+from ..utils.hydration import RowViewSpec
+
+# Row views for read-only list queries (see methods/row_pages.py)
+IDEA_ROW_VIEW = RowViewSpec(
+    name='IdeaRow',
+    table='ideas',
+    json_columns=frozenset({'tags'}),
+    enum_columns=(('status', IdeaStatus), ('source', IdeaSource)),
+)
 
 
 def create_idea(service, idea: Idea) -> Idea:
@@ -163,9 +173,9 @@ def list_ideas(
 
     # Add tag filter (OR condition for multiple tags)
     if tags:
-        tag_conditions = " OR ".join(["tags LIKE ?"] * len(tags))
-        conditions.append(f"({tag_conditions})")
-        params.extend([f'%"{tag}"%' for tag in tags])
+        placeholders = ", ".join("?" * len(tags))
+        conditions.append(f"id IN (SELECT idea_id FROM idea_tags WHERE tag IN ({placeholders}))")
+        params.extend(tags)
 
     # Apply conditions
     if conditions:
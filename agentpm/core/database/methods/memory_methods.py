@@ -10,18 +10,32 @@ Methods:
 - CRUD: create_memory_file, get_memory_file, update_memory_file, delete_memory_file
 - Queries: list_memory_files, get_memory_file_by_type, get_stale_memory_files
 - Validation: mark_validated, mark_stale, is_memory_file_current
+
+Content is stored in the content-addressed blob store (Migration 0052); the
+inline content column is left empty and reads go through the blob.
 """
 
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from agentpm.core.database.adapters.memory import MemoryFileAdapter
+from agentpm.core.database.methods.content_blobs import (
+    blob_columns,
+    blob_join,
+    put_blob,
+)
 from agentpm.core.database.models.memory import (
     MemoryFile,
     MemoryFileType,
     ValidationStatus,
 )
 
+# Memory file rows with their content blob attached (decoded by the adapter)
+_SELECT_MEMORY_FILES = (
+    'SELECT memory_files.*' + blob_columns('content_blob')
+    + ' FROM memory_files' + blob_join('memory_files', 'content_blob_key')
+)
+
 
 def create_memory_file(db: 'DatabaseService', memory_file: MemoryFile) -> MemoryFile:
     """Create a new memory file record.
@@ -60,20 +74,23 @@ def create_memory_file(db: 'DatabaseService', memory_file: MemoryFile) -> Memory
         if not data.get('updated_at'):
             data['updated_at'] = now
 
+        # Content goes to the blob store; the inline column stays empty
+        content_blob_key = put_blob(conn, data['content'])
+
         cursor = conn.execute('''
             INSERT INTO memory_files (
                 project_id, session_id, file_type, file_path, file_hash,
-                content, source_tables, template_version,
-                confidence_score, completeness_score, validation_status,
+                content, content_blob_key, source_tables, template_version,
+                source_watermark, confidence_score, completeness_score, validation_status,
                 generated_by, generation_duration_ms,
                 generated_at, validated_at, expires_at,
                 created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ''', (
             data['project_id'], data['session_id'], data['file_type'],
-            data['file_path'], data['file_hash'], data['content'],
+            data['file_path'], data['file_hash'], '', content_blob_key,
             data['source_tables'], data['template_version'],
-            data['confidence_score'], data['completeness_score'],
+            data['source_watermark'], data['confidence_score'], data['completeness_score'],
             data['validation_status'], data['generated_by'],
             data['generation_duration_ms'], data['generated_at'],
             data['validated_at'], data['expires_at'],
@@ -82,6 +99,7 @@ def create_memory_file(db: 'DatabaseService', memory_file: MemoryFile) -> Memory
         conn.commit()
 
         memory_file.id = cursor.lastrowid
+        memory_file.content_blob_key = content_blob_key
         memory_file.created_at = data['created_at']
         memory_file.updated_at = data['updated_at']
         return memory_file
@@ -104,7 +122,7 @@ def get_memory_file(db: 'DatabaseService', memory_file_id: int) -> Optional[Memo
     """
     with db.connect() as conn:
         cursor = conn.execute(
-            'SELECT * FROM memory_files WHERE id = ?',
+            _SELECT_MEMORY_FILES + ' WHERE id = ?',
             (memory_file_id,)
         )
         row = cursor.fetchone()
@@ -137,7 +155,7 @@ def get_memory_file_by_type(
     """
     with db.connect() as conn:
         cursor = conn.execute(
-            'SELECT * FROM memory_files WHERE project_id = ? AND file_type = ?',
+            _SELECT_MEMORY_FILES + ' WHERE project_id = ? AND file_type = ?',
             (project_id, file_type.value)
         )
         row = cursor.fetchone()
@@ -172,7 +190,7 @@ def list_memory_files(
         ...     print(f"{memory.file_type}: {memory.file_path}")
     """
     with db.connect() as conn:
-        query = 'SELECT * FROM memory_files WHERE 1=1'
+        query = _SELECT_MEMORY_FILES + ' WHERE 1=1'
         params: List[Any] = []
 
         if project_id is not None:
@@ -248,6 +266,11 @@ def update_memory_file(
         # Always update updated_at timestamp
         db_updates['updated_at'] = datetime.now().isoformat()
 
+        # Route content through the blob store (unchanged content keeps its key)
+        if 'content' in db_updates:
+            db_updates['content_blob_key'] = put_blob(conn, db_updates['content'] or '')
+            db_updates['content'] = ''
+
         # Build UPDATE query dynamically
         set_clause = ', '.join(f'{key} = ?' for key in db_updates.keys())
         values = list(db_updates.values())
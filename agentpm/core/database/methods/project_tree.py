@@ -0,0 +1,264 @@
+"""
+Project Tree Methods - Bulk Hierarchical Loading
+
+Loads work items with their tasks, task dependencies, task blockers and work
+item dependencies in one query per level on a single connection, replacing the
+N+1 pattern of list_work_items() followed by list_tasks(work_item_id=...) for
+every work item.
+
+Child queries filter through a join on work_items with the same WHERE clause
+as the parent query (no id IN (...) lists), so the number of queries is fixed
+regardless of tree size:
+- work items: 1 query
+- tasks: 1 query (include 'tasks')
+- task dependencies / blockers / work item dependencies: 1 query each when included
+
+Optional column projection selects fewer columns for callers that only need
+counts or names; unselected model fields keep their model defaults.
+
+Pattern: Read-only bulk method returning plain tree containers of models
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import sqlite3
+
+from ..models import WorkItem, Task
+from ..models.dependencies import TaskDependency, TaskBlocker, WorkItemDependency
+from ..adapters import WorkItemAdapter, TaskAdapter
+from ..adapters.dependencies_adapter import (
+    TaskDependencyAdapter,
+    TaskBlockerAdapter,
+    WorkItemDependencyAdapter,
+)
+
+INCLUDE_TASKS = 'tasks'
+INCLUDE_DEPENDENCIES = 'dependencies'
+INCLUDE_BLOCKERS = 'blockers'
+INCLUDE_WORK_ITEM_DEPENDENCIES = 'work_item_dependencies'
+
+INCLUDE_ALL = (
+    INCLUDE_TASKS,
+    INCLUDE_DEPENDENCIES,
+    INCLUDE_BLOCKERS,
+    INCLUDE_WORK_ITEM_DEPENDENCIES,
+)
+
+# Columns always selected under projection (required to build and nest models)
+_REQUIRED_WORK_ITEM_COLUMNS = ('id', 'project_id', 'name', 'type', 'status', 'priority')
+_REQUIRED_TASK_COLUMNS = ('id', 'work_item_id', 'name', 'type', 'status', 'priority')
+
+# Same ordering as work_items.list_work_items() and tasks.list_tasks()
+_WORK_ITEM_ORDER = "w.priority ASC, w.created_at DESC, w.id ASC"
+_TASK_ORDER = "t.priority ASC, t.created_at DESC, t.id ASC"
+
+
+@dataclass
+class TaskNode:
+    """A task with its dependencies and blockers."""
+    task: Task
+    dependencies: List[TaskDependency] = field(default_factory=list)
+    blockers: List[TaskBlocker] = field(default_factory=list)
+
+    @property
+    def unresolved_blockers(self) -> List[TaskBlocker]:
+        return [blocker for blocker in self.blockers if not blocker.is_resolved]
+
+
+@dataclass
+class WorkItemNode:
+    """A work item with its tasks and work item dependencies."""
+    work_item: WorkItem
+    tasks: List[TaskNode] = field(default_factory=list)
+    dependencies: List[WorkItemDependency] = field(default_factory=list)
+
+    def tasks_with_status(self, *statuses) -> List[Task]:
+        """Tasks whose status is one of statuses (all tasks if none given)."""
+        wanted = _status_values(statuses)
+        return [
+            node.task for node in self.tasks
+            if not wanted or node.task.status.value in wanted
+        ]
+
+
+@dataclass
+class ProjectTree:
+    """Work items (in list_work_items order) with nested tasks."""
+    project_id: Optional[int]
+    work_items: List[WorkItemNode] = field(default_factory=list)
+
+    def get(self, work_item_id: int) -> Optional[WorkItemNode]:
+        """Node for a work item ID (None if not loaded)."""
+        for node in self.work_items:
+            if node.work_item.id == work_item_id:
+                return node
+        return None
+
+    def iter_tasks(self, *statuses) -> Iterator[Tuple[WorkItem, Task]]:
+        """(work item, task) pairs, optionally filtered by task status."""
+        for node in self.work_items:
+            for task in node.tasks_with_status(*statuses):
+                yield node.work_item, task
+
+    def all_tasks(self, *statuses) -> List[Task]:
+        """Flattened tasks in work item order, optionally filtered by status."""
+        return [task for _, task in self.iter_tasks(*statuses)]
+
+    def work_items_with_status(self, *statuses) -> List[WorkItem]:
+        """Work items grouped by status in the order given (all if none given)."""
+        if not statuses:
+            return [node.work_item for node in self.work_items]
+        return [
+            node.work_item
+            for value in _status_values(statuses, ordered=True)
+            for node in self.work_items
+            if node.work_item.status.value == value
+        ]
+
+
+def load_project_tree(
+    service,
+    project_id: Optional[int] = None,
+    statuses: Optional[Iterable] = None,
+    task_statuses: Optional[Iterable] = None,
+    include: Sequence[str] = (INCLUDE_TASKS,),
+    work_item_columns: Optional[Sequence[str]] = None,
+    task_columns: Optional[Sequence[str]] = None
+) -> ProjectTree:
+    """
+    Load work items with nested tasks, dependencies and blockers in bulk.
+
+    Args:
+        service: DatabaseService instance
+        project_id: Optional project filter (None: all projects)
+        statuses: Optional work item status filter (WorkItemStatus or str values)
+        task_statuses: Optional task status filter (TaskStatus or str values)
+        include: Relations to load: 'tasks', 'dependencies', 'blockers',
+            'work_item_dependencies' ('dependencies'/'blockers' imply 'tasks')
+        work_item_columns: Optional work item column projection
+        task_columns: Optional task column projection
+
+    Returns:
+        ProjectTree with WorkItemNodes in list_work_items() order and
+        TaskNodes in list_tasks() order
+
+    Raises:
+        ValueError: If include names an unknown relation or a column name is invalid
+
+    Example:
+        >>> tree = load_project_tree(db, project_id=1, statuses=[WorkItemStatus.ACTIVE])
+        >>> for node in tree.work_items:
+        ...     done = len(node.tasks_with_status(TaskStatus.DONE))
+        ...     print(f"WI-{node.work_item.id}: {done}/{len(node.tasks)} tasks done")
+    """
+    include = set(include)
+    unknown = include - set(INCLUDE_ALL)
+    if unknown:
+        raise ValueError(f"Unknown project tree relation(s): {', '.join(sorted(unknown))}")
+    load_tasks = bool(include & {INCLUDE_TASKS, INCLUDE_DEPENDENCIES, INCLUDE_BLOCKERS})
+
+    wi_where, wi_params = _work_item_filter(project_id, statuses)
+    wi_select = _select('w', work_item_columns, _REQUIRED_WORK_ITEM_COLUMNS)
+    task_select = _select('t', task_columns, _REQUIRED_TASK_COLUMNS)
+    tree = ProjectTree(project_id=project_id)
+
+    with service.connect() as conn:
+        conn.row_factory = sqlite3.Row
+
+        rows = conn.execute(
+            f"SELECT {wi_select} "
+            f"FROM work_items w{wi_where} ORDER BY {_WORK_ITEM_ORDER}",
+            wi_params
+        ).fetchall()
+        nodes: Dict[int, WorkItemNode] = {}
+        for row in rows:
+            node = WorkItemNode(work_item=WorkItemAdapter.from_db(dict(row)))
+            nodes[node.work_item.id] = node
+            tree.work_items.append(node)
+
+        if not nodes:
+            return tree
+
+        if load_tasks:
+            task_where, task_params = wi_where, list(wi_params)
+            values = _status_values(task_statuses or ())
+            if values:
+                task_where += (" AND " if task_where else " WHERE ")
+                task_where += f"t.status IN ({', '.join('?' * len(values))})"
+                task_params.extend(sorted(values))
+
+            task_nodes: Dict[int, TaskNode] = {}
+            for row in conn.execute(
+                f"SELECT {task_select} "
+                f"FROM tasks t JOIN work_items w ON w.id = t.work_item_id"
+                f"{task_where} ORDER BY {_TASK_ORDER}",
+                task_params
+            ):
+                task_node = TaskNode(task=TaskAdapter.from_db(dict(row)))
+                task_nodes[task_node.task.id] = task_node
+                nodes[task_node.task.work_item_id].tasks.append(task_node)
+
+            if INCLUDE_DEPENDENCIES in include and task_nodes:
+                for row in conn.execute(
+                    "SELECT d.* FROM task_dependencies d "
+                    "JOIN tasks t ON t.id = d.task_id JOIN work_items w ON w.id = t.work_item_id"
+                    f"{wi_where} ORDER BY d.created_at, d.id",
+                    wi_params
+                ):
+                    task_node = task_nodes.get(row['task_id'])
+                    if task_node is not None:
+                        task_node.dependencies.append(TaskDependencyAdapter.from_db(dict(row)))
+
+            if INCLUDE_BLOCKERS in include and task_nodes:
+                for row in conn.execute(
+                    "SELECT b.* FROM task_blockers b "
+                    "JOIN tasks t ON t.id = b.task_id JOIN work_items w ON w.id = t.work_item_id"
+                    f"{wi_where} ORDER BY b.created_at, b.id",
+                    wi_params
+                ):
+                    task_node = task_nodes.get(row['task_id'])
+                    if task_node is not None:
+                        task_node.blockers.append(TaskBlockerAdapter.from_db(dict(row)))
+
+        if INCLUDE_WORK_ITEM_DEPENDENCIES in include:
+            for row in conn.execute(
+                "SELECT d.* FROM work_item_dependencies d "
+                "JOIN work_items w ON w.id = d.work_item_id"
+                f"{wi_where} ORDER BY d.created_at, d.id",
+                wi_params
+            ):
+                nodes[row['work_item_id']].dependencies.append(
+                    WorkItemDependencyAdapter.from_db(dict(row))
+                )
+
+    return tree
+
+
+def _work_item_filter(project_id: Optional[int], statuses: Optional[Iterable]) -> Tuple[str, List]:
+    """WHERE clause (on alias w) shared by every level of the tree"""
+    clauses, params = [], []
+    if project_id:
+        clauses.append("w.project_id = ?")
+        params.append(project_id)
+    values = _status_values(statuses or ())
+    if values:
+        clauses.append(f"w.status IN ({', '.join('?' * len(values))})")
+        params.extend(sorted(values))
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _select(alias: str, columns: Optional[Sequence[str]], required: Sequence[str]) -> str:
+    """Column list for a (possibly projected) SELECT"""
+    if columns is None:
+        return f"{alias}.*"
+    selected = list(required) + [c for c in columns if c not in required]
+    for column in selected:
+        if not column.isidentifier():
+            raise ValueError(f"Invalid column name: {column!r}")
+    return ", ".join(f"{alias}.{column}" for column in selected)
+
+
+def _status_values(statuses: Iterable, ordered: bool = False):
+    """Normalise enum or string statuses to their stored values"""
+    values = [getattr(status, 'value', status) for status in statuses]
+    return list(dict.fromkeys(values)) if ordered else set(values)
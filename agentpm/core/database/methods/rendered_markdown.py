@@ -0,0 +1,113 @@
+"""
+Rendered Markdown Methods - Persistent Render Cache (Migration 0054)
+
+Stores HTML rendered from markdown once per (content hash, variant), so the
+web UI does not re-run markdown + Pygments highlighting for content it has
+already rendered. Rows are written when documents are saved and read by the
+web render cache (agentpm.web.utils.markdown) on an in-process cache miss.
+
+Rendering itself lives in the web layer; these methods only store and fetch
+HTML by key. The web layer qualifies variants with its renderer version, so
+rows written by an older renderer are simply never read again and age out
+through prune_rendered_html().
+
+Methods: get_rendered_html, put_rendered_html, prune_rendered_html,
+         get_rendered_html_stats
+"""
+
+from typing import Any, Dict, Optional
+
+# Default number of rendered entries kept by prune_rendered_html()
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def get_rendered_html(service, content_hash: str, variant: str) -> Optional[str]:
+    """
+    Get stored HTML for a markdown source hash and render variant.
+
+    Args:
+        service: DatabaseService instance
+        content_hash: SHA-256 hex digest of the markdown source
+        variant: Render variant key
+
+    Returns:
+        Rendered HTML, or None if not stored
+    """
+    with service.connect() as conn:
+        row = conn.execute(
+            "SELECT html FROM rendered_markdown WHERE content_hash = ? AND variant = ?",
+            (content_hash, variant)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def put_rendered_html(service, content_hash: str, variant: str, html: str) -> None:
+    """
+    Store rendered HTML (replacing any previous rendering of the same key).
+
+    Args:
+        service: DatabaseService instance
+        content_hash: SHA-256 hex digest of the markdown source
+        variant: Render variant key
+        html: Rendered HTML
+    """
+    with service.transaction() as conn:
+        conn.execute(
+            """
+            INSERT INTO rendered_markdown (content_hash, variant, html)
+            VALUES (?, ?, ?)
+            ON CONFLICT(content_hash, variant)
+            DO UPDATE SET html = excluded.html, rendered_at = CURRENT_TIMESTAMP
+            """,
+            (content_hash, variant, html)
+        )
+
+
+def prune_rendered_html(service, max_entries: int = DEFAULT_MAX_ENTRIES) -> int:
+    """
+    Delete the oldest renderings beyond max_entries.
+
+    Args:
+        service: DatabaseService instance
+        max_entries: Number of most recently rendered entries to keep
+
+    Returns:
+        Number of entries deleted
+    """
+    with service.transaction() as conn:
+        cursor = conn.execute(
+            """
+            DELETE FROM rendered_markdown
+            WHERE (content_hash, variant) NOT IN (
+                SELECT content_hash, variant FROM rendered_markdown
+                ORDER BY rendered_at DESC
+                LIMIT ?
+            )
+            """,
+            (max_entries,)
+        )
+        return cursor.rowcount
+
+
+def get_rendered_html_stats(service) -> Dict[str, Any]:
+    """
+    Get persistent render cache statistics.
+
+    Args:
+        service: DatabaseService instance
+
+    Returns:
+        Dict with entries, distinct_sources and html_bytes
+    """
+    with service.connect() as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*), COUNT(DISTINCT content_hash), COALESCE(SUM(length(html)), 0)
+            FROM rendered_markdown
+            """
+        ).fetchone()
+    return {
+        'entries': row[0],
+        'distinct_sources': row[1],
+        'html_bytes': row[2],
+    }
@@ -0,0 +1,76 @@
+"""
+Row Page Methods - Keyset-Paginated, Projected Row Views for APIs
+
+List endpoints used to load every row as a full model (documents including
+their content) and serialize one payload. Row pages select only the
+requested columns as lightweight row views (utils/hydration.py) and page by
+id, so each page is one index range scan and large columns are never read
+unless asked for.
+
+Entities: documents, work_items, tasks, ideas
+
+Methods: page_rows
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..utils.hydration import RowView, RowViewSpec, fetch_row_view_page
+from .document_references import DOCUMENT_ROW_VIEW
+from .ideas import IDEA_ROW_VIEW
+from .tasks import TASK_ROW_VIEW
+from .work_items import WORK_ITEM_ROW_VIEW
+
+# Maximum rows per page
+MAX_PAGE_SIZE = 1000
+
+ROW_VIEWS: Dict[str, RowViewSpec] = {
+    'documents': DOCUMENT_ROW_VIEW,
+    'work_items': WORK_ITEM_ROW_VIEW,
+    'tasks': TASK_ROW_VIEW,
+    'ideas': IDEA_ROW_VIEW,
+}
+
+
+def page_rows(
+    service,
+    entity: str,
+    filters: Optional[Mapping[str, Any]] = None,
+    columns: Optional[Sequence[str]] = None,
+    after_id: int = 0,
+    limit: int = 100
+) -> Tuple[List[RowView], Optional[int]]:
+    """
+    Fetch one page of row views for an entity, ordered by id.
+
+    Args:
+        service: DatabaseService instance
+        entity: 'documents', 'work_items', 'tasks' or 'ideas'
+        filters: Optional {column: value} equality filters
+        columns: Optional column projection ('id' is always included);
+            default is every column except large ones (document content)
+        after_id: Return rows with id > after_id (the previous page's cursor)
+        limit: Page size (1..MAX_PAGE_SIZE)
+
+    Returns:
+        (views, next_after_id) - next_after_id is None on the last page
+
+    Raises:
+        ValueError: If entity is unknown, limit is out of range, or a filter
+            or column is not available
+
+    Example:
+        >>> after = 0
+        >>> while after is not None:
+        ...     rows, after = page_rows(db, 'tasks', {'status': 'active'},
+        ...                             columns=('name',), after_id=after)
+        ...     for row in rows:
+        ...         print(row.id, row.name)
+    """
+    spec = ROW_VIEWS.get(entity)
+    if spec is None:
+        raise ValueError(f"Unknown entity: {entity!r} (expected one of {', '.join(ROW_VIEWS)})")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"Page limit must be between 1 and {MAX_PAGE_SIZE}, got {limit}")
+
+    with service.connect() as conn:
+        return fetch_row_view_page(conn, spec, filters, columns, after_id, limit)
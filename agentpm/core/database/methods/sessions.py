@@ -11,12 +11,17 @@ Methods:
 - Queries: list_sessions, get_sessions_by_date_range, get_sessions_by_work_item, get_sessions_by_developer
 - Analytics: search_decisions, get_session_stats, get_active_sessions
 - Current Session: get_current_session, set_current_session, update_current_session, clear_current_session
+
+Decisions recorded in session metadata are mirrored into the session_decisions
+child table (Migration 0059) by create_session, update_session and end_session,
+so search_decisions is an indexed query instead of a parse of every session.
 """
 
 import json
+import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agentpm.core.database.adapters.session import SessionAdapter
 from agentpm.core.database.models.session import Session, SessionMetadata, SessionStatus
@@ -56,6 +61,7 @@ def create_session(db: 'DatabaseService', session: Session) -> Session:
             data['exit_reason'], data['developer_name'], data['developer_email'],
             data['metadata']
         ))
+        sync_session_decisions(conn, cursor.lastrowid, data['project_id'], data['metadata'])
         conn.commit()  # Commit transaction
 
         session.id = cursor.lastrowid
@@ -98,13 +104,14 @@ def end_session(
 
     # Calculate duration
     end_time = datetime.now()
-    duration_minutes = int((end_time - session.start_time).total_seconds() / 60)
+    start_time = datetime.fromisoformat(session.started_at) if session.started_at else end_time
+    duration_minutes = max(int((end_time - start_time).total_seconds() / 60), 0)
 
     # Build updates
     updates = {
         'end_time': end_time,
         'duration_minutes': duration_minutes,
-        'status': SessionStatus.DONE
+        'status': SessionStatus.COMPLETED
     }
 
     if metadata:
@@ -126,6 +133,8 @@ def end_session(
             SET {set_clause}
             WHERE session_id = ?
         ''', values)
+        if 'metadata' in db_updates:
+            sync_session_decisions(conn, session.id, session.project_id, db_updates['metadata'])
         conn.commit()  # Commit transaction
 
     # Return updated session
@@ -177,7 +186,8 @@ def update_session(db: 'DatabaseService', session: Session) -> Session:
         >>> session.developer_name = "Jane Doe"
         >>> updated = update_session(db, session)
     """
-    if not get_session(db, session.session_id):
+    existing = get_session(db, session.session_id)
+    if not existing:
         raise ValueError(f"Session {session.session_id} not found")
 
     with db.connect() as conn:
@@ -197,6 +207,7 @@ def update_session(db: 'DatabaseService', session: Session) -> Session:
             data['developer_name'], data['developer_email'], data['metadata'],
             session.session_id
         ))
+        sync_session_decisions(conn, existing.id, existing.project_id, data['metadata'])
         conn.commit()  # Commit transaction
 
     return session
@@ -371,50 +382,63 @@ def get_sessions_by_developer(
 
 def search_decisions(
     db: 'DatabaseService',
-    project_id: int,
-    query: str
+    project_id: Optional[int],
+    query: str,
+    limit: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """Search decisions across all sessions.
 
-    Full-text search in metadata.decisions_made JSON field.
+    Case-insensitive substring search in decision and rationale text, served
+    by the session_decisions_fts trigram index (falls back to LIKE on
+    session_decisions when FTS5 is unavailable).
 
     Args:
         db: DatabaseService instance
-        project_id: Project ID
+        project_id: Project ID (None: all projects)
         query: Search text (case-insensitive)
+        limit: Max decisions to return (default: all)
 
     Returns:
-        List of decision dicts with session context
+        List of decision dicts with session context, newest session first
 
     Example:
         >>> decisions = search_decisions(db, 1, "pydantic")
         >>> for d in decisions:
         >>>     print(f"{d['session_id']}: {d['decision']}")
     """
-    with db.connect() as conn:
-        cursor = conn.execute('''
-            SELECT session_id, metadata FROM sessions
-            WHERE project_id = ?
-            ORDER BY start_time DESC
-        ''', (project_id,))
+    pattern = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    escape = " ESCAPE '\\'" if pattern != f'%{query}%' else ''
 
-        rows = cursor.fetchall()
-        results = []
-
-        for row in rows:
-            metadata_json = row['metadata']
-            if metadata_json:
-                metadata = json.loads(metadata_json)
-                for decision in metadata.get('decisions_made', []):
-                    # Case-insensitive search in decision and rationale
-                    text = f"{decision.get('decision', '')} {decision.get('rationale', '')}".lower()
-                    if query.lower() in text:
-                        results.append({
-                            'session_id': row['session_id'],
-                            **decision
-                        })
-
-        return results
+    with db.connect() as conn:
+        if _table_exists(conn, 'session_decisions_fts'):
+            source = '''
+                session_decisions_fts f
+                JOIN session_decisions d ON d.id = f.rowid
+            '''
+            match = f"(f.decision LIKE ?{escape} OR f.rationale LIKE ?{escape})"
+        else:
+            source = 'session_decisions d'
+            match = f"(d.decision LIKE ?{escape} OR d.rationale LIKE ?{escape})"
+
+        sql = f'''
+            SELECT s.session_id, d.decision, d.entry
+            FROM {source}
+            JOIN sessions s ON s.id = d.session_id
+            WHERE {match}
+        '''
+        params: List[Any] = [pattern, pattern]
+        if project_id is not None:
+            sql += ' AND d.project_id = ?'
+            params.append(project_id)
+        sql += ' ORDER BY s.start_time DESC, s.id DESC, d.position'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        return [
+            {'session_id': row['session_id'], **(json.loads(row['entry']) if row['entry'] else {'decision': row['decision']})}
+            for row in conn.execute(sql, params)
+        ]
 
 
 def get_session_stats(
@@ -424,6 +448,8 @@ def get_session_stats(
 ) -> Dict[str, Any]:
     """Get session statistics for project.
 
+    Computed with one grouped aggregate query (no session hydration).
+
     Args:
         db: DatabaseService instance
         project_id: Project ID
@@ -438,6 +464,8 @@ def get_session_stats(
         - sessions_per_day: Average sessions per day
         - tool_distribution: Dict of tool usage counts
         - session_type_distribution: Dict of session type counts
+        - developer_stats: Per developer {sessions, avg_duration, total_duration}
+        - session_type_stats: Per session type {sessions, avg_duration, total_duration}
 
     Example:
         >>> stats = get_session_stats(db, project_id=1, days=7)
@@ -446,47 +474,140 @@ def get_session_stats(
     cutoff = datetime.now() - timedelta(days=days)
 
     with db.connect() as conn:
-        # Get all sessions in date range
-        cursor = conn.execute('''
-            SELECT * FROM sessions
+        # Durations of 0 / NULL are excluded from averages
+        groups = conn.execute('''
+            SELECT
+                COALESCE(developer_name, 'unknown') AS developer,
+                session_type,
+                tool_name,
+                COUNT(*) AS sessions,
+                SUM(COALESCE(status, 'active') = 'active') AS active,
+                COUNT(NULLIF(duration_minutes, 0)) AS timed,
+                COALESCE(SUM(duration_minutes), 0) AS duration
+            FROM sessions
             WHERE project_id = ? AND start_time >= ?
-            ORDER BY start_time DESC
-        ''', (project_id, cutoff.isoformat()))
+            GROUP BY developer, session_type, tool_name
+        ''', (project_id, cutoff.isoformat())).fetchall()
+
+    totals = _fold_stats(groups, lambda row: None)[None] if groups else _empty_stats()
+    total_sessions = totals['sessions']
+
+    return {
+        'total_sessions': total_sessions,
+        'active_sessions': sum(row['active'] for row in groups),
+        'avg_duration': totals['avg_duration'],
+        'total_duration': totals['total_duration'],
+        'sessions_per_day': round(total_sessions / days, 2) if days > 0 else 0,
+        'tool_distribution': {
+            tool: stats['sessions'] for tool, stats in _fold_stats(groups, lambda row: row['tool_name']).items()
+        },
+        'session_type_distribution': {
+            stype: stats['sessions'] for stype, stats in _fold_stats(groups, lambda row: row['session_type']).items()
+        },
+        'developer_stats': _fold_stats(groups, lambda row: row['developer']),
+        'session_type_stats': _fold_stats(groups, lambda row: row['session_type']),
+    }
 
-        rows = cursor.fetchall()
-        sessions = [SessionAdapter.from_db(dict(row)) for row in rows]
-
-        # Calculate stats
-        total_sessions = len(sessions)
-        active_sessions = sum(1 for s in sessions if s.is_active)
-
-        durations = [s.duration_minutes for s in sessions if s.duration_minutes]
-        avg_duration = sum(durations) / len(durations) if durations else 0
-        total_duration = sum(durations)
-
-        sessions_per_day = total_sessions / days if days > 0 else 0
-
-        # Tool distribution
-        tool_dist = {}
-        for s in sessions:
-            tool = s.tool_name.value
-            tool_dist[tool] = tool_dist.get(tool, 0) + 1
-
-        # Session type distribution
-        type_dist = {}
-        for s in sessions:
-            stype = s.session_type.value
-            type_dist[stype] = type_dist.get(stype, 0) + 1
-
-        return {
-            'total_sessions': total_sessions,
-            'active_sessions': active_sessions,
-            'avg_duration': round(avg_duration, 1),
-            'total_duration': total_duration,
-            'sessions_per_day': round(sessions_per_day, 2),
-            'tool_distribution': tool_dist,
-            'session_type_distribution': type_dist
-        }
+
+def _empty_stats() -> Dict[str, Any]:
+    return {'sessions': 0, 'avg_duration': 0, 'total_duration': 0}
+
+
+def _fold_stats(groups: List[sqlite3.Row], key) -> Dict[Any, Dict[str, Any]]:
+    """Combine aggregate rows by key into sessions / avg / total duration"""
+    folded: Dict[Any, Dict[str, Any]] = {}
+    timed: Dict[Any, int] = {}
+    for row in groups:
+        stats = folded.setdefault(key(row), _empty_stats())
+        stats['sessions'] += row['sessions']
+        stats['total_duration'] += row['duration']
+        timed[key(row)] = timed.get(key(row), 0) + row['timed']
+    for name, stats in folded.items():
+        stats['avg_duration'] = round(stats['total_duration'] / timed[name], 1) if timed[name] else 0
+    return folded
+
+
+def sync_session_decisions(
+    conn: sqlite3.Connection,
+    session_pk: int,
+    project_id: int,
+    metadata: Union[str, Dict[str, Any], None]
+) -> int:
+    """Mirror the decisions in a session's metadata into session_decisions.
+
+    Decisions are matched by position: the unchanged prefix is kept and only
+    the tail is rewritten, so appending a decision inserts a single row.
+    Runs on the caller's connection (and transaction). No-op before
+    Migration 0059.
+
+    Args:
+        conn: Open connection
+        session_pk: sessions.id
+        project_id: Project of the session
+        metadata: sessions.metadata (JSON string or dict)
+
+    Returns:
+        Number of decision rows written
+    """
+    if not _table_exists(conn, 'session_decisions'):
+        return 0
+
+    rows = _decision_rows(metadata)
+    existing = conn.execute('''
+        SELECT decision, rationale, decided_at, entry FROM session_decisions
+        WHERE session_id = ? ORDER BY position
+    ''', (session_pk,)).fetchall()
+
+    keep = 0
+    while keep < min(len(rows), len(existing)) and tuple(existing[keep]) == rows[keep]:
+        keep += 1
+
+    if keep < len(existing):
+        conn.execute(
+            'DELETE FROM session_decisions WHERE session_id = ? AND position >= ?', (session_pk, keep)
+        )
+    conn.executemany('''
+        INSERT INTO session_decisions (session_id, project_id, position, decision, rationale, decided_at, entry)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', [(session_pk, project_id, position, *row) for position, row in enumerate(rows) if position >= keep])
+    return len(rows) - keep
+
+
+def _decision_rows(metadata: Union[str, Dict[str, Any], None]) -> List[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+    """(decision, rationale, decided_at, entry JSON) for each decision in session metadata
+
+    Reads metadata.decisions_made (dicts with decision / rationale / timestamp,
+    as recorded by hooks and update_current_session) followed by the
+    plain-string metadata.decisions list.
+    """
+    if isinstance(metadata, str):
+        try:
+            metadata = json.loads(metadata) if metadata else {}
+        except json.JSONDecodeError:
+            metadata = {}
+    if not isinstance(metadata, dict):
+        return []
+
+    rows = []
+    for item in list(metadata.get('decisions_made') or []) + list(metadata.get('decisions') or []):
+        if isinstance(item, dict):
+            text = str(item.get('decision') or '').strip()
+            if text:
+                rows.append((
+                    text,
+                    item.get('rationale'),
+                    item.get('timestamp') or item.get('decided_at'),
+                    json.dumps(item, sort_keys=True, default=str),
+                ))
+        elif item is not None and str(item).strip():
+            rows.append((str(item).strip(), None, None, None))
+    return rows
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = ? AND type IN ('table', 'view')", (table,)
+    ).fetchone() is not None
 
 
 def get_active_sessions(db: 'DatabaseService', project_id: int) -> List[Session]:
@@ -16,7 +16,7 @@ from datetime import datetime
 
 from ..models.summary import Summary
 from ..adapters.summary_adapter import SummaryAdapter
-from ..enums import EntityType, SummaryType
+from ..enums import EntityType, SummaryLevel, SummaryType
 
 
 def create_summary(service, summary: Summary) -> Summary:
@@ -52,9 +52,9 @@ def create_summary(service, summary: Summary) -> Summary:
         INSERT INTO summaries (
             entity_type, entity_id, summary_type, summary_text,
             context_metadata, created_by, session_id, session_date,
-            session_duration_hours
+            session_duration_hours, summary_level, source_ids
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
     params = (
         db_data['entity_type'],
@@ -66,6 +66,8 @@ def create_summary(service, summary: Summary) -> Summary:
         db_data['session_id'],
         db_data['session_date'],
         db_data['session_duration_hours'],
+        db_data['summary_level'],
+        db_data['source_ids'],
     )
     
     with service.transaction() as conn:
@@ -238,10 +240,15 @@ def search_summaries(
     search_text: str,
     entity_type: Optional[EntityType] = None,
     summary_type: Optional[SummaryType] = None,
-    limit: int = 20
+    limit: int = 20,
+    summary_level: Optional[SummaryLevel] = None
 ) -> List[Summary]:
     """
     Search summaries by text content.
+
+    Compacted history is searched through rollup rows (their text lists the
+    headlines of the merged summaries); pass summary_level to restrict the
+    search to raw summaries or one rollup level.
     
     Args:
         service: DatabaseService instance
@@ -249,6 +256,7 @@ def search_summaries(
         entity_type: Optional filter by entity type
         summary_type: Optional filter by summary type
         limit: Maximum number of results
+        summary_level: Optional filter by compaction level
         
     Returns:
         List of Summary models matching search criteria
@@ -266,6 +274,10 @@ def search_summaries(
     if summary_type:
         query += " AND summary_type = ?"
         params.append(summary_type.value)
+
+    if summary_level:
+        query += " AND summary_level = ?"
+        params.append(summary_level.value)
     
     query += " ORDER BY created_at DESC LIMIT ?"
     params.append(limit)
@@ -0,0 +1,451 @@
+"""
+Summary Rollups - Hierarchical Compaction of Session Summaries
+
+Session summaries are written after every work session and were kept
+forever, so the temporal context loader and summary search scanned an
+ever-growing set of raw rows. compact_summaries() rolls aged summaries up
+one level at a time:
+
+    session  --(older than daily_after_days)-->      daily     (work item, day)
+    daily    --(older than weekly_after_days)-->     weekly    (work item, ISO week)
+    weekly   --(older than work_item_after_days)-->  work_item (one row per work item)
+
+Rollup rows keep:
+- merged key_decisions (chronological, de-duplicated) and next_steps
+  (newest first, de-duplicated) in context_metadata
+- the first line of every merged session as its headline (summary_text
+  lists the most recent ones and counts the rest)
+- lineage: source_ids holds every raw summary id folded into the rollup, so
+  lineage survives further compaction
+- period_start / period_end / session_count and the summed duration
+
+Raw rows are moved to summary_archive (Migration 0060) rather than deleted,
+so every id in source_ids resolves through get_archived_summaries().
+Intermediate rollups are derived data and are replaced outright. Merged
+lists are only capped when the policy asks for it; what a cap drops is
+counted in context_metadata['dropped'].
+
+Only progress-type summaries are compacted (work_item_summaries 'session';
+summaries of work items of type 'session' / 'work_item_progress').
+Milestones, decisions and retrospectives stay raw. Rolling up into a period
+that already has a rollup merges the existing rollup into the new one, so
+repeated runs are idempotent and deterministic for a given `today`.
+
+Pattern: Method module operating on DatabaseService (like work_item_summaries)
+"""
+
+import json
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from itertools import groupby
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..enums import SummaryLevel
+
+ROLLUP_AUTHOR = 'summary-rollup'
+
+ARCHIVE_TABLE = 'summary_archive'
+
+# Loader fallback order (finest rollups first)
+LEVEL_ORDER = [level.value for level in SummaryLevel]
+
+
+@dataclass(frozen=True)
+class RollupPolicy:
+    """
+    Age thresholds and size caps for compaction.
+
+    Attributes:
+        daily_after_days: Raw session summaries older than this become daily rollups
+        weekly_after_days: Daily rollups older than this become weekly rollups
+        work_item_after_days: Weekly rollups older than this merge into one per-work-item rollup
+        max_headlines: Session headlines listed in summary_text (most recent;
+            context_metadata keeps all of them)
+        max_decisions: Key decisions kept per rollup (most recent, None = all)
+        max_next_steps: Next steps kept per rollup (newest first, None = all)
+    """
+    daily_after_days: int = 14
+    weekly_after_days: int = 60
+    work_item_after_days: int = 365
+    max_headlines: int = 40
+    max_decisions: Optional[int] = None
+    max_next_steps: Optional[int] = None
+
+
+@dataclass
+class RollupReport:
+    """Outcome of a compaction run"""
+    today: str
+    dry_run: bool = False
+    rows_before: Dict[str, int] = field(default_factory=dict)   # table -> rows
+    rows_after: Dict[str, int] = field(default_factory=dict)
+    created: Counter = field(default_factory=Counter)           # level -> rollup rows written
+    compacted: Counter = field(default_factory=Counter)         # level -> rows folded into rollups
+    archived: Counter = field(default_factory=Counter)          # table -> raw rows moved to the archive
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly representation"""
+        return {
+            'today': self.today,
+            'dry_run': self.dry_run,
+            'rows_before': dict(self.rows_before),
+            'rows_after': dict(self.rows_after),
+            'created': dict(self.created),
+            'compacted': dict(self.compacted),
+            'archived': dict(self.archived),
+        }
+
+
+@dataclass(frozen=True)
+class _SummaryTable:
+    """How one summary table is compacted"""
+    name: str
+    owner_columns: Tuple[str, ...]   # Columns identifying the work item
+    scope: str                       # Rows eligible for compaction
+    date_expr: str                   # Row date (YYYY-MM-DD)
+    raw_types: Tuple[str, ...]       # summary_type values of compactable raw rows
+    rollup_type: str                 # summary_type written on rollup rows
+
+
+TABLES = (
+    _SummaryTable(
+        name='work_item_summaries',
+        owner_columns=('work_item_id',),
+        scope="1 = 1",
+        date_expr="session_date",
+        raw_types=('session',),
+        rollup_type='session',
+    ),
+    _SummaryTable(
+        name='summaries',
+        owner_columns=('entity_type', 'entity_id'),
+        scope="entity_type = 'work_item'",
+        date_expr="COALESCE(session_date, date(created_at))",
+        raw_types=('session', 'work_item_progress'),
+        rollup_type='work_item_progress',
+    ),
+)
+
+
+def compact_summaries(
+    service,
+    today: Optional[date] = None,
+    policy: RollupPolicy = RollupPolicy(),
+    dry_run: bool = False,
+) -> RollupReport:
+    """
+    Roll aged session summaries up into daily, weekly and work item rollups.
+
+    Runs in one transaction; a dry run computes the same report and rolls back.
+    Raw summaries folded into a rollup are moved to summary_archive. Tables
+    are skipped on databases without the rollup columns or the archive.
+
+    Args:
+        service: DatabaseService instance
+        today: Reference date for the age thresholds (default: date.today())
+        policy: Thresholds and caps
+        dry_run: Report what would be compacted without writing
+
+    Returns:
+        RollupReport with per-level created / compacted row counts
+    """
+    today = today or date.today()
+    report = RollupReport(today=today.isoformat(), dry_run=dry_run)
+    steps = [
+        (SummaryLevel.SESSION, SummaryLevel.DAILY, policy.daily_after_days, lambda day: day),
+        (SummaryLevel.DAILY, SummaryLevel.WEEKLY, policy.weekly_after_days, _week_start),
+        (SummaryLevel.WEEKLY, SummaryLevel.WORK_ITEM, policy.work_item_after_days, lambda day: None),
+    ]
+
+    with service.connect() as conn:
+        try:
+            if not _table_exists(conn, ARCHIVE_TABLE):
+                return report
+            for table in TABLES:
+                if not _has_rollup_columns(conn, table.name):
+                    continue
+                report.rows_before[table.name] = _count(conn, table.name)
+                for child, parent, after_days, period in steps:
+                    cutoff = (today - timedelta(days=after_days)).isoformat()
+                    created, compacted, archived = _roll_up(conn, table, child, parent, cutoff, period, policy)
+                    report.created[parent.value] += created
+                    report.compacted[child.value] += compacted
+                    report.archived[table.name] += archived
+                report.rows_after[table.name] = _count(conn, table.name)
+            if dry_run:
+                conn.rollback()
+            else:
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    return report
+
+
+def get_archived_summaries(service, table: str, ids: Sequence[int]) -> List[Dict[str, Any]]:
+    """
+    Original rows of archived raw summaries (e.g. a rollup's source_ids).
+
+    Args:
+        service: DatabaseService instance
+        table: Summary table the ids belong to ('work_item_summaries' or 'summaries')
+        ids: Summary ids
+
+    Returns:
+        Row dicts (all columns of the original row) ordered by id; ids that
+        were never archived are omitted
+    """
+    if not ids:
+        return []
+    placeholders = ', '.join('?' * len(ids))
+    with service.connect() as conn:
+        rows = conn.execute(f"""
+            SELECT row_data FROM {ARCHIVE_TABLE}
+            WHERE source_table = ? AND source_id IN ({placeholders})
+            ORDER BY source_id
+        """, [table, *ids]).fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def merge_rollup(
+    members: Sequence[Dict[str, Any]],
+    level: SummaryLevel,
+    policy: RollupPolicy = RollupPolicy(),
+) -> Dict[str, Any]:
+    """
+    Merge summary rows (raw or rollups) into the fields of one rollup row.
+
+    Args:
+        members: Rows with id, day, session_duration_hours, summary_text,
+            context_metadata (dict), summary_level, source_ids (list or None)
+        level: Level of the rollup being built
+        policy: Size caps
+
+    Returns:
+        Dict with session_date, session_duration_hours, summary_text,
+        context_metadata (dict) and source_ids (sorted list). Entries removed
+        by a policy cap are counted in context_metadata['dropped'], which
+        also carries the counts of merged rollups.
+    """
+    members = sorted(members, key=lambda m: (m['day'], m['id']))
+    source_ids: List[int] = []
+    headlines: List[List[str]] = []
+    decisions: List[str] = []
+    next_steps: List[str] = []
+    starts, ends = [], []
+    dropped: Counter = Counter()
+    hours = [m['session_duration_hours'] for m in members if m['session_duration_hours'] is not None]
+
+    for member in members:
+        metadata = member['context_metadata'] or {}
+        if member['summary_level'] == SummaryLevel.SESSION.value:
+            source_ids.append(member['id'])
+            headlines.append([member['day'], _headline(member['summary_text'])])
+        else:
+            source_ids.extend(member['source_ids'] or [])
+            headlines.extend(metadata.get('headlines', []))
+        decisions.extend(metadata.get('key_decisions') or [])
+        dropped.update(metadata.get('dropped') or {})
+        starts.append(metadata.get('period_start', member['day']))
+        ends.append(metadata.get('period_end', member['day']))
+
+    for member in reversed(members):
+        next_steps.extend((member['context_metadata'] or {}).get('next_steps') or [])
+
+    source_ids.sort()
+    headlines.sort(key=lambda headline: headline[0])  # stable: same-day entries keep id order
+    period_start, period_end = min(starts), max(ends)
+    decisions, next_steps = _dedupe(decisions), _dedupe(next_steps)
+    if policy.max_decisions is not None and len(decisions) > policy.max_decisions:
+        dropped['key_decisions'] += len(decisions) - policy.max_decisions
+        decisions = decisions[len(decisions) - policy.max_decisions:]
+    if policy.max_next_steps is not None and len(next_steps) > policy.max_next_steps:
+        dropped['next_steps'] += len(next_steps) - policy.max_next_steps
+        next_steps = next_steps[:policy.max_next_steps]
+    metadata = {
+        'period_start': period_start,
+        'period_end': period_end,
+        'session_count': len(source_ids),
+        'key_decisions': decisions,
+        'next_steps': next_steps,
+        'headlines': headlines,
+    }
+    if dropped:
+        metadata['dropped'] = dict(sorted(dropped.items()))
+
+    return {
+        'session_date': period_start,
+        'session_duration_hours': round(sum(hours), 2) if hours else None,
+        'summary_text': _rollup_text(level, metadata, policy.max_headlines),
+        'context_metadata': metadata,
+        'source_ids': source_ids,
+    }
+
+
+def _roll_up(
+    conn: sqlite3.Connection,
+    table: _SummaryTable,
+    child: SummaryLevel,
+    parent: SummaryLevel,
+    cutoff: str,
+    period: Callable[[str], Optional[str]],
+    policy: RollupPolicy,
+) -> Tuple[int, int, int]:
+    """
+    Fold child-level rows older than cutoff into parent-level rows.
+
+    Returns:
+        (rollups written, child rows folded, raw rows archived)
+    """
+    owners = ', '.join(table.owner_columns)
+    raw_filter = ''
+    params: List[Any] = [child.value, parent.value, cutoff]
+    if child == SummaryLevel.SESSION:
+        raw_filter = f"AND (summary_level != 'session' OR summary_type IN ({', '.join('?' * len(table.raw_types))}))"
+        params.extend(table.raw_types)
+
+    # Existing parent rows of the affected periods are re-merged with the new children
+    rows = conn.execute(f"""
+        SELECT id, {owners}, {table.date_expr} AS day, session_duration_hours,
+               summary_text, context_metadata, summary_level, source_ids
+        FROM {table.name}
+        WHERE {table.scope}
+          AND summary_level IN (?, ?)
+          AND {table.date_expr} < ?
+          {raw_filter}
+        ORDER BY {owners}, day, id
+    """, params).fetchall()
+
+    inserts, deletes, archives = [], [], []
+    compacted = 0
+    members = [_member(row, table.owner_columns) for row in rows]
+    group_key = lambda m: (m['owner'], period(m['day']))
+    for _key, group in groupby(sorted(members, key=group_key), key=group_key):
+        group = list(group)
+        children = sum(1 for m in group if m['summary_level'] == child.value)
+        if not children:
+            continue
+        merged = merge_rollup(group, parent, policy)
+        inserts.append(_insert_params(table, group[0]['owner'], parent, merged))
+        deletes.extend((m['id'],) for m in group)
+        archives.extend((m['id'],) for m in group if m['summary_level'] == SummaryLevel.SESSION.value)
+        compacted += children
+
+    if inserts:
+        columns = list(table.owner_columns) + [
+            'session_date', 'session_duration_hours', 'summary_text', 'context_metadata',
+            'created_by', 'summary_type', 'summary_level', 'source_ids',
+        ]
+        # Raw rows keep their ids in the archive, so source_ids stay resolvable
+        row_json = ', '.join(f"'{name}', {name}" for name in _columns(conn, table.name))
+        conn.executemany(
+            f"INSERT INTO {ARCHIVE_TABLE} (source_table, source_id, row_data) "
+            f"SELECT '{table.name}', id, json_object({row_json}) FROM {table.name} WHERE id = ?",
+            archives
+        )
+        conn.executemany(f"DELETE FROM {table.name} WHERE id = ?", deletes)
+        conn.executemany(
+            f"INSERT INTO {table.name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            inserts
+        )
+
+    return len(inserts), compacted, len(archives)
+
+
+def _member(row: sqlite3.Row, owner_columns: Tuple[str, ...]) -> Dict[str, Any]:
+    """Row of the compaction query as a merge member"""
+    metadata = row['context_metadata']
+    if isinstance(metadata, str):
+        metadata = json.loads(metadata)
+        if isinstance(metadata, str):  # Double-encoded (see WorkItemSummaryAdapter)
+            metadata = json.loads(metadata)
+    return {
+        'id': row['id'],
+        'owner': tuple(row[column] for column in owner_columns),
+        'day': row['day'],
+        'session_duration_hours': row['session_duration_hours'],
+        'summary_text': row['summary_text'],
+        'context_metadata': metadata if isinstance(metadata, dict) else {},
+        'summary_level': row['summary_level'],
+        'source_ids': json.loads(row['source_ids']) if row['source_ids'] else None,
+    }
+
+
+def _insert_params(table: _SummaryTable, owner: Tuple[Any, ...], level: SummaryLevel,
+                   merged: Dict[str, Any]) -> Tuple[Any, ...]:
+    return owner + (
+        merged['session_date'],
+        merged['session_duration_hours'],
+        merged['summary_text'],
+        json.dumps(merged['context_metadata']),
+        ROLLUP_AUTHOR,
+        table.rollup_type,
+        level.value,
+        json.dumps(merged['source_ids']),
+    )
+
+
+def _rollup_text(level: SummaryLevel, metadata: Dict[str, Any], max_headlines: int) -> str:
+    """Markdown body of a rollup: period header plus recent session headlines"""
+    count = metadata['session_count']
+    period = metadata['period_start']
+    if metadata['period_end'] != period:
+        period = f"{period} to {metadata['period_end']}"
+    lines = [f"{level.value.replace('_', ' ').title()} rollup of {count} session"
+             f"{'s' if count != 1 else ''} ({period})", ""]
+    headlines = metadata['headlines'][-max_headlines:] if max_headlines else []
+    omitted = count - len(headlines)
+    if omitted > 0:
+        lines.append(f"- … {omitted} earlier session{'s' if omitted != 1 else ''}")
+    lines.extend(f"- {day}: {headline}" for day, headline in headlines)
+    return "\n".join(lines)
+
+
+def _headline(text: str) -> str:
+    """First meaningful line of a summary (the full text is archived)"""
+    for line in (text or '').splitlines():
+        line = line.strip().lstrip('#*->').strip()
+        if line:
+            return line
+    return ''
+
+
+def _dedupe(items: Sequence[Any]) -> List[Any]:
+    """Drop repeated entries, keeping first occurrences in order"""
+    seen, result = set(), []
+    for item in items:
+        key = json.dumps(item, sort_keys=True) if not isinstance(item, str) else item
+        if key not in seen:
+            seen.add(key)
+            result.append(item)
+    return result
+
+
+def _week_start(day: str) -> str:
+    """Monday of the ISO week containing day"""
+    value = date.fromisoformat(day)
+    return (value - timedelta(days=value.weekday())).isoformat()
+
+
+def _count(conn: sqlite3.Connection, table: str) -> int:
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _has_rollup_columns(conn: sqlite3.Connection, table: str) -> bool:
+    """Tables predating Migration 0058 are left alone"""
+    return 'summary_level' in _columns(conn, table)
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Databases predating Migration 0060 (no archive) are not compacted"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
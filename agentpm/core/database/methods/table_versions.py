@@ -0,0 +1,56 @@
+"""
+Table Version Methods - Change Counters for Cache Validation (Migration 0055)
+
+Triggers bump table_versions.version on every insert, update and delete of a
+tracked table. Readers compare versions to decide whether data they derived
+earlier (rendered pages, cached responses) is still current, without reading
+the tables themselves.
+
+Methods: get_table_versions, get_table_version
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+
+def get_table_versions(service, tables: Iterable[str]) -> Dict[str, Tuple[int, Optional[str]]]:
+    """
+    Get change versions for tables.
+
+    Args:
+        service: DatabaseService instance
+        tables: Table names
+
+    Returns:
+        {table: (version, changed_at)} for tracked tables (untracked tables are omitted)
+
+    Example:
+        >>> before = get_table_versions(db, ['tasks'])
+        >>> ...
+        >>> if get_table_versions(db, ['tasks']) != before:
+        ...     refresh()
+    """
+    names = sorted(set(tables))
+    if not names:
+        return {}
+    with service.connect() as conn:
+        rows = conn.execute(
+            f"SELECT table_name, version, changed_at FROM table_versions "
+            f"WHERE table_name IN ({', '.join('?' * len(names))})",
+            names
+        ).fetchall()
+    return {row[0]: (row[1], row[2]) for row in rows}
+
+
+def get_table_version(service, table: str) -> Optional[int]:
+    """
+    Get the change version of one table.
+
+    Args:
+        service: DatabaseService instance
+        table: Table name
+
+    Returns:
+        Version counter, or None if the table is not tracked
+    """
+    version = get_table_versions(service, [table]).get(table)
+    return version[0] if version else None
@@ -5,17 +5,42 @@ Implements CRUD operations for Task entities with:
 - Dependency validation (work_item_id)
 - Completion timestamp tracking
 - Assignment management
+- Set-based bulk update/delete (one transaction, all-or-nothing)
 
 Pattern: Type-safe method signatures with Task model
 """
 
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, List, Sequence
 import sqlite3
 from datetime import datetime
 
 from ..models import Task
 from ..adapters import TaskAdapter
 from ..enums import TaskStatus, TaskType
+from ..utils.hydration import (
+    HYDRATE_MODEL,
+    HYDRATE_VIEW,
+    RowViewSpec,
+    check_hydration,
+    fetch_row_views,
+    hydrate_rows,
+)
+
+# Row views for read-only list queries (hydrate='view')
+TASK_ROW_VIEW = RowViewSpec(
+    name='TaskRow',
+    table='tasks',
+    json_columns=frozenset({'quality_metadata'}),
+    enum_columns=(('type', TaskType), ('status', TaskStatus)),
+)
+
+
+# Task ids per "WHERE id IN (...)" statement (below SQLite's variable limit)
+BULK_CHUNK_SIZE = 500
+
+# Fields bulk_update_tasks() may set (the same value on every task)
+BULK_UPDATE_FIELDS = ('status', 'priority', 'assigned_to', 'description', 'blocked_reason', 'effort_hours', 'due_date')
 
 
 # TaskType to Sub-Agent Auto-Assignment Mapping
@@ -166,7 +191,10 @@ def list_tasks(
     task_type: Optional[TaskType] = None,
     priority: Optional[int] = None,
     sort_by: str = "priority",
-    ascending: bool = True
+    ascending: bool = True,
+    hydrate: str = HYDRATE_MODEL,
+    columns: Optional[Sequence[str]] = None,
+    project_id: Optional[int] = None
 ) -> List[Task]:
     """
     List tasks with optional filters.
@@ -180,17 +208,29 @@ def list_tasks(
         priority: Optional priority filter
         sort_by: Sort field (priority, name, created_at, status)
         ascending: Sort direction (default: True for priority, False for others)
+        hydrate: 'model' (validated Task models), 'trusted' (Task models built
+            without validation) or 'view' (read-only TaskRow views)
+        columns: Optional column projection for hydrate='view'
+        project_id: Optional project filter (tasks of the project's work items)
 
     Returns:
-        List of Task models
+        List of Task models (TaskRow views for hydrate='view')
+
+    Raises:
+        ValueError: If hydrate is unknown or columns is given without hydrate='view'
     """
-    query = "SELECT * FROM tasks WHERE 1=1"
+    check_hydration(hydrate, columns)
+    query = " WHERE 1=1"
     params = []
 
     if work_item_id:
         query += " AND work_item_id = ?"
         params.append(work_item_id)
 
+    if project_id:
+        query += " AND work_item_id IN (SELECT id FROM work_items WHERE project_id = ?)"
+        params.append(project_id)
+
     if status:
         query += " AND status = ?"
         params.append(status.value)
@@ -209,7 +249,7 @@ def list_tasks(
 
     # Add sorting
     if sort_by == "priority":
-        query += " ORDER BY priority ASC, created_at DESC"
+        query += " ORDER BY priority ASC, created_at DESC, id ASC"
     elif sort_by == "name":
         query += " ORDER BY name ASC"
     elif sort_by == "status":
@@ -218,14 +258,16 @@ def list_tasks(
         direction = "ASC" if ascending else "DESC"
         query += f" ORDER BY created_at {direction}"
     else:
-        query += " ORDER BY priority ASC, created_at DESC"
+        query += " ORDER BY priority ASC, created_at DESC, id ASC"
 
     with service.connect() as conn:
+        if hydrate == HYDRATE_VIEW:
+            return fetch_row_views(conn, TASK_ROW_VIEW, query, params, columns)
         conn.row_factory = sqlite3.Row
-        cursor = conn.execute(query, tuple(params))
+        cursor = conn.execute("SELECT * FROM tasks" + query, tuple(params))
         rows = cursor.fetchall()
 
-    return [TaskAdapter.from_db(dict(row)) for row in rows]
+    return hydrate_rows(rows, hydrate, TaskAdapter.from_db, TaskAdapter.from_rows_trusted)
 
 
 def mark_task_blocked(service, task_id: int, reason: str) -> Optional[Task]:
@@ -272,6 +314,162 @@ def assign_task(service, task_id: int, assigned_to: str) -> Optional[Task]:
     return update_task(service, task_id, assigned_to=assigned_to)
 
 
+def get_tasks(service, task_ids: Iterable[int]) -> List[Task]:
+    """
+    Get tasks by ID in one query per BULK_CHUNK_SIZE ids.
+
+    Returns:
+        Existing tasks in the order of task_ids (missing ids are skipped)
+    """
+    ids = _unique_ids(task_ids)
+    with service.connect() as conn:
+        conn.row_factory = sqlite3.Row
+        rows = _fetch_rows(conn, ids)
+    return [TaskAdapter.from_db(dict(rows[task_id])) for task_id in ids if task_id in rows]
+
+
+def count_tasks_by_work_item(service, work_item_ids: Iterable[int]) -> Dict[int, int]:
+    """Number of tasks per work item (one grouped query; absent work items count 0)"""
+    ids = _unique_ids(work_item_ids)
+    counts = {work_item_id: 0 for work_item_id in ids}
+    with service.connect() as conn:
+        for chunk in _chunks(ids):
+            rows = conn.execute(
+                f"SELECT work_item_id, COUNT(*) FROM tasks WHERE work_item_id IN ({_marks(chunk)}) "
+                "GROUP BY work_item_id", chunk
+            )
+            counts.update({row[0]: row[1] for row in rows})
+    return counts
+
+
+@dataclass
+class BulkTaskResult:
+    """
+    Outcome of a bulk task operation.
+
+    applied is False when validation rejected the batch; nothing was
+    changed then and errors holds the reason per task id.
+    """
+    action: str
+    task_ids: List[int] = field(default_factory=list)   # tasks changed
+    missing_ids: List[int] = field(default_factory=list)
+    errors: Dict[int, str] = field(default_factory=dict)
+    updates: Dict[str, Any] = field(default_factory=dict)
+    applied: bool = False
+
+    @property
+    def count(self) -> int:
+        return len(self.task_ids) if self.applied else 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'action': self.action,
+            'applied': self.applied,
+            'count': self.count,
+            'task_ids': self.task_ids,
+            'missing_ids': self.missing_ids,
+            'errors': {str(task_id): error for task_id, error in self.errors.items()},
+            'updates': self.updates,
+        }
+
+
+def bulk_update_tasks(
+    service,
+    task_ids: Iterable[int],
+    validate_workflow: bool = False,
+    emit_event: bool = True,
+    **updates
+) -> BulkTaskResult:
+    """
+    Set the same fields on many tasks in one transaction.
+
+    Runs one "UPDATE tasks SET ... WHERE id IN (...)" per BULK_CHUNK_SIZE
+    ids on a single connection. Any database error (e.g. a CHECK
+    constraint) rolls back the whole batch. Status timestamps
+    (started_at, completed_at) and blocked_reason clearing are maintained
+    by the tasks triggers, as for update_task().
+
+    Args:
+        service: DatabaseService instance
+        task_ids: Tasks to update (unknown ids are reported in missing_ids)
+        validate_workflow: Check every task's status transition first
+            (terminal states, state machine, blocked_reason); any failure
+            rejects the batch
+        emit_event: Emit one summarized workflow event for the batch
+        **updates: Fields from BULK_UPDATE_FIELDS
+
+    Returns:
+        BulkTaskResult
+
+    Raises:
+        ValueError: If no updates or unsupported fields are given
+    """
+    unknown = sorted(set(updates) - set(BULK_UPDATE_FIELDS))
+    if unknown:
+        raise ValueError(f"Unsupported bulk update fields: {', '.join(unknown)}")
+    if not updates:
+        raise ValueError("No updates given")
+
+    ids = _unique_ids(task_ids)
+    values = {name: _db_value(value) for name, value in updates.items()}
+    result = BulkTaskResult('update', updates=values)
+    set_clause = ', '.join(f"{name} = ?" for name in values)
+
+    with service.transaction() as conn:
+        conn.row_factory = sqlite3.Row
+        rows = _fetch_rows(conn, ids)
+        result.missing_ids = [task_id for task_id in ids if task_id not in rows]
+        result.task_ids = [task_id for task_id in ids if task_id in rows]
+
+        if validate_workflow and 'status' in updates:
+            result.errors = _validate_transitions(
+                [rows[task_id] for task_id in result.task_ids],
+                TaskStatus(values['status']), values.get('blocked_reason')
+            )
+            if result.errors:
+                return result
+
+        for chunk in _chunks(result.task_ids):
+            conn.execute(
+                f"UPDATE tasks SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id IN ({_marks(chunk)})",
+                (*values.values(), *chunk)
+            )
+        result.applied = True
+
+    if emit_event and result.task_ids:
+        _emit_bulk_event(service, result, rows)
+    return result
+
+
+def bulk_delete_tasks(service, task_ids: Iterable[int], emit_event: bool = True) -> BulkTaskResult:
+    """
+    Delete many tasks in one transaction ("DELETE ... WHERE id IN (...)").
+
+    Args:
+        service: DatabaseService instance
+        task_ids: Tasks to delete (unknown ids are reported in missing_ids)
+        emit_event: Emit one summarized workflow event for the batch
+
+    Returns:
+        BulkTaskResult
+    """
+    ids = _unique_ids(task_ids)
+    result = BulkTaskResult('delete')
+
+    with service.transaction() as conn:
+        conn.row_factory = sqlite3.Row
+        rows = _fetch_rows(conn, ids)
+        result.missing_ids = [task_id for task_id in ids if task_id not in rows]
+        result.task_ids = [task_id for task_id in ids if task_id in rows]
+        for chunk in _chunks(result.task_ids):
+            conn.execute(f"DELETE FROM tasks WHERE id IN ({_marks(chunk)})", chunk)
+        result.applied = True
+
+    if emit_event and result.task_ids:
+        _emit_bulk_event(service, result, rows)
+    return result
+
+
 # Helper functions
 
 def _check_work_item_exists(service, work_item_id: int) -> bool:
@@ -324,4 +522,117 @@ def _get_valid_agents() -> List[str]:
         return []
 
     agent_files = agents_dir.glob("*.md")
-    return sorted([f.stem for f in agent_files])
\ No newline at end of file
+    return sorted([f.stem for f in agent_files])
+
+
+def _unique_ids(ids: Iterable[int]) -> List[int]:
+    """Integer ids, de-duplicated in first-seen order"""
+    return list(dict.fromkeys(int(value) for value in ids))
+
+
+def _chunks(ids: List[int]) -> Iterable[List[int]]:
+    for start in range(0, len(ids), BULK_CHUNK_SIZE):
+        yield ids[start:start + BULK_CHUNK_SIZE]
+
+
+def _marks(chunk: List[int]) -> str:
+    return ', '.join('?' * len(chunk))
+
+
+def _fetch_rows(conn, ids: List[int]) -> Dict[int, sqlite3.Row]:
+    """Task rows by id, with the owning project_id"""
+    rows = {}
+    for chunk in _chunks(ids):
+        cursor = conn.execute(
+            "SELECT t.*, w.project_id AS project_id FROM tasks t "
+            f"LEFT JOIN work_items w ON w.id = t.work_item_id WHERE t.id IN ({_marks(chunk)})",
+            chunk
+        )
+        rows.update({row['id']: row for row in cursor})
+    return rows
+
+
+def _db_value(value: Any) -> Any:
+    if hasattr(value, 'value'):  # Enum
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _validate_transitions(rows: List[sqlite3.Row], new_status: TaskStatus,
+                          blocked_reason: Optional[str]) -> Dict[int, str]:
+    """
+    Per-task status transition checks (WorkflowService gates that need no I/O).
+
+    Returns:
+        {task_id: error} for tasks whose transition is not allowed
+    """
+    from ...workflow.state_machine import StateMachine
+    from ..enums import EntityType
+
+    errors = {}
+    for row in rows:
+        current = TaskStatus(row['status'])
+        if current == new_status:
+            continue
+        if TaskStatus.is_terminal_state(current):
+            errors[row['id']] = f"Task is already {current.value} (terminal state)"
+        elif not StateMachine.can_transition(EntityType.TASK, current, new_status):
+            errors[row['id']] = f"Invalid transition {current.value} -> {new_status.value}"
+        elif new_status == TaskStatus.BLOCKED and not (blocked_reason or row['blocked_reason']):
+            errors[row['id']] = "blocked_reason required when transitioning to BLOCKED"
+    return errors
+
+
+def _emit_bulk_event(service, result: BulkTaskResult, rows: Dict[int, sqlite3.Row]) -> None:
+    """
+    Emit one workflow event summarizing a bulk status change.
+
+    Uses the WorkflowService event mapping (active -> task.started,
+    done -> task.completed, blocked -> task.blocked); other bulk changes
+    have no event type in the session_events taxonomy and are not emitted.
+    Requires an active session. Failures never affect the bulk operation.
+    """
+    from ...events.models import Event, EventCategory, EventSeverity, EventType
+
+    event_types = {
+        TaskStatus.ACTIVE.value: EventType.TASK_STARTED,
+        TaskStatus.DONE.value: EventType.TASK_DONE,
+        TaskStatus.BLOCKED.value: EventType.TASK_BLOCKED,
+    }
+    event_type = event_types.get(result.updates.get('status')) if result.action == 'update' else None
+    if event_type is None:
+        return
+
+    try:
+        from . import sessions as session_methods
+        from ...sessions.event_bus import EventBus
+
+        session = session_methods.get_current_session(service)
+        if not session:
+            return
+        changed = [rows[task_id] for task_id in result.task_ids]
+        projects = {row['project_id'] for row in changed}
+        work_items = {row['work_item_id'] for row in changed}
+        EventBus(service).emit(Event(
+            event_type=event_type,
+            event_category=EventCategory.WORKFLOW,
+            event_severity=EventSeverity.INFO,
+            session_id=session.id,
+            source='bulk_tasks',
+            event_data={
+                'entity_type': 'task',
+                'bulk': True,
+                'action': result.action,
+                'count': len(changed),
+                'task_ids': result.task_ids,
+                'previous_statuses': sorted({row['status'] for row in changed}),
+                'updates': result.updates,
+            },
+            project_id=projects.pop() if len(projects) == 1 else session.project_id,
+            work_item_id=work_items.pop() if len(work_items) == 1 else None,
+        ))
+    except Exception:
+        # Event emission is an enhancement - never fail the bulk operation
+        pass
@@ -3,7 +3,8 @@ Work Item Summaries CRUD Methods - Type-Safe Database Operations
 
 Implements CRUD operations for WorkItemSummary entities with:
 - Work item existence validation
-- Recent summaries query for session-start agents
+- Recent summaries query for session-start agents (raw rows first,
+  falling back to daily/weekly/work item rollups - see summary_rollups)
 - Type filtering (session/milestone/decision)
 
 Pattern: Type-safe method signatures with WorkItemSummary model
@@ -46,9 +47,10 @@ def create_summary(service, summary: WorkItemSummary) -> WorkItemSummary:
     query = """
         INSERT INTO work_item_summaries (
             work_item_id, session_date, session_duration_hours,
-            summary_text, context_metadata, created_by, summary_type
+            summary_text, context_metadata, created_by, summary_type,
+            summary_level, source_ids
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
     params = (
         db_data['work_item_id'],
@@ -58,6 +60,8 @@ def create_summary(service, summary: WorkItemSummary) -> WorkItemSummary:
         db_data['context_metadata'],
         db_data['created_by'],
         db_data['summary_type'],
+        db_data['summary_level'],
+        db_data['source_ids'],
     )
 
     with service.transaction() as conn:
@@ -140,7 +144,11 @@ def get_recent_summaries(
     Get N most recent summaries for work item.
 
     Optimized query for session-start agents needing
-    recent context from previous sessions.
+    recent context from previous sessions. Reads the newest raw
+    (session-level) summaries first; when fewer than `limit` remain after
+    compaction, older history is filled in from rollups, finest level first
+    (daily, weekly, work_item). Each level is one indexed query
+    (idx_wi_summaries_level), so the cost no longer grows with history.
 
     Args:
         service: DatabaseService instance
@@ -148,9 +156,25 @@ def get_recent_summaries(
         limit: Number of recent summaries (default: 5)
 
     Returns:
-        List of WorkItemSummary models (newest first)
+        List of WorkItemSummary models (raw newest first, then rollups)
     """
-    return list_summaries(service, work_item_id=work_item_id, limit=limit)
+    from .summary_rollups import LEVEL_ORDER
+
+    query = """
+        SELECT * FROM work_item_summaries
+        WHERE work_item_id = ? AND summary_level = ?
+        ORDER BY session_date DESC, id DESC
+        LIMIT ?
+    """
+    rows = []
+    with service.connect() as conn:
+        conn.row_factory = sqlite3.Row
+        for level in LEVEL_ORDER:
+            if len(rows) >= limit:
+                break
+            rows.extend(conn.execute(query, (work_item_id, level, limit - len(rows))).fetchall())
+
+    return [WorkItemSummaryAdapter.from_db(dict(row)) for row in rows]
 
 
 def delete_summary(service, summary_id: int) -> bool:
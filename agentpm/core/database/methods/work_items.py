@@ -9,14 +9,35 @@ Implements CRUD operations for WorkItem entities with:
 Pattern: Type-safe method signatures with WorkItem model
 """
 
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, List, Sequence
 import sqlite3
 import json
 from datetime import datetime
 
 from ..models import WorkItem
 from ..adapters import WorkItemAdapter
-from ..enums import WorkItemStatus, WorkItemType
+from ..enums import WorkItemStatus, WorkItemType, Phase
+from ..utils.hydration import (
+    HYDRATE_MODEL,
+    HYDRATE_VIEW,
+    RowViewSpec,
+    check_hydration,
+    fetch_row_views,
+    hydrate_rows,
+)
+from .tasks import _chunks, _db_value, _marks, _unique_ids
+
+# Row views for read-only list queries (hydrate='view')
+WORK_ITEM_ROW_VIEW = RowViewSpec(
+    name='WorkItemRow',
+    table='work_items',
+    json_columns=frozenset({'metadata'}),
+    enum_columns=(('type', WorkItemType), ('status', WorkItemStatus), ('phase', Phase)),
+)
+
+# Fields bulk_update_work_items() may set
+BULK_UPDATE_FIELDS = ('status', 'priority', 'phase')
 
 
 def create_work_item(service, work_item: WorkItem) -> WorkItem:
@@ -182,7 +203,9 @@ def list_work_items(
     service,
     project_id: Optional[int] = None,
     status: Optional[WorkItemStatus] = None,
-    type: Optional[WorkItemType] = None
+    type: Optional[WorkItemType] = None,
+    hydrate: str = HYDRATE_MODEL,
+    columns: Optional[Sequence[str]] = None
 ) -> List[WorkItem]:
     """
     List work items with optional filters.
@@ -192,11 +215,18 @@ def list_work_items(
         project_id: Optional project filter
         status: Optional status filter
         type: Optional type filter
+        hydrate: 'model' (validated WorkItem models), 'trusted' (WorkItem
+            models built without validation) or 'view' (read-only WorkItemRow views)
+        columns: Optional column projection for hydrate='view'
 
     Returns:
-        List of WorkItem models
+        List of WorkItem models (WorkItemRow views for hydrate='view')
+
+    Raises:
+        ValueError: If hydrate is unknown or columns is given without hydrate='view'
     """
-    query = "SELECT * FROM work_items WHERE 1=1"
+    check_hydration(hydrate, columns)
+    query = " WHERE 1=1"
     params = []
 
     if project_id:
@@ -211,14 +241,16 @@ def list_work_items(
         query += " AND type = ?"
         params.append(type.value)
 
-    query += " ORDER BY priority ASC, created_at DESC"
+    query += " ORDER BY priority ASC, created_at DESC, id ASC"
 
     with service.connect() as conn:
+        if hydrate == HYDRATE_VIEW:
+            return fetch_row_views(conn, WORK_ITEM_ROW_VIEW, query, params, columns)
         conn.row_factory = sqlite3.Row
-        cursor = conn.execute(query, tuple(params))
+        cursor = conn.execute("SELECT * FROM work_items" + query, tuple(params))
         rows = cursor.fetchall()
 
-    return [WorkItemAdapter.from_db(dict(row)) for row in rows]
+    return hydrate_rows(rows, hydrate, WorkItemAdapter.from_db, WorkItemAdapter.from_rows_trusted)
 
 
 def get_child_work_items(service, parent_id: int) -> List[WorkItem]:
@@ -242,6 +274,104 @@ def get_child_work_items(service, parent_id: int) -> List[WorkItem]:
     return [WorkItemAdapter.from_db(dict(row)) for row in rows]
 
 
+def get_work_items(service, work_item_ids: Iterable[int]) -> List[WorkItem]:
+    """
+    Get work items by ID in one query per BULK_CHUNK_SIZE ids.
+
+    Returns:
+        Existing work items in the order of work_item_ids (missing ids are skipped)
+    """
+    ids = _unique_ids(work_item_ids)
+    with service.connect() as conn:
+        conn.row_factory = sqlite3.Row
+        rows = _fetch_rows(conn, ids)
+    return [WorkItemAdapter.from_db(dict(rows[wi_id])) for wi_id in ids if wi_id in rows]
+
+
+@dataclass
+class BulkWorkItemResult:
+    """Outcome of a bulk work item operation"""
+    action: str
+    work_item_ids: List[int] = field(default_factory=list)   # work items changed
+    missing_ids: List[int] = field(default_factory=list)
+    updates: Dict[str, Any] = field(default_factory=dict)
+    applied: bool = False
+
+    @property
+    def count(self) -> int:
+        return len(self.work_item_ids) if self.applied else 0
+
+
+def bulk_update_work_items(service, work_item_ids: Iterable[int], **updates) -> BulkWorkItemResult:
+    """
+    Set the same fields on many work items in one transaction.
+
+    Runs one "UPDATE work_items SET ... WHERE id IN (...)" per
+    BULK_CHUNK_SIZE ids on a single connection. Any database error
+    (e.g. a CHECK constraint) rolls back the whole batch.
+
+    Args:
+        service: DatabaseService instance
+        work_item_ids: Work items to update (unknown ids are reported in missing_ids)
+        **updates: Fields from BULK_UPDATE_FIELDS
+
+    Returns:
+        BulkWorkItemResult
+
+    Raises:
+        ValueError: If no updates or unsupported fields are given
+    """
+    unknown = sorted(set(updates) - set(BULK_UPDATE_FIELDS))
+    if unknown:
+        raise ValueError(f"Unsupported bulk update fields: {', '.join(unknown)}")
+    if not updates:
+        raise ValueError("No updates given")
+
+    ids = _unique_ids(work_item_ids)
+    values = {name: _db_value(value) for name, value in updates.items()}
+    result = BulkWorkItemResult('update', updates=values)
+    set_clause = ', '.join(f"{name} = ?" for name in values)
+
+    with service.transaction() as conn:
+        conn.row_factory = sqlite3.Row
+        existing = _existing_ids(conn, ids)
+        result.missing_ids = [wi_id for wi_id in ids if wi_id not in existing]
+        result.work_item_ids = [wi_id for wi_id in ids if wi_id in existing]
+        for chunk in _chunks(result.work_item_ids):
+            conn.execute(
+                f"UPDATE work_items SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE id IN ({_marks(chunk)})",
+                (*values.values(), *chunk)
+            )
+        result.applied = True
+    return result
+
+
+def bulk_delete_work_items(service, work_item_ids: Iterable[int]) -> BulkWorkItemResult:
+    """
+    Delete many work items in one transaction ("DELETE ... WHERE id IN (...)").
+
+    Cascades to tasks, as delete_work_item() does.
+
+    Args:
+        service: DatabaseService instance
+        work_item_ids: Work items to delete (unknown ids are reported in missing_ids)
+
+    Returns:
+        BulkWorkItemResult
+    """
+    ids = _unique_ids(work_item_ids)
+    result = BulkWorkItemResult('delete')
+
+    with service.transaction() as conn:
+        existing = _existing_ids(conn, ids)
+        result.missing_ids = [wi_id for wi_id in ids if wi_id not in existing]
+        result.work_item_ids = [wi_id for wi_id in ids if wi_id in existing]
+        for chunk in _chunks(result.work_item_ids):
+            conn.execute(f"DELETE FROM work_items WHERE id IN ({_marks(chunk)})", chunk)
+        result.applied = True
+    return result
+
+
 # Helper functions
 
 def _check_project_exists(service, project_id: int) -> bool:
@@ -260,3 +390,21 @@ def _check_work_item_exists(service, work_item_id: int) -> bool:
     with service.connect() as conn:
         cursor = conn.execute(query, (work_item_id,))
         return cursor.fetchone() is not None
+
+
+def _fetch_rows(conn, ids: List[int]) -> Dict[int, sqlite3.Row]:
+    """Work item rows by id"""
+    rows = {}
+    for chunk in _chunks(ids):
+        cursor = conn.execute(f"SELECT * FROM work_items WHERE id IN ({_marks(chunk)})", chunk)
+        rows.update({row['id']: row for row in cursor})
+    return rows
+
+
+def _existing_ids(conn, ids: List[int]) -> set:
+    """Subset of ids present in work_items"""
+    existing = set()
+    for chunk in _chunks(ids):
+        cursor = conn.execute(f"SELECT id FROM work_items WHERE id IN ({_marks(chunk)})", chunk)
+        existing.update(row[0] for row in cursor)
+    return existing
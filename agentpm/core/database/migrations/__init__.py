@@ -8,6 +8,8 @@ Components:
 - SchemaDiffer: Detects schema changes between current and target state
 - MigrationGenerator: Generates migration files from schema changes
 - Migration discovery and tracking
+- Schema baseline: squashed snapshot new databases load instead of replaying
+  every migration (baseline.py, `apm migrate squash`)
 - Rollback support
 - Pre/post validation
 """
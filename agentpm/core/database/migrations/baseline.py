@@ -0,0 +1,499 @@
+"""
+Schema Baseline
+
+Squashed snapshot of the schema produced by replaying every migration file.
+New databases load the snapshot with a single executescript() and then replay
+only migrations added after it, instead of replaying the whole history.
+
+The snapshot (schema_baseline.sql) is generated by `apm migrate squash`:
+1. Replay all migrations into a scratch database (the reference)
+2. Dump tables, seed data, indexes, triggers and views from sqlite_master
+3. Load the dump into a second scratch database
+4. Verify with SchemaDiffer and a sqlite_master/seed data comparison that
+   the loaded snapshot equals the reference
+
+Snapshot layout:
+    -- baseline-version: 0052          latest migration included
+    -- source-checksum: <sha256>       migration files the snapshot was built from
+    -- @section tables / data / indexes / triggers / views / migrations
+
+FTS5 shadow tables are never dumped - SQLite creates them with their owning
+virtual tables. Columns defaulting to the current time (created_at,
+applied_at, ...) are left out of seed rows so they are stamped when the
+database is created, as a replay would, and the snapshot stays deterministic.
+"""
+
+import contextlib
+import hashlib
+import io
+import sqlite3
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .differ import FTS_SHADOW_SUFFIXES, SchemaDiffer
+
+BASELINE_FILE = Path(__file__).parent / "schema_baseline.sql"
+MIGRATIONS_DIR = Path(__file__).parent / "files"
+
+_VERSION_HEADER = '-- baseline-version: '
+_CHECKSUM_HEADER = '-- source-checksum: '
+_SECTION_MARKER = '-- @section '
+
+
+class BaselineError(Exception):
+    """Baseline snapshot could not be generated or loaded"""
+    pass
+
+
+@dataclass
+class BaselineSnapshot:
+    """
+    Parsed schema baseline.
+
+    Attributes:
+        version: Latest migration version included in the snapshot
+        source_checksum: Checksum of the migration files it was built from
+        sql: Complete script (loaded with one executescript call)
+        sections: Script split by section name (tables, data, indexes, ...)
+    """
+    version: str
+    source_checksum: str
+    sql: str
+    sections: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ddl(self) -> str:
+        """Schema statements only (tables, indexes, triggers, views)"""
+        return '\n'.join(
+            self.sections.get(name, '') for name in ('tables', 'indexes', 'triggers', 'views')
+        )
+
+
+@dataclass
+class BaselineVerification:
+    """
+    Result of comparing a snapshot against the replayed schema.
+
+    Attributes:
+        schema_changes: SchemaDiffer changes needed to turn the replayed schema
+                        into the snapshot schema (empty when equal)
+        differences: Human-readable sqlite_master/column/seed data differences
+    """
+    schema_changes: list = field(default_factory=list)
+    differences: List[str] = field(default_factory=list)
+
+    @property
+    def is_equal(self) -> bool:
+        return not self.schema_changes and not self.differences
+
+
+def compute_source_checksum(migrations_dir: Optional[Path] = None) -> str:
+    """
+    Checksum the migration files a snapshot is generated from.
+
+    Args:
+        migrations_dir: Migration files directory (defaults to files/)
+
+    Returns:
+        SHA256 hex digest over file names and contents
+    """
+    directory = Path(migrations_dir) if migrations_dir else MIGRATIONS_DIR
+    digest = hashlib.sha256()
+    for path in sorted(directory.glob("migration_*.py")):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(b'\x00')
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_baseline(path: Optional[Path] = None) -> Optional[BaselineSnapshot]:
+    """
+    Load the schema baseline snapshot.
+
+    Args:
+        path: Snapshot file (defaults to schema_baseline.sql next to this module)
+
+    Returns:
+        BaselineSnapshot, or None if no snapshot exists
+
+    Raises:
+        BaselineError: If the file exists but has no baseline-version header
+    """
+    baseline_path = Path(path) if path else BASELINE_FILE
+    if not baseline_path.exists():
+        return None
+    return parse_baseline(baseline_path.read_text(encoding='utf-8'))
+
+
+def parse_baseline(sql: str) -> BaselineSnapshot:
+    """
+    Parse a snapshot script into a BaselineSnapshot.
+
+    Raises:
+        BaselineError: If the baseline-version header is missing
+    """
+    version = None
+    checksum = ''
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+
+    for line in sql.splitlines():
+        if line.startswith(_VERSION_HEADER):
+            version = line[len(_VERSION_HEADER):].strip()
+        elif line.startswith(_CHECKSUM_HEADER):
+            checksum = line[len(_CHECKSUM_HEADER):].strip()
+        elif line.startswith(_SECTION_MARKER):
+            current = line[len(_SECTION_MARKER):].strip()
+            sections.setdefault(current, [])
+        elif current is not None:
+            sections[current].append(line)
+
+    if not version:
+        raise BaselineError("Schema baseline is missing its baseline-version header")
+
+    return BaselineSnapshot(
+        version=version,
+        source_checksum=checksum,
+        sql=sql,
+        sections={name: '\n'.join(lines) for name, lines in sections.items()}
+    )
+
+
+def apply_baseline(conn: sqlite3.Connection, snapshot: BaselineSnapshot) -> None:
+    """
+    Load a snapshot into an empty database with one executescript call.
+
+    The script runs in its own transaction; on failure it is rolled back and
+    the database is left empty.
+
+    Args:
+        conn: Connection to an empty database
+        snapshot: Snapshot to load
+
+    Raises:
+        sqlite3.Error: If the script fails
+    """
+    try:
+        conn.executescript(snapshot.sql)
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+
+
+def dump_baseline(conn: sqlite3.Connection, source_checksum: str = '') -> str:
+    """
+    Dump a migrated database as a baseline snapshot script.
+
+    Args:
+        conn: Connection to a database built by replaying migrations
+        source_checksum: Checksum of the migration files (see compute_source_checksum)
+
+    Returns:
+        Snapshot script (see module docstring for layout)
+
+    Raises:
+        BaselineError: If the database has no applied migrations
+    """
+    versions = [
+        row[0] for row in conn.execute(
+            "SELECT version FROM schema_migrations WHERE rollback_at IS NULL ORDER BY version"
+        )
+    ]
+    if not versions:
+        raise BaselineError("Cannot squash a database without applied migrations")
+
+    objects = _schema_objects(conn)
+    shadow = _shadow_tables(objects)
+    virtual = {name for type_, name, _, sql in objects if type_ == 'table' and _is_virtual(sql)}
+
+    tables = [
+        (name, sql) for type_, name, _, sql in objects
+        if type_ == 'table' and name not in shadow
+    ]
+
+    lines = [
+        "-- APM schema baseline",
+        "-- Generated by `apm migrate squash` - do not edit by hand.",
+        f"{_VERSION_HEADER}{versions[-1]}",
+        f"{_CHECKSUM_HEADER}{source_checksum}",
+        f"-- migrations: {len(versions)}",
+        "",
+        "PRAGMA foreign_keys = OFF;",
+        "BEGIN;",
+        "",
+        f"{_SECTION_MARKER}tables",
+    ]
+    lines.extend(f"{sql};" for _, sql in tables)
+
+    lines.append(f"{_SECTION_MARKER}data")
+    for name, _ in tables:
+        if name in virtual or name == 'schema_migrations':
+            continue
+        lines.extend(_dump_rows(conn, name))
+    lines.extend(_dump_sequences(conn))
+
+    for section, type_ in (('indexes', 'index'), ('triggers', 'trigger'), ('views', 'view')):
+        lines.append(f"{_SECTION_MARKER}{section}")
+        lines.extend(
+            f"{sql};" for obj_type, name, tbl_name, sql in objects
+            if obj_type == type_ and tbl_name not in shadow
+        )
+
+    lines.append(f"{_SECTION_MARKER}migrations")
+    lines.extend(_dump_rows(conn, 'schema_migrations'))
+
+    lines.extend(["", "COMMIT;", ""])
+    return '\n'.join(lines)
+
+
+def replay_migrations(db_path: Path):
+    """
+    Build a database by replaying every migration file (no baseline).
+
+    Migration progress output is suppressed.
+
+    Args:
+        db_path: Path for the new database (must not exist)
+
+    Returns:
+        DatabaseService for the replayed database
+    """
+    from ..service import DatabaseService
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return DatabaseService(db_path, use_baseline=False)
+
+
+def build_from_baseline(db_path: Path, snapshot: BaselineSnapshot):
+    """
+    Build a database from a snapshot.
+
+    Migrations newer than the snapshot are replayed when the service opens
+    the database, exactly as for a freshly created database.
+
+    Args:
+        db_path: Path for the new database (must not exist)
+        snapshot: Snapshot to load
+
+    Returns:
+        DatabaseService for the new database
+    """
+    from ..service import DatabaseService
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        apply_baseline(conn, snapshot)
+    finally:
+        conn.close()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return DatabaseService(db_path)
+
+
+def verify_baseline(reference, snapshot: BaselineSnapshot, work_dir: Path) -> BaselineVerification:
+    """
+    Verify that a snapshot reproduces the replayed schema.
+
+    Checks:
+    - SchemaDiffer.compare_schemas(snapshot DDL) against the reference is empty
+    - SchemaDiffer.detect_column_changes finds no column differences per table
+    - sqlite_master SQL text is identical for every table/index/trigger/view
+    - Seed data and applied migration versions are identical
+
+    Args:
+        reference: DatabaseService built by replay_migrations()
+        snapshot: Snapshot to verify
+        work_dir: Scratch directory for the snapshot database
+
+    Returns:
+        BaselineVerification
+    """
+    reference_differ = SchemaDiffer(reference)
+    result = BaselineVerification()
+    result.schema_changes = reference_differ.compare_schemas(snapshot.ddl)
+
+    candidate = build_from_baseline(Path(work_dir) / "baseline_check.db", snapshot)
+    differ = SchemaDiffer(candidate)
+
+    with reference.connect() as ref_conn, candidate.connect() as cand_conn:
+        ref_objects = _object_map(ref_conn)
+        cand_objects = _object_map(cand_conn)
+
+        for key in sorted(set(ref_objects) | set(cand_objects)):
+            type_, name = key
+            if key not in cand_objects:
+                result.differences.append(f"{type_} {name} missing from snapshot")
+            elif key not in ref_objects:
+                result.differences.append(f"{type_} {name} not produced by migrations")
+            elif _normalize_sql(ref_objects[key]) != _normalize_sql(cand_objects[key]):
+                result.differences.append(f"{type_} {name} definition differs")
+
+        for type_, name in sorted(ref_objects):
+            if type_ != 'table' or (type_, name) not in cand_objects:
+                continue
+            column_changes = differ.detect_column_changes(
+                name, differ._get_table_columns(name), reference_differ._get_table_columns(name)
+            )
+            for change in column_changes:
+                result.differences.append(
+                    f"column {name}.{change.object_name}: {change.change_type.value}"
+                )
+            if _table_fingerprint(ref_conn, name) != _table_fingerprint(cand_conn, name):
+                result.differences.append(f"table {name} seed data differs")
+
+    return result
+
+
+def squash(
+    output: Optional[Path] = None,
+    migrations_dir: Optional[Path] = None
+) -> Tuple[BaselineSnapshot, BaselineVerification]:
+    """
+    Generate, verify and (optionally) write the schema baseline.
+
+    The snapshot is only written when verification passes.
+
+    Args:
+        output: File to write (None for a dry run)
+        migrations_dir: Migration files directory used for the source checksum
+
+    Returns:
+        (snapshot, verification)
+    """
+    with tempfile.TemporaryDirectory(prefix="apm-squash-") as tmp:
+        work_dir = Path(tmp)
+        reference = replay_migrations(work_dir / "replay.db")
+
+        with reference.connect() as conn:
+            sql = dump_baseline(conn, compute_source_checksum(migrations_dir))
+
+        snapshot = parse_baseline(sql)
+        verification = verify_baseline(reference, snapshot, work_dir)
+
+    if output is not None and verification.is_equal:
+        Path(output).write_text(sql, encoding='utf-8')
+
+    return snapshot, verification
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _schema_objects(conn: sqlite3.Connection) -> List[Tuple[str, str, str, str]]:
+    """(type, name, tbl_name, sql) for user objects in creation order"""
+    return [
+        (row[0], row[1], row[2], row[3])
+        for row in conn.execute("""
+            SELECT type, name, tbl_name, sql FROM sqlite_master
+            WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%'
+            ORDER BY rowid
+        """)
+    ]
+
+
+def _is_virtual(sql: Optional[str]) -> bool:
+    return (sql or '').upper().startswith('CREATE VIRTUAL TABLE')
+
+
+def _shadow_tables(objects: List[Tuple[str, str, str, str]]) -> set:
+    """Names of tables SQLite manages on behalf of virtual tables"""
+    return {
+        f"{name}_{suffix}"
+        for type_, name, _, sql in objects
+        if type_ == 'table' and _is_virtual(sql)
+        for suffix in FTS_SHADOW_SUFFIXES
+    }
+
+
+def _object_map(conn: sqlite3.Connection) -> Dict[Tuple[str, str], str]:
+    objects = _schema_objects(conn)
+    shadow = _shadow_tables(objects)
+    return {
+        (type_, name): sql for type_, name, tbl_name, sql in objects
+        if name not in shadow and tbl_name not in shadow
+    }
+
+
+def _normalize_sql(sql: str) -> str:
+    return ' '.join(sql.split())
+
+
+def _sql_literal(value) -> str:
+    """Render a Python value as a SQLite literal"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return f"X'{bytes(value).hex()}'"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _stable_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    """Columns of a table except those defaulting to the current time"""
+    return [
+        row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')
+        if not _is_volatile_default(row[4])
+    ]
+
+
+def _is_volatile_default(default: Optional[str]) -> bool:
+    text = (default or '').upper()
+    return 'CURRENT_' in text or "'NOW'" in text
+
+
+def _dump_rows(conn: sqlite3.Connection, table: str) -> List[str]:
+    columns = _stable_columns(conn, table)
+    column_list = ', '.join(f'"{column}"' for column in columns)
+    return [
+        f'INSERT INTO "{table}" ({column_list}) VALUES '
+        f"({', '.join(_sql_literal(value) for value in row)});"
+        for row in conn.execute(f'SELECT {column_list} FROM "{table}" ORDER BY rowid')
+    ]
+
+
+def _dump_sequences(conn: sqlite3.Connection) -> List[str]:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'"
+    ).fetchone()
+    if not exists:
+        return []
+    return ["DELETE FROM sqlite_sequence;"] + [
+        f"INSERT INTO sqlite_sequence (name, seq) VALUES ({_sql_literal(name)}, {seq});"
+        for name, seq in conn.execute(
+            "SELECT name, seq FROM sqlite_sequence WHERE name != 'schema_migrations' ORDER BY name"
+        )
+    ]
+
+
+def _table_fingerprint(conn: sqlite3.Connection, table: str) -> str:
+    """Hash of a table's rows, ignoring columns stamped at creation time"""
+    column_list = ', '.join(f'"{column}"' for column in _stable_columns(conn, table))
+    query = f'SELECT {column_list} FROM "{table}" ORDER BY rowid'
+    digest = hashlib.sha256()
+    for row in conn.execute(query):
+        digest.update(repr(tuple(row)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+__all__ = [
+    'BASELINE_FILE',
+    'BaselineError',
+    'BaselineSnapshot',
+    'BaselineVerification',
+    'apply_baseline',
+    'build_from_baseline',
+    'compute_source_checksum',
+    'dump_baseline',
+    'load_baseline',
+    'parse_baseline',
+    'replay_migrations',
+    'squash',
+    'verify_baseline',
+]
@@ -17,11 +17,25 @@ Design:
 Reference: Task #111 - Migration Auto-Generation
 """
 
+import re
 import sqlite3
 from enum import Enum
 from typing import List, Dict, Set, Optional, Tuple
 from dataclasses import dataclass
 
+# Shadow tables SQLite creates for each FTS5 virtual table
+FTS_SHADOW_SUFFIXES = ('data', 'idx', 'content', 'docsize', 'config')
+
+_TABLE_RE = re.compile(
+    r'^CREATE\s+(?:VIRTUAL\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?["`\[]?(\w+)',
+    re.IGNORECASE
+)
+_INDEX_RE = re.compile(
+    r'^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?["`\[]?(\w+)["`\]]?'
+    r'\s+ON\s+["`\[]?(\w+)[^;]*',
+    re.IGNORECASE | re.MULTILINE
+)
+
 
 class ChangeType(Enum):
     """Type of schema change"""
@@ -463,14 +477,22 @@ class SchemaDiffer:
         return conflicts
 
     def _get_current_tables(self) -> Set[str]:
-        """Get list of current table names"""
+        """Get list of current table names (FTS5 shadow tables excluded)"""
         with self.db_service.connect() as conn:
             cursor = conn.execute("""
-                SELECT name FROM sqlite_master
+                SELECT name, sql FROM sqlite_master
                 WHERE type='table' AND name NOT LIKE 'sqlite_%'
                 ORDER BY name
             """)
-            return {row[0] for row in cursor.fetchall()}
+            rows = cursor.fetchall()
+
+        shadow = {
+            f"{row[0]}_{suffix}"
+            for row in rows
+            if (row[1] or '').upper().startswith('CREATE VIRTUAL TABLE')
+            for suffix in FTS_SHADOW_SUFFIXES
+        }
+        return {row[0] for row in rows if row[0] not in shadow}
 
     def _get_current_indexes(self) -> Dict[str, Dict]:
         """Get current indexes with metadata"""
@@ -538,13 +560,12 @@ class SchemaDiffer:
         for line in ddl.split('\n'):
             line = line.strip()
 
-            if line.startswith('CREATE TABLE'):
-                # Extract table name
-                parts = line.split()
-                if len(parts) >= 3:
-                    table_name = parts[2].rstrip('(')
-                    current_table = table_name
-                    current_sql = [line]
+            match = _TABLE_RE.match(line)
+            if match:
+                # Extract table name (quoted names and virtual tables as dumped
+                # from sqlite_master)
+                current_table = match.group(1)
+                current_sql = [line]
             elif current_table and line:
                 current_sql.append(line)
 
@@ -557,29 +578,16 @@ class SchemaDiffer:
         return tables
 
     def _parse_target_indexes(self, ddl: str) -> Dict[str, Dict]:
-        """Parse CREATE INDEX statements from DDL"""
+        """Parse CREATE INDEX statements from DDL (may span several lines)"""
         indexes = {}
 
-        for line in ddl.split('\n'):
-            line = line.strip()
-
-            if line.startswith('CREATE INDEX') or line.startswith('CREATE UNIQUE INDEX'):
-                # Extract index name (simplified)
-                parts = line.split()
-                unique = 'UNIQUE' in line.upper()
-
-                # Find index name and table name
-                if 'ON' in parts:
-                    on_idx = parts.index('ON')
-                    index_name = parts[on_idx - 1]
-                    table_name = parts[on_idx + 1].split('(')[0]
-
-                    indexes[index_name] = {
-                        'table': table_name,
-                        'unique': unique,
-                        'columns': [],  # Would need to parse for actual columns
-                        'sql': line
-                    }
+        for match in _INDEX_RE.finditer(ddl):
+            indexes[match.group(2)] = {
+                'table': match.group(3),
+                'unique': match.group(1) is not None,
+                'columns': [],  # Would need to parse for actual columns
+                'sql': ' '.join(match.group(0).split())
+            }
 
         return indexes
 
@@ -0,0 +1,152 @@
+"""
+Migration 0051: Chunked FTS5 Index for Document Content
+
+Replaces the never-populated document_content_fts placeholder (Migration 0039)
+with a real, heading-aware content index so document search no longer reads
+files from disk at query time.
+
+New Tables:
+- document_content_chunks: Heading-aware chunks of document content
+- document_chunks_fts: External-content FTS5 table over chunk title,
+  heading path and content (BM25 ranking, snippets served from the index)
+
+Features:
+- Chunks cascade-delete with their document
+- Triggers keep document_chunks_fts in sync with document_content_chunks
+- Existing document content is chunked and indexed during upgrade
+
+Migration 0051
+Dependencies: Migration 0039 (document content storage)
+"""
+
+import sqlite3
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Create chunked document content index"""
+    print("🔧 Migration 0051: Create chunked document content index")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS document_content_chunks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            chunk_index INTEGER NOT NULL,
+            title TEXT NOT NULL DEFAULT '',              -- Document title (indexed with each chunk)
+            heading_path TEXT NOT NULL DEFAULT '',       -- e.g. 'Architecture > Storage'
+            content TEXT NOT NULL,                       -- Chunk text
+            start_offset INTEGER NOT NULL DEFAULT 0,     -- Character offset in document content
+            source_hash TEXT NOT NULL,                   -- Hash of title+content the chunk was built from
+
+            FOREIGN KEY (document_id) REFERENCES document_references(id) ON DELETE CASCADE,
+            CONSTRAINT unique_document_chunk UNIQUE (document_id, chunk_index)
+        )
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_document_chunks_document
+        ON document_content_chunks(document_id)
+    """)
+
+    if not _check_fts5_availability(conn):
+        print("⚠️  FTS5 not available - chunks are stored but not full-text indexed")
+        print("   Document search will fall back to LIKE queries")
+        _populate_chunks(conn)
+        return
+
+    conn.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS document_chunks_fts USING fts5(
+            title,
+            heading_path,
+            content,
+            content='document_content_chunks',
+            content_rowid='id',
+            tokenize='porter unicode61 remove_diacritics 2'
+        )
+    """)
+    print("  ✅ Created document_content_chunks and document_chunks_fts")
+
+    _create_chunk_triggers(conn)
+    _populate_chunks(conn)
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop chunked document content index"""
+    print("🔧 Migration 0051 downgrade: Drop chunked document content index")
+
+    for trigger_name in ('document_chunks_ai', 'document_chunks_ad', 'document_chunks_au'):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+    conn.execute("DROP TABLE IF EXISTS document_chunks_fts")
+    conn.execute("DROP TABLE IF EXISTS document_content_chunks")
+
+    print("  ✅ Document content index dropped")
+
+
+def _check_fts5_availability(conn: sqlite3.Connection) -> bool:
+    """Check if FTS5 is available in this SQLite build"""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _create_chunk_triggers(conn: sqlite3.Connection) -> None:
+    """Keep the external-content FTS table in sync with chunk rows"""
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS document_chunks_ai
+        AFTER INSERT ON document_content_chunks
+        BEGIN
+            INSERT INTO document_chunks_fts(rowid, title, heading_path, content)
+            VALUES (NEW.id, NEW.title, NEW.heading_path, NEW.content);
+        END
+    """)
+
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS document_chunks_ad
+        AFTER DELETE ON document_content_chunks
+        BEGIN
+            INSERT INTO document_chunks_fts(document_chunks_fts, rowid, title, heading_path, content)
+            VALUES ('delete', OLD.id, OLD.title, OLD.heading_path, OLD.content);
+        END
+    """)
+
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS document_chunks_au
+        AFTER UPDATE ON document_content_chunks
+        BEGIN
+            INSERT INTO document_chunks_fts(document_chunks_fts, rowid, title, heading_path, content)
+            VALUES ('delete', OLD.id, OLD.title, OLD.heading_path, OLD.content);
+            INSERT INTO document_chunks_fts(rowid, title, heading_path, content)
+            VALUES (NEW.id, NEW.title, NEW.heading_path, NEW.content);
+        END
+    """)
+    print("  ✅ Created document chunk FTS triggers")
+
+
+def _populate_chunks(conn: sqlite3.Connection) -> None:
+    """Chunk and index content of existing documents"""
+    from agentpm.core.database.methods.document_chunks import index_document_content
+
+    rows = conn.execute("""
+        SELECT id, title, content
+        FROM document_references
+        WHERE content IS NOT NULL AND content != ''
+    """).fetchall()
+
+    if not rows:
+        print("  ℹ️  No existing document content to index")
+        return
+
+    total_chunks = 0
+    for document_id, title, content in rows:
+        total_chunks += index_document_content(conn, document_id, title, content, force=True)
+
+    print(f"  ✅ Indexed {len(rows)} documents ({total_chunks} chunks)")
+
+
+# Migration metadata
+MIGRATION_ID = "0051"
+MIGRATION_NAME = "document_content_chunks"
+DEPENDENCIES = ["0039"]
+DESCRIPTION = "Create chunked FTS5 index for document content with BM25 ranking"
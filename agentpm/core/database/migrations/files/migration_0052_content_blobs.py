@@ -0,0 +1,268 @@
+"""
+Migration 0052: Content-Addressed Blob Store
+
+Document content (Migration 0039), generated memory files (Migration 0037) and
+checkpoint snapshots (Migration 0038) each stored a full text copy per row, and
+most rows are near-identical revisions of each other. Content now lives once
+per distinct value in a compressed, reference-counted blob table.
+
+New Table:
+- content_blobs: SHA-256 keyed, zlib/lzma compressed payloads with ref counts
+
+New Columns:
+- document_references.content_blob_key (content column left NULL)
+- memory_files.content_blob_key (content column left '')
+- session_checkpoints.snapshot_blob_key (snapshot columns left at defaults)
+
+Features:
+- Triggers on each owning table maintain content_blobs.ref_count
+- Blobs are deleted when their last reference goes away
+- Existing inline content is moved into blobs during upgrade
+
+Migration 0052
+Dependencies: Migrations 0037, 0038, 0039
+"""
+
+import json
+import sqlite3
+
+# (table, key column, trigger prefix)
+BLOB_OWNERS = (
+    ('document_references', 'content_blob_key', 'document_blob_ref'),
+    ('memory_files', 'content_blob_key', 'memory_blob_ref'),
+    ('session_checkpoints', 'snapshot_blob_key', 'checkpoint_blob_ref'),
+)
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Create content blob store and move inline content into it"""
+    print("🔧 Migration 0052: Create content-addressed blob store")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS content_blobs (
+            blob_key TEXT PRIMARY KEY CHECK(length(blob_key) = 64),  -- SHA-256 of raw content
+            codec TEXT NOT NULL DEFAULT 'zlib' CHECK(codec IN ('none', 'zlib', 'lzma')),
+            payload BLOB NOT NULL,                                   -- Compressed content
+            raw_size INTEGER NOT NULL CHECK(raw_size >= 0),
+            stored_size INTEGER NOT NULL CHECK(stored_size >= 0),
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            stored_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS content_blobs_release
+        AFTER UPDATE OF ref_count ON content_blobs
+        WHEN NEW.ref_count <= 0
+        BEGIN
+            DELETE FROM content_blobs WHERE blob_key = NEW.blob_key;
+        END
+    """)
+    print("  ✅ Created content_blobs table")
+
+    for table, column, prefix in BLOB_OWNERS:
+        if not _table_exists(conn, table):
+            print(f"  ⚠️  Table {table} not found, skipping")
+            continue
+        if not _column_exists(conn, table, column):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+            print(f"  ✅ Added column: {table}.{column}")
+        _create_ref_triggers(conn, table, column, prefix)
+
+    _move_document_content(conn)
+    _move_memory_content(conn)
+    _move_checkpoint_snapshots(conn)
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Restore inline content and drop the blob store"""
+    from agentpm.core.database.methods.content_blobs import get_blob_text
+
+    print("🔧 Migration 0052 downgrade: Drop content-addressed blob store")
+
+    if _column_exists(conn, 'document_references', 'content_blob_key'):
+        rows = conn.execute(
+            "SELECT id, content_blob_key FROM document_references WHERE content_blob_key IS NOT NULL"
+        ).fetchall()
+        for doc_id, key in rows:
+            conn.execute(
+                "UPDATE document_references SET content = ? WHERE id = ?",
+                (get_blob_text(conn, key), doc_id)
+            )
+
+    if _column_exists(conn, 'memory_files', 'content_blob_key'):
+        rows = conn.execute(
+            "SELECT id, content_blob_key FROM memory_files WHERE content_blob_key IS NOT NULL"
+        ).fetchall()
+        for memory_id, key in rows:
+            conn.execute(
+                "UPDATE memory_files SET content = ? WHERE id = ?",
+                (get_blob_text(conn, key) or '', memory_id)
+            )
+
+    if _column_exists(conn, 'session_checkpoints', 'snapshot_blob_key'):
+        rows = conn.execute(
+            "SELECT id, snapshot_blob_key FROM session_checkpoints WHERE snapshot_blob_key IS NOT NULL"
+        ).fetchall()
+        for checkpoint_id, key in rows:
+            snapshot = json.loads(get_blob_text(conn, key) or '{}')
+            conn.execute(
+                """
+                UPDATE session_checkpoints
+                SET work_items_snapshot = ?, tasks_snapshot = ?, context_snapshot = ?
+                WHERE id = ?
+                """,
+                (
+                    json.dumps(snapshot.get('work_items', [])),
+                    json.dumps(snapshot.get('tasks', [])),
+                    json.dumps(snapshot.get('context', {})),
+                    checkpoint_id,
+                )
+            )
+
+    for table, column, prefix in BLOB_OWNERS:
+        for suffix in ('ai', 'au', 'ad'):
+            conn.execute(f"DROP TRIGGER IF EXISTS {prefix}_{suffix}")
+        if _column_exists(conn, table, column):
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+
+    conn.execute("DROP TRIGGER IF EXISTS content_blobs_release")
+    conn.execute("DROP TABLE IF EXISTS content_blobs")
+
+    print("  ✅ Content restored inline, blob store dropped")
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check if a table exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """Check if a column exists on a table"""
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+def _create_ref_triggers(conn: sqlite3.Connection, table: str, column: str, prefix: str) -> None:
+    """Maintain content_blobs.ref_count from an owning table"""
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_ai
+        AFTER INSERT ON {table}
+        WHEN NEW.{column} IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.{column};
+        END
+    """)
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_au
+        AFTER UPDATE OF {column} ON {table}
+        WHEN OLD.{column} IS NOT NEW.{column}
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.{column};
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.{column};
+        END
+    """)
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {prefix}_ad
+        AFTER DELETE ON {table}
+        WHEN OLD.{column} IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.{column};
+        END
+    """)
+    print(f"  ✅ Created reference triggers for {table}")
+
+
+def _move_document_content(conn: sqlite3.Connection) -> None:
+    """Move inline document content into blobs"""
+    from agentpm.core.database.methods.content_blobs import put_blob
+
+    if not _table_exists(conn, 'document_references'):
+        return
+
+    rows = conn.execute("""
+        SELECT id, content FROM document_references
+        WHERE content IS NOT NULL AND content_blob_key IS NULL
+    """).fetchall()
+
+    for doc_id, content in rows:
+        key = put_blob(conn, content)
+        conn.execute(
+            "UPDATE document_references SET content_blob_key = ?, content = NULL WHERE id = ?",
+            (key, doc_id)
+        )
+
+    if rows:
+        print(f"  ✅ Moved content of {len(rows)} documents into blobs")
+
+
+def _move_memory_content(conn: sqlite3.Connection) -> None:
+    """Move inline memory file content into blobs"""
+    from agentpm.core.database.methods.content_blobs import put_blob
+
+    if not _table_exists(conn, 'memory_files'):
+        return
+
+    rows = conn.execute("""
+        SELECT id, content FROM memory_files
+        WHERE content_blob_key IS NULL
+    """).fetchall()
+
+    for memory_id, content in rows:
+        key = put_blob(conn, content or '')
+        conn.execute(
+            "UPDATE memory_files SET content_blob_key = ?, content = '' WHERE id = ?",
+            (key, memory_id)
+        )
+
+    if rows:
+        print(f"  ✅ Moved content of {len(rows)} memory files into blobs")
+
+
+def _move_checkpoint_snapshots(conn: sqlite3.Connection) -> None:
+    """Move inline checkpoint snapshots into blobs"""
+    from agentpm.core.database.methods.content_blobs import put_blob
+
+    if not _table_exists(conn, 'session_checkpoints'):
+        return
+
+    rows = conn.execute("""
+        SELECT id, work_items_snapshot, tasks_snapshot, context_snapshot
+        FROM session_checkpoints
+        WHERE snapshot_blob_key IS NULL
+    """).fetchall()
+
+    for checkpoint_id, work_items, tasks, context in rows:
+        snapshot = json.dumps(
+            {
+                'work_items': json.loads(work_items or '[]'),
+                'tasks': json.loads(tasks or '[]'),
+                'context': json.loads(context or '{}'),
+            },
+            sort_keys=True,
+            separators=(',', ':')
+        )
+        key = put_blob(conn, snapshot)
+        conn.execute(
+            """
+            UPDATE session_checkpoints
+            SET snapshot_blob_key = ?, work_items_snapshot = '[]',
+                tasks_snapshot = '[]', context_snapshot = '{}'
+            WHERE id = ?
+            """,
+            (key, checkpoint_id)
+        )
+
+    if rows:
+        print(f"  ✅ Moved {len(rows)} checkpoint snapshots into blobs")
+
+
+# Migration metadata
+MIGRATION_ID = "0052"
+MIGRATION_NAME = "content_blobs"
+DEPENDENCIES = ["0037", "0038", "0039"]
+DESCRIPTION = "Create content-addressed compressed blob store for document, memory and checkpoint content"
@@ -0,0 +1,60 @@
+"""
+Migration 0053: Memory File Source Watermarks
+
+Memory files (Migration 0037) were regenerated from scratch on every session
+hook, even when none of the tables they are built from had changed. Each file
+now records a watermark of its source tables (row count, max id and max
+updated_at per table) so regeneration can be skipped while the watermark is
+unchanged.
+
+New Columns:
+- memory_files.source_watermark (NULL until the file is next generated)
+
+Migration 0053
+Dependencies: Migration 0037
+"""
+
+import sqlite3
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Add source_watermark column to memory_files"""
+    print("🔧 Migration 0053: Add memory file source watermarks")
+
+    if not _table_exists(conn, 'memory_files'):
+        print("  ⚠️  Table memory_files not found, skipping")
+        return
+
+    if not _column_exists(conn, 'memory_files', 'source_watermark'):
+        conn.execute("ALTER TABLE memory_files ADD COLUMN source_watermark TEXT")
+        print("  ✅ Added column: memory_files.source_watermark")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop source_watermark column from memory_files"""
+    print("🔧 Migration 0053 downgrade: Drop memory file source watermarks")
+
+    if _table_exists(conn, 'memory_files') and _column_exists(conn, 'memory_files', 'source_watermark'):
+        conn.execute("ALTER TABLE memory_files DROP COLUMN source_watermark")
+
+    print("  ✅ Source watermarks dropped")
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check if a table exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """Check if a column exists on a table"""
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+# Migration metadata
+MIGRATION_ID = "0053"
+MIGRATION_NAME = "memory_source_watermarks"
+DEPENDENCIES = ["0037"]
+DESCRIPTION = "Add source table watermarks to memory files for incremental regeneration"
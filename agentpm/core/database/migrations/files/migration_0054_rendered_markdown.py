@@ -0,0 +1,54 @@
+"""
+Migration 0054: Rendered Markdown Cache
+
+The web UI rendered document content (and descriptions, contexts, summaries)
+from markdown with Pygments highlighting on every request. Rendered HTML is
+now stored once per (content hash, render variant), written when documents
+are saved, and read by the web render cache on an in-process cache miss.
+
+New Table:
+- rendered_markdown: rendered HTML keyed by SHA-256 of the markdown source
+  and the render variant (prose classes / table of contents)
+
+Migration 0054
+Dependencies: None
+"""
+
+import sqlite3
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Create rendered_markdown table"""
+    print("🔧 Migration 0054: Create rendered markdown cache")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS rendered_markdown (
+            content_hash TEXT NOT NULL CHECK(length(content_hash) = 64),  -- SHA-256 of markdown source
+            variant TEXT NOT NULL,                                        -- Render options
+            html TEXT NOT NULL,
+            rendered_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (content_hash, variant)
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rendered_markdown_rendered_at
+        ON rendered_markdown(rendered_at)
+    """)
+    print("  ✅ Created rendered_markdown table")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop rendered_markdown table"""
+    print("🔧 Migration 0054 downgrade: Drop rendered markdown cache")
+
+    conn.execute("DROP INDEX IF EXISTS idx_rendered_markdown_rendered_at")
+    conn.execute("DROP TABLE IF EXISTS rendered_markdown")
+
+    print("  ✅ Rendered markdown cache dropped")
+
+
+# Migration metadata
+MIGRATION_ID = "0054"
+MIGRATION_NAME = "rendered_markdown"
+DEPENDENCIES = []
+DESCRIPTION = "Add persistent rendered markdown cache keyed by content hash and variant"
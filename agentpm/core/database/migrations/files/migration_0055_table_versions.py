@@ -0,0 +1,110 @@
+"""
+Migration 0055: Table Change Versions
+
+Web views recomputed and re-rendered their data on every request, even when
+nothing had changed since the browser's last copy. Each tracked table now has
+a modification counter bumped by triggers on every insert, update and delete,
+so views can answer conditional GETs (ETag / Last-Modified) with 304 while the
+tables they read are unchanged.
+
+New Table:
+- table_versions: per-table version counter and last change timestamp
+
+Triggers (per tracked table):
+- {table}_version_insert / _update / _delete
+
+Migration 0055
+Dependencies: None
+"""
+
+import sqlite3
+
+# Tables whose changes invalidate web views
+TRACKED_TABLES = (
+    'projects',
+    'work_items',
+    'tasks',
+    'ideas',
+    'idea_elements',
+    'agents',
+    'agent_skills',
+    'agent_tools',
+    'agent_relationships',
+    'skills',
+    'rules',
+    'contexts',
+    'document_references',
+    'evidence_sources',
+    'sessions',
+    'session_events',
+    'summaries',
+    'work_item_summaries',
+    'task_dependencies',
+    'task_blockers',
+    'work_item_dependencies',
+)
+
+_OPERATIONS = ('insert', 'update', 'delete')
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Create table_versions and version triggers on tracked tables"""
+    print("🔧 Migration 0055: Create table change versions")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    print("  ✅ Created table_versions table")
+
+    tracked = 0
+    for table in TRACKED_TABLES:
+        if not _table_exists(conn, table):
+            print(f"  ⚠️  Table {table} not found, skipping")
+            continue
+        conn.execute(
+            "INSERT OR IGNORE INTO table_versions (table_name) VALUES (?)", (table,)
+        )
+        for operation in _OPERATIONS:
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_version_{operation}
+                AFTER {operation.upper()} ON {table}
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = '{table}';
+                END
+            """)
+        tracked += 1
+
+    print(f"  ✅ Version triggers on {tracked} tables")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop version triggers and table_versions"""
+    print("🔧 Migration 0055 downgrade: Drop table change versions")
+
+    for table in TRACKED_TABLES:
+        for operation in _OPERATIONS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {table}_version_{operation}")
+    conn.execute("DROP TABLE IF EXISTS table_versions")
+
+    print("  ✅ Table change versions dropped")
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check if a table exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+# Migration metadata
+MIGRATION_ID = "0055"
+MIGRATION_NAME = "table_versions"
+DEPENDENCIES = []
+DESCRIPTION = "Add per-table change versions maintained by triggers for conditional GETs"
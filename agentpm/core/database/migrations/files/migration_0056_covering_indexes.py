@@ -0,0 +1,163 @@
+"""
+Migration 0056: Composite Indexes and Tag Join Tables
+
+The hot list queries filtered on one indexed column and sorted the rest in a
+temporary B-tree (tasks by work item + status ordered by priority, documents
+and contexts by entity, session events by session + category), and tag
+filters scanned every row with `tags LIKE '%"x"%'` over JSON arrays.
+
+New Indexes (match the WHERE equality columns, then the ORDER BY):
+- idx_tasks_work_item_status_priority: tasks(work_item_id, status, priority, created_at DESC)
+- idx_tasks_work_item_priority: tasks(work_item_id, priority, created_at DESC)
+- idx_work_items_project_status_priority: work_items(project_id, status, priority, created_at DESC)
+- idx_document_references_entity: document_references(entity_type, entity_id, created_at DESC)
+- idx_document_references_file_path: document_references(file_path)
+- idx_contexts_entity_type: contexts(entity_type, entity_id, context_type)
+  (replaces idx_contexts_entity, a prefix of it)
+- idx_session_events_session_category: session_events(session_id, event_category, timestamp DESC)
+- idx_ideas_project_status: ideas(project_id, status, created_at DESC)
+
+New Tables (one row per JSON array element of the owner's tags column,
+maintained by triggers, case-insensitive like the LIKE filters they replace):
+- document_tags(tag, document_id)
+- idea_tags(tag, idea_id)
+
+Migration 0056
+Dependencies: None
+"""
+
+import sqlite3
+
+# (index name, table, columns)
+INDEXES = (
+    ('idx_tasks_work_item_status_priority', 'tasks', 'work_item_id, status, priority, created_at DESC'),
+    ('idx_tasks_work_item_priority', 'tasks', 'work_item_id, priority, created_at DESC'),
+    ('idx_work_items_project_status_priority', 'work_items', 'project_id, status, priority, created_at DESC'),
+    ('idx_document_references_entity', 'document_references', 'entity_type, entity_id, created_at DESC'),
+    ('idx_document_references_file_path', 'document_references', 'file_path'),
+    ('idx_contexts_entity_type', 'contexts', 'entity_type, entity_id, context_type'),
+    ('idx_session_events_session_category', 'session_events', 'session_id, event_category, timestamp DESC'),
+    ('idx_ideas_project_status', 'ideas', 'project_id, status, created_at DESC'),
+)
+
+# Indexes made redundant by a new index with the same leading columns
+SUPERSEDED_INDEXES = (
+    ('idx_contexts_entity', 'contexts', 'entity_type, entity_id'),
+)
+
+# (join table, owner table, owner id column)
+TAG_TABLES = (
+    ('document_tags', 'document_references', 'document_id'),
+    ('idea_tags', 'ideas', 'idea_id'),
+)
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Create composite indexes and tag join tables"""
+    print("🔧 Migration 0056: Composite indexes and tag join tables")
+
+    created = 0
+    for name, table, columns in INDEXES:
+        if not _table_exists(conn, table):
+            print(f"  ⚠️  Table {table} not found, skipping {name}")
+            continue
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+        created += 1
+    print(f"  ✅ Created {created} composite indexes")
+
+    for name, _, _ in SUPERSEDED_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    print(f"  ✅ Dropped {len(SUPERSEDED_INDEXES)} superseded indexes")
+
+    for tag_table, owner, owner_id in TAG_TABLES:
+        if not _table_exists(conn, owner):
+            print(f"  ⚠️  Table {owner} not found, skipping {tag_table}")
+            continue
+        _create_tag_table(conn, tag_table, owner, owner_id)
+        count = conn.execute(f"SELECT COUNT(*) FROM {tag_table}").fetchone()[0]
+        print(f"  ✅ Created {tag_table} ({count} tags backfilled)")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop tag join tables and composite indexes"""
+    print("🔧 Migration 0056 downgrade: Drop composite indexes and tag join tables")
+
+    for tag_table, owner, _ in TAG_TABLES:
+        for operation in ('insert', 'update', 'delete'):
+            conn.execute(f"DROP TRIGGER IF EXISTS {owner}_tags_{operation}")
+        conn.execute(f"DROP TABLE IF EXISTS {tag_table}")
+
+    for name, _, _ in INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    for name, table, columns in SUPERSEDED_INDEXES:
+        if _table_exists(conn, table):
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+
+    print("  ✅ Composite indexes and tag join tables dropped")
+
+
+def _create_tag_table(conn: sqlite3.Connection, tag_table: str, owner: str, owner_id: str) -> None:
+    """Create a tag join table, its sync triggers, and backfill it from owner.tags"""
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {tag_table} (
+            tag TEXT NOT NULL COLLATE NOCASE,
+            {owner_id} INTEGER NOT NULL,
+            PRIMARY KEY (tag, {owner_id})
+        )
+    """)
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{tag_table}_{owner_id} ON {tag_table}({owner_id})")
+
+    # String elements of NEW.tags when it is a JSON array (anything else has no tags)
+    insert_tags = f"""
+        INSERT OR IGNORE INTO {tag_table} (tag, {owner_id})
+        SELECT value, NEW.id FROM json_each(
+            CASE WHEN json_valid(NEW.tags) AND json_type(NEW.tags) = 'array' THEN NEW.tags ELSE '[]' END
+        )
+        WHERE type = 'text';
+    """
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {owner}_tags_insert
+        AFTER INSERT ON {owner}
+        BEGIN
+            {insert_tags}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {owner}_tags_update
+        AFTER UPDATE OF tags ON {owner}
+        BEGIN
+            DELETE FROM {tag_table} WHERE {owner_id} = OLD.id;
+            {insert_tags}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {owner}_tags_delete
+        AFTER DELETE ON {owner}
+        BEGIN
+            DELETE FROM {tag_table} WHERE {owner_id} = OLD.id;
+        END
+    """)
+
+    conn.execute(f"""
+        INSERT OR IGNORE INTO {tag_table} (tag, {owner_id})
+        SELECT j.value, o.id
+        FROM {owner} o, json_each(
+            CASE WHEN json_valid(o.tags) AND json_type(o.tags) = 'array' THEN o.tags ELSE '[]' END
+        ) j
+        WHERE j.type = 'text'
+    """)
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check if a table exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+# Migration metadata
+MIGRATION_ID = "0056"
+MIGRATION_NAME = "covering_indexes"
+DEPENDENCIES = []
+DESCRIPTION = "Add composite indexes for hot list queries and indexable tag join tables"
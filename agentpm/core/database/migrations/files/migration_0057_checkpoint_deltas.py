@@ -0,0 +1,109 @@
+"""
+Migration 0057: Incremental Session Checkpoints
+
+Every checkpoint stored a full snapshot of active work items and tasks, so
+frequent automatic checkpoints (hooks) rewrote nearly identical state each
+time. Checkpoints can now store only the entities that changed since the
+previous checkpoint of the session; a full base snapshot is written
+periodically and restores replay base + deltas.
+
+New Columns:
+- session_checkpoints.snapshot_kind: 'full' or 'delta'
+- session_checkpoints.parent_checkpoint_id: checkpoint a delta applies to
+  (NULL for full snapshots)
+
+New Index:
+- idx_checkpoints_parent: session_checkpoints(parent_checkpoint_id)
+
+Existing checkpoints are full snapshots. Downgrade materializes deltas back
+into full snapshots before dropping the columns.
+
+Migration 0057
+Dependencies: Migrations 0038, 0052
+"""
+
+import json
+import sqlite3
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Add delta columns to session_checkpoints"""
+    print("🔧 Migration 0057: Incremental session checkpoints")
+
+    if not _table_exists(conn, 'session_checkpoints'):
+        print("  ⚠️  Table session_checkpoints not found, skipping")
+        return
+
+    if not _column_exists(conn, 'session_checkpoints', 'snapshot_kind'):
+        conn.execute("""
+            ALTER TABLE session_checkpoints ADD COLUMN snapshot_kind TEXT NOT NULL DEFAULT 'full'
+                CHECK(snapshot_kind IN ('full', 'delta'))
+        """)
+        print("  ✅ Added column: session_checkpoints.snapshot_kind")
+
+    if not _column_exists(conn, 'session_checkpoints', 'parent_checkpoint_id'):
+        conn.execute("ALTER TABLE session_checkpoints ADD COLUMN parent_checkpoint_id INTEGER")
+        print("  ✅ Added column: session_checkpoints.parent_checkpoint_id")
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_checkpoints_parent
+        ON session_checkpoints(parent_checkpoint_id)
+    """)
+    print("  ✅ Created index: idx_checkpoints_parent")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Materialize delta checkpoints and drop the delta columns"""
+    from agentpm.core.database.methods.content_blobs import get_blob_text, put_blob
+    from agentpm.providers.anthropic.claude_code.runtime.checkpoints.adapters import CheckpointAdapter
+
+    print("🔧 Migration 0057 downgrade: Remove incremental session checkpoints")
+
+    if not _column_exists(conn, 'session_checkpoints', 'snapshot_kind'):
+        return
+
+    rows = conn.execute("""
+        SELECT id, snapshot_kind, parent_checkpoint_id, snapshot_blob_key
+        FROM session_checkpoints
+        ORDER BY id
+    """).fetchall()
+    states = {}  # parents always have lower ids than their deltas
+    for checkpoint_id, kind, parent_id, key in rows:
+        document = get_blob_text(conn, key)
+        if kind == 'delta':
+            parent_state = states.get(parent_id) or CheckpointAdapter.unpack_snapshot(None)
+            state = CheckpointAdapter.apply_delta(parent_state, json.loads(document or '{}'))
+            packed = CheckpointAdapter.pack_state(state)
+            conn.execute(
+                "UPDATE session_checkpoints SET snapshot_blob_key = ?, size_bytes = ? WHERE id = ?",
+                (put_blob(conn, packed), len(packed.encode('utf-8')), checkpoint_id)
+            )
+        else:
+            state = CheckpointAdapter.unpack_snapshot(document)
+        states[checkpoint_id] = state
+
+    conn.execute("DROP INDEX IF EXISTS idx_checkpoints_parent")
+    conn.execute("ALTER TABLE session_checkpoints DROP COLUMN parent_checkpoint_id")
+    conn.execute("ALTER TABLE session_checkpoints DROP COLUMN snapshot_kind")
+
+    print("  ✅ Delta checkpoints materialized, columns dropped")
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check if a table exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """Check if a column exists on a table"""
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+# Migration metadata
+MIGRATION_ID = "0057"
+MIGRATION_NAME = "checkpoint_deltas"
+DEPENDENCIES = []
+DESCRIPTION = "Store session checkpoints as periodic full snapshots plus deltas"
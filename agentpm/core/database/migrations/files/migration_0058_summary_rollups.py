@@ -0,0 +1,92 @@
+"""
+Migration 0058: Hierarchical Summary Rollups
+
+Session summaries accumulate for the lifetime of a work item; the temporal
+context loader and summary search scanned every raw row. A compaction job
+(methods/summary_rollups.py) now rolls aged per-session summaries into
+daily, weekly and finally per-work-item rollup rows.
+
+New Columns (work_item_summaries and summaries):
+- summary_level: 'session' (raw), 'daily', 'weekly' or 'work_item'
+- source_ids: JSON list of the raw summary ids a rollup replaces
+  (NULL for raw rows)
+
+New Indexes:
+- idx_wi_summaries_level: work_item_summaries(work_item_id, summary_level, session_date DESC)
+- idx_summaries_level: summaries(entity_type, entity_id, summary_level, session_date DESC)
+
+Existing rows are raw session-level summaries. Downgrade keeps rollup rows
+as ordinary summaries and drops the columns.
+
+Migration 0058
+Dependencies: Migrations 0018, 0025
+"""
+
+import sqlite3
+
+LEVEL_CHECK = "CHECK(summary_level IN ('session', 'daily', 'weekly', 'work_item'))"
+
+TABLE_INDEXES = {
+    'work_item_summaries': (
+        'idx_wi_summaries_level', "work_item_id, summary_level, session_date DESC"
+    ),
+    'summaries': (
+        'idx_summaries_level', "entity_type, entity_id, summary_level, session_date DESC"
+    ),
+}
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Add rollup level and lineage columns to the summary tables"""
+    print("🔧 Migration 0058: Hierarchical summary rollups")
+
+    for table, (index, columns) in TABLE_INDEXES.items():
+        if not _table_exists(conn, table):
+            print(f"  ⚠️  Table {table} not found, skipping")
+            continue
+
+        if not _column_exists(conn, table, 'summary_level'):
+            conn.execute(
+                f"ALTER TABLE {table} ADD COLUMN summary_level TEXT NOT NULL DEFAULT 'session' {LEVEL_CHECK}"
+            )
+            print(f"  ✅ Added column: {table}.summary_level")
+
+        if not _column_exists(conn, table, 'source_ids'):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN source_ids TEXT")
+            print(f"  ✅ Added column: {table}.source_ids")
+
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {table}({columns})")
+        print(f"  ✅ Created index: {index}")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop rollup level and lineage columns (rollup rows are kept)"""
+    print("🔧 Migration 0058 downgrade: Remove summary rollup columns")
+
+    for table, (index, _columns) in TABLE_INDEXES.items():
+        conn.execute(f"DROP INDEX IF EXISTS {index}")
+        if _table_exists(conn, table) and _column_exists(conn, table, 'summary_level'):
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN source_ids")
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN summary_level")
+
+    print("  ✅ Rollup columns dropped")
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check if a table exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def _column_exists(conn: sqlite3.Connection, table: str, column: str) -> bool:
+    """Check if a column exists on a table"""
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+# Migration metadata
+MIGRATION_ID = "0058"
+MIGRATION_NAME = "summary_rollups"
+DEPENDENCIES = []
+DESCRIPTION = "Add summary levels and source lineage for hierarchical summary rollups"
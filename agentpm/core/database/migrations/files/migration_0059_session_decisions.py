@@ -0,0 +1,154 @@
+"""
+Migration 0059: Indexed Session Decision Store
+
+Decisions were only stored inside sessions.metadata (JSON), so
+search_decisions loaded and parsed the metadata of every session in a
+project and substring-matched in Python. Decisions now live in a child
+table written by the session methods, with an FTS5 mirror for search.
+
+New Tables:
+- session_decisions: one row per decision (session, position, decision,
+  rationale, decided_at, original entry as JSON)
+- session_decisions_fts: FTS5 external-content index over decision and
+  rationale, maintained by triggers. Uses the trigram tokenizer (SQLite
+  3.34+) so case-insensitive substring LIKE searches are index-served;
+  skipped when FTS5 is unavailable (search then uses LIKE on
+  session_decisions)
+
+New Indexes:
+- idx_session_decisions_project: session_decisions(project_id, decided_at DESC)
+- idx_sessions_project_start: sessions(project_id, start_time) for the
+  session statistics aggregates
+
+Existing sessions are backfilled from metadata.decisions_made (and the
+plain-string metadata.decisions list).
+
+Migration 0059
+Dependencies: Migrations 0041, 0055
+"""
+
+import sqlite3
+
+FTS_TRIGGERS = {
+    'session_decisions_fts_insert': """
+        CREATE TRIGGER IF NOT EXISTS session_decisions_fts_insert AFTER INSERT ON session_decisions
+        BEGIN
+            INSERT INTO session_decisions_fts(rowid, decision, rationale)
+            VALUES (NEW.id, NEW.decision, COALESCE(NEW.rationale, ''));
+        END
+    """,
+    'session_decisions_fts_delete': """
+        CREATE TRIGGER IF NOT EXISTS session_decisions_fts_delete AFTER DELETE ON session_decisions
+        BEGIN
+            INSERT INTO session_decisions_fts(session_decisions_fts, rowid, decision, rationale)
+            VALUES ('delete', OLD.id, OLD.decision, COALESCE(OLD.rationale, ''));
+        END
+    """,
+    'session_decisions_fts_update': """
+        CREATE TRIGGER IF NOT EXISTS session_decisions_fts_update AFTER UPDATE ON session_decisions
+        BEGIN
+            INSERT INTO session_decisions_fts(session_decisions_fts, rowid, decision, rationale)
+            VALUES ('delete', OLD.id, OLD.decision, COALESCE(OLD.rationale, ''));
+            INSERT INTO session_decisions_fts(rowid, decision, rationale)
+            VALUES (NEW.id, NEW.decision, COALESCE(NEW.rationale, ''));
+        END
+    """,
+}
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Create session_decisions (+ FTS5 mirror) and backfill from session metadata"""
+    from agentpm.core.database.methods.sessions import sync_session_decisions
+
+    print("🔧 Migration 0059: Indexed session decision store")
+
+    if not _table_exists(conn, 'sessions'):
+        print("  ⚠️  Table sessions not found, skipping")
+        return
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS session_decisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER NOT NULL,       -- sessions.id
+            project_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,         -- Order within the session
+            decision TEXT NOT NULL,
+            rationale TEXT,
+            decided_at TEXT,
+            entry TEXT,                        -- Original decision entry (JSON, NULL for plain text)
+
+            FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE,
+            UNIQUE (session_id, position)
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_session_decisions_project
+        ON session_decisions(project_id, decided_at DESC)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sessions_project_start
+        ON sessions(project_id, start_time)
+    """)
+    print("  ✅ Created table: session_decisions")
+
+    if _fts5_available(conn):
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS session_decisions_fts USING fts5(
+                decision,
+                rationale,
+                content='session_decisions',
+                content_rowid='id',
+                tokenize='{_fts_tokenizer()}'
+            )
+        """)
+        for sql in FTS_TRIGGERS.values():
+            conn.execute(sql)
+        print("  ✅ Created FTS5 index: session_decisions_fts")
+    else:
+        print("  ⚠️  FTS5 not available - decision search will use LIKE")
+
+    sessions = conn.execute("SELECT id, project_id, metadata FROM sessions").fetchall()
+    backfilled = sum(sync_session_decisions(conn, row[0], row[1], row[2]) for row in sessions)
+    print(f"  ✅ Backfilled {backfilled} decisions from {len(sessions)} sessions")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop the decision store (session metadata still holds the decisions)"""
+    print("🔧 Migration 0059 downgrade: Remove session decision store")
+
+    for trigger in FTS_TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE IF EXISTS session_decisions_fts")
+    conn.execute("DROP INDEX IF EXISTS idx_session_decisions_project")
+    conn.execute("DROP INDEX IF EXISTS idx_sessions_project_start")
+    conn.execute("DROP TABLE IF EXISTS session_decisions")
+
+    print("  ✅ Session decision store removed")
+
+
+def _fts5_available(conn: sqlite3.Connection) -> bool:
+    """Check if this SQLite build includes FTS5"""
+    options = {row[0] for row in conn.execute("PRAGMA compile_options")}
+    return 'ENABLE_FTS5' in options
+
+
+def _fts_tokenizer() -> str:
+    """Trigram tokenizer (substring matching) where supported"""
+    if sqlite3.sqlite_version_info >= (3, 34, 0):
+        return 'trigram'
+    return 'unicode61 remove_diacritics 2'
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    """Check if a table exists"""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+# Migration metadata
+MIGRATION_ID = "0059"
+MIGRATION_NAME = "session_decisions"
+DEPENDENCIES = []
+DESCRIPTION = "Store session decisions in an indexed child table with an FTS5 mirror"
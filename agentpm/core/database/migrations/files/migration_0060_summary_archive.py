@@ -0,0 +1,55 @@
+"""
+Migration 0060: Summary Archive
+
+Summary compaction (Migration 0058, methods/summary_rollups.py) replaced
+raw session summaries with rollup rows, so the ids listed in a rollup's
+source_ids no longer resolved to anything. Compaction now moves the raw
+rows it folds into a rollup to an archive table instead of deleting them.
+
+New Tables:
+- summary_archive: one row per archived raw summary (source table, original
+  id, the complete original row as JSON, archive time)
+
+Live tables keep only rollups and recent raw rows, so the context loader
+and summary search still read the compacted set. Downgrade drops the
+archive; compaction then skips the tables again rather than delete raw rows.
+
+Migration 0060
+Dependencies: Migration 0058
+"""
+
+import sqlite3
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    """Create summary_archive"""
+    print("🔧 Migration 0060: Summary archive")
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS summary_archive (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_table TEXT NOT NULL CHECK(source_table IN ('work_item_summaries', 'summaries')),
+            source_id INTEGER NOT NULL,        -- id in source_table (listed in rollup source_ids)
+            row_data TEXT NOT NULL,            -- Original row (JSON object of all columns)
+            archived_at TEXT NOT NULL DEFAULT (datetime('now')),
+
+            UNIQUE (source_table, source_id)
+        )
+    """)
+    print("  ✅ Created table: summary_archive")
+
+
+def downgrade(conn: sqlite3.Connection) -> None:
+    """Drop the summary archive"""
+    print("🔧 Migration 0060 downgrade: Remove summary archive")
+
+    conn.execute("DROP TABLE IF EXISTS summary_archive")
+
+    print("  ✅ Summary archive removed")
+
+
+# Migration metadata
+MIGRATION_ID = "0060"
+MIGRATION_NAME = "summary_archive"
+DEPENDENCIES = []
+DESCRIPTION = "Archive raw summaries folded into rollups instead of deleting them"
@@ -0,0 +1,2006 @@
+-- APM schema baseline
+-- Generated by `apm migrate squash` - do not edit by hand.
+-- baseline-version: 0060
+-- source-checksum: 181e4fb7a87f14b313fc92115b793a10fb31b845f1e05bb4930b0b096aae8e99
+-- migrations: 39
+
+PRAGMA foreign_keys = OFF;
+BEGIN;
+
+-- @section tables
+CREATE TABLE schema_migrations (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        version TEXT NOT NULL UNIQUE,
+                        description TEXT,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        rollback_at TIMESTAMP DEFAULT NULL,
+                        rollback_reason TEXT DEFAULT NULL,
+                        applied_by TEXT DEFAULT NULL
+                    );
+CREATE TABLE projects (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            description TEXT,
+            path TEXT NOT NULL,
+
+            -- Technical context (JSON arrays)
+            tech_stack TEXT DEFAULT '[]',
+            detected_frameworks TEXT DEFAULT '[]',
+
+            -- Lifecycle
+            status TEXT DEFAULT 'initiated' CHECK(status IN ('initiated', 'active', 'on_hold', 'completed', 'archived')),
+
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+CREATE TABLE rules (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+
+            -- Rule identity
+            rule_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            category TEXT,
+
+            -- Rule enforcement
+            enforcement_level TEXT NOT NULL CHECK(enforcement_level IN ('BLOCK', 'LIMIT', 'GUIDE', 'ENHANCE')),
+            validation_logic TEXT,
+            error_message TEXT,
+
+            -- Rule configuration (JSON)
+            config TEXT,
+
+            -- Status
+            enabled INTEGER DEFAULT 1,
+
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            UNIQUE(project_id, rule_id)
+        );
+CREATE TABLE ideas (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+
+            -- Core fields
+            title TEXT NOT NULL CHECK(length(title) >= 3 AND length(title) <= 200),
+            description TEXT,
+
+            -- Attribution
+            source TEXT CHECK(source IN ('user', 'ai_suggestion', 'brainstorming_session', 'customer_feedback', 'competitor_analysis', 'other')),
+            created_by TEXT,  -- Username, email, or agent identifier
+
+            -- Social engagement
+            votes INTEGER DEFAULT 0 CHECK(votes >= 0),
+            tags TEXT DEFAULT '[]',  -- JSON array: ["ux", "backend", "quick-win"]
+
+            -- Lifecycle
+            status TEXT DEFAULT 'idea' CHECK(status IN ('idea', 'research', 'design', 'accepted', 'converted', 'rejected')),
+            rejection_reason TEXT,  -- Required when status='rejected'
+
+            -- Conversion tracking
+            converted_to_work_item_id INTEGER,
+            converted_at TIMESTAMP,
+
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            FOREIGN KEY (converted_to_work_item_id) REFERENCES work_items(id) ON DELETE SET NULL,
+
+            -- Conversion constraint: converted_to_work_item_id requires status='converted'
+            CHECK (
+                (status = 'converted' AND converted_to_work_item_id IS NOT NULL AND converted_at IS NOT NULL) OR
+                (status != 'converted')
+            )
+        );
+CREATE TABLE sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL UNIQUE,
+            project_id INTEGER NOT NULL,
+
+            -- Tool identification
+            tool_name TEXT NOT NULL CHECK(tool_name IN (
+                'claude-code', 'cursor', 'windsurf', 'aider', 'manual', 'other'
+            )),
+            llm_model TEXT CHECK(llm_model IN (
+                'claude-sonnet-4-5', 'claude-opus-4', 'gpt-4', 'gpt-4-turbo',
+                'gpt-4o', 'gemini-pro', 'gemini-ultra', 'deepseek', 'other'
+            )),
+            tool_version TEXT,
+
+            -- Lifecycle
+            start_time TIMESTAMP NOT NULL,
+            end_time TIMESTAMP,
+            duration_minutes INTEGER CHECK(duration_minutes >= 0),
+            status TEXT DEFAULT 'active' CHECK(status IN (
+                'active', 'paused', 'completed', 'abandoned'
+            )),
+            session_type TEXT DEFAULT 'coding' CHECK(session_type IN (
+                'coding', 'review', 'planning', 'research', 'debugging'
+            )),
+            exit_reason TEXT,
+
+            -- Developer
+            developer_name TEXT,
+            developer_email TEXT,
+
+            -- Metadata (JSON)
+            metadata TEXT DEFAULT '{}',
+
+            -- Audit
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+        );
+CREATE TABLE agent_relationships (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent_id INTEGER NOT NULL,
+            related_agent_id INTEGER NOT NULL,
+            relationship_type TEXT NOT NULL CHECK(relationship_type IN (
+                'collaborates_with', 'reports_to', 'delegates_to', 'consults_with',
+                'reviews_for', 'mentors', 'specializes_in', 'handles_escalation'
+            )),
+            metadata TEXT DEFAULT '{}',  -- JSON metadata
+
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (agent_id) REFERENCES agents(id) ON DELETE CASCADE,
+            FOREIGN KEY (related_agent_id) REFERENCES agents(id) ON DELETE CASCADE,
+            UNIQUE(agent_id, related_agent_id, relationship_type)
+        );
+CREATE TABLE agent_tools (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            agent_id INTEGER NOT NULL,
+            phase TEXT NOT NULL CHECK(phase IN (
+                'analysis', 'design', 'implementation', 'testing', 'deployment', 'maintenance'
+            )),
+            tool_name TEXT NOT NULL,
+            priority INTEGER DEFAULT 1 CHECK(priority >= 1 AND priority <= 5),
+            config TEXT DEFAULT '{}',  -- JSON configuration
+
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (agent_id) REFERENCES agents(id) ON DELETE CASCADE,
+            UNIQUE(agent_id, phase, tool_name)
+        );
+CREATE TABLE task_dependencies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            depends_on_task_id INTEGER NOT NULL,
+            dependency_type TEXT DEFAULT 'hard' CHECK(dependency_type IN ('hard', 'soft')),
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+            FOREIGN KEY (depends_on_task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+            UNIQUE(task_id, depends_on_task_id)
+        );
+CREATE TABLE task_blockers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            blocker_type TEXT NOT NULL CHECK(blocker_type IN ('task', 'external')),
+
+            -- Task blocker fields
+            blocker_task_id INTEGER,
+
+            -- External blocker fields
+            blocker_description TEXT,
+            blocker_reference TEXT,
+
+            -- Resolution tracking
+            is_resolved INTEGER DEFAULT 0,
+            resolved_at TIMESTAMP,
+            resolution_notes TEXT,
+
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+            FOREIGN KEY (blocker_task_id) REFERENCES tasks(id) ON DELETE CASCADE,
+
+            CHECK (
+                (blocker_type = 'task' AND blocker_task_id IS NOT NULL) OR
+                (blocker_type = 'external' AND blocker_description IS NOT NULL)
+            )
+        );
+CREATE TABLE work_item_dependencies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            work_item_id INTEGER NOT NULL,
+            depends_on_work_item_id INTEGER NOT NULL,
+            dependency_type TEXT DEFAULT 'hard' CHECK(dependency_type IN ('hard', 'soft')),
+            notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (work_item_id) REFERENCES work_items(id) ON DELETE CASCADE,
+            FOREIGN KEY (depends_on_work_item_id) REFERENCES work_items(id) ON DELETE CASCADE,
+            UNIQUE(work_item_id, depends_on_work_item_id)
+        );
+CREATE TABLE work_item_summaries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            work_item_id INTEGER NOT NULL,
+
+            -- Session identification
+            session_date TEXT NOT NULL CHECK(session_date IS date(session_date)),
+            session_duration_hours REAL CHECK(session_duration_hours IS NULL OR session_duration_hours >= 0),
+
+            -- Summary content
+            summary_text TEXT NOT NULL,
+            context_metadata TEXT,  -- JSON blob
+
+            -- Attribution
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            created_by TEXT,
+            summary_type TEXT DEFAULT 'session' CHECK(summary_type IN ('session', 'milestone', 'decision', 'retrospective')), summary_level TEXT NOT NULL DEFAULT 'session' CHECK(summary_level IN ('session', 'daily', 'weekly', 'work_item')), source_ids TEXT,
+
+            FOREIGN KEY (work_item_id) REFERENCES work_items(id) ON DELETE CASCADE
+        );
+CREATE TABLE "contexts" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            context_type TEXT NOT NULL CHECK(context_type IN ('resource_file', 'project_context', 'work_item_context', 'task_context', 'rules_context', 'business_pillars_context', 'market_research_context', 'competitive_analysis_context', 'quality_gates_context', 'stakeholder_context', 'technical_context', 'implementation_context', 'idea_context', 'idea_to_work_item_mapping')),
+            file_path TEXT,
+            file_hash TEXT,
+            resource_type TEXT CHECK(resource_type IN ('sop', 'code', 'specification', 'documentation') OR resource_type IS NULL),
+            entity_type TEXT CHECK(entity_type IN ('project', 'work_item', 'task', 'idea') OR entity_type IS NULL),
+            entity_id INTEGER,
+            six_w_data TEXT,
+            confidence_score REAL CHECK(confidence_score IS NULL OR (confidence_score >= 0.0 AND confidence_score <= 1.0)),
+            confidence_band TEXT CHECK(confidence_band IN ('RED', 'YELLOW', 'GREEN') OR confidence_band IS NULL),
+            confidence_factors TEXT,
+            context_data TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            CHECK (
+                (context_type = 'resource_file' AND file_path IS NOT NULL) OR
+                (context_type IN ('resource_file', 'project_context', 'work_item_context', 'task_context', 'rules_context', 'business_pillars_context', 'market_research_context', 'competitive_analysis_context', 'quality_gates_context', 'stakeholder_context', 'technical_context', 'implementation_context', 'idea_context', 'idea_to_work_item_mapping'))
+            ),
+            CHECK (
+                (context_type = 'resource_file') OR
+                (context_type IN ('resource_file', 'project_context', 'work_item_context', 'task_context', 'rules_context', 'business_pillars_context', 'market_research_context', 'competitive_analysis_context', 'quality_gates_context', 'stakeholder_context', 'technical_context', 'implementation_context', 'idea_context', 'idea_to_work_item_mapping') AND entity_type IS NOT NULL AND entity_id IS NOT NULL)
+            ),
+            UNIQUE(context_type, entity_type, entity_id)
+        );
+CREATE TABLE "evidence_sources" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity_type TEXT NOT NULL CHECK(entity_type IN ('project', 'work_item', 'task', 'idea')),
+            entity_id INTEGER NOT NULL,
+            url TEXT,
+            source_type TEXT CHECK(source_type IN (
+                'documentation', 'research', 'stackoverflow', 'github',
+                'internal_doc', 'meeting_notes', 'user_feedback', 'competitor_analysis'
+            )),
+            excerpt TEXT,
+            captured_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            content_hash TEXT,
+            confidence REAL CHECK(confidence >= 0.0 AND confidence <= 1.0),
+            created_by TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (entity_id) REFERENCES work_items(id) ON DELETE CASCADE
+        );
+CREATE TABLE "agents" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            role TEXT NOT NULL,
+            display_name TEXT NOT NULL,
+            description TEXT,
+            sop_content TEXT,
+            capabilities TEXT DEFAULT '[]',
+            is_active INTEGER DEFAULT 1,
+            agent_type TEXT DEFAULT NULL,
+            file_path TEXT DEFAULT NULL,
+            generated_at TIMESTAMP DEFAULT NULL,
+            tier INTEGER CHECK(tier IN (1, 2, 3)),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, functional_category TEXT
+                CHECK(functional_category IN ('planning', 'implementation', 'testing', 'documentation', 'utilities')),
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            UNIQUE(project_id, role)
+        );
+CREATE TABLE "session_events" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            event_type TEXT NOT NULL CHECK(event_type IN ('task.created', 'task.started', 'task.completed', 'task.blocked', 'task.unblocked', 'work_item.started', 'work_item.completed', 'dependency.added', 'blocker.added', 'blocker.resolved', 'tool.read_file', 'tool.write_file', 'tool.edit_file', 'tool.bash_command', 'tool.grep_search', 'tool.glob_search', 'tool.success', 'tool.failure', 'decision.made', 'decision.approach_chosen', 'decision.approach_rejected', 'decision.trade_off_analyzed', 'reasoning.started', 'reasoning.complete', 'reasoning.hypothesis_formed', 'reasoning.hypothesis_tested', 'error.encountered', 'error.resolved', 'error.import_failed', 'error.test_failed', 'error.build_failed', 'error.syntax_error', 'session.started', 'session.paused', 'session.resumed', 'session.ended', 'session.milestone', 'session.phase_transition')),
+            event_category TEXT NOT NULL CHECK(event_category IN (
+                'workflow', 'tool_usage', 'decision', 'reasoning', 'error', 'session_lifecycle'
+            )),
+            event_severity TEXT NOT NULL CHECK(event_severity IN (
+                'debug', 'info', 'warning', 'error', 'critical'
+            )),
+            session_id INTEGER NOT NULL,
+            timestamp TEXT NOT NULL,
+            source TEXT NOT NULL,
+            event_data TEXT NOT NULL,
+            work_item_id INTEGER,
+            task_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE,
+            FOREIGN KEY (work_item_id) REFERENCES work_items(id) ON DELETE CASCADE,
+            FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+        );
+CREATE TABLE "work_items" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            parent_work_item_id INTEGER,
+            originated_from_idea_id INTEGER,
+
+            -- Work item details
+            name TEXT NOT NULL,
+            description TEXT,
+            type TEXT NOT NULL CHECK(type IN (
+                'feature', 'enhancement', 'bugfix', 'research', 'analysis', 'planning',
+                'refactoring', 'infrastructure', 'maintenance', 'monitoring',
+                'documentation', 'security', 'fix_bugs_issues'
+            )),
+
+            -- Business context
+            business_context TEXT,
+            metadata TEXT DEFAULT '{}',
+
+            -- Planning
+            effort_estimate_hours REAL,
+            priority INTEGER DEFAULT 3 CHECK(priority >= 1 AND priority <= 5),
+
+            -- Lifecycle
+            status TEXT DEFAULT 'draft' CHECK(status IN (
+                'draft', 'ready', 'active', 'review', 'done', 'archived', 'blocked', 'cancelled'
+            )),
+            phase TEXT CHECK(phase IS NULL OR phase IN ('D1_discovery', 'P1_plan', 'I1_implementation', 'R1_review', 'O1_operations', 'E1_evolution')),
+            due_date TIMESTAMP,
+            not_before TIMESTAMP,
+            is_continuous INTEGER NOT NULL DEFAULT 0 CHECK(is_continuous IN (0, 1)),
+
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            FOREIGN KEY (parent_work_item_id) REFERENCES work_items(id) ON DELETE CASCADE
+            FOREIGN KEY (originated_from_idea_id) REFERENCES ideas(id) ON DELETE SET NULL
+        );
+CREATE TABLE "tasks" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            work_item_id INTEGER NOT NULL,
+
+            -- Task details
+            name TEXT NOT NULL,
+            description TEXT,
+            type TEXT DEFAULT 'implementation' CHECK(type IN (
+                'design', 'implementation', 'testing', 'bugfix', 'refactoring',
+                'documentation', 'deployment', 'review', 'analysis', 'research',
+                'maintenance', 'optimization', 'integration', 'training', 'meeting',
+                'planning', 'dependency', 'blocker', 'simple', 'other'
+            )),
+
+            -- Quality gate tracking
+            quality_metadata TEXT,
+
+            -- Planning
+            effort_hours REAL CHECK(effort_hours IS NULL OR (effort_hours >= 0 AND effort_hours <= 8)),
+            priority INTEGER DEFAULT 3 CHECK(priority >= 1 AND priority <= 5),
+            due_date TIMESTAMP,
+
+            -- Assignment
+            assigned_to TEXT,
+
+            -- Lifecycle
+            status TEXT DEFAULT 'draft' CHECK(status IN (
+                'draft', 'ready', 'active', 'review', 'done', 'archived', 'blocked', 'cancelled'
+            )),
+            blocked_reason TEXT,
+
+            -- NEW: Phase field (from work_item)
+            phase TEXT CHECK(phase IS NULL OR phase IN ('D1_discovery', 'P1_plan', 'I1_implementation', 'R1_review', 'O1_operations', 'E1_evolution')),
+
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP,
+            completed_at TIMESTAMP,
+
+            FOREIGN KEY (work_item_id) REFERENCES work_items(id) ON DELETE CASCADE
+        );
+CREATE TABLE summaries (
+            -- Primary Key
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+            -- Polymorphic assignment
+            entity_type TEXT NOT NULL CHECK (entity_type IN ('project', 'session', 'work_item', 'task', 'idea')),
+            entity_id INTEGER NOT NULL,
+
+            -- Summary classification
+            summary_type TEXT NOT NULL,
+            summary_text TEXT NOT NULL,
+            context_metadata TEXT,  -- JSON blob
+
+            -- Attribution & traceability
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            created_by TEXT NOT NULL,
+            session_id INTEGER,  -- Optional link to session
+
+            -- Optional session context
+            session_date TEXT,  -- YYYY-MM-DD format
+            session_duration_hours REAL, summary_level TEXT NOT NULL DEFAULT 'session' CHECK(summary_level IN ('session', 'daily', 'weekly', 'work_item')), source_ids TEXT,
+
+            -- Constraints
+            FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE SET NULL,
+
+            -- Ensure session_date is valid ISO 8601 date
+            CHECK (session_date IS NULL OR session_date IS date(session_date)),
+
+            -- Ensure entity_id is positive
+            CHECK (entity_id > 0),
+
+            -- Ensure session_duration_hours is non-negative
+            CHECK (session_duration_hours IS NULL OR session_duration_hours >= 0),
+
+            -- Ensure summary_text is not empty
+            CHECK (length(trim(summary_text)) >= 10)
+        );
+CREATE TABLE provider_installations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            provider_type TEXT NOT NULL CHECK(provider_type IN ('cursor', 'vscode', 'zed', 'claude_code')),
+            provider_version TEXT NOT NULL DEFAULT '1.0.0',
+
+            -- Installation metadata
+            install_path TEXT NOT NULL,
+            status TEXT NOT NULL CHECK(status IN ('installed', 'partial', 'failed', 'uninstalled')),
+            config TEXT NOT NULL DEFAULT '{}',  -- JSON configuration
+
+            -- File tracking
+            installed_files TEXT NOT NULL DEFAULT '[]',  -- JSON array of file paths
+            file_hashes TEXT NOT NULL DEFAULT '{}',  -- JSON map of file_path -> hash
+
+            -- Timestamps
+            installed_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            last_verified_at TEXT,
+
+            -- Foreign keys
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+
+            -- Constraints
+            UNIQUE(project_id, provider_type)  -- One provider per project
+        );
+CREATE TABLE cursor_memories (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+
+            -- Memory metadata
+            name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            category TEXT NOT NULL DEFAULT 'general',
+
+            -- Memory content
+            content TEXT NOT NULL,
+            tags TEXT NOT NULL DEFAULT '[]',  -- JSON array of tags
+
+            -- File metadata
+            file_path TEXT NOT NULL,  -- Relative path in .cursor/memories/
+            file_hash TEXT,  -- SHA-256 hash of file content
+
+            -- Sync metadata
+            source_learning_id INTEGER,  -- AIPM learning that generated this memory
+            last_synced_at TEXT,
+
+            -- Timestamps
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+
+            -- Foreign keys
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            FOREIGN KEY (source_learning_id) REFERENCES learnings(id) ON DELETE SET NULL,
+
+            -- Constraints
+            UNIQUE(project_id, file_path)  -- No duplicate memory files
+        );
+CREATE TABLE memory_files (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL,
+            session_id INTEGER,
+
+            -- Memory file metadata
+            file_type TEXT NOT NULL CHECK(file_type IN (
+                'rules',           -- RULES.md - Governance rules
+                'principles',      -- PRINCIPLES.md - Development principles
+                'workflow',        -- WORKFLOW.md - Quality-gated workflow
+                'agents',          -- AGENTS.md - Agent system
+                'context',         -- CONTEXT.md - Context assembly
+                'project',         -- PROJECT.md - Project information
+                'ideas'            -- IDEAS.md - Ideas analysis
+            )),
+            file_path TEXT NOT NULL,  -- Relative path in .claude/ directory
+            file_hash TEXT,           -- SHA-256 hash for change detection
+
+            -- Content metadata
+            content TEXT NOT NULL,                    -- Generated markdown content
+            source_tables TEXT NOT NULL DEFAULT '[]', -- JSON array of source tables
+            template_version TEXT NOT NULL DEFAULT '1.0.0',
+
+            -- Quality metadata
+            confidence_score REAL DEFAULT 1.0 CHECK(confidence_score BETWEEN 0.0 AND 1.0),
+            completeness_score REAL DEFAULT 1.0 CHECK(completeness_score BETWEEN 0.0 AND 1.0),
+            validation_status TEXT NOT NULL DEFAULT 'pending' CHECK(validation_status IN (
+                'pending', 'validated', 'stale', 'failed'
+            )),
+
+            -- Generation metadata
+            generated_by TEXT NOT NULL,  -- Agent or service that generated file
+            generation_duration_ms INTEGER,
+
+            -- Timestamps
+            generated_at TEXT NOT NULL,
+            validated_at TEXT,
+            expires_at TEXT,  -- Optional expiry for cache management
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL, content_blob_key TEXT, source_watermark TEXT,
+
+            -- Foreign keys
+            FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE,
+            FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE SET NULL,
+
+            -- Constraints
+            UNIQUE(project_id, file_type)  -- One file per type per project
+        );
+CREATE TABLE session_checkpoints (
+            -- Primary key
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+            -- Session reference
+            session_id INTEGER NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+
+            -- Checkpoint identification
+            checkpoint_name TEXT NOT NULL CHECK(length(checkpoint_name) >= 1 AND length(checkpoint_name) <= 200),
+            created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+            -- State snapshots (JSON blobs)
+            work_items_snapshot TEXT NOT NULL DEFAULT '[]' CHECK(json_valid(work_items_snapshot)),
+            tasks_snapshot TEXT NOT NULL DEFAULT '[]' CHECK(json_valid(tasks_snapshot)),
+            context_snapshot TEXT NOT NULL DEFAULT '{}' CHECK(json_valid(context_snapshot)),
+
+            -- Metadata
+            session_notes TEXT DEFAULT '' CHECK(length(session_notes) <= 1000),
+            created_by TEXT DEFAULT 'unknown' CHECK(length(created_by) <= 200),
+            restore_count INTEGER DEFAULT 0 CHECK(restore_count >= 0),
+            size_bytes INTEGER DEFAULT 0 CHECK(size_bytes >= 0),
+
+            -- Audit
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        , snapshot_blob_key TEXT, snapshot_kind TEXT NOT NULL DEFAULT 'full'
+                CHECK(snapshot_kind IN ('full', 'delta')), parent_checkpoint_id INTEGER);
+CREATE VIRTUAL TABLE document_content_fts USING fts5(
+                document_id UNINDEXED,
+                filename,
+                title,
+                content,
+                tokenize='unicode61 remove_diacritics 2'
+            );
+CREATE VIRTUAL TABLE search_index USING fts5(
+            entity_id,
+            entity_type,
+            title,
+            content,
+            tags,
+            metadata
+        );
+CREATE TABLE search_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER NOT NULL DEFAULT 1,
+            query_text TEXT NOT NULL,
+            result_count INTEGER NOT NULL,
+            execution_time_ms REAL NOT NULL,
+            user_id TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects(id)
+        );
+CREATE TABLE search_cache (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            query_hash TEXT UNIQUE NOT NULL,
+            query_text TEXT NOT NULL,
+            result_data TEXT NOT NULL,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            expires_at DATETIME NOT NULL
+        );
+CREATE VIRTUAL TABLE evidence_fts USING fts5(
+            evidence_id UNINDEXED,
+            entity_type,
+            entity_id UNINDEXED,
+            source_type,
+            url,
+            excerpt,
+            tokenize='unicode61 remove_diacritics 2'
+        );
+CREATE VIRTUAL TABLE sessions_fts USING fts5(
+            session_id UNINDEXED,
+            project_id UNINDEXED,
+            session_type,
+            developer_name,
+            tool_name,
+            llm_model,
+            exit_reason,
+            metadata_text,
+            tokenize='unicode61 remove_diacritics 2'
+        );
+CREATE TABLE idea_elements (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            idea_id INTEGER NOT NULL,
+            
+            -- Core fields
+            title TEXT NOT NULL CHECK(length(title) >= 3 AND length(title) <= 200),
+            description TEXT,
+            
+            -- Element classification
+            type TEXT NOT NULL CHECK(type IN (
+                'analysis', 'bugfix', 'deployment', 'design', 'documentation',
+                'implementation', 'maintenance', 'refactoring', 'research',
+                'review', 'testing'
+            )),
+            
+            -- Effort estimation
+            effort_hours REAL NOT NULL CHECK(effort_hours >= 0.1 AND effort_hours <= 1000.0),
+            
+            -- Ordering and completion
+            order_index INTEGER NOT NULL CHECK(order_index >= 0),
+            is_completed INTEGER DEFAULT 0 CHECK(is_completed IN (0, 1)),
+            completed_at TIMESTAMP,
+            
+            -- Timestamps
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            
+            FOREIGN KEY (idea_id) REFERENCES ideas(id) ON DELETE CASCADE,
+            
+            -- Completion constraint: completed_at requires is_completed=1
+            CHECK (
+                (is_completed = 1 AND completed_at IS NOT NULL) OR
+                (is_completed = 0)
+            )
+        );
+CREATE TABLE "document_references" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity_type TEXT NOT NULL CHECK(entity_type IN ('project', 'work_item', 'task', 'idea')),
+            entity_id INTEGER NOT NULL,
+            file_path TEXT NOT NULL,
+            document_type TEXT CHECK(document_type IN (
+                'idea', 'requirements', 'user_story', 'use_case',
+                'architecture_doc', 'design_doc', 'adr', 'technical_spec',
+                'implementation_plan', 'refactoring_guide', 'migration_guide', 'integration_guide',
+                'test_plan', 'test_report', 'coverage_report', 'validation_report',
+                'runbook', 'deployment_guide', 'monitoring_guide', 'incident_report',
+                'user_guide', 'admin_guide', 'api_doc', 'developer_guide', 'troubleshooting', 'faq',
+                'research_report', 'analysis_report', 'investigation_report', 'assessment_report',
+                'feasibility_study', 'competitive_analysis',
+                'session_summary', 'status_report', 'progress_report', 'milestone_report', 'retrospective_report',
+                'business_pillars', 'market_research', 'stakeholder_analysis', 'quality_gates_spec',
+                'specification', 'other'
+            )),
+            format TEXT CHECK(format IN ('markdown', 'html', 'pdf', 'text', 'json', 'yaml', 'other')),
+            title TEXT,
+            description TEXT,
+            created_by TEXT DEFAULT 'system',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            file_size_bytes INTEGER,
+            content_hash TEXT,
+            category TEXT,
+            document_type_dir TEXT,
+            segment_type TEXT,
+            component TEXT,
+            domain TEXT,
+            audience TEXT,
+            maturity TEXT,
+            priority TEXT,
+            tags TEXT,
+            phase TEXT,
+            work_item_id INTEGER,
+            content TEXT,
+            filename TEXT,
+            storage_mode TEXT DEFAULT 'hybrid',
+            content_updated_at DATETIME,
+            last_synced_at DATETIME,
+            sync_status TEXT DEFAULT 'synced', visibility TEXT DEFAULT 'private', lifecycle_stage TEXT DEFAULT 'draft', published_path TEXT, published_date TIMESTAMP, unpublished_date TIMESTAMP, review_status TEXT, reviewer_id TEXT, review_comment TEXT, auto_publish BOOLEAN DEFAULT 0, reviewer_assigned_at TIMESTAMP, review_completed_at TIMESTAMP, content_blob_key TEXT,
+            CHECK (entity_id > 0),
+            CHECK (file_path IS NOT NULL AND length(file_path) > 0)
+        );
+CREATE TABLE document_visibility_policies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT NOT NULL,
+            doc_type TEXT NOT NULL,
+            default_visibility TEXT NOT NULL DEFAULT 'private',
+            default_audience TEXT NOT NULL DEFAULT 'internal',
+            requires_review BOOLEAN NOT NULL DEFAULT 0,
+            auto_publish_on_approved BOOLEAN NOT NULL DEFAULT 0,
+            base_score INTEGER NOT NULL DEFAULT 50,
+            force_private BOOLEAN NOT NULL DEFAULT 0,
+            force_public BOOLEAN NOT NULL DEFAULT 0,
+            description TEXT,
+            rationale TEXT,
+            auto_publish_trigger TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(category, doc_type)
+        );
+CREATE TABLE document_audit_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            action TEXT NOT NULL,
+            actor TEXT NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            from_state TEXT,
+            to_state TEXT,
+            details TEXT,
+            comment TEXT,
+            FOREIGN KEY (document_id) REFERENCES document_references(id) ON DELETE CASCADE
+        );
+CREATE TABLE "provider_files" (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            installation_id INTEGER NOT NULL,
+            file_path TEXT NOT NULL,
+            file_type TEXT NOT NULL CHECK(file_type IN ('agent', 'hook', 'settings', 'rules', 'config', 'other')),
+            content_hash TEXT NOT NULL,
+            generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_verified_at TIMESTAMP,
+            modification_detected INTEGER DEFAULT 0 CHECK(modification_detected IN (0, 1)),
+
+            FOREIGN KEY (installation_id) REFERENCES provider_installations(id) ON DELETE CASCADE,
+            UNIQUE(installation_id, file_path)
+        );
+CREATE TABLE skills (
+            -- Primary key
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+            -- Identifiers
+            name TEXT NOT NULL,                          -- Kebab-case identifier (e.g., 'python-testing')
+            display_name TEXT NOT NULL,                  -- Human-readable name (e.g., 'Python Testing')
+            description TEXT NOT NULL,                   -- Brief description for discovery (~100 chars)
+            category TEXT,                               -- Grouping (testing, database, api, documentation)
+
+            -- Content sections (progressive loading: metadata → instructions → resources)
+            instructions TEXT NOT NULL,                  -- Level 2: Main instructions (markdown, ~5-20 KB)
+            resources TEXT,                              -- Level 3: JSON {examples: [], templates: [], docs: []}
+
+            -- Provider-specific configuration
+            provider_config TEXT,                        -- JSON {claude_code: {allowed_tools: []}, cursor: {}}
+
+            -- State
+            enabled BOOLEAN NOT NULL DEFAULT 1,          -- Enable/disable skill
+
+            -- Audit timestamps
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+
+            -- Constraints
+            CONSTRAINT unique_skill_name UNIQUE (name),
+            CONSTRAINT valid_category CHECK (category IN (
+                'testing', 'database', 'api', 'documentation',
+                'security', 'deployment', 'monitoring', 'project-management'
+            ))
+        );
+CREATE TABLE agent_skills (
+            -- Primary key
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+            -- Foreign keys
+            agent_id INTEGER NOT NULL,
+            skill_id INTEGER NOT NULL,
+
+            -- Priority for loading order (higher = load earlier)
+            priority INTEGER NOT NULL DEFAULT 50,        -- Range: 0-100
+
+            -- Audit
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+
+            -- Foreign key constraints
+            FOREIGN KEY (agent_id) REFERENCES agents(id) ON DELETE CASCADE,
+            FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE,
+
+            -- Constraints
+            CONSTRAINT unique_agent_skill UNIQUE (agent_id, skill_id),
+            CONSTRAINT valid_priority CHECK (priority BETWEEN 0 AND 100)
+        );
+CREATE TABLE document_content_chunks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_id INTEGER NOT NULL,
+            chunk_index INTEGER NOT NULL,
+            title TEXT NOT NULL DEFAULT '',              -- Document title (indexed with each chunk)
+            heading_path TEXT NOT NULL DEFAULT '',       -- e.g. 'Architecture > Storage'
+            content TEXT NOT NULL,                       -- Chunk text
+            start_offset INTEGER NOT NULL DEFAULT 0,     -- Character offset in document content
+            source_hash TEXT NOT NULL,                   -- Hash of title+content the chunk was built from
+
+            FOREIGN KEY (document_id) REFERENCES document_references(id) ON DELETE CASCADE,
+            CONSTRAINT unique_document_chunk UNIQUE (document_id, chunk_index)
+        );
+CREATE VIRTUAL TABLE document_chunks_fts USING fts5(
+            title,
+            heading_path,
+            content,
+            content='document_content_chunks',
+            content_rowid='id',
+            tokenize='porter unicode61 remove_diacritics 2'
+        );
+CREATE TABLE content_blobs (
+            blob_key TEXT PRIMARY KEY CHECK(length(blob_key) = 64),  -- SHA-256 of raw content
+            codec TEXT NOT NULL DEFAULT 'zlib' CHECK(codec IN ('none', 'zlib', 'lzma')),
+            payload BLOB NOT NULL,                                   -- Compressed content
+            raw_size INTEGER NOT NULL CHECK(raw_size >= 0),
+            stored_size INTEGER NOT NULL CHECK(stored_size >= 0),
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            stored_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+CREATE TABLE rendered_markdown (
+            content_hash TEXT NOT NULL CHECK(length(content_hash) = 64),  -- SHA-256 of markdown source
+            variant TEXT NOT NULL,                                        -- Render options
+            html TEXT NOT NULL,
+            rendered_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (content_hash, variant)
+        );
+CREATE TABLE table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+CREATE TABLE document_tags (
+            tag TEXT NOT NULL COLLATE NOCASE,
+            document_id INTEGER NOT NULL,
+            PRIMARY KEY (tag, document_id)
+        );
+CREATE TABLE idea_tags (
+            tag TEXT NOT NULL COLLATE NOCASE,
+            idea_id INTEGER NOT NULL,
+            PRIMARY KEY (tag, idea_id)
+        );
+CREATE TABLE session_decisions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id INTEGER NOT NULL,       -- sessions.id
+            project_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,         -- Order within the session
+            decision TEXT NOT NULL,
+            rationale TEXT,
+            decided_at TEXT,
+            entry TEXT,                        -- Original decision entry (JSON, NULL for plain text)
+
+            FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE,
+            UNIQUE (session_id, position)
+        );
+CREATE VIRTUAL TABLE session_decisions_fts USING fts5(
+                decision,
+                rationale,
+                content='session_decisions',
+                content_rowid='id',
+                tokenize='trigram'
+            );
+CREATE TABLE summary_archive (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_table TEXT NOT NULL CHECK(source_table IN ('work_item_summaries', 'summaries')),
+            source_id INTEGER NOT NULL,        -- id in source_table (listed in rollup source_ids)
+            row_data TEXT NOT NULL,            -- Original row (JSON object of all columns)
+            archived_at TEXT NOT NULL DEFAULT (datetime('now')),
+
+            UNIQUE (source_table, source_id)
+        );
+-- @section data
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (1, 'guides', 'user_guide', 'public', 'users', 1, 1, 70, 0, 1, 'User-facing guide - always public after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (2, 'guides', 'developer_guide', 'public', 'contributors', 1, 1, 70, 0, 1, 'Developer documentation - always public after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (3, 'guides', 'admin_guide', 'public', 'users', 1, 1, 65, 0, 0, 'Administrator guide - public after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (4, 'guides', 'troubleshooting', 'public', 'users', 1, 1, 65, 0, 0, 'Troubleshooting guide - public after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (5, 'guides', 'faq', 'public', 'public', 1, 1, 60, 0, 1, 'FAQ - always public after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (6, 'reference', 'api_doc', 'public', 'public', 1, 1, 80, 0, 1, 'API documentation - always public after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (7, 'reference', 'integration_guide', 'public', 'contributors', 1, 1, 70, 0, 1, 'Integration guide - always public after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (8, 'planning', 'requirements', 'private', 'internal', 0, 0, 30, 1, 0, 'Requirements document - always private', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (9, 'planning', 'idea', 'private', 'internal', 0, 0, 20, 1, 0, 'Initial ideas - always private', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (10, 'planning', 'user_story', 'private', 'team', 0, 0, 35, 1, 0, 'User stories - always private', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (11, 'planning', 'use_case', 'private', 'team', 0, 0, 35, 1, 0, 'Use cases - always private', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (12, 'architecture', 'adr', 'private', 'team', 1, 0, 50, 0, 0, 'Architecture Decision Record - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (13, 'architecture', 'architecture_doc', 'private', 'team', 1, 0, 55, 0, 0, 'Architecture documentation - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (14, 'architecture', 'design_doc', 'private', 'team', 1, 0, 50, 0, 0, 'Design document - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (15, 'architecture', 'technical_spec', 'private', 'team', 1, 0, 50, 0, 0, 'Technical specification - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (16, 'implementation', 'implementation_plan', 'private', 'team', 1, 0, 45, 0, 0, 'Implementation plan - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (17, 'implementation', 'refactoring_guide', 'private', 'team', 1, 0, 45, 0, 0, 'Refactoring guide - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (18, 'implementation', 'migration_guide', 'restricted', 'contributors', 1, 0, 55, 0, 0, 'Migration guide - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (19, 'testing', 'test_plan', 'private', 'team', 1, 0, 40, 0, 0, 'Test plan - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (20, 'testing', 'test_report', 'restricted', 'team', 1, 0, 50, 0, 0, 'Test report - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (21, 'testing', 'coverage_report', 'restricted', 'team', 0, 1, 55, 0, 0, 'Coverage report - usually restricted, auto-publish', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (22, 'operations', 'runbook', 'restricted', 'team', 1, 0, 60, 0, 0, 'Runbook - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (23, 'operations', 'deployment_guide', 'restricted', 'team', 1, 0, 60, 0, 0, 'Deployment guide - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (24, 'operations', 'monitoring_guide', 'restricted', 'team', 1, 0, 55, 0, 0, 'Monitoring guide - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (25, 'operations', 'incident_report', 'private', 'team', 1, 0, 45, 0, 0, 'Incident report - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (26, 'research', 'research_report', 'private', 'internal', 1, 0, 40, 0, 0, 'Research report - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (27, 'research', 'analysis_report', 'private', 'internal', 1, 0, 40, 0, 0, 'Analysis report - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (28, 'research', 'competitive_analysis', 'private', 'internal', 1, 0, 35, 1, 0, 'Competitive analysis - always private', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (29, 'research', 'market_research', 'private', 'internal', 1, 0, 35, 1, 0, 'Market research - always private', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (30, 'research', 'feasibility_study', 'private', 'internal', 1, 0, 40, 0, 0, 'Feasibility study - context-aware visibility', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (31, 'communication', 'session_summary', 'restricted', 'team', 0, 0, 45, 0, 0, 'Session summary - usually restricted', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (32, 'communication', 'status_report', 'restricted', 'team', 1, 0, 50, 0, 0, 'Status report - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (33, 'communication', 'progress_report', 'restricted', 'team', 1, 0, 50, 0, 0, 'Progress report - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (34, 'governance', 'quality_gates_spec', 'restricted', 'team', 1, 0, 65, 0, 0, 'Quality gates specification - usually restricted after review', NULL, NULL);
+INSERT INTO "document_visibility_policies" ("id", "category", "doc_type", "default_visibility", "default_audience", "requires_review", "auto_publish_on_approved", "base_score", "force_private", "force_public", "description", "rationale", "auto_publish_trigger") VALUES (35, 'governance', 'stakeholder_analysis', 'private', 'internal', 1, 0, 35, 1, 0, 'Stakeholder analysis - always private', NULL, NULL);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('projects', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('work_items', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('tasks', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('ideas', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('idea_elements', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('agents', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('agent_skills', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('agent_tools', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('agent_relationships', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('skills', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('rules', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('contexts', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('document_references', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('evidence_sources', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('sessions', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('session_events', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('summaries', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('work_item_summaries', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('task_dependencies', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('task_blockers', 0);
+INSERT INTO "table_versions" ("table_name", "version") VALUES ('work_item_dependencies', 0);
+DELETE FROM sqlite_sequence;
+INSERT INTO sqlite_sequence (name, seq) VALUES ('agents', 0);
+INSERT INTO sqlite_sequence (name, seq) VALUES ('contexts', 0);
+INSERT INTO sqlite_sequence (name, seq) VALUES ('document_references', 0);
+INSERT INTO sqlite_sequence (name, seq) VALUES ('document_visibility_policies', 35);
+INSERT INTO sqlite_sequence (name, seq) VALUES ('evidence_sources', 0);
+INSERT INTO sqlite_sequence (name, seq) VALUES ('session_events', 0);
+INSERT INTO sqlite_sequence (name, seq) VALUES ('tasks', 0);
+INSERT INTO sqlite_sequence (name, seq) VALUES ('work_items', 0);
+-- @section indexes
+CREATE INDEX idx_projects_status ON projects(status);
+CREATE INDEX idx_projects_name ON projects(name);
+CREATE INDEX idx_rules_project ON rules(project_id);
+CREATE INDEX idx_rules_enforcement ON rules(enforcement_level);
+CREATE INDEX idx_task_deps_task ON task_dependencies(task_id);
+CREATE INDEX idx_task_deps_depends ON task_dependencies(depends_on_task_id);
+CREATE INDEX idx_task_blockers_task ON task_blockers(task_id);
+CREATE INDEX idx_task_blockers_blocker ON task_blockers(blocker_task_id);
+CREATE INDEX idx_task_blockers_resolved ON task_blockers(is_resolved);
+CREATE INDEX idx_wi_deps_wi ON work_item_dependencies(work_item_id);
+CREATE INDEX idx_wi_deps_depends ON work_item_dependencies(depends_on_work_item_id);
+CREATE INDEX idx_wi_summaries_wi ON work_item_summaries(work_item_id, session_date DESC);
+CREATE INDEX idx_wi_summaries_date ON work_item_summaries(session_date DESC);
+CREATE INDEX idx_wi_summaries_type ON work_item_summaries(work_item_id, summary_type, session_date DESC);
+CREATE INDEX idx_agent_relationships_agent ON agent_relationships(agent_id);
+CREATE INDEX idx_agent_relationships_related ON agent_relationships(related_agent_id);
+CREATE INDEX idx_agent_tools_agent ON agent_tools(agent_id);
+CREATE INDEX idx_agent_tools_phase ON agent_tools(phase, priority);
+CREATE INDEX idx_contexts_project ON contexts(project_id);
+CREATE INDEX idx_contexts_type ON contexts(context_type);
+CREATE INDEX idx_agents_project ON agents(project_id);
+CREATE INDEX idx_agents_role ON agents(project_id, role);
+CREATE INDEX idx_agents_active ON agents(is_active);
+CREATE INDEX idx_agents_type ON agents(agent_type);
+CREATE INDEX idx_session_events_session
+        ON session_events(session_id, timestamp DESC)
+    ;
+CREATE INDEX idx_session_events_type
+        ON session_events(event_type, timestamp DESC)
+    ;
+CREATE INDEX idx_session_events_category
+        ON session_events(event_category, timestamp DESC)
+    ;
+CREATE INDEX idx_session_events_entity
+        ON session_events(work_item_id, task_id, timestamp DESC)
+    ;
+CREATE INDEX idx_work_items_status ON work_items(status);
+CREATE INDEX idx_work_items_type ON work_items(type);
+CREATE INDEX idx_work_items_project_id ON work_items(project_id);
+CREATE INDEX idx_work_items_phase ON work_items(phase);
+CREATE INDEX idx_work_items_phase_status ON work_items(phase, status);
+CREATE INDEX idx_tasks_status ON tasks(status);
+CREATE INDEX idx_tasks_blocked ON tasks(status) WHERE status = 'blocked';
+CREATE INDEX idx_tasks_work_item_id ON tasks(work_item_id);
+CREATE INDEX idx_tasks_phase ON tasks(phase);
+CREATE INDEX idx_tasks_phase_status ON tasks(phase, status);
+CREATE INDEX idx_summaries_entity 
+        ON summaries(entity_type, entity_id, created_at DESC)
+    ;
+CREATE INDEX idx_summaries_recent 
+        ON summaries(created_at DESC)
+    ;
+CREATE INDEX idx_summaries_session 
+        ON summaries(session_id, created_at DESC)
+    ;
+CREATE INDEX idx_summaries_type 
+        ON summaries(entity_type, summary_type, created_at DESC)
+    ;
+CREATE INDEX idx_summaries_text 
+        ON summaries(summary_text)
+    ;
+CREATE INDEX idx_provider_installations_project
+        ON provider_installations(project_id)
+    ;
+CREATE INDEX idx_provider_installations_type
+        ON provider_installations(provider_type)
+    ;
+CREATE INDEX idx_cursor_memories_project
+        ON cursor_memories(project_id)
+    ;
+CREATE INDEX idx_cursor_memories_category
+        ON cursor_memories(category)
+    ;
+CREATE INDEX idx_cursor_memories_source_learning
+        ON cursor_memories(source_learning_id)
+    ;
+CREATE INDEX idx_cursor_memories_sync
+        ON cursor_memories(last_synced_at)
+    ;
+CREATE INDEX idx_memory_files_project
+        ON memory_files(project_id)
+    ;
+CREATE INDEX idx_memory_files_type
+        ON memory_files(file_type)
+    ;
+CREATE INDEX idx_memory_files_validation
+        ON memory_files(validation_status)
+    ;
+CREATE INDEX idx_memory_files_generated
+        ON memory_files(generated_at)
+    ;
+CREATE INDEX idx_memory_files_expires
+        ON memory_files(expires_at)
+    ;
+CREATE INDEX idx_checkpoints_session
+        ON session_checkpoints(session_id, created_at DESC)
+    ;
+CREATE INDEX idx_checkpoints_name
+        ON session_checkpoints(session_id, checkpoint_name)
+    ;
+CREATE INDEX idx_checkpoints_created
+        ON session_checkpoints(created_at DESC)
+    ;
+CREATE INDEX idx_search_metrics_timestamp 
+        ON search_metrics(timestamp)
+    ;
+CREATE INDEX idx_search_metrics_project_id 
+        ON search_metrics(project_id)
+    ;
+CREATE INDEX idx_search_cache_expires_at 
+        ON search_cache(expires_at)
+    ;
+CREATE INDEX idx_search_cache_query_hash 
+        ON search_cache(query_hash)
+    ;
+CREATE INDEX idx_idea_elements_idea_id ON idea_elements(idea_id)
+    ;
+CREATE INDEX idx_idea_elements_idea_order ON idea_elements(idea_id, order_index)
+    ;
+CREATE INDEX idx_doc_visibility
+                ON document_references(visibility)
+            ;
+CREATE INDEX idx_doc_lifecycle
+                ON document_references(lifecycle_stage)
+            ;
+CREATE INDEX idx_doc_review_status
+                ON document_references(review_status)
+            ;
+CREATE INDEX idx_audit_log_document
+                ON document_audit_log(document_id)
+            ;
+CREATE INDEX idx_audit_log_timestamp
+                ON document_audit_log(timestamp DESC)
+            ;
+CREATE INDEX idx_audit_log_action
+                ON document_audit_log(action)
+            ;
+CREATE INDEX idx_visibility_policy_lookup
+                ON document_visibility_policies(category, doc_type)
+            ;
+CREATE INDEX idx_agents_functional_category
+            ON agents(functional_category)
+        ;
+CREATE INDEX idx_provider_installations_status
+                    ON provider_installations(status)
+                ;
+CREATE INDEX idx_provider_files_installation
+                ON provider_files(installation_id)
+            ;
+CREATE INDEX idx_provider_files_hash
+                ON provider_files(content_hash)
+            ;
+CREATE INDEX idx_provider_files_type
+                ON provider_files(file_type)
+            ;
+CREATE INDEX idx_skills_category
+        ON skills(category)
+        WHERE category IS NOT NULL
+    ;
+CREATE INDEX idx_skills_enabled
+        ON skills(enabled)
+        WHERE enabled = 1
+    ;
+CREATE INDEX idx_skills_name_lookup
+        ON skills(name)
+    ;
+CREATE INDEX idx_agent_skills_agent
+        ON agent_skills(agent_id)
+    ;
+CREATE INDEX idx_agent_skills_skill
+        ON agent_skills(skill_id)
+    ;
+CREATE INDEX idx_agent_skills_priority
+        ON agent_skills(agent_id, priority DESC)
+    ;
+CREATE INDEX idx_document_chunks_document
+        ON document_content_chunks(document_id)
+    ;
+CREATE INDEX idx_rendered_markdown_rendered_at
+        ON rendered_markdown(rendered_at)
+    ;
+CREATE INDEX idx_tasks_work_item_status_priority ON tasks(work_item_id, status, priority, created_at DESC);
+CREATE INDEX idx_tasks_work_item_priority ON tasks(work_item_id, priority, created_at DESC);
+CREATE INDEX idx_work_items_project_status_priority ON work_items(project_id, status, priority, created_at DESC);
+CREATE INDEX idx_document_references_entity ON document_references(entity_type, entity_id, created_at DESC);
+CREATE INDEX idx_document_references_file_path ON document_references(file_path);
+CREATE INDEX idx_contexts_entity_type ON contexts(entity_type, entity_id, context_type);
+CREATE INDEX idx_session_events_session_category ON session_events(session_id, event_category, timestamp DESC);
+CREATE INDEX idx_ideas_project_status ON ideas(project_id, status, created_at DESC);
+CREATE INDEX idx_document_tags_document_id ON document_tags(document_id);
+CREATE INDEX idx_idea_tags_idea_id ON idea_tags(idea_id);
+CREATE INDEX idx_checkpoints_parent
+        ON session_checkpoints(parent_checkpoint_id)
+    ;
+CREATE INDEX idx_wi_summaries_level ON work_item_summaries(work_item_id, summary_level, session_date DESC);
+CREATE INDEX idx_summaries_level ON summaries(entity_type, entity_id, summary_level, session_date DESC);
+CREATE INDEX idx_session_decisions_project
+        ON session_decisions(project_id, decided_at DESC)
+    ;
+CREATE INDEX idx_sessions_project_start
+        ON sessions(project_id, start_time)
+    ;
+-- @section triggers
+CREATE TRIGGER update_project_timestamp
+        AFTER UPDATE ON projects
+        BEGIN
+            UPDATE projects
+            SET updated_at = CURRENT_TIMESTAMP
+            WHERE id = NEW.id;
+        END;
+CREATE TRIGGER agents_updated_at
+        AFTER UPDATE ON agents
+        FOR EACH ROW
+        BEGIN
+            UPDATE agents SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+        END;
+CREATE TRIGGER trigger_tasks_started_at
+        AFTER UPDATE OF status ON tasks
+        WHEN NEW.status = 'active' AND OLD.status != 'active' AND NEW.started_at IS NULL
+        BEGIN
+            UPDATE tasks SET started_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+        END;
+CREATE TRIGGER trigger_tasks_completed_at
+        AFTER UPDATE OF status ON tasks
+        WHEN NEW.status = 'done' AND OLD.status != 'done' AND NEW.completed_at IS NULL
+        BEGIN
+            UPDATE tasks SET completed_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+        END;
+CREATE TRIGGER trigger_tasks_unblocked
+        AFTER UPDATE OF status ON tasks
+        WHEN OLD.status = 'blocked' AND NEW.status != 'blocked'
+        BEGIN
+            UPDATE tasks SET blocked_reason = NULL WHERE id = NEW.id;
+        END;
+CREATE TRIGGER trigger_sync_task_phase_from_work_item
+        AFTER UPDATE OF phase ON work_items
+        BEGIN
+            UPDATE tasks
+            SET phase = NEW.phase
+            WHERE work_item_id = NEW.id;
+        END;
+CREATE TRIGGER update_checkpoints_timestamp
+        AFTER UPDATE ON session_checkpoints
+        BEGIN
+            UPDATE session_checkpoints
+            SET updated_at = CURRENT_TIMESTAMP
+            WHERE id = NEW.id;
+        END;
+CREATE TRIGGER work_items_search_insert AFTER INSERT ON work_items BEGIN
+            INSERT INTO search_index(entity_id, entity_type, title, content, tags, metadata)
+            VALUES (
+                NEW.id, 
+                'work_item', 
+                NEW.name, 
+                COALESCE(NEW.description, '') || ' ' || COALESCE(NEW.business_context, ''),
+                '',
+                json_object('status', NEW.status, 'type', NEW.type, 'priority', COALESCE(NEW.priority, ''))
+            );
+        END;
+CREATE TRIGGER work_items_search_update AFTER UPDATE ON work_items BEGIN
+            UPDATE search_index 
+            SET 
+                title = NEW.name,
+                content = COALESCE(NEW.description, '') || ' ' || COALESCE(NEW.business_context, ''),
+                tags = '',
+                metadata = json_object('status', NEW.status, 'type', NEW.type, 'priority', COALESCE(NEW.priority, ''))
+            WHERE entity_id = NEW.id AND entity_type = 'work_item';
+        END;
+CREATE TRIGGER work_items_search_delete AFTER DELETE ON work_items BEGIN
+            DELETE FROM search_index WHERE entity_id = OLD.id AND entity_type = 'work_item';
+        END;
+CREATE TRIGGER tasks_search_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO search_index(entity_id, entity_type, title, content, tags, metadata)
+            VALUES (
+                NEW.id, 
+                'task', 
+                NEW.name, 
+                COALESCE(NEW.description, ''),
+                '',
+                json_object('status', NEW.status, 'type', NEW.type, 'work_item_id', NEW.work_item_id)
+            );
+        END;
+CREATE TRIGGER tasks_search_update AFTER UPDATE ON tasks BEGIN
+            UPDATE search_index 
+            SET 
+                title = NEW.name,
+                content = COALESCE(NEW.description, ''),
+                tags = '',
+                metadata = json_object('status', NEW.status, 'type', NEW.type, 'work_item_id', NEW.work_item_id)
+            WHERE entity_id = NEW.id AND entity_type = 'task';
+        END;
+CREATE TRIGGER tasks_search_delete AFTER DELETE ON tasks BEGIN
+            DELETE FROM search_index WHERE entity_id = OLD.id AND entity_type = 'task';
+        END;
+CREATE TRIGGER ideas_search_insert AFTER INSERT ON ideas BEGIN
+            INSERT INTO search_index(entity_id, entity_type, title, content, tags, metadata)
+            VALUES (
+                NEW.id, 
+                'idea', 
+                NEW.title, 
+                COALESCE(NEW.description, ''),
+                COALESCE(NEW.tags, ''),
+                json_object('status', NEW.status, 'source', COALESCE(NEW.source, ''))
+            );
+        END;
+CREATE TRIGGER ideas_search_update AFTER UPDATE ON ideas BEGIN
+            UPDATE search_index 
+            SET 
+                title = NEW.title,
+                content = COALESCE(NEW.description, ''),
+                tags = COALESCE(NEW.tags, ''),
+                metadata = json_object('status', NEW.status, 'source', COALESCE(NEW.source, ''))
+            WHERE entity_id = NEW.id AND entity_type = 'idea';
+        END;
+CREATE TRIGGER ideas_search_delete AFTER DELETE ON ideas BEGIN
+            DELETE FROM search_index WHERE entity_id = OLD.id AND entity_type = 'idea';
+        END;
+CREATE TRIGGER evidence_fts_insert AFTER INSERT ON evidence_sources
+        BEGIN
+            INSERT INTO evidence_fts(
+                evidence_id,
+                entity_type,
+                entity_id,
+                source_type,
+                url,
+                excerpt
+            )
+            VALUES (
+                NEW.id,
+                NEW.entity_type,
+                NEW.entity_id,
+                COALESCE(NEW.source_type, ''),
+                COALESCE(NEW.url, ''),
+                COALESCE(NEW.excerpt, '')
+            );
+        END;
+CREATE TRIGGER evidence_fts_update AFTER UPDATE ON evidence_sources
+        BEGIN
+            UPDATE evidence_fts
+            SET
+                entity_type = NEW.entity_type,
+                entity_id = NEW.entity_id,
+                source_type = COALESCE(NEW.source_type, ''),
+                url = COALESCE(NEW.url, ''),
+                excerpt = COALESCE(NEW.excerpt, '')
+            WHERE evidence_id = NEW.id;
+        END;
+CREATE TRIGGER evidence_fts_delete AFTER DELETE ON evidence_sources
+        BEGIN
+            DELETE FROM evidence_fts WHERE evidence_id = OLD.id;
+        END;
+CREATE TRIGGER sessions_fts_insert AFTER INSERT ON sessions
+        BEGIN
+            INSERT INTO sessions_fts(
+                session_id,
+                project_id,
+                session_type,
+                developer_name,
+                tool_name,
+                llm_model,
+                exit_reason,
+                metadata_text
+            )
+            VALUES (
+                NEW.id,
+                NEW.project_id,
+                COALESCE(NEW.session_type, ''),
+                COALESCE(NEW.developer_name, ''),
+                COALESCE(NEW.tool_name, ''),
+                COALESCE(NEW.llm_model, ''),
+                COALESCE(NEW.exit_reason, ''),
+                COALESCE(NEW.metadata, '{}')
+            );
+        END;
+CREATE TRIGGER sessions_fts_update AFTER UPDATE ON sessions
+        BEGIN
+            UPDATE sessions_fts
+            SET
+                project_id = NEW.project_id,
+                session_type = COALESCE(NEW.session_type, ''),
+                developer_name = COALESCE(NEW.developer_name, ''),
+                tool_name = COALESCE(NEW.tool_name, ''),
+                llm_model = COALESCE(NEW.llm_model, ''),
+                exit_reason = COALESCE(NEW.exit_reason, ''),
+                metadata_text = COALESCE(NEW.metadata, '{}')
+            WHERE session_id = NEW.id;
+        END;
+CREATE TRIGGER sessions_fts_delete AFTER DELETE ON sessions
+        BEGIN
+            DELETE FROM sessions_fts WHERE session_id = OLD.id;
+        END;
+CREATE TRIGGER idea_elements_updated_at
+        AFTER UPDATE ON idea_elements
+        BEGIN
+            UPDATE idea_elements 
+            SET updated_at = CURRENT_TIMESTAMP 
+            WHERE id = NEW.id;
+        END;
+CREATE TRIGGER update_skills_timestamp
+        AFTER UPDATE ON skills
+        BEGIN
+            UPDATE skills
+            SET updated_at = datetime('now')
+            WHERE id = NEW.id;
+        END;
+CREATE TRIGGER document_chunks_ai
+        AFTER INSERT ON document_content_chunks
+        BEGIN
+            INSERT INTO document_chunks_fts(rowid, title, heading_path, content)
+            VALUES (NEW.id, NEW.title, NEW.heading_path, NEW.content);
+        END;
+CREATE TRIGGER document_chunks_ad
+        AFTER DELETE ON document_content_chunks
+        BEGIN
+            INSERT INTO document_chunks_fts(document_chunks_fts, rowid, title, heading_path, content)
+            VALUES ('delete', OLD.id, OLD.title, OLD.heading_path, OLD.content);
+        END;
+CREATE TRIGGER document_chunks_au
+        AFTER UPDATE ON document_content_chunks
+        BEGIN
+            INSERT INTO document_chunks_fts(document_chunks_fts, rowid, title, heading_path, content)
+            VALUES ('delete', OLD.id, OLD.title, OLD.heading_path, OLD.content);
+            INSERT INTO document_chunks_fts(rowid, title, heading_path, content)
+            VALUES (NEW.id, NEW.title, NEW.heading_path, NEW.content);
+        END;
+CREATE TRIGGER content_blobs_release
+        AFTER UPDATE OF ref_count ON content_blobs
+        WHEN NEW.ref_count <= 0
+        BEGIN
+            DELETE FROM content_blobs WHERE blob_key = NEW.blob_key;
+        END;
+CREATE TRIGGER document_blob_ref_ai
+        AFTER INSERT ON document_references
+        WHEN NEW.content_blob_key IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.content_blob_key;
+        END;
+CREATE TRIGGER document_blob_ref_au
+        AFTER UPDATE OF content_blob_key ON document_references
+        WHEN OLD.content_blob_key IS NOT NEW.content_blob_key
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.content_blob_key;
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.content_blob_key;
+        END;
+CREATE TRIGGER document_blob_ref_ad
+        AFTER DELETE ON document_references
+        WHEN OLD.content_blob_key IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.content_blob_key;
+        END;
+CREATE TRIGGER memory_blob_ref_ai
+        AFTER INSERT ON memory_files
+        WHEN NEW.content_blob_key IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.content_blob_key;
+        END;
+CREATE TRIGGER memory_blob_ref_au
+        AFTER UPDATE OF content_blob_key ON memory_files
+        WHEN OLD.content_blob_key IS NOT NEW.content_blob_key
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.content_blob_key;
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.content_blob_key;
+        END;
+CREATE TRIGGER memory_blob_ref_ad
+        AFTER DELETE ON memory_files
+        WHEN OLD.content_blob_key IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.content_blob_key;
+        END;
+CREATE TRIGGER checkpoint_blob_ref_ai
+        AFTER INSERT ON session_checkpoints
+        WHEN NEW.snapshot_blob_key IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.snapshot_blob_key;
+        END;
+CREATE TRIGGER checkpoint_blob_ref_au
+        AFTER UPDATE OF snapshot_blob_key ON session_checkpoints
+        WHEN OLD.snapshot_blob_key IS NOT NEW.snapshot_blob_key
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count + 1 WHERE blob_key = NEW.snapshot_blob_key;
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.snapshot_blob_key;
+        END;
+CREATE TRIGGER checkpoint_blob_ref_ad
+        AFTER DELETE ON session_checkpoints
+        WHEN OLD.snapshot_blob_key IS NOT NULL
+        BEGIN
+            UPDATE content_blobs SET ref_count = ref_count - 1 WHERE blob_key = OLD.snapshot_blob_key;
+        END;
+CREATE TRIGGER projects_version_insert
+                AFTER INSERT ON projects
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'projects';
+                END;
+CREATE TRIGGER projects_version_update
+                AFTER UPDATE ON projects
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'projects';
+                END;
+CREATE TRIGGER projects_version_delete
+                AFTER DELETE ON projects
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'projects';
+                END;
+CREATE TRIGGER work_items_version_insert
+                AFTER INSERT ON work_items
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_items';
+                END;
+CREATE TRIGGER work_items_version_update
+                AFTER UPDATE ON work_items
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_items';
+                END;
+CREATE TRIGGER work_items_version_delete
+                AFTER DELETE ON work_items
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_items';
+                END;
+CREATE TRIGGER tasks_version_insert
+                AFTER INSERT ON tasks
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'tasks';
+                END;
+CREATE TRIGGER tasks_version_update
+                AFTER UPDATE ON tasks
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'tasks';
+                END;
+CREATE TRIGGER tasks_version_delete
+                AFTER DELETE ON tasks
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'tasks';
+                END;
+CREATE TRIGGER ideas_version_insert
+                AFTER INSERT ON ideas
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'ideas';
+                END;
+CREATE TRIGGER ideas_version_update
+                AFTER UPDATE ON ideas
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'ideas';
+                END;
+CREATE TRIGGER ideas_version_delete
+                AFTER DELETE ON ideas
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'ideas';
+                END;
+CREATE TRIGGER idea_elements_version_insert
+                AFTER INSERT ON idea_elements
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'idea_elements';
+                END;
+CREATE TRIGGER idea_elements_version_update
+                AFTER UPDATE ON idea_elements
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'idea_elements';
+                END;
+CREATE TRIGGER idea_elements_version_delete
+                AFTER DELETE ON idea_elements
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'idea_elements';
+                END;
+CREATE TRIGGER agents_version_insert
+                AFTER INSERT ON agents
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agents';
+                END;
+CREATE TRIGGER agents_version_update
+                AFTER UPDATE ON agents
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agents';
+                END;
+CREATE TRIGGER agents_version_delete
+                AFTER DELETE ON agents
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agents';
+                END;
+CREATE TRIGGER agent_skills_version_insert
+                AFTER INSERT ON agent_skills
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_skills';
+                END;
+CREATE TRIGGER agent_skills_version_update
+                AFTER UPDATE ON agent_skills
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_skills';
+                END;
+CREATE TRIGGER agent_skills_version_delete
+                AFTER DELETE ON agent_skills
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_skills';
+                END;
+CREATE TRIGGER agent_tools_version_insert
+                AFTER INSERT ON agent_tools
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_tools';
+                END;
+CREATE TRIGGER agent_tools_version_update
+                AFTER UPDATE ON agent_tools
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_tools';
+                END;
+CREATE TRIGGER agent_tools_version_delete
+                AFTER DELETE ON agent_tools
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_tools';
+                END;
+CREATE TRIGGER agent_relationships_version_insert
+                AFTER INSERT ON agent_relationships
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_relationships';
+                END;
+CREATE TRIGGER agent_relationships_version_update
+                AFTER UPDATE ON agent_relationships
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_relationships';
+                END;
+CREATE TRIGGER agent_relationships_version_delete
+                AFTER DELETE ON agent_relationships
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'agent_relationships';
+                END;
+CREATE TRIGGER skills_version_insert
+                AFTER INSERT ON skills
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'skills';
+                END;
+CREATE TRIGGER skills_version_update
+                AFTER UPDATE ON skills
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'skills';
+                END;
+CREATE TRIGGER skills_version_delete
+                AFTER DELETE ON skills
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'skills';
+                END;
+CREATE TRIGGER rules_version_insert
+                AFTER INSERT ON rules
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'rules';
+                END;
+CREATE TRIGGER rules_version_update
+                AFTER UPDATE ON rules
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'rules';
+                END;
+CREATE TRIGGER rules_version_delete
+                AFTER DELETE ON rules
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'rules';
+                END;
+CREATE TRIGGER contexts_version_insert
+                AFTER INSERT ON contexts
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'contexts';
+                END;
+CREATE TRIGGER contexts_version_update
+                AFTER UPDATE ON contexts
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'contexts';
+                END;
+CREATE TRIGGER contexts_version_delete
+                AFTER DELETE ON contexts
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'contexts';
+                END;
+CREATE TRIGGER document_references_version_insert
+                AFTER INSERT ON document_references
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'document_references';
+                END;
+CREATE TRIGGER document_references_version_update
+                AFTER UPDATE ON document_references
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'document_references';
+                END;
+CREATE TRIGGER document_references_version_delete
+                AFTER DELETE ON document_references
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'document_references';
+                END;
+CREATE TRIGGER evidence_sources_version_insert
+                AFTER INSERT ON evidence_sources
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'evidence_sources';
+                END;
+CREATE TRIGGER evidence_sources_version_update
+                AFTER UPDATE ON evidence_sources
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'evidence_sources';
+                END;
+CREATE TRIGGER evidence_sources_version_delete
+                AFTER DELETE ON evidence_sources
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'evidence_sources';
+                END;
+CREATE TRIGGER sessions_version_insert
+                AFTER INSERT ON sessions
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'sessions';
+                END;
+CREATE TRIGGER sessions_version_update
+                AFTER UPDATE ON sessions
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'sessions';
+                END;
+CREATE TRIGGER sessions_version_delete
+                AFTER DELETE ON sessions
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'sessions';
+                END;
+CREATE TRIGGER session_events_version_insert
+                AFTER INSERT ON session_events
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'session_events';
+                END;
+CREATE TRIGGER session_events_version_update
+                AFTER UPDATE ON session_events
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'session_events';
+                END;
+CREATE TRIGGER session_events_version_delete
+                AFTER DELETE ON session_events
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'session_events';
+                END;
+CREATE TRIGGER summaries_version_insert
+                AFTER INSERT ON summaries
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'summaries';
+                END;
+CREATE TRIGGER summaries_version_update
+                AFTER UPDATE ON summaries
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'summaries';
+                END;
+CREATE TRIGGER summaries_version_delete
+                AFTER DELETE ON summaries
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'summaries';
+                END;
+CREATE TRIGGER work_item_summaries_version_insert
+                AFTER INSERT ON work_item_summaries
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_item_summaries';
+                END;
+CREATE TRIGGER work_item_summaries_version_update
+                AFTER UPDATE ON work_item_summaries
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_item_summaries';
+                END;
+CREATE TRIGGER work_item_summaries_version_delete
+                AFTER DELETE ON work_item_summaries
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_item_summaries';
+                END;
+CREATE TRIGGER task_dependencies_version_insert
+                AFTER INSERT ON task_dependencies
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'task_dependencies';
+                END;
+CREATE TRIGGER task_dependencies_version_update
+                AFTER UPDATE ON task_dependencies
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'task_dependencies';
+                END;
+CREATE TRIGGER task_dependencies_version_delete
+                AFTER DELETE ON task_dependencies
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'task_dependencies';
+                END;
+CREATE TRIGGER task_blockers_version_insert
+                AFTER INSERT ON task_blockers
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'task_blockers';
+                END;
+CREATE TRIGGER task_blockers_version_update
+                AFTER UPDATE ON task_blockers
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'task_blockers';
+                END;
+CREATE TRIGGER task_blockers_version_delete
+                AFTER DELETE ON task_blockers
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'task_blockers';
+                END;
+CREATE TRIGGER work_item_dependencies_version_insert
+                AFTER INSERT ON work_item_dependencies
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_item_dependencies';
+                END;
+CREATE TRIGGER work_item_dependencies_version_update
+                AFTER UPDATE ON work_item_dependencies
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_item_dependencies';
+                END;
+CREATE TRIGGER work_item_dependencies_version_delete
+                AFTER DELETE ON work_item_dependencies
+                BEGIN
+                    UPDATE table_versions
+                    SET version = version + 1, changed_at = CURRENT_TIMESTAMP
+                    WHERE table_name = 'work_item_dependencies';
+                END;
+CREATE TRIGGER document_references_tags_insert
+        AFTER INSERT ON document_references
+        BEGIN
+            
+        INSERT OR IGNORE INTO document_tags (tag, document_id)
+        SELECT value, NEW.id FROM json_each(
+            CASE WHEN json_valid(NEW.tags) AND json_type(NEW.tags) = 'array' THEN NEW.tags ELSE '[]' END
+        )
+        WHERE type = 'text';
+    
+        END;
+CREATE TRIGGER document_references_tags_update
+        AFTER UPDATE OF tags ON document_references
+        BEGIN
+            DELETE FROM document_tags WHERE document_id = OLD.id;
+            
+        INSERT OR IGNORE INTO document_tags (tag, document_id)
+        SELECT value, NEW.id FROM json_each(
+            CASE WHEN json_valid(NEW.tags) AND json_type(NEW.tags) = 'array' THEN NEW.tags ELSE '[]' END
+        )
+        WHERE type = 'text';
+    
+        END;
+CREATE TRIGGER document_references_tags_delete
+        AFTER DELETE ON document_references
+        BEGIN
+            DELETE FROM document_tags WHERE document_id = OLD.id;
+        END;
+CREATE TRIGGER ideas_tags_insert
+        AFTER INSERT ON ideas
+        BEGIN
+            
+        INSERT OR IGNORE INTO idea_tags (tag, idea_id)
+        SELECT value, NEW.id FROM json_each(
+            CASE WHEN json_valid(NEW.tags) AND json_type(NEW.tags) = 'array' THEN NEW.tags ELSE '[]' END
+        )
+        WHERE type = 'text';
+    
+        END;
+CREATE TRIGGER ideas_tags_update
+        AFTER UPDATE OF tags ON ideas
+        BEGIN
+            DELETE FROM idea_tags WHERE idea_id = OLD.id;
+            
+        INSERT OR IGNORE INTO idea_tags (tag, idea_id)
+        SELECT value, NEW.id FROM json_each(
+            CASE WHEN json_valid(NEW.tags) AND json_type(NEW.tags) = 'array' THEN NEW.tags ELSE '[]' END
+        )
+        WHERE type = 'text';
+    
+        END;
+CREATE TRIGGER ideas_tags_delete
+        AFTER DELETE ON ideas
+        BEGIN
+            DELETE FROM idea_tags WHERE idea_id = OLD.id;
+        END;
+CREATE TRIGGER session_decisions_fts_insert AFTER INSERT ON session_decisions
+        BEGIN
+            INSERT INTO session_decisions_fts(rowid, decision, rationale)
+            VALUES (NEW.id, NEW.decision, COALESCE(NEW.rationale, ''));
+        END;
+CREATE TRIGGER session_decisions_fts_delete AFTER DELETE ON session_decisions
+        BEGIN
+            INSERT INTO session_decisions_fts(session_decisions_fts, rowid, decision, rationale)
+            VALUES ('delete', OLD.id, OLD.decision, COALESCE(OLD.rationale, ''));
+        END;
+CREATE TRIGGER session_decisions_fts_update AFTER UPDATE ON session_decisions
+        BEGIN
+            INSERT INTO session_decisions_fts(session_decisions_fts, rowid, decision, rationale)
+            VALUES ('delete', OLD.id, OLD.decision, COALESCE(OLD.rationale, ''));
+            INSERT INTO session_decisions_fts(rowid, decision, rationale)
+            VALUES (NEW.id, NEW.decision, COALESCE(NEW.rationale, ''));
+        END;
+-- @section views
+-- @section migrations
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (1, '0018_consolidated', 'Consolidated schema migration (enum-driven)', NULL, NULL, 'migration_system');
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (2, '0018', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (3, '0019_expand_context_types', 'Expand contexts table to support rich types and ideas', NULL, NULL, 'migration_system');
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (4, '0019', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (5, '0020', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (6, '0021', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (7, '0022', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (8, '0023', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (9, '0024', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (10, '0025', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (11, '0026', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (13, '0029', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (14, '0031', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (15, '0032', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (16, '0036', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (17, '0037', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (18, '0038', 'Add session_checkpoints table for state preservation', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (19, '0039', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (21, '0040', 'Implement FTS5 full-text search system with virtual tables, triggers, and caching', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (23, '0041', 'Add FTS5 full-text search indexes for evidence_sources and sessions tables', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (25, '0042', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (26, '0043', 'Fix document_type constraint to include new types and remove deprecated ones', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (27, '0044', 'Add document visibility, lifecycle, and audit trail system', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (28, '0045', 'Add reviewer_assigned_at and review_completed_at columns to document_references', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (29, '0046', 'Add functional_category column to agents table', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (30, '0047', 'Add provider_installations and provider_files tables for multi-provider tracking', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (31, '0048', 'Context consolidation - unify context storage into Context model', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (32, '0049', 'Align provider_files schema for multi-provider support', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (33, '0050', 'No description', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (34, '0051', 'Create chunked FTS5 index for document content with BM25 ranking', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (35, '0052', 'Create content-addressed compressed blob store for document, memory and checkpoint content', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (36, '0053', 'Add source table watermarks to memory files for incremental regeneration', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (37, '0054', 'Add persistent rendered markdown cache keyed by content hash and variant', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (38, '0055', 'Add per-table change versions maintained by triggers for conditional GETs', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (39, '0056', 'Add composite indexes for hot list queries and indexable tag join tables', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (40, '0057', 'Store session checkpoints as periodic full snapshots plus deltas', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (41, '0058', 'Add summary levels and source lineage for hierarchical summary rollups', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (42, '0059', 'Store session decisions in an indexed child table with an FTS5 mirror', NULL, NULL, NULL);
+INSERT INTO "schema_migrations" ("id", "version", "description", "rollback_at", "rollback_reason", "applied_by") VALUES (43, '0060', 'Archive raw summaries folded into rollups instead of deleting them', NULL, NULL, NULL);
+
+COMMIT;
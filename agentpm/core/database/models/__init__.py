@@ -7,77 +7,38 @@ These models represent business entities with type safety and validation,
 separate from database persistence concerns (handled by adapters).
 """
 
-from .project import Project
-from .work_item import WorkItem
-from .task import Task
-from .idea import Idea
-from .idea_element import IdeaElement
-from .agent import Agent
-from .rule import Rule
-from .context import Context, UnifiedSixW
-from .dependencies import TaskDependency, TaskBlocker, WorkItemDependency
-from .work_item_summary import WorkItemSummary
-from .summary import Summary
-from .evidence_source import EvidenceSource
-from .event import Event
-from .document_reference import DocumentReference
-from .document_audit_log import DocumentAuditLog
-from .search_index import SearchIndex
-from .search_metrics import SearchMetrics
-from .provider import (
-    ProviderInstallation,
-    CursorConfig,
-    CursorMemory,
-    CustomMode,
-    ProviderType,
-    InstallationStatus,
-    MemorySyncDirection,
-    SafetyLevel,
-    AllowlistEntry,
-    Guardrails,
-    RuleTemplate,
-    InstallResult,
-    VerifyResult,
-    MemorySyncResult,
-    UpdateResult,
-)
-from .detection_analysis import (
-    FileAnalysis,
-    ProjectAnalysis,
-    ComplexityReport,
-    MaintainabilityReport,
-)
-from .detection_graph import (
-    DependencyNode,
-    CircularDependency,
-    CouplingMetrics,
-    DependencyGraphAnalysis,
-)
-from .detection_sbom import (
-    LicenseInfo,
-    SBOMComponent,
-    SBOM,
-)
-from .detection_pattern import (
-    PatternMatch,
-    PatternAnalysis,
-)
-from .detection_fitness import (
-    Policy,
-    PolicyViolation,
-    FitnessResult,
-)
-from .detection_preset import (
-    DetectionPreset,
-)
-from .detection_runtime import (
-    RuntimeOverlay,
-)
-from .skill import (
-    Skill,
-    AgentSkill,
-    SkillCategory,
-)
+from agentpm.utils.lazy import lazy_exports
+
+# Imported on first access, so using one name does not load every submodule
+_EXPORTS = {
+    '.project': ['Project'],
+    '.work_item': ['WorkItem'],
+    '.task': ['Task'],
+    '.idea': ['Idea'],
+    '.idea_element': ['IdeaElement'],
+    '.agent': ['Agent'],
+    '.rule': ['Rule'],
+    '.context': ['Context', 'UnifiedSixW'],
+    '.dependencies': ['TaskDependency', 'TaskBlocker', 'WorkItemDependency'],
+    '.work_item_summary': ['WorkItemSummary'],
+    '.summary': ['Summary'],
+    '.evidence_source': ['EvidenceSource'],
+    '.event': ['Event'],
+    '.document_reference': ['DocumentReference'],
+    '.document_audit_log': ['DocumentAuditLog'],
+    '.search_index': ['SearchIndex'],
+    '.search_metrics': ['SearchMetrics'],
+    '.provider': ['ProviderInstallation', 'CursorConfig', 'CursorMemory', 'CustomMode', 'ProviderType', 'InstallationStatus', 'MemorySyncDirection', 'SafetyLevel', 'AllowlistEntry', 'Guardrails', 'RuleTemplate', 'InstallResult', 'VerifyResult', 'MemorySyncResult', 'UpdateResult'],
+    '.detection_analysis': ['FileAnalysis', 'ProjectAnalysis', 'ComplexityReport', 'MaintainabilityReport'],
+    '.detection_graph': ['DependencyNode', 'CircularDependency', 'CouplingMetrics', 'DependencyGraphAnalysis'],
+    '.detection_sbom': ['LicenseInfo', 'SBOMComponent', 'SBOM'],
+    '.detection_pattern': ['PatternMatch', 'PatternAnalysis'],
+    '.detection_fitness': ['Policy', 'PolicyViolation', 'FitnessResult'],
+    '.detection_preset': ['DetectionPreset'],
+    '.detection_runtime': ['RuntimeOverlay'],
+    '.skill': ['Skill', 'AgentSkill', 'SkillCategory'],
+}
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = [
     "Project",
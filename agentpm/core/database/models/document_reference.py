@@ -73,6 +73,7 @@ class DocumentReference(BaseModel):
     content_updated_at: Optional[datetime] = Field(None, description="When content was last modified")
     last_synced_at: Optional[datetime] = Field(None, description="When file was last synced from database")
     sync_status: SyncStatus = Field(default=SyncStatus.SYNCED, description="Synchronization state (synced, pending, conflict, error)")
+    content_blob_key: Optional[str] = Field(None, max_length=64, description="SHA256 key of stored content blob (Migration 0052, read-only)")
 
     # Visibility and lifecycle (WI-164: Document Visibility System - Migration 0044)
     visibility: Optional[str] = Field(None, description="Visibility level (private|restricted|public)")
@@ -55,6 +55,10 @@ class MemoryFile(BaseModel):
 
     # Content
     content: str = Field(..., description="Generated markdown content")
+    content_blob_key: Optional[str] = Field(
+        None,
+        description="SHA-256 key of stored content blob (Migration 0052, read-only)"
+    )
     source_tables: List[str] = Field(
         default_factory=list,
         description="Database tables used to generate content"
@@ -63,6 +67,10 @@ class MemoryFile(BaseModel):
         default="1.0.0",
         description="Template version used for generation"
     )
+    source_watermark: Optional[str] = Field(
+        None,
+        description="Digest of source table state at generation (Migration 0053)"
+    )
 
     # Quality metrics
     confidence_score: float = Field(
@@ -54,6 +54,9 @@ class SessionMetadata(BaseModel):
     work_item_count: int = Field(0, description="Number of work items touched")
     errors: List[str] = Field(default_factory=list, description="Errors encountered")
     decisions: List[str] = Field(default_factory=list, description="Decisions made")
+    decisions_made: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Decisions with rationale (decision, rationale, timestamp)"
+    )
     learnings: List[str] = Field(default_factory=list, description="Key learnings")
 
     class Config:
@@ -14,10 +14,10 @@ Pattern: Pydantic BaseModel with Field validation (APM (Agent Project Manager) t
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 
-from ..enums import EntityType, SummaryType
+from ..enums import EntityType, SummaryLevel, SummaryType
 
 
 class Summary(BaseModel):
@@ -42,6 +42,8 @@ class Summary(BaseModel):
         session_id: Optional link to session for traceability
         session_date: Optional session date (YYYY-MM-DD format)
         session_duration_hours: Optional session duration in hours
+        summary_level: Compaction level (session = raw, daily/weekly/work_item rollups)
+        source_ids: Raw summary ids merged into a rollup
     """
 
     model_config = ConfigDict(
@@ -115,6 +117,16 @@ class Summary(BaseModel):
         description="Optional session duration in hours"
     )
 
+    # Rollups (Migration 0058)
+    summary_level: SummaryLevel = Field(
+        default=SummaryLevel.SESSION,
+        description="Compaction level (session = raw summary)"
+    )
+    source_ids: Optional[List[int]] = Field(
+        default=None,
+        description="Raw summary ids merged into this rollup"
+    )
+
     @field_validator('summary_type')
     @classmethod
     def validate_summary_type_for_entity(cls, v: SummaryType, info) -> SummaryType:
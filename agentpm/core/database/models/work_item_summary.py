@@ -9,7 +9,7 @@ Pydantic model for work_item_summaries table with:
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 
 
@@ -25,6 +25,9 @@ class WorkItemSummary(BaseModel):
 
     Used by session-start agents to gather efficient context
     from previous work sessions.
+
+    Aged session summaries are compacted into rollup rows (summary_level
+    daily/weekly/work_item) that list the raw ids they replace in source_ids.
     """
 
     # Identity
@@ -65,6 +68,16 @@ class WorkItemSummary(BaseModel):
         description="Summary type: session, milestone, decision, retrospective"
     )
 
+    # Rollups (Migration 0058)
+    summary_level: str = Field(
+        default='session',
+        description="Compaction level: session (raw), daily, weekly, work_item"
+    )
+    source_ids: Optional[List[int]] = Field(
+        default=None,
+        description="Raw summary ids merged into this rollup"
+    )
+
     class Config:
         validate_assignment = True
         json_schema_extra = {
@@ -16,6 +16,7 @@ Pattern Reference: /agentpm-cli-backup/agentpm_cli/services/database/service.py
 import sqlite3
 import json
 import logging
+import os
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Generator, Optional, Union
@@ -47,15 +48,27 @@ class DatabaseService:
             # Auto-commits if no exception
     """
 
-    def __init__(self, db_path: Union[str, Path]):
+    def __init__(self, db_path: Union[str, Path], use_baseline: bool = True):
         """
         Initialize database service.
 
         Args:
             db_path: Path to SQLite database file
+            use_baseline: Create new databases from the squashed schema baseline
+                (False replays every migration file)
         """
         self.db_path = Path(db_path).expanduser()
+        self.use_baseline = use_baseline
         self.logger = logging.getLogger(__name__)
+        self.profiler = None
+
+        # APM_DB_PROFILE=<slow_ms> (or 1 for the default threshold) profiles every query
+        profile = os.environ.get('APM_DB_PROFILE')
+        if profile and profile != '0':
+            try:
+                self.enable_profiling(slow_ms=float(profile) if profile != '1' else None)
+            except ValueError:
+                self.enable_profiling()
 
         self.logger.info(f"Initializing database service: {self.db_path}")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -89,7 +102,12 @@ class DatabaseService:
                 result = conn.execute("SELECT * FROM projects").fetchall()
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
+            if self.profiler is not None:
+                from .utils.query_profiler import ProfiledConnection
+                conn = sqlite3.connect(str(self.db_path), factory=ProfiledConnection)
+                conn.profiler = self.profiler
+            else:
+                conn = sqlite3.connect(str(self.db_path))
             conn.row_factory = sqlite3.Row  # Dict-like row access
             conn.execute("PRAGMA foreign_keys = ON")  # Enable FK constraints
 
@@ -131,6 +149,29 @@ class DatabaseService:
                 self.logger.error(f"Transaction rolled back due to error: {e}")
                 raise TransactionError(f"Transaction failed: {e}") from e
 
+    def enable_profiling(self, slow_ms: Optional[float] = None, max_samples: Optional[int] = None):
+        """
+        Record timing of every statement run on connections opened from now on.
+
+        Args:
+            slow_ms: Statements at least this slow get EXPLAIN QUERY PLAN in reports
+            max_samples: Recent durations kept per query fingerprint
+
+        Returns:
+            QueryProfiler collecting the statistics (see utils/query_profiler.py)
+        """
+        from .utils.query_profiler import DEFAULT_MAX_SAMPLES, DEFAULT_SLOW_MS, QueryProfiler
+
+        self.profiler = QueryProfiler(
+            slow_ms=DEFAULT_SLOW_MS if slow_ms is None else slow_ms,
+            max_samples=max_samples or DEFAULT_MAX_SAMPLES
+        )
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Stop profiling (connections opened afterwards are plain connections)"""
+        self.profiler = None
+
     def serialize_json_field(self, value: Any) -> str:
         """
         Serialize value to JSON string for database storage.
@@ -191,26 +232,29 @@ class DatabaseService:
         Initialize database schema using migration system.
 
         This method is called automatically if database doesn't exist.
-        Uses the migration system to ensure consistency.
+        Loads the squashed schema baseline (see migrations/baseline.py) in one
+        executescript, then replays only migrations newer than the baseline.
+        Falls back to replaying every migration if no baseline is available.
         """
         from .migrations import MigrationManager
 
         self.logger.info("Initializing database schema via migrations")
-        
-        # Create schema_migrations table first (chicken-and-egg problem)
-        with self.transaction() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS schema_migrations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    version TEXT NOT NULL UNIQUE,
-                    description TEXT,
-                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    rollback_at TIMESTAMP DEFAULT NULL,
-                    rollback_reason TEXT DEFAULT NULL,
-                    applied_by TEXT DEFAULT NULL
-                )
-            """)
-        
+
+        if not (self.use_baseline and self._load_schema_baseline()):
+            # Create schema_migrations table first (chicken-and-egg problem)
+            with self.transaction() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        version TEXT NOT NULL UNIQUE,
+                        description TEXT,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        rollback_at TIMESTAMP DEFAULT NULL,
+                        rollback_reason TEXT DEFAULT NULL,
+                        applied_by TEXT DEFAULT NULL
+                    )
+                """)
+
         # Run all pending migrations
         migration_manager = MigrationManager(self)
         success_count, failure_count = migration_manager.run_all_pending()
@@ -220,6 +264,40 @@ class DatabaseService:
         else:
             self.logger.info("Database schema initialized successfully via migrations")
 
+    def _load_schema_baseline(self) -> bool:
+        """
+        Load the squashed schema baseline into the new database.
+
+        Returns:
+            True if the baseline was loaded, False if unavailable, the database
+            is not empty, or loading failed (the database is left untouched so
+            migrations can be replayed instead)
+        """
+        from .migrations.baseline import BaselineError, apply_baseline, load_baseline
+
+        with self.connect() as conn:
+            if conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone():
+                return False
+
+        try:
+            snapshot = load_baseline()
+        except (OSError, BaselineError) as e:
+            self.logger.warning(f"Schema baseline unreadable, replaying migrations: {e}")
+            return False
+
+        if snapshot is None:
+            return False
+
+        try:
+            with self.connect() as conn:
+                apply_baseline(conn, snapshot)
+        except ConnectionError as e:
+            self.logger.warning(f"Schema baseline failed to load, replaying migrations: {e}")
+            return False
+
+        self.logger.info(f"Loaded schema baseline {snapshot.version}")
+        return True
+
     def _run_pending_migrations(self) -> None:
         """
         Run pending migrations for existing database.
@@ -0,0 +1,147 @@
+"""
+Blob Codec - Content Addressing and Compression
+
+Pure helpers for the content-addressed blob store (Migration 0052). Content is
+keyed by the SHA-256 of its raw bytes, so identical revisions share one blob
+regardless of how the payload is compressed.
+
+Codecs:
+- none: payload stored as-is (small content, or content that does not shrink)
+- zlib: default codec, fast with good ratios on markdown/JSON
+- lzma: used for large payloads when it beats zlib
+
+The key of a file on disk is simply its SHA-256, so equality checks between
+database content and published files are key comparisons.
+"""
+
+import hashlib
+import lzma
+import zlib
+from typing import Optional, Tuple, Union
+
+CODEC_NONE = 'none'
+CODEC_ZLIB = 'zlib'
+CODEC_LZMA = 'lzma'
+CODECS = (CODEC_NONE, CODEC_ZLIB, CODEC_LZMA)
+
+# Content smaller than this is not worth compressing
+MIN_COMPRESS_BYTES = 256
+
+# Content at least this large is also tried with lzma (slower, denser)
+LZMA_THRESHOLD_BYTES = 64 * 1024
+
+_ZLIB_LEVEL = 6
+
+
+def to_bytes(content: Union[str, bytes]) -> bytes:
+    """Encode text content as UTF-8 (bytes pass through unchanged)."""
+    if isinstance(content, bytes):
+        return content
+    return content.encode('utf-8')
+
+
+def compute_blob_key(content: Union[str, bytes]) -> str:
+    """
+    Compute the content address (SHA-256 hex digest) of content.
+
+    Args:
+        content: Text (UTF-8 encoded) or raw bytes
+
+    Returns:
+        64-character SHA-256 hex digest
+
+    Example:
+        >>> compute_blob_key("hello")[:12]
+        '2cf24dba5fb0'
+    """
+    return hashlib.sha256(to_bytes(content)).hexdigest()
+
+
+def encode_blob(raw: bytes, codec: Optional[str] = None) -> Tuple[str, bytes]:
+    """
+    Compress raw bytes for storage.
+
+    Args:
+        raw: Uncompressed content
+        codec: Force a codec (none/zlib/lzma); None selects automatically
+
+    Returns:
+        (codec, payload) - payload is never larger than raw for automatic selection
+
+    Raises:
+        ValueError: If codec is not a known codec
+    """
+    if codec is not None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown blob codec: {codec}")
+        return codec, _compress(raw, codec)
+
+    if len(raw) < MIN_COMPRESS_BYTES:
+        return CODEC_NONE, raw
+
+    best_codec, best_payload = CODEC_NONE, raw
+
+    payload = _compress(raw, CODEC_ZLIB)
+    if len(payload) < len(best_payload):
+        best_codec, best_payload = CODEC_ZLIB, payload
+
+    if len(raw) >= LZMA_THRESHOLD_BYTES:
+        payload = _compress(raw, CODEC_LZMA)
+        if len(payload) < len(best_payload):
+            best_codec, best_payload = CODEC_LZMA, payload
+
+    return best_codec, best_payload
+
+
+def decode_blob(codec: Optional[str], payload: Optional[bytes]) -> Optional[bytes]:
+    """
+    Decompress a stored payload.
+
+    Args:
+        codec: Codec recorded with the blob
+        payload: Stored bytes
+
+    Returns:
+        Raw content bytes (None if payload is None)
+
+    Raises:
+        ValueError: If codec is not a known codec
+    """
+    if payload is None:
+        return None
+    if codec in (None, CODEC_NONE):
+        return bytes(payload)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(payload)
+    if codec == CODEC_LZMA:
+        return lzma.decompress(payload)
+    raise ValueError(f"Unknown blob codec: {codec}")
+
+
+def decode_blob_text(codec: Optional[str], payload: Optional[bytes]) -> Optional[str]:
+    """Decompress a stored payload and decode it as UTF-8 text."""
+    raw = decode_blob(codec, payload)
+    return raw.decode('utf-8') if raw is not None else None
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    if codec == CODEC_ZLIB:
+        return zlib.compress(raw, _ZLIB_LEVEL)
+    if codec == CODEC_LZMA:
+        return lzma.compress(raw, preset=6)
+    return raw
+
+
+__all__ = [
+    'CODEC_NONE',
+    'CODEC_ZLIB',
+    'CODEC_LZMA',
+    'CODECS',
+    'MIN_COMPRESS_BYTES',
+    'LZMA_THRESHOLD_BYTES',
+    'to_bytes',
+    'compute_blob_key',
+    'encode_blob',
+    'decode_blob',
+    'decode_blob_text',
+]
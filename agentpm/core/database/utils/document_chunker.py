@@ -0,0 +1,172 @@
+"""
+Document Chunker - Heading-Aware Content Splitting
+
+Splits document content into chunks for the document content search index
+(Migration 0051). Markdown headings start a new chunk and are carried along
+as a heading path ("Architecture > Storage > Sync") so search hits can be
+attributed to a section. Oversized sections are split further on paragraph
+boundaries.
+
+Fenced code blocks are never treated as headings and are kept intact where
+they fit within the chunk size.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+DEFAULT_MAX_CHUNK_CHARS = 1500
+
+_HEADING_RE = re.compile(r'^(#{1,6})[ \t]+(.+?)[ \t#]*$')
+_FENCE_RE = re.compile(r'^\s*(```|~~~)')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n[ \t]*\n')
+
+
+@dataclass(frozen=True)
+class DocumentChunk:
+    """
+    A single indexed slice of a document.
+
+    Attributes:
+        chunk_index: Position of the chunk within the document (0-based)
+        heading_path: Enclosing headings joined with " > " (empty before first heading)
+        content: Chunk text (includes its heading line when it opens a section)
+        start_offset: Character offset of the chunk within the source content
+    """
+
+    chunk_index: int
+    heading_path: str
+    content: str
+    start_offset: int
+
+
+def compute_index_hash(title: Optional[str], content: Optional[str]) -> str:
+    """
+    Compute the hash used to detect whether a document needs re-indexing.
+
+    Args:
+        title: Document title (indexed alongside every chunk)
+        content: Document content
+
+    Returns:
+        SHA256 hex digest over title and content
+    """
+    digest = hashlib.sha256()
+    digest.update((title or '').encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update((content or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def chunk_document(
+    content: Optional[str],
+    max_chars: int = DEFAULT_MAX_CHUNK_CHARS
+) -> List[DocumentChunk]:
+    """
+    Split document content into heading-aware chunks.
+
+    Args:
+        content: Document text (markdown or plain text)
+        max_chars: Soft upper bound for chunk size in characters
+
+    Returns:
+        List of DocumentChunk in document order (empty for blank content)
+
+    Example:
+        >>> chunks = chunk_document("# Intro\\n\\nHello\\n\\n## Setup\\n\\nRun it")
+        >>> [c.heading_path for c in chunks]
+        ['Intro', 'Intro > Setup']
+    """
+    if not content or not content.strip():
+        return []
+
+    chunks: List[DocumentChunk] = []
+    for heading_path, section, offset in _split_sections(content):
+        for piece, piece_offset in _split_section(section, max_chars):
+            stripped = piece.strip()
+            if not stripped:
+                continue
+            leading = len(piece) - len(piece.lstrip())
+            chunks.append(DocumentChunk(
+                chunk_index=len(chunks),
+                heading_path=heading_path,
+                content=stripped,
+                start_offset=offset + piece_offset + leading,
+            ))
+
+    return chunks
+
+
+def _split_sections(content: str) -> List[Tuple[str, str, int]]:
+    """Split content at markdown headings, tracking the heading hierarchy."""
+    sections: List[Tuple[str, str, int]] = []
+    stack: List[Tuple[int, str]] = []
+    current_path = ''
+    current_start = 0
+    in_fence = False
+    offset = 0
+
+    for line in content.splitlines(keepends=True):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            match = _HEADING_RE.match(line.rstrip('\r\n'))
+            if match:
+                if offset > current_start:
+                    sections.append(
+                        (current_path, content[current_start:offset], current_start)
+                    )
+                level = len(match.group(1))
+                while stack and stack[-1][0] >= level:
+                    stack.pop()
+                stack.append((level, match.group(2).strip()))
+                current_path = ' > '.join(title for _, title in stack)
+                current_start = offset
+        offset += len(line)
+
+    if offset > current_start:
+        sections.append((current_path, content[current_start:], current_start))
+
+    return sections
+
+
+def _split_section(section: str, max_chars: int) -> List[Tuple[str, int]]:
+    """Split an oversized section on paragraph boundaries (hard-split as last resort)."""
+    if len(section) <= max_chars:
+        return [(section, 0)]
+
+    pieces: List[Tuple[str, int]] = []
+    buffer_start = 0
+    buffer_end = 0
+
+    boundaries = [m.end() for m in _PARAGRAPH_BREAK_RE.finditer(section)]
+    boundaries.append(len(section))
+
+    for boundary in boundaries:
+        if boundary - buffer_start <= max_chars:
+            buffer_end = boundary
+            continue
+
+        if buffer_end > buffer_start:
+            pieces.append((section[buffer_start:buffer_end], buffer_start))
+            buffer_start = buffer_end
+
+        # Paragraph on its own is still too large - hard split it
+        while boundary - buffer_start > max_chars:
+            pieces.append((section[buffer_start:buffer_start + max_chars], buffer_start))
+            buffer_start += max_chars
+        buffer_end = boundary
+
+    if buffer_end > buffer_start:
+        pieces.append((section[buffer_start:buffer_end], buffer_start))
+
+    return pieces
+
+
+__all__ = [
+    'DEFAULT_MAX_CHUNK_CHARS',
+    'DocumentChunk',
+    'chunk_document',
+    'compute_index_hash',
+]
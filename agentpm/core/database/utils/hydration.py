@@ -0,0 +1,563 @@
+"""
+Row Hydration - Fast Paths for Read-Only List Queries
+
+List methods turn every row into a fully validated Pydantic model. Rows read
+back from the database were validated when they were written, so re-validating
+them on every read is pure overhead for read-only callers. Three modes:
+
+- model: Validated Pydantic models (default, unchanged behaviour)
+- trusted: Same models built with model_construct() from adapter-converted
+  values (enum lookups and cached timestamp parsing, no validation)
+- view: Lightweight __slots__ row objects over the selected columns only;
+  enum columns are coerced, JSON columns are decoded lazily on first access,
+  everything else (including timestamps) is the raw column value
+
+Trusted models compare equal to validated ones for rows that satisfy the
+model constraints (all rows written through the methods layer do).
+
+Pattern: Pure helpers used by adapters (from_db_trusted) and list methods
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, TypeVar
+
+M = TypeVar('M')
+
+HYDRATE_MODEL = 'model'
+HYDRATE_TRUSTED = 'trusted'
+HYDRATE_VIEW = 'view'
+HYDRATION_MODES = (HYDRATE_MODEL, HYDRATE_TRUSTED, HYDRATE_VIEW)
+
+_object_setattr = object.__setattr__
+
+
+def check_hydration(hydrate: str, columns: Optional[Sequence[str]] = None) -> None:
+    """
+    Validate hydration arguments of a list method.
+
+    Args:
+        hydrate: Hydration mode
+        columns: Optional column projection (view mode only)
+
+    Raises:
+        ValueError: If the mode is unknown, a projection is given for a model
+            mode, or a column name is not a plain identifier
+    """
+    if hydrate not in HYDRATION_MODES:
+        raise ValueError(f"Unknown hydration mode: {hydrate!r} (expected one of {HYDRATION_MODES})")
+    if columns is not None:
+        if hydrate != HYDRATE_VIEW:
+            raise ValueError("Column projection requires hydrate='view'")
+        for column in columns:
+            if not column.isidentifier():
+                raise ValueError(f"Invalid column name: {column!r}")
+
+
+@lru_cache(maxsize=8192)
+def parse_db_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse a stored timestamp (cached - bulk rows share timestamps).
+
+    Args:
+        value: Column value (ISO or SQLite CURRENT_TIMESTAMP formatted string)
+
+    Returns:
+        datetime, or None for empty/unparseable values
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace(' ', 'T'))
+    except (ValueError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _enum_members(enum_cls: Type[Enum]) -> Dict[Any, Enum]:
+    return {member.value: member for member in enum_cls}
+
+
+def enum_member(enum_cls: Type[Enum], value: Any, default: Optional[Enum] = None) -> Optional[Enum]:
+    """
+    Look up an enum member by stored value without calling the enum constructor.
+
+    Args:
+        enum_cls: Enum class
+        value: Stored value (or a member of enum_cls)
+        default: Returned when value is empty
+
+    Returns:
+        Enum member (default if value is empty)
+
+    Raises:
+        ValueError: If value is not a valid member value (same as enum_cls(value))
+    """
+    if value is None or value == '':
+        return default
+    if isinstance(value, enum_cls):
+        return value
+    try:
+        return _enum_members(enum_cls)[value]
+    except KeyError:
+        return enum_cls(value)
+
+
+@lru_cache(maxsize=None)
+def _model_fields(model_cls: type) -> frozenset:
+    return frozenset(model_cls.model_fields)
+
+
+def trusted_construct(model_cls: Type[M], values: Dict[str, Any]) -> M:
+    """
+    Build a model from already-converted database values without validation.
+
+    Equivalent to model_cls.model_construct(**values). When values supply
+    every field (the adapters always do) the instance state is assigned
+    directly, skipping model_construct()'s per-field default resolution.
+
+    Args:
+        model_cls: Pydantic model class
+        values: Field values (fields missing from values take their defaults)
+
+    Returns:
+        Unvalidated model instance
+    """
+    if values.keys() != _model_fields(model_cls) or model_cls.__private_attributes__:
+        return model_cls.model_construct(**values)
+    model = model_cls.__new__(model_cls)
+    _object_setattr(model, '__dict__', values)
+    _object_setattr(model, '__pydantic_fields_set__', set(values))
+    _object_setattr(model, '__pydantic_extra__', None)
+    _object_setattr(model, '__pydantic_private__', None)
+    return model
+
+
+def enum_converter(enum_cls: Type[Enum], default: Optional[Enum] = None) -> Callable[[Any], Optional[Enum]]:
+    """
+    Converter from stored value to enum member (default for NULL/empty).
+
+    Invalid values raise ValueError, as enum_cls(value) does.
+    """
+    members = _enum_members(enum_cls)
+
+    def convert(value: Any) -> Optional[Enum]:
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            return enum_member(enum_cls, value, default)
+
+    return convert
+
+
+class TrustedHydrator:
+    """
+    Trusted (unvalidated) construction of one model type from database rows.
+
+    The per-row work is compiled once per selected column set: field values
+    are picked with a single itemgetter, converters run only for columns that
+    need them, and fields that were not selected take their model defaults.
+    Adapters declare the same field mapping as their validating from_db().
+
+    Args:
+        model_cls: Pydantic model class
+        columns: Fields read directly from same-named columns
+        converters: Per-field converters applied to the raw column value
+        derived: Fields computed from several columns, as
+            {field: (source columns, fn)}; fn receives the raw source values
+            (None for columns that were not selected)
+    """
+
+    def __init__(
+        self,
+        model_cls: Type[M],
+        columns: Sequence[str],
+        converters: Optional[Mapping[str, Callable[[Any], Any]]] = None,
+        derived: Optional[Mapping[str, Tuple[Sequence[str], Callable[..., Any]]]] = None
+    ):
+        self.model_cls = model_cls
+        self.columns = tuple(columns)
+        self.converters = dict(converters or {})
+        self.derived = dict(derived or {})
+        self._plans: Dict[Tuple[Tuple[str, ...], bool], Callable[[Any], M]] = {}
+
+    def from_row(self, row: Mapping[str, Any]) -> M:
+        """Build one model from a dict or sqlite3.Row."""
+        keys = tuple(row.keys())
+        return self._plan(keys, isinstance(row, dict))(row)
+
+    def from_rows(self, rows: Sequence[Any]) -> List[M]:
+        """Build models from sqlite3.Row results of one query."""
+        if not rows:
+            return []
+        build = self._plan(tuple(rows[0].keys()), False)
+        return [build(row) for row in rows]
+
+    def _plan(self, names: Tuple[str, ...], by_key: bool) -> Callable[[Any], M]:
+        plan = self._plans.get((names, by_key))
+        if plan is None:
+            plan = self._plans[(names, by_key)] = self._compile(names, by_key)
+        return plan
+
+    def _compile(self, names: Tuple[str, ...], by_key: bool) -> Callable[[Any], M]:
+        model_cls = self.model_cls
+        position = {name: (name if by_key else index) for index, name in enumerate(names)}
+        present = tuple(column for column in self.columns if column in position)
+        pick = _picker([position[column] for column in present])
+        converters = tuple(
+            (column, self.converters[column]) for column in present if column in self.converters
+        )
+        derived = tuple(
+            (field_name, tuple(position.get(source) for source in sources), fn)
+            for field_name, (sources, fn) in self.derived.items()
+        )
+
+        static_defaults, factories = {}, []
+        for field_name, info in model_cls.model_fields.items():
+            if field_name in present or field_name in self.derived:
+                continue
+            if info.default_factory is not None:
+                factories.append((field_name, info.default_factory))
+            else:
+                static_defaults[field_name] = None if info.is_required() else info.default
+
+        def build(row: Any) -> M:
+            values = dict(zip(present, pick(row)))
+            for column, convert in converters:
+                values[column] = convert(values[column])
+            for field_name, sources, fn in derived:
+                values[field_name] = fn(*[None if source is None else row[source] for source in sources])
+            if static_defaults:
+                values.update(static_defaults)
+            for field_name, factory in factories:
+                values[field_name] = factory()
+            return trusted_construct(model_cls, values)
+
+        return build
+
+
+def _picker(keys: Sequence[Any]) -> Callable[[Any], Tuple[Any, ...]]:
+    """itemgetter that always returns a tuple"""
+    if not keys:
+        return lambda row: ()
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda row: (row[key],)
+    return itemgetter(*keys)
+
+
+class RowView:
+    """
+    Base class for lightweight read-only row views.
+
+    Subclasses are generated by row_view_class(): the row tuple is held in a
+    single slot and every column is a property over it. Enum columns are
+    coerced on access; JSON columns are decoded on first access and cached.
+    """
+
+    __slots__ = ('_values',)
+    _columns: Tuple[str, ...] = ()
+
+    def __init__(self, values: Sequence[Any]):
+        _object_setattr(self, '_values', tuple(values))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Column value (default if the column was not selected)."""
+        return getattr(self, name) if name in self._columns else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Selected columns as a dict (enums coerced, JSON columns decoded)."""
+        return {column: getattr(self, column) for column in self._columns}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values == other._values
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        shown = ', '.join(
+            f"{column}={getattr(self, column)!r}"
+            for column in self._columns[:4]
+        )
+        more = ', ...' if len(self._columns) > 4 else ''
+        return f"{type(self).__name__}({shown}{more})"
+
+
+@lru_cache(maxsize=256)
+def row_view_class(
+    name: str,
+    columns: Tuple[str, ...],
+    json_columns: frozenset = frozenset(),
+    enum_columns: Tuple[Tuple[str, Type[Enum]], ...] = ()
+) -> Type[RowView]:
+    """
+    Create (once per column set) a __slots__ row view class.
+
+    Args:
+        name: Class name (e.g. 'TaskRow')
+        columns: Selected column names, in SELECT order
+        json_columns: Columns holding JSON text (decoded lazily)
+        enum_columns: (column, Enum class) pairs coerced on access
+
+    Returns:
+        RowView subclass; instances are built from row tuples
+    """
+    enums = dict(enum_columns)
+    lazy = tuple(column for column in columns if column in json_columns)
+    view_cls = type(name, (RowView,), {
+        '__slots__': tuple(f'_json_{column}' for column in lazy),
+        '_columns': columns,
+    })
+
+    values_slot = RowView.__dict__['_values']
+    for index, column in enumerate(columns):
+        if column in lazy:
+            prop = _json_property(view_cls.__dict__[f'_json_{column}'], values_slot, index)
+        elif column in enums:
+            prop = _enum_property(enum_converter(enums[column]), values_slot, index)
+        else:
+            prop = property(lambda self, _get=values_slot.__get__, _i=index: _get(self)[_i])
+        setattr(view_cls, column, prop)
+    return view_cls
+
+
+def _enum_property(convert: Callable[[Any], Any], values_slot: Any, index: int) -> property:
+    get_values = values_slot.__get__
+    return property(lambda self: convert(get_values(self)[index]))
+
+
+def _json_property(cache_slot: Any, values_slot: Any, index: int) -> property:
+    get_cached, set_cached = cache_slot.__get__, cache_slot.__set__
+    get_values = values_slot.__get__
+
+    def decoded(self: RowView) -> Any:
+        try:
+            return get_cached(self)
+        except AttributeError:
+            value = _decode_json(get_values(self)[index])
+            set_cached(self, value)
+            return value
+
+    return property(decoded)
+
+
+def view_columns(
+    conn,
+    table: str,
+    columns: Optional[Sequence[str]] = None,
+    exclude: Iterable[str] = ()
+) -> Tuple[str, ...]:
+    """
+    Column list for a view query: the projection, or every table column.
+
+    Args:
+        conn: Open sqlite3 connection
+        table: Table name
+        columns: Optional projection ('id' is always included first)
+        exclude: Columns left out when no projection is given (e.g. large content)
+
+    Returns:
+        Tuple of column names
+    """
+    if columns is not None:
+        return ('id',) + tuple(column for column in dict.fromkeys(columns) if column != 'id')
+    excluded = set(exclude)
+    return tuple(
+        row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+        if row[1] not in excluded
+    )
+
+
+@dataclass(frozen=True)
+class RowViewSpec:
+    """
+    How a table is exposed as row views.
+
+    Attributes:
+        name: View class name (e.g. 'TaskRow')
+        table: Table name
+        json_columns: Columns holding JSON text (decoded lazily)
+        enum_columns: (column, Enum class) pairs coerced on construction
+        exclude: Columns never selected into views (large or blob-backed content);
+            projecting one raises ValueError
+    """
+    name: str
+    table: str
+    json_columns: frozenset = frozenset()
+    enum_columns: Tuple[Tuple[str, Type[Enum]], ...] = ()
+    exclude: Tuple[str, ...] = ()
+
+
+def fetch_row_views(
+    conn,
+    spec: RowViewSpec,
+    where: str,
+    params: Sequence[Any],
+    columns: Optional[Sequence[str]] = None
+) -> List[RowView]:
+    """
+    Run a list query selecting only the view columns and build row views.
+
+    Args:
+        conn: Open sqlite3 connection
+        spec: Row view spec for the table
+        where: Query text following FROM <table> (WHERE/ORDER BY/LIMIT)
+        params: Query parameters
+        columns: Optional column projection (excluded columns may not be projected)
+
+    Returns:
+        List of RowView instances in query order
+
+    Raises:
+        ValueError: If a projected column is excluded by the spec
+    """
+    return list(iter_row_views(conn, spec, where, params, columns))
+
+
+def iter_row_views(
+    conn,
+    spec: RowViewSpec,
+    where: str,
+    params: Sequence[Any],
+    columns: Optional[Sequence[str]] = None
+) -> Iterator[RowView]:
+    """
+    Like fetch_row_views(), yielding views as rows are read from the cursor.
+
+    The connection must stay open until the iterator is exhausted.
+
+    Raises:
+        ValueError: If a projected column is excluded by the spec
+    """
+    excluded = [column for column in columns or () if column in spec.exclude]
+    if excluded:
+        raise ValueError(
+            f"Column(s) not available in {spec.name} views: {', '.join(excluded)}"
+            " (use hydrate='model' or 'trusted')"
+        )
+    selected = view_columns(conn, spec.table, columns, spec.exclude)
+    view_cls = row_view_class(spec.name, selected, spec.json_columns, spec.enum_columns)
+    select = ', '.join(f"{spec.table}.{column}" for column in selected)
+
+    conn.row_factory = None
+    new, set_values = object.__new__, RowView.__dict__['_values'].__set__
+    for row in conn.execute(f"SELECT {select} FROM {spec.table}{where}", tuple(params)):
+        view = new(view_cls)
+        set_values(view, row)
+        yield view
+
+
+def fetch_row_view_page(
+    conn,
+    spec: RowViewSpec,
+    filters: Optional[Mapping[str, Any]] = None,
+    columns: Optional[Sequence[str]] = None,
+    after_id: int = 0,
+    limit: int = 100
+) -> Tuple[List[RowView], Optional[int]]:
+    """
+    Fetch one keyset page of row views ordered by id.
+
+    Pages are addressed by the last id of the previous page, so every page
+    costs one index range scan regardless of how deep the client has paged.
+
+    Args:
+        conn: Open sqlite3 connection
+        spec: Row view spec for the table
+        filters: Optional {column: value} equality filters (enums use their value)
+        columns: Optional column projection (excluded columns may not be projected)
+        after_id: Return rows with id > after_id
+        limit: Page size (>= 1)
+
+    Returns:
+        (views, next_after_id) - next_after_id is None on the last page
+
+    Raises:
+        ValueError: If a filter or projected column is not a table column,
+            a projected column is excluded by the spec, or limit < 1
+    """
+    if limit < 1:
+        raise ValueError(f"Page limit must be at least 1, got {limit}")
+    table_columns = set(view_columns(conn, spec.table))
+    unknown = [c for c in list(filters or ()) + list(columns or ()) if c not in table_columns]
+    if unknown:
+        raise ValueError(f"Unknown {spec.table} column(s): {', '.join(unknown)}")
+    excluded = [c for c in columns or () if c in spec.exclude]
+    if excluded:
+        raise ValueError(f"Column(s) not available in {spec.table} pages: {', '.join(excluded)}")
+
+    where, params = " WHERE id > ?", [after_id]
+    for column, value in (filters or {}).items():
+        where += f" AND {column} = ?"
+        params.append(getattr(value, 'value', value))
+    where += " ORDER BY id LIMIT ?"
+    params.append(limit + 1)
+
+    views = fetch_row_views(conn, spec, where, params, columns)
+    if len(views) > limit:
+        views = views[:limit]
+        return views, views[-1].id
+    return views, None
+
+
+def hydrate_rows(
+    rows: Sequence[Any],
+    hydrate: str,
+    from_db: Callable[[Dict[str, Any]], M],
+    from_rows_trusted: Callable[[Sequence[Any]], List[M]]
+) -> List[M]:
+    """
+    Convert fetched rows to models using the model or trusted path.
+
+    Args:
+        rows: sqlite3.Row results
+        hydrate: HYDRATE_MODEL or HYDRATE_TRUSTED
+        from_db: Validating adapter (receives a dict copy of each row)
+        from_rows_trusted: Trusted bulk adapter (e.g. TaskAdapter.from_rows_trusted)
+
+    Returns:
+        List of models
+    """
+    if hydrate == HYDRATE_TRUSTED:
+        return from_rows_trusted(rows)
+    return [from_db(dict(row)) for row in rows]
+
+
+def _decode_json(raw: Any) -> Any:
+    if raw is None or raw == '':
+        return None
+    if not isinstance(raw, str):
+        return raw
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+__all__ = [
+    'HYDRATE_MODEL',
+    'HYDRATE_TRUSTED',
+    'HYDRATE_VIEW',
+    'HYDRATION_MODES',
+    'check_hydration',
+    'parse_db_datetime',
+    'enum_member',
+    'trusted_construct',
+    'enum_converter',
+    'TrustedHydrator',
+    'RowView',
+    'row_view_class',
+    'view_columns',
+    'hydrate_rows',
+    'RowViewSpec',
+    'fetch_row_views',
+]
@@ -0,0 +1,247 @@
+"""
+Index Advisor - Flag Full Table Scans in Captured Query Shapes
+
+Replays query fingerprints (see query_profiler.fingerprint) through EXPLAIN
+QUERY PLAN and reports, per fingerprint, the tables read without an index
+and sorts done in a temporary B-tree. Full scans are flagged only for
+statements with a WHERE filter on a column; unfiltered lists read every
+row whatever the indexes. For single-table shapes it proposes
+an index: the columns compared with = / IN in the WHERE clause, then the
+ORDER BY columns.
+
+Fingerprints come from a QueryProfiler report (`apm testing db-profile
+--json`), a text file with one statement per line, or run_read_workload(),
+which exercises the list queries behind the CLI and web views.
+
+Pattern: Pure analysis over an open connection (no schema changes)
+"""
+
+import json
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .query_profiler import fingerprint as normalize
+
+_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(.*)$")
+_FROM = re.compile(r"\bFROM\s+(\w+)", re.I)
+_JOIN = re.compile(r"\bJOIN\b|\bFROM\s+\w+(?:\s+\w+)?\s*,", re.I)
+_WHERE = re.compile(r"\bWHERE\b(.*?)(?:\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|$)", re.I | re.S)
+_ORDER_BY = re.compile(r"\bORDER BY\b(.*?)(?:\bLIMIT\b|$)", re.I | re.S)
+_EQUALITY = re.compile(r"(?<![\w.])(\w+)\s*(?:=\s*\?|IN\s*\(\?)", re.I)
+_FILTER = re.compile(r"(?<![\w.?])([A-Za-z_]\w*)\s*(?:[=<>!]=?|\bIN\b|\bLIKE\b|\bGLOB\b|\bBETWEEN\b|\bIS\b)", re.I)
+_KEYWORDS = {'and', 'or', 'not', 'where', 'on'}
+
+
+@dataclass
+class Advice:
+    """EXPLAIN QUERY PLAN findings for one fingerprint."""
+    fingerprint: str
+    plan: List[str] = field(default_factory=list)
+    full_scans: List[str] = field(default_factory=list)
+    filtered: bool = False
+    temp_sort: bool = False
+    suggestion: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def flagged(self) -> bool:
+        """Whether a filtered statement reads a whole table (unfiltered lists must scan anyway)"""
+        return bool(self.full_scans) and self.filtered
+
+    def to_dict(self) -> Dict:
+        return {
+            'fingerprint': self.fingerprint,
+            'plan': self.plan,
+            'full_scans': self.full_scans,
+            'filtered': self.filtered,
+            'flagged': self.flagged,
+            'temp_sort': self.temp_sort,
+            'suggestion': self.suggestion,
+            'error': self.error,
+        }
+
+
+def replayable(fingerprint: str) -> Tuple[str, int]:
+    """
+    Statement text that can be explained for a fingerprint.
+
+    Collapsed (?+) lists become a single placeholder; every ? is bound to NULL,
+    which does not change the plan.
+
+    Returns:
+        (sql, parameter count)
+    """
+    sql = fingerprint.replace('(?+)', '(?)')
+    return sql, sql.count('?')
+
+
+def advise_fingerprint(conn: sqlite3.Connection, fingerprint: str) -> Advice:
+    """
+    Explain one fingerprint.
+
+    Args:
+        conn: Open connection to the database whose indexes are evaluated
+        fingerprint: Normalized statement
+
+    Returns:
+        Advice (error set if the statement cannot be explained)
+    """
+    advice = Advice(fingerprint)
+    sql, param_count = replayable(fingerprint)
+    if not sql.lstrip().upper().startswith(('SELECT', 'WITH', 'UPDATE', 'DELETE')):
+        return advice
+    try:
+        rows = sqlite3.Connection.execute(
+            conn, f"EXPLAIN QUERY PLAN {sql}", [None] * param_count
+        ).fetchall()
+    except sqlite3.Error as e:
+        advice.error = str(e)
+        return advice
+
+    where = _WHERE.search(fingerprint)
+    advice.filtered = bool(where and any(
+        column.lower() not in _KEYWORDS for column in _FILTER.findall(where.group(1))
+    ))
+    advice.plan = [row[-1] for row in rows]
+    for step in advice.plan:
+        match = _SCAN.match(step)
+        if match and 'USING' not in match.group(2) and 'VIRTUAL TABLE' not in match.group(2):
+            advice.full_scans.append(match.group(1))
+        if step.startswith('USE TEMP B-TREE FOR ORDER BY'):
+            advice.temp_sort = True
+
+    if advice.flagged:
+        advice.suggestion = suggest_index(fingerprint)
+    return advice
+
+
+def advise(conn: sqlite3.Connection, fingerprints: Iterable[str]) -> List[Advice]:
+    """
+    Explain fingerprints, flagged (full scan) shapes first.
+
+    Args:
+        conn: Open connection
+        fingerprints: Normalized statements (duplicates are explained once)
+
+    Returns:
+        List of Advice
+    """
+    unique = list(dict.fromkeys(fingerprints))
+    results = [advise_fingerprint(conn, fp) for fp in unique]
+    return sorted(results, key=lambda a: (not a.flagged, not a.temp_sort))
+
+
+def suggest_index(fingerprint: str) -> Optional[str]:
+    """
+    CREATE INDEX statement for a single-table fingerprint.
+
+    Returns:
+        Statement, or None for joins or shapes without filter/sort columns
+    """
+    if _JOIN.search(fingerprint):
+        return None
+    tables = _FROM.findall(fingerprint)
+    if len(set(tables)) != 1:
+        return None
+    table = tables[0]
+
+    columns: List[str] = []
+    where = _WHERE.search(fingerprint)
+    if where:
+        for column in _EQUALITY.findall(where.group(1)):
+            if column.lower() not in _KEYWORDS and column not in columns:
+                columns.append(column)
+    order = _ORDER_BY.search(fingerprint)
+    if order:
+        for term in order.group(1).split(','):
+            parts = term.split()
+            if parts and re.fullmatch(r"\w+", parts[0]) and parts[0] not in columns:
+                columns.append(parts[0] + (' DESC' if len(parts) > 1 and parts[1].upper() == 'DESC' else ''))
+
+    if not columns or columns[0].lower() == 'id':
+        return None
+    name = 'idx_' + table + '_' + '_'.join(c.split()[0] for c in columns)
+    return f"CREATE INDEX {name} ON {table}({', '.join(columns)})"
+
+
+def load_fingerprints(path: Path) -> List[str]:
+    """
+    Read captured query shapes.
+
+    Accepts `apm testing db-profile --json` output, a QueryProfiler report,
+    a JSON list of statements, or a text file with one statement per line.
+    Statements are normalized, so raw SQL works as well as fingerprints.
+
+    Raises:
+        ValueError: If the file content is not recognized
+    """
+    text = Path(path).read_text(encoding='utf-8')
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return [normalize(line) for line in text.splitlines() if line.strip()]
+
+    if isinstance(data, dict):
+        data = data.get('profile', data).get('queries')
+    if not isinstance(data, list):
+        raise ValueError(f"No queries found in {path}")
+    statements = [item['fingerprint'] if isinstance(item, dict) else item for item in data]
+    return [normalize(statement) for statement in statements if isinstance(statement, str)]
+
+
+def run_read_workload(service) -> Dict[str, str]:
+    """
+    Run the list queries behind the main CLI and web views once.
+
+    Filtered shapes use the first project / work item / session id (or 1),
+    so plans are exercised even when those rows do not exist.
+
+    Args:
+        service: DatabaseService instance
+
+    Returns:
+        {step: error} for steps that failed
+    """
+    from ..enums import EntityType, TaskStatus, WorkItemStatus
+    from ..methods import (
+        agents, contexts, document_references, events, ideas, projects, row_pages, tasks, work_items
+    )
+
+    with service.connect() as conn:
+        first = {
+            table: conn.execute(f"SELECT COALESCE(MIN(id), 1) FROM {table}").fetchone()[0]
+            for table in ('projects', 'work_items', 'sessions')
+        }
+
+    steps = {
+        'projects': lambda: projects.list_projects(service),
+        'work_items': lambda: work_items.list_work_items(service),
+        'work_items_by_status': lambda: work_items.list_work_items(
+            service, project_id=first['projects'], status=WorkItemStatus.ACTIVE),
+        'tasks': lambda: tasks.list_tasks(service),
+        'tasks_by_work_item': lambda: tasks.list_tasks(service, work_item_id=first['work_items']),
+        'tasks_by_status': lambda: tasks.list_tasks(
+            service, work_item_id=first['work_items'], status=TaskStatus.ACTIVE),
+        'ideas': lambda: ideas.list_ideas(service),
+        'ideas_by_tag': lambda: ideas.list_ideas(service, project_id=first['projects'], tags=['backend']),
+        'agents': lambda: agents.list_agents(service),
+        'contexts': lambda: contexts.list_contexts(service),
+        'entity_context': lambda: contexts.get_entity_context(
+            service, EntityType.WORK_ITEM, first['work_items']),
+        'documents': lambda: row_pages.page_rows(service, 'documents'),
+        'entity_documents': lambda: document_references.list_document_references(
+            service, entity_type=EntityType.WORK_ITEM, entity_id=first['work_items']),
+        'documents_by_tag': lambda: document_references.search_documents_by_metadata(service, tags=['api']),
+        'events': lambda: events.get_events_after(service, 0, limit=500),
+        'session_events': lambda: events.get_session_events(service, first['sessions'], limit=100),
+    }
+    errors = {}
+    for name, step in steps.items():
+        try:
+            step()
+        except Exception as e:
+            errors[name] = str(e)
+    return errors
@@ -0,0 +1,278 @@
+"""
+Query Profiler - Opt-In Per-Statement Instrumentation for DatabaseService
+
+When profiling is enabled on a DatabaseService, connections are opened with
+ProfiledConnection, whose cursors time each statement (execute plus every
+fetch of its rows) and record it under a normalized fingerprint:
+
+    SELECT * FROM tasks WHERE id = 42 AND status IN ('a', 'b')
+    -> SELECT * FROM tasks WHERE id = ? AND status IN (?+)
+
+Per fingerprint the profiler keeps the call count, total time, a bounded
+window of recent durations (p50/p95) and the slowest statement with its
+parameters. EXPLAIN QUERY PLAN is captured for fingerprints slower than the
+threshold when a report is built, so the hot path only pays for timing.
+
+Disabled profiling costs nothing: connections are plain sqlite3 connections.
+
+Pattern: Thread-safe collector shared by all connections of one service
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+DEFAULT_SLOW_MS = 50.0
+DEFAULT_MAX_SAMPLES = 1000
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_PLACEHOLDER = re.compile(r"(?::\w+|\?\d*)")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUES_LIST = re.compile(r"(\(\?\+\))(?:\s*,\s*\(\?\+\))+")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """
+    Normalize a statement so executions differing only in literals group together.
+
+    Comments are removed, string and numeric literals and named/numbered
+    placeholders become ?, parenthesised ? lists collapse to (?+) and
+    whitespace is collapsed.
+
+    Args:
+        sql: Statement text
+
+    Returns:
+        Fingerprint string
+    """
+    text = _COMMENT.sub(' ', sql)
+    text = _STRING.sub('?', text)
+    text = _NUMBER.sub('?', text)
+    text = _PLACEHOLDER.sub('?', text)
+    text = _SPACE.sub(' ', text).strip()
+    text = _IN_LIST.sub('(?+)', text)
+    text = _VALUES_LIST.sub(r'\1', text)
+    return text.rstrip(';').strip()
+
+
+class Execution:
+    """One recorded statement execution (time accumulates while rows are fetched)."""
+    __slots__ = ('key', 'sql', 'params', 'duration_ms')
+
+    def __init__(self, key: str, sql: str, params: Any):
+        self.key = key
+        self.sql = sql
+        self.params = params
+        self.duration_ms = 0.0
+
+
+@dataclass
+class QueryStats:
+    """Aggregated timings for one fingerprint."""
+    fingerprint: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    samples: Deque[Execution] = field(default_factory=deque)
+    slowest_sql: Optional[str] = None
+    slowest_params: Any = None
+
+
+class QueryProfiler:
+    """
+    Collects statement timings from ProfiledConnection cursors.
+
+    Args:
+        slow_ms: Statements slower than this get EXPLAIN QUERY PLAN in reports
+        max_samples: Recent durations kept per fingerprint for percentiles
+    """
+
+    def __init__(self, slow_ms: float = DEFAULT_SLOW_MS, max_samples: int = DEFAULT_MAX_SAMPLES):
+        self.slow_ms = slow_ms
+        self.max_samples = max_samples
+        self.started_at = time.time()
+        self._stats: Dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+
+    def start(self, sql: str, params: Any) -> Execution:
+        """Register one execution of sql"""
+        execution = Execution(fingerprint(sql), sql, params)
+        with self._lock:
+            stats = self._stats.get(execution.key)
+            if stats is None:
+                stats = self._stats[execution.key] = QueryStats(
+                    execution.key, samples=deque(maxlen=self.max_samples)
+                )
+            stats.count += 1
+            stats.samples.append(execution)
+        return execution
+
+    def add(self, execution: Execution, elapsed_ms: float) -> None:
+        """Add time spent executing or fetching rows to an execution"""
+        execution.duration_ms += elapsed_ms
+        with self._lock:
+            stats = self._stats.get(execution.key)
+            if stats is None:
+                return
+            stats.total_ms += elapsed_ms
+            if execution.duration_ms > stats.max_ms:
+                stats.max_ms = execution.duration_ms
+                stats.slowest_sql = execution.sql
+                stats.slowest_params = execution.params
+
+    def reset(self) -> None:
+        """Discard all collected statistics"""
+        with self._lock:
+            self._stats.clear()
+            self.started_at = time.time()
+
+    def stats(self) -> List[QueryStats]:
+        """Snapshot of per-fingerprint statistics, slowest total first"""
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda s: s.total_ms, reverse=True)
+
+    def report(self, conn: Optional[sqlite3.Connection] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Summarize collected statistics.
+
+        Args:
+            conn: Optional connection used to EXPLAIN QUERY PLAN slow statements
+            limit: Optional maximum number of fingerprints (by total time)
+
+        Returns:
+            Dict with totals and a 'queries' list (fingerprint, count, total_ms,
+            avg_ms, p50_ms, p95_ms, max_ms, slow, plan)
+        """
+        with self._lock:
+            all_stats = sorted(self._stats.values(), key=lambda s: s.total_ms, reverse=True)
+            durations = [sorted(e.duration_ms for e in stats.samples) for stats in all_stats]
+        selected = all_stats[:limit] if limit else all_stats
+        queries = []
+        for stats, values in zip(selected, durations):
+            slow = stats.max_ms >= self.slow_ms
+            queries.append({
+                'fingerprint': stats.fingerprint,
+                'count': stats.count,
+                'total_ms': round(stats.total_ms, 3),
+                'avg_ms': round(stats.total_ms / stats.count, 3) if stats.count else 0.0,
+                'p50_ms': round(percentile(values, 50), 3),
+                'p95_ms': round(percentile(values, 95), 3),
+                'max_ms': round(stats.max_ms, 3),
+                'slow': slow,
+                'plan': explain_query_plan(conn, stats.slowest_sql, stats.slowest_params)
+                if slow and conn is not None else None,
+            })
+        return {
+            'since': self.started_at,
+            'slow_ms': self.slow_ms,
+            'statements': sum(s.count for s in all_stats),
+            'fingerprints': len(all_stats),
+            'total_ms': round(sum(s.total_ms for s in all_stats), 3),
+            'queries': queries,
+        }
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 if empty)"""
+    if not sorted_values:
+        return 0.0
+    rank = -(-pct * len(sorted_values) // 100)  # ceil
+    return sorted_values[max(0, min(len(sorted_values), int(rank)) - 1)]
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: Optional[str], params: Any = ()) -> Optional[List[str]]:
+    """
+    EXPLAIN QUERY PLAN lines for a statement (None if it cannot be explained).
+
+    Args:
+        conn: Open connection
+        sql: Statement text
+        params: Statement parameters
+    """
+    if not sql or not sql.lstrip().upper().startswith(('SELECT', 'WITH', 'UPDATE', 'DELETE', 'INSERT', 'REPLACE')):
+        return None
+    try:
+        rows = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", params or ()).fetchall()
+    except (sqlite3.Error, ValueError):
+        return None
+    return [row[-1] for row in rows]
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor timing execute() and row fetching into the connection's profiler."""
+
+    _execution: Optional[Execution] = None
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()):  # type: ignore[override]
+        profiler = self.connection.profiler
+        self._execution = profiler.start(sql, parameters)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            profiler.add(self._execution, (time.perf_counter() - start) * 1000.0)
+
+    def executemany(self, sql: str, seq_of_parameters):  # type: ignore[override]
+        profiler = self.connection.profiler
+        self._execution = profiler.start(sql, None)
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            profiler.add(self._execution, (time.perf_counter() - start) * 1000.0)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            self._fetched(start)
+
+    def fetchmany(self, size: int = -1):
+        start = time.perf_counter()
+        try:
+            return super().fetchmany(self.arraysize if size == -1 else size)
+        finally:
+            self._fetched(start)
+
+    def fetchall(self):
+        start = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            self._fetched(start)
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return super().__next__()
+        finally:
+            self._fetched(start)
+
+    def _fetched(self, start: float) -> None:
+        if self._execution is not None:
+            self.connection.profiler.add(self._execution, (time.perf_counter() - start) * 1000.0)
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """sqlite3 connection whose statements are recorded by a QueryProfiler."""
+
+    profiler: QueryProfiler
+
+    def cursor(self, factory=ProfiledCursor):  # type: ignore[override]
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()):  # type: ignore[override]
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters):  # type: ignore[override]
+        return self.cursor().executemany(sql, seq_of_parameters)
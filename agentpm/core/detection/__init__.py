@@ -15,12 +15,16 @@ Usage:
     print(f"Detected: {result.get_detected_technologies()}")
 """
 
-from .models import DetectionResult, TechnologyMatch, EvidenceType
-from .indicators import ProjectIndicators
-# DetectionService will be exported after refactoring to use Pydantic models
-
-from .indicator_service import IndicatorService
-from .orchestrator import DetectionOrchestrator
+from agentpm.utils.lazy import lazy_exports
+
+# Imported on first access, so using one name does not load every submodule
+_EXPORTS = {
+    '.models': ['DetectionResult', 'TechnologyMatch', 'EvidenceType'],
+    '.indicators': ['ProjectIndicators'],
+    '.indicator_service': ['IndicatorService'],
+    '.orchestrator': ['DetectionOrchestrator'],
+}
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = [
     "DetectionResult",
@@ -73,6 +73,10 @@ from agentpm.core.database.models.detection_analysis import (
 )
 
 
+# Default cache location, relative to the working directory
+DEFAULT_CACHE_DIR = Path(".cache") / "analysis"
+
+
 class AnalysisCache:
     """
     Simple file-based cache for analysis results.
@@ -99,7 +103,7 @@ class AnalysisCache:
         """
         self.enabled = enabled
         if cache_dir is None:
-            cache_dir = Path.cwd() / ".cache" / "analysis"
+            cache_dir = Path.cwd() / DEFAULT_CACHE_DIR
         self.cache_dir = cache_dir
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
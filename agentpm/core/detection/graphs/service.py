@@ -46,7 +46,7 @@ for graph construction and AST parsing.
 
 import hashlib
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -66,6 +66,7 @@ from agentpm.utils.graph_builders import (
     _normalize_file_path_to_module,
 )
 from agentpm.utils.ignore_patterns import IgnorePatternMatcher
+from agentpm.core.performance.cache import TTLCache
 
 # Database layer models
 from agentpm.core.database.models.detection_graph import (
@@ -92,9 +93,10 @@ class DependencyGraphService:
 
     Attributes:
         project_path: Project root directory
-        _graph: Cached NetworkX graph (lazy-loaded)
-        _imports_cache: Cached import data by file
-        _cache_timestamp: When cache was last built
+        _graph: Current NetworkX graph (lazy-loaded)
+        _imports_cache: Import data by file of the current graph
+        _cache_timestamp: When the current graph was built
+        _graphs: TTL cache of built graphs by file pattern
 
     Example:
         >>> from pathlib import Path
@@ -134,6 +136,8 @@ class DependencyGraphService:
         self._graph: Optional[nx.DiGraph] = None
         self._imports_cache: Dict[str, List[str]] = {}
         self._cache_timestamp: Optional[datetime] = None
+        # file_pattern -> (graph, imports_by_file, built_at)
+        self._graphs = TTLCache('detection.dependency_graphs', maxsize=8, ttl=self.CACHE_TTL_SECONDS)
         self.ignore_matcher = IgnorePatternMatcher(self.project_path)
 
     def build_graph(
@@ -180,10 +184,11 @@ class DependencyGraphService:
             - .agentpmignore patterns (AIPM-specific exclusions)
             - Default patterns (venv/, node_modules/, .git/, etc.)
         """
-        # Check cache validity
-        if not force_rebuild and self._is_cache_valid():
-            if self._graph is not None:
-                return self._graph
+        # Check cache (entries expire after CACHE_TTL_SECONDS)
+        cached = None if force_rebuild else self._graphs.get(file_pattern)
+        if cached is not None:
+            self._graph, self._imports_cache, self._cache_timestamp = cached
+            return self._graph
 
         # Step 1: Find all Python files
         all_python_files = list(self.project_path.glob(file_pattern))
@@ -215,6 +220,7 @@ class DependencyGraphService:
         self._graph = build_import_graph(imports_by_file, self.project_path)
         self._imports_cache = imports_by_file
         self._cache_timestamp = datetime.now()
+        self._graphs.set(file_pattern, (self._graph, self._imports_cache, self._cache_timestamp))
 
         return self._graph
 
@@ -616,14 +622,6 @@ class DependencyGraphService:
 
     # Private helper methods
 
-    def _is_cache_valid(self) -> bool:
-        """Check if cached graph is still valid."""
-        if self._cache_timestamp is None:
-            return False
-
-        age = datetime.now() - self._cache_timestamp
-        return age < timedelta(seconds=self.CACHE_TTL_SECONDS)
-
     def _format_node_label(self, node_path: str) -> str:
         """Format node label for visualization (shorten long paths)."""
         # Use just filename for clarity
@@ -683,6 +681,7 @@ class DependencyGraphService:
         self._graph = None
         self._imports_cache = {}
         self._cache_timestamp = None
+        self._graphs.clear()
 
     def get_graph_summary(self) -> Dict[str, any]:
         """
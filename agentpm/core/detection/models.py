@@ -65,6 +65,7 @@ class DetectionResult(BaseModel):
         scan_time_ms: Time taken for detection (milliseconds)
         project_path: Path to scanned project
         scanned_at: When scan occurred
+        plugin_times_ms: Phase 2 detect() time per technology (milliseconds)
     """
     model_config = ConfigDict(validate_assignment=True)
 
@@ -72,6 +73,7 @@ class DetectionResult(BaseModel):
     scan_time_ms: float = Field(..., ge=0.0)
     project_path: str = Field(..., min_length=1)
     scanned_at: datetime = Field(default_factory=datetime.now)
+    plugin_times_ms: Dict[str, float] = Field(default_factory=dict)
 
     def get_primary_language(self) -> Optional[str]:
         """
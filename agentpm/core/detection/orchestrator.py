@@ -4,7 +4,8 @@ Detection Orchestrator - Two-Phase Detection Coordinator
 Coordinates Phase 1 (IndicatorService) and Phase 2 (Plugin.detect) detection.
 
 Implements ADR-001 two-phase detection architecture for scalable performance
-with 200+ plugins.
+with 200+ plugins. Phase 2 plugins run concurrently with per-plugin timeouts
+(see plugins/base/execution.py).
 
 Pattern: Service coordinator using IndicatorService + PluginOrchestrator
 """
@@ -15,6 +16,7 @@ import time
 
 from .indicator_service import IndicatorService
 from .models import DetectionResult, TechnologyMatch, EvidenceType
+from ..plugins.base.execution import run_plugins
 from ..plugins.base.plugin_interface import BasePlugin
 from ...utils import DependencyGraph
 
@@ -60,15 +62,28 @@ class DetectionOrchestrator:
         'sqlite': 'agentpm.core.plugins.domains.data.sqlite.SQLitePlugin',
     }
 
-    def __init__(self, min_confidence: float = 0.5):
+    def __init__(
+        self,
+        min_confidence: float = 0.5,
+        max_workers: Optional[int] = None,
+        plugin_timeout_s: Optional[float] = 10.0,
+        budget_s: Optional[float] = None
+    ):
         """
         Initialize detection orchestrator.
 
         Args:
             min_confidence: Minimum confidence threshold for matches (0.0-1.0)
                            Default 0.5 filters out weak signals
+            max_workers: Plugins detected in parallel (None: auto, 1: sequential)
+            plugin_timeout_s: Per-plugin detect() time limit (None: unlimited)
+            budget_s: Time limit for all of Phase 2 (None: unlimited)
         """
         self.min_confidence = min_confidence
+        self.max_workers = max_workers
+        self.plugin_timeout_s = plugin_timeout_s
+        self.budget_s = budget_s
+        self._last_plugin_times: Dict[str, float] = {}
         self._plugin_cache: Dict[str, Type[BasePlugin]] = {}
         self._indicator_service = IndicatorService()
         self._dependency_graph = self._build_technology_dependency_graph()
@@ -140,7 +155,8 @@ class DetectionOrchestrator:
         result = DetectionResult(
             matches=matches,
             scan_time_ms=total_time,
-            project_path=str(project_path.absolute())
+            project_path=str(project_path.absolute()),
+            plugin_times_ms=self._last_plugin_times
         )
 
         # TODO: Add structured logging when available
@@ -158,7 +174,9 @@ class DetectionOrchestrator:
         """
         Run plugin detection on filtered candidates only.
 
-        Loads only plugins matching candidates (selective loading from ADR-002).
+        Loads only plugins matching candidates (selective loading from ADR-002)
+        and runs their detect() concurrently. A plugin that fails or exceeds
+        plugin_timeout_s is treated as not detected.
 
         Args:
             project_path: Path to project
@@ -172,26 +190,35 @@ class DetectionOrchestrator:
         # Load only candidate plugins (not all 200+)
         plugins = self._load_plugins(candidates)
 
-        # Run detect() on each candidate plugin
-        for plugin in plugins:
-            try:
-                # Phase 2 detection: 3-phase within plugin
-                confidence = plugin.detect(project_path)
-
-                # Filter by confidence threshold
-                if confidence >= self.min_confidence:
-                    matches[plugin.enriches] = TechnologyMatch(
-                        technology=plugin.enriches,
-                        confidence=confidence,
-                        evidence=[],  # TODO: Add evidence collection from plugin
-                        evidence_types=[]
-                    )
+        # Run detect() on each candidate plugin (concurrently, input order kept)
+        runs = run_plugins(
+            plugins,
+            lambda plugin, cancel: plugin.detect(project_path),
+            max_workers=self.max_workers,
+            timeout_s=self.plugin_timeout_s,
+            budget_s=self.budget_s
+        )
+
+        self._last_plugin_times = {}
+        for run in runs:
+            plugin = run.item
+            self._last_plugin_times[plugin.enriches] = run.duration_ms
 
-            except Exception as e:
-                # Plugin detection failure doesn't crash system (fail-safe design)
-                # TODO: Add logging when available
-                # logger.warning(f"Plugin {plugin.plugin_id} detection failed: {e}")
-                pass
+            # Plugin detection failure/timeout doesn't crash system (fail-safe design)
+            # TODO: Add logging when available
+            # logger.warning(f"Plugin {plugin.plugin_id} detection {run.status}: {run.error}")
+            if not run.ok:
+                continue
+
+            # Filter by confidence threshold
+            confidence = run.value
+            if confidence >= self.min_confidence:
+                matches[plugin.enriches] = TechnologyMatch(
+                    technology=plugin.enriches,
+                    confidence=confidence,
+                    evidence=[],  # TODO: Add evidence collection from plugin
+                    evidence_types=[]
+                )
 
         return matches
 
@@ -206,11 +233,11 @@ class DetectionOrchestrator:
             candidates: Set of technology names from Phase 1
 
         Returns:
-            List of instantiated plugin objects
+            List of instantiated plugin objects (sorted by technology name)
         """
         plugins: List[BasePlugin] = []
 
-        for tech_name in candidates:
+        for tech_name in sorted(candidates):
             # Check if we have a plugin for this technology
             if tech_name not in self.PLUGIN_REGISTRY:
                 continue
@@ -12,9 +12,10 @@ Performance Targets:
 Design Pattern: Adapter layer between Context Agent and Hooks System
 """
 
+import json
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 from datetime import datetime
 
 # Add project to path
@@ -23,20 +24,23 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from agentpm.core.database import DatabaseService
-from agentpm.core.context.assembly_service import (
-    ContextAssemblyService,
-    ContextAssemblyError,
-    ContextPayload,
-)
-from agentpm.core.database.models.context import UnifiedSixW
-from agentpm.providers import get_provider
-from agentpm.providers.anthropic import AnthropicAdapter
-from agentpm.providers.anthropic.formatter import AnthropicFormatter
+
+# Context assembly and the provider adapters pull in pydantic and the plugin
+# system; they are imported when a hook first needs them, so hooks that exit
+# early stay within their startup budget (see `apm testing startup`).
+if TYPE_CHECKING:
+    from agentpm.core.context.assembly_service import ContextAssemblyService, ContextPayload
+    from agentpm.core.database.models.context import UnifiedSixW
+
+# Project context settings, e.g. {"token_budget": 4000}: token budget for task
+# context printed by hooks (0 disables packing; budget.DEFAULT_TOKEN_BUDGET when unset)
+CONTEXT_CONFIG_PATH = Path('.agentpm') / 'context_config.json'
 
 
 def get_llm_formatter(provider_name: str):
     """Get LLM formatter for the specified provider."""
     if provider_name == "anthropic":
+        from agentpm.providers.anthropic.formatter import AnthropicFormatter
         return AnthropicFormatter()
     return None
 
@@ -47,7 +51,8 @@ class ContextHookAdapter:
 
     Responsibilities:
     - Initialize DatabaseService and ContextAssemblyService
-    - Format context payloads for hook output
+    - Format context payloads for hook output, packed into the project's
+      token budget (see token_budget)
     - Handle graceful degradation on failures
     - Track performance for SLA monitoring
 
@@ -69,7 +74,7 @@ class ContextHookAdapter:
 
         # Initialize services (lazy loading for performance)
         self._db: Optional[DatabaseService] = None
-        self._assembly_service: Optional[ContextAssemblyService] = None
+        self._assembly_service: Optional['ContextAssemblyService'] = None
 
     @property
     def db(self) -> DatabaseService:
@@ -79,16 +84,37 @@ class ContextHookAdapter:
         return self._db
 
     @property
-    def assembly_service(self) -> ContextAssemblyService:
+    def assembly_service(self) -> 'ContextAssemblyService':
         """Lazy-load context assembly service."""
         if self._assembly_service is None:
+            from agentpm.core.context.assembly_service import ContextAssemblyService
             self._assembly_service = ContextAssemblyService(
                 db=self.db,
                 project_path=self.project_root,
-                enable_cache=False  # Cache disabled for MVP
+                enable_cache=False,  # Cache disabled for MVP
+                token_budget=self.token_budget
             )
         return self._assembly_service
 
+    @property
+    def token_budget(self) -> int:
+        """
+        Token budget for task context in hook output.
+
+        Read from "token_budget" in the project's CONTEXT_CONFIG_PATH
+        (0 disables packing); DEFAULT_TOKEN_BUDGET when unset or invalid.
+        """
+        from agentpm.core.context.budget import DEFAULT_TOKEN_BUDGET
+
+        config_path = self.project_root / CONTEXT_CONFIG_PATH
+        if not config_path.exists():
+            return DEFAULT_TOKEN_BUDGET
+        try:
+            budget = int(json.loads(config_path.read_text()).get('token_budget', DEFAULT_TOKEN_BUDGET))
+        except (json.JSONDecodeError, OSError, AttributeError, TypeError, ValueError):
+            return DEFAULT_TOKEN_BUDGET
+        return budget if budget >= 0 else DEFAULT_TOKEN_BUDGET
+
     # ─────────────────────────────────────────────────────────────────
     # SessionStart Hook - Background context loading
     # ─────────────────────────────────────────────────────────────────
@@ -261,6 +287,8 @@ class ContextHookAdapter:
 
             **Confidence**: 85% (GREEN)
         """
+        from agentpm.core.context.assembly_service import ContextAssemblyError
+
         try:
             start_time = datetime.now()
 
@@ -278,6 +306,7 @@ class ContextHookAdapter:
 
             if formatter:
                 try:
+                    from agentpm.providers.anthropic import AnthropicAdapter
                     adapter = AnthropicAdapter()
                     token_allocation = adapter.plan_tokens(payload)
                 except Exception:
@@ -353,7 +382,7 @@ class ContextHookAdapter:
 
     def _format_task_payload_fallback(
         self,
-        payload: ContextPayload,
+        payload: 'ContextPayload',
         *,
         assembly_duration_ms: Optional[float] = None,
     ) -> str:
@@ -416,7 +445,7 @@ class ContextHookAdapter:
         lines.append("")
         return "\n".join(lines)
 
-    def _format_6w_context(self, merged_6w: UnifiedSixW) -> List[str]:
+    def _format_6w_context(self, merged_6w: 'UnifiedSixW') -> List[str]:
         """Format merged 6W context - platform agnostic structured format."""
         lines = []
         lines.append("### 🔍 Merged Context (Task → Work Item → Project)")
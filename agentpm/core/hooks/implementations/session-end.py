@@ -19,8 +19,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from agentpm.core.database import DatabaseService
-from agentpm.core.database.methods import work_items as wi_methods
-from agentpm.core.database.methods import tasks as task_methods
+from agentpm.core.database.methods import project_tree
 from agentpm.core.database.enums import WorkItemStatus, TaskStatus
 
 
@@ -139,17 +138,17 @@ def end_session_record(session_id: str, reason: str) -> None:
         metadata = existing_session.metadata
 
         # Capture ACTIVE state for next session (handover context)
-        active_wis = wi_methods.list_work_items(db, status=WorkItemStatus.ACTIVE)
-        review_wis = wi_methods.list_work_items(db, status=WorkItemStatus.REVIEW)
-        all_active = active_wis + review_wis
+        tree = project_tree.load_project_tree(
+            db,
+            task_statuses=(TaskStatus.ACTIVE, TaskStatus.REVIEW),
+            work_item_columns=(),
+            task_columns=()
+        )
+        all_active = tree.work_items_with_status(WorkItemStatus.ACTIVE, WorkItemStatus.REVIEW)
         metadata.active_work_items = [wi.id for wi in all_active]
 
         # Capture ACTIVE tasks for next session
-        all_active_tasks = []
-        for wi in wi_methods.list_work_items(db):
-            tasks = task_methods.list_tasks(db, work_item_id=wi.id)
-            active = [t for t in tasks if t.status in (TaskStatus.ACTIVE, TaskStatus.REVIEW)]
-            all_active_tasks.extend(active)
+        all_active_tasks = tree.all_tasks()
         metadata.active_tasks = [t.id for t in all_active_tasks]
 
         # Capture git status (uncommitted files)
@@ -381,28 +380,32 @@ def generate_handover_context(session_id: str, reason: str) -> None:
         f.write(f"**Session ID**: {session_id}\n")
         f.write(f"**Exit Reason**: {reason}\n\n")
 
+        # Work items with all their tasks, loaded once for both sections
+        try:
+            tree = project_tree.load_project_tree(db)
+            tree_error = None
+        except Exception as e:
+            tree, tree_error = None, e
+
         # Active Work Items
         f.write("## 📋 Active Work Items\n\n")
         try:
-            active_wis = wi_methods.list_work_items(
-                db,
-                status=WorkItemStatus.ACTIVE
-            )
-            review_wis = wi_methods.list_work_items(
-                db,
-                status=WorkItemStatus.REVIEW
-            )
-            all_active = active_wis + review_wis
+            if tree_error:
+                raise tree_error
+            all_active = [
+                tree.get(wi.id)
+                for wi in tree.work_items_with_status(WorkItemStatus.ACTIVE, WorkItemStatus.REVIEW)
+            ]
 
             if all_active:
-                for wi in all_active[:5]:  # Show top 5
+                for node in all_active[:5]:  # Show top 5
+                    wi = node.work_item
                     f.write(f"- **WI-{wi.id}**: {wi.name}\n")
                     f.write(f"  - Type: {wi.type.value}, Status: {wi.status.value}, Priority: {wi.priority}\n")
 
                     # Get task count
-                    tasks = task_methods.list_tasks(db, work_item_id=wi.id)
-                    completed = sum(1 for t in tasks if t.status == TaskStatus.DONE)
-                    f.write(f"  - Progress: {completed}/{len(tasks)} tasks completed\n")
+                    completed = len(node.tasks_with_status(TaskStatus.DONE))
+                    f.write(f"  - Progress: {completed}/{len(node.tasks)} tasks completed\n")
                 f.write("\n")
             else:
                 f.write("No active work items\n\n")
@@ -412,12 +415,12 @@ def generate_handover_context(session_id: str, reason: str) -> None:
         # Active Tasks
         f.write("## ✅ Active Tasks\n\n")
         try:
-            all_active_tasks = []
-            all_wis = wi_methods.list_work_items(db)
-            for wi in all_wis:
-                tasks = task_methods.list_tasks(db, work_item_id=wi.id)
-                active = [t for t in tasks if t.status in (TaskStatus.ACTIVE, TaskStatus.REVIEW)]
-                all_active_tasks.extend([(t, wi.name) for t in active])
+            if tree_error:
+                raise tree_error
+            all_active_tasks = [
+                (task, wi.name)
+                for wi, task in tree.iter_tasks(TaskStatus.ACTIVE, TaskStatus.REVIEW)
+            ]
 
             if all_active_tasks:
                 for task, wi_name in all_active_tasks[:5]:  # Show top 5
@@ -19,7 +19,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 from agentpm.core.database import DatabaseService
 from agentpm.core.database.methods import work_items as wi_methods
-from agentpm.core.database.methods import tasks as task_methods
+from agentpm.core.database.methods import project_tree
 from agentpm.core.database.methods import projects as project_methods
 from agentpm.core.database.enums import WorkItemStatus, TaskStatus, Phase
 
@@ -343,12 +343,13 @@ def _format_context_fallback() -> str:
 
         # Active Tasks Summary
         try:
-            all_wis = wi_methods.list_work_items(db)
-            all_tasks = []
-            for wi in all_wis:
-                tasks = task_methods.list_tasks(db, work_item_id=wi.id)
-                active = [t for t in tasks if t.status in (TaskStatus.ACTIVE, TaskStatus.REVIEW)]
-                all_tasks.extend(active)
+            tree = project_tree.load_project_tree(
+                db,
+                task_statuses=(TaskStatus.ACTIVE, TaskStatus.REVIEW),
+                work_item_columns=(),
+                task_columns=()
+            )
+            all_tasks = tree.all_tasks()
 
             if all_tasks:
                 lines.append(f"**Active Tasks** ({len(all_tasks)}):")
@@ -0,0 +1,16 @@
+"""
+Core Performance Module
+
+- cache: TTLCache (O(1) LRU with TTL, size/byte limits and tags),
+  CACHE_REGISTRY and the cached_method decorator
+- optimizer: TaskStart performance optimizer (multi-level cache, connection pool)
+"""
+
+from .cache import CACHE_REGISTRY, CacheRegistry, TTLCache, cached_method
+
+__all__ = [
+    'CACHE_REGISTRY',
+    'CacheRegistry',
+    'TTLCache',
+    'cached_method',
+]
@@ -0,0 +1,358 @@
+"""
+TTL LRU Cache - Shared In-Process Cache Primitive
+
+Modules used to cache with their own dicts (plugin instances, SOP files,
+visibility policies, dependency graphs) or with the list-ordered LRUCache of
+the performance optimizer, whose get/set called list.remove and so cost
+O(n). TTLCache is the one primitive they share:
+
+- OrderedDict recency order: get, set and eviction are O(1)
+- Per-entry TTL (expired entries are dropped when touched or by expire())
+- Size limit (entries) and optional byte-weight limit (weigh callable)
+- Tags per entry for explicit invalidation (invalidate_tag)
+- Hit / miss / eviction / expiration counters
+- Thread-safe (one lock per cache)
+
+Every cache registers under a name in CACHE_REGISTRY (weakly, so per-instance
+caches disappear with their owner); /system/caches reports the registry.
+
+Example usage:
+    cache = TTLCache('plugins.instances', maxsize=64, ttl=300)
+    plugin = cache.get_or_set('python', PythonPlugin, tags=['plugins'])
+
+    class PolicyEngine:
+        @cached_method(ttl=60, tags=lambda self, category: [f"policy:{category}"])
+        def policy_for(self, category): ...
+
+    CACHE_REGISTRY.invalidate_tag('policy:planning')
+
+Pattern: Pure in-process component (no database access), like context/budget
+"""
+
+import functools
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Union
+
+# Default entry limit of a cache
+DEFAULT_MAXSIZE = 1024
+
+Weigher = Callable[[Any], int]
+TagSpec = Union[Iterable[str], Callable[..., Iterable[str]], None]
+
+_MISSING = object()
+
+
+class _Entry:
+    """Cached value with expiry, weight and tags"""
+    __slots__ = ('value', 'expires_at', 'weight', 'tags')
+
+    def __init__(self, value: Any, expires_at: Optional[float], weight: int, tags: frozenset):
+        self.value = value
+        self.expires_at = expires_at
+        self.weight = weight
+        self.tags = tags
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with TTL, size and byte-weight limits.
+
+    The least recently used entry is evicted when maxsize entries or
+    max_bytes of weight are exceeded. Entries expire ttl seconds after they
+    were set (None: never).
+    """
+
+    def __init__(self, name: Optional[str] = None, maxsize: Optional[int] = DEFAULT_MAXSIZE,
+                 ttl: Optional[float] = None, max_bytes: Optional[int] = None,
+                 weigh: Optional[Weigher] = None, clock: Callable[[], float] = time.monotonic,
+                 register: bool = True):
+        """
+        Args:
+            name: Registry name (e.g. 'plugins.instances'); unnamed caches are not registered
+            maxsize: Maximum entries (None: unbounded)
+            ttl: Default seconds until an entry expires (None: no expiry)
+            max_bytes: Maximum total weight of entries (None: unbounded)
+            weigh: Callable value -> bytes (default: sys.getsizeof; only used with max_bytes)
+            clock: Monotonic time source (overridable in tests)
+            register: Register in CACHE_REGISTRY when named
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.weigh = weigh or sys.getsizeof
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+        if name and register:
+            CACHE_REGISTRY.register(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._live(key) is not None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value of key (marked most recently used), default on a miss"""
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = _MISSING,
+            tags: Iterable[str] = ()) -> None:
+        """
+        Cache value under key.
+
+        Args:
+            key: Hashable key
+            value: Value to cache
+            ttl: Seconds until expiry (default: the cache ttl; None: no expiry)
+            tags: Invalidation tags of the entry
+        """
+        ttl = self.ttl if ttl is _MISSING else ttl
+        weight = self.weigh(value) if self.max_bytes is not None else 0
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            if self.max_bytes is not None and weight > self.max_bytes:
+                self.evictions += 1  # larger than the whole cache: never stored
+                return
+            entry = _Entry(value, self.clock() + ttl if ttl is not None else None, weight, frozenset(tags))
+            self._entries[key] = entry
+            self._bytes += weight
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            self._evict()
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = _MISSING,
+                   tags: Iterable[str] = ()) -> Any:
+        """Cached value of key, computing and caching factory() on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, ttl=ttl, tags=tags)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (default if absent or expired)"""
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return default
+            self._discard(key)
+            return entry.value
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove key; True if it was cached"""
+        return self.pop(key, _MISSING) is not _MISSING
+
+    def invalidate_tag(self, *tags: str) -> int:
+        """Remove every entry carrying one of the tags; returns entries removed"""
+        with self._lock:
+            keys = set().union(*(self._tags.get(tag, ()) for tag in tags)) if tags else set()
+            for key in keys:
+                self._discard(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def expire(self) -> int:
+        """Drop all expired entries; returns entries dropped"""
+        with self._lock:
+            now = self.clock()
+            expired = [key for key, entry in self._entries.items()
+                       if entry.expires_at is not None and entry.expires_at <= now]
+            for key in expired:
+                self._discard(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """Change the entry limit, evicting least recently used entries to fit"""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def keys(self) -> List[Hashable]:
+        """Keys of live entries, least recently used first"""
+        with self._lock:
+            self.expire()
+            return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept; see reset_stats)"""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/eviction counters"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Size, limits and counters of the cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+    def _live(self, key: Hashable) -> Optional[_Entry]:
+        """Entry of key, dropping it if expired (lock held)"""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= self.clock():
+            self._discard(key)
+            self.expirations += 1
+            return None
+        return entry
+
+    def _discard(self, key: Hashable) -> None:
+        """Remove key and its tag index entries (lock held)"""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.weight
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within limits (lock held)"""
+        while self._entries and (
+            (self.maxsize is not None and len(self._entries) > self.maxsize)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+
+class CacheRegistry:
+    """
+    Named caches of the process, for reporting and cross-cache invalidation.
+
+    Caches are held weakly and grouped by name: per-instance caches (one per
+    PluginRegistry, per DependencyGraphService, ...) report as one entry with
+    summed counters.
+    """
+
+    def __init__(self):
+        self._caches: Dict[str, "weakref.WeakSet[TTLCache]"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, cache: TTLCache) -> None:
+        """Track a named cache"""
+        with self._lock:
+            self._caches.setdefault(cache.name, weakref.WeakSet()).add(cache)
+
+    def caches(self, name: Optional[str] = None) -> List[TTLCache]:
+        """Live caches (of one name, or all)"""
+        with self._lock:
+            groups = [self._caches.get(name, ())] if name else list(self._caches.values())
+            return [cache for group in groups for cache in list(group)]
+
+    def invalidate_tag(self, *tags: str) -> int:
+        """Invalidate tags in every registered cache; returns entries removed"""
+        return sum(cache.invalidate_tag(*tags) for cache in self.caches())
+
+    def clear(self, name: Optional[str] = None) -> None:
+        """Drop the entries of registered caches (of one name, or all)"""
+        for cache in self.caches(name):
+            cache.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-name statistics: instances, size, bytes and summed counters"""
+        report: Dict[str, Dict[str, Any]] = {}
+        for cache in self.caches():
+            stats = cache.stats()
+            totals = report.setdefault(cache.name, {
+                'instances': 0, 'size': 0, 'bytes': 0, 'maxsize': stats['maxsize'], 'ttl': stats['ttl'],
+                'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0,
+            })
+            totals['instances'] += 1
+            for counter in ('size', 'bytes', 'hits', 'misses', 'evictions', 'expirations', 'invalidations'):
+                totals[counter] += stats[counter]
+        for totals in report.values():
+            lookups = totals['hits'] + totals['misses']
+            totals['hit_rate'] = round(totals['hits'] / lookups, 4) if lookups else 0.0
+        return dict(sorted(report.items()))
+
+
+CACHE_REGISTRY = CacheRegistry()
+
+
+def cached_method(name: Optional[str] = None, maxsize: Optional[int] = 128, ttl: Optional[float] = None,
+                  tags: TagSpec = None, max_bytes: Optional[int] = None):
+    """
+    Memoize a method per instance in a TTLCache.
+
+    The cache is created on first call and stored on the instance, keyed by
+    the call arguments (which must be hashable). Entries carry the given
+    tags so they can be dropped with invalidate_tag() on the wrapper, the
+    instance cache or CACHE_REGISTRY.
+
+    Args:
+        name: Registry name (default: module.Class.method)
+        maxsize: Maximum entries per instance
+        ttl: Seconds until an entry expires (None: no expiry)
+        tags: Tags for every entry, or callable(self, *args, **kwargs) -> tags
+        max_bytes: Maximum total weight per instance
+
+    Example:
+        @cached_method(ttl=300, tags=lambda self, tech: ['plugins', f"plugin:{tech}"])
+        def get_plugin(self, tech): ...
+
+        registry.get_plugin.cache(registry).stats()
+        registry.get_plugin.invalidate_tag(registry, 'plugin:python')
+    """
+    def decorator(method: Callable) -> Callable:
+        cache_name = name or f"{method.__module__}.{method.__qualname__}"
+        attribute = f"_cached_{method.__name__}"
+        lock = threading.Lock()
+
+        def cache_of(instance: Any) -> TTLCache:
+            cache = instance.__dict__.get(attribute)
+            if cache is None:
+                with lock:
+                    cache = instance.__dict__.get(attribute)
+                    if cache is None:
+                        cache = TTLCache(cache_name, maxsize=maxsize, ttl=ttl, max_bytes=max_bytes)
+                        instance.__dict__[attribute] = cache
+            return cache
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            entry_tags = tags(self, *args, **kwargs) if callable(tags) else (tags or ())
+            return cache_of(self).get_or_set(key, lambda: method(self, *args, **kwargs), tags=entry_tags)
+
+        wrapper.cache = cache_of
+        wrapper.invalidate_tag = lambda instance, *names: cache_of(instance).invalidate_tag(*names)
+        wrapper.cache_clear = lambda instance: cache_of(instance).clear()
+        return wrapper
+    return decorator
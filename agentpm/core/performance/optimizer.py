@@ -18,6 +18,8 @@ from pathlib import Path
 import hashlib
 import json
 
+from .cache import TTLCache
+
 
 class CacheLevel(Enum):
     """Cache levels"""
@@ -46,87 +48,31 @@ class PerformanceMetrics:
     details: Dict[str, Any]
 
 
-class LRUCache:
-    """LRU Cache with TTL support"""
+class LRUCache(TTLCache):
+    """LRU Cache with TTL support (O(1) get/set, see performance.cache.TTLCache)"""
     
-    def __init__(self, size: int = 1000, ttl: float = 60.0):
+    def __init__(self, size: int = 1000, ttl: float = 60.0, name: Optional[str] = None):
+        super().__init__(name, maxsize=size, ttl=ttl)
         self.size = size
-        self.ttl = ttl
-        self.cache = {}
-        self.access_order = []
-    
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache."""
-        if key in self.cache:
-            entry = self.cache[key]
-            # Check TTL
-            if time.time() - entry.timestamp > entry.ttl:
-                self._remove(key)
-                return None
-            
-            # Update access order
-            self._update_access_order(key)
-            return entry.value
-        
-        return None
-    
-    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
-        """Set value in cache."""
-        if ttl is None:
-            ttl = self.ttl
-        
-        # Remove oldest if cache is full
-        if len(self.cache) >= self.size:
-            oldest_key = self.access_order[0]
-            self._remove(oldest_key)
-        
-        # Add new entry
-        entry = CacheEntry(
-            key=key,
-            value=value,
-            timestamp=time.time(),
-            ttl=ttl,
-            level=CacheLevel.L1
-        )
-        
-        self.cache[key] = entry
-        self._update_access_order(key)
     
     def _remove(self, key: str) -> None:
         """Remove entry from cache."""
-        if key in self.cache:
-            del self.cache[key]
-            if key in self.access_order:
-                self.access_order.remove(key)
-    
-    def _update_access_order(self, key: str) -> None:
-        """Update access order for LRU."""
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
-    
-    def clear(self) -> None:
-        """Clear cache."""
-        self.cache.clear()
-        self.access_order.clear()
+        self.delete(key)
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        return {
-            "size": len(self.cache),
-            "max_size": self.size,
-            "ttl": self.ttl,
-            "hit_rate": 0.0  # Would be calculated from hit/miss counters
-        }
+        stats = super().stats()
+        stats["max_size"] = self.size
+        return stats
 
 
 class MultiLevelCache:
     """Multi-level cache with smart promotion"""
     
-    def __init__(self):
-        self.l1_cache = LRUCache(size=1000, ttl=60)    # 1 minute
-        self.l2_cache = LRUCache(size=10000, ttl=300)  # 5 minutes
-        self.l3_cache = LRUCache(size=100000, ttl=1800) # 30 minutes
+    def __init__(self, name: str = "performance.multi_level"):
+        self.l1_cache = LRUCache(size=1000, ttl=60, name=f"{name}.l1")      # 1 minute
+        self.l2_cache = LRUCache(size=10000, ttl=300, name=f"{name}.l2")    # 5 minutes
+        self.l3_cache = LRUCache(size=100000, ttl=1800, name=f"{name}.l3")  # 30 minutes
         self.hit_counters = {"l1": 0, "l2": 0, "l3": 0, "miss": 0}
     
     def get(self, key: str) -> Optional[Any]:
@@ -165,9 +111,9 @@ class MultiLevelCache:
     
     def clear(self) -> None:
         """Clear all cache levels."""
-        self.l1_cache.clear()
-        self.l2_cache.clear()
-        self.l3_cache.clear()
+        for cache in (self.l1_cache, self.l2_cache, self.l3_cache):
+            cache.clear()
+            cache.reset_stats()
         self.hit_counters = {"l1": 0, "l2": 0, "l3": 0, "miss": 0}
     
     def stats(self) -> Dict[str, Any]:
@@ -241,7 +187,7 @@ class PerformanceOptimizer:
     
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self.cache = MultiLevelCache()
+        self.cache = MultiLevelCache(name="performance.optimizer")
         self.connection_pool = DatabaseConnectionPool(db_path)
         self.performance_metrics = []
         self.optimization_enabled = True
@@ -525,7 +471,7 @@ def cache_result(ttl: float = 300, level: CacheLevel = CacheLevel.L2):
             return result
         
         # Add cache to wrapper
-        wrapper._cache = MultiLevelCache()
+        wrapper._cache = MultiLevelCache(name=f"performance.cache_result.{func.__qualname__}")
         return wrapper
     return decorator
 
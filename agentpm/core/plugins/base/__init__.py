@@ -19,11 +19,16 @@ from .types import (
     PluginCategory,
     ProjectFacts,
     CodeAmalgamation,
+    PluginTiming,
 )
+from .execution import PluginRun, run_plugins
 
 __all__ = [
     "BasePlugin",
     "PluginCategory",
     "ProjectFacts",
     "CodeAmalgamation",
+    "PluginTiming",
+    "PluginRun",
+    "run_plugins",
 ]
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Plugin Execution - Concurrent Plugin Runs with Timeouts
+
+Runs one callable per plugin on a thread pool. Plugin work (detect, fact
+extraction, code amalgamation) is dominated by file I/O, so a polyglot project
+with 10+ detected technologies is bounded by the slowest plugin rather than
+the sum of all plugins.
+
+Guarantees:
+- Outcomes are returned in input order, whatever order plugins finish in
+- A plugin exceeding its timeout is reported as timed out and no longer waited for
+- An overall budget caps the whole run; plugins not finished by then time out
+- max_workers=1 runs plugins inline on the calling thread (no pool, so
+  per-plugin timeouts are not enforced; the budget still skips later plugins)
+
+Python threads cannot be killed, so a timed-out plugin keeps running in the
+background until it returns. Callers pass a cancel Event to plugin work that
+has side effects (e.g. writing files) and check it before committing them.
+
+Pattern: Pure helper (no plugin-specific logic), used by DetectionOrchestrator
+and PluginOrchestrator
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar('T')
+
+STATUS_OK = 'ok'
+STATUS_FAILED = 'failed'
+STATUS_TIMEOUT = 'timeout'
+
+DEFAULT_MAX_WORKERS = 8
+
+# Poll interval while waiting for queued plugins to start
+_START_POLL_S = 0.05
+
+
+@dataclass
+class PluginRun(Generic[T]):
+    """
+    Outcome of running one plugin.
+
+    Attributes:
+        item: The plugin (or other input) that was run
+        status: 'ok', 'failed' or 'timeout'
+        value: Return value (None unless status is 'ok')
+        error: Error message for failed/timed-out runs
+        duration_ms: Wall time from start to finish (or to the timeout)
+        cancel: Event set when the run timed out (checked by side-effecting work)
+    """
+    item: Any
+    status: str = STATUS_OK
+    value: Optional[T] = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+    cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+
+def run_plugins(
+    items: Sequence[Any],
+    func: Callable[[Any, threading.Event], T],
+    max_workers: Optional[int] = None,
+    timeout_s: Optional[float] = None,
+    budget_s: Optional[float] = None,
+) -> List[PluginRun[T]]:
+    """
+    Run func(item, cancel_event) for every item, concurrently.
+
+    Args:
+        items: Plugins to run
+        func: Work per plugin; receives the plugin and its cancel Event
+        max_workers: Thread pool size (None: min(len(items), 8); 1: inline)
+        timeout_s: Per-plugin timeout, measured from when the plugin starts
+        budget_s: Overall budget for the whole run
+
+    Returns:
+        One PluginRun per item, in input order
+
+    Example:
+        >>> runs = run_plugins(plugins, lambda p, cancel: p.detect(path), timeout_s=5.0)
+        >>> {run.item.plugin_id: run.value for run in runs if run.ok}
+    """
+    runs = [PluginRun(item=item) for item in items]
+    if not runs:
+        return runs
+
+    workers = max_workers or min(len(runs), DEFAULT_MAX_WORKERS)
+    unbounded = timeout_s is None and budget_s is None
+    if max_workers == 1 or (workers == 1 and unbounded):
+        _run_inline(runs, func, budget_s)
+        return runs
+
+    started: Dict[int, float] = {}
+    finished: Dict[int, float] = {}
+    run_start = time.perf_counter()
+    budget_deadline = run_start + budget_s if budget_s is not None else None
+
+    def _execute(index: int) -> T:
+        started[index] = time.perf_counter()
+        try:
+            return func(runs[index].item, runs[index].cancel)
+        finally:
+            finished[index] = time.perf_counter()
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='apm-plugin')
+    try:
+        futures: Dict[Future, int] = {
+            executor.submit(_execute, index): index for index in range(len(runs))
+        }
+        pending = set(futures)
+
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=_next_wait(pending, futures, started, timeout_s, budget_deadline),
+                return_when=FIRST_COMPLETED
+            )
+            now = time.perf_counter()
+
+            for future in done:
+                index = futures[future]
+                _record_result(runs[index], future, started.get(index, now), finished.get(index, now))
+
+            for future in list(pending):
+                index = futures[future]
+                begun = started.get(index)
+                overdue = timeout_s is not None and begun is not None and now - begun >= timeout_s
+                over_budget = budget_deadline is not None and now >= budget_deadline
+                if overdue or over_budget:
+                    future.cancel()
+                    pending.discard(future)
+                    _record_timeout(runs[index], begun or now, now, timeout_s if overdue else budget_s)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return runs
+
+
+def _run_inline(runs: List[PluginRun], func: Callable, budget_s: Optional[float]) -> None:
+    """Sequential execution on the calling thread (timeouts cannot be enforced)"""
+    budget_deadline = time.perf_counter() + budget_s if budget_s is not None else None
+
+    for run in runs:
+        begun = time.perf_counter()
+        if budget_deadline is not None and begun >= budget_deadline:
+            _record_timeout(run, begun, begun, budget_s)
+            continue
+        try:
+            run.value = func(run.item, run.cancel)
+        except Exception as e:
+            run.status = STATUS_FAILED
+            run.error = str(e) or type(e).__name__
+        run.duration_ms = (time.perf_counter() - begun) * 1000
+
+
+def _next_wait(
+    pending: set,
+    futures: Dict[Future, int],
+    started: Dict[int, float],
+    timeout_s: Optional[float],
+    budget_deadline: Optional[float]
+) -> Optional[float]:
+    """Seconds until the next plugin deadline (None: wait for a completion)"""
+    deadlines = []
+    if budget_deadline is not None:
+        deadlines.append(budget_deadline)
+    if timeout_s is not None:
+        for future in pending:
+            begun = started.get(futures[future])
+            if begun is None:
+                # Queued or just starting - re-check shortly for its start time
+                deadlines.append(time.perf_counter() + _START_POLL_S)
+            else:
+                deadlines.append(begun + timeout_s)
+
+    if not deadlines:
+        return None
+    return max(0.0, min(deadlines) - time.perf_counter())
+
+
+def _record_result(run: PluginRun, future: Future, begun: float, ended: float) -> None:
+    run.duration_ms = (ended - begun) * 1000
+    try:
+        run.value = future.result()
+    except Exception as e:
+        run.status = STATUS_FAILED
+        run.error = str(e) or type(e).__name__
+
+
+def _record_timeout(run: PluginRun, begun: float, now: float, limit: Optional[float]) -> None:
+    run.cancel.set()
+    run.status = STATUS_TIMEOUT
+    run.error = f"Timed out after {limit:.1f}s" if limit is not None else "Timed out"
+    run.duration_ms = (now - begun) * 1000
+
+
+__all__ = [
+    'STATUS_OK',
+    'STATUS_FAILED',
+    'STATUS_TIMEOUT',
+    'DEFAULT_MAX_WORKERS',
+    'PluginRun',
+    'run_plugins',
+]
@@ -8,7 +8,7 @@ Pattern: Pydantic BaseModel with Field validation
 
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 
@@ -82,6 +82,24 @@ class ContextDelta(BaseModel):
     recommendations: list[str] = Field(default_factory=list)
 
 
+class PluginTiming(BaseModel):
+    """
+    Execution record for one plugin during enrichment.
+
+    Attributes:
+        plugin_id: Plugin identifier
+        duration_ms: Wall time spent in the plugin
+        status: 'ok', 'failed' or 'timeout'
+        error: Failure or timeout message
+    """
+    model_config = ConfigDict(validate_assignment=True)
+
+    plugin_id: str = Field(..., min_length=1)
+    duration_ms: float = Field(default=0.0, ge=0)
+    status: str = Field(default='ok', pattern=r'^(ok|failed|timeout)$')
+    error: Optional[str] = None
+
+
 class EnrichmentResult(BaseModel):
     """
     Combined result from all plugins.
@@ -94,6 +112,7 @@ class EnrichmentResult(BaseModel):
         total_plugins: Number of plugins that contributed
         enriched_at: When enrichment occurred
         enrichment_time_ms: Time taken for enrichment in milliseconds
+        plugin_timings: Per-plugin timing and status (in plugin order)
     """
     model_config = ConfigDict(validate_assignment=True)
 
@@ -102,6 +121,7 @@ class EnrichmentResult(BaseModel):
     total_plugins: int = Field(default=0, ge=0)
     enriched_at: datetime = Field(default_factory=datetime.now)
     enrichment_time_ms: float = Field(default=0.0, ge=0)
+    plugin_timings: list[PluginTiming] = Field(default_factory=list)
 
     def add_delta(self, delta: ContextDelta) -> None:
         """Add a context delta from a plugin."""
@@ -113,4 +133,8 @@ class EnrichmentResult(BaseModel):
         all_recs = []
         for delta in self.deltas:
             all_recs.extend(delta.recommendations)
-        return all_recs
\ No newline at end of file
+        return all_recs
+
+    def get_slowest_plugin(self) -> Optional[PluginTiming]:
+        """Get the plugin that bounded enrichment time (None if no plugins ran)."""
+        return max(self.plugin_timings, key=lambda t: t.duration_ms, default=None)
\ No newline at end of file
@@ -4,15 +4,22 @@ Plugin Orchestrator - Selective Plugin Loading
 Loads plugins ONLY for detected technologies.
 Type-safe with Pydantic models throughout.
 
+Plugins enrich concurrently (see base/execution.py): enrichment time is
+bounded by the slowest plugin, and deltas are merged in plugin_id order so
+results do not depend on which plugin finishes first.
+
 Pattern: Dynamic plugin loading based on detection results
 """
 
+import threading
 from pathlib import Path
-from typing import List, Type, Optional
+from typing import Any, Dict, List, Type, Optional
 import time
 
+from ..performance.cache import TTLCache
+from .base.execution import run_plugins
 from .base.plugin_interface import BasePlugin
-from .base.types import EnrichmentResult, ContextDelta
+from .base.types import EnrichmentResult, ContextDelta, PluginTiming
 from ..detection.models import DetectionResult
 
 
@@ -53,15 +60,27 @@ class PluginOrchestrator:
         'sqlite': 'domains.data.sqlite.SQLitePlugin',
     }
 
-    def __init__(self, min_confidence: float = 0.5):
+    def __init__(
+        self,
+        min_confidence: float = 0.5,
+        max_workers: Optional[int] = None,
+        plugin_timeout_s: Optional[float] = 30.0,
+        budget_s: Optional[float] = None
+    ):
         """
         Initialize orchestrator with confidence threshold.
 
         Args:
             min_confidence: Minimum confidence to load plugin (0.0-1.0)
+            max_workers: Plugins enriched in parallel (None: auto, 1: sequential)
+            plugin_timeout_s: Per-plugin time limit (None: unlimited)
+            budget_s: Time limit for the whole enrichment (None: unlimited)
         """
         self.min_confidence = min_confidence
-        self._plugin_cache: dict[str, Type[BasePlugin]] = {}
+        self.max_workers = max_workers
+        self.plugin_timeout_s = plugin_timeout_s
+        self.budget_s = budget_s
+        self._plugin_cache = TTLCache('plugins.classes', maxsize=None)  # tech -> plugin class
 
     def load_plugins_for(self, detection: DetectionResult) -> List[BasePlugin]:
         """
@@ -115,7 +134,8 @@ class PluginOrchestrator:
                     ContextDelta(plugin_id='lang:python', additions={...}, recommendations=[...]),
                 ],
                 total_recommendations=5,
-                enrichment_time_ms=45.2
+                enrichment_time_ms=45.2,
+                plugin_timings=[PluginTiming(plugin_id='lang:python', duration_ms=41.7, status='ok')]
             )
         """
         start_time = time.perf_counter()
@@ -134,53 +154,38 @@ class PluginOrchestrator:
         contexts_dir = project_path / ".agentpm" / "contexts"
         contexts_dir.mkdir(parents=True, exist_ok=True)
 
-        # Each plugin extracts facts AND generates code amalgamations
-        for plugin in plugins:
-            try:
-                # Extract project facts
-                facts = plugin.extract_project_facts(project_path)
-
-                # Generate code amalgamations and write to files
-                amalgamations = plugin.generate_code_amalgamations(project_path)
-                amalgamation_files = {}
-
-                for amalgamation_type, content in amalgamations.items():
-                    # Skip if content is empty or just headers
-                    # Headers are typically "# Title\n# Generated: date\n\n"
-                    if not content:
-                        continue
-
-                    # Count actual content lines (not headers/comments/blank)
-                    lines = content.split('\n')
-                    content_lines = [l for l in lines if l.strip() and not l.strip().startswith('#')]
-
-                    if len(content_lines) == 0:  # No actual content, just headers
-                        continue
-
-                    # File naming: plugin_id_type.txt (e.g., lang:python_classes.txt)
-                    safe_plugin_id = plugin.plugin_id.replace(':', '_')
-                    filename = f"{safe_plugin_id}_{amalgamation_type}"
-                    if not filename.endswith('.txt'):
-                        filename += '.txt'
-
-                    file_path = contexts_dir / filename
-                    file_path.write_text(content, encoding='utf-8')
-                    amalgamation_files[amalgamation_type] = str(file_path.relative_to(project_path))
-
-                # Add amalgamation file paths to facts
-                if amalgamation_files:
-                    facts['amalgamation_files'] = amalgamation_files
-
-                # Convert to ContextDelta
-                delta = ContextDelta(
-                    plugin_id=plugin.plugin_id,
-                    additions=facts,
-                    recommendations=[]  # Can be enhanced later
-                )
-                result.add_delta(delta)  # Type-safe addition
-            except Exception as e:
+        # Each plugin extracts facts AND generates code amalgamations (concurrently)
+        plugins.sort(key=lambda plugin: plugin.plugin_id)
+        runs = run_plugins(
+            plugins,
+            lambda plugin, cancel: self._enrich_with_plugin(plugin, project_path, contexts_dir, cancel),
+            max_workers=self.max_workers,
+            timeout_s=self.plugin_timeout_s,
+            budget_s=self.budget_s
+        )
+
+        # Merge in plugin_id order (deterministic regardless of completion order)
+        for run in runs:
+            plugin = run.item
+            result.plugin_timings.append(PluginTiming(
+                plugin_id=plugin.plugin_id,
+                duration_ms=run.duration_ms,
+                status=run.status,
+                error=run.error
+            ))
+
+            if not run.ok:
                 # Log error but continue with other plugins
-                print(f"Plugin {plugin.plugin_id} failed: {e}")
+                print(f"Plugin {plugin.plugin_id} failed: {run.error}")
+                continue
+
+            # Convert to ContextDelta
+            delta = ContextDelta(
+                plugin_id=plugin.plugin_id,
+                additions=run.value,
+                recommendations=[]  # Can be enhanced later
+            )
+            result.add_delta(delta)  # Type-safe addition
 
         # Set enrichment time
         elapsed_ms = (time.perf_counter() - start_time) * 1000
@@ -188,6 +193,61 @@ class PluginOrchestrator:
 
         return result
 
+    def _enrich_with_plugin(
+        self,
+        plugin: BasePlugin,
+        project_path: Path,
+        contexts_dir: Path,
+        cancel: threading.Event
+    ) -> Dict[str, Any]:
+        """
+        Extract facts and write code amalgamations for one plugin.
+
+        Runs on a worker thread. Amalgamation files are not written once the
+        plugin has timed out (cancel is set).
+
+        Returns:
+            Project facts, with 'amalgamation_files' when files were written
+        """
+        # Extract project facts
+        facts = plugin.extract_project_facts(project_path)
+
+        # Generate code amalgamations and write to files
+        amalgamations = plugin.generate_code_amalgamations(project_path)
+        amalgamation_files = {}
+
+        for amalgamation_type, content in amalgamations.items():
+            # Skip if content is empty or just headers
+            # Headers are typically "# Title\n# Generated: date\n\n"
+            if not content:
+                continue
+
+            # Count actual content lines (not headers/comments/blank)
+            lines = content.split('\n')
+            content_lines = [l for l in lines if l.strip() and not l.strip().startswith('#')]
+
+            if len(content_lines) == 0:  # No actual content, just headers
+                continue
+
+            if cancel.is_set():
+                break
+
+            # File naming: plugin_id_type.txt (e.g., lang:python_classes.txt)
+            safe_plugin_id = plugin.plugin_id.replace(':', '_')
+            filename = f"{safe_plugin_id}_{amalgamation_type}"
+            if not filename.endswith('.txt'):
+                filename += '.txt'
+
+            file_path = contexts_dir / filename
+            file_path.write_text(content, encoding='utf-8')
+            amalgamation_files[amalgamation_type] = str(file_path.relative_to(project_path))
+
+        # Add amalgamation file paths to facts
+        if amalgamation_files:
+            facts['amalgamation_files'] = amalgamation_files
+
+        return facts
+
     def _import_plugin(self, tech_name: str) -> Optional[Type[BasePlugin]]:
         """
         Import plugin class dynamically with caching.
@@ -199,8 +259,9 @@ class PluginOrchestrator:
             Plugin class or None if import fails
         """
         # Check cache
-        if tech_name in self._plugin_cache:
-            return self._plugin_cache[tech_name]
+        plugin_class = self._plugin_cache.get(tech_name)
+        if plugin_class is not None:
+            return plugin_class
 
         # Import plugin
         try:
@@ -210,7 +271,7 @@ class PluginOrchestrator:
             plugin_class = getattr(module, class_name)
 
             # Cache for future use
-            self._plugin_cache[tech_name] = plugin_class
+            self._plugin_cache.set(tech_name, plugin_class, tags=['plugins'])
             return plugin_class
 
         except (ImportError, AttributeError) as e:
@@ -12,6 +12,7 @@ Pattern: Registry pattern with lazy loading
 from pathlib import Path
 from typing import Dict, Type, List, Optional
 
+from ..performance.cache import cached_method
 from .base.plugin_interface import BasePlugin
 from .domains.languages.python import PythonPlugin
 from .domains.testing.pytest import PytestPlugin
@@ -42,15 +43,14 @@ class PluginRegistry:
         # 'nextjs': NextJsPlugin,
     }
 
-    def __init__(self):
-        """Initialize registry with empty cache"""
-        self._plugin_cache: Dict[str, BasePlugin] = {}
-
+    @cached_method(name='plugins.instances', maxsize=None,
+                   tags=lambda self, technology: ['plugins', f"plugin:{technology}"])
     def get_plugin(self, technology: str) -> Optional[BasePlugin]:
         """
         Get plugin instance for technology.
 
-        Lazy loads and caches plugins for performance.
+        Lazy loads and caches plugins for performance (per registry,
+        invalidated with get_plugin.invalidate_tag(registry, 'plugin:<tech>')).
 
         Args:
             technology: Technology name (e.g., 'python', 'django')
@@ -63,20 +63,12 @@ class PluginRegistry:
             python_plugin = registry.get_plugin('python')
             facts = python_plugin.extract_project_facts(project_path)
         """
-        # Check cache
-        if technology in self._plugin_cache:
-            return self._plugin_cache[technology]
-
         # Check if plugin exists
         if technology not in self.PLUGIN_MAP:
             return None
 
-        # Instantiate and cache
-        plugin_class = self.PLUGIN_MAP[technology]
-        plugin_instance = plugin_class()
-        self._plugin_cache[technology] = plugin_instance
-
-        return plugin_instance
+        # Instantiate (cached by @cached_method)
+        return self.PLUGIN_MAP[technology]()
 
     def get_plugins_for_technologies(
         self,
@@ -17,8 +17,12 @@ from ..database.service import DatabaseService
 from ..database.enums import EntityType
 from ..database.models.search_result import SearchResult, SearchResults, SearchResultType
 from .models import SearchQuery, SearchConfig, SearchScope
+from .methods import TextSearchEngine
 from ..database.models import SearchIndex, SearchMetrics
 
+# LIKE matches read by the fallback searches before BM25 ranking
+FALLBACK_CANDIDATE_LIMIT = 5000
+
 
 @dataclass
 class FTS5SearchResult:
@@ -60,9 +64,16 @@ class FTS5SearchService:
     - Metadata-based filtering
     """
     
-    def __init__(self, db_service: DatabaseService, config: Optional[SearchConfig] = None):
+    def __init__(
+        self,
+        db_service: DatabaseService,
+        config: Optional[SearchConfig] = None,
+        text_engine: Optional[TextSearchEngine] = None
+    ):
         self.db_service = db_service
         self.config = config or SearchConfig()
+        # Ranks LIKE matches with BM25 when FTS5 is unavailable
+        self.text_engine = text_engine or TextSearchEngine(self.config)
         self.fts5_available = self._check_fts5_availability()
         
         if not self.fts5_available:
@@ -293,41 +304,51 @@ class FTS5SearchService:
         )
     
     def _fallback_search(self, query: SearchQuery) -> SearchResults:
-        """Fallback to LIKE-based search when FTS5 is not available."""
-        # Simple LIKE-based search implementation
-        sql = """
+        """
+        Fallback to LIKE-based search when FTS5 is not available.
+
+        Rows matching any query term are ranked with BM25 by the text engine
+        (title and content), then paginated.
+        """
+        terms = self.text_engine.tokenize(query.query) or [query.query]
+        where = " OR ".join(["(title LIKE ? OR content LIKE ?)"] * len(terms))
+        params = [pattern for term in terms for pattern in (f"%{term}%", f"%{term}%")]
+
+        sql = f"""
         SELECT entity_id, entity_type, title, content, metadata
         FROM search_index 
-        WHERE (title LIKE ? OR content LIKE ?)
-        LIMIT ? OFFSET ?
+        WHERE {where}
+        LIMIT ?
         """
         
-        search_term = f"%{query.query}%"
-        
         with self.db_service.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute(sql, (search_term, search_term, query.limit, query.offset))
+            cursor.execute(sql, (*params, FALLBACK_CANDIDATE_LIMIT))
             
-            results = []
-            for i, row in enumerate(cursor.fetchall()):
-                result = SearchResult(
-                    id=i + 1,
+            candidates = [
+                SearchResult(
+                    id=position + 1,
                     entity_id=row[0],
                     entity_type=EntityType(row[1]),
                     result_type=SearchResultType(row[1]),
                     title=row[2],
                     content=row[3],
-                    relevance_score=1.0,  # No relevance scoring in fallback
+                    relevance_score=0.0,
                     match_type="like",
                     matched_fields=["title", "content"],
                     search_query=query.query,
                     metadata=json.loads(row[4]) if row[4] else {}
                 )
-                results.append(result)
+                for position, row in enumerate(cursor.fetchall())
+            ]
+            ranked = self.text_engine.rank(query.query, candidates, index_name=None)
+            results = ranked[query.offset:query.offset + query.limit]
+            for position, result in enumerate(results):
+                result.id = position + 1
             
             # Get total count
-            count_sql = "SELECT COUNT(*) FROM search_index WHERE (title LIKE ? OR content LIKE ?)"
-            cursor.execute(count_sql, (search_term, search_term))
+            count_sql = f"SELECT COUNT(*) FROM search_index WHERE {where}"
+            cursor.execute(count_sql, params)
             total_count = cursor.fetchone()[0]
             
             # Calculate statistics for fallback
@@ -542,7 +563,7 @@ class FTS5SearchService:
         summary_type: Optional[str] = None,
         limit: int = 50
     ) -> List[SearchResult]:
-        """Fallback to LIKE-based search when FTS5 is not available."""
+        """Fallback to LIKE-based search when FTS5 is not available, ranked with BM25."""
         search_term = f"%{query}%"
 
         # Build WHERE clause with optional filters
@@ -557,8 +578,6 @@ class FTS5SearchService:
             where_clauses.append("summary_type = ?")
             params.append(summary_type)
 
-        params.append(limit)
-
         sql = f"""
         SELECT
             id, entity_id, entity_type, summary_type, summary_text,
@@ -571,9 +590,9 @@ class FTS5SearchService:
 
         with self.db_service.connect() as conn:
             cursor = conn.cursor()
-            cursor.execute(sql, params)
+            cursor.execute(sql, (*params, FALLBACK_CANDIDATE_LIMIT))
 
-            results = []
+            candidates = []
             for i, row in enumerate(cursor.fetchall()):
                 title = f"{row[2].replace('_', ' ').title()} {row[3].replace('_', ' ').title()}"
 
@@ -583,8 +602,8 @@ class FTS5SearchService:
                     entity_type=EntityType(row[2]),
                     result_type=SearchResultType.SUMMARY,
                     title=title,
-                    content=row[4][:200] if len(row[4]) > 200 else row[4],
-                    relevance_score=1.0,  # No relevance scoring in fallback
+                    content=row[4],
+                    relevance_score=0.0,
                     match_type="like",
                     matched_fields=["summary_text", "context_metadata"],
                     search_query=query,
@@ -595,6 +614,13 @@ class FTS5SearchService:
                         "created_at": row[6]
                     }
                 )
-                results.append(result)
+                candidates.append(result)
+
+            # BM25 over the full summary text; ties keep newest first
+            results = self.text_engine.rank(query, candidates, limit=limit, index_name=None)
+            for position, result in enumerate(results):
+                result.id = position + 1
+                if len(result.content) > 200:
+                    result.content = result.content[:200]
 
             return results
@@ -5,8 +5,12 @@ Core search algorithms, indexing, and ranking functionality.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterable, Hashable, Sequence
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+import heapq
+import math
 import time
 import re
 import sqlite3
@@ -17,6 +21,137 @@ from ..database.enums import EntityType
 from ..database.models.search_result import SearchResult, SearchResults
 from .models import SearchQuery, SearchFilter, SearchConfig
 from ..database.models import SearchIndex, SearchMetrics
+from ..performance import TTLCache
+
+
+_NON_WORD = re.compile(r'[^\w\s]')
+
+# Tokenized texts kept per engine (text digest -> tokens)
+TOKEN_CACHE_SIZE = 4096
+# Inverted indexes kept per engine (one per corpus snapshot name)
+INDEX_CACHE_SIZE = 16
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def _corpus_digest(corpus: Sequence[str]) -> bytes:
+    """Content digest of a corpus (length-prefixed, so document boundaries count)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for text in corpus:
+        data = (text or '').encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.digest()
+
+
+@lru_cache(maxsize=256)
+def _highlight_pattern(query: str) -> 're.Pattern':
+    """Compiled case-insensitive pattern for highlighting a query"""
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index over one corpus snapshot.
+
+    Stores term -> postings ({document key: term frequency}) and document
+    lengths, so scoring only visits documents that contain a query term.
+    IDF values are computed once per term and cached.
+
+    The index is immutable; ``version`` identifies the snapshot it was
+    built from so callers can tell when to rebuild it.
+    """
+
+    def __init__(self, documents: Iterable[Tuple[Hashable, Sequence[str]]], version: Any = None):
+        """
+        Build the index.
+
+        Args:
+            documents: (document key, tokens) pairs
+            version: Snapshot identifier (compared by the caller)
+        """
+        self.version = version
+        postings: Dict[str, Dict[Hashable, int]] = defaultdict(dict)
+        self.doc_lengths: Dict[Hashable, int] = {}
+        self._order: Dict[Hashable, int] = {}
+
+        for key, tokens in documents:
+            self._order.setdefault(key, len(self._order))
+            self.doc_lengths[key] = len(tokens)
+            for term, frequency in Counter(tokens).items():
+                postings[term][key] = frequency
+
+        self.postings: Dict[str, Dict[Hashable, int]] = dict(postings)
+        self.document_count = len(self.doc_lengths)
+        self.avg_doc_length = (
+            sum(self.doc_lengths.values()) / self.document_count if self.document_count else 0.0
+        )
+        self._idf: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return self.document_count
+
+    def document_frequency(self, term: str) -> int:
+        """Number of documents containing the term"""
+        return len(self.postings.get(term, ()))
+
+    def term_frequency(self, term: str, key: Hashable) -> int:
+        """Occurrences of the term in one document"""
+        return self.postings.get(term, {}).get(key, 0)
+
+    def idf(self, term: str) -> float:
+        """BM25 inverse document frequency (cached per term)"""
+        idf = self._idf.get(term)
+        if idf is None:
+            doc_freq = self.document_frequency(term)
+            idf = math.log(1.0 + (self.document_count - doc_freq + 0.5) / (doc_freq + 0.5))
+            self._idf[term] = idf
+        return idf
+
+    def bm25(self, terms: Iterable[str], k1: float = BM25_K1, b: float = BM25_B) -> Dict[Hashable, float]:
+        """
+        Score documents against query terms with Okapi BM25.
+
+        Args:
+            terms: Query terms (already tokenized)
+            k1: Term frequency saturation
+            b: Document length normalization
+
+        Returns:
+            Document key -> score, for documents matching at least one term
+        """
+        scores: Dict[Hashable, float] = defaultdict(float)
+        avg_length = self.avg_doc_length or 1.0
+
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term)
+            for key, frequency in postings.items():
+                norm = k1 * (1.0 - b + b * self.doc_lengths[key] / avg_length)
+                scores[key] += idf * frequency * (k1 + 1.0) / (frequency + norm)
+
+        return dict(scores)
+
+    def top_k(
+        self,
+        terms: Iterable[str],
+        k: int,
+        k1: float = BM25_K1,
+        b: float = BM25_B
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Highest scoring documents, ties broken by corpus order.
+
+        Returns:
+            Up to k (document key, score) pairs, best first
+        """
+        scores = self.bm25(terms, k1, b)
+        order = self._order
+        return heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -order[item[0]]))
 
 
 class TextSearchEngine:
@@ -24,6 +159,8 @@ class TextSearchEngine:
     
     def __init__(self, config: SearchConfig):
         self.config = config
+        self._token_cache = TTLCache('search.tokens', maxsize=TOKEN_CACHE_SIZE)
+        self._indexes = TTLCache('search.inverted_indexes', maxsize=INDEX_CACHE_SIZE)
         self.stop_words = {
             'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
             'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
@@ -38,39 +175,205 @@ class TextSearchEngine:
     
     def tokenize(self, text: str) -> List[str]:
         """Tokenize text into searchable terms."""
+        return list(self._tokens(text))
+    
+    def _tokens(self, text: str) -> Tuple[str, ...]:
+        """Tokenize with a per-engine cache keyed by text digest (tokens are immutable)."""
+        if not text:
+            return ()
+        
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        tokens = self._token_cache.get(key)
+        if tokens is None:
+            tokens = self._tokenize(text)
+            self._token_cache.set(key, tokens)
+        
+        return tokens
+    
+    def _tokenize(self, text: str) -> Tuple[str, ...]:
+        """Tokenize without caching."""
         if not text:
-            return []
+            return ()
         
         # Convert to lowercase and remove special characters
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
+        words = _NON_WORD.sub(' ', text.lower()).split()
         
-        # Split into words and filter out stop words
-        words = [word for word in text.split() if word not in self.stop_words and len(word) > 2]
+        # Filter out stop words and short words
+        return tuple(word for word in words if word not in self.stop_words and len(word) > 2)
+    
+    def build_index(self, documents: Iterable[Tuple[Hashable, str]], version: Any = None) -> InvertedIndex:
+        """
+        Build an inverted index over (document key, text) pairs.
         
-        return words
+        Args:
+            documents: Documents to index
+            version: Snapshot identifier stored on the index
+            
+        Returns:
+            InvertedIndex
+        """
+        return InvertedIndex(((key, self._tokenize(text)) for key, text in documents), version=version)
+    
+    def get_index(
+        self,
+        name: Hashable,
+        documents: Iterable[Tuple[Hashable, str]],
+        version: Any
+    ) -> InvertedIndex:
+        """
+        Get the cached index for a corpus, rebuilding it when its version changes.
+        
+        Args:
+            name: Corpus name (one cached index per name)
+            documents: (document key, text) pairs; only read on rebuild
+            version: Current snapshot version (e.g. entity ids and updated_at)
+            
+        Returns:
+            InvertedIndex for this snapshot
+        """
+        index = self._indexes.get(name)
+        if index is None or index.version != version:
+            index = self.build_index(documents, version=version)
+            self._indexes.set(name, index)
+        return index
+    
+    def _corpus_index(self, corpus: Sequence[str], version: Optional[Hashable]) -> InvertedIndex:
+        """
+        Index for a TF-IDF corpus without re-reading an unchanged corpus.
+        
+        With no explicit version the key is a digest of the corpus text, so
+        any change (including an in-place edit of the same length) rebuilds
+        the index. Hashing is far cheaper than tokenizing; callers that
+        already track snapshots can pass a version to skip it.
+        """
+        if version is None:
+            version = ('digest', _corpus_digest(corpus))
+        return self.get_index('corpus', enumerate(corpus), version=version)
     
-    def calculate_tf_idf(self, term: str, document: str, corpus: List[str]) -> float:
+    def calculate_tf_idf(
+        self,
+        term: str,
+        document: str,
+        corpus: List[str],
+        corpus_version: Optional[Hashable] = None
+    ) -> float:
         """
         Calculate TF-IDF score for a term in a document.
         
+        Document frequencies come from an inverted index built once per
+        corpus snapshot; each call costs the document's length, not the
+        corpus size.
+        
         Args:
             term: Search term
             document: Document text
             corpus: All documents in the corpus
+            corpus_version: Snapshot identifier (default: digest of the corpus)
             
         Returns:
             TF-IDF score
         """
+        term = term.lower()
+        
         # Term frequency in document
-        doc_words = self.tokenize(document)
-        tf = doc_words.count(term.lower()) / len(doc_words) if doc_words else 0
+        doc_words = self._tokens(document)
+        tf = doc_words.count(term) / len(doc_words) if doc_words else 0
         
         # Document frequency in corpus
-        doc_freq = sum(1 for doc in corpus if term.lower() in self.tokenize(doc))
+        doc_freq = self._corpus_index(corpus, corpus_version).document_frequency(term)
         idf = 1.0 if doc_freq == 0 else len(corpus) / doc_freq
         
         return tf * idf
     
+    def tf_idf_scores(
+        self,
+        terms: List[str],
+        corpus: List[str],
+        corpus_version: Optional[Hashable] = None
+    ) -> List[float]:
+        """
+        Summed TF-IDF score of the terms for every document in a corpus.
+        
+        Same values as calling calculate_tf_idf per term and document,
+        from a single index pass.
+        
+        Args:
+            terms: Search terms
+            corpus: All documents in the corpus
+            corpus_version: Snapshot identifier (default: digest of the corpus)
+            
+        Returns:
+            One score per corpus document, in corpus order
+        """
+        index = self._corpus_index(corpus, corpus_version)
+        
+        scores = [0.0] * len(corpus)
+        for term in terms:
+            term = term.lower()
+            postings = index.postings.get(term)
+            if not postings:
+                continue
+            idf = len(corpus) / len(postings)
+            for position, frequency in postings.items():
+                scores[position] += frequency / index.doc_lengths[position] * idf
+        
+        return scores
+    
+    def rank(
+        self,
+        query: str,
+        results: List[SearchResult],
+        limit: Optional[int] = None,
+        index_name: Optional[Hashable] = 'results'
+    ) -> List[SearchResult]:
+        """
+        Rank search results against a query with BM25.
+        
+        The index over the results (title and content) is cached under
+        index_name and rebuilt only when the entities or their updated_at
+        change; with index_name=None it is built for this call only (for
+        candidate sets that change with every query). relevance_score is
+        set to the BM25 score normalized to 0.0-1.0; results matching no
+        query term score 0.0.
+        
+        Args:
+            query: Search query
+            results: Candidate results
+            limit: Maximum results to return (None: all)
+            index_name: Cache slot for this candidate set (None: no caching)
+            
+        Returns:
+            Results ordered best first
+        """
+        documents = (
+            (position, f"{result.title} {result.content}") for position, result in enumerate(results)
+        )
+        if index_name is None:
+            index = self.build_index(documents)
+        else:
+            version = tuple(
+                (result.entity_type, result.entity_id, result.updated_at) for result in results
+            )
+            index = self.get_index(index_name, documents, version=version)
+        
+        ranked = index.top_k(self._tokens(query), limit if limit is not None else len(results))
+        best = ranked[0][1] if ranked else 0.0
+        
+        ordered = []
+        for position, score in ranked:
+            result = results[position]
+            result.relevance_score = min(1.0, score / best) if best > 0 else 0.0
+            ordered.append(result)
+        
+        if limit is None or len(ordered) < limit:
+            matched = {position for position, _ in ranked}
+            for position, result in enumerate(results):
+                if position not in matched:
+                    result.relevance_score = 0.0
+                    ordered.append(result)
+        
+        return ordered[:limit] if limit is not None else ordered
+    
     def calculate_relevance(self, query: str, text: str, field_weights: Optional[Dict[str, float]] = None) -> float:
         """
         Calculate relevance score between query and text.
@@ -94,8 +397,8 @@ class TextSearchEngine:
             base_score = 1.0
         else:
             # Calculate word overlap
-            query_words = set(self.tokenize(query))
-            text_words = set(self.tokenize(text))
+            query_words = set(self._tokens(query))
+            text_words = set(self._tokens(text))
             
             if not query_words:
                 return 0.0
@@ -147,12 +450,8 @@ class TextSearchEngine:
         excerpt = text[start:end]
         
         # Highlight the query term
-        excerpt = re.sub(
-            re.escape(query),
-            f"**{query}**",
-            excerpt,
-            flags=re.IGNORECASE
-        )
+        highlighted = f"**{query}**"
+        excerpt = _highlight_pattern(query).sub(lambda match: highlighted, excerpt)
         
         # Add ellipsis if needed
         if start > 0:
@@ -547,6 +846,7 @@ class SearchRanker:
 
 
 __all__ = [
+    'InvertedIndex',
     'TextSearchEngine',
     'MetadataSearchEngine',
     'RelevanceCalculator',
@@ -42,9 +42,10 @@ class SearchService:
         self.db_service = db_service
         self.config = config or SearchConfig()
         
-        # Initialize FTS5 service (preferred) and fallback engines
-        self.fts5_service = FTS5SearchService(db_service, self.config)
+        # Initialize FTS5 service (preferred) and fallback engines; the text
+        # engine ranks the LIKE fallback with BM25
         self.text_engine = TextSearchEngine(self.config)
+        self.fts5_service = FTS5SearchService(db_service, self.config, text_engine=self.text_engine)
         self.metadata_engine = MetadataSearchEngine(self.config)
         self.relevance_calculator = RelevanceCalculator(self.config)
         self.indexer = SearchIndexer(db_service, self.config)
@@ -8,10 +8,12 @@ and secure command execution patterns.
 from .input_validator import InputValidator, SecurityError
 from .command_security import SecureCommandExecutor
 from .output_sanitizer import OutputSanitizer
+from .scrubber import Scrubber
 
 __all__ = [
     'InputValidator',
     'SecurityError',
     'SecureCommandExecutor',
-    'OutputSanitizer'
+    'OutputSanitizer',
+    'Scrubber'
 ]
\ No newline at end of file
@@ -7,11 +7,14 @@ Provides secure patterns for executing external commands without shell injection
 import subprocess
 import os
 import re
+import signal
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, TextIO
 from datetime import datetime
 
 from .input_validator import InputValidator, SecurityError
+from .scrubber import Scrubber, ci
 
 
 class SecureCommandExecutor:
@@ -28,6 +31,19 @@ class SecureCommandExecutor:
         'PYTHONPATH', 'NODE_ENV', 'JAVA_HOME', 'GOPATH'
     }
 
+    # Captured output kept per stream (10KB); the rest is drained unscrubbed
+    MAX_OUTPUT_LENGTH = 10000
+
+    # Wait for output readers after a timeout kill (seconds); a process that
+    # left the killed process group may still hold the pipes open
+    KILL_GRACE_SECONDS = 1
+
+    # Sensitive patterns removed from command output, in a single pass
+    _OUTPUT_SCRUBBER = Scrubber([
+        ('assignment', ci('password', 'token', 'key', 'secret') + r'[=:][ \t]*\S+', '[REDACTED]'),
+        ('flag', r'--' + ci('password', 'token') + r'[ \t]+\S+', '[REDACTED]'),
+    ])
+
     @classmethod
     def execute_build_command(
         cls,
@@ -73,25 +89,16 @@ class SecureCommandExecutor:
         start_time = datetime.utcnow()
 
         try:
-            result = subprocess.run(
-                command_list,  # Use list format - NO shell=True
-                cwd=str(work_dir),
-                capture_output=True,
-                text=True,
-                timeout=timeout or cls.BUILD_TIMEOUT,
-                env=secure_env,
-                check=False  # Don't raise on non-zero exit
+            # Use list format - NO shell=True; output is sanitized while streaming
+            return_code, stdout, stderr = cls._run_sanitized(
+                command_list, work_dir, secure_env, timeout or cls.BUILD_TIMEOUT
             )
 
             execution_time = (datetime.utcnow() - start_time).total_seconds()
 
-            # Sanitize output for safe logging/display
-            stdout = cls._sanitize_output(result.stdout)
-            stderr = cls._sanitize_output(result.stderr)
-
             return {
-                "success": result.returncode == 0,
-                "return_code": result.returncode,
+                "success": return_code == 0,
+                "return_code": return_code,
                 "stdout": stdout,
                 "stderr": stderr,
                 "execution_time_seconds": execution_time,
@@ -148,21 +155,11 @@ class SecureCommandExecutor:
         secure_env = cls._create_secure_environment()
 
         try:
-            result = subprocess.run(
-                command_list,
-                cwd=str(working_directory),
-                capture_output=True,
-                text=True,
-                timeout=timeout or cls.DEFAULT_TIMEOUT,
-                env=secure_env,
-                check=False
+            return_code, stdout, stderr = cls._run_sanitized(
+                command_list, working_directory, secure_env, timeout or cls.DEFAULT_TIMEOUT
             )
 
-            # Sanitize outputs
-            stdout = cls._sanitize_output(result.stdout)
-            stderr = cls._sanitize_output(result.stderr)
-
-            return (result.returncode == 0, stdout, stderr)
+            return (return_code == 0, stdout, stderr)
 
         except subprocess.TimeoutExpired:
             return (False, "", "Command timed out")
@@ -188,6 +185,94 @@ class SecureCommandExecutor:
 
         return secure_env
 
+    @classmethod
+    def _run_sanitized(
+        cls,
+        command_list: List[str],
+        working_directory: Path,
+        env: Dict[str, str],
+        timeout: float
+    ) -> Tuple[int, str, str]:
+        """
+        Run a command, sanitizing stdout/stderr line by line as they arrive
+
+        Multi-megabyte build logs are never held in memory: each stream keeps
+        at most MAX_OUTPUT_LENGTH sanitized characters and drains the rest.
+        The command runs in its own process group, so a timeout kills any
+        background children holding its output pipes as well.
+
+        Returns:
+            Tuple[int, str, str]: (return code, stdout, stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time
+        """
+        process = subprocess.Popen(
+            command_list,
+            cwd=str(working_directory),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace',
+            env=env,
+            start_new_session=True
+        )
+        outputs = ["", ""]
+        readers = [
+            threading.Thread(target=cls._collect_output, args=(stream, outputs, index), daemon=True)
+            for index, stream in enumerate((process.stdout, process.stderr))
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            return_code = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            cls._kill_process_group(process)
+            for reader in readers:
+                reader.join(timeout=cls.KILL_GRACE_SECONDS)
+            if not any(reader.is_alive() for reader in readers):
+                process.stdout.close()
+                process.stderr.close()
+            raise
+
+        for reader in readers:
+            reader.join()
+        process.stdout.close()
+        process.stderr.close()
+        return return_code, outputs[0], outputs[1]
+
+    @staticmethod
+    def _kill_process_group(process: subprocess.Popen) -> None:
+        """Kill a command started with start_new_session and everything it spawned"""
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.kill()  # no process groups (Windows) or group already gone
+        process.wait()
+
+    @classmethod
+    def _collect_output(cls, stream: TextIO, outputs: List[str], index: int) -> None:
+        """Sanitize a pipe line by line, keeping MAX_OUTPUT_LENGTH characters"""
+        kept: List[str] = []
+        length = 0
+        for line in cls._OUTPUT_SCRUBBER.stream(stream):
+            kept.append(line)
+            length += len(line)
+            if length > cls.MAX_OUTPUT_LENGTH:
+                for _ in iter(lambda: stream.read(65536), ''):
+                    pass  # drain so the process never blocks on a full pipe
+                break
+        outputs[index] = cls._truncate_output(''.join(kept))
+
+    @classmethod
+    def _truncate_output(cls, sanitized: str) -> str:
+        """Limit sanitized output to MAX_OUTPUT_LENGTH characters"""
+        if len(sanitized) > cls.MAX_OUTPUT_LENGTH:
+            sanitized = sanitized[:cls.MAX_OUTPUT_LENGTH] + "\n... [OUTPUT TRUNCATED] ..."
+        return sanitized
+
     @classmethod
     def _sanitize_output(cls, output: str) -> str:
         """
@@ -202,28 +287,8 @@ class SecureCommandExecutor:
         if not output:
             return ""
 
-        sanitized = output
-
-        # Remove potential sensitive patterns
-        sensitive_patterns = [
-            r'password[=:]\s*\S+',  # password=value
-            r'token[=:]\s*\S+',     # token=value
-            r'key[=:]\s*\S+',       # key=value
-            r'secret[=:]\s*\S+',    # secret=value
-            r'api_key[=:]\s*\S+',   # api_key=value
-            r'--password\s+\S+',    # --password value
-            r'--token\s+\S+',       # --token value
-        ]
-
-        for pattern in sensitive_patterns:
-            sanitized = re.sub(pattern, '[REDACTED]', sanitized, flags=re.IGNORECASE)
-
-        # Limit output length
-        max_output_length = 10000  # 10KB limit
-        if len(sanitized) > max_output_length:
-            sanitized = sanitized[:max_output_length] + "\n... [OUTPUT TRUNCATED] ..."
-
-        return sanitized
+        # Remove potential sensitive patterns (password=value, --token value, ...)
+        return cls._truncate_output(cls._OUTPUT_SCRUBBER.sub(output))
 
     @classmethod
     def validate_command_safety(cls, command_list: List[str]) -> bool:
@@ -7,53 +7,73 @@ safe display of potentially sensitive data.
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+from .scrubber import Scrubber, ci
+
+_KEYWORD = re.compile(r'[A-Za-z_-]+')
+
+
+def _redact_assignment(match: re.Match) -> str:
+    return f"{_KEYWORD.match(match.group()).group().lower()}=***REDACTED***"
+
+
+def _redact_flag(match: re.Match) -> str:
+    return f"--{_KEYWORD.match(match.group(), 2).group().lower()} ***REDACTED***"
+
+
+def _redact_user(match: re.Match) -> str:
+    return '/Users/***USER***' if match.group()[1] in 'Uu' else '/home/***USER***'
 
 
 class OutputSanitizer:
     """Sanitize outputs to prevent information disclosure"""
 
-    # Sensitive patterns to redact from outputs
+    # Sensitive patterns to redact from outputs: (name, pattern, replacement).
+    # All rules are compiled into one single-pass Scrubber and never match
+    # across lines, so streamed output is scrubbed exactly like whole text.
     SENSITIVE_PATTERNS = [
-        # Credential patterns
-        (r'password[=:]\s*["\']?([^"\'\s]+)["\']?', r'password=\*\*\*REDACTED\*\*\*'),
-        (r'token[=:]\s*["\']?([^"\'\s]+)["\']?', r'token=\*\*\*REDACTED\*\*\*'),
-        (r'key[=:]\s*["\']?([^"\'\s]+)["\']?', r'key=\*\*\*REDACTED\*\*\*'),
-        (r'secret[=:]\s*["\']?([^"\'\s]+)["\']?', r'secret=\*\*\*REDACTED\*\*\*'),
-        (r'api_key[=:]\s*["\']?([^"\'\s]+)["\']?', r'api_key=\*\*\*REDACTED\*\*\*'),
+        # Credential patterns (password=, token:, key=, secret=, api_key=)
+        ('assignment', ci('password', 'token', 'secret', 'api_key', 'key') + r'[=:][ \t]*["\']?[^"\'\s]+["\']?',
+         _redact_assignment),
 
         # Command line credential arguments
-        (r'--password\s+\S+', r'--password \*\*\*REDACTED\*\*\*'),
-        (r'--token\s+\S+', r'--token \*\*\*REDACTED\*\*\*'),
-        (r'--api-key\s+\S+', r'--api-key \*\*\*REDACTED\*\*\*'),
+        ('flag', r'--' + ci('password', 'token', 'api-key') + r'[ \t]+\S+', _redact_flag),
 
         # Database connection strings
-        (r'://[^:]+:[^@]+@', r'://\*\*\*REDACTED\*\*\*:\*\*\*REDACTED\*\*\*@'),
+        ('url_credentials', r'://[^:\s]+:[^@\s]+@', '://***REDACTED***:***REDACTED***@'),
 
         # File paths with usernames
-        (r'/Users/([^/\s]+)/', r'/Users/\*\*\*USER\*\*\*/'),
-        (r'/home/([^/\s]+)/', r'/home/\*\*\*USER\*\*\*/'),
-        (r'C:\\Users\\([^\\]+)\\', r'C:\\Users\\\*\*\*USER\*\*\*\\'),
+        ('user_path', r'/' + ci('Users', 'home') + r'/[^/\s]+(?=/)', _redact_user),
+        ('windows_user_path', r'[Cc]:\\' + ci('Users') + r'\\[^\\\n]+(?=\\)', 'C:\\Users\\***USER***'),
 
         # IP addresses (optional - may be needed for debugging)
-        (r'\b(?:\d{1,3}\.){3}\d{1,3}\b', r'\*\*\*IP\*\*\*'),
+        ('ip', r'\b(?:\d{1,3}\.){3}\d{1,3}\b', '***IP***'),
 
         # UUIDs and potential session IDs
-        (r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', r'\*\*\*UUID\*\*\*'),
-        (r'\b[A-Za-z0-9]{32,}\b', r'\*\*\*HASH\*\*\*'),
+        ('uuid', r'\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b', '***UUID***'),
+        ('hash', r'\b[A-Za-z0-9]{32,}\b', '***HASH***'),
     ]
 
     # Path patterns to sanitize
     SENSITIVE_PATH_PATTERNS = [
         # System paths
-        r'/etc/',
-        r'/var/',
-        r'/usr/',
-        r'/root/',
-        r'C:\\Windows\\',
-        r'C:\\Program Files\\',
+        ('system_path', r'/' + ci('etc', 'var', 'usr', 'root') + r'(?=/)', '***SYSTEM_PATH***'),
+        ('windows_system_path', r'[Cc]:\\' + ci('Windows', 'Program Files') + r'\\', '***SYSTEM_PATH***/'),
     ]
 
+    _SCRUBBER = Scrubber(SENSITIVE_PATTERNS)
+    _PATH_SCRUBBER = Scrubber(SENSITIVE_PATTERNS + SENSITIVE_PATH_PATTERNS)
+    _SYSTEM_PATH = re.compile('|'.join(pattern for _, pattern, _ in SENSITIVE_PATH_PATTERNS))
+    _USER_PATH = Scrubber([
+        ('users', r'/Users/[^/]+/', '/Users/***USER***/'),
+        ('home', r'/home/[^/]+/', '/home/***USER***/'),
+        ('windows_users', r'C:\\Users\\[^\\]+\\', 'C:\\Users\\***USER***\\'),
+    ])
+    _TRACE_FILE = re.compile(r'File "([^"]+)"')
+    _TRACE_LINE = re.compile(r'line \d+')
+    _ENV_VAR = re.compile(r'^[A-Z_]+=.*$', re.MULTILINE)
+
     @classmethod
     def sanitize_text(cls, text: str, redact_paths: bool = True) -> str:
         """
@@ -69,23 +89,28 @@ class OutputSanitizer:
         if not text:
             return ""
 
-        sanitized = text
+        return (cls._PATH_SCRUBBER if redact_paths else cls._SCRUBBER).sub(text)
 
-        # Apply sensitive pattern replacements
-        for pattern, replacement in cls.SENSITIVE_PATTERNS:
-            sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+    @classmethod
+    def sanitize_stream(
+        cls,
+        lines: Union[Iterable[str], TextIO],
+        redact_paths: bool = True
+    ) -> Iterator[str]:
+        """
+        Sanitize output line by line (e.g. a subprocess pipe or a log file)
 
-        # Redact sensitive paths if requested
-        if redact_paths:
-            for path_pattern in cls.SENSITIVE_PATH_PATTERNS:
-                sanitized = re.sub(
-                    path_pattern,
-                    '***SYSTEM_PATH***/',
-                    sanitized,
-                    flags=re.IGNORECASE
-                )
+        Only one line is held in memory; the result equals sanitize_text()
+        of the joined lines.
 
-        return sanitized
+        Args:
+            lines: Iterable of lines or a text stream
+            redact_paths: Whether to redact sensitive file paths
+
+        Yields:
+            str: Sanitized lines
+        """
+        return (cls._PATH_SCRUBBER if redact_paths else cls._SCRUBBER).stream(lines)
 
     @classmethod
     def sanitize_dict(cls, data: Dict[str, Any], redact_paths: bool = True) -> Dict[str, Any]:
@@ -168,17 +193,12 @@ class OutputSanitizer:
         path_str = str(path)
 
         # Check if path contains sensitive directories
-        for sensitive_pattern in cls.SENSITIVE_PATH_PATTERNS:
-            if re.search(sensitive_pattern, path_str, re.IGNORECASE):
-                # Replace with generic indicator
-                return "***SYSTEM_PATH***"
+        if cls._SYSTEM_PATH.search(path_str):
+            # Replace with generic indicator
+            return "***SYSTEM_PATH***"
 
         # Sanitize username in home directories
-        path_str = re.sub(r'/Users/([^/]+)/', r'/Users/\*\*\*USER\*\*\*/', path_str)
-        path_str = re.sub(r'/home/([^/]+)/', r'/home/\*\*\*USER\*\*\*/', path_str)
-        path_str = re.sub(r'C:\\Users\\([^\\]+)\\', r'C:\\Users\\\*\*\*USER\*\*\*\\', path_str)
-
-        return path_str
+        return cls._USER_PATH.sub(path_str)
 
     @classmethod
     def sanitize_error_message(cls, error: Exception) -> str:
@@ -197,8 +217,8 @@ class OutputSanitizer:
         sanitized_msg = cls.sanitize_text(error_msg)
 
         # Remove stack trace information that might leak paths
-        sanitized_msg = re.sub(r'File "([^"]+)"', r'File "\*\*\*PATH\*\*\*"', sanitized_msg)
-        sanitized_msg = re.sub(r'line \d+', r'line \*\*\*', sanitized_msg)
+        sanitized_msg = cls._TRACE_FILE.sub('File "***PATH***"', sanitized_msg)
+        sanitized_msg = cls._TRACE_LINE.sub('line ***', sanitized_msg)
 
         return sanitized_msg
 
@@ -220,8 +240,8 @@ class OutputSanitizer:
 
         # Additional sanitization for command outputs
         # Remove potential environment variable dumps
-        clean_stdout = re.sub(r'^[A-Z_]+=.*$', r'\*\*\*ENV_VAR\*\*\*', clean_stdout, flags=re.MULTILINE)
-        clean_stderr = re.sub(r'^[A-Z_]+=.*$', r'\*\*\*ENV_VAR\*\*\*', clean_stderr, flags=re.MULTILINE)
+        clean_stdout = cls._ENV_VAR.sub('***ENV_VAR***', clean_stdout)
+        clean_stderr = cls._ENV_VAR.sub('***ENV_VAR***', clean_stderr)
 
         return clean_stdout, clean_stderr
 
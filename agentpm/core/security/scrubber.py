@@ -0,0 +1,160 @@
+"""
+Single-Pass Regex Scrubber
+
+Redacting output used to run one re.sub per sensitive pattern, each with
+re.IGNORECASE - twenty-odd full scans of every build log and of every string
+in a sanitized dict. Scrubber compiles a table of rules into a single
+alternation and rewrites each match through a dispatching callback, so the
+text is scanned once.
+
+Rules are (name, pattern, replacement) tuples. Each pattern is compiled as
+`(?:pattern)(?P<name>)`: the empty marker group closes last, so
+`match.lastgroup` names the rule that matched while each alternative still
+starts with a plain literal or character class (sre skips alternatives whose
+first character cannot match - a leading named group or re.IGNORECASE
+defeats that). Use ci() for case-insensitive keywords instead of
+re.IGNORECASE.
+
+Overlapping matches resolve leftmost-first (then rule order) instead of
+rule-by-rule. Patterns should not match across newlines so that stream(),
+which scrubs line by line, gives the same result as sub() on the whole text.
+Lines longer than the read size are scrubbed in chunks; the last `overlap`
+characters of a chunk (and any match reaching into them) are held back and
+rescanned with the next chunk, so matches up to that length are not split.
+
+Usage:
+    scrubber = Scrubber([
+        ('token', ci('token') + r'=\\S+', 'token=***'),
+        ('ip', r'\\b(?:\\d{1,3}\\.){3}\\d{1,3}\\b', '***IP***'),
+    ])
+    clean = scrubber.sub(text)
+    for line in scrubber.stream(process.stdout):
+        ...
+"""
+
+import re
+from typing import Callable, Dict, Iterable, Iterator, Sequence, TextIO, Tuple, Union
+
+Replacement = Union[str, Callable[[re.Match], str]]
+Rule = Tuple[str, str, Replacement]
+
+# Longest line stream() reads at once; longer lines are scrubbed in chunks
+MAX_LINE_LENGTH = 64 * 1024
+
+# Characters of an overlong line held back between chunks (longest match
+# guaranteed to be scrubbed whole across a chunk boundary)
+STREAM_OVERLAP = 4 * 1024
+
+
+def ci(*words: str) -> str:
+    """
+    Case-insensitive alternation of literal words without re.IGNORECASE.
+
+    ci('key', 'token') -> '(?:[Kk][Ee][Yy]|[Tt][Oo][Kk][Ee][Nn])'
+    """
+    alternatives = [
+        ''.join(f'[{c.upper()}{c.lower()}]' if c.isalpha() else re.escape(c) for c in word)
+        for word in words
+    ]
+    return f"(?:{'|'.join(alternatives)})"
+
+
+class Scrubber:
+    """Precompiled single-pass replacement of a table of regex rules"""
+
+    def __init__(self, rules: Sequence[Rule]):
+        """
+        Args:
+            rules: (name, pattern, replacement) in priority order; replacement
+                is a literal string or a callable receiving the match
+        """
+        self.rules = list(rules)
+        self._handlers: Dict[str, Callable[[re.Match], str]] = {}
+        alternatives = []
+        for name, pattern, replacement in self.rules:
+            if name in self._handlers:
+                raise ValueError(f"Duplicate scrubber rule: {name}")
+            alternatives.append(f"(?:{pattern})(?P<{name}>)")
+            self._handlers[name] = (lambda match, text=replacement: text) if isinstance(replacement, str) else replacement
+        self.pattern = re.compile('|'.join(alternatives))
+
+        handlers = self._handlers
+        self._dispatch = lambda match: handlers[match.lastgroup](match)
+
+    def sub(self, text: str) -> str:
+        """Replace every rule match in text"""
+        if not text:
+            return text
+        return self.pattern.sub(self._dispatch, text)
+
+    def stream(
+        self,
+        source: Union[Iterable[str], TextIO],
+        max_line_length: int = MAX_LINE_LENGTH,
+        overlap: int = STREAM_OVERLAP
+    ) -> Iterator[str]:
+        """
+        Scrub lines lazily, holding at most one line in memory.
+
+        Args:
+            source: Iterable of lines or a text stream (e.g. Popen.stdout);
+                streams are read with readline(max_line_length)
+            max_line_length: Chunk size for overlong lines read from a stream
+            overlap: Characters of an overlong line carried into the next
+                chunk, so a match crossing the chunk boundary is scrubbed whole
+
+        Yields:
+            Scrubbed lines (line endings preserved); overlong lines arrive in
+            several pieces
+        """
+        readline = getattr(source, 'readline', None)
+        sub, dispatch = self.pattern.sub, self._dispatch
+        if readline is None:
+            for line in source:
+                yield sub(dispatch, line)
+            return
+
+        # carry: unscrubbed rest of an overlong line; carry[:start] was already
+        # yielded and is kept only as look-behind context (\b and the like)
+        carry, start = '', 0
+        while True:
+            chunk = readline(max_line_length)
+            if not carry:
+                if not chunk:
+                    return
+                if chunk.endswith('\n'):
+                    yield sub(dispatch, chunk)
+                    continue
+            text = carry + chunk
+            if not chunk or chunk.endswith('\n'):
+                scrubbed, _cut = self._scrub_until(text, start, len(text))
+                if scrubbed:
+                    yield scrubbed
+                if not chunk:
+                    return
+                carry, start = '', 0
+                continue
+            scrubbed, cut = self._scrub_until(text, start, max(start, len(text) - overlap))
+            if scrubbed:
+                yield scrubbed
+            keep = max(0, cut - overlap)
+            carry, start = text[keep:], cut - keep
+
+    def _scrub_until(self, text: str, start: int, cut: int) -> Tuple[str, int]:
+        """
+        Scrub text[start:cut], moving cut back to the start of a match crossing it.
+
+        Returns:
+            (scrubbed text, cut actually used)
+        """
+        dispatch = self._dispatch
+        parts, last = [], start
+        for match in self.pattern.finditer(text, start):
+            if match.end() > cut:
+                cut = min(cut, match.start())
+                break
+            parts.append(text[last:match.start()])
+            parts.append(dispatch(match))
+            last = match.end()
+        parts.append(text[last:cut])
+        return ''.join(parts), cut
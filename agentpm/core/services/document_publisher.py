@@ -10,13 +10,18 @@ Pattern: Service layer with type-safe operations
 Architecture: Three-layer (Models → Adapters → Methods → Service)
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
+import os
+import json
 import shutil
 import hashlib
 import logging
+import tempfile
 
 from agentpm.core.database.service import DatabaseService
 from agentpm.core.database.models.document_reference import DocumentReference
@@ -28,6 +33,11 @@ from agentpm.core.database.adapters.document_audit_adapter import DocumentAuditA
 
 logger = logging.getLogger(__name__)
 
+PUBLISH_MANIFEST_PATH = Path('.agentpm') / 'publish_manifest.json'  # relative to the project root
+MAX_SYNC_WORKERS = 8
+MANIFEST_FLUSH_INTERVAL = 50  # completed copies between manifest saves
+TEMP_SUFFIX = '.apm-publish'
+
 
 @dataclass
 class PublishResult:
@@ -47,6 +57,14 @@ class SyncResult:
     orphaned_files: List[Path]
     dry_run: bool
 
+    @property
+    def has_drift(self) -> bool:
+        """True if published files differ from their sources"""
+        return any(
+            self.stats.get(key)
+            for key in ("missing_source", "missing_dest", "content_mismatch", "pruned")
+        )
+
 
 class PublishError(Exception):
     """Publishing workflow error"""
@@ -58,6 +76,174 @@ class ValidationError(Exception):
     pass
 
 
+def _sha256_file(file_path: Path) -> str:
+    """SHA-256 of a file's bytes (same value as its content blob key)"""
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for byte_block in iter(lambda: f.read(65536), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def _atomic_write(
+    dest: Path,
+    source: Optional[Path] = None,
+    data: Optional[bytes] = None
+) -> os.stat_result:
+    """
+    Write dest from a source file or bytes via a temp file and rename.
+
+    Readers see the old file or the new one, never a partial copy; an
+    interrupted write leaves only a ``*.apm-publish`` temp file, which the
+    next sync removes.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=TEMP_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            if data is not None:
+                tmp.write(data)
+            else:
+                with open(source, 'rb') as src:
+                    shutil.copyfileobj(src, tmp)
+        if data is None:
+            shutil.copystat(source, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, dest)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+    return dest.stat()
+
+
+def _find_project_root(db: Optional[DatabaseService] = None) -> Path:
+    """
+    Project root for publishing paths.
+
+    The directory holding .agentpm/data/<db> when the database uses the
+    standard layout, else the nearest directory at or above the current one
+    containing .agentpm, else the current directory.
+    """
+    db_path = getattr(db, 'db_path', None)
+    if db_path is not None:
+        db_path = Path(db_path).resolve()
+        if db_path.parent.name == 'data' and db_path.parent.parent.name == '.agentpm':
+            return db_path.parents[2]
+    cwd = Path.cwd().resolve()
+    for directory in (cwd, *cwd.parents):
+        if (directory / '.agentpm').is_dir():
+            return directory
+    return cwd
+
+
+class PublishManifest:
+    """
+    Content hashes and published files recorded by sync_all.
+
+    Hashes are cached per path against the file's (size, mtime_ns), so a
+    file whose size and modification time are unchanged is not read again.
+    ``published`` maps each destination sync has written to its source and
+    is what pruning works from - files in docs/ that sync did not write are
+    never deleted.
+
+    Paths are keyed relative to the project root (see key()), so runs from
+    any directory of the project share entries.
+
+    The manifest is only a cache: a missing, stale or unreadable file costs
+    re-hashing, not correctness. It is saved with a temp file and rename so
+    an interrupted run leaves the previous or the new manifest intact.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None, root: Optional[Path] = None):
+        """
+        Load manifest.
+
+        Args:
+            path: Manifest file (default: .agentpm/publish_manifest.json under root)
+            root: Project root that keys are relative to (None: keys are the
+                paths as given)
+        """
+        self.root = Path(root) if root is not None else None
+        self.path = Path(path or PUBLISH_MANIFEST_PATH)
+        if self.root is not None:
+            self.path = self.root / self.path
+        self.files: Dict[str, List[Any]] = {}  # path -> [size, mtime_ns, sha256]
+        self.published: Dict[str, str] = {}  # destination -> source
+        self.hashed = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable publish manifest {self.path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        self.files = data.get("files", {})
+        self.published = data.get("published", {})
+
+    def key(self, file_path: Path) -> str:
+        """Manifest key of a path: relative to the root (POSIX), absolute outside it"""
+        if self.root is None:
+            return str(file_path)
+        path = self.root / file_path
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def file_hash(self, file_path: Path) -> Optional[str]:
+        """SHA-256 of a file, read only if its size or mtime changed; None if missing"""
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        entry = self.files.get(self.key(file_path))
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        digest = _sha256_file(file_path)
+        self.hashed += 1
+        self.record(file_path, digest, stat)
+        return digest
+
+    def record(self, file_path: Path, digest: str, stat: Optional[os.stat_result] = None):
+        """Store a file's hash against its current size and mtime"""
+        stat = stat or file_path.stat()
+        self.files[self.key(file_path)] = [stat.st_size, stat.st_mtime_ns, digest]
+        self._dirty = True
+
+    def mark_published(self, dest: Path, source: Path):
+        """Record that dest is the published copy of source"""
+        dest_key, source_key = self.key(dest), self.key(source)
+        if self.published.get(dest_key) != source_key:
+            self.published[dest_key] = source_key
+            self._dirty = True
+
+    def forget(self, file_path: Path):
+        """Drop a file's hash and published entry"""
+        key = self.key(file_path)
+        if key in self.files or key in self.published:
+            self.files.pop(key, None)
+            self.published.pop(key, None)
+            self._dirty = True
+
+    def save(self):
+        """Write the manifest if anything changed"""
+        if not self._dirty:
+            return
+        payload = {"version": self.VERSION, "files": self.files, "published": self.published}
+        _atomic_write(self.path, data=json.dumps(payload, sort_keys=True).encode('utf-8'))
+        self._dirty = False
+
+
 class DocumentPublisher:
     """
     Manages document publishing workflow and lifecycle transitions.
@@ -68,15 +254,28 @@ class DocumentPublisher:
     Also handles REJECTED state which auto-reverts to DRAFT.
     """
 
-    def __init__(self, db: DatabaseService):
+    def __init__(
+        self,
+        db: DatabaseService,
+        manifest_path: Optional[Path] = None,
+        project_root: Optional[Path] = None
+    ):
         """
         Initialize document publisher.
 
         Args:
             db: DatabaseService instance
+            manifest_path: Publish manifest used by sync_all (default:
+                .agentpm/publish_manifest.json; relative paths are resolved
+                against the project root)
+            project_root: Directory document paths are relative to in sync_all
+                (default: derived from the database location or the nearest
+                .agentpm directory, see _find_project_root)
         """
         self.db = db
         self.logger = logger
+        self.project_root = Path(project_root) if project_root is not None else _find_project_root(db)
+        self.manifest_path = self.project_root / (manifest_path or PUBLISH_MANIFEST_PATH)
 
     def submit_review(
         self,
@@ -587,84 +786,129 @@ class DocumentPublisher:
         self.logger.info(f"Document {document_id} archived")
         return True
 
-    def sync_all(self, dry_run: bool = False) -> SyncResult:
+    def sync_all(self, dry_run: bool = False, max_workers: Optional[int] = None) -> SyncResult:
         """
         Sync all published documents.
 
         Checks:
         1. Query all docs where lifecycle = 'published'
         2. For each:
-           a. Verify source exists in .agentpm/docs/
+           a. Verify source exists in .agentpm/docs/ (restored from the
+              database content when missing)
            b. Verify destination matches published_path
-           c. Compare content checksums
-           d. If mismatch: re-copy (or report in dry-run)
-        3. Find orphaned public docs (in docs/ but not in DB)
-        4. Report sync status
+           c. Compare SHA-256 of the source and the published file (the
+              source file is the truth; database content only restores it)
+           d. If mismatch: re-publish from the source (or report in dry-run)
+        3. Prune files sync published earlier whose source is gone (document
+           deleted, unpublished, moved, or source missing with no content)
+        4. Find orphaned public docs (in docs/ but not in DB)
+        5. Report sync status
+
+        Document paths are resolved against the project root, so the result
+        does not depend on the directory sync runs from; reported paths are
+        relative to it. File hashes come from the publish manifest (see
+        PublishManifest), so only files whose size or mtime changed since the
+        last run are read. Temp files left by interrupted writes (copies,
+        source restores, the manifest) are removed before writing.
+        Re-publishes run in a thread pool; each one writes a temp file and
+        renames it over the destination. The manifest is saved every
+        MANIFEST_FLUSH_INTERVAL copies and when the run ends, including when
+        it is interrupted.
 
         Args:
-            dry_run: If True, report issues without making changes
+            dry_run: If True, report drift without writing anything (files,
+                database or manifest)
+            max_workers: Copy threads (default: min(MAX_SYNC_WORKERS, cpu count))
 
         Returns:
             SyncResult with counts and any issues
         """
         # Query published documents
         published_docs = self._get_published_documents()
+        manifest = PublishManifest(self.manifest_path, root=self.project_root)
 
         stats = {
             "checked": 0,
             "synced": 0,
+            "hashed": 0,
             "missing_source": [],
             "missing_dest": [],
             "content_mismatch": [],
             "synced_files": [],
+            "pruned": [],
         }
 
+        # (dest, source, source digest) per file to (re)write
+        copies = []
+        mismatched_docs = []
+        live = set()
+        write_dirs = {self.manifest_path.parent}  # swept for interrupted temp files
+
         for doc in published_docs:
             stats["checked"] += 1
 
-            source_path = Path(doc.computed_path)
-            dest_path = Path(getattr(doc, 'published_path', ''))
+            published_path = getattr(doc, 'published_path', None)
+            if not published_path:
+                continue
+            source_path = self.project_root / doc.computed_path
+            dest_path = self.project_root / published_path
+            dest_key = manifest.key(dest_path)
+            write_dirs.update((source_path.parent, dest_path.parent))
 
             # Check source exists
             if not source_path.exists():
-                stats["missing_source"].append(str(source_path))
+                stats["missing_source"].append(manifest.key(source_path))
+                if doc.content is None:
+                    continue  # Nothing to publish from; destination is pruned below
+                data = doc.content.encode('utf-8')
+                source_hash = hashlib.sha256(data).hexdigest()
                 if not dry_run:
                     # Sync from database to file
-                    source_path.parent.mkdir(parents=True, exist_ok=True)
-                    if doc.content:
-                        source_path.write_text(doc.content, encoding='utf-8')
-                continue
+                    manifest.record(source_path, source_hash, _atomic_write(source_path, data=data))
+            else:
+                # Compare content checksums (cached in the manifest)
+                source_hash = manifest.file_hash(source_path)
+            live.add(dest_key)
 
             # Check destination exists
-            if not dest_path.exists():
-                stats["missing_dest"].append(str(dest_path))
-                if not dry_run:
-                    # Re-publish
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(source_path, dest_path)
-                    stats["synced_files"].append(str(dest_path))
+            dest_hash = manifest.file_hash(dest_path)
+            if dest_hash is None:
+                stats["missing_dest"].append(dest_key)
+                copies.append((dest_path, source_path, source_hash))
                 continue
 
-            # Compare content checksums
-            source_hash = self._calculate_file_hash(source_path)
-            dest_hash = self._calculate_file_hash(dest_path)
-
             if source_hash != dest_hash:
                 stats["content_mismatch"].append({
-                    "source": str(source_path),
-                    "dest": str(dest_path),
+                    "source": manifest.key(source_path),
+                    "dest": dest_key,
                     "source_hash": source_hash,
                     "dest_hash": dest_hash,
                 })
-                if not dry_run:
-                    # Re-sync
-                    shutil.copy2(source_path, dest_path)
-                    doc.content_hash = source_hash
-                    doc_methods.update_document_reference(self.db, doc)
-                    stats["synced_files"].append(str(dest_path))
+                copies.append((dest_path, source_path, source_hash))
+                doc.content_hash = source_hash
+                mismatched_docs.append(doc)
+            else:
+                manifest.mark_published(dest_path, source_path)
 
             stats["synced"] += 1
 
+        stale = [self.project_root / dest for dest in sorted(manifest.published) if dest not in live]
+        stats["pruned"] = [manifest.key(dest) for dest in stale if dest.exists()]
+        stats["hashed"] = manifest.hashed
+
+        if not dry_run:
+            try:
+                self._sweep_temp_files(write_dirs | {dest.parent for dest in stale})
+                self._copy_files(copies, manifest, stats, max_workers)
+                for doc in mismatched_docs:
+                    doc_methods.update_document_reference(self.db, doc)
+                for dest in stale:
+                    with suppress(FileNotFoundError):
+                        dest.unlink()
+                    manifest.forget(dest)
+            finally:
+                manifest.save()
+
         # Find orphaned files
         orphaned = self._find_orphaned_public_docs(published_docs)
 
@@ -674,6 +918,50 @@ class DocumentPublisher:
             dry_run=dry_run
         )
 
+    def _copy_files(
+        self,
+        copies: List[tuple],
+        manifest: PublishManifest,
+        stats: Dict[str, Any],
+        max_workers: Optional[int] = None
+    ):
+        """Write destinations in a thread pool, recording each in the manifest."""
+        if not copies:
+            return
+
+        workers = max_workers or min(MAX_SYNC_WORKERS, os.cpu_count() or 1, len(copies))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='apm-publish') as executor:
+            futures = {
+                executor.submit(_atomic_write, dest, source=source): (dest, source, digest)
+                for dest, source, digest in copies
+            }
+            error = None
+            for done, future in enumerate(as_completed(futures), start=1):
+                dest, source, digest = futures[future]
+                try:
+                    stat = future.result()
+                except Exception as e:
+                    # Keep recording the copies that do finish; raise once all are done
+                    self.logger.error(f"Failed to publish {dest}: {e}")
+                    error = error or e
+                    continue
+                manifest.record(dest, digest, stat)
+                manifest.mark_published(dest, source)
+                stats["synced_files"].append(manifest.key(dest))
+                if done % MANIFEST_FLUSH_INTERVAL == 0:
+                    manifest.save()
+        if error is not None:
+            raise error
+
+    def _sweep_temp_files(self, directories):
+        """Remove temp files left by interrupted writes (destinations, restored sources, manifest)."""
+        for directory in directories:
+            if not directory.is_dir():
+                continue
+            for leftover in directory.glob(f".*{TEMP_SUFFIX}"):
+                with suppress(FileNotFoundError):
+                    leftover.unlink()
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -759,22 +1047,18 @@ class DocumentPublisher:
         ]
 
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of file."""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        """Calculate SHA256 hash of file (same value as its content blob key)."""
+        return _sha256_file(file_path)
 
     def _find_orphaned_public_docs(self, known_docs: List[DocumentReference]) -> List[Path]:
         """Identify files in docs/ not tracked in database."""
         known_paths = {
-            Path(getattr(doc, 'published_path', ''))
+            self.project_root / doc.published_path
             for doc in known_docs
             if getattr(doc, 'published_path', None)
         }
 
-        docs_dir = Path("docs")
+        docs_dir = self.project_root / "docs"
         if not docs_dir.exists():
             return []
 
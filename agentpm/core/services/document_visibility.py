@@ -17,6 +17,7 @@ from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 from ..database.service import DatabaseService
+from ..performance.cache import TTLCache
 from ..database.adapters.visibility_policy_adapter import VisibilityPolicyAdapter
 from ..models.document_visibility import (
     VisibilityPolicy,
@@ -25,6 +26,9 @@ from ..models.document_visibility import (
     AutoPublishResult,
 )
 
+# Seconds a loaded policy is reused before it is re-read from the database
+POLICY_CACHE_TTL = 300
+
 # Scoring modifiers (from policy matrix design)
 TEAM_SIZE_MODIFIERS = {
     "solo": -20,
@@ -118,7 +122,7 @@ class VisibilityPolicyEngine:
         self.project_context = self._load_project_context()
 
         # Cache policies for performance (loaded on demand)
-        self._policy_cache: Dict[str, VisibilityPolicy] = {}
+        self._policy_cache = TTLCache('visibility.policies', maxsize=256, ttl=POLICY_CACHE_TTL)
 
     def determine_visibility(
         self,
@@ -311,15 +315,16 @@ class VisibilityPolicyEngine:
         """
         # Check cache first
         cache_key = f"{category}.{doc_type}"
-        if cache_key in self._policy_cache:
-            return self._policy_cache[cache_key]
+        cached = self._policy_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Try to load from database
         policy = VisibilityPolicyAdapter.get_by_type(self.db, category, doc_type)
 
         if policy:
             # Cache and return
-            self._policy_cache[cache_key] = policy
+            self._policy_cache.set(cache_key, policy, tags=[f"policy:{category}"])
             return policy
 
         # Return default policy
@@ -342,7 +347,7 @@ class VisibilityPolicyEngine:
         )
 
         # Cache default
-        self._policy_cache[cache_key] = default_policy
+        self._policy_cache.set(cache_key, default_policy, tags=[f"policy:{category}"])
 
         return default_policy
 
@@ -1,7 +1,8 @@
 """
 Testing Module for APM (Agent Project Manager)
 
-Provides category-specific testing and coverage calculation functionality.
+Provides category-specific testing and coverage calculation functionality,
+including a test-impact runner that only runs tests affected by changes.
 """
 
 from .categorization import (
@@ -19,6 +20,13 @@ from .coverage import (
     validate_all_categories
 )
 
+from .impact import (
+    ImpactMap,
+    ImpactRunner,
+    ImpactRunResult,
+    ImpactSelection
+)
+
 from .config import (
     TestingConfigManager,
     TestingConfig,
@@ -35,6 +43,10 @@ __all__ = [
     'CoverageResult',
     'category_coverage',
     'validate_all_categories',
+    'ImpactMap',
+    'ImpactRunner',
+    'ImpactRunResult',
+    'ImpactSelection',
     'TestingConfigManager',
     'TestingConfig',
     'ensure_testing_config_installed'
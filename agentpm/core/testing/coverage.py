@@ -3,9 +3,13 @@ Coverage Calculation System for Category-Specific Testing
 
 Calculates coverage percentages for different testing categories and validates
 against category-specific requirements.
+
+With impact=True only the tests affected by changed files are run, and
+category coverage is read from the test-impact map (see impact.py).
 """
 
 import os
+import logging
 import subprocess
 import json
 from pathlib import Path
@@ -14,6 +18,9 @@ from dataclasses import dataclass
 
 from .categorization import CodeCategoryDetector, TestingCategory
 from .config import load_project_testing_config
+from .impact import ImpactRunner
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -103,11 +110,18 @@ class CategoryCoverageCalculator:
         
         return False
     
-    def run_coverage_analysis(self, test_command: str = "pytest") -> Dict[str, any]:
+    def run_coverage_analysis(
+        self,
+        test_command: str = "pytest",
+        impact: bool = False,
+        workers: int = 1
+    ) -> Dict[str, any]:
         """Run coverage analysis and return results
         
         Args:
             test_command: Command to run tests (default: pytest)
+            impact: Only run tests affected by changes since the last run
+            workers: Test processes for impact runs
             
         Returns:
             Coverage results by category
@@ -116,7 +130,10 @@ class CategoryCoverageCalculator:
         source_files = self.get_all_source_files()
         
         # Run coverage analysis
-        coverage_data = self._run_coverage_command(test_command, source_files)
+        if impact:
+            coverage_data = self._run_impact_command(workers)
+        else:
+            coverage_data = self._run_coverage_command(test_command, source_files)
         
         # Calculate category-specific coverage
         return self._calculate_category_coverage(source_files, coverage_data)
@@ -171,6 +188,23 @@ class CategoryCoverageCalculator:
             print(f"Warning: Coverage analysis failed: {e}")
             return {}
     
+    def _run_impact_command(self, workers: int = 1) -> Dict[str, any]:
+        """Run affected tests and read coverage from the test-impact map
+        
+        Args:
+            workers: Test processes to split the selected tests across
+            
+        Returns:
+            Coverage data in ``coverage json`` shape
+        """
+        try:
+            runner = ImpactRunner(str(self.project_path))
+            runner.run(workers=workers)
+            return runner.impact_map.coverage_report()
+        except Exception as e:
+            logger.warning(f"Test-impact analysis failed: {e}")
+            return {}
+    
     def _calculate_category_coverage(
         self, 
         source_files: List[str], 
@@ -287,7 +321,7 @@ class CategoryCoverageCalculator:
         return "\n".join(summary_lines)
 
 
-def category_coverage(project_path: str, category: str) -> Optional[CoverageResult]:
+def category_coverage(project_path: str, category: str, impact: bool = False) -> Optional[CoverageResult]:
     """Calculate coverage percentage for a specific category
     
     This function is designed to be used by the rules validation system.
@@ -295,13 +329,14 @@ def category_coverage(project_path: str, category: str) -> Optional[CoverageResu
     Args:
         project_path: Path to project root
         category: Category name (e.g., 'critical_paths', 'user_facing')
+        impact: Only run tests affected by changes since the last run
         
     Returns:
         CoverageResult object for the category, or None if category not found
     """
     try:
         calculator = CategoryCoverageCalculator(project_path)
-        coverage_results = calculator.run_coverage_analysis()
+        coverage_results = calculator.run_coverage_analysis(impact=impact)
         
         if category in coverage_results:
             return coverage_results[category]
@@ -313,18 +348,19 @@ def category_coverage(project_path: str, category: str) -> Optional[CoverageResu
         return None
 
 
-def validate_all_categories(project_path: str) -> Tuple[bool, List[str]]:
+def validate_all_categories(project_path: str, impact: bool = False) -> Tuple[bool, List[str]]:
     """Validate all testing categories meet their requirements
     
     Args:
         project_path: Path to project root
+        impact: Only run tests affected by changes since the last run
         
     Returns:
         Tuple of (all_requirements_met, list_of_violations)
     """
     try:
         calculator = CategoryCoverageCalculator(project_path)
-        coverage_results = calculator.run_coverage_analysis()
+        coverage_results = calculator.run_coverage_analysis(impact=impact)
         return calculator.validate_coverage_requirements(coverage_results)
     except Exception as e:
         return False, [f"Coverage validation failed: {e}"]
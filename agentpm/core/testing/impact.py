@@ -0,0 +1,483 @@
+"""
+Test-Impact Coverage Runner
+
+Runs only the tests affected by files changed since the last run.
+
+Each run records, per test, which source lines it executed (coverage.py
+contexts set to the pytest node id by impact_plugin.py) into a SQLite map.
+The next run hashes the project's Python files, finds those that changed,
+and selects the tests whose recorded lines touch them, plus every test in
+a changed test file. A changed conftest.py, or a module whose lines only
+ran at import time, cannot be traced to tests and triggers a full run.
+Selected tests can be split across worker processes;
+their .coverage data files are combined before the map is updated.
+
+Usage:
+    runner = ImpactRunner(project_path)
+    result = runner.run(workers=4)
+    report = runner.impact_map.coverage_report()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Map location, relative to the project root
+IMPACT_DB_PATH = Path('.agentpm') / 'test_impact.db'
+
+PLUGIN = 'agentpm.core.testing.impact_plugin'
+
+# Directories never hashed
+SKIP_DIRS = {
+    '__pycache__', '.git', '.pytest_cache', 'node_modules', '.venv', 'venv',
+    'env', '.env', '.tox', '.agentpm', 'build', 'dist',
+}
+
+# SQLite parameter chunk for IN (...) queries
+QUERY_CHUNK_SIZE = 500
+
+# pytest exit code when no tests were collected
+NO_TESTS_COLLECTED = 5
+
+# Map key for lines run outside any test (imports, collection). They count
+# toward coverage; a changed file that only has such lines (constants,
+# configuration, module-level code) cannot be traced to tests, so it forces
+# a full run
+IMPORT_CONTEXT = ''
+
+# (sha256, size, mtime_ns)
+FileState = Tuple[str, int, int]
+
+
+def is_test_file(path: str) -> bool:
+    """Whether a project-relative path is a pytest test module"""
+    name = PurePosixPath(path).name
+    return name.endswith('.py') and (name.startswith('test_') or name.endswith('_test.py'))
+
+
+def is_conftest(path: str) -> bool:
+    """Whether a project-relative path is a pytest conftest module"""
+    return PurePosixPath(path).name == 'conftest.py'
+
+
+def _node_file(node_id: str) -> str:
+    """File part of a pytest node id"""
+    return node_id.split('::', 1)[0]
+
+
+@dataclass
+class ImpactSelection:
+    """Tests chosen for a run"""
+    full_run: bool
+    changed_files: List[str]
+    targets: List[str] = field(default_factory=list)  # node ids and test files (empty + full_run: all)
+    full_run_reason: Optional[str] = None
+
+    @property
+    def has_work(self) -> bool:
+        return self.full_run or bool(self.targets)
+
+
+@dataclass
+class ImpactRunResult:
+    """Result of a test-impact run"""
+    selection: ImpactSelection
+    returncode: int
+    tests_recorded: int
+    workers: int
+    duration_seconds: float
+
+    @property
+    def success(self) -> bool:
+        return self.returncode in (0, NO_TESTS_COLLECTED)
+
+
+class ImpactMap:
+    """SQLite store of file hashes and per-test line coverage"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS impact_files (
+            path TEXT PRIMARY KEY,
+            sha256 TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            statements INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS impact_lines (
+            test TEXT NOT NULL,
+            path TEXT NOT NULL,
+            lines TEXT NOT NULL,
+            PRIMARY KEY (test, path)
+        );
+        CREATE INDEX IF NOT EXISTS idx_impact_lines_path ON impact_lines(path);
+    """
+
+    def __init__(self, db_path: Path):
+        """Initialize with the map's database file (created if missing)
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def is_empty(self) -> bool:
+        """True until a run has been recorded"""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT 1 FROM impact_lines LIMIT 1").fetchone() is None
+
+    def file_states(self) -> Dict[str, FileState]:
+        """Recorded (sha256, size, mtime_ns) by path"""
+        with closing(self._connect()) as conn:
+            return {
+                row[0]: (row[1], row[2], row[3])
+                for row in conn.execute("SELECT path, sha256, size, mtime_ns FROM impact_files")
+            }
+
+    def tests_touching(self, paths: Iterable[str]) -> Set[str]:
+        """Node ids of tests that executed any line of the given files"""
+        paths = list(paths)
+        tests = set()
+        with closing(self._connect()) as conn:
+            for start in range(0, len(paths), QUERY_CHUNK_SIZE):
+                chunk = paths[start:start + QUERY_CHUNK_SIZE]
+                tests.update(row[0] for row in conn.execute(
+                    f"SELECT DISTINCT test FROM impact_lines "
+                    f"WHERE path IN ({', '.join('?' * len(chunk))}) AND test != ?",
+                    [*chunk, IMPORT_CONTEXT]
+                ))
+        return tests
+
+    def import_only(self, paths: Iterable[str]) -> Set[str]:
+        """Paths whose recorded lines all ran at import time, outside any test"""
+        paths = list(paths)
+        found = set()
+        with closing(self._connect()) as conn:
+            for start in range(0, len(paths), QUERY_CHUNK_SIZE):
+                chunk = paths[start:start + QUERY_CHUNK_SIZE]
+                found.update(row[0] for row in conn.execute(
+                    f"SELECT path FROM impact_lines WHERE path IN ({', '.join('?' * len(chunk))}) "
+                    f"GROUP BY path HAVING SUM(test != ?) = 0",
+                    [*chunk, IMPORT_CONTEXT]
+                ))
+        return found
+
+    def lines_for(self, test: str) -> Dict[str, List[int]]:
+        """Lines a test executed, by path"""
+        with closing(self._connect()) as conn:
+            return {
+                row[0]: json.loads(row[1])
+                for row in conn.execute("SELECT path, lines FROM impact_lines WHERE test = ?", (test,))
+            }
+
+    def record(
+        self,
+        selection: ImpactSelection,
+        lines: Dict[str, Dict[str, List[int]]],
+        statements: Dict[str, int],
+        file_states: Optional[Dict[str, FileState]] = None
+    ) -> None:
+        """Replace the map entries of the tests that ran, in one transaction
+
+        Args:
+            selection: What was run (full runs replace the whole map)
+            lines: test node id (or IMPORT_CONTEXT) -> path -> executed lines
+            statements: Statement count per measured path
+            file_states: Current file states to store (None: keep the old
+                hashes, so the same changes are selected again next run)
+        """
+        with closing(self._connect()) as conn, conn:
+            if selection.full_run:
+                conn.execute("DELETE FROM impact_lines")
+            else:
+                replaced_files = [p for p in selection.changed_files if is_test_file(p)]
+                replaced_files += [t for t in selection.targets if '::' not in t]
+                for test_file in set(replaced_files):
+                    prefix = f"{test_file}::"
+                    conn.execute(
+                        "DELETE FROM impact_lines WHERE substr(test, 1, ?) = ?", (len(prefix), prefix)
+                    )
+                conn.executemany(
+                    "DELETE FROM impact_lines WHERE test = ?",
+                    [(t,) for t in selection.targets if '::' in t]
+                )
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO impact_lines (test, path, lines) VALUES (?, ?, ?)",
+                [
+                    (test, path, json.dumps(sorted(set(numbers))))
+                    for test, paths in lines.items()
+                    for path, numbers in paths.items()
+                ]
+            )
+
+            if file_states is not None:
+                conn.execute("DELETE FROM impact_files WHERE path NOT IN (SELECT value FROM json_each(?))",
+                              (json.dumps(list(file_states)),))
+                conn.executemany(
+                    """
+                    INSERT INTO impact_files (path, sha256, size, mtime_ns) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(path) DO UPDATE SET
+                        sha256 = excluded.sha256, size = excluded.size, mtime_ns = excluded.mtime_ns
+                    """,
+                    [(path, *state) for path, state in file_states.items()]
+                )
+
+            conn.executemany(
+                "UPDATE impact_files SET statements = ? WHERE path = ?",
+                [(count, path) for path, count in statements.items()]
+            )
+
+    def coverage_report(self) -> Dict[str, Dict]:
+        """Coverage in the shape of ``coverage json`` output (files -> summary)
+
+        Covered lines are the union over all recorded tests.
+        """
+        covered: Dict[str, Set[int]] = defaultdict(set)
+        with closing(self._connect()) as conn:
+            for path, numbers in conn.execute("SELECT path, lines FROM impact_lines"):
+                covered[path].update(json.loads(numbers))
+            statements = dict(conn.execute(
+                "SELECT path, statements FROM impact_files WHERE statements IS NOT NULL"
+            ))
+
+        return {
+            'files': {
+                path: {
+                    'executed_lines': sorted(covered.get(path, ())),
+                    'summary': {
+                        'covered_lines': len(covered.get(path, ())),
+                        'num_statements': count,
+                    },
+                }
+                for path, count in statements.items()
+            }
+        }
+
+
+class ImpactRunner:
+    """Select and run the tests affected by changed files"""
+
+    def __init__(
+        self,
+        project_path: str,
+        db_path: Optional[Path] = None,
+        pytest_args: Optional[List[str]] = None,
+        python: Optional[str] = None,
+        timeout: int = 300
+    ):
+        """Initialize with project path
+
+        Args:
+            project_path: Path to project root
+            db_path: Impact map file (default: .agentpm/test_impact.db)
+            pytest_args: Extra pytest arguments for every run
+            python: Interpreter for test processes (default: current)
+            timeout: Seconds before a test process is killed
+        """
+        self.project_path = Path(project_path).resolve()
+        self.impact_map = ImpactMap(db_path or self.project_path / IMPACT_DB_PATH)
+        self.pytest_args = list(pytest_args or [])
+        self.python = python or sys.executable
+        self.timeout = timeout
+
+    def scan_files(self, known: Optional[Dict[str, FileState]] = None) -> Dict[str, FileState]:
+        """Current state of every Python file in the project
+
+        Files whose size and mtime match ``known`` keep their recorded hash
+        instead of being read again.
+        """
+        known = known or {}
+        states = {}
+        for root, dirs, files in os.walk(self.project_path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.endswith('.egg-info')]
+            for name in files:
+                if not name.endswith('.py'):
+                    continue
+                full_path = Path(root) / name
+                rel_path = full_path.relative_to(self.project_path).as_posix()
+                stat = full_path.stat()
+                previous = known.get(rel_path)
+                if previous and previous[1:] == (stat.st_size, stat.st_mtime_ns):
+                    states[rel_path] = previous
+                else:
+                    digest = hashlib.sha256(full_path.read_bytes()).hexdigest()
+                    states[rel_path] = (digest, stat.st_size, stat.st_mtime_ns)
+        return states
+
+    def select(self, full: bool = False) -> ImpactSelection:
+        """Tests affected by files changed since the last recorded run"""
+        return self._select(full)[0]
+
+    def _select(self, full: bool) -> Tuple[ImpactSelection, Dict[str, FileState]]:
+        known = self.impact_map.file_states()
+        current = self.scan_files(known)
+        changed = sorted(
+            path for path in current.keys() | known.keys()
+            if current.get(path, ('',))[0] != known.get(path, ('',))[0]
+        )
+
+        if full or self.impact_map.is_empty():
+            return ImpactSelection(full_run=True, changed_files=changed), current
+
+        # Changes no recorded test line can be traced to: conftest hooks and
+        # fixtures, and modules only executed at import time
+        untraceable = sorted(
+            {path for path in changed if is_conftest(path)}
+            | self.impact_map.import_only(p for p in changed if not is_test_file(p))
+        )
+        if untraceable:
+            reason = f"changed without per-test coverage: {', '.join(untraceable)}"
+            logger.info(f"Test-impact full run, {reason}")
+            return ImpactSelection(full_run=True, changed_files=changed, full_run_reason=reason), current
+
+        # Changed test files run whole; their node ids may no longer exist
+        test_files = sorted(path for path in changed if is_test_file(path) and path in current)
+        node_ids = sorted(
+            node_id for node_id in self.impact_map.tests_touching(changed)
+            if _node_file(node_id) in current and _node_file(node_id) not in test_files
+        )
+        return ImpactSelection(full_run=False, changed_files=changed, targets=test_files + node_ids), current
+
+    def run(self, workers: int = 1, full: bool = False) -> ImpactRunResult:
+        """Run the affected tests and update the impact map
+
+        Args:
+            workers: Test processes to split the selection across
+            full: Run everything and rebuild the map
+
+        Returns:
+            ImpactRunResult
+        """
+        started = time.monotonic()
+        selection, current = self._select(full)
+
+        if not selection.has_work:
+            # Nothing recorded touches the changes: just remember the new hashes
+            self.impact_map.record(selection, {}, {}, current)
+            return ImpactRunResult(selection, 0, 0, 0, time.monotonic() - started)
+
+        with tempfile.TemporaryDirectory(prefix='apm-impact-') as tmp:
+            data_dir = Path(tmp)
+            chunks = self._split(selection, workers)
+            returncode = self._run_pytest(chunks, data_dir)
+            lines, statements = self._read_coverage(data_dir)
+
+        success = returncode in (0, NO_TESTS_COLLECTED)
+        if not success:
+            logger.warning(f"Tests failed with return code {returncode}")
+        self.impact_map.record(selection, lines, statements, current if success else None)
+
+        tests_recorded = len(lines) - (IMPORT_CONTEXT in lines)
+        return ImpactRunResult(selection, returncode, tests_recorded, len(chunks), time.monotonic() - started)
+
+    def _split(self, selection: ImpactSelection, workers: int) -> List[List[str]]:
+        """Split targets round-robin across workers ([[]] runs pytest's own discovery)"""
+        targets = selection.targets
+        if workers > 1 and selection.full_run:
+            targets = self._collect()
+        if workers <= 1 or len(targets) <= 1:
+            return [targets]
+        return [chunk for chunk in (targets[i::workers] for i in range(workers)) if chunk]
+
+    def _collect(self) -> List[str]:
+        """Node ids of all tests in the project"""
+        result = subprocess.run(
+            [self.python, '-m', 'pytest', '--collect-only', '-q', f'--rootdir={self.project_path}', *self.pytest_args],
+            cwd=self.project_path,
+            capture_output=True,
+            text=True,
+            timeout=self.timeout
+        )
+        return [line.strip() for line in result.stdout.splitlines() if '::' in line]
+
+    def _run_pytest(self, chunks: List[List[str]], data_dir: Path) -> int:
+        """Run one coverage + pytest process per chunk, in parallel
+
+        Returns:
+            Combined return code (first failure, else 0, else 5 if nothing ran)
+        """
+        env = dict(os.environ)
+        package_root = str(Path(__file__).resolve().parents[3])
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_root, env.get('PYTHONPATH')]))
+
+        processes = []
+        for index, chunk in enumerate(chunks):
+            command = [
+                self.python, '-m', 'coverage', 'run',
+                f'--data-file={data_dir / f".coverage.{index}"}',
+                f'--source={self.project_path}',
+                '-m', 'pytest', '-p', PLUGIN, '-q', f'--rootdir={self.project_path}',
+                *self.pytest_args, *chunk,
+            ]
+            log = open(data_dir / f'worker-{index}.log', 'w')
+            processes.append((subprocess.Popen(
+                command, cwd=self.project_path, env=env, stdout=log, stderr=subprocess.STDOUT
+            ), log))
+
+        deadline = time.monotonic() + self.timeout
+        codes = []
+        for process, log in processes:
+            try:
+                codes.append(process.wait(timeout=max(0.0, deadline - time.monotonic())))
+            except subprocess.TimeoutExpired:
+                logger.warning(f"Test-impact run timed out after {self.timeout}s")
+                process.kill()
+                codes.append(process.wait())
+            finally:
+                log.close()
+
+        failures = [code for code in codes if code not in (0, NO_TESTS_COLLECTED)]
+        if failures:
+            return failures[0]
+        return 0 if 0 in codes else NO_TESTS_COLLECTED
+
+    def _read_coverage(self, data_dir: Path) -> Tuple[Dict[str, Dict[str, List[int]]], Dict[str, int]]:
+        """Combine worker data files and group executed lines by test
+
+        Returns:
+            Tuple of (test or IMPORT_CONTEXT -> path -> lines, path -> statement count)
+        """
+        import coverage
+
+        cov = coverage.Coverage(data_file=str(data_dir / '.coverage'))
+        try:
+            cov.combine([str(data_dir)], keep=False)
+        except coverage.CoverageException:
+            return {}, {}  # no worker produced data
+        data = cov.get_data()
+
+        lines: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+        statements = {}
+        for measured in data.measured_files():
+            try:
+                rel_path = Path(measured).resolve().relative_to(self.project_path).as_posix()
+            except ValueError:
+                continue
+            for lineno, contexts in data.contexts_by_lineno(measured).items():
+                for context in contexts:
+                    lines[context].setdefault(rel_path, []).append(lineno)
+            try:
+                statements[rel_path] = len(cov.analysis2(measured)[1])
+            except Exception:
+                pass
+
+        return dict(lines), statements
@@ -0,0 +1,21 @@
+"""
+Pytest plugin used by the test-impact runner (impact.py)
+
+Switches the coverage.py context to each test's node id while it runs, so
+the recorded data says which source lines every test executed. Loaded in
+the runner's pytest subprocesses with ``-p agentpm.core.testing.impact_plugin``.
+"""
+
+import coverage
+import pytest
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Record setup, call and teardown under the test's node id"""
+    cov = coverage.Coverage.current()
+    if cov is not None:
+        cov.switch_context(item.nodeid)
+    yield
+    if cov is not None:
+        cov.switch_context('')
@@ -0,0 +1,318 @@
+"""
+Startup Time Budgets for the apm CLI and Claude Code Hooks
+
+Runs each startup target in a fresh interpreter with `python -X importtime`,
+parses the per-module timings it prints and checks them against a budget:
+
+- import_ms: time spent importing modules, minus the interpreter's own
+  startup imports (measured once with an empty program)
+- forbidden: heavy modules a target must not import at all (e.g. `apm --help`
+  must not load pydantic or networkx)
+
+Targets:
+- `apm --help`: prints help without importing any command module
+- `apm status`: the real command, run against a generated fixture project
+  (project_fixture) so its first-use imports are measured too
+- hook:<name>: top-level imports of each hook script in
+  agentpm/core/hooks/implementations (main() is not run)
+
+Budgets are BASELINE_MS times BUDGET_MARGIN. Each target runs `repeat`
+times and the fastest run counts, so a busy machine does not fail the
+check; update BASELINE_MS when startup work changes on purpose.
+
+Used by `apm testing startup` (CI can run it with --strict).
+"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[3]
+HOOKS_DIR = PACKAGE_ROOT / 'agentpm' / 'core' / 'hooks' / 'implementations'
+
+# Heavy third-party modules that fast paths must not import
+HEAVY_MODULES = ('networkx', 'jinja2', 'pydantic', 'rich.table')
+
+# Typical import time in ms (fastest of 3 runs, interpreter startup excluded)
+# on a 1-CPU Linux dev container, Python 3.11. Hooks not listed use 'hook'.
+BASELINE_MS = {
+    'apm --help': 100.0,
+    'apm status': 600.0,
+    'hook:session-start': 450.0,
+    'hook:session-end': 430.0,
+    'hook:user-prompt-submit': 430.0,
+    'hook:task-start': 100.0,
+    'hook': 60.0,
+}
+
+# Budget = baseline x margin. Runs on a busy machine varied by up to 2x;
+# heavy eager imports are caught by the forbidden-module checks regardless
+BUDGET_MARGIN = 2.0
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """One line of `-X importtime` output."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupTarget:
+    """Program whose startup is budgeted."""
+    name: str
+    code: str
+    budget_ms: float
+    forbidden: Sequence[str] = ()
+    fixture: Optional[Callable[[Path], None]] = None   # Builds the directory the target runs in
+
+
+@dataclass
+class StartupResult:
+    """Measured startup of one target."""
+    target: StartupTarget
+    records: List[ImportRecord] = field(default_factory=list)
+    import_ms: float = 0.0
+    wall_ms: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def violations(self) -> List[str]:
+        """Forbidden modules that were imported"""
+        imported = {record.module for record in self.records}
+        return [
+            name for name in self.target.forbidden
+            if any(module == name or module.startswith(name + '.') for module in imported)
+        ]
+
+    @property
+    def within_budget(self) -> bool:
+        return self.error is None and self.import_ms <= self.target.budget_ms and not self.violations
+
+    def top_modules(self, limit: int = 10) -> List[ImportRecord]:
+        """Slowest directly imported modules by cumulative time"""
+        roots = [record for record in self.records if record.depth == 0]
+        return sorted(roots, key=lambda r: r.cumulative_us, reverse=True)[:limit]
+
+    def packages(self, limit: int = 10) -> Dict[str, float]:
+        """Self time per top-level package in ms, largest first"""
+        totals: Dict[str, int] = {}
+        for record in self.records:
+            package = record.module.split('.', 1)[0]
+            totals[package] = totals.get(package, 0) + record.self_us
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return {package: round(us / 1000.0, 1) for package, us in ranked}
+
+    def to_dict(self, limit: int = 10) -> Dict:
+        return {
+            'target': self.target.name,
+            'budget_ms': self.target.budget_ms,
+            'import_ms': round(self.import_ms, 1),
+            'wall_ms': round(self.wall_ms, 1),
+            'within_budget': self.within_budget,
+            'violations': self.violations,
+            'error': self.error,
+            'packages': self.packages(limit),
+            'top_modules': [
+                {'module': r.module, 'cumulative_ms': round(r.cumulative_us / 1000.0, 1),
+                 'self_ms': round(r.self_us / 1000.0, 1)}
+                for r in self.top_modules(limit)
+            ],
+        }
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parse `python -X importtime` output.
+
+    Lines that are not import timings (warnings, program output) and the
+    header line are ignored. Depth is the nesting level (0 = imported
+    directly by the program).
+
+    Args:
+        output: stderr of the measured interpreter
+
+    Returns:
+        Records in the order printed (children before their parent)
+    """
+    records = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def default_targets(margin: float = BUDGET_MARGIN) -> List[StartupTarget]:
+    """
+    Budgeted targets: `apm --help`, `apm status` and every hook script.
+
+    Budgets are BASELINE_MS scaled by margin; `apm --help` may not import
+    any of HEAVY_MODULES and hooks may not import networkx or jinja2.
+    """
+    def budget(name: str) -> float:
+        return round(BASELINE_MS.get(name, BASELINE_MS['hook']) * margin)
+
+    targets = [
+        StartupTarget(
+            'apm --help',
+            _cli_program(['--help']),
+            budget('apm --help'),
+            HEAVY_MODULES,
+        ),
+        StartupTarget(
+            'apm status',
+            _cli_program(['status']),
+            budget('apm status'),
+            ('networkx', 'jinja2'),
+            fixture=project_fixture,
+        ),
+    ]
+    for path in sorted(HOOKS_DIR.glob('*.py')):
+        if path.name.startswith('_'):
+            continue
+        name = f"hook:{path.stem}"
+        targets.append(StartupTarget(
+            name,
+            f"import runpy\nrunpy.run_path({str(path)!r}, run_name='__startup__')",
+            budget(name),
+            ('networkx', 'jinja2'),
+        ))
+    return targets
+
+
+def project_fixture(directory: Path, work_items: int = 20, tasks_per_item: int = 5) -> None:
+    """
+    Initialize an apm project in directory for commands that need one.
+
+    Creates .agentpm/data/agentpm.db with the project registered at
+    directory and a few work items with tasks.
+    """
+    from agentpm.core.database.service import DatabaseService
+
+    data_dir = directory / '.agentpm' / 'data'
+    data_dir.mkdir(parents=True, exist_ok=True)
+    db = DatabaseService(str(data_dir / 'agentpm.db'))
+    with db.connect() as conn:
+        project_id = conn.execute(
+            "INSERT INTO projects (name, path) VALUES (?, ?)", ('Startup fixture', str(directory.resolve()))
+        ).lastrowid
+        for item in range(1, work_items + 1):
+            work_item_id = conn.execute(
+                "INSERT INTO work_items (project_id, name, type) VALUES (?, ?, 'feature')",
+                (project_id, f"Work item {item}")
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO tasks (work_item_id, name, effort_hours) VALUES (?, ?, 2.0)",
+                [(work_item_id, f"Task {item}.{task}") for task in range(1, tasks_per_item + 1)]
+            )
+        conn.commit()
+
+
+def _cli_program(args: List[str]) -> str:
+    """Program running `apm <args>`; a non-zero exit status is kept"""
+    return (
+        "from agentpm.cli.main import main\n"
+        f"try:\n    main({args!r})\n"
+        "except SystemExit as exit:\n    if exit.code:\n        raise"
+    )
+
+
+def _run(code: str, cwd: Optional[Path]) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(PACKAGE_ROOT), env.get('PYTHONPATH')]))
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=str(cwd) if cwd else None, env=env,
+        stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=120
+    )
+
+
+def interpreter_baseline_us(cwd: Optional[Path] = None) -> int:
+    """Import time of an empty program (site, encodings, ...) in microseconds"""
+    return sum(record.self_us for record in parse_importtime(_run('pass', cwd).stderr))
+
+
+def measure(
+    target: StartupTarget,
+    cwd: Optional[Path] = None,
+    baseline_us: int = 0,
+    repeat: int = 1
+) -> StartupResult:
+    """
+    Run a target in fresh interpreters and collect its import timings.
+
+    Args:
+        target: Program to run
+        cwd: Working directory (ignored for targets with a fixture, which run
+            in a temporary directory the fixture builds)
+        baseline_us: Interpreter startup import time subtracted from import_ms
+        repeat: Runs; the fastest one is returned (an error is returned at once)
+
+    Returns:
+        StartupResult (error set if the program exited with a non-zero status)
+    """
+    if target.fixture is not None:
+        with tempfile.TemporaryDirectory(prefix='apm-startup-') as tmp:
+            target.fixture(Path(tmp))
+            return _fastest(target, Path(tmp), baseline_us, repeat)
+    return _fastest(target, cwd, baseline_us, repeat)
+
+
+def _fastest(target: StartupTarget, cwd: Optional[Path], baseline_us: int, repeat: int) -> StartupResult:
+    best = None
+    for _ in range(max(1, repeat)):
+        result = _measure_once(target, cwd, baseline_us)
+        if result.error:
+            return result
+        if best is None or result.import_ms < best.import_ms:
+            best = result
+    return best
+
+
+def _measure_once(target: StartupTarget, cwd: Optional[Path], baseline_us: int) -> StartupResult:
+    start = time.perf_counter()
+    try:
+        completed = _run(target.code, cwd)
+    except subprocess.TimeoutExpired:
+        return StartupResult(target, error='timed out')
+    wall_ms = (time.perf_counter() - start) * 1000.0
+
+    records = parse_importtime(completed.stderr)
+    total_us = sum(record.self_us for record in records)
+    result = StartupResult(
+        target, records,
+        import_ms=max(0, total_us - baseline_us) / 1000.0,
+        wall_ms=wall_ms,
+    )
+    if completed.returncode != 0:
+        errors = [line for line in completed.stderr.splitlines() if not line.startswith('import time:')]
+        result.error = errors[-1] if errors else f"exit status {completed.returncode}"
+    return result
+
+
+def check_startup(
+    targets: Optional[Iterable[StartupTarget]] = None,
+    cwd: Optional[Path] = None,
+    repeat: int = 3
+) -> List[StartupResult]:
+    """
+    Measure targets (default_targets() if omitted), keeping each one's fastest run.
+
+    Returns:
+        One StartupResult per target, in order
+    """
+    baseline_us = min(interpreter_baseline_us(cwd) for _ in range(max(1, repeat)))
+    return [measure(target, cwd, baseline_us, repeat) for target in (targets or default_targets())]
@@ -23,6 +23,7 @@ import json
 import re
 
 from agentpm.core.database.service import DatabaseService
+from agentpm.core.database.methods.content_blobs import put_blob
 from agentpm.core.database.models.project import Project
 from agentpm.core.database.enums import EntityType
 from agentpm.core.context.unified_service import UnifiedContextService
@@ -708,41 +709,44 @@ class MemoryGenerator(TemplateBasedMixin):
             # Calculate content hash
             content_hash = hashlib.sha256(file_output.content.encode()).hexdigest()
 
-            # Upsert into memory_files table
+            # Upsert into memory_files table (content stored in the blob store)
             try:
-                self.db.execute(
-                    """
-                    INSERT INTO memory_files (
-                        project_id, file_type, file_path, file_hash, content,
-                        source_tables, template_version, confidence_score,
-                        completeness_score, validation_status, generated_by,
-                        generated_at, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(project_id, file_type) DO UPDATE SET
-                        file_path = excluded.file_path,
-                        file_hash = excluded.file_hash,
-                        content = excluded.content,
-                        generated_at = excluded.generated_at,
-                        updated_at = excluded.updated_at
-                    """,
-                    (
-                        project.id,
-                        file_type,
-                        str(file_output.path),
-                        content_hash,
-                        file_output.content,
-                        json.dumps([]),  # source_tables (to be populated)
-                        "1.0.0",  # template_version
-                        1.0,  # confidence_score
-                        1.0,  # completeness_score
-                        "validated",  # validation_status
-                        "memory_generator",  # generated_by
-                        now,  # generated_at
-                        now,  # created_at
-                        now   # updated_at
+                with self.db.transaction() as conn:
+                    content_blob_key = put_blob(conn, file_output.content)
+                    conn.execute(
+                        """
+                        INSERT INTO memory_files (
+                            project_id, file_type, file_path, file_hash, content,
+                            content_blob_key, source_tables, template_version,
+                            confidence_score, completeness_score, validation_status,
+                            generated_by, generated_at, created_at, updated_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(project_id, file_type) DO UPDATE SET
+                            file_path = excluded.file_path,
+                            file_hash = excluded.file_hash,
+                            content = excluded.content,
+                            content_blob_key = excluded.content_blob_key,
+                            generated_at = excluded.generated_at,
+                            updated_at = excluded.updated_at
+                        """,
+                        (
+                            project.id,
+                            file_type,
+                            str(file_output.path),
+                            content_hash,
+                            '',  # content (stored in content_blobs)
+                            content_blob_key,
+                            json.dumps([]),  # source_tables (to be populated)
+                            "1.0.0",  # template_version
+                            1.0,  # confidence_score
+                            1.0,  # completeness_score
+                            "validated",  # validation_status
+                            "memory_generator",  # generated_by
+                            now,  # generated_at
+                            now,  # created_at
+                            now   # updated_at
+                        )
                     )
-                )
-                self.db.commit()
             except Exception as e:
                 print(f"⚠️ Failed to track memory file {file_output.path}: {e}")
 
@@ -9,9 +9,11 @@ Pattern: Three-layer architecture - Adapters layer
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+from agentpm.core.database.utils.blob_codec import decode_blob_text
+
 from .models import SessionCheckpoint, CheckpointMetadata
 
 
@@ -19,7 +21,13 @@ class CheckpointAdapter:
     """
     Convert between SessionCheckpoint models and SQLite rows.
 
-    Handles JSON serialization for snapshot fields.
+    Handles JSON serialization for snapshot fields. Snapshots are stored as a
+    single packed document in the content blob store (Migration 0052) and
+    decoded transparently from the joined snapshot_blob_* columns.
+
+    Delta checkpoints (Migration 0057) store a delta document instead of the
+    full state: per entity list the upserted entities, removed ids and (when
+    it changed) the id order, plus the context if it changed.
 
     Example:
         # To database
@@ -57,6 +65,7 @@ class CheckpointAdapter:
             "work_items_snapshot": json.dumps(checkpoint.work_items_snapshot),
             "tasks_snapshot": json.dumps(checkpoint.tasks_snapshot),
             "context_snapshot": json.dumps(checkpoint.context_snapshot),
+            "snapshot": CheckpointAdapter.pack_snapshot(checkpoint),
             "session_notes": checkpoint.session_notes,
             "created_by": checkpoint.created_by,
             "restore_count": checkpoint.restore_count,
@@ -64,12 +73,19 @@ class CheckpointAdapter:
         }
 
     @staticmethod
-    def from_database(row: Dict[str, Any]) -> SessionCheckpoint:
+    def from_database(
+        row: Dict[str, Any],
+        state: Optional[Dict[str, Any]] = None,
+        chain_length: int = 1
+    ) -> SessionCheckpoint:
         """
         Convert database row to SessionCheckpoint model.
 
         Args:
             row: SQLite row as dictionary
+            state: Materialized state for delta rows (see methods.get_checkpoint);
+                full rows are decoded from the row itself
+            chain_length: Stored checkpoints replayed to build state
 
         Returns:
             SessionCheckpoint instance
@@ -78,20 +94,149 @@ class CheckpointAdapter:
             row = cursor.fetchone()
             checkpoint = CheckpointAdapter.from_database(row)
         """
+        if state is not None:
+            snapshot = state
+        elif row.get("snapshot_blob_payload") is not None:
+            snapshot = CheckpointAdapter.unpack_snapshot(decode_blob_text(
+                row.get("snapshot_blob_codec"), row["snapshot_blob_payload"]
+            ))
+        else:
+            snapshot = {
+                "work_items": json.loads(row["work_items_snapshot"]),
+                "tasks": json.loads(row["tasks_snapshot"]),
+                "context": json.loads(row["context_snapshot"]),
+            }
+
         return SessionCheckpoint(
             id=row["id"],
             session_id=row["session_id"],
             checkpoint_name=row["checkpoint_name"],
             created_at=datetime.fromisoformat(row["created_at"]),
-            work_items_snapshot=json.loads(row["work_items_snapshot"]),
-            tasks_snapshot=json.loads(row["tasks_snapshot"]),
-            context_snapshot=json.loads(row["context_snapshot"]),
+            work_items_snapshot=snapshot["work_items"],
+            tasks_snapshot=snapshot["tasks"],
+            context_snapshot=snapshot["context"],
             session_notes=row["session_notes"] or "",
             created_by=row["created_by"] or "unknown",
             restore_count=row["restore_count"] or 0,
             size_bytes=row["size_bytes"] or 0,
+            snapshot_kind=row.get("snapshot_kind") or "full",
+            parent_checkpoint_id=row.get("parent_checkpoint_id"),
+            chain_length=chain_length,
         )
 
+    @staticmethod
+    def row_document(row: Dict[str, Any]) -> Optional[str]:
+        """Decoded snapshot document of a row joined with its blob (None if absent)"""
+        if row.get("snapshot_blob_payload") is None:
+            return None
+        return decode_blob_text(row.get("snapshot_blob_codec"), row["snapshot_blob_payload"])
+
+    @staticmethod
+    def pack_snapshot(checkpoint: SessionCheckpoint) -> str:
+        """
+        Serialize all snapshots into one canonical JSON document.
+
+        Keys are sorted so identical state always produces identical text
+        (and therefore the same blob key).
+
+        Args:
+            checkpoint: Checkpoint model
+
+        Returns:
+            Compact JSON with work_items, tasks and context
+        """
+        return CheckpointAdapter.pack_state(CheckpointAdapter.state_of(checkpoint))
+
+    @staticmethod
+    def state_of(checkpoint: SessionCheckpoint) -> Dict[str, Any]:
+        """Snapshot fields of a checkpoint as a state dict (work_items, tasks, context)"""
+        return {
+            "work_items": checkpoint.work_items_snapshot,
+            "tasks": checkpoint.tasks_snapshot,
+            "context": checkpoint.context_snapshot,
+        }
+
+    @staticmethod
+    def pack_state(state: Dict[str, Any]) -> str:
+        """Canonical compact JSON for a state or delta document"""
+        return json.dumps(state, sort_keys=True, separators=(",", ":"), default=str)
+
+    @staticmethod
+    def unpack_snapshot(packed: Optional[str]) -> Dict[str, Any]:
+        """
+        Parse a packed snapshot document.
+
+        Args:
+            packed: JSON produced by pack_snapshot (None treated as empty)
+
+        Returns:
+            Dict with work_items, tasks and context
+        """
+        data = json.loads(packed) if packed else {}
+        return {
+            "work_items": data.get("work_items", []),
+            "tasks": data.get("tasks", []),
+            "context": data.get("context", {}),
+        }
+
+    @staticmethod
+    def diff_snapshots(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Delta document turning previous state into current state.
+
+        Entities are matched by id and compared by content, so only new or
+        changed entities are stored. The id order is stored only if it
+        differs from the order apply_delta would produce.
+
+        Args:
+            previous: State dict (work_items, tasks, context)
+            current: State dict
+
+        Returns:
+            Delta document (see apply_delta)
+        """
+        delta: Dict[str, Any] = {}
+        for key in _ENTITY_KEYS:
+            before = {entity["id"]: entity for entity in previous.get(key, [])}
+            after = current.get(key, [])
+            changes: Dict[str, Any] = {
+                "upsert": [entity for entity in after if before.get(entity["id"]) != entity],
+                "remove": sorted(set(before) - {entity["id"] for entity in after}),
+            }
+            order = [entity["id"] for entity in after]
+            if order != _replayed_order(list(before), changes):
+                changes["order"] = order
+            delta[key] = changes
+        if current.get("context") != previous.get("context"):
+            delta["context"] = current.get("context", {})
+        return delta
+
+    @staticmethod
+    def apply_delta(state: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply a delta document to a state dict.
+
+        Args:
+            state: State dict (not modified)
+            delta: Document from diff_snapshots
+
+        Returns:
+            New state dict
+        """
+        result: Dict[str, Any] = {"context": delta.get("context", state.get("context", {}))}
+        for key in _ENTITY_KEYS:
+            changes = delta.get(key, {})
+            entities = {entity["id"]: entity for entity in state.get(key, [])}
+            for entity_id in changes.get("remove", []):
+                entities.pop(entity_id, None)
+            for entity in changes.get("upsert", []):
+                entities[entity["id"]] = entity
+            order = changes.get("order") or _replayed_order(
+                [entity["id"] for entity in state.get(key, [])], changes
+            )
+            result[key] = [entities[entity_id] for entity_id in order if entity_id in entities]
+        return result
+
     @staticmethod
     def to_metadata(row: Dict[str, Any]) -> CheckpointMetadata:
         """
@@ -120,4 +265,18 @@ class CheckpointAdapter:
             size_bytes=row["size_bytes"] or 0,
             restore_count=row["restore_count"] or 0,
             notes_preview=notes_preview,
+            snapshot_kind=row.get("snapshot_kind") or "full",
         )
+
+
+# State keys holding entity lists (matched by "id" in deltas)
+_ENTITY_KEYS = ("work_items", "tasks")
+
+
+def _replayed_order(previous_ids: List[Any], changes: Dict[str, Any]) -> List[Any]:
+    """Id order after removing and appending (new ids last) without an explicit order"""
+    removed = set(changes.get("remove", []))
+    order = [entity_id for entity_id in previous_ids if entity_id not in removed]
+    known = set(order)
+    order.extend(entity["id"] for entity in changes.get("upsert", []) if entity["id"] not in known)
+    return order
@@ -8,11 +8,11 @@ Pattern: Three-layer architecture - Business logic layer
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from datetime import datetime
 
+from .adapters import CheckpointAdapter
 from .models import SessionCheckpoint, CheckpointMetadata
 from . import methods
 
@@ -21,6 +21,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Checkpoints in a delta chain before a full base snapshot is written again
+# (bounds the replay cost of a restore)
+FULL_SNAPSHOT_INTERVAL = 10
+
 
 class CheckpointManager:
     """
@@ -30,7 +34,8 @@ class CheckpointManager:
 
     Responsibilities:
     - Capture current session state (work items, tasks, context)
-    - Save checkpoints to database
+    - Save checkpoints to database (deltas against the previous checkpoint,
+      with a full snapshot every full_snapshot_interval checkpoints)
     - Restore session to checkpoint state
     - List and manage checkpoints
 
@@ -52,14 +57,17 @@ class CheckpointManager:
         success = manager.restore_checkpoint(checkpoint.id)
     """
 
-    def __init__(self, db: DatabaseService):
+    def __init__(self, db: DatabaseService, full_snapshot_interval: int = FULL_SNAPSHOT_INTERVAL):
         """
         Initialize checkpoint manager.
 
         Args:
             db: Database service instance
+            full_snapshot_interval: Maximum delta chain length (1 stores every
+                checkpoint as a full snapshot)
         """
         self.db = db
+        self.full_snapshot_interval = max(1, full_snapshot_interval)
         logger.debug("CheckpointManager initialized")
 
     def create_checkpoint(
@@ -67,7 +75,8 @@ class CheckpointManager:
         session_id: int,
         name: Optional[str] = None,
         notes: str = "",
-        created_by: str = "unknown"
+        created_by: str = "unknown",
+        full: bool = False
     ) -> SessionCheckpoint:
         """
         Create checkpoint of current session state.
@@ -77,11 +86,17 @@ class CheckpointManager:
         - Active tasks with full state
         - Session context (settings, metadata)
 
+        Only the entities that changed since the session's previous
+        checkpoint are stored, unless the delta chain has reached
+        full_snapshot_interval (or full is set), in which case a full base
+        snapshot is written.
+
         Args:
             session_id: Session ID to checkpoint
             name: Optional checkpoint name (auto-generated if None)
             notes: User notes about this checkpoint
             created_by: User identifier (email or name)
+            full: Always store a full snapshot
 
         Returns:
             Created checkpoint with assigned ID
@@ -109,14 +124,14 @@ class CheckpointManager:
         tasks_snapshot = self._capture_tasks(session_id)
         context_snapshot = self._capture_context(session_id)
 
-        # Calculate size
-        size_bytes = self._calculate_size(
-            work_items_snapshot,
-            tasks_snapshot,
-            context_snapshot
-        )
+        # Store a delta against the previous checkpoint while the chain is short
+        parent = None
+        if not full:
+            previous = methods.get_latest_checkpoint(self.db, session_id)
+            if previous and previous.chain_length < self.full_snapshot_interval:
+                parent = previous
 
-        # Create checkpoint model
+        # Create checkpoint model (size_bytes set from what is stored)
         checkpoint = SessionCheckpoint(
             session_id=session_id,
             checkpoint_name=name,
@@ -126,16 +141,15 @@ class CheckpointManager:
             context_snapshot=context_snapshot,
             session_notes=notes,
             created_by=created_by,
-            restore_count=0,
-            size_bytes=size_bytes
+            restore_count=0
         )
 
         # Save to database
-        created = methods.create_checkpoint(self.db, checkpoint)
+        created = methods.create_checkpoint(self.db, checkpoint, parent=parent)
 
         logger.info(
             f"Checkpoint created: {created.checkpoint_name} "
-            f"(ID: {created.id}, size: {size_bytes} bytes)"
+            f"(ID: {created.id}, {created.snapshot_kind}, size: {created.size_bytes} bytes)"
         )
 
         return created
@@ -147,6 +161,10 @@ class CheckpointManager:
         WARNING: This will modify work items and tasks to match checkpoint state.
         Consider creating a new checkpoint before restoring.
 
+        The checkpoint state is materialized by replaying its base snapshot
+        and deltas; only entities whose current state differs from it are
+        restored.
+
         Args:
             checkpoint_id: Checkpoint ID to restore
 
@@ -180,8 +198,15 @@ class CheckpointManager:
 
         # Restore state (in transaction)
         try:
-            self._restore_work_items(checkpoint.work_items_snapshot)
-            self._restore_tasks(checkpoint.tasks_snapshot)
+            changes = CheckpointAdapter.diff_snapshots(
+                {
+                    "work_items": self._capture_work_items(checkpoint.session_id),
+                    "tasks": self._capture_tasks(checkpoint.session_id),
+                },
+                CheckpointAdapter.state_of(checkpoint)
+            )
+            self._restore_work_items(changes["work_items"]["upsert"])
+            self._restore_tasks(changes["tasks"]["upsert"])
             self._restore_context(checkpoint.context_snapshot, checkpoint.session_id)
 
             # Increment restore count
@@ -275,14 +300,16 @@ class CheckpointManager:
 
     def _capture_work_items(self, session_id: int) -> List[Dict[str, Any]]:
         """Capture active work items for session."""
-        from agentpm.core.database.methods import work_items as wi_methods
+        from agentpm.core.database.enums import WorkItemStatus
+        from agentpm.core.database.methods import project_tree
 
-        # Get active work items
-        active_wis = wi_methods.list_work_items(
+        # Get active work items (tasks captured separately)
+        tree = project_tree.load_project_tree(
             self.db,
-            status="active",
-            limit=100
+            statuses=(WorkItemStatus.ACTIVE,),
+            include=()
         )
+        active_wis = [node.work_item for node in tree.work_items[:100]]
 
         # Serialize to JSON-compatible dicts
         return [
@@ -294,8 +321,6 @@ class CheckpointManager:
                 "status": wi.status,
                 "priority": wi.priority,
                 "business_context": wi.business_context,
-                "acceptance_criteria": wi.acceptance_criteria,
-                "risks": wi.risks,
                 "metadata": wi.metadata
             }
             for wi in active_wis
@@ -303,20 +328,17 @@ class CheckpointManager:
 
     def _capture_tasks(self, session_id: int) -> List[Dict[str, Any]]:
         """Capture active tasks for session."""
-        from agentpm.core.database.methods import tasks as task_methods
+        from agentpm.core.database.enums import TaskStatus
+        from agentpm.core.database.methods import project_tree
 
-        # Get active and ready tasks
-        active_tasks = task_methods.list_tasks(
+        # Get active and ready tasks in one query
+        tree = project_tree.load_project_tree(
             self.db,
-            status="active",
-            limit=100
-        )
-
-        ready_tasks = task_methods.list_tasks(
-            self.db,
-            status="ready",
-            limit=100
+            task_statuses=(TaskStatus.ACTIVE, TaskStatus.READY),
+            work_item_columns=()
         )
+        active_tasks = tree.all_tasks(TaskStatus.ACTIVE)[:100]
+        ready_tasks = tree.all_tasks(TaskStatus.READY)[:100]
 
         all_tasks = active_tasks + ready_tasks
 
@@ -325,12 +347,11 @@ class CheckpointManager:
             {
                 "id": task.id,
                 "work_item_id": task.work_item_id,
-                "objective": task.objective,
+                "name": task.name,
                 "type": task.type,
                 "status": task.status,
                 "priority": task.priority,
                 "effort_hours": task.effort_hours,
-                "acceptance_criteria": task.acceptance_criteria,
                 "quality_metadata": task.quality_metadata
             }
             for task in all_tasks
@@ -356,25 +377,10 @@ class CheckpointManager:
             "captured_at": datetime.now().isoformat()
         }
 
-    def _calculate_size(
-        self,
-        work_items: List[Dict[str, Any]],
-        tasks: List[Dict[str, Any]],
-        context: Dict[str, Any]
-    ) -> int:
-        """Calculate total size of checkpoint data in bytes."""
-        # Rough estimate using JSON serialization
-        data = {
-            "work_items": work_items,
-            "tasks": tasks,
-            "context": context
-        }
-        return len(json.dumps(data).encode('utf-8'))
-
     # Private helper methods for state restoration
 
     def _restore_work_items(self, work_items_snapshot: List[Dict[str, Any]]) -> None:
-        """Restore work items from snapshot."""
+        """Restore work items that differ from the snapshot."""
         # NOTE: This is a simplified implementation
         # In production, you'd want more sophisticated merging logic
         logger.info(f"Would restore {len(work_items_snapshot)} work items")
@@ -385,7 +391,7 @@ class CheckpointManager:
         # - Handling conflicts
 
     def _restore_tasks(self, tasks_snapshot: List[Dict[str, Any]]) -> None:
-        """Restore tasks from snapshot."""
+        """Restore tasks that differ from the snapshot."""
         logger.info(f"Would restore {len(tasks_snapshot)} tasks")
         # TODO: Implement task restoration logic
         # Similar to work items restoration
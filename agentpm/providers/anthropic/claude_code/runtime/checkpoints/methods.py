@@ -4,13 +4,28 @@ Checkpoint Database Methods
 CRUD operations for session checkpoints.
 
 Pattern: Three-layer architecture - Methods layer
+
+Snapshots are stored in the content-addressed blob store (Migration 0052):
+identical checkpoints share one compressed blob, and the inline snapshot
+columns keep their empty defaults.
+
+Incremental checkpoints (Migration 0057) store only the changes relative to
+a parent checkpoint. Reads replay the chain from the nearest full snapshot,
+so returned checkpoints always carry the complete state.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import TYPE_CHECKING, List, Optional
 
+from agentpm.core.database.methods.content_blobs import (
+    blob_columns,
+    blob_join,
+    put_blob,
+)
+
 from .models import SessionCheckpoint, CheckpointMetadata
 from .adapters import CheckpointAdapter
 
@@ -19,17 +34,44 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# A checkpoint and the parents its delta depends on, full snapshot first
+# (snapshot blobs attached, decoded by the adapter)
+_SELECT_CHAIN = (
+    """
+    WITH RECURSIVE chain(id, depth) AS (
+        SELECT ?, 0
+        UNION ALL
+        SELECT parent.parent_checkpoint_id, chain.depth + 1
+        FROM session_checkpoints AS parent
+        JOIN chain ON parent.id = chain.id
+        WHERE parent.snapshot_kind = 'delta'
+    )
+    SELECT session_checkpoints.*""" + blob_columns("snapshot_blob") + """
+    FROM chain
+    JOIN session_checkpoints ON session_checkpoints.id = chain.id"""
+    + blob_join("session_checkpoints", "snapshot_blob_key") + """
+    ORDER BY chain.depth DESC
+    """
+)
+
 
 def create_checkpoint(
     db: DatabaseService,
-    checkpoint: SessionCheckpoint
+    checkpoint: SessionCheckpoint,
+    parent: Optional[SessionCheckpoint] = None
 ) -> SessionCheckpoint:
     """
     Create a new checkpoint.
 
+    With a parent, only the changes relative to the parent's state are
+    stored (unless the delta would not be smaller than the full snapshot).
+    size_bytes, snapshot_kind, parent_checkpoint_id and chain_length are set
+    from what was stored.
+
     Args:
         db: Database service
         checkpoint: Checkpoint to create (id will be assigned)
+        parent: Materialized checkpoint of the same session to store a delta against
 
     Returns:
         Created checkpoint with assigned ID
@@ -54,44 +96,63 @@ def create_checkpoint(
 
         # Convert to database format
         db_row = CheckpointAdapter.to_database(checkpoint)
-
-        # Insert
+        document = db_row["snapshot"]
+        checkpoint.snapshot_kind = "full"
+        checkpoint.parent_checkpoint_id = None
+        checkpoint.chain_length = 1
+
+        if parent is not None and parent.id is not None:
+            delta = CheckpointAdapter.pack_state(CheckpointAdapter.diff_snapshots(
+                CheckpointAdapter.state_of(parent), CheckpointAdapter.state_of(checkpoint)
+            ))
+            if len(delta) < len(document):
+                document = delta
+                checkpoint.snapshot_kind = "delta"
+                checkpoint.parent_checkpoint_id = parent.id
+                checkpoint.chain_length = parent.chain_length + 1
+        checkpoint.size_bytes = len(document.encode("utf-8"))
+
+        # Snapshots go to the blob store (deduplicated by content key)
+        snapshot_blob_key = put_blob(conn, document)
+
+        # Insert (inline snapshot columns keep their empty defaults)
         cursor.execute("""
             INSERT INTO session_checkpoints (
                 session_id,
                 checkpoint_name,
                 created_at,
-                work_items_snapshot,
-                tasks_snapshot,
-                context_snapshot,
+                snapshot_blob_key,
                 session_notes,
                 created_by,
                 restore_count,
-                size_bytes
+                size_bytes,
+                snapshot_kind,
+                parent_checkpoint_id
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             db_row["session_id"],
             db_row["checkpoint_name"],
             db_row["created_at"],
-            db_row["work_items_snapshot"],
-            db_row["tasks_snapshot"],
-            db_row["context_snapshot"],
+            snapshot_blob_key,
             db_row["session_notes"],
             db_row["created_by"],
             db_row["restore_count"],
-            db_row["size_bytes"],
+            checkpoint.size_bytes,
+            checkpoint.snapshot_kind,
+            checkpoint.parent_checkpoint_id,
         ))
 
         checkpoint_id = cursor.lastrowid
         conn.commit()
 
         logger.info(
-            f"Created checkpoint: {checkpoint.checkpoint_name} "
+            f"Created {checkpoint.snapshot_kind} checkpoint: {checkpoint.checkpoint_name} "
             f"(ID: {checkpoint_id}, session: {checkpoint.session_id})"
         )
 
         # Return with assigned ID
         checkpoint.id = checkpoint_id
+        checkpoint.snapshot_blob_key = snapshot_blob_key
         return checkpoint
 
 
@@ -115,22 +176,28 @@ def get_checkpoint(
             print(f"Found: {checkpoint.checkpoint_name}")
     """
     with db.connect() as conn:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT *
-            FROM session_checkpoints
-            WHERE id = ?
-        """, (checkpoint_id,))
-
-        row = cursor.fetchone()
-
-        if not row:
-            return None
-
-        # Convert to dict for adapter
-        row_dict = dict(row)
-        return CheckpointAdapter.from_database(row_dict)
+        return _load_checkpoint(conn, checkpoint_id)
+
+
+def _load_checkpoint(conn, checkpoint_id: int) -> Optional[SessionCheckpoint]:
+    """Load a checkpoint, replaying its delta chain from the nearest full snapshot"""
+    rows = [dict(row) for row in conn.execute(_SELECT_CHAIN, (checkpoint_id,)).fetchall()]
+    if not rows or rows[-1]["id"] != checkpoint_id:
+        return None
+    if len(rows) == 1 and rows[0].get("snapshot_kind", "full") == "full":
+        return CheckpointAdapter.from_database(rows[0])
+
+    deltas = rows
+    if rows[0].get("snapshot_kind") == "delta":
+        # Base missing (deletes rewrite dependents, so this indicates manual edits)
+        logger.warning(f"Checkpoint {rows[0]['id']} has no base snapshot; replaying from empty state")
+        state = CheckpointAdapter.unpack_snapshot(None)
+    else:
+        state = CheckpointAdapter.state_of(CheckpointAdapter.from_database(rows[0]))
+        deltas = rows[1:]
+    for row in deltas:
+        state = CheckpointAdapter.apply_delta(state, json.loads(CheckpointAdapter.row_document(row) or "{}"))
+    return CheckpointAdapter.from_database(rows[-1], state=state, chain_length=len(rows))
 
 
 def list_checkpoints(
@@ -162,7 +229,7 @@ def list_checkpoints(
         if session_id:
             cursor.execute("""
                 SELECT id, checkpoint_name, created_at, session_id,
-                       size_bytes, restore_count, session_notes
+                       size_bytes, restore_count, session_notes, snapshot_kind
                 FROM session_checkpoints
                 WHERE session_id = ?
                 ORDER BY created_at DESC
@@ -171,7 +238,7 @@ def list_checkpoints(
         else:
             cursor.execute("""
                 SELECT id, checkpoint_name, created_at, session_id,
-                       size_bytes, restore_count, session_notes
+                       size_bytes, restore_count, session_notes, snapshot_kind
                 FROM session_checkpoints
                 ORDER BY created_at DESC
                 LIMIT ?
@@ -208,6 +275,21 @@ def delete_checkpoint(
     with db.connect() as conn:
         cursor = conn.cursor()
 
+        # Deltas stored against this checkpoint become full snapshots first
+        dependents = conn.execute(
+            "SELECT id FROM session_checkpoints WHERE parent_checkpoint_id = ? AND snapshot_kind = 'delta'",
+            (checkpoint_id,)
+        ).fetchall()
+        for (dependent_id,) in dependents:
+            dependent = _load_checkpoint(conn, dependent_id)
+            document = CheckpointAdapter.pack_snapshot(dependent)
+            conn.execute("""
+                UPDATE session_checkpoints
+                SET snapshot_kind = 'full', parent_checkpoint_id = NULL,
+                    snapshot_blob_key = ?, size_bytes = ?
+                WHERE id = ?
+            """, (put_blob(conn, document), len(document.encode("utf-8")), dependent_id))
+
         cursor.execute("""
             DELETE FROM session_checkpoints
             WHERE id = ?
@@ -284,20 +366,14 @@ def get_latest_checkpoint(
             print(f"Latest: {latest.checkpoint_name}")
     """
     with db.connect() as conn:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT *
-            FROM session_checkpoints
+        row = conn.execute("""
+            SELECT id FROM session_checkpoints
             WHERE session_id = ?
-            ORDER BY created_at DESC
+            ORDER BY created_at DESC, id DESC
             LIMIT 1
-        """, (session_id,))
-
-        row = cursor.fetchone()
+        """, (session_id,)).fetchone()
 
         if not row:
             return None
 
-        row_dict = dict(row)
-        return CheckpointAdapter.from_database(row_dict)
+        return _load_checkpoint(conn, row[0])
@@ -31,7 +31,10 @@ class SessionCheckpoint(BaseModel):
         session_notes: User notes about this checkpoint
         created_by: User who created checkpoint
         restore_count: Number of times this checkpoint was restored
-        size_bytes: Total size of checkpoint data in bytes
+        size_bytes: Bytes stored for this checkpoint (the delta for incremental ones)
+        snapshot_kind: 'full' or 'delta'
+        parent_checkpoint_id: Checkpoint a delta applies to
+        chain_length: Stored checkpoints replayed to materialize the snapshots
 
     Example:
         checkpoint = SessionCheckpoint(
@@ -113,10 +116,33 @@ class SessionCheckpoint(BaseModel):
 
     size_bytes: int = Field(
         default=0,
-        description="Total size of checkpoint data in bytes",
+        description="Bytes stored for this checkpoint (only the changes for deltas)",
         ge=0
     )
 
+    snapshot_blob_key: Optional[str] = Field(
+        default=None,
+        description="SHA-256 key of the stored snapshot blob (set by the database)"
+    )
+
+    # Incremental storage (snapshot fields always hold the materialized state)
+    snapshot_kind: str = Field(
+        default="full",
+        description="How the snapshot is stored: 'full' or 'delta' (changes since parent)",
+        pattern="^(full|delta)$"
+    )
+
+    parent_checkpoint_id: Optional[int] = Field(
+        default=None,
+        description="Checkpoint a delta applies to (None for full snapshots)"
+    )
+
+    chain_length: int = Field(
+        default=1,
+        description="Stored checkpoints replayed to materialize this one (1 for full snapshots)",
+        ge=1
+    )
+
     class Config:
         """Pydantic configuration."""
         json_schema_extra = {
@@ -174,6 +200,7 @@ class CheckpointMetadata(BaseModel):
         size_bytes: Data size
         restore_count: Restore count
         notes_preview: First 100 chars of notes
+        snapshot_kind: Stored as 'full' or 'delta'
 
     Example:
         metadata = CheckpointMetadata(
@@ -198,6 +225,7 @@ class CheckpointMetadata(BaseModel):
         description="First 100 chars of notes",
         max_length=100
     )
+    snapshot_kind: str = Field(default="full", description="Stored as 'full' or 'delta'")
 
     class Config:
         """Pydantic configuration."""
@@ -19,7 +19,7 @@ class DocumentSearchResult(BaseModel):
         snippet: Content excerpt containing search match
         rank: Relevance score (0.0 to 1.0, higher is more relevant)
         matched_terms: List of query terms that matched
-        highlights: List of (start, end) character positions for highlighting
+        highlights: List of (start, end) snippet positions for highlighting
     """
 
     document_id: int = Field(..., description="Document ID from database")
@@ -33,7 +33,7 @@ class DocumentSearchResult(BaseModel):
     )
     highlights: List[Tuple[int, int]] = Field(
         default_factory=list,
-        description="Character positions (start, end) for highlighting matches"
+        description="Character positions (start, end) of matches within the snippet"
     )
 
     # Optional metadata
@@ -3,20 +3,21 @@ Document Search Service
 
 Full-text search across document content with ranking, snippets, and highlights.
 
-Current Implementation: File-based search (reads content from disk)
-Future Migration: FTS5-based search when Task #711 completes (content column added)
+Implementation: Chunked FTS5 index (Migration 0051). Document content stored in
+the database is split into heading-aware chunks, indexed with FTS5 and ranked
+with BM25. Snippets are generated from the index, so searching never reads
+document files from disk.
 
-Performance Target: <200ms for 1000+ documents (with FTS5)
+Performance Target: <200ms for 1000+ documents
 """
 
 from typing import List, Optional, Tuple
-from pathlib import Path
 import time
 
 from ...core.database.service import DatabaseService
 from ...core.database.enums import EntityType
-from ...core.search.models import SearchQuery, SearchFilter, SearchScope
-from ...core.search.service import SearchService
+from ...core.database.methods import document_chunks
+from ...core.search.models import SearchQuery, SearchScope
 from .models import DocumentSearchResult
 
 
@@ -25,19 +26,11 @@ class DocumentSearchService:
     Full-text search service for documents.
 
     Provides enterprise-grade document search with:
-    - Full-text content search
-    - Relevance ranking (BM25 algorithm when FTS5 enabled)
-    - Context-aware snippets
+    - Full-text content search over an FTS5 chunk index
+    - Relevance ranking (BM25, best matching chunk per document)
+    - Index-generated snippets labelled with their section heading
     - Multi-term highlighting
     - Entity-scoped search
-    - Query suggestions
-
-    Current Implementation:
-        Hybrid approach - searches metadata via existing DocumentSearchAdapter,
-        then enhances with file-based content search for matched documents.
-
-    Future Implementation (after Task #711):
-        FTS5-based search with database content column for optimal performance.
 
     Example:
         >>> service = DocumentSearchService(db_service)
@@ -54,7 +47,6 @@ class DocumentSearchService:
             db_service: Database service instance for queries
         """
         self.db = db_service
-        self.search_service = SearchService(db_service)
 
     def search_content(
         self,
@@ -62,24 +54,29 @@ class DocumentSearchService:
         entity_type: Optional[EntityType] = None,
         document_type: Optional[str] = None,
         limit: int = 10,
-        offset: int = 0
+        offset: int = 0,
+        entity_id: Optional[int] = None
     ) -> List[DocumentSearchResult]:
         """
         Full-text search across document content.
 
-        Searches document title, description, and content (read from files).
-        Returns results ranked by relevance with highlighted snippets.
+        Searches document titles, section headings and content via the chunk
+        index. Returns results ranked by relevance with highlighted snippets.
 
         Args:
-            query: Search query text (supports multi-word queries)
+            query: Search query text (supports multi-word queries and "quoted phrases")
             entity_type: Filter by entity type (work_item, task, etc.)
             document_type: Filter by document type (design, requirements, etc.)
             limit: Maximum results to return
             offset: Number of results to skip (pagination)
+            entity_id: Filter by entity ID
 
         Returns:
             List of DocumentSearchResult objects sorted by relevance
 
+        Raises:
+            pydantic.ValidationError: If query is empty or limit/offset invalid
+
         Example:
             >>> results = service.search_content("database migration")
             >>> print(f"Found {len(results)} documents")
@@ -87,84 +84,34 @@ class DocumentSearchService:
         """
         start_time = time.time()
 
-        # Build search filters
-        filters = SearchFilter()
-        if entity_type:
-            filters.entity_types = [entity_type]
-
-        # Search using existing document adapter (title/description only)
+        # Validate query parameters with the shared search query model
         search_query = SearchQuery(
             query=query,
             scope=SearchScope.DOCUMENTS if hasattr(SearchScope, 'DOCUMENTS') else SearchScope.ALL,
-            limit=limit * 3,  # Get more candidates for content filtering
+            limit=limit,
             offset=offset,
             highlight=True
         )
-        search_query.filters = filters
 
-        # Get basic results from metadata search
-        basic_results = self.search_service.search_documents(
-            query=query,
-            filters=filters,
-            limit=limit * 3,
-            offset=offset
+        matches = document_chunks.search_document_chunks(
+            self.db,
+            search_query.query,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            document_type=document_type,
+            limit=search_query.limit,
+            offset=search_query.offset
         )
 
-        # Enhance with file content search
-        enhanced_results = []
-        for result in basic_results:
-            file_path = result.metadata.get('file_path') if result.metadata else None
-            if not file_path:
-                continue
-
-            # Read file content (temporary until Task #711 adds content column)
-            content = self._read_file_content(file_path)
-            if not content:
-                # If can't read content, still include if title/description matched
-                if query.lower() in (result.title or "").lower():
-                    enhanced_results.append(self._create_result_from_metadata(
-                        result, query
-                    ))
-                continue
-
-            # Check if query matches in content
-            if self._content_matches(content, query):
-                snippet = self._create_snippet(content, query)
-                highlights = self._find_highlights(content, query)
-                matched_terms = self._extract_matched_terms(content, query)
-
-                # Calculate enhanced relevance score
-                # TODO: Replace with BM25 when FTS5 is available
-                rank = self._calculate_relevance(
-                    content=content,
-                    query=query,
-                    base_score=result.relevance_score
-                )
-
-                enhanced_results.append(DocumentSearchResult(
-                    document_id=result.entity_id,
-                    title=result.title or "Untitled Document",
-                    file_path=file_path,
-                    snippet=snippet,
-                    rank=rank,
-                    matched_terms=matched_terms,
-                    highlights=highlights,
-                    document_type=result.metadata.get('document_type') if result.metadata else None,
-                    entity_type=result.entity_type.value if result.entity_type else None,
-                    entity_id=result.metadata.get('entity_id') if result.metadata else None
-                ))
-
-        # Sort by rank (descending) and apply limit
-        enhanced_results.sort(key=lambda r: r.rank, reverse=True)
-        final_results = enhanced_results[:limit]
+        results = [self._create_result(match) for match in matches]
 
         # Log search performance
         search_time_ms = (time.time() - start_time) * 1000
         if search_time_ms > 200:  # Performance target
             print(f"WARNING: Document search took {search_time_ms:.1f}ms (target: <200ms)")
-            print(f"  Searched {len(basic_results)} documents, returned {len(final_results)} results")
+            print(f"  Returned {len(results)} results")
 
-        return final_results
+        return results
 
     def search_by_entity(
         self,
@@ -192,26 +139,33 @@ class DocumentSearchService:
             ...     "architecture"
             ... )
         """
-        # Build entity filter
-        filters = SearchFilter(
-            entity_types=[entity_type]
-        )
-
-        # TODO: Add entity_id filtering when SearchFilter supports it
-        # For now, filter in Python after retrieval
-        all_results = self.search_content(
+        return self.search_content(
             query=query,
             entity_type=entity_type,
-            limit=limit * 2  # Get more to filter
+            entity_id=entity_id,
+            limit=limit
         )
 
-        # Filter by entity_id
-        filtered_results = [
-            r for r in all_results
-            if r.entity_id == entity_id
-        ]
+    def rebuild_search_index(self) -> int:
+        """
+        Rebuild the document content index from stored document content.
+
+        Returns:
+            Number of chunks indexed
+        """
+        return document_chunks.rebuild_document_index(self.db)
+
+    def update_search_index_for_document(self, document_id: int) -> int:
+        """
+        Re-index a single document.
+
+        Args:
+            document_id: Document reference ID
 
-        return filtered_results[:limit]
+        Returns:
+            Number of chunks indexed
+        """
+        return document_chunks.reindex_document(self.db, document_id)
 
     def get_search_suggestions(
         self,
@@ -221,11 +175,6 @@ class DocumentSearchService:
         """
         Get search query suggestions based on partial input.
 
-        Returns suggested completions based on:
-        - Document titles
-        - Common terms in content
-        - Previous successful searches
-
         Args:
             partial: Partial search query
             limit: Maximum suggestions to return
@@ -235,269 +184,87 @@ class DocumentSearchService:
 
         Note:
             Current implementation returns empty list (stub).
-            Will be implemented with FTS5 when Task #711 completes.
-
-        TODO (Task #711):
-            - Create FTS5 auxiliary table for term suggestions
-            - Implement prefix matching on document content
-            - Track popular/successful queries for suggestions
         """
-        # TODO: Implement after Task #711 (FTS5 suggestion queries)
         return []
 
     # Private helper methods
 
-    def _read_file_content(self, file_path: str) -> Optional[str]:
+    def _create_result(self, match: dict) -> DocumentSearchResult:
         """
-        Read document content from file.
-
-        Temporary implementation - reads from disk.
-        Will be replaced with database query when Task #711 completes.
-
-        Args:
-            file_path: Path to document file (relative to project root)
-
-        Returns:
-            File content as string, or None if read fails
-        """
-        try:
-            # Try absolute path first
-            path = Path(file_path)
-            if not path.is_absolute():
-                # Make relative to project root
-                # Assumes service is running from project root
-                path = Path.cwd() / file_path
-
-            if path.exists() and path.is_file():
-                return path.read_text(encoding='utf-8')
-        except Exception as e:
-            print(f"Warning: Could not read {file_path}: {e}")
-        return None
-
-    def _content_matches(self, content: str, query: str) -> bool:
-        """
-        Check if content matches search query.
-
-        Implements simple multi-word matching.
-        Will be replaced with FTS5 MATCH when Task #711 completes.
+        Convert an index match into a DocumentSearchResult.
 
         Args:
-            content: Document content
-            query: Search query
+            match: Row from document_chunks.search_document_chunks
 
         Returns:
-            True if content matches query
+            DocumentSearchResult with snippet, highlights and matched terms
         """
-        content_lower = content.lower()
-        query_lower = query.lower()
+        snippet, highlights = self._parse_snippet(match.get('snippet') or '')
+        heading = match.get('heading_path')
+        if heading:
+            prefix = f"{heading}: "
+            snippet = prefix + snippet
+            highlights = [(start + len(prefix), end + len(prefix)) for start, end in highlights]
+
+        matched_terms = []
+        for start, end in highlights:
+            term = snippet[start:end].lower()
+            if term not in matched_terms:
+                matched_terms.append(term)
 
-        # Check if all query words are in content
-        query_words = query_lower.split()
-        return all(word in content_lower for word in query_words)
-
-    def _create_snippet(
-        self,
-        content: str,
-        query: str,
-        max_length: int = 200
-    ) -> str:
-        """
-        Create content snippet centered on query match.
-
-        Args:
-            content: Full document content
-            query: Search query
-            max_length: Maximum snippet length
-
-        Returns:
-            Content snippet with query match in context
-        """
-        query_lower = query.lower()
-        content_lower = content.lower()
-
-        # Find first occurrence of any query word
-        query_words = query_lower.split()
-        positions = []
-        for word in query_words:
-            pos = content_lower.find(word)
-            if pos != -1:
-                positions.append(pos)
-
-        if not positions:
-            # No match found, return beginning
-            return content[:max_length] + ('...' if len(content) > max_length else '')
-
-        # Use earliest match position
-        match_pos = min(positions)
-
-        # Calculate snippet boundaries (centered on match)
-        half_length = max_length // 2
-        start = max(0, match_pos - half_length)
-        end = min(len(content), match_pos + half_length)
-
-        # Adjust start to avoid cutting words
-        if start > 0:
-            while start < len(content) and content[start] not in ' \n\t':
-                start += 1
-            start += 1  # Skip the whitespace
-
-        # Extract snippet
-        snippet = content[start:end].strip()
-
-        # Add ellipsis
-        if start > 0:
-            snippet = '...' + snippet
-        if end < len(content):
-            snippet = snippet + '...'
-
-        return snippet
-
-    def _find_highlights(
-        self,
-        content: str,
-        query: str,
-        max_highlights: int = 10
-    ) -> List[Tuple[int, int]]:
-        """
-        Find character positions for highlighting matches.
-
-        Args:
-            content: Document content
-            query: Search query
-            max_highlights: Maximum number of highlights to return
-
-        Returns:
-            List of (start, end) character positions
-        """
-        highlights = []
-        content_lower = content.lower()
-
-        # Find all query words
-        query_words = query.lower().split()
-
-        for word in query_words:
-            pos = 0
-            while len(highlights) < max_highlights:
-                pos = content_lower.find(word, pos)
-                if pos == -1:
-                    break
-                highlights.append((pos, pos + len(word)))
-                pos += len(word)
-
-            if len(highlights) >= max_highlights:
-                break
-
-        # Sort by position and remove duplicates
-        highlights = sorted(list(set(highlights)))
-        return highlights[:max_highlights]
-
-    def _extract_matched_terms(self, content: str, query: str) -> List[str]:
-        """
-        Extract query terms that matched in content.
-
-        Args:
-            content: Document content
-            query: Search query
-
-        Returns:
-            List of query terms found in content
-        """
-        content_lower = content.lower()
-        query_words = query.lower().split()
-
-        matched = []
-        for word in query_words:
-            if word in content_lower and word not in matched:
-                matched.append(word)
-
-        return matched
+        return DocumentSearchResult(
+            document_id=match['document_id'],
+            title=match.get('title') or "Untitled Document",
+            file_path=match.get('file_path') or '',
+            snippet=snippet,
+            rank=self._normalize_score(match['score']),
+            matched_terms=matched_terms,
+            highlights=highlights,
+            document_type=match.get('document_type'),
+            entity_type=match.get('entity_type'),
+            entity_id=match.get('entity_id')
+        )
 
-    def _calculate_relevance(
-        self,
-        content: str,
-        query: str,
-        base_score: float
-    ) -> float:
+    def _parse_snippet(self, marked: str) -> Tuple[str, List[Tuple[int, int]]]:
         """
-        Calculate relevance score for search result.
-
-        Simple algorithm for now - will be replaced with BM25 when FTS5 available.
+        Strip FTS5 match markers from a snippet, recording highlight positions.
 
         Args:
-            content: Document content
-            query: Search query
-            base_score: Base score from metadata search
+            marked: Snippet with SNIPPET_MATCH_START/END markers around matches
 
         Returns:
-            Relevance score between 0.0 and 1.0
+            (plain snippet, list of (start, end) positions within the snippet)
         """
-        content_lower = content.lower()
-        query_lower = query.lower()
-        query_words = query_lower.split()
-
-        # Count matches
-        match_count = sum(content_lower.count(word) for word in query_words)
-
-        # Calculate score based on match density
-        content_length = len(content.split())
-        density = min(1.0, match_count / max(1, content_length / 100))
-
-        # Boost if query appears as exact phrase
-        phrase_boost = 1.2 if query_lower in content_lower else 1.0
-
-        # Combine with base score
-        final_score = min(1.0, (base_score * 0.3 + density * 0.7) * phrase_boost)
-
-        return round(final_score, 3)
-
-    def _create_result_from_metadata(
-        self,
-        search_result,
-        query: str
-    ) -> DocumentSearchResult:
+        plain: List[str] = []
+        highlights: List[Tuple[int, int]] = []
+        length = 0
+        start = None
+
+        for char in marked:
+            if char == document_chunks.SNIPPET_MATCH_START:
+                start = length
+            elif char == document_chunks.SNIPPET_MATCH_END:
+                if start is not None and length > start:
+                    highlights.append((start, length))
+                start = None
+            else:
+                plain.append(char)
+                length += 1
+
+        return ''.join(plain), highlights
+
+    def _normalize_score(self, bm25_score: float) -> float:
         """
-        Create DocumentSearchResult from metadata-only match.
-
-        Used when file content is not available.
+        Map a BM25 score (negative, lower is better) onto 0.0-1.0.
 
         Args:
-            search_result: SearchResult from metadata search
-            query: Search query
+            bm25_score: Raw FTS5 bm25() value
 
         Returns:
-            DocumentSearchResult with metadata-based snippet
+            Relevance score between 0.0 and 1.0 (higher is more relevant)
         """
-        snippet = search_result.excerpt or search_result.content or ""
-        return DocumentSearchResult(
-            document_id=search_result.entity_id,
-            title=search_result.title or "Untitled Document",
-            file_path=search_result.metadata.get('file_path', ''),
-            snippet=snippet,
-            rank=search_result.relevance_score,
-            matched_terms=query.lower().split(),
-            highlights=[],
-            document_type=search_result.metadata.get('document_type') if search_result.metadata else None,
-            entity_type=search_result.entity_type.value if search_result.entity_type else None,
-            entity_id=search_result.metadata.get('entity_id') if search_result.metadata else None
-        )
-
-
-# TODO: Future enhancements when Task #711 completes
-#
-# 1. Add content column to document_references table
-# 2. Create FTS5 virtual table:
-#    CREATE VIRTUAL TABLE document_content_fts USING fts5(
-#        document_id, title, content,
-#        tokenize='porter unicode61'
-#    );
-# 3. Implement rebuild_search_index() method
-# 4. Implement update_search_index_for_document(document_id)
-# 5. Replace file-based search with FTS5 queries
-# 6. Add BM25 ranking with custom weights
-# 7. Implement sophisticated query parsing (quoted phrases, boolean operators)
-# 8. Add query suggestion using FTS5 auxiliary functions
-# 9. Performance optimization: <200ms for 1000+ documents
-# 10. Add search analytics and metrics tracking
+        magnitude = abs(bm25_score or 0.0)
+        return round(magnitude / (1.0 + magnitude), 3)
 
 
 __all__ = ['DocumentSearchService']
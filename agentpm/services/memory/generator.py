@@ -16,14 +16,33 @@ always-current access to:
 """
 
 import hashlib
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
-from agentpm.core.database.service import DatabaseService
+from agentpm.core.database.service import DatabaseService, DatabaseError
 from agentpm.core.database.models.memory import MemoryFile, MemoryFileType, ValidationStatus
-from agentpm.core.database.methods import memory_methods
+from agentpm.core.database.methods import memory_methods, table_versions
+
+TEMPLATE_VERSION = "1.0.0"
+
+# Tables each file type's generator reads (drives the source watermark)
+SOURCE_TABLES: Dict[MemoryFileType, List[str]] = {
+    MemoryFileType.RULES: ["rules"],
+    MemoryFileType.PRINCIPLES: ["rules"],
+    MemoryFileType.WORKFLOW: ["work_items", "tasks"],
+    MemoryFileType.AGENTS: ["agents"],
+    MemoryFileType.CONTEXT: ["contexts"],
+    MemoryFileType.PROJECT: ["projects"],
+    MemoryFileType.IDEAS: ["ideas"],
+}
+
+# Generation timestamp line, excluded from the content hash
+_GENERATED_LINE_RE = re.compile(r'^\*\*Generated\*\*:.*$', re.MULTILINE)
 
 
 class MemoryGenerator:
@@ -57,6 +76,11 @@ class MemoryGenerator:
     ) -> MemoryFile:
         """Generate a memory file for Claude.
 
+        Regeneration is change-driven: an unexpired file whose source tables
+        are unchanged since it was generated (same watermark) is returned as-is,
+        and regenerated content that matches the stored content is neither
+        rewritten in the database nor on disk.
+
         Args:
             project_id: Project ID
             file_type: Type of memory file to generate
@@ -71,53 +95,211 @@ class MemoryGenerator:
             >>> memory = generator.generate_memory_file(1, MemoryFileType.RULES)
             >>> print(f"Generated {memory.file_path}")
         """
+        plan = self._plan_memory_file(project_id, file_type, force_regenerate)
+        return self._persist_memory_file(plan, session_id)
+
+    def generate_all_memory_files(
+        self,
+        project_id: int,
+        session_id: Optional[int] = None,
+        force_regenerate: bool = False,
+        max_workers: Optional[int] = None
+    ) -> List[MemoryFile]:
+        """Generate all memory files for a project.
+
+        Args:
+            project_id: Project ID
+            session_id: Optional session ID (for tracking)
+            force_regenerate: Force regeneration even if sources are unchanged
+            max_workers: Thread pool size (None: one per file type; 1: sequential)
+
+        Returns:
+            List of generated MemoryFile models
+
+        Example:
+            >>> generator = MemoryGenerator(db, Path("/project"))
+            >>> memories = generator.generate_all_memory_files(1)
+            >>> print(f"Generated {len(memories)} memory files")
+        """
+        memory_files, errors = self.generate_memory_files(
+            project_id,
+            session_id=session_id,
+            force_regenerate=force_regenerate,
+            max_workers=max_workers
+        )
+        for file_type, error in errors.items():
+            # Log error but continue with other files
+            print(f"Error generating {file_type.value}: {error}")
+
+        return memory_files
+
+    def generate_memory_files(
+        self,
+        project_id: int,
+        file_types: Optional[List[MemoryFileType]] = None,
+        session_id: Optional[int] = None,
+        force_regenerate: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Tuple[List[MemoryFile], Dict[MemoryFileType, str]]:
+        """Generate several memory files, collecting per-file errors.
+
+        File types are independent, so watermarks and content are computed
+        concurrently; results are then persisted one at a time (SQLite allows
+        a single writer) in file type order.
+
+        Args:
+            project_id: Project ID
+            file_types: File types to generate (None: all)
+            session_id: Optional session ID (for tracking)
+            force_regenerate: Force regeneration even if sources are unchanged
+            max_workers: Thread pool size (None: one per file type; 1: sequential)
+
+        Returns:
+            Tuple of (generated MemoryFile models, {file_type: error message})
+        """
+        file_types = list(file_types) if file_types is not None else list(MemoryFileType)
+        if not file_types:
+            return [], {}
+
+        def plan(file_type: MemoryFileType) -> Tuple[Optional['_MemoryFilePlan'], Optional[Exception]]:
+            try:
+                return self._plan_memory_file(project_id, file_type, force_regenerate), None
+            except Exception as e:
+                return None, e
+
+        workers = max_workers or len(file_types)
+        if workers == 1:
+            outcomes = [plan(file_type) for file_type in file_types]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='apm-memory') as executor:
+                outcomes = list(executor.map(plan, file_types))
+
+        memory_files = []
+        errors: Dict[MemoryFileType, str] = {}
+        for file_type, (planned, error) in zip(file_types, outcomes):
+            try:
+                if error is not None:
+                    raise error
+                memory_files.append(self._persist_memory_file(planned, session_id))
+            except Exception as e:
+                errors[file_type] = str(e)
+
+        return memory_files, errors
+
+    def _plan_memory_file(
+        self,
+        project_id: int,
+        file_type: MemoryFileType,
+        force_regenerate: bool
+    ) -> '_MemoryFilePlan':
+        """Decide whether a memory file needs regenerating (read-only).
+
+        Args:
+            project_id: Project ID
+            file_type: Type of memory file
+            force_regenerate: Regenerate even if sources are unchanged
+
+        Returns:
+            _MemoryFilePlan with new content, or with content=None if the
+            existing file is still current
+        """
         start_time = time.time()
+        existing = memory_methods.get_memory_file_by_type(self.db, project_id, file_type)
+        watermark = self._compute_watermark(project_id, SOURCE_TABLES.get(file_type, []))
+
+        plan = _MemoryFilePlan(
+            project_id=project_id,
+            file_type=file_type,
+            existing=existing,
+            watermark=watermark,
+            start_time=start_time
+        )
+
+        if (not force_regenerate and existing and not existing.is_stale and not existing.is_expired
+                and existing.source_watermark in (watermark, None)):
+            # Sources unchanged since generation (or legacy row without a watermark)
+            return plan
 
-        # Check if current file exists and is not stale (unless forcing)
-        if not force_regenerate:
-            existing = memory_methods.get_memory_file_by_type(self.db, project_id, file_type)
-            if existing and not existing.is_stale and not existing.is_expired:
-                return existing
+        plan.content, plan.source_tables = self._generate_content_for_type(project_id, file_type)
+        return plan
+
+    def _persist_memory_file(
+        self,
+        plan: '_MemoryFilePlan',
+        session_id: Optional[int]
+    ) -> MemoryFile:
+        """Store a planned memory file and write it to disk if it changed.
 
-        # Generate content based on file type
-        content, source_tables = self._generate_content_for_type(project_id, file_type)
+        Args:
+            plan: Result of _plan_memory_file
+            session_id: Optional session ID (for tracking)
 
-        # Calculate file hash
+        Returns:
+            Stored MemoryFile model
+        """
+        existing = plan.existing
+        now = datetime.now()
+
+        if plan.content is None:
+            # Current file: keep content, record the watermark, restore a missing disk copy
+            if existing.source_watermark != plan.watermark:
+                existing = memory_methods.update_memory_file(self.db, existing.id, {
+                    'source_watermark': plan.watermark,
+                    'validated_at': now.isoformat(),
+                    'expires_at': (now + timedelta(hours=24)).isoformat()
+                })
+            self._write_file_if_changed(existing.file_path, existing.content)
+            return existing
+
+        content = plan.content
+        source_tables = plan.source_tables
+
+        # Calculate file hash (ignores the volatile generation timestamp)
         file_hash = self._calculate_hash(content)
 
         # Calculate quality scores
         confidence_score = self._calculate_confidence(content, source_tables)
-        completeness_score = self._calculate_completeness(content, file_type)
+        completeness_score = self._calculate_completeness(content, plan.file_type)
 
         # Determine file path
-        file_path = self._get_file_path(file_type)
+        file_path = self._get_file_path(plan.file_type)
 
         # Calculate generation duration
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = int((time.time() - plan.start_time) * 1000)
+
+        if existing and existing.file_hash == file_hash:
+            # Same content as stored: refresh metadata only, keep file on disk
+            updates = {
+                'source_watermark': plan.watermark,
+                'validation_status': ValidationStatus.VALIDATED,
+                'validated_at': now.isoformat(),
+                'expires_at': (now + timedelta(hours=24)).isoformat()
+            }
+            memory_file = memory_methods.update_memory_file(self.db, existing.id, updates)
+            self._write_file_if_changed(memory_file.file_path, memory_file.content)
+            return memory_file
 
         # Create memory file model
         memory_file = MemoryFile(
-            project_id=project_id,
+            project_id=plan.project_id,
             session_id=session_id,
-            file_type=file_type,
+            file_type=plan.file_type,
             file_path=file_path,
             file_hash=file_hash,
             content=content,
             source_tables=source_tables,
-            template_version="1.0.0",
+            template_version=TEMPLATE_VERSION,
+            source_watermark=plan.watermark,
             confidence_score=confidence_score,
             completeness_score=completeness_score,
             validation_status=ValidationStatus.VALIDATED,
             generated_by="memory-generator",
             generation_duration_ms=duration_ms,
-            generated_at=datetime.now().isoformat(),
-            validated_at=datetime.now().isoformat(),
-            expires_at=(datetime.now() + timedelta(hours=24)).isoformat()
+            generated_at=now.isoformat(),
+            validated_at=now.isoformat(),
+            expires_at=(now + timedelta(hours=24)).isoformat()
         )
 
-        # Check if file already exists for this project and type
-        existing = memory_methods.get_memory_file_by_type(self.db, project_id, file_type)
-
         if existing:
             # Update existing record
             updates = {
@@ -125,6 +307,8 @@ class MemoryGenerator:
                 'file_hash': file_hash,
                 'content': content,
                 'source_tables': source_tables,
+                'template_version': TEMPLATE_VERSION,
+                'source_watermark': plan.watermark,
                 'confidence_score': confidence_score,
                 'completeness_score': completeness_score,
                 'validation_status': ValidationStatus.VALIDATED,
@@ -143,36 +327,55 @@ class MemoryGenerator:
 
         return memory_file
 
-    def generate_all_memory_files(
-        self,
-        project_id: int,
-        session_id: Optional[int] = None
-    ) -> List[MemoryFile]:
-        """Generate all memory files for a project.
+    def _compute_watermark(self, project_id: int, tables: List[str]) -> str:
+        """Compute a digest of the current state of a memory file's source tables.
+
+        Per table: its change counter from table_versions (Migration 0055),
+        bumped by triggers on every insert, update and delete, including
+        in-place edits that leave updated_at alone. Counters are per table,
+        not per project, so a change in another project also regenerates.
+        Tables without a counter (database before Migration 0055) fall back
+        to row count, max id and max updated_at. The template version is
+        included so template changes also invalidate generated files.
 
         Args:
             project_id: Project ID
-            session_id: Optional session ID (for tracking)
+            tables: Source tables read by the file's generator
 
         Returns:
-            List of generated MemoryFile models
-
-        Example:
-            >>> generator = MemoryGenerator(db, Path("/project"))
-            >>> memories = generator.generate_all_memory_files(1)
-            >>> print(f"Generated {len(memories)} memory files")
+            Hex digest identifying the source state
         """
-        memory_files = []
+        parts = [TEMPLATE_VERSION, f"project:{project_id}"]
+        try:
+            versions = table_versions.get_table_versions(self.db, tables)
+        except DatabaseError:
+            versions = {}  # no table_versions table
+        with self.db.connect() as conn:
+            for table in tables:
+                if table in versions:
+                    parts.append(f"{table}:v{versions[table][0]}")
+                    continue
 
-        for file_type in MemoryFileType:
-            try:
-                memory_file = self.generate_memory_file(project_id, file_type, session_id)
-                memory_files.append(memory_file)
-            except Exception as e:
-                # Log error but continue with other files
-                print(f"Error generating {file_type.value}: {e}")
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if not columns:
+                    parts.append(f"{table}:missing")
+                    continue
 
-        return memory_files
+                select = "COUNT(*), MAX(rowid)"
+                select += ", MAX(updated_at)" if 'updated_at' in columns else ", NULL"
+                if table == 'projects':
+                    where, params = " WHERE id = ?", (project_id,)
+                elif 'project_id' in columns:
+                    where, params = " WHERE project_id = ?", (project_id,)
+                else:
+                    where, params = "", ()
+
+                count, max_id, max_updated = conn.execute(
+                    f"SELECT {select} FROM {table}{where}", params
+                ).fetchone()
+                parts.append(f"{table}:{count}:{max_id}:{max_updated}")
+
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
 
     def _generate_content_for_type(
         self,
@@ -698,13 +901,17 @@ class MemoryGenerator:
     def _calculate_hash(self, content: str) -> str:
         """Calculate SHA-256 hash of content.
 
+        The "**Generated**:" timestamp line is excluded so that regenerating
+        unchanged data yields the same hash.
+
         Args:
             content: Content to hash
 
         Returns:
             Hex digest of SHA-256 hash
         """
-        return hashlib.sha256(content.encode()).hexdigest()
+        stable = _GENERATED_LINE_RE.sub('', content)
+        return hashlib.sha256(stable.encode()).hexdigest()
 
     def _calculate_confidence(self, content: str, source_tables: List[str]) -> float:
         """Calculate confidence score for generated content.
@@ -787,3 +994,36 @@ class MemoryGenerator:
 
         # Write file
         full_path.write_text(content, encoding='utf-8')
+
+    def _write_file_if_changed(self, file_path: str, content: str) -> bool:
+        """Write memory file only if the file on disk differs.
+
+        Args:
+            file_path: Relative file path
+            content: File content
+
+        Returns:
+            True if the file was written
+        """
+        full_path = self.project_root / file_path
+        try:
+            if full_path.read_text(encoding='utf-8') == content:
+                return False
+        except (OSError, UnicodeDecodeError):
+            pass
+
+        self._write_file(file_path, content)
+        return True
+
+
+@dataclass
+class _MemoryFilePlan:
+    """Outcome of the read-only phase of memory file generation."""
+    project_id: int
+    file_type: MemoryFileType
+    existing: Optional[MemoryFile]
+    watermark: str
+    start_time: float
+    content: Optional[str] = None
+    source_tables: List[str] = field(default_factory=list)
+
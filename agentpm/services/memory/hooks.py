@@ -137,26 +137,25 @@ class MemoryHooks:
             # Generate all memory files (or just stale ones)
             regenerate_all = event.payload.get('regenerate_all', False)
 
-            generated_files = []
-            errors = []
+            memory_files, failures = self.generator.generate_memory_files(
+                project_id=project_id,
+                session_id=session_id,
+                force_regenerate=regenerate_all
+            )
 
-            for file_type in MemoryFileType:
-                try:
-                    memory_file = self.generator.generate_memory_file(
-                        project_id=project_id,
-                        file_type=file_type,
-                        session_id=session_id,
-                        force_regenerate=regenerate_all
-                    )
-                    generated_files.append({
-                        'type': file_type.value,
-                        'path': memory_file.file_path,
-                        'confidence': memory_file.confidence_score,
-                        'completeness': memory_file.completeness_score
-                    })
-                except Exception as e:
-                    logger.error(f"Error generating {file_type.value}: {e}")
-                    errors.append(f"{file_type.value}: {str(e)}")
+            generated_files = [
+                {
+                    'type': memory_file.file_type.value,
+                    'path': memory_file.file_path,
+                    'confidence': memory_file.confidence_score,
+                    'completeness': memory_file.completeness_score
+                }
+                for memory_file in memory_files
+            ]
+            errors = []
+            for file_type, error in failures.items():
+                logger.error(f"Error generating {file_type.value}: {error}")
+                errors.append(f"{file_type.value}: {error}")
 
             if generated_files:
                 logger.info(f"Session end: generated {len(generated_files)} memory files")
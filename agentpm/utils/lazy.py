@@ -0,0 +1,66 @@
+"""
+Lazy Package Exports
+
+Packages that re-export names from many submodules (models, methods,
+detection, utils) used to import every submodule - and their heavy
+dependencies such as pydantic, networkx or jinja2 - as soon as any one name
+was needed. lazy_exports() builds a module-level __getattr__ (PEP 562) that
+imports the providing submodule on first access instead, so
+`from package import Name` only pays for the submodule defining Name.
+
+Usage (in a package __init__.py):
+    from agentpm.utils.lazy import lazy_exports
+
+    _EXPORTS = {
+        '.project': ['Project'],
+        '.task': ['Task'],
+    }
+    __getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+    __all__ = ['Project', 'Task']
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str,
+    package_globals: Dict[str, Any],
+    exports: Mapping[str, Iterable[str]],
+    submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build __getattr__ / __dir__ resolving re-exported names on first access.
+
+    Args:
+        package: __name__ of the package
+        package_globals: globals() of the package (resolved names are cached
+            there, so each name costs one lookup)
+        exports: {relative submodule: names it provides}
+        submodules: Relative names of submodules exported as attributes
+            (e.g. methods.tasks)
+
+    Returns:
+        (__getattr__, __dir__) to assign at package level
+    """
+    owners: Dict[str, str] = {}
+    for module, names in exports.items():
+        for name in names:
+            owners[name] = module
+    for module in submodules:
+        owners[module.lstrip('.')] = module
+
+    def __getattr__(name: str) -> Any:
+        module = owners.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # __import__ rather than importlib.import_module: only imports through
+        # the builtin are reported by `python -X importtime` (startup budgets)
+        imported = __import__(package + module, fromlist=('__name__',))
+        value = imported if module.lstrip('.') == name else getattr(imported, name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(owners))
+
+    return __getattr__, __dir__
@@ -397,8 +397,10 @@ from .utils.markdown import (
     render_markdown_compact,
     render_markdown_large,
     render_markdown_dark,
-    get_markdown_toc
+    get_markdown_toc,
+    configure_render_cache
 )
+from .utils.event_stream import configure_event_stream
 
 # Helper function to find latest built files
 def get_latest_built_files():
@@ -436,13 +438,16 @@ def get_latest_built_files():
         'vendor_legacy_js': get_latest(vendor_legacy_files)
     }
 
+# Asset manifest is resolved once at startup (a rebuild needs a restart)
+BUILT_FILES = get_latest_built_files()
+
 # Template context processor for development vs production
 @app.context_processor
 def inject_config():
     return {
         'use_dev_template': app.config.get('USE_DEV_TEMPLATE', False),
         'vite_dev_server_url': app.config.get('VITE_DEV_SERVER_URL', 'http://localhost:3000'),
-        'built_files': get_latest_built_files()
+        'built_files': BUILT_FILES
     }
 app.jinja_env.filters['markdown'] = render_markdown
 app.jinja_env.filters['markdown_to_text'] = markdown_to_text
@@ -603,6 +608,20 @@ def get_database_service() -> DatabaseService:
     return DatabaseInitializer.get_instance()
 
 
+# Markdown render cache: in-process LRU backed by the rendered_markdown table
+configure_render_cache(
+    maxsize=app.config.get('MARKDOWN_RENDER_CACHE_SIZE'),
+    database=get_database_service if app.config.get('MARKDOWN_RENDER_CACHE_PERSISTENT') else None
+)
+
+# Live session events: one shared session_events tail for all SSE clients
+configure_event_stream(
+    database=get_database_service,
+    poll_interval=app.config.get('EVENT_STREAM_POLL_INTERVAL'),
+    heartbeat_interval=app.config.get('EVENT_STREAM_HEARTBEAT_INTERVAL')
+)
+
+
 def calculate_status_distribution(
     items: List[Any],
     total: int
@@ -15,12 +15,13 @@ from typing import Optional, Dict, Any, List
 from flask import render_template, abort
 
 from ....core.database.methods import agents, projects, work_items, tasks
-from ..utils import get_database_service, safe_get_entity
+from ..utils import get_database_service, safe_get_entity, conditional_view
 from . import agents_bp
 
 logger = logging.getLogger(__name__)
 
 @agents_bp.route('/<int:agent_id>')
+@conditional_view('projects', 'agents', 'work_items', 'tasks')
 def agent_detail(agent_id: int):
     """
     Comprehensive agent detail view.
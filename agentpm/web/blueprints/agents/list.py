@@ -12,12 +12,13 @@ from typing import Dict, Any, List
 from flask import render_template
 
 from ....core.database.methods import agents
-from ..utils import get_database_service
+from ..utils import get_database_service, conditional_view
 from . import agents_bp
 
 logger = logging.getLogger(__name__)
 
 @agents_bp.route('/')
+@conditional_view('agents')
 def agents_list():
     """Agents list view with comprehensive metrics."""
     db = get_database_service()
@@ -4,14 +4,16 @@ Context Events Module for APM (Agent Project Manager) Web Application
 Handles event-related context functionality including:
 - Event listing and management
 - Event timeline and history
+- Live session event stream (server-sent events)
 """
 
-from flask import render_template
+from flask import render_template, request, Response, stream_with_context
 import logging
 from datetime import datetime
 
 from . import context_bp
-from ..utils import get_database_service
+from ..utils import get_database_service, create_error_response
+from ...utils.event_stream import EventFilter, event_hub, stream_events
 
 logger = logging.getLogger(__name__)
 
@@ -41,3 +43,41 @@ def context_events():
     return render_template('context/events.html', 
                          contexts=event_contexts,
                          metrics=event_metrics)
+
+
+@context_bp.route('/events/stream')
+def context_events_stream():
+    """
+    Live session events as server-sent events.
+
+    Query parameters (all optional): project_id, work_item_id, task_id,
+    session_id, category (repeatable). Reconnecting clients resume after the
+    Last-Event-ID header (or last_event_id parameter).
+    """
+    from ....core.events.models import EventCategory
+
+    categories = frozenset(request.args.getlist('category'))
+    unknown = categories - {category.value for category in EventCategory}
+    if unknown:
+        return create_error_response(f"Unknown event category: {', '.join(sorted(unknown))}")
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        return create_error_response("Last-Event-ID must be an integer")
+
+    event_filter = EventFilter(
+        project_id=request.args.get('project_id', type=int),
+        work_item_id=request.args.get('work_item_id', type=int),
+        task_id=request.args.get('task_id', type=int),
+        session_id=request.args.get('session_id', type=int),
+        categories=categories,
+    )
+    subscription = event_hub.subscribe(event_filter, last_event_id)
+
+    return Response(
+        stream_with_context(stream_events(subscription)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
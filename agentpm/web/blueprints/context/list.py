@@ -13,11 +13,12 @@ from datetime import datetime
 import logging
 
 from . import context_bp
-from ..utils import get_database_service, _is_htmx_request
+from ..utils import get_database_service, _is_htmx_request, conditional_view
 
 logger = logging.getLogger(__name__)
 
 @context_bp.route('/')
+@conditional_view('projects', 'contexts')
 def contexts_list():
     """Contexts list view with comprehensive metrics, filtering, and search"""
     db = get_database_service()
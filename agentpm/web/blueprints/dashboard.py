@@ -16,7 +16,7 @@ from ...core.database.methods import (
     rules, evidence_sources, events, document_references
 )
 from ...core.database.enums import EntityType, ContextType, WorkItemStatus, TaskStatus, IdeaStatus
-from .utils import get_database_service
+from .utils import get_database_service, conditional_view
 
 # Create dashboard blueprint
 dashboard_bp = Blueprint('dashboard', __name__, url_prefix='')
@@ -24,6 +24,7 @@ dashboard_bp = Blueprint('dashboard', __name__, url_prefix='')
 logger = logging.getLogger(__name__)
 
 @dashboard_bp.route('/')
+@conditional_view('projects', 'work_items', 'tasks', 'agents', 'ideas', 'contexts', 'rules', 'evidence_sources', 'session_events', 'document_references')
 def dashboard_home():
     """Dashboard home - comprehensive project portal with all project-level context."""
     db = get_database_service()
@@ -36,8 +37,8 @@ def dashboard_home():
     project = projects_list[0]
     
     # Get comprehensive project data
-    work_items_list = work_items.list_work_items(db, project_id=project.id) or []
-    tasks_list = tasks.list_tasks(db) or []
+    work_items_list = work_items.list_work_items(db, project_id=project.id, hydrate='trusted') or []
+    tasks_list = tasks.list_tasks(db, hydrate='trusted') or []
     agents_list = agents.list_agents(db) or []
     ideas_list = ideas.list_ideas(db, project_id=project.id) or []
     
@@ -79,7 +80,7 @@ def dashboard_home():
     # Get document references
     document_references_list = []
     try:
-        document_references_list = document_references.list_document_references(db) or []
+        document_references_list = document_references.list_document_references(db, hydrate='trusted') or []
     except Exception as e:
         logger.warning(f"Error fetching document references: {e}")
     
@@ -16,6 +16,7 @@ from flask import request, flash, redirect, url_for, render_template, abort
 from ....core.database.methods import document_references, projects
 from ....core.database.models import DocumentReference
 from ....core.database.enums import EntityType
+from ...utils.markdown import prerender_markdown
 from ..utils import (
     get_database_service, 
     validate_required_fields, 
@@ -65,6 +66,7 @@ def create_document():
             )
             
             created_document = document_references.create_document_reference(db, document)
+            prerender_markdown(created_document.content)
             
             flash(f'Document "{created_document.title}" created successfully', 'success')
             return redirect(url_for('documents.document_detail', document_id=created_document.id))
@@ -210,6 +212,7 @@ def edit_document(document_id: int):
             
             # Update document in database
             updated_document = document_references.update_document_reference(db, document)
+            prerender_markdown(updated_document.content)
             
             # Success message with entity context
             if updated_document.entity_type and updated_document.entity_id:
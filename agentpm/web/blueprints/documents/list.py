@@ -10,13 +10,14 @@ from flask import render_template, request, redirect, url_for, flash
 import logging
 
 from . import documents_bp
-from ..utils import get_database_service, _is_htmx_request, validate_required_fields, handle_error
+from ..utils import get_database_service, _is_htmx_request, validate_required_fields, handle_error, conditional_view
 from ...utils.pagination import paginate_items, get_pagination_from_request, get_query_params_from_request
 from ....core.database.enums import EntityType
 
 logger = logging.getLogger(__name__)
 
 @documents_bp.route('/')
+@conditional_view('projects', 'document_references', daily=True)
 def documents_list():
     """Documents list view with comprehensive metrics, search, and pagination"""
     try:
@@ -40,14 +41,14 @@ def documents_list():
             project_exists = any(p.id == current_project_id for p in projects_list)
             if project_exists:
                 documents = document_references.list_document_references(
-                    db, entity_type=EntityType.PROJECT, entity_id=current_project_id
+                    db, entity_type=EntityType.PROJECT, entity_id=current_project_id, hydrate='trusted'
                 ) or []
             else:
                 # Project doesn't exist, show all documents
-                documents = document_references.list_document_references(db) or []
+                documents = document_references.list_document_references(db, hydrate='trusted') or []
         else:
             # No project filter or no projects available, show all documents
-            documents = document_references.list_document_references(db) or []
+            documents = document_references.list_document_references(db, hydrate='trusted') or []
         
         # Apply search filter
         if search_query:
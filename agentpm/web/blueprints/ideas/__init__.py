@@ -17,4 +17,4 @@ logger = logging.getLogger(__name__)
 from ..utils import get_database_service, _is_htmx_request
 
 # Import route modules
-from . import list, detail, actions
+from . import list, detail, actions, api
@@ -0,0 +1,27 @@
+"""
+Ideas API Module for APM (Agent Project Manager) Web Application
+
+Handles API-related functionality for ideas including:
+- Streaming, projected and cursor-paginated JSON/NDJSON list responses
+"""
+
+import logging
+
+from . import ideas_bp
+from ..utils import row_page_response
+
+logger = logging.getLogger(__name__)
+
+@ideas_bp.route('/api/ideas')
+def api_ideas():
+    """
+    API endpoint for ideas list.
+
+    Query parameters: fields, cursor, limit, format=ndjson and the filters
+    project_id, status, source.
+    """
+    return row_page_response(
+        'ideas', 'ideas',
+        filter_args=('project_id', 'status', 'source'),
+        message='Ideas retrieved successfully'
+    )
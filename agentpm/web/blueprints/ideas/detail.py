@@ -14,11 +14,12 @@ from datetime import datetime
 import logging
 
 from . import ideas_bp
-from ..utils import get_database_service, safe_get_entity, create_success_response, create_error_response
+from ..utils import get_database_service, safe_get_entity, create_success_response, create_error_response, conditional_view
 
 logger = logging.getLogger(__name__)
 
 @ideas_bp.route('/<int:idea_id>')
+@conditional_view('projects', 'ideas', 'idea_elements', 'work_items', 'contexts', daily=True)
 def idea_detail(idea_id: int):
     """
     Comprehensive idea detail view.
@@ -12,12 +12,13 @@ from datetime import datetime
 import logging
 
 from . import ideas_bp
-from ..utils import get_database_service, _is_htmx_request
+from ..utils import get_database_service, _is_htmx_request, conditional_view
 from ...utils.pagination import paginate_items, get_pagination_from_request, get_query_params_from_request
 
 logger = logging.getLogger(__name__)
 
 @ideas_bp.route('/')
+@conditional_view('projects', 'ideas')
 def ideas_list():
     """Ideas list view with comprehensive metrics, filtering, search, and pagination"""
     try:
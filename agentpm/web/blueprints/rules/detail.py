@@ -13,11 +13,12 @@ from flask import render_template, abort
 import logging
 
 from . import rules_bp
-from ..utils import get_database_service, safe_get_entity
+from ..utils import get_database_service, safe_get_entity, conditional_view
 
 logger = logging.getLogger(__name__)
 
 @rules_bp.route('/<int:rule_id>')
+@conditional_view('rules')
 def rule_detail(rule_id: int):
     """
     Comprehensive rule detail view.
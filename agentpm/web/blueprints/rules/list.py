@@ -11,11 +11,12 @@ from flask import render_template
 import logging
 
 from . import rules_bp
-from ..utils import get_database_service
+from ..utils import get_database_service, conditional_view
 
 logger = logging.getLogger(__name__)
 
 @rules_bp.route('/')
+@conditional_view('rules')
 def rules_list():
     """Rules list view with comprehensive metrics and governance information"""
     db = get_database_service()
@@ -17,4 +17,4 @@ logger = logging.getLogger(__name__)
 from ..utils import get_database_service
 
 # Import route modules
-from . import health, database
+from . import health, database, caches
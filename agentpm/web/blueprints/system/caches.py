@@ -0,0 +1,36 @@
+"""
+System Caches Module for APM (Agent Project Manager) Web Application
+
+Exposes cache statistics for monitoring:
+- Markdown render cache hit rates (in-process and persistent layers)
+- Shared TTL caches (CACHE_REGISTRY: plugins, SOPs, policies, graphs, ...)
+"""
+
+from flask import jsonify
+import logging
+
+from . import system_bp
+from ..utils import get_database_service
+from ...utils.markdown import get_render_cache_stats
+from ....core.performance.cache import CACHE_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+@system_bp.route('/caches')
+def system_caches():
+    """
+    Cache statistics (JSON).
+
+    Returns render cache hits, misses and hit rate, plus the size of the
+    persistent rendered markdown table when available, and per-name
+    statistics of every registered TTLCache under 'registry'.
+    """
+    stats = {'markdown_render': get_render_cache_stats(), 'registry': CACHE_REGISTRY.stats()}
+
+    try:
+        from ....core.database.methods import rendered_markdown
+        stats['markdown_render']['stored'] = rendered_markdown.get_rendered_html_stats(get_database_service())
+    except Exception as e:
+        logger.debug(f"Rendered markdown stats unavailable: {e}")
+
+    return jsonify(stats)
@@ -2,9 +2,9 @@
 System Database Module for APM (Agent Project Manager) Web Application
 
 Handles database administration functionality including:
-- Database status and metrics
-- Database maintenance operations
-- Data integrity checks
+- Database status and storage metrics (PRAGMAs, sqlite_stat1, dbstat)
+- Per-table row counts and sizes
+- Query profile when profiling is enabled (APM_DB_PROFILE)
 """
 
 from flask import render_template
@@ -12,49 +12,60 @@ import logging
 
 from . import system_bp
 from ..utils import get_database_service
+from ..context.files import format_file_size
 
 logger = logging.getLogger(__name__)
 
+# Tables summarised as entity totals on the page
+ENTITY_TABLES = {
+    'total_projects': 'projects',
+    'total_work_items': 'work_items',
+    'total_tasks': 'tasks',
+    'total_ideas': 'ideas',
+    'total_agents': 'agents',
+    'total_contexts': 'contexts',
+}
+
 @system_bp.route('/database')
 def system_database():
     """
     Database administration.
     
     Shows database status and metrics:
-    - Database schema information
-    - Table statistics
-    - Data integrity status
-    - Performance metrics
+    - File size, pages and free pages
+    - Per-table row counts and sizes
+    - Slowest query fingerprints when profiling is enabled
     """
     try:
         db = get_database_service()
-        
-        # Get database statistics
-        from ....core.database.methods import projects, work_items, tasks, ideas, agents, contexts
-        
-        # Count entities
-        projects_count = len(projects.list_projects(db) or [])
-        work_items_count = len(work_items.list_work_items(db) or [])
-        tasks_count = len(tasks.list_tasks(db) or [])
-        ideas_count = len(ideas.list_ideas(db) or [])
-        agents_count = len(agents.list_agents(db) or [])
-        contexts_count = len(contexts.list_contexts(db) or [])
-        
+
+        from ....core.database.methods import database_stats
+        stats = database_stats.get_database_stats(db)
+        rows = {table['name']: table['rows'] for table in stats['tables']}
+        totals = {key: rows.get(table, 0) for key, table in ENTITY_TABLES.items()}
+
         database_data = {
             'status': 'connected',
-            'database_path': '.agentpm/data/agentpm.db',
-            'total_projects': projects_count,
-            'total_work_items': work_items_count,
-            'total_tasks': tasks_count,
-            'total_ideas': ideas_count,
-            'total_agents': agents_count,
-            'total_contexts': contexts_count,
-            'total_entities': projects_count + work_items_count + tasks_count + ideas_count + agents_count + contexts_count,
-            'last_backup': '2024-01-01 12:00:00',
-            'database_size': '2.3 MB',
-            'integrity_status': 'OK'
+            'database_path': stats['path'],
+            **totals,
+            'total_entities': sum(totals.values()),
+            'last_backup': None,
+            'database_size': format_file_size(stats['size_bytes']),
+            'free_space': format_file_size(stats['free_bytes']),
+            'page_size': stats['page_size'],
+            'page_count': stats['page_count'],
+            'journal_mode': stats['journal_mode'],
+            'tables': [
+                {**table, 'size': format_file_size(table['bytes']) if table['bytes'] is not None else None}
+                for table in sorted(stats['tables'], key=lambda t: t['rows'], reverse=True)
+            ],
+            'profile': None,
         }
-        
+
+        if db.profiler is not None:
+            with db.connect() as conn:
+                database_data['profile'] = db.profiler.report(conn, limit=25)
+
         return render_template('system/database.html', database=database_data)
     
     except Exception as e:
@@ -176,7 +176,7 @@ def update_task_status(task_id: int):
         return jsonify(create_error_response('Internal server error', 500))
 
 def bulk_update_tasks():
-    """Bulk update tasks."""
+    """Bulk update tasks (single transaction, all or nothing)."""
     try:
         data = request.get_json()
         task_ids = data.get('task_ids', [])
@@ -187,42 +187,33 @@ def bulk_update_tasks():
         
         db = get_database_service()
         
-        updated_count = 0
-        errors = []
-        
-        for task_id in task_ids:
+        fields = {}
+        if 'status' in updates:
             try:
-                task = tasks.get_task(db, task_id)
-                if not task:
-                    errors.append(f"Task {task_id} not found")
-                    continue
-                
-                # Apply updates
-                if 'status' in updates:
-                    try:
-                        task.status = TaskStatus(updates['status'])
-                    except ValueError:
-                        errors.append(f"Invalid status for task {task_id}")
-                        continue
-                
-                if 'priority' in updates:
-                    task.priority = int(updates['priority'])
-                
-                if 'assigned_to' in updates:
-                    task.assigned_to = updates['assigned_to']
-                
-                task.updated_at = datetime.now()
-                tasks.update_task(db, task)
-                updated_count += 1
-                
-            except Exception as e:
-                errors.append(f"Error updating task {task_id}: {str(e)}")
+                fields['status'] = TaskStatus(updates['status'])
+            except ValueError:
+                return jsonify(create_error_response('Invalid status', 400))
+        
+        if 'priority' in updates:
+            fields['priority'] = int(updates['priority'])
+        
+        if 'assigned_to' in updates:
+            fields['assigned_to'] = updates['assigned_to']
         
+        if not fields:
+            return jsonify(create_error_response('No update fields provided', 400))
+        
+        result = tasks.bulk_update_tasks(
+            db, task_ids, validate_workflow=bool(data.get('validate_workflow')), **fields
+        )
+        
+        errors = [f"Task {task_id} not found" for task_id in result.missing_ids]
+        errors += [f"Task {task_id}: {error}" for task_id, error in result.errors.items()]
         if errors:
-            return jsonify(create_error_response(f"Updated {updated_count} tasks, {len(errors)} errors", 400, {'errors': errors}))
+            return jsonify(create_error_response(f"Updated {result.count} tasks, {len(errors)} errors", 400, {'errors': errors}))
         
-        return jsonify(create_success_response(f'Successfully updated {updated_count} tasks', {
-            'updated_count': updated_count
+        return jsonify(create_success_response(f'Successfully updated {result.count} tasks', {
+            'updated_count': result.count
         }))
         
     except Exception as e:
@@ -230,7 +221,7 @@ def bulk_update_tasks():
         return jsonify(create_error_response('Internal server error', 500))
 
 def bulk_delete_tasks():
-    """Bulk delete tasks."""
+    """Bulk delete tasks (single transaction, all or nothing)."""
     try:
         data = request.get_json()
         task_ids = data.get('task_ids', [])
@@ -239,28 +230,14 @@ def bulk_delete_tasks():
             return jsonify(create_error_response('No tasks selected', 400))
         
         db = get_database_service()
+        result = tasks.bulk_delete_tasks(db, task_ids)
         
-        deleted_count = 0
-        errors = []
-        
-        for task_id in task_ids:
-            try:
-                task = tasks.get_task(db, task_id)
-                if not task:
-                    errors.append(f"Task {task_id} not found")
-                    continue
-                
-                tasks.delete_task(db, task_id)
-                deleted_count += 1
-                
-            except Exception as e:
-                errors.append(f"Error deleting task {task_id}: {str(e)}")
-        
+        errors = [f"Task {task_id} not found" for task_id in result.missing_ids]
         if errors:
-            return jsonify(create_error_response(f"Deleted {deleted_count} tasks, {len(errors)} errors", 400, {'errors': errors}))
+            return jsonify(create_error_response(f"Deleted {result.count} tasks, {len(errors)} errors", 400, {'errors': errors}))
         
-        return jsonify(create_success_response(f'Successfully deleted {deleted_count} tasks', {
-            'deleted_count': deleted_count
+        return jsonify(create_success_response(f'Successfully deleted {result.count} tasks', {
+            'deleted_count': result.count
         }))
         
     except Exception as e:
@@ -0,0 +1,27 @@
+"""
+Tasks API Module for APM (Agent Project Manager) Web Application
+
+Handles API-related functionality for tasks including:
+- Streaming, projected and cursor-paginated JSON/NDJSON list responses
+"""
+
+import logging
+
+from . import tasks_bp
+from ..utils import row_page_response
+
+logger = logging.getLogger(__name__)
+
+@tasks_bp.route('/api/tasks')
+def api_tasks():
+    """
+    API endpoint for tasks list.
+
+    Query parameters: fields, cursor, limit, format=ndjson and the filters
+    work_item_id, status, type, assigned_to.
+    """
+    return row_page_response(
+        'tasks', 'tasks',
+        filter_args=('work_item_id', 'status', 'type', 'assigned_to'),
+        message='Tasks retrieved successfully'
+    )
@@ -37,6 +37,7 @@ from ....core.database.enums import (
     StorageMode
 )
 from ....core.context.unified_service import UnifiedContextService
+from ...utils.markdown import prerender_markdown
 from ..utils import get_database_service
 from . import tasks_bp
 
@@ -412,6 +413,7 @@ def create_task_document(task_id: int):
             )
             
             created_document = document_references.create_document_reference(db, document)
+            prerender_markdown(created_document.content)
             
             flash(f'Document "{created_document.title}" created successfully', 'success')
             return redirect(url_for('tasks.task_detail', task_id=task_id))
@@ -18,13 +18,14 @@ from flask import render_template, request, jsonify, Response
 
 from ....core.database.methods import tasks, work_items, projects
 from ....core.database.enums import TaskStatus, TaskType
-from ..utils import get_database_service, _is_htmx_request
+from ..utils import get_database_service, _is_htmx_request, conditional_view
 from ...utils.pagination import paginate_items, get_pagination_from_request, get_query_params_from_request
 from . import tasks_bp
 
 logger = logging.getLogger(__name__)
 
 @tasks_bp.route('/')
+@conditional_view('projects', 'work_items', 'tasks')
 def tasks_list():
     """Tasks list view with comprehensive metrics, filtering, search, and pagination."""
     db = get_database_service()
@@ -41,11 +42,11 @@ def tasks_list():
     priority_filter = request.args.get('priority', '')
     sort_by = request.args.get('sort', 'updated_desc')
     
-    # Get all tasks
-    tasks_list = tasks.list_tasks(db) or []
+    # Get all tasks (read-only page: rows come from the database, skip validation)
+    tasks_list = tasks.list_tasks(db, hydrate='trusted') or []
     
     # Get work items for filtering
-    work_items_list = work_items.list_work_items(db) or []
+    work_items_list = work_items.list_work_items(db, hydrate='trusted') or []
     
     # Apply filters
     filtered_tasks = tasks_list
@@ -281,40 +282,27 @@ def bulk_update_tasks():
         if not updates:
             return jsonify({'error': 'No update fields provided'}), 400
         
-        # Perform bulk updates
-        updated_count = 0
-        errors = []
+        # Perform bulk update (single transaction, all or nothing)
+        try:
+            result = tasks.bulk_update_tasks(
+                db, task_ids, validate_workflow=bool(data.get('validate_workflow')), **updates
+            )
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Invalid task IDs'}), 400
         
-        for task_id in task_ids:
-            try:
-                task = tasks.get_task(db, task_id)
-                if not task:
-                    errors.append(f"Task {task_id} not found")
-                    continue
-                
-                # Apply updates
-                for field, value in updates.items():
-                    setattr(task, field, value)
-                
-                # Update timestamps based on status changes
-                if 'status' in updates:
-                    if updates['status'].value == 'in_progress' and not task.started_at:
-                        task.started_at = datetime.now()
-                    elif updates['status'].value in ['done', 'cancelled'] and not task.completed_at:
-                        task.completed_at = datetime.now()
-                
-                tasks.update_task(db, task)
-                updated_count += 1
-                
-            except Exception as e:
-                errors.append(f"Task {task_id}: {str(e)}")
+        if not result.applied:
+            return jsonify({
+                'error': f'Workflow validation failed for {len(result.errors)} tasks, no tasks were updated',
+                'errors': [f"Task {task_id}: {error}" for task_id, error in result.errors.items()]
+            }), 400
         
+        errors = [f"Task {task_id} not found" for task_id in result.missing_ids]
         return jsonify({
             'success': True,
-            'updated_count': updated_count,
+            'updated_count': result.count,
             'total_count': len(task_ids),
             'errors': errors,
-            'message': f'Successfully updated {updated_count} of {len(task_ids)} tasks'
+            'message': f'Successfully updated {result.count} of {len(task_ids)} tasks'
         })
         
     except Exception as e:
@@ -335,29 +323,19 @@ def bulk_delete_tasks():
         if not task_ids:
             return jsonify({'error': 'No task IDs provided'}), 400
         
-        # Perform bulk deletes
-        deleted_count = 0
-        errors = []
-        
-        for task_id in task_ids:
-            try:
-                task = tasks.get_task(db, task_id)
-                if not task:
-                    errors.append(f"Task {task_id} not found")
-                    continue
-                
-                tasks.delete_task(db, task_id)
-                deleted_count += 1
-                
-            except Exception as e:
-                errors.append(f"Task {task_id}: {str(e)}")
+        # Perform bulk delete (single transaction, all or nothing)
+        try:
+            result = tasks.bulk_delete_tasks(db, task_ids)
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Invalid task IDs'}), 400
         
+        errors = [f"Task {task_id} not found" for task_id in result.missing_ids]
         return jsonify({
             'success': True,
-            'deleted_count': deleted_count,
+            'deleted_count': result.count,
             'total_count': len(task_ids),
             'errors': errors,
-            'message': f'Successfully deleted {deleted_count} of {len(task_ids)} tasks'
+            'message': f'Successfully deleted {result.count} of {len(task_ids)} tasks'
         })
         
     except Exception as e:
@@ -4,12 +4,16 @@ Shared Blueprint Utilities for APM (Agent Project Manager) Web Application
 Common utilities and helper functions used across all blueprints.
 """
 
+import functools
+import hashlib
 import logging
 import os
+import uuid
+from datetime import date, datetime, time, timezone
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Callable, Tuple
 
-from flask import request, jsonify, flash, redirect, url_for
+from flask import request, jsonify, flash, redirect, url_for, session, make_response
 
 from ...core.database.service import DatabaseService
 
@@ -30,6 +34,133 @@ def get_database_service() -> DatabaseService:
     
     return DatabaseInitializer.get_instance()
 
+# Changes with every process start so templates and assets shipped with a new
+# release never match an ETag issued by the previous process
+_BOOT_ID = uuid.uuid4().hex
+
+def conditional_view(*tables: str, daily: bool = False) -> Callable:
+    """
+    Answer conditional GETs for views that only depend on database tables.
+
+    Emits a weak ETag (request path, HTMX flag and the change versions of
+    tables) and Last-Modified (latest change of tables), and returns
+    304 Not Modified while none of tables changed since the client's copy.
+    Falls through to the view when versions are unavailable (database not
+    migrated) or flash messages are pending.
+
+    Args:
+        tables: Tables the view reads (see migration 0055 TRACKED_TABLES)
+        daily: The view renders values relative to the current date ("days
+            since", "last 7 days"); the ETag then also changes at midnight
+
+    Example:
+        >>> @tasks_bp.route('/')
+        ... @conditional_view('tasks', 'work_items')
+        ... def tasks_list():
+        ...     ...
+    """
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD') or session.get('_flashes'):
+                return view(*args, **kwargs)
+
+            versions = _table_versions(tables)
+            if versions is None:
+                return view(*args, **kwargs)
+
+            etag, last_modified = _validators(versions, date.today() if daily else None)
+            if _not_modified(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                response.headers['Cache-Control'] = 'no-cache'
+                response.vary.add('HX-Request')
+            response.set_etag(etag, weak=True)
+            if last_modified:
+                response.last_modified = last_modified
+            return response
+        return wrapper
+    return decorator
+
+def _table_versions(tables: Tuple[str, ...]) -> Optional[Dict[str, Tuple[int, Optional[str]]]]:
+    """Current versions of tables, or None if they cannot be read"""
+    from ...core.database.methods import table_versions
+
+    try:
+        versions = table_versions.get_table_versions(get_database_service(), tables)
+    except Exception as e:
+        logger.debug(f"Table versions unavailable, serving uncached: {e}")
+        return None
+    return versions if len(versions) == len(set(tables)) else None
+
+def _validators(versions: Dict[str, Tuple[int, Optional[str]]],
+                day: Optional[date] = None) -> Tuple[str, Optional[datetime]]:
+    """ETag and Last-Modified for the current request, table versions and (daily views) date"""
+    parts = [_BOOT_ID, request.full_path, request.headers.get('HX-Request', '')]
+    parts.extend(f"{table}={versions[table][0]}" for table in sorted(versions))
+    if day:
+        parts.append(day.isoformat())
+    etag = hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    changed = [changed_at for _, changed_at in versions.values() if changed_at]
+    last_modified = None
+    if changed:
+        try:
+            # CURRENT_TIMESTAMP is UTC 'YYYY-MM-DD HH:MM:SS'
+            last_modified = datetime.fromisoformat(max(changed)).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    if day:
+        # Local midnight: relative dates in the page changed then at the latest
+        midnight = datetime.combine(day, time()).astimezone(timezone.utc)
+        last_modified = max(last_modified, midnight) if last_modified else midnight
+    return etag, last_modified
+
+def _not_modified(etag: str) -> bool:
+    """
+    Whether the client's cached copy is current.
+
+    Only If-None-Match is honoured: Last-Modified has one second resolution
+    and does not cover the request path or a restart, so If-Modified-Since
+    alone could validate a stale copy.
+    """
+    return bool(request.if_none_match) and request.if_none_match.contains_weak(etag)
+
+def row_page_response(entity: str, key: str, filter_args: Tuple[str, ...] = (),
+                      message: str = 'Retrieved successfully') -> Any:
+    """
+    Streaming JSON/NDJSON API response for one page of an entity list.
+
+    Reads fields, cursor, limit and the filter_args equality filters from the
+    query string (see utils/json_stream.py for the response format).
+
+    Args:
+        entity: Entity name for row_pages.page_rows()
+        key: JSON array name for the rows
+        filter_args: Query parameters accepted as column equality filters
+        message: Success message
+
+    Returns:
+        Streaming response, or a 400 error response for invalid parameters
+    """
+    from ...core.database.methods import row_pages
+    from ..utils.json_stream import decode_cursor, json_rows_response, parse_fields, parse_limit
+
+    try:
+        fields = parse_fields(request.args.get('fields'))
+        after_id = decode_cursor(request.args.get('cursor'))
+        limit = parse_limit(request.args.get('limit'))
+        filters = {name: request.args[name] for name in filter_args if request.args.get(name)}
+        rows, next_after_id = row_pages.page_rows(
+            get_database_service(), entity, filters, fields, after_id, limit
+        )
+    except ValueError as e:
+        return create_error_response(str(e), 400)
+    return json_rows_response(key, rows, next_after_id, message)
+
 def _is_htmx_request() -> bool:
     """Check if request is from HTMX."""
     return request.headers.get('HX-Request') == 'true'
@@ -0,0 +1,27 @@
+"""
+Work Items API Module for APM (Agent Project Manager) Web Application
+
+Handles API-related functionality for work items including:
+- Streaming, projected and cursor-paginated JSON/NDJSON list responses
+"""
+
+import logging
+
+from . import work_items_bp
+from ..utils import row_page_response
+
+logger = logging.getLogger(__name__)
+
+@work_items_bp.route('/api/work-items')
+def api_work_items():
+    """
+    API endpoint for work items list.
+
+    Query parameters: fields, cursor, limit, format=ndjson and the filters
+    project_id, status, type, phase.
+    """
+    return row_page_response(
+        'work_items', 'work_items',
+        filter_args=('project_id', 'status', 'type', 'phase'),
+        message='Work Items retrieved successfully'
+    )
@@ -41,6 +41,7 @@ from ....core.database.enums import (
 )
 from ....core.context.unified_service import UnifiedContextService
 from ....core.workflow.phase_validator import PhaseValidator
+from ...utils.markdown import prerender_markdown
 from ..utils import get_database_service
 from . import work_items_bp
 
@@ -642,6 +643,7 @@ def create_work_item_document(work_item_id: int):
             )
             
             created_document = document_references.create_document_reference(db, document)
+            prerender_markdown(created_document.content)
             
             flash(f'Document "{created_document.title}" created successfully', 'success')
             return redirect(url_for('work_items.work_item_detail', work_item_id=work_item_id))
@@ -15,7 +15,7 @@ import json
 import io
 
 from . import work_items_bp
-from ..utils import get_database_service, _is_htmx_request
+from ..utils import get_database_service, _is_htmx_request, conditional_view
 from ...utils.pagination import paginate_items, get_pagination_from_request, get_query_params_from_request
 
 # Core imports
@@ -25,6 +25,7 @@ from ....core.database.enums import WorkItemStatus, WorkItemType, Phase
 logger = logging.getLogger(__name__)
 
 @work_items_bp.route('/')
+@conditional_view('projects', 'work_items', 'tasks')
 def work_items_list():
     """Work items list view with comprehensive metrics, filtering, search, and pagination"""
     db = get_database_service()
@@ -44,9 +45,9 @@ def work_items_list():
     priority_filter = request.args.get('priority', '')
     sort_by = request.args.get('sort', 'updated_desc')
     
-    # Get work items and tasks
-    work_items_list = work_items.list_work_items(db, project_id=project_id) or []
-    tasks_list = tasks.list_tasks(db) or []
+    # Get work items and tasks (read-only page: rows come from the database, skip validation)
+    work_items_list = work_items.list_work_items(db, project_id=project_id, hydrate='trusted') or []
+    tasks_list = tasks.list_tasks(db, hydrate='trusted') or []
     
     # Apply filters
     filtered_work_items = work_items_list
@@ -10,6 +10,14 @@ class Config:
     USE_DEV_TEMPLATE = False
     VITE_DEV_SERVER_URL = 'http://localhost:3000'
 
+    # Markdown render cache (in-process entries; persistent rendered_markdown table)
+    MARKDOWN_RENDER_CACHE_SIZE = 512
+    MARKDOWN_RENDER_CACHE_PERSISTENT = True
+
+    # Live event stream (seconds between session_events polls / idle keep-alives)
+    EVENT_STREAM_POLL_INTERVAL = 1.0
+    EVENT_STREAM_HEARTBEAT_INTERVAL = 15.0
+
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
@@ -24,6 +32,7 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     USE_DEV_TEMPLATE = False
+    MARKDOWN_RENDER_CACHE_PERSISTENT = False
 
 # Configuration mapping
 config = {
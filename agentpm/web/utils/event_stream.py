@@ -0,0 +1,339 @@
+"""
+Live session event streaming for APM (Agent Project Manager) Web Application
+
+One background poller per process tails session_events by last-seen id and
+fans new events out to subscribers (one per open SSE connection), so the
+number of queries does not grow with the number of connected browsers:
+- The poller first compares the session_events change version
+  (table_versions, Migration 0055) and only queries when it moved
+- Each subscriber filters by project / work item / task / session / category
+- Reconnecting clients (Last-Event-ID) are backfilled from the database
+  before joining the live stream
+
+The poller thread runs only while at least one subscriber is connected.
+"""
+
+import json
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Defaults (overridable via configure_event_stream)
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_HEARTBEAT_INTERVAL = 15.0
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_BATCH_SIZE = 500
+
+# Client reconnect delay advertised in the stream (milliseconds)
+RETRY_MS = 3000
+
+
+@dataclass(frozen=True)
+class EventFilter:
+    """Per-subscriber event filter (None / empty matches everything)."""
+    project_id: Optional[int] = None
+    work_item_id: Optional[int] = None
+    task_id: Optional[int] = None
+    session_id: Optional[int] = None
+    categories: FrozenSet[str] = frozenset()
+
+    def matches(self, event) -> bool:
+        """Whether event passes the filter"""
+        if self.project_id is not None and event.project_id != self.project_id:
+            return False
+        if self.work_item_id is not None and event.work_item_id != self.work_item_id:
+            return False
+        if self.task_id is not None and event.task_id != self.task_id:
+            return False
+        if self.session_id is not None and event.session_id != self.session_id:
+            return False
+        if self.categories and _value(event.event_category) not in self.categories:
+            return False
+        return True
+
+
+class EventSubscription:
+    """
+    Queue of events for one client.
+
+    A subscriber that falls more than its queue size behind is marked
+    overflowed; the stream then tells the client to reload instead of
+    silently skipping events.
+    """
+
+    def __init__(self, event_filter: EventFilter, last_event_id: int, queue_size: int):
+        self.filter = event_filter
+        self.last_event_id = last_event_id
+        self.overflowed = False
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+
+    def offer(self, event) -> None:
+        """Queue event if it matches the filter and is newer than the last delivered"""
+        if event.id <= self.last_event_id or not self.filter.matches(event):
+            return
+        try:
+            self._queue.put_nowait(event)
+            self.last_event_id = event.id
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout: float) -> List[Any]:
+        """Wait up to timeout for events, then drain everything queued"""
+        try:
+            events = [self._queue.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+
+class EventStreamHub:
+    """
+    Shared tail of session_events fanned out to subscriptions.
+
+    Thread-safe. poll_once() performs one poll synchronously; the background
+    thread calls it every poll_interval seconds while subscribers exist.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self._database: Optional[Callable[[], Any]] = None
+        self._subscribers: List[EventSubscription] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_id: Optional[int] = None
+        self._version: Optional[int] = None
+        self.polls = 0
+        self.queries = 0
+        self.dispatched = 0
+
+    def configure(
+        self,
+        database: Optional[Callable[[], Any]] = None,
+        poll_interval: Optional[float] = None,
+        heartbeat_interval: Optional[float] = None
+    ) -> None:
+        """
+        Set the database and/or intervals.
+
+        Args:
+            database: Callable returning a DatabaseService
+            poll_interval: Seconds between polls
+            heartbeat_interval: Seconds between keep-alive comments on idle streams
+        """
+        with self._lock:
+            if database is not None:
+                self._database = database
+            if poll_interval is not None:
+                self.poll_interval = poll_interval
+            if heartbeat_interval is not None:
+                self.heartbeat_interval = heartbeat_interval
+
+    def subscribe(self, event_filter: EventFilter, last_event_id: Optional[int] = None,
+                  start: bool = True) -> EventSubscription:
+        """
+        Register a subscriber.
+
+        Args:
+            event_filter: Events to deliver
+            last_event_id: Last event the client saw (backfills newer events);
+                None to receive only events recorded from now on
+            start: Start the background poller if it is not running
+
+        Returns:
+            EventSubscription to read events from
+        """
+        from ...core.database.methods import events as event_methods
+
+        db = self._database()
+        with self._lock:
+            if self._last_id is None:
+                self._last_id = event_methods.get_latest_event_id(db)
+            if last_event_id is None or last_event_id > self._last_id:
+                last_event_id = self._last_id
+
+            subscription = EventSubscription(event_filter, last_event_id, self.queue_size)
+            if last_event_id < self._last_id:
+                # Events the poller already dispatched before this client (re)connected
+                for event in event_methods.get_events_after(
+                    db, last_event_id,
+                    project_id=event_filter.project_id,
+                    work_item_id=event_filter.work_item_id,
+                    task_id=event_filter.task_id,
+                    session_id=event_filter.session_id,
+                    event_categories=sorted(event_filter.categories),
+                    up_to_event_id=self._last_id,
+                    limit=self.queue_size + 1
+                ):
+                    subscription.offer(event)
+                if not subscription.overflowed:
+                    subscription.last_event_id = self._last_id
+            self._subscribers.append(subscription)
+
+        if start:
+            self._ensure_poller()
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscriber (the poller stops after the last one leaves)"""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+        if not self._subscribers:
+            self._wakeup.set()
+
+    def poll_once(self) -> int:
+        """
+        Fetch events recorded since the last poll and dispatch them.
+
+        Returns:
+            Number of new events read
+        """
+        from ...core.database.methods import events as event_methods
+        from ...core.database.methods import table_versions
+
+        db = self._database()
+        self.polls += 1
+        version = table_versions.get_table_version(db, 'session_events')
+        if version is not None and version == self._version:
+            return 0
+
+        read = 0
+        with self._lock:
+            if self._last_id is None:
+                self._last_id = event_methods.get_latest_event_id(db)
+            while True:
+                batch = event_methods.get_events_after(db, self._last_id, limit=self.batch_size)
+                self.queries += 1
+                for event in batch:
+                    for subscription in self._subscribers:
+                        subscription.offer(event)
+                    self._last_id = event.id
+                read += len(batch)
+                if len(batch) < self.batch_size:
+                    break
+            self._version = version
+            self.dispatched += read
+        return read
+
+    def stats(self) -> Dict[str, Any]:
+        """Subscriber and polling statistics"""
+        with self._lock:
+            return {
+                'subscribers': len(self._subscribers),
+                'last_event_id': self._last_id,
+                'polls': self.polls,
+                'queries': self.queries,
+                'dispatched': self.dispatched,
+                'poll_interval': self.poll_interval,
+                'running': self._thread is not None,
+            }
+
+    def _ensure_poller(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='apm-event-stream', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f"Event stream poll failed: {e}")
+            if self._wakeup.wait(self.poll_interval):
+                self._wakeup.clear()
+
+
+# Process-wide hub used by the SSE endpoint
+event_hub = EventStreamHub()
+
+
+def configure_event_stream(
+    database: Optional[Callable[[], Any]] = None,
+    poll_interval: Optional[float] = None,
+    heartbeat_interval: Optional[float] = None
+) -> None:
+    """Configure the process-wide event hub (called at app startup)."""
+    event_hub.configure(database=database, poll_interval=poll_interval,
+                        heartbeat_interval=heartbeat_interval)
+
+
+def stream_events(subscription: EventSubscription, hub: Optional[EventStreamHub] = None) -> Iterator[str]:
+    """
+    Server-sent events for a subscription.
+
+    Emits one `event: <category>` message per event (id = session_events.id,
+    data = JSON), keep-alive comments while idle, and a final `reset` event if
+    the client fell too far behind. Unsubscribes when the client disconnects.
+
+    Args:
+        subscription: Subscription from EventStreamHub.subscribe()
+        hub: Hub owning the subscription (default: process-wide hub)
+    """
+    hub = hub or event_hub
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            events = subscription.get(timeout=hub.heartbeat_interval)
+            for event in events:
+                yield format_sse(event)
+            if subscription.overflowed:
+                yield "event: reset\ndata: {}\n\n"
+                return
+            if not events:
+                yield ": keep-alive\n\n"
+    finally:
+        hub.unsubscribe(subscription)
+
+
+def format_sse(event) -> str:
+    """Format an Event as a server-sent event message"""
+    data = {
+        'id': event.id,
+        'event_type': _value(event.event_type),
+        'event_category': _value(event.event_category),
+        'event_severity': _value(event.event_severity),
+        'timestamp': _isoformat(event.timestamp),
+        'source': event.source,
+        'project_id': event.project_id,
+        'session_id': event.session_id,
+        'work_item_id': event.work_item_id,
+        'task_id': event.task_id,
+        'event_data': event.event_data or {},
+    }
+    return (
+        f"id: {event.id}\n"
+        f"event: {data['event_category']}\n"
+        f"data: {json.dumps(data, default=str)}\n\n"
+    )
+
+
+def _value(member) -> Any:
+    return getattr(member, 'value', member)
+
+
+def _isoformat(value) -> Optional[str]:
+    return value.isoformat() if hasattr(value, 'isoformat') else value
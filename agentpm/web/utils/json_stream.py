@@ -0,0 +1,166 @@
+"""
+Streaming JSON list responses for APM (Agent Project Manager) Web Application
+
+List API endpoints return one keyset page of projected row views
+(core/database/methods/row_pages.py), serialized row by row:
+- ?fields=id,title,updated_at   column projection ('id' always included)
+- ?cursor=<next_cursor>&limit=N  cursor pagination (default 100, max 1000)
+- ?format=ndjson (or Accept: application/x-ndjson)  one object per line;
+  the next cursor is sent in the X-Next-Cursor and Link headers
+- gzip Content-Encoding when the client accepts it (?gzip=0 disables)
+"""
+
+import base64
+import binascii
+import json
+import zlib
+from urllib.parse import urlencode
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from flask import Response, request, stream_with_context
+
+DEFAULT_PAGE_SIZE = 100
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+_CURSOR_PREFIX = 'id:'
+
+
+def encode_cursor(after_id: Optional[int]) -> Optional[str]:
+    """Opaque cursor for the page after after_id (None on the last page)"""
+    if after_id is None:
+        return None
+    return base64.urlsafe_b64encode(f"{_CURSOR_PREFIX}{after_id}".encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """
+    Last id of the previous page encoded in cursor (0 for the first page).
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    if not cursor:
+        return 0
+    try:
+        decoded = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    if not decoded.startswith(_CURSOR_PREFIX) or not decoded[len(_CURSOR_PREFIX):].isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return int(decoded[len(_CURSOR_PREFIX):])
+
+
+def parse_fields(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Field projection from a comma-separated list (None: default fields)"""
+    if not value:
+        return None
+    return tuple(field.strip() for field in value.split(',') if field.strip())
+
+
+def parse_limit(value: Optional[str], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """
+    Page size from a query parameter.
+
+    Raises:
+        ValueError: If value is not an integer
+    """
+    if value is None or value == '':
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"limit must be an integer, got {value!r}")
+
+
+def wants_ndjson() -> bool:
+    """Whether the client asked for newline-delimited JSON"""
+    if 'format' in request.args:
+        return request.args['format'] == 'ndjson'
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def wants_gzip() -> bool:
+    """Whether to gzip the response body"""
+    return request.args.get('gzip') != '0' and 'gzip' in request.accept_encodings
+
+
+def json_rows_response(
+    key: str,
+    rows: Sequence[Any],
+    next_after_id: Optional[int],
+    message: str = 'Retrieved successfully'
+) -> Response:
+    """
+    Stream rows as JSON or NDJSON, gzip-compressed when accepted.
+
+    JSON body: {"success": true, "message": ..., "count": N,
+    "next_cursor": ..., "<key>": [...]}; NDJSON body: one row per line.
+
+    Args:
+        key: Name of the JSON array holding the rows
+        rows: Row views (objects with to_dict()) or dicts
+        next_after_id: Last id of this page if more rows exist, else None
+        message: Success message (JSON format)
+    """
+    next_cursor = encode_cursor(next_after_id)
+    ndjson = wants_ndjson()
+    if ndjson:
+        chunks = _ndjson_chunks(rows)
+        mimetype = NDJSON_MIMETYPE
+    else:
+        chunks = _json_chunks(key, rows, next_cursor, message)
+        mimetype = 'application/json'
+
+    headers: Dict[str, str] = {'Vary': 'Accept, Accept-Encoding'}
+    if next_cursor:
+        headers['X-Next-Cursor'] = next_cursor
+        headers['Link'] = f'<{_next_url(next_cursor)}>; rel="next"'
+    if wants_gzip():
+        chunks = _gzip_chunks(chunks)
+        headers['Content-Encoding'] = 'gzip'
+    else:
+        chunks = (chunk.encode('utf-8') for chunk in chunks)
+
+    return Response(stream_with_context(chunks), mimetype=mimetype, headers=headers)
+
+
+def _json_chunks(key: str, rows: Sequence[Any], next_cursor: Optional[str], message: str) -> Iterator[str]:
+    head = {'success': True, 'message': message, 'count': len(rows), 'next_cursor': next_cursor}
+    yield json.dumps(head)[:-1] + f', {json.dumps(key)}: ['
+    separator = ''
+    for row in rows:
+        yield separator + _dumps(row)
+        separator = ','
+    yield ']}'
+
+
+def _ndjson_chunks(rows: Iterable[Any]) -> Iterator[str]:
+    for row in rows:
+        yield _dumps(row) + '\n'
+
+
+def _gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _dumps(row: Any) -> str:
+    data = row.to_dict() if hasattr(row, 'to_dict') else row
+    return json.dumps(data, default=_json_default, separators=(',', ':'))
+
+
+def _json_default(value: Any) -> Any:
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(getattr(value, 'value', value))
+
+
+def _next_url(next_cursor: str) -> str:
+    args = request.args.to_dict()
+    args['cursor'] = next_cursor
+    return f"{request.path}?{urlencode(args)}"
@@ -1,14 +1,246 @@
 """
 Enhanced markdown rendering utilities for APM (Agent Project Manager) Web Application
+
+Rendered HTML is cached by content hash and render variant:
+- In-process LRU (MarkdownRenderCache, a TTLCache registered as
+  'web.markdown_render') in front of every render
+- Optional persistent layer (rendered_markdown table, Migration 0054) read on
+  an in-process miss and populated when documents are saved (prerender_markdown)
+
+Cache keys include RENDER_VERSION (RENDERER_VERSION plus the markdown package
+version), so stored HTML from an older renderer is never served; bump
+RENDERER_VERSION when extensions, their configs or post-processing change.
+
+Configured Markdown instances are reused per thread via reset().
 """
 
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
 import markdown
 from markdown.extensions import codehilite, fenced_code, tables, toc, attr_list, nl2br, def_list, footnotes
 import re
 from markupsafe import Markup
 
+from ...core.performance import TTLCache
+
+logger = logging.getLogger(__name__)
 
-def render_markdown(text, safe_mode=False, prose_class="prose prose-slate max-w-none"):
+# Default in-process render cache size (entries)
+DEFAULT_RENDER_CACHE_SIZE = 512
+
+# Rendering pipeline version (part of every cache key)
+RENDERER_VERSION = 1
+RENDER_VERSION = f"r{RENDERER_VERSION}-md{markdown.__version__}"
+
+# Persistent stores between prunes of the rendered_markdown table
+PRUNE_EVERY = 100
+
+# Configure markdown extensions for enhanced formatting
+MARKDOWN_EXTENSIONS = [
+    'codehilite',
+    'fenced_code',
+    'tables',
+    'toc',
+    'nl2br',  # Convert newlines to <br>
+    'attr_list',  # Allow attributes on elements
+    'def_list',  # Definition lists
+    'footnotes',  # Footnotes support
+    'md_in_html',  # Allow HTML in markdown
+]
+
+# Configure extension options
+MARKDOWN_EXTENSION_CONFIGS = {
+    'codehilite': {
+        'css_class': 'highlight',
+        'use_pygments': True,  # Enable syntax highlighting
+        'linenums': True,  # Enable line numbers
+        'guess_lang': True,  # Auto-detect language
+    },
+    'toc': {
+        'permalink': True,
+        'permalink_title': 'Link to this section',
+        'permalink_class': 'text-blue-600 hover:text-blue-800',
+    },
+    'footnotes': {
+        'BACKLINK_TEXT': '↩',
+        'BACKLINK_TITLE': 'Jump back to footnote %d in the text',
+    }
+}
+
+
+class MarkdownRenderCache:
+    """
+    Bounded LRU cache of rendered HTML keyed by (content hash, versioned variant).
+
+    Thread-safe. The in-process layer is a TTLCache named
+    'web.markdown_render', so /system/caches reports it with the other
+    registered caches. An optional persistent store (a callable returning a
+    DatabaseService) is consulted on a miss; its hits are promoted into the
+    in-process cache. The store is pruned on the first persistent write and
+    then once every prune_every writes.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_RENDER_CACHE_SIZE, prune_every: int = PRUNE_EVERY):
+        self.prune_every = prune_every
+        self._entries = TTLCache('web.markdown_render', maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._database: Optional[Callable[[], Any]] = None
+        self._stores_until_prune = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._entries.maxsize
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    def configure(self, maxsize: Optional[int] = None, database: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Set the cache size and/or the persistent store.
+
+        Args:
+            maxsize: Maximum in-process entries (0 disables the in-process layer)
+            database: Callable returning a DatabaseService for the persistent layer
+        """
+        if maxsize is not None:
+            self._entries.resize(maxsize)
+        if database is not None:
+            with self._lock:
+                self._database = database
+
+    def get_or_render(self, text: str, variant: str, render: Callable[[str], str]) -> str:
+        """
+        Return cached HTML for text/variant, rendering (and caching) on a miss.
+
+        Args:
+            text: Markdown source
+            variant: Render variant key
+            render: Function rendering text to HTML
+
+        Returns:
+            Rendered HTML
+        """
+        key = _cache_key(text, variant)
+        html = self._entries.get(key)
+        if html is not None:
+            return html
+
+        html = self._load(key)
+        if html is not None:
+            with self._lock:
+                self.persistent_hits += 1
+        else:
+            html = render(text)
+            with self._lock:
+                self.misses += 1
+        self._remember(key, html)
+        return html
+
+    def store(self, text: str, variant: str, html: str, persist: bool = False) -> None:
+        """Cache HTML for text/variant (and write it to the persistent store)."""
+        key = _cache_key(text, variant)
+        self._remember(key, html)
+        if persist and self._database is not None:
+            from ...core.database.methods import rendered_markdown
+            db = self._database()
+            rendered_markdown.put_rendered_html(db, *key, html)
+            with self._lock:
+                prune = self._stores_until_prune <= 0
+                self._stores_until_prune = self.prune_every - 1 if prune else self._stores_until_prune - 1
+            if prune:
+                rendered_markdown.prune_rendered_html(db)
+
+    def clear(self) -> None:
+        """Drop in-process entries and reset counters."""
+        self._entries.clear()
+        self._entries.reset_stats()
+        with self._lock:
+            self.persistent_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate of the in-process and persistent layers."""
+        with self._lock:
+            hits = self.hits
+            lookups = hits + self.persistent_hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': hits,
+                'persistent_hits': self.persistent_hits,
+                'misses': self.misses,
+                'hit_rate': round((hits + self.persistent_hits) / lookups, 4) if lookups else 0.0,
+                'persistent': self._database is not None,
+            }
+
+    def _remember(self, key: tuple, html: str) -> None:
+        if self.maxsize > 0:
+            self._entries.set(key, html)
+
+    def _load(self, key: tuple) -> Optional[str]:
+        if self._database is None:
+            return None
+        try:
+            from ...core.database.methods import rendered_markdown
+            return rendered_markdown.get_rendered_html(self._database(), *key)
+        except Exception as e:
+            # Persistent layer is optional - fall back to rendering
+            logger.debug(f"Rendered markdown lookup failed: {e}")
+            return None
+
+
+render_cache = MarkdownRenderCache()
+
+_markdown_instances = threading.local()
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of markdown source (render cache key)."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _cache_key(text: str, variant: str) -> tuple:
+    """(content hash, variant qualified by RENDER_VERSION) - also the rendered_markdown key."""
+    return content_hash(text), f"{variant}|{RENDER_VERSION}"
+
+
+def configure_render_cache(maxsize: Optional[int] = None, database: Optional[Callable[[], Any]] = None) -> None:
+    """
+    Configure the shared render cache.
+
+    Args:
+        maxsize: Maximum in-process entries
+        database: Callable returning a DatabaseService to enable the persistent layer
+    """
+    render_cache.configure(maxsize=maxsize, database=database)
+
+
+def get_render_cache_stats() -> Dict[str, Any]:
+    """Render cache hit rates (see MarkdownRenderCache.stats)."""
+    return render_cache.stats()
+
+
+def _get_markdown(name: str, factory: Callable[[], markdown.Markdown]) -> markdown.Markdown:
+    """Per-thread reusable Markdown instance (reset() before use)."""
+    instances = getattr(_markdown_instances, 'instances', None)
+    if instances is None:
+        instances = _markdown_instances.instances = {}
+    md = instances.get(name)
+    if md is None:
+        md = instances[name] = factory()
+    return md.reset()
+
+
+_DEFAULT_PROSE_CLASS = "prose prose-slate max-w-none"
+_LARGE_PROSE_CLASS = "prose prose-lg prose-slate max-w-none"
+
+
+def render_markdown(text, safe_mode=False, prose_class=_DEFAULT_PROSE_CLASS):
     """
     Render markdown text to HTML with enhanced extensions and Tailwind Typography.
     
@@ -27,43 +259,28 @@ def render_markdown(text, safe_mode=False, prose_class="prose prose-slate max-w-
     if not isinstance(text, str):
         text = str(text)
     
-    # Configure markdown extensions for enhanced formatting
-    extensions = [
-        'codehilite',
-        'fenced_code', 
-        'tables',
-        'toc',
-        'nl2br',  # Convert newlines to <br>
-        'attr_list',  # Allow attributes on elements
-        'def_list',  # Definition lists
-        'footnotes',  # Footnotes support
-        'md_in_html',  # Allow HTML in markdown
-    ]
-    
-    # Configure extension options
-    extension_configs = {
-        'codehilite': {
-            'css_class': 'highlight',
-            'use_pygments': True,  # Enable syntax highlighting
-            'linenums': True,  # Enable line numbers
-            'guess_lang': True,  # Auto-detect language
-        },
-        'toc': {
-            'permalink': True,
-            'permalink_title': 'Link to this section',
-            'permalink_class': 'text-blue-600 hover:text-blue-800',
-        },
-        'footnotes': {
-            'BACKLINK_TEXT': '↩',
-            'BACKLINK_TITLE': 'Jump back to footnote %d in the text',
-        }
-    }
+    html = render_cache.get_or_render(
+        text, _variant(prose_class, safe_mode), lambda source: _render_html(source, safe_mode, prose_class)
+    )
     
-    # Create markdown instance
-    md = markdown.Markdown(
-        extensions=extensions,
-        extension_configs=extension_configs,
-        safe_mode=safe_mode
+    # Return as safe HTML (won't be escaped by Jinja2)
+    return Markup(html)
+
+
+def _variant(prose_class, safe_mode):
+    """Render cache variant key for render_markdown() options."""
+    return f"{prose_class}|safe={int(bool(safe_mode))}"
+
+
+def _render_html(text, safe_mode, prose_class):
+    """Render markdown to wrapped HTML (uncached)."""
+    md = _get_markdown(
+        f"render|{int(bool(safe_mode))}",
+        lambda: markdown.Markdown(
+            extensions=MARKDOWN_EXTENSIONS,
+            extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+            safe_mode=safe_mode
+        )
     )
     
     # Render markdown
@@ -73,10 +290,32 @@ def render_markdown(text, safe_mode=False, prose_class="prose prose-slate max-w-
     html = enhance_markdown_html(html)
     
     # Wrap in prose container with custom classes
-    wrapped_html = f'<div class="{prose_class}">{html}</div>'
+    return f'<div class="{prose_class}">{html}</div>'
+
+
+def prerender_markdown(text, large=True):
+    """
+    Render markdown into the render cache and the persistent store.
+
+    Called when documents are saved so their detail pages are served from
+    the cache on the first request.
     
-    # Return as safe HTML (won't be escaped by Jinja2)
-    return Markup(wrapped_html)
+    Args:
+        text (str): Markdown text
+        large (bool): Render the full-document (markdown_large) variant
+    """
+    if not text:
+        return
+    try:
+        if not isinstance(text, str):
+            text = str(text)
+        prose_class = _LARGE_PROSE_CLASS if large else _DEFAULT_PROSE_CLASS
+        render_cache.store(
+            text, _variant(prose_class, False), _render_html(text, False, prose_class), persist=True
+        )
+    except Exception as e:
+        # Pre-rendering is an optimisation - never fail the write
+        logger.warning(f"Failed to pre-render markdown: {e}")
 
 
 def enhance_markdown_html(html):
@@ -291,7 +530,7 @@ def render_markdown_large(text):
         return ""
     
     # Use large prose classes
-    return render_markdown(text, prose_class="prose prose-lg prose-slate max-w-none")
+    return render_markdown(text, prose_class=_LARGE_PROSE_CLASS)
 
 
 def render_markdown_dark(text):
@@ -328,12 +567,7 @@ def get_markdown_toc(text):
     if not isinstance(text, str):
         text = str(text)
     
-    # Create markdown instance with TOC extension
-    md = markdown.Markdown(extensions=['toc'])
-    md.convert(text)
-    
-    # Get the TOC
-    toc_html = md.toc
+    toc_html = render_cache.get_or_render(text, 'toc', _render_toc)
     
     if toc_html:
         return Markup(f'<div class="prose prose-sm prose-slate max-w-none">{toc_html}</div>')
@@ -341,6 +575,14 @@ def get_markdown_toc(text):
     return ""
 
 
+def _render_toc(text):
+    """Extract table of contents HTML (uncached)."""
+    # Reused markdown instance with TOC extension
+    md = _get_markdown('toc', lambda: markdown.Markdown(extensions=['toc']))
+    md.convert(text)
+    return md.toc
+
+
 def format_enum_display(enum_value):
     """
     Format enum values for display by removing enum class prefixes.
@@ -190,3 +190,44 @@ class TestCheckpointAdapter:
 
         # Assert
         assert metadata.notes_preview == ""  # Empty string for NULL
+
+    def test_from_database_reads_snapshot_blob(self, sample_checkpoint):
+        """Test snapshots are decoded from the joined blob columns."""
+        # Arrange
+        from agentpm.core.database.utils.blob_codec import encode_blob
+
+        packed = CheckpointAdapter.pack_snapshot(sample_checkpoint)
+        codec, payload = encode_blob(packed.encode("utf-8"))
+        db_row = {
+            "id": 7,
+            "session_id": 1,
+            "checkpoint_name": "blob-checkpoint",
+            "created_at": "2025-10-21T10:30:00",
+            "work_items_snapshot": "[]",
+            "tasks_snapshot": "[]",
+            "context_snapshot": "{}",
+            "snapshot_blob_codec": codec,
+            "snapshot_blob_payload": payload,
+            "session_notes": "",
+            "created_by": "test-user",
+            "restore_count": 0,
+            "size_bytes": 0
+        }
+
+        # Act
+        checkpoint = CheckpointAdapter.from_database(db_row)
+
+        # Assert
+        assert checkpoint.work_items_snapshot == sample_checkpoint.work_items_snapshot
+        assert checkpoint.tasks_snapshot == sample_checkpoint.tasks_snapshot
+        assert checkpoint.context_snapshot == sample_checkpoint.context_snapshot
+
+    def test_pack_snapshot_is_canonical(self, sample_checkpoint):
+        """Test identical state packs to identical text (same blob key)."""
+        # Arrange
+        reordered = sample_checkpoint.model_copy(
+            update={"context_snapshot": dict(reversed(list(sample_checkpoint.context_snapshot.items())))}
+        )
+
+        # Act / Assert
+        assert CheckpointAdapter.pack_snapshot(reordered) == CheckpointAdapter.pack_snapshot(sample_checkpoint)
@@ -0,0 +1,151 @@
+"""
+Tests for incremental (delta) checkpoints (Migration 0057).
+
+Covers:
+- diff_snapshots / apply_delta round trips (changes, removals, reordering)
+- Manager stores deltas against the previous checkpoint and periodic full bases
+- Reads replay base + deltas to the captured state
+- Deleting a checkpoint rewrites dependent deltas as full snapshots
+- Migration downgrade materializes deltas
+"""
+
+import pytest
+
+from agentpm.core.database.migrations.files import migration_0057_checkpoint_deltas as migration
+from agentpm.core.database.service import DatabaseService
+from agentpm.providers.anthropic.claude_code.runtime.checkpoints import CheckpointManager, methods
+from agentpm.providers.anthropic.claude_code.runtime.checkpoints.adapters import CheckpointAdapter
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseService(str(tmp_path / "checkpoints.db"))
+    with db.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'Checkpoints', '/tmp/checkpoints')")
+        conn.execute(
+            "INSERT INTO sessions (id, session_id, project_id, tool_name, start_time) "
+            "VALUES (1, 'session-1', 1, 'claude-code', '2025-01-01T10:00:00')"
+        )
+        conn.execute(
+            "INSERT INTO work_items (id, project_id, name, type, status, priority) "
+            "VALUES (1, 1, 'Checkout', 'feature', 'active', 1)"
+        )
+        conn.executemany(
+            "INSERT INTO tasks (id, work_item_id, name, type, status, priority, description) "
+            "VALUES (?, 1, ?, 'implementation', 'active', 2, ?)",
+            [(i, f"Task {i}", "x" * 200) for i in range(1, 41)]
+        )
+        conn.commit()
+    return db
+
+
+def _state(checkpoint):
+    return CheckpointAdapter.state_of(checkpoint)
+
+
+class TestDeltaDocuments:
+    """diff_snapshots + apply_delta reproduce the target state."""
+
+    @pytest.mark.parametrize('after_ids', [
+        [1, 2, 3],        # unchanged
+        [1, 3],           # removal
+        [3, 1, 2],        # reorder
+        [1, 2, 3, 4],     # addition
+        [4, 2],           # mixed
+        [],               # everything removed
+    ])
+    def test_round_trip(self, after_ids):
+        before = {"work_items": [], "tasks": [{"id": i, "name": f"T{i}"} for i in (1, 2, 3)], "context": {"a": 1}}
+        after = {"work_items": [], "tasks": [{"id": i, "name": f"T{i}"} for i in after_ids], "context": {"a": 1}}
+        after["tasks"][:1] = [dict(task, name="changed") for task in after["tasks"][:1]]
+
+        delta = CheckpointAdapter.diff_snapshots(before, after)
+
+        assert CheckpointAdapter.apply_delta(before, delta) == after
+        assert "context" not in delta
+
+    def test_unchanged_state_is_tiny(self):
+        state = {"work_items": [{"id": 1, "name": "W"}], "tasks": [{"id": 2, "name": "T"}], "context": {}}
+        delta = CheckpointAdapter.diff_snapshots(state, state)
+
+        assert delta == {"work_items": {"upsert": [], "remove": []}, "tasks": {"upsert": [], "remove": []}}
+
+
+class TestIncrementalCheckpoints:
+    """Manager writes deltas and replays them on read."""
+
+    def test_delta_after_base(self, db):
+        manager = CheckpointManager(db)
+        base = manager.create_checkpoint(session_id=1, name="base")
+
+        with db.connect() as conn:
+            conn.execute("UPDATE tasks SET name = 'Renamed' WHERE id = 7")
+            conn.execute("UPDATE tasks SET status = 'done' WHERE id = 8")
+            conn.commit()
+        delta = manager.create_checkpoint(session_id=1, name="delta")
+
+        assert base.snapshot_kind == "full"
+        assert delta.snapshot_kind == "delta"
+        assert delta.parent_checkpoint_id == base.id
+        assert delta.size_bytes < base.size_bytes / 5
+
+        loaded = manager.get_checkpoint(delta.id)
+        assert loaded.chain_length == 2
+        assert _state(loaded) == _state(delta)
+        assert [t["name"] for t in loaded.tasks_snapshot if t["id"] == 7] == ["Renamed"]
+        assert 8 not in {t["id"] for t in loaded.tasks_snapshot}
+        assert manager.list_checkpoints(session_id=1)[0].snapshot_kind == "delta"
+
+    def test_full_snapshot_interval(self, db):
+        manager = CheckpointManager(db, full_snapshot_interval=3)
+        kinds = [manager.create_checkpoint(session_id=1, name=f"cp-{i}").snapshot_kind for i in range(7)]
+
+        assert kinds == ["full", "delta", "delta", "full", "delta", "delta", "full"]
+        assert manager.create_checkpoint(session_id=1, name="forced", full=True).snapshot_kind == "full"
+
+    def test_delete_rewrites_dependents(self, db):
+        manager = CheckpointManager(db)
+        base = manager.create_checkpoint(session_id=1, name="base")
+        with db.connect() as conn:
+            conn.execute("UPDATE tasks SET name = 'Later' WHERE id = 3")
+            conn.commit()
+        child = manager.create_checkpoint(session_id=1, name="child")
+        grandchild = manager.create_checkpoint(session_id=1, name="grandchild")
+
+        assert manager.delete_checkpoint(base.id)
+
+        reloaded_child = manager.get_checkpoint(child.id)
+        reloaded_grandchild = manager.get_checkpoint(grandchild.id)
+        assert reloaded_child.snapshot_kind == "full"
+        assert _state(reloaded_child) == _state(child)
+        assert reloaded_grandchild.chain_length == 2
+        assert _state(reloaded_grandchild) == _state(grandchild)
+
+    def test_restore_replays_chain(self, db):
+        manager = CheckpointManager(db)
+        manager.create_checkpoint(session_id=1, name="base")
+        target = manager.create_checkpoint(session_id=1, name="target")
+
+        assert manager.restore_checkpoint(target.id)
+        assert manager.get_checkpoint(target.id).restore_count == 1
+
+    def test_downgrade_materializes_deltas(self, db):
+        manager = CheckpointManager(db)
+        manager.create_checkpoint(session_id=1, name="base")
+        with db.connect() as conn:
+            conn.execute("UPDATE tasks SET name = 'Downgraded' WHERE id = 1")
+            conn.commit()
+        delta = manager.create_checkpoint(session_id=1, name="delta")
+
+        with db.connect() as conn:
+            migration.downgrade(conn)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(session_checkpoints)")]
+            row = dict(conn.execute(
+                "SELECT session_checkpoints.*, content_blobs.codec AS snapshot_blob_codec, "
+                "content_blobs.payload AS snapshot_blob_payload FROM session_checkpoints "
+                "JOIN content_blobs ON content_blobs.blob_key = session_checkpoints.snapshot_blob_key "
+                "WHERE session_checkpoints.id = ?", (delta.id,)
+            ).fetchone())
+
+        assert 'snapshot_kind' not in columns
+        assert _state(CheckpointAdapter.from_database(row)) == _state(delta)
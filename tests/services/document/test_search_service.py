@@ -2,94 +2,67 @@
 Tests for DocumentSearchService
 
 Tests cover:
-- Basic search functionality
+- Basic search functionality against the chunked FTS5 content index
 - Entity-scoped search
-- Snippet generation
+- Snippet generation (served from the index)
 - Highlight extraction
-- Relevance ranking
+- Relevance ranking (BM25)
+- Index maintenance on create/update/delete
+- LIKE fallback when FTS5 is unavailable
 - Error handling
-- Performance benchmarks (for future FTS5)
 """
 
 import pytest
+import tempfile
+import shutil
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
 
 from agentpm.services.document.search_service import DocumentSearchService
 from agentpm.services.document.models import DocumentSearchResult
 from agentpm.core.database.service import DatabaseService
-from agentpm.core.database.enums import EntityType
-from agentpm.core.database.models.search_result import SearchResult, SearchResultType
+from agentpm.core.database.models import Project, WorkItem, DocumentReference
+from agentpm.core.database.methods import projects as project_methods
+from agentpm.core.database.methods import work_items as wi_methods
+from agentpm.core.database.methods import document_references as doc_methods
+from agentpm.core.database.enums import (
+    EntityType,
+    DocumentType,
+    WorkItemType,
+    WorkItemStatus,
+)
 
 
 @pytest.fixture
-def mock_db_service():
-    """Create mock database service."""
-    db = Mock(spec=DatabaseService)
-    return db
+def db_service():
+    """Create a real database service with a temporary database."""
+    temp_dir = tempfile.mkdtemp()
+    service = DatabaseService(str(Path(temp_dir) / "test.db"))
+    yield service
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 @pytest.fixture
-def mock_search_service():
-    """Create mock search service."""
-    with patch('agentpm.services.document.search_service.SearchService') as mock:
-        yield mock
-
-
-@pytest.fixture
-def search_service(mock_db_service, mock_search_service):
-    """Create DocumentSearchService instance with mocks."""
-    return DocumentSearchService(mock_db_service)
+def work_item(db_service):
+    """Create a project and work item to own documents."""
+    project = project_methods.create_project(
+        db_service,
+        Project(name="Search Project", path=tempfile.gettempdir())
+    )
+    return wi_methods.create_work_item(
+        db_service,
+        WorkItem(
+            project_id=project.id,
+            name="Search Work Item",
+            work_item_type=WorkItemType.FEATURE,
+            status=WorkItemStatus.DRAFT
+        )
+    )
 
 
 @pytest.fixture
-def sample_search_results():
-    """Create sample search results for testing."""
-    return [
-        SearchResult(
-            id=1,
-            entity_type=EntityType.WORK_ITEM,  # Documents are associated with entities
-            entity_id=42,
-            result_type=SearchResultType.DOCUMENT,
-            title="Architecture Design",
-            content="System architecture using microservices",
-            excerpt="...architecture using microservices...",
-            relevance_score=0.85,
-            match_type="text_match",
-            matched_fields=["title", "content"],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-            metadata={
-                'file_path': 'docs/architecture/design/system-design.md',
-                'document_type': 'design',
-                'entity_type': 'work_item',
-                'entity_id': 133
-            },
-            search_query="architecture"
-        ),
-        SearchResult(
-            id=2,
-            entity_type=EntityType.WORK_ITEM,  # Documents are associated with entities
-            entity_id=43,
-            result_type=SearchResultType.DOCUMENT,
-            title="Database Design",
-            content="Database schema design for microservices",
-            excerpt="...schema design for microservices...",
-            relevance_score=0.75,
-            match_type="text_match",
-            matched_fields=["title"],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-            metadata={
-                'file_path': 'docs/architecture/design/database-design.md',
-                'document_type': 'design',
-                'entity_type': 'work_item',
-                'entity_id': 133
-            },
-            search_query="architecture"
-        )
-    ]
+def search_service(db_service):
+    """Create DocumentSearchService instance backed by a real database."""
+    return DocumentSearchService(db_service)
 
 
 @pytest.fixture
@@ -114,95 +87,89 @@ service has its own database and communicates via REST APIs.
 """
 
 
+@pytest.fixture
+def create_document(db_service, work_item):
+    """Factory creating documents with content in the database."""
+    def _create(title, content, filename, entity_id=None):
+        return doc_methods.create_document_with_content(
+            db_service,
+            DocumentReference(
+                entity_type=EntityType.WORK_ITEM,
+                entity_id=entity_id or work_item.id,
+                file_path=f"docs/architecture/design_doc/{filename}",
+                category="architecture",
+                document_type=DocumentType.DESIGN_DOC,
+                filename=filename,
+                title=title
+            ),
+            content
+        )
+    return _create
+
+
 class TestDocumentSearchService:
     """Test DocumentSearchService functionality."""
 
-    def test_initialization(self, mock_db_service):
+    def test_initialization(self, db_service):
         """Test service initialization."""
-        service = DocumentSearchService(mock_db_service)
-        assert service.db == mock_db_service
-        assert service.search_service is not None
-
-    def test_search_content_basic(
-        self,
-        search_service,
-        mock_search_service,
-        sample_search_results,
-        sample_document_content
-    ):
+        service = DocumentSearchService(db_service)
+        assert service.db == db_service
+
+    def test_search_content_basic(self, search_service, create_document, sample_document_content):
         """Test basic content search."""
-        # Setup mock
-        mock_search_service.return_value.search_documents.return_value = sample_search_results
-
-        # Mock file reading
-        with patch.object(
-            search_service,
-            '_read_file_content',
-            return_value=sample_document_content
-        ):
-            results = search_service.search_content("microservices")
-
-        # Verify results
-        assert len(results) > 0
+        doc = create_document("Architecture Design", sample_document_content, "system-design.md")
+
+        results = search_service.search_content("microservices")
+
+        assert len(results) == 1
         assert all(isinstance(r, DocumentSearchResult) for r in results)
+        assert results[0].document_id == doc.id
+        assert results[0].file_path == "docs/architecture/design_doc/system-design.md"
 
-    def test_search_content_with_filters(
-        self,
-        search_service,
-        mock_search_service,
-        sample_search_results
-    ):
-        """Test search with entity type filter."""
-        mock_search_service.return_value.search_documents.return_value = sample_search_results
-
-        with patch.object(search_service, '_read_file_content', return_value="content"):
-            results = search_service.search_content(
-                "architecture",
-                entity_type=EntityType.WORK_ITEM
-            )
+    def test_search_content_with_filters(self, search_service, create_document):
+        """Test search with entity type and document type filters."""
+        create_document("Architecture", "# Architecture\n\nLayered architecture", "arch.md")
 
-        # Verify filter was applied
-        assert isinstance(results, list)
-
-    def test_search_content_with_limit(
-        self,
-        search_service,
-        mock_search_service,
-        sample_search_results
-    ):
-        """Test search respects limit parameter."""
-        # Create many results
-        many_results = sample_search_results * 10  # 20 results
-        mock_search_service.return_value.search_documents.return_value = many_results
-
-        with patch.object(search_service, '_read_file_content', return_value="content"):
-            results = search_service.search_content("test", limit=5)
-
-        assert len(results) <= 5
-
-    def test_search_by_entity(
-        self,
-        search_service,
-        mock_search_service,
-        sample_search_results,
-        sample_document_content
-    ):
+        assert search_service.search_content(
+            "architecture", entity_type=EntityType.WORK_ITEM
+        )
+        assert search_service.search_content(
+            "architecture", entity_type=EntityType.TASK
+        ) == []
+        assert search_service.search_content(
+            "architecture", document_type="adr"
+        ) == []
+
+    def test_search_content_with_limit(self, search_service, create_document):
+        """Test search respects limit and offset parameters."""
+        for i in range(8):
+            create_document(f"Guide {i}", f"# Guide {i}\n\nCommon test content", f"guide-{i}.md")
+
+        first_page = search_service.search_content("common", limit=5)
+        second_page = search_service.search_content("common", limit=5, offset=5)
+
+        assert len(first_page) == 5
+        assert len(second_page) == 3
+        assert not {r.document_id for r in first_page} & {r.document_id for r in second_page}
+
+    def test_search_by_entity(self, search_service, create_document, work_item, sample_document_content):
         """Test entity-scoped search."""
-        mock_search_service.return_value.search_documents.return_value = sample_search_results
-
-        with patch.object(
-            search_service,
-            '_read_file_content',
-            return_value=sample_document_content
-        ):
-            results = search_service.search_by_entity(
-                EntityType.WORK_ITEM,
-                133,
-                "architecture"
-            )
+        create_document("Architecture Design", sample_document_content, "system-design.md")
+
+        results = search_service.search_by_entity(
+            EntityType.WORK_ITEM,
+            work_item.id,
+            "architecture"
+        )
+        other = search_service.search_by_entity(
+            EntityType.WORK_ITEM,
+            work_item.id + 1000,
+            "architecture"
+        )
 
-        # Verify entity filtering
-        assert all(r.entity_id == 133 for r in results)
+        assert len(results) == 1
+        assert all(r.entity_id == work_item.id for r in results)
+        assert other == []
 
     def test_get_search_suggestions(self, search_service):
         """Test search suggestions (stub)."""
@@ -210,137 +177,76 @@ class TestDocumentSearchService:
         # Currently returns empty list (stub)
         assert isinstance(suggestions, list)
 
-    def test_create_snippet(self, search_service):
-        """Test snippet creation."""
-        content = "This is a test document about microservices architecture."
-        query = "microservices"
-
-        snippet = search_service._create_snippet(content, query, max_length=50)
-
-        assert isinstance(snippet, str)
-        assert "microservices" in snippet.lower()
-        assert len(snippet) <= 100  # Including ellipsis
-
-    def test_create_snippet_no_match(self, search_service):
-        """Test snippet when query not found."""
-        content = "This is a test document."
-        query = "nonexistent"
-
-        snippet = search_service._create_snippet(content, query, max_length=20)
-
-        assert isinstance(snippet, str)
-        # Should return beginning of content
-        assert snippet.startswith("This is a test")
-
-    def test_find_highlights(self, search_service):
-        """Test highlight position extraction."""
-        content = "microservices are used in microservices architecture"
-        query = "microservices"
-
-        highlights = search_service._find_highlights(content, query)
-
-        assert isinstance(highlights, list)
-        assert len(highlights) >= 2  # Two occurrences
-        assert all(isinstance(h, tuple) and len(h) == 2 for h in highlights)
-
-    def test_find_highlights_multi_word(self, search_service):
-        """Test highlights for multi-word query."""
-        content = "The architecture uses microservices pattern"
-        query = "architecture microservices"
-
-        highlights = search_service._find_highlights(content, query)
+    def test_snippet_comes_from_matching_section(self, search_service, create_document, sample_document_content):
+        """Test snippet is taken from the best matching chunk and labelled with its heading."""
+        create_document("Architecture Design", sample_document_content, "system-design.md")
 
-        assert isinstance(highlights, list)
-        assert len(highlights) >= 2  # Both words should be found
+        result = search_service.search_content("gateway")[0]
 
-    def test_extract_matched_terms(self, search_service):
-        """Test matched term extraction."""
-        content = "This document discusses architecture and design"
-        query = "architecture design database"
+        assert result.snippet.startswith("Architecture Design Document > Components: ")
+        assert "Gateway" in result.snippet
 
-        matched = search_service._extract_matched_terms(content, query)
-
-        assert "architecture" in matched
-        assert "design" in matched
-        assert "database" not in matched  # Not in content
-
-    def test_calculate_relevance(self, search_service):
-        """Test relevance calculation."""
-        content = "microservices architecture " * 5  # High density
-        query = "microservices"
-
-        relevance = search_service._calculate_relevance(content, query, base_score=0.5)
+    def test_highlights_point_at_matches(self, search_service, create_document):
+        """Test highlight positions index matched terms within the snippet."""
+        create_document(
+            "Services",
+            "microservices are used in microservices architecture",
+            "services.md"
+        )
 
-        assert 0.0 <= relevance <= 1.0
-        assert relevance > 0.5  # Should boost from base score
+        result = search_service.search_content("microservices")[0]
 
-    def test_calculate_relevance_phrase_boost(self, search_service):
-        """Test relevance with exact phrase match."""
-        content = "The microservices architecture is scalable"
-        query = "microservices architecture"
+        assert len(result.highlights) == 2
+        for start, end in result.highlights:
+            assert result.snippet[start:end].lower() == "microservices"
+        assert result.matched_terms == ["microservices"]
 
-        relevance = search_service._calculate_relevance(content, query, base_score=0.5)
+    def test_multi_word_query_requires_all_terms(self, search_service, create_document):
+        """Test multi-word queries match documents containing every term."""
+        create_document("Both", "The architecture uses microservices pattern", "both.md")
+        create_document("One", "The architecture uses a monolith", "one.md")
 
-        # Should get phrase boost
-        assert relevance > 0.5
+        results = search_service.search_content("architecture microservices")
 
-    def test_content_matches(self, search_service):
-        """Test content matching logic."""
-        content = "This is about microservices and architecture"
+        assert [r.title for r in results] == ["Both"]
+        assert set(results[0].matched_terms) == {"architecture", "microservices"}
 
-        assert search_service._content_matches(content, "microservices")
-        assert search_service._content_matches(content, "architecture")
-        assert search_service._content_matches(content, "microservices architecture")
-        assert not search_service._content_matches(content, "database")
+    def test_phrase_query(self, search_service, create_document):
+        """Test quoted phrases match only exact phrases."""
+        create_document("Phrase", "hybrid storage keeps files in sync", "phrase.md")
+        create_document("Split", "storage is hybrid by default", "split.md")
 
-    def test_read_file_content_success(self, search_service, tmp_path):
-        """Test successful file reading."""
-        # Create temporary file
-        test_file = tmp_path / "test.md"
-        test_content = "# Test Document\n\nContent here."
-        test_file.write_text(test_content)
+        results = search_service.search_content('"hybrid storage"')
 
-        content = search_service._read_file_content(str(test_file))
+        assert [r.title for r in results] == ["Phrase"]
 
-        assert content == test_content
+    def test_query_with_fts_operators_is_safe(self, search_service, create_document):
+        """Test that FTS5 syntax characters in user input do not raise."""
+        create_document("Ops", "Use NOT operators (carefully) in code", "ops.md")
 
-    def test_read_file_content_not_found(self, search_service):
-        """Test file reading with non-existent file."""
-        content = search_service._read_file_content("/nonexistent/file.md")
-        assert content is None
+        results = search_service.search_content('operators (carefully) NOT "')
 
-    def test_read_file_content_relative_path(self, search_service, tmp_path, monkeypatch):
-        """Test file reading with relative path."""
-        # Create temporary file in "current directory"
-        test_file = tmp_path / "docs" / "test.md"
-        test_file.parent.mkdir(parents=True)
-        test_content = "Test content"
-        test_file.write_text(test_content)
+        assert len(results) == 1
 
-        # Change to tmp_path as working directory
-        monkeypatch.chdir(tmp_path)
+    def test_search_does_not_read_files(self, search_service, create_document, monkeypatch):
+        """Test search is served entirely from the database index."""
+        create_document("Indexed", "# Indexed\n\nContent only in the database", "indexed.md")
 
-        content = search_service._read_file_content("docs/test.md")
+        def fail(*args, **kwargs):
+            raise AssertionError("document search must not read files")
 
-        assert content == test_content
+        monkeypatch.setattr(Path, "read_text", fail)
+        monkeypatch.setattr("builtins.open", fail)
 
-    def test_search_content_file_not_found(
-        self,
-        search_service,
-        mock_search_service,
-        sample_search_results
-    ):
-        """Test search when document files cannot be read."""
-        mock_search_service.return_value.search_documents.return_value = sample_search_results
+        assert len(search_service.search_content("database")) == 1
 
-        with patch.object(search_service, '_read_file_content', return_value=None):
-            results = search_service.search_content("architecture")
+    def test_search_content_no_match(self, search_service, create_document):
+        """Test search with no matching documents."""
+        create_document("Python", "# Python\n\nPython programming guide", "python.md")
 
-        # Should still return results based on metadata
-        # or empty list if content search required
-        assert isinstance(results, list)
+        assert search_service.search_content("javascript") == []
 
-    def test_search_content_empty_query(self, search_service, mock_search_service):
+    def test_search_content_empty_query(self, search_service):
         """Test search with empty query."""
         # Empty query should raise validation error from SearchQuery
         from pydantic import ValidationError
@@ -348,27 +254,25 @@ class TestDocumentSearchService:
         with pytest.raises(ValidationError):
             search_service.search_content("")
 
-    def test_search_results_sorted_by_rank(
-        self,
-        search_service,
-        mock_search_service,
-        sample_search_results,
-        sample_document_content
-    ):
+    def test_search_results_sorted_by_rank(self, search_service, create_document):
         """Test that results are sorted by relevance rank."""
-        mock_search_service.return_value.search_documents.return_value = sample_search_results
+        create_document("Dense", "architecture architecture architecture design", "dense.md")
+        create_document("Sparse", "architecture " + "filler words here " * 40, "sparse.md")
+
+        results = search_service.search_content("architecture")
+
+        ranks = [r.rank for r in results]
+        assert ranks == sorted(ranks, reverse=True)
+        assert results[0].title == "Dense"
+
+    def test_title_match_outranks_body_match(self, search_service, create_document):
+        """Test title matches are weighted above body matches (BM25 column weights)."""
+        create_document("Deployment Guide", "How to ship the application", "deploy.md")
+        create_document("Notes", "Some notes mentioning deployment once", "notes.md")
 
-        with patch.object(
-            search_service,
-            '_read_file_content',
-            return_value=sample_document_content
-        ):
-            results = search_service.search_content("architecture")
+        results = search_service.search_content("deployment")
 
-        # Verify results are sorted (descending)
-        if len(results) > 1:
-            ranks = [r.rank for r in results]
-            assert ranks == sorted(ranks, reverse=True)
+        assert results[0].title == "Deployment Guide"
 
     def test_document_search_result_model(self):
         """Test DocumentSearchResult model."""
@@ -407,95 +311,123 @@ class TestDocumentSearchService:
 
 
 class TestDocumentSearchPerformance:
-    """Performance tests for document search (benchmarks for future FTS5)."""
+    """Performance tests for document search."""
 
     @pytest.mark.skip(reason="Performance test - run manually")
-    def test_search_performance_target(self, search_service):
-        """Test search performance meets <200ms target."""
-        # This test will be enabled when FTS5 is implemented
-        # For now, it documents the performance requirement
+    def test_search_performance_target(self, search_service, create_document):
+        """Test search performance meets <200ms target with 1000+ documents."""
         import time
 
+        for i in range(1000):
+            create_document(f"Doc {i}", f"# Doc {i}\n\narchitecture note {i}", f"doc-{i}.md")
+
         start = time.time()
-        results = search_service.search_content("architecture", limit=100)
+        search_service.search_content("architecture", limit=100)
         elapsed_ms = (time.time() - start) * 1000
 
         assert elapsed_ms < 200, f"Search took {elapsed_ms}ms (target: <200ms)"
 
-    @pytest.mark.skip(reason="Load test - run manually")
-    def test_search_large_dataset(self, search_service):
-        """Test search with 1000+ documents."""
-        # This will be implemented when we have FTS5
-        # Documents expected behavior with large dataset
-        pass
-
 
 class TestFTS5Integration:
-    """Tests for future FTS5 implementation (currently skipped)."""
+    """Tests for the chunked FTS5 content index."""
 
-    @pytest.mark.skip(reason="FTS5 not yet implemented - blocked by Task #711")
-    def test_rebuild_search_index(self):
+    def test_rebuild_search_index(self, search_service, create_document, db_service):
         """Test FTS5 index rebuild."""
-        # TODO: Implement when Task #711 completes
-        pass
+        create_document("Rebuild", "# One\n\nalpha\n\n# Two\n\nbeta", "rebuild.md")
+        with db_service.transaction() as conn:
+            conn.execute("DELETE FROM document_content_chunks")
+        assert search_service.search_content("alpha") == []
 
-    @pytest.mark.skip(reason="FTS5 not yet implemented - blocked by Task #711")
-    def test_update_search_index_for_document(self):
-        """Test incremental FTS5 index update."""
-        # TODO: Implement when Task #711 completes
-        pass
+        chunk_count = search_service.rebuild_search_index()
 
-    @pytest.mark.skip(reason="FTS5 not yet implemented - blocked by Task #711")
-    def test_bm25_ranking(self):
-        """Test BM25 relevance ranking."""
-        # TODO: Implement when Task #711 completes
-        pass
+        assert chunk_count == 2
+        assert len(search_service.search_content("alpha")) == 1
 
-    @pytest.mark.skip(reason="FTS5 not yet implemented - blocked by Task #711")
-    def test_query_suggestions_fts5(self):
-        """Test query suggestions using FTS5."""
-        # TODO: Implement when Task #711 completes
-        pass
+    def test_update_search_index_for_document(self, search_service, create_document, db_service):
+        """Test content updates are reflected in the index."""
+        doc = create_document("Updatable", "original wording", "update.md")
 
+        doc_methods.update_document_content(db_service, doc.id, "revised wording")
 
-# Test fixtures for integration tests (when DB available)
+        assert search_service.search_content("original") == []
+        assert len(search_service.search_content("revised")) == 1
+        assert search_service.update_search_index_for_document(doc.id) == 1
 
-@pytest.fixture
-def integration_db_service():
-    """Real database service for integration tests."""
-    # TODO: Setup test database
-    pytest.skip("Integration tests require test database setup")
-
-
-@pytest.mark.integration
-class TestDocumentSearchIntegration:
-    """Integration tests with real database (skipped in unit tests)."""
-
-    def test_search_real_documents(self, integration_db_service):
-        """Test search against real database."""
-        service = DocumentSearchService(integration_db_service)
-        results = service.search_content("architecture")
-        assert isinstance(results, list)
-
-    def test_search_by_work_item(self, integration_db_service):
-        """Test searching documents for a work item."""
-        service = DocumentSearchService(integration_db_service)
-        results = service.search_by_entity(
-            EntityType.WORK_ITEM,
-            133,
-            "design"
-        )
-        assert isinstance(results, list)
+    def test_unchanged_content_is_not_reindexed(self, create_document, db_service):
+        """Test metadata-only updates leave existing chunks untouched."""
+        doc = create_document("Stable", "# Stable\n\ncontent", "stable.md")
+        with db_service.connect() as conn:
+            before = conn.execute(
+                "SELECT id FROM document_content_chunks WHERE document_id = ?", (doc.id,)
+            ).fetchall()
 
+        doc_methods.mark_document_synced(db_service, doc.id)
 
-# Pytest configuration
-def pytest_configure(config):
-    """Configure pytest with custom markers."""
-    config.addinivalue_line(
-        "markers",
-        "integration: marks tests as integration tests (skipped by default)"
-    )
-    config.addinivalue_line(
-        "markers",
-        "performance: marks tests as performance benchmarks"
-    )
+        with db_service.connect() as conn:
+            after = conn.execute(
+                "SELECT id FROM document_content_chunks WHERE document_id = ?", (doc.id,)
+            ).fetchall()
+        assert [r[0] for r in before] == [r[0] for r in after]
+
+    def test_delete_removes_chunks(self, search_service, create_document, db_service):
+        """Test deleting a document removes it from the index."""
+        doc = create_document("Doomed", "ephemeral content", "doomed.md")
+
+        doc_methods.delete_document_reference(db_service, doc.id)
+
+        assert search_service.search_content("ephemeral") == []
+        with db_service.connect() as conn:
+            remaining = conn.execute("SELECT COUNT(*) FROM document_content_chunks").fetchone()[0]
+        assert remaining == 0
+
+    def test_bm25_ranking(self, search_service, create_document):
+        """Test BM25 relevance ranking favours denser matches."""
+        create_document("Low", "cache " + "other text " * 50, "low.md")
+        create_document("High", "cache cache cache invalidation", "high.md")
+
+        results = search_service.search_content("cache")
+
+        assert [r.title for r in results] == ["High", "Low"]
+        assert all(0.0 <= r.rank <= 1.0 for r in results)
+
+
+class TestLikeFallback:
+    """Search without FTS5 (Migration 0051 created only the chunk table)."""
+
+    @pytest.fixture(autouse=True)
+    def without_fts5(self, db_service):
+        with db_service.connect() as conn:
+            for trigger in ('document_chunks_ai', 'document_chunks_ad', 'document_chunks_au'):
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            conn.execute("DROP TABLE IF EXISTS document_chunks_fts")
+            conn.commit()
+
+    def test_search_content(self, search_service, create_document, sample_document_content):
+        doc = create_document("Architecture Design", sample_document_content, "system-design.md")
+
+        result = search_service.search_content("gateway")[0]
+
+        assert result.document_id == doc.id
+        assert result.snippet.startswith("Architecture Design Document > Components: ")
+        assert result.matched_terms == ["gateway"]
+        for start, end in result.highlights:
+            assert result.snippet[start:end].lower() == "gateway"
+
+    def test_all_terms_and_phrases_required(self, search_service, create_document):
+        create_document("Both", "hybrid storage keeps architecture in sync", "both.md")
+        create_document("Split", "storage is hybrid by default", "split.md")
+
+        assert [r.title for r in search_service.search_content("architecture storage")] == ["Both"]
+        assert [r.title for r in search_service.search_content('"hybrid storage"')] == ["Both"]
+        assert search_service.search_content("javascript") == []
+
+    def test_ranking_and_filters(self, search_service, create_document, work_item):
+        create_document("Notes", "Some notes mentioning deployment once", "notes.md")
+        create_document("Deployment Guide", "How to ship the application", "deploy.md")
+        create_document("Dense", "deployment deployment deployment", "dense.md", entity_id=work_item.id + 1)
+
+        assert [r.title for r in search_service.search_content("deployment")] == ["Deployment Guide", "Dense", "Notes"]
+        assert [r.title for r in search_service.search_by_entity(
+            EntityType.WORK_ITEM, work_item.id, "deployment"
+        )] == ["Deployment Guide", "Notes"]
+        assert [r.title for r in search_service.search_content("deployment", limit=1, offset=1)] == ["Dense"]
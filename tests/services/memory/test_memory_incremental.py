@@ -0,0 +1,223 @@
+"""
+Tests for change-driven memory file regeneration.
+
+Covers:
+- Source watermarks skip regeneration while source tables are unchanged
+- Source table changes (insert/update, including in-place edits) trigger
+  regeneration of dependent files only; expired files are regenerated
+- Equal content (ignoring the generation timestamp) is not rewritten to disk
+- Concurrent generation matches sequential generation
+"""
+
+import pytest
+
+from agentpm.core.database.methods import ideas, memory_methods
+from agentpm.core.database.models.memory import MemoryFileType
+from agentpm.core.database.service import DatabaseService
+from agentpm.services.memory.generator import MemoryGenerator
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Database with one project, a rule and an idea."""
+    db = DatabaseService(str(tmp_path / "test.db"))
+    with db.connect() as conn:
+        conn.execute(
+            "INSERT INTO projects (name, path, tech_stack, status) "
+            "VALUES ('Test Project', '/test/path', '[\"Python\"]', 'active')"
+        )
+        conn.execute(
+            "INSERT INTO rules (project_id, rule_id, name, description, category, enforcement_level, enabled) "
+            "VALUES (1, 'DP-001', 'time-boxing', 'Time-box work', 'Development Principles', 'BLOCK', 1)"
+        )
+        conn.execute(
+            "INSERT INTO ideas (project_id, title, description, status, source, votes) "
+            "VALUES (1, 'First Idea', 'An idea', 'idea', 'user', 1)"
+        )
+        conn.commit()
+    return db
+
+
+@pytest.fixture
+def generator(db, tmp_path):
+    return MemoryGenerator(db, tmp_path / "project")
+
+
+def _insert_idea(db, title):
+    with db.connect() as conn:
+        conn.execute(
+            "INSERT INTO ideas (project_id, title, description, status, source, votes) "
+            "VALUES (1, ?, 'Another idea', 'idea', 'user', 0)",
+            (title,)
+        )
+        conn.commit()
+
+
+def _mtimes(generator):
+    return {
+        path.name: path.stat().st_mtime_ns
+        for path in (generator.project_root / ".claude").glob("*.md")
+    }
+
+
+class TestSourceWatermarks:
+    """Test watermark-driven regeneration decisions."""
+
+    def test_watermark_stored(self, generator):
+        memory = generator.generate_memory_file(1, MemoryFileType.IDEAS)
+
+        assert memory.source_watermark
+        assert memory.source_watermark == generator._compute_watermark(1, ["ideas"])
+
+    def test_unchanged_sources_skip_regeneration(self, generator, monkeypatch):
+        generator.generate_all_memory_files(1)
+        calls = []
+        original = generator._generate_content_for_type
+        monkeypatch.setattr(
+            generator, '_generate_content_for_type',
+            lambda project_id, file_type: calls.append(file_type) or original(project_id, file_type)
+        )
+
+        memories = generator.generate_all_memory_files(1)
+
+        assert len(memories) == len(MemoryFileType)
+        assert calls == []
+
+    def test_changed_source_regenerates_dependent_file_only(self, generator, db, monkeypatch):
+        generator.generate_all_memory_files(1)
+        calls = []
+        original = generator._generate_content_for_type
+        monkeypatch.setattr(
+            generator, '_generate_content_for_type',
+            lambda project_id, file_type: calls.append(file_type) or original(project_id, file_type)
+        )
+
+        _insert_idea(db, "Second Idea")
+        generator.generate_all_memory_files(1)
+
+        assert calls == [MemoryFileType.IDEAS]
+        ideas = memory_methods.get_memory_file_by_type(db, 1, MemoryFileType.IDEAS)
+        assert "Second Idea" in ideas.content
+        assert "Second Idea" in (generator.project_root / ".claude" / "IDEAS.md").read_text()
+
+    def test_updated_row_changes_watermark(self, generator, db):
+        before = generator._compute_watermark(1, ["rules"])
+
+        with db.connect() as conn:
+            conn.execute("UPDATE rules SET name = 'renamed-rule', updated_at = '2999-01-01 00:00:00'")
+            conn.commit()
+
+        assert generator._compute_watermark(1, ["rules"]) != before
+
+    def test_in_place_edit_changes_watermark(self, generator, db):
+        before = generator._compute_watermark(1, ["ideas"])
+        idea = ideas.get_idea(db, 1)
+        idea.title = "Renamed Idea"
+        idea.votes = 7
+
+        ideas.update_idea(db, idea)  # leaves updated_at alone
+
+        assert generator._compute_watermark(1, ["ideas"]) != before
+
+    def test_in_place_edit_regenerates(self, generator, db):
+        generator.generate_memory_file(1, MemoryFileType.IDEAS)
+        idea = ideas.get_idea(db, 1)
+        idea.title = "Renamed Idea"
+        ideas.update_idea(db, idea)
+
+        memory = generator.generate_memory_file(1, MemoryFileType.IDEAS)
+
+        assert "Renamed Idea" in memory.content
+
+    def test_expired_file_regenerated(self, generator, db, monkeypatch):
+        memory = generator.generate_memory_file(1, MemoryFileType.RULES)
+        memory_methods.update_memory_file(db, memory.id, {'expires_at': '2000-01-01T00:00:00'})
+        calls = []
+        original = generator._generate_content_for_type
+        monkeypatch.setattr(
+            generator, '_generate_content_for_type',
+            lambda project_id, file_type: calls.append(file_type) or original(project_id, file_type)
+        )
+
+        regenerated = generator.generate_memory_file(1, MemoryFileType.RULES)
+
+        assert calls == [MemoryFileType.RULES]
+        assert not regenerated.is_expired
+
+    def test_stale_file_regenerated(self, generator, db):
+        memory = generator.generate_memory_file(1, MemoryFileType.RULES)
+        memory_methods.mark_stale(db, memory.id)
+
+        regenerated = generator.generate_memory_file(1, MemoryFileType.RULES)
+
+        assert regenerated.is_validated
+
+    def test_deleted_disk_file_restored(self, generator):
+        memory = generator.generate_memory_file(1, MemoryFileType.RULES)
+        path = generator.project_root / memory.file_path
+        path.unlink()
+
+        generator.generate_memory_file(1, MemoryFileType.RULES)
+
+        assert path.read_text(encoding='utf-8') == memory.content
+
+
+class TestContentHash:
+    """Test content-hash based write skipping."""
+
+    def test_hash_ignores_generation_timestamp(self, generator):
+        first = "# Title\n\n**Generated**: 2025-01-01 10:00:00\n\nBody\n"
+        second = "# Title\n\n**Generated**: 2025-06-30 23:59:59\n\nBody\n"
+
+        assert generator._calculate_hash(first) == generator._calculate_hash(second)
+        assert generator._calculate_hash(first) != generator._calculate_hash(first + "More\n")
+
+    def test_forced_regeneration_with_equal_content_skips_disk_write(self, generator):
+        generator.generate_all_memory_files(1)
+        before = _mtimes(generator)
+
+        memories = generator.generate_all_memory_files(1, force_regenerate=True)
+
+        assert len(memories) == len(MemoryFileType)
+        assert _mtimes(generator) == before
+
+    def test_changed_content_written(self, generator, db):
+        generator.generate_memory_file(1, MemoryFileType.IDEAS)
+        _insert_idea(db, "Fresh Idea")
+
+        memory = generator.generate_memory_file(1, MemoryFileType.IDEAS, force_regenerate=True)
+
+        assert (generator.project_root / memory.file_path).read_text(encoding='utf-8') == memory.content
+        assert "Fresh Idea" in memory.content
+
+
+class TestConcurrentGeneration:
+    """Test concurrent generation of independent file types."""
+
+    def test_results_in_file_type_order(self, generator):
+        memories = generator.generate_all_memory_files(1)
+
+        assert [m.file_type for m in memories] == list(MemoryFileType)
+
+    def test_concurrent_matches_sequential(self, db, tmp_path):
+        concurrent = MemoryGenerator(db, tmp_path / "a").generate_all_memory_files(1)
+        sequential = MemoryGenerator(db, tmp_path / "b").generate_all_memory_files(
+            1, force_regenerate=True, max_workers=1
+        )
+
+        assert [m.file_hash for m in concurrent] == [m.file_hash for m in sequential]
+
+    def test_failure_is_isolated(self, generator, monkeypatch):
+        original = generator._generate_content_for_type
+
+        def content(project_id, file_type):
+            if file_type == MemoryFileType.AGENTS:
+                raise RuntimeError("agents table unavailable")
+            return original(project_id, file_type)
+
+        monkeypatch.setattr(generator, '_generate_content_for_type', content)
+
+        memories, errors = generator.generate_memory_files(1)
+
+        assert len(memories) == len(MemoryFileType) - 1
+        assert errors == {MemoryFileType.AGENTS: "agents table unavailable"}
@@ -0,0 +1,155 @@
+"""
+Tests for CLI startup time: static help, lazy package exports and importtime budgets.
+
+Covers:
+- `apm --help` lists commands without importing command modules or heavy libraries
+- COMMAND_HELP matches each command's docstring
+- lazy_exports resolves names on first access and rejects unknown ones
+- parse_importtime / budget checks
+- `apm status` measured against a fixture project; budgets from the baseline
+"""
+
+import subprocess
+import sys
+import types
+
+import click
+import pytest
+
+from agentpm.cli.main import COMMAND_HELP, COMMANDS, main
+from agentpm.core.testing.startup import (
+    BASELINE_MS, BUDGET_MARGIN, PACKAGE_ROOT, StartupResult, StartupTarget, default_targets, measure,
+    parse_importtime
+)
+from agentpm.utils.lazy import lazy_exports
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _abc
+import time:       300 |        420 | abc
+import time:      1500 |       1500 |       pydantic_core.core_schema
+import time:      2000 |       3500 |     pydantic.types
+import time:       500 |       4000 |   pydantic
+import time:       250 |       4250 | agentpm.core.database.models
+Traceback-free program output
+"""
+
+
+class TestHelp:
+    """`apm --help` is served from static metadata."""
+
+    def test_help_does_not_import_commands_or_heavy_modules(self):
+        code = (
+            "import sys\n"
+            "from agentpm.cli.main import main\n"
+            "try:\n    main(['--help'])\nexcept SystemExit:\n    pass\n"
+            "heavy = [m for m in sys.modules if m.split('.')[0] in ('networkx', 'jinja2', 'pydantic')"
+            " or m == 'rich.table' or m.startswith('agentpm.cli.commands.')]\n"
+            "print('HEAVY', heavy)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], cwd=str(PACKAGE_ROOT), capture_output=True, text=True, timeout=60
+        ).stdout
+
+        assert 'status' in output and 'work-item' in output
+        assert 'HEAVY []' in output
+
+    def test_every_listed_command_has_help(self):
+        assert set(main.list_commands(None)) <= set(COMMAND_HELP)
+        assert set(COMMAND_HELP) == set(COMMANDS)
+
+    @pytest.mark.parametrize('name', sorted(COMMANDS))
+    def test_help_matches_command_docstring(self, name):
+        module_path, attr = COMMANDS[name].rsplit(':', 1)
+        try:
+            command = getattr(__import__(module_path, fromlist=[attr]), attr)
+        except Exception as e:  # optional dependency missing (e.g. psutil for web)
+            pytest.skip(f"{name} not importable: {e}")
+
+        assert COMMAND_HELP[name] == click.utils.make_default_short_help(command.help or '', 10_000)
+
+
+class TestLazyExports:
+    """lazy_exports imports the providing module on first access."""
+
+    def test_resolves_and_caches(self):
+        package_globals = {}
+        getattr_, dir_ = lazy_exports('json', package_globals, {'.decoder': ['JSONDecodeError']}, ['.encoder'])
+
+        assert getattr_('JSONDecodeError').__name__ == 'JSONDecodeError'
+        assert isinstance(getattr_('encoder'), types.ModuleType)
+        assert set(package_globals) == {'JSONDecodeError', 'encoder'}
+        assert 'JSONDecodeError' in dir_()
+
+    def test_unknown_name(self):
+        getattr_, _ = lazy_exports('json', {}, {'.decoder': ['JSONDecodeError']})
+
+        with pytest.raises(AttributeError):
+            getattr_('missing')
+
+    def test_package_exports_unchanged(self):
+        from agentpm.core.database import methods, models
+
+        assert models.Task.__name__ == 'Task'
+        assert methods.tasks.__name__ == 'agentpm.core.database.methods.tasks'
+        assert set(models.__all__) <= set(dir(models))
+
+
+class TestImportTime:
+    """parse_importtime and budget evaluation."""
+
+    def test_parse(self):
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert [r.module for r in records] == [
+            '_abc', 'abc', 'pydantic_core.core_schema', 'pydantic.types', 'pydantic', 'agentpm.core.database.models'
+        ]
+        assert [r.depth for r in records] == [1, 0, 3, 2, 1, 0]
+        assert records[4].cumulative_us == 4000
+
+    def test_budget_and_violations(self):
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+        target = StartupTarget('probe', 'pass', budget_ms=5.0, forbidden=('pydantic', 'networkx'))
+        result = StartupResult(target, records, import_ms=4.67)
+
+        assert result.violations == ['pydantic']
+        assert not result.within_budget
+        assert result.packages(2) == {'pydantic': 2.5, 'pydantic_core': 1.5}
+        assert [r.module for r in result.top_modules(1)] == ['agentpm.core.database.models']
+
+    def test_default_targets_cover_hooks(self):
+        names = [target.name for target in default_targets()]
+
+        assert names[:2] == ['apm --help', 'apm status']
+        assert 'hook:session-start' in names
+
+    def test_budgets_from_baseline_with_margin(self):
+        budgets = {target.name: target.budget_ms for target in default_targets()}
+
+        assert budgets['apm status'] == BASELINE_MS['apm status'] * BUDGET_MARGIN
+        assert budgets['hook:stop'] == BASELINE_MS['hook'] * BUDGET_MARGIN
+        assert default_targets(margin=1.0)[0].budget_ms == BASELINE_MS['apm --help']
+
+    def test_measure_help(self):
+        target = next(t for t in default_targets() if t.name == 'apm --help')
+        result = measure(target, cwd=PACKAGE_ROOT)
+
+        assert result.error is None
+        assert result.violations == []
+        assert any(r.module == 'agentpm.cli.main' for r in result.records)
+
+    def test_measure_status_runs_command_against_fixture(self, tmp_path):
+        target = next(t for t in default_targets() if t.name == 'apm status')
+        result = measure(target, cwd=tmp_path)
+
+        assert result.error is None
+        assert result.target is target
+        assert any(r.module == 'agentpm.core.database.methods.project_tree' for r in result.records)
+        assert not (tmp_path / '.agentpm').exists()
+
+    def test_failing_program_reports_error(self, tmp_path):
+        target = next(t for t in default_targets() if t.name == 'apm status')
+        result = measure(StartupTarget('no project', target.code, 1000.0), cwd=tmp_path, repeat=3)
+
+        assert result.error is not None
+        assert not result.within_budget
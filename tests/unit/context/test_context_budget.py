@@ -0,0 +1,220 @@
+"""
+Tests for token-budgeted context packing (core/context/budget.py).
+
+Covers:
+- Offline token estimate and pluggable tokenizers
+- Greedy knapsack selection by priority per token
+- Truncated stubs with references, dropped sections, required sections
+- ContextAssemblyService packs task payloads and records packing stats
+- Hook output is packed into the project's token budget (.agentpm/context_config.json)
+"""
+
+import json
+
+import pytest
+
+from agentpm.core.context import ContextAssemblyService, ContextBudgetPacker, PayloadSection, estimate_tokens
+from agentpm.core.context.budget import DEFAULT_TOKEN_BUDGET, truncate_text
+from agentpm.core.database.methods import work_item_summaries
+from agentpm.core.database.models.work_item_summary import WorkItemSummary
+from agentpm.core.database.service import DatabaseService
+from agentpm.core.hooks.context_integration import CONTEXT_CONFIG_PATH, ContextHookAdapter
+
+
+class TestEstimateTokens:
+    """Offline tokenizer heuristic."""
+
+    def test_character_and_word_estimates(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("x" * 400) == 100
+        assert estimate_tokens("a b c d e f") == 8  # word floor beats chars / 4
+
+    def test_truncate_text_keeps_preview_and_reference(self):
+        stub = truncate_text("word " * 1000, "apm rules list", 1250)
+
+        assert stub.startswith("word word")
+        assert stub.endswith("[truncated 1250 tokens - see apm rules list]")
+        assert estimate_tokens(stub) < 80
+
+
+class TestPacker:
+    """Greedy packing into a token budget."""
+
+    def test_everything_fits(self):
+        packed = ContextBudgetPacker(1000).pack([
+            PayloadSection('a', 10, "x" * 400),
+            PayloadSection('b', 5, "y" * 400),
+        ])
+
+        assert packed.status == {'a': 'full', 'b': 'full'}
+        assert packed.stats['tokens_before'] == packed.stats['tokens_after'] == 200
+        assert packed.stats['stubbed'] == packed.stats['dropped'] == []
+
+    def test_density_order_stubs_and_drops(self):
+        packed = ContextBudgetPacker(300).pack([
+            PayloadSection('task', 100, "t" * 400, required=True),            # 100 tokens
+            PayloadSection('sop', 90, "s" * 2000, 'apm agents show dev', stub="sop preview"),  # 500
+            PayloadSection('fact', 20, "f" * 200),                             # 50, dense
+            PayloadSection('summary', 30, "m" * 400, stub="m" * 400),          # 100, stub too big
+            PayloadSection('paths', 10, "p" * 80),                             # 20
+        ])
+
+        assert packed.status == {'task': 'full', 'fact': 'full', 'paths': 'full', 'summary': 'full', 'sop': 'stub'}
+        assert packed.value('sop') == "sop preview"
+        assert packed.stats['tokens_after'] <= 300
+        assert packed.stats['sections']['sop'] == {
+            'priority': 90, 'tokens': 500, 'packed_tokens': 3, 'status': 'stub', 'reference': 'apm agents show dev'
+        }
+
+    def test_dropped_when_stub_does_not_fit(self):
+        packed = ContextBudgetPacker(120).pack([
+            PayloadSection('task', 100, "t" * 400, required=True),
+            PayloadSection('sop', 90, "s" * 2000, stub="s" * 200),
+            PayloadSection('rules', 50, "r" * 200),
+        ])
+
+        assert packed.status['sop'] == 'dropped'
+        assert packed.status['rules'] == 'dropped'
+        assert packed.value('sop') is None
+        assert packed.stats['dropped'] == ['sop', 'rules']
+
+    def test_leftover_budget_widens_stub(self):
+        sop = "Follow the three-layer pattern. " * 500
+
+        def truncate(tokens):
+            return truncate_text(sop, "apm agents show dev", 4000, preview_tokens=tokens)
+
+        packed = ContextBudgetPacker(1000).pack([
+            PayloadSection('sop', 90, sop, stub=truncate(48), truncate=truncate),
+        ])
+
+        assert packed.status['sop'] == 'stub'
+        assert 900 < packed.stats['tokens_after'] <= 1000
+        assert packed.value('sop').endswith("see apm agents show dev]")
+
+    def test_required_sections_kept_over_budget(self):
+        packed = ContextBudgetPacker(10).pack([PayloadSection('task', 100, "t" * 400, required=True)])
+
+        assert packed.status['task'] == 'full'
+        assert packed.stats['over_budget']
+
+    def test_pluggable_tokenizer(self):
+        def characters(text):
+            return len(text)
+
+        packed = ContextBudgetPacker(150, tokenizer=characters).pack([
+            PayloadSection('a', 10, "x" * 100),
+            PayloadSection('b', 10, "y" * 100),
+        ])
+
+        assert packed.stats['tokenizer'] == 'characters'
+        assert packed.stats['tokens_after'] == 100
+
+
+@pytest.fixture
+def task_env(tmp_path):
+    db = DatabaseService(str(tmp_path / "budget.db"))
+    with db.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'Budget', ?)", (str(tmp_path),))
+        conn.execute(
+            "INSERT INTO work_items (id, project_id, name, type, status, priority) "
+            "VALUES (1, 1, 'Large feature', 'feature', 'active', 1)"
+        )
+        conn.execute(
+            "INSERT INTO tasks (id, work_item_id, name, type, status, priority, effort_hours) "
+            "VALUES (1, 1, 'Implement', 'implementation', 'active', 2, 3.0)"
+        )
+        conn.commit()
+    for day in range(1, 4):
+        work_item_summaries.create_summary(db, WorkItemSummary(
+            work_item_id=1, session_date=f"2025-01-0{day}", summary_type='session',
+            summary_text=f"Session {day}: " + "implemented parsing and refactored the loader. " * 200,
+            context_metadata={'decisions': ["use a generator"] * 50},
+        ))
+
+    sop_dir = tmp_path / '.claude' / 'agents'
+    sop_dir.mkdir(parents=True)
+    (sop_dir / 'python-developer.md').write_text("# Python Developer SOP\n\n" + "Follow the three-layer pattern. " * 1500)
+    return db, tmp_path, 1
+
+
+class TestAssemblyPacking:
+    """ContextAssemblyService fits task payloads into the budget."""
+
+    def test_payload_packed_into_budget(self, task_env):
+        db, project_path, task_id = task_env
+
+        payload = ContextAssemblyService(db, project_path, token_budget=2000).assemble_task_context(
+            task_id, agent_role='python-developer'
+        )
+        stats = payload.packing_stats
+
+        assert stats['token_budget'] == 2000
+        assert stats['tokens_before'] > 15000
+        assert stats['tokens_after'] <= 2000
+        assert stats['sections']['agent_sop']['status'] == 'stub'
+        assert payload.agent_sop.endswith("see apm agents show python-developer]")
+        assert len(payload.temporal_context) + len([n for n in stats['dropped'] if n.startswith('temporal')]) == 3
+        for summary in payload.temporal_context:
+            if summary.get('truncated'):
+                assert f"work_item_summaries #{summary['id']}" in summary['summary_text']
+        assert any("token budget" in warning for warning in payload.warnings)
+
+    def test_unbudgeted_by_default(self, task_env):
+        db, project_path, task_id = task_env
+
+        payload = ContextAssemblyService(db, project_path).assemble_task_context(task_id, agent_role='python-developer')
+
+        assert payload.packing_stats == {}
+        assert len(payload.agent_sop) > 40000
+
+    def test_per_call_budget_can_disable_packing(self, task_env):
+        db, project_path, task_id = task_env
+        service = ContextAssemblyService(db, project_path, token_budget=2000)
+
+        assert service.assemble_task_context(task_id, agent_role='python-developer', token_budget=0).packing_stats == {}
+        assert service.assemble_task_context(task_id, agent_role='python-developer').packing_stats['token_budget'] == 2000
+        with pytest.raises(ValueError):
+            service.assemble_task_context(task_id, token_budget=-1)
+
+    def test_budget_override_and_unbudgeted(self, task_env):
+        db, project_path, task_id = task_env
+        service = ContextAssemblyService(db, project_path, token_budget=None)
+
+        unbudgeted = service.assemble_task_context(task_id, agent_role='python-developer')
+        generous = service.assemble_task_context(task_id, agent_role='python-developer', token_budget=100_000)
+
+        assert unbudgeted.packing_stats == {}
+        assert len(unbudgeted.agent_sop) > 40000
+        assert generous.agent_sop == unbudgeted.agent_sop
+        assert generous.packing_stats['stubbed'] == generous.packing_stats['dropped'] == []
+        assert generous.packing_stats['tokens_after'] == generous.packing_stats['tokens_before']
+
+
+class TestHookBudget:
+    """Hooks pack task context into the project's token budget."""
+
+    @staticmethod
+    def _hook_output(task_env, setting=None):
+        db, project_path, task_id = task_env
+        if setting is not None:
+            config = project_path / CONTEXT_CONFIG_PATH
+            config.parent.mkdir(exist_ok=True)
+            config.write_text(json.dumps({"token_budget": setting}))
+        adapter = ContextHookAdapter(project_path)
+        adapter.db_path = project_path / "budget.db"
+        return adapter, adapter.format_task_context(task_id, agent_role='python-developer')
+
+    def test_default_budget(self, task_env):
+        adapter, _ = self._hook_output(task_env)
+
+        assert adapter.token_budget == DEFAULT_TOKEN_BUDGET
+        assert adapter.assembly_service.token_budget == DEFAULT_TOKEN_BUDGET
+
+    def test_output_respects_project_budget(self, task_env):
+        _, unpacked = self._hook_output(task_env, setting=0)
+        adapter, packed = self._hook_output(task_env, setting=1500)
+
+        assert adapter.token_budget == 1500
+        assert estimate_tokens(packed) < 2000 < estimate_tokens(unpacked)
+        assert "see work_item_summaries #" in packed and "see work_item_summaries #" not in unpacked
@@ -0,0 +1,177 @@
+"""
+Tests for Agent Loader batch loading
+
+Tests parallel parsing, the content-hash cache, the single-transaction
+upsert and the added/changed/unchanged diff against a real database.
+"""
+
+import pytest
+
+from agentpm.core.agents.loader import AgentLoader
+from agentpm.core.database import DatabaseService
+
+
+AGENT_YAML = """
+role: {role}
+display_name: {name}
+description: Agent used by loader tests
+tier: 1
+category: sub-agent
+sop_content: "You are a test agent."
+capabilities:
+  - testing
+"""
+
+
+@pytest.fixture
+def db(tmp_path):
+    service = DatabaseService(str(tmp_path / "test.db"))
+    with service.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'Test', ?)", (str(tmp_path),))
+        conn.commit()
+    return service
+
+
+@pytest.fixture
+def definitions(tmp_path):
+    directory = tmp_path / "agents"
+    (directory / "nested").mkdir(parents=True)
+    for i in range(6):
+        subdir = directory / "nested" if i % 2 else directory
+        (subdir / f"agent-{i}.yaml").write_text(AGENT_YAML.format(role=f"agent-{i}", name=f"Agent {i}"))
+    return directory
+
+
+def _agents(db):
+    with db.connect() as conn:
+        return {row['role']: dict(row) for row in conn.execute("SELECT * FROM agents WHERE project_id = 1")}
+
+
+class TestBatchLoad:
+    """load_all writes the diff in one transaction"""
+
+    @pytest.mark.parametrize('max_workers', [None, 1])
+    def test_initial_load_adds_everything(self, db, definitions, max_workers):
+        result = AgentLoader(db, project_id=1).load_all(definitions, max_workers=max_workers)
+
+        assert result.success
+        assert result.loaded_count == 6
+        assert sorted(result.added) == [f"agent-{i}" for i in range(6)]
+        assert result.changed == result.unchanged == []
+        assert len(_agents(db)) == 6
+
+    def test_reload_reports_changed_and_unchanged(self, db, definitions):
+        loader = AgentLoader(db, project_id=1)
+        loader.load_all(definitions)
+        before = _agents(db)
+
+        (definitions / "agent-0.yaml").write_text(AGENT_YAML.format(role="agent-0", name="Renamed"))
+        (definitions / "agent-9.yaml").write_text(AGENT_YAML.format(role="agent-9", name="Agent 9"))
+        result = loader.load_all(definitions, force=True)
+        after = _agents(db)
+
+        assert result.success
+        assert (result.added, result.changed) == (["agent-9"], ["agent-0"])
+        assert len(result.unchanged) == 5
+        assert result.loaded_count == 2
+        assert after["agent-0"]["display_name"] == "Renamed"
+        assert after["agent-0"]["id"] == before["agent-0"]["id"]  # updated in place
+        assert after["agent-1"] == before["agent-1"]  # unchanged rows untouched
+
+    def test_changed_agents_conflict_without_force(self, db, definitions):
+        loader = AgentLoader(db, project_id=1)
+        loader.load_all(definitions)
+
+        (definitions / "agent-0.yaml").write_text(AGENT_YAML.format(role="agent-0", name="Renamed"))
+        result = loader.load_all(definitions)
+
+        assert not result.success
+        assert list(result.conflicts) == ["agent-0"]
+        assert _agents(db)["agent-0"]["display_name"] == "Agent 0"
+
+    def test_unchanged_reload_is_a_no_op(self, db, definitions):
+        loader = AgentLoader(db, project_id=1)
+        loader.load_all(definitions)
+
+        result = loader.load_all(definitions)
+
+        assert result.success
+        assert result.loaded_count == 0
+        assert len(result.unchanged) == 6
+
+    def test_failed_write_rolls_back_batch(self, db, definitions, monkeypatch):
+        values = AgentLoader._agent_values
+
+        def broken(agent):  # display_name is NOT NULL
+            row = values(agent)
+            return dict(row, display_name=None) if agent.role == "agent-5" else row
+
+        monkeypatch.setattr(AgentLoader, '_agent_values', staticmethod(broken))
+
+        result = AgentLoader(db, project_id=1).load_all(definitions)
+
+        assert not result.success
+        assert result.loaded_count == 0
+        assert _agents(db) == {}
+
+    def test_dry_run_previews_diff(self, db, definitions):
+        result = AgentLoader(db, project_id=1).load_all(definitions, dry_run=True)
+
+        assert result.success
+        assert len(result.added) == len(result.agents) == 6
+        assert _agents(db) == {}
+
+
+class TestDefinitionCache:
+    """Unchanged YAML skips parsing and validation"""
+
+    def test_unchanged_files_not_revalidated(self, db, definitions, monkeypatch):
+        loader = AgentLoader(db, project_id=1)
+        loader.load_all(definitions)
+        calls = []
+        validate = AgentLoader._validate_yaml
+        monkeypatch.setattr(AgentLoader, '_validate_yaml', lambda self, *args: calls.append(1) or validate(self, *args))
+
+        (definitions / "agent-0.yaml").write_text(AGENT_YAML.format(role="agent-0", name="Edited"))
+        loader.load_all(definitions, force=True)
+
+        assert len(calls) == 1
+
+    def test_cached_agents_are_copies(self, db, definitions):
+        loader = AgentLoader(db, project_id=1)
+        first = loader.load_all(definitions, dry_run=True)
+        first.agents[0].display_name = "Mutated by caller"
+
+        second = loader.load_all(definitions, dry_run=True)
+
+        assert second.agents[0].display_name == "Agent 0"
+        assert second.agents[0] is not first.agents[0]
+
+    def test_errors_reported_per_file(self, db, definitions):
+        (definitions / "broken.yaml").write_text("role: broken\ntier: 7\n")
+
+        result = AgentLoader(db, project_id=1).load_all(definitions)
+
+        assert not result.success
+        assert result.errors[0].startswith("broken.yaml: Agent 1: Validation failed")
+        assert _agents(db) == {}
+
+
+class TestSingleFile:
+    """load_from_yaml rejects repeated roles unless forced"""
+
+    def test_repeated_role_conflicts_without_force(self, db, tmp_path):
+        path = tmp_path / "team.yaml"
+        first = AGENT_YAML.format(role="twin", name="First").strip().replace("\n", "\n    ")
+        second = AGENT_YAML.format(role="twin", name="Second").strip().replace("\n", "\n    ")
+        path.write_text(f"agents:\n  - {first}\n  - {second}\n")
+        loader = AgentLoader(db, project_id=1)
+
+        result = loader.load_from_yaml(path)
+
+        assert not result.success
+        assert result.conflicts == {"twin": ["Role defined 2 times in file"]}
+        assert _agents(db) == {}
+
+        assert loader.load_from_yaml(path, force=True).success
+        assert _agents(db)["twin"]["display_name"] == "Second"
@@ -0,0 +1,279 @@
+"""
+Unit tests for the content-addressed blob store (Migration 0052).
+
+Covers:
+- Codec selection and round-tripping (none/zlib/lzma)
+- put_blob deduplication and trigger-maintained reference counts
+- Transparent read-through for documents, memory files and checkpoints
+- Garbage collection of unreferenced blobs
+"""
+
+import pytest
+
+from agentpm.core.database.methods import content_blobs
+from agentpm.core.database.methods import document_references as doc_methods
+from agentpm.core.database.methods import memory_methods
+from agentpm.core.database.models import DocumentReference
+from agentpm.core.database.models.memory import MemoryFile, MemoryFileType
+from agentpm.core.database.enums import EntityType, DocumentType, DocumentFormat
+from agentpm.core.database.utils.blob_codec import (
+    CODEC_LZMA,
+    CODEC_NONE,
+    CODEC_ZLIB,
+    LZMA_THRESHOLD_BYTES,
+    compute_blob_key,
+    decode_blob,
+    encode_blob,
+)
+
+
+def _blob_row(db_service, key):
+    with db_service.connect() as conn:
+        row = conn.execute(
+            "SELECT codec, raw_size, stored_size, ref_count FROM content_blobs WHERE blob_key = ?",
+            (key,)
+        ).fetchone()
+    return dict(row) if row else None
+
+
+@pytest.fixture
+def create_document(db_service, work_item):
+    """Factory creating work item documents with content."""
+    def _create(content, name="design"):
+        doc = DocumentReference(
+            entity_type=EntityType.WORK_ITEM,
+            entity_id=work_item.id,
+            file_path=f"docs/architecture/design_doc/{name}.md",
+            category="architecture",
+            document_type=DocumentType.DESIGN_DOC,
+            filename=f"{name}.md",
+            title=name.title(),
+            format=DocumentFormat.MARKDOWN,
+            created_by="architect"
+        )
+        return doc_methods.create_document_with_content(db_service, doc, content)
+    return _create
+
+
+class TestBlobCodec:
+    """Test codec selection and round-tripping."""
+
+    def test_small_content_is_stored_uncompressed(self):
+        codec, payload = encode_blob(b"short")
+
+        assert codec == CODEC_NONE
+        assert payload == b"short"
+
+    def test_repetitive_content_uses_zlib(self):
+        raw = b"# Heading\n\nSame paragraph again.\n" * 100
+
+        codec, payload = encode_blob(raw)
+
+        assert codec == CODEC_ZLIB
+        assert len(payload) < len(raw)
+        assert decode_blob(codec, payload) == raw
+
+    def test_large_content_tries_lzma(self):
+        raw = b"".join(
+            f"- item {i}: status=active phase=I1\n".encode() for i in range(LZMA_THRESHOLD_BYTES // 20)
+        )
+
+        codec, payload = encode_blob(raw)
+
+        assert codec in (CODEC_ZLIB, CODEC_LZMA)
+        assert decode_blob(codec, payload) == raw
+
+    def test_forced_codec_round_trips(self):
+        for codec in (CODEC_NONE, CODEC_ZLIB, CODEC_LZMA):
+            stored_codec, payload = encode_blob(b"content" * 50, codec=codec)
+            assert stored_codec == codec
+            assert decode_blob(stored_codec, payload) == b"content" * 50
+
+    def test_unknown_codec_rejected(self):
+        with pytest.raises(ValueError):
+            encode_blob(b"x", codec="brotli")
+
+    def test_key_matches_sha256_of_utf8(self):
+        import hashlib
+
+        text = "Résumé ✓"
+        assert compute_blob_key(text) == hashlib.sha256(text.encode("utf-8")).hexdigest()
+        assert compute_blob_key(text) == compute_blob_key(text.encode("utf-8"))
+
+
+class TestPutBlob:
+    """Test blob storage, deduplication and reference counting."""
+
+    def test_put_is_idempotent(self, db_service):
+        with db_service.transaction() as conn:
+            first = content_blobs.put_blob(conn, "same content")
+            second = content_blobs.put_blob(conn, "same content")
+
+        assert first == second
+        with db_service.connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM content_blobs").fetchone()[0]
+        assert count == 1
+
+    def test_get_blob_text_round_trips(self, db_service):
+        content = "# Doc\n\n" + "paragraph text\n" * 200
+        with db_service.transaction() as conn:
+            key = content_blobs.put_blob(conn, content)
+
+        assert content_blobs.read_blob_text(db_service, key) == content
+        assert content_blobs.read_blob_text(db_service, None) is None
+        assert content_blobs.read_blob_text(db_service, "0" * 64) is None
+
+    def test_identical_documents_share_one_blob(self, db_service, create_document):
+        content = "# Shared\n\n" + "identical body\n" * 100
+
+        first = create_document(content, name="first")
+        second = create_document(content, name="second")
+
+        assert first.content_blob_key == second.content_blob_key
+        blob = _blob_row(db_service, first.content_blob_key)
+        assert blob['ref_count'] == 2
+        assert blob['stored_size'] < blob['raw_size']
+
+    def test_content_update_moves_reference(self, db_service, create_document):
+        doc = create_document("# Version 1\n\nOriginal text")
+        old_key = doc.content_blob_key
+
+        updated = doc_methods.update_document_content(db_service, doc.id, "# Version 2\n\nNew text")
+
+        assert updated.content == "# Version 2\n\nNew text"
+        assert updated.content_blob_key != old_key
+        assert _blob_row(db_service, old_key) is None  # last reference released
+        assert _blob_row(db_service, updated.content_blob_key)['ref_count'] == 1
+
+    def test_metadata_update_keeps_reference(self, db_service, create_document):
+        doc = create_document("# Stable\n\nUnchanged content")
+
+        doc.description = "Only metadata changed"
+        updated = doc_methods.update_document_reference(db_service, doc)
+
+        assert updated.content_blob_key == doc.content_blob_key
+        assert _blob_row(db_service, doc.content_blob_key)['ref_count'] == 1
+
+    def test_delete_releases_blob(self, db_service, create_document):
+        doc = create_document("# Temporary\n\nSoon gone")
+
+        doc_methods.delete_document_reference(db_service, doc.id)
+
+        assert _blob_row(db_service, doc.content_blob_key) is None
+
+    def test_collect_garbage_removes_unreferenced(self, db_service, create_document):
+        doc = create_document("# Kept\n\nReferenced content")
+        with db_service.transaction() as conn:
+            orphan = content_blobs.put_blob(conn, "never referenced")
+
+        removed = content_blobs.collect_garbage(db_service)
+
+        assert removed == 1
+        assert _blob_row(db_service, orphan) is None
+        assert _blob_row(db_service, doc.content_blob_key) is not None
+
+
+class TestReadThrough:
+    """Test adapters decode blob content transparently."""
+
+    def test_document_content_not_stored_inline(self, db_service, create_document):
+        content = "# Inline?\n\nNo - stored as a blob"
+        doc = create_document(content)
+
+        with db_service.connect() as conn:
+            inline = conn.execute(
+                "SELECT content FROM document_references WHERE id = ?", (doc.id,)
+            ).fetchone()[0]
+
+        assert inline is None
+        assert doc_methods.get_document_reference(db_service, doc.id).content == content
+        assert doc_methods.get_document_content(db_service, doc.id) == content
+
+    def test_document_list_and_search_read_through(self, db_service, create_document, work_item):
+        create_document("# Blob Store\n\nContent addressed storage", name="blobs")
+
+        listed = doc_methods.list_document_references(
+            db_service, entity_type=EntityType.WORK_ITEM, entity_id=work_item.id
+        )
+        found = doc_methods.search_document_content(db_service, "addressed")
+
+        assert listed[0].content == "# Blob Store\n\nContent addressed storage"
+        assert found and found[0].content == listed[0].content
+
+    def test_legacy_inline_content_still_readable(self, db_service, create_document):
+        doc = create_document("# Placeholder")
+        with db_service.transaction() as conn:
+            conn.execute(
+                "UPDATE document_references SET content_blob_key = NULL, content = ? WHERE id = ?",
+                ("# Legacy inline", doc.id)
+            )
+
+        assert doc_methods.get_document_reference(db_service, doc.id).content == "# Legacy inline"
+
+    def test_memory_file_content_read_through(self, db_service, project):
+        memory = MemoryFile(
+            project_id=project.id,
+            file_type=MemoryFileType.RULES,
+            file_path=".claude/RULES.md",
+            content="# Rules\n\n" + "- rule\n" * 50,
+            generated_by="memory-generator",
+            generated_at="2025-10-21T10:00:00"
+        )
+
+        created = memory_methods.create_memory_file(db_service, memory)
+        loaded = memory_methods.get_memory_file_by_type(db_service, project.id, MemoryFileType.RULES)
+
+        assert loaded.content == memory.content
+        assert loaded.content_blob_key == compute_blob_key(memory.content)
+
+        updated = memory_methods.update_memory_file(db_service, created.id, {'content': '# Rules v2'})
+
+        assert updated.content == '# Rules v2'
+        assert _blob_row(db_service, created.content_blob_key) is None
+
+    def test_checkpoint_snapshots_read_through(self, db_service, project):
+        from agentpm.providers.anthropic.claude_code.runtime.checkpoints import methods as checkpoint_methods
+        from agentpm.providers.anthropic.claude_code.runtime.checkpoints.models import SessionCheckpoint
+
+        with db_service.transaction() as conn:
+            session_id = conn.execute(
+                "INSERT INTO sessions (session_id, project_id, tool_name, start_time) "
+                "VALUES ('blob-session', ?, 'claude-code', CURRENT_TIMESTAMP)",
+                (project.id,)
+            ).lastrowid
+
+        def _checkpoint(name):
+            return SessionCheckpoint(
+                session_id=session_id,
+                checkpoint_name=name,
+                work_items_snapshot=[{"id": 1, "status": "active"}],
+                tasks_snapshot=[{"id": 2, "status": "draft"}],
+                context_snapshot={"phase": "I1_implementation"}
+            )
+
+        first = checkpoint_methods.create_checkpoint(db_service, _checkpoint("first"))
+        second = checkpoint_methods.create_checkpoint(db_service, _checkpoint("second"))
+        loaded = checkpoint_methods.get_checkpoint(db_service, first.id)
+
+        assert first.snapshot_blob_key == second.snapshot_blob_key  # identical state deduplicated
+        assert _blob_row(db_service, first.snapshot_blob_key)['ref_count'] == 2
+        assert loaded.work_items_snapshot == [{"id": 1, "status": "active"}]
+        assert loaded.context_snapshot == {"phase": "I1_implementation"}
+        assert checkpoint_methods.get_latest_checkpoint(db_service, session_id).tasks_snapshot == [
+            {"id": 2, "status": "draft"}
+        ]
+
+
+class TestBlobStats:
+    """Test get_blob_stats summary."""
+
+    def test_stats_report_sizes_and_codecs(self, db_service, create_document):
+        create_document("# Stats\n\n" + "repeated line\n" * 200)
+
+        stats = content_blobs.get_blob_stats(db_service)
+
+        assert stats['blob_count'] == 1
+        assert stats['references'] == 1
+        assert stats['stored_bytes'] < stats['raw_bytes']
+        assert stats['compression_ratio'] < 1.0
+        assert stats['codecs'] == {CODEC_ZLIB: 1}
@@ -0,0 +1,213 @@
+"""
+Unit tests for the bulk project tree loader (methods/project_tree.py).
+
+Covers:
+- Parity with list_work_items() + list_tasks(work_item_id=...) per work item
+- Work item and task status filters, project scoping
+- Nested task dependencies, blockers and work item dependencies
+- Column projection
+- Fixed query count regardless of tree size
+"""
+
+import pytest
+
+from agentpm.core.database.enums import TaskStatus, WorkItemStatus
+from agentpm.core.database.methods import project_tree
+from agentpm.core.database.methods import tasks as task_methods
+from agentpm.core.database.methods import work_items as wi_methods
+
+
+# (name, status, priority, [(task name, task status, priority)])
+TREE = [
+    ("Checkout", "active", 1, [("Design", "done", 2), ("Build", "active", 1), ("Test", "ready", 3)]),
+    ("Search", "review", 2, [("Index", "review", 1)]),
+    ("Billing", "draft", 3, []),
+    ("Reports", "active", 2, [("Query", "blocked", 2), ("Export", "active", 2)]),
+]
+
+
+@pytest.fixture
+def tree_db(db_service, project):
+    """Project with work items, tasks, dependencies and blockers."""
+    ids = {}
+    with db_service.connect() as conn:
+        for wi_name, wi_status, wi_priority, tasks in TREE:
+            cursor = conn.execute(
+                "INSERT INTO work_items (project_id, name, type, status, priority) VALUES (?, ?, 'feature', ?, ?)",
+                (project.id, wi_name, wi_status, wi_priority)
+            )
+            ids[wi_name] = cursor.lastrowid
+            for task_name, task_status, task_priority in tasks:
+                cursor = conn.execute(
+                    "INSERT INTO tasks (work_item_id, name, type, status, priority, effort_hours) "
+                    "VALUES (?, ?, 'implementation', ?, ?, 2.5)",
+                    (ids[wi_name], task_name, task_status, task_priority)
+                )
+                ids[task_name] = cursor.lastrowid
+
+        conn.execute(
+            "INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (?, ?)",
+            (ids["Build"], ids["Design"])
+        )
+        conn.execute(
+            "INSERT INTO task_blockers (task_id, blocker_type, blocker_description) VALUES (?, 'external', 'Awaiting API key')",
+            (ids["Query"],)
+        )
+        conn.execute(
+            "INSERT INTO task_blockers (task_id, blocker_type, blocker_task_id, is_resolved) VALUES (?, 'task', ?, 1)",
+            (ids["Export"], ids["Query"])
+        )
+        conn.execute(
+            "INSERT INTO work_item_dependencies (work_item_id, depends_on_work_item_id) VALUES (?, ?)",
+            (ids["Reports"], ids["Checkout"])
+        )
+
+        # Second project that must not leak into scoped loads
+        other = conn.execute("INSERT INTO projects (name, path) VALUES ('Other', '/other')").lastrowid
+        other_wi = conn.execute(
+            "INSERT INTO work_items (project_id, name, type, status) VALUES (?, 'Elsewhere', 'feature', 'active')",
+            (other,)
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO tasks (work_item_id, name, type, status) VALUES (?, 'Foreign', 'implementation', 'active')",
+            (other_wi,)
+        )
+        conn.commit()
+    return ids
+
+
+def _count_queries(monkeypatch, db_service):
+    """Count SELECT statements issued through db_service.connect()."""
+    statements = []
+    original = db_service.connect.__func__
+
+    def connect(self):
+        context = original(self)
+        conn = context.__enter__()
+        conn.set_trace_callback(
+            lambda sql: statements.append(sql) if sql.lstrip().upper().startswith("SELECT") else None
+        )
+
+        class _Context:
+            def __enter__(self_inner):
+                return conn
+
+            def __exit__(self_inner, *exc):
+                return context.__exit__(*exc)
+
+        return _Context()
+
+    monkeypatch.setattr(type(db_service), "connect", connect)
+    return statements
+
+
+class TestLoadProjectTree:
+    """Test load_project_tree results."""
+
+    def test_matches_per_work_item_queries(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(db_service, project_id=project.id)
+
+        expected = wi_methods.list_work_items(db_service, project_id=project.id)
+        assert [node.work_item for node in tree.work_items] == expected
+        for node in tree.work_items:
+            assert [t.task for t in node.tasks] == task_methods.list_tasks(
+                db_service, work_item_id=node.work_item.id
+            )
+
+    def test_work_item_status_filter(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(
+            db_service, project_id=project.id, statuses=[WorkItemStatus.ACTIVE, "review"]
+        )
+
+        assert [node.work_item.name for node in tree.work_items] == ["Checkout", "Search", "Reports"]
+        assert [wi.name for wi in tree.work_items_with_status(WorkItemStatus.REVIEW, WorkItemStatus.ACTIVE)] == [
+            "Search", "Checkout", "Reports"
+        ]
+
+    def test_task_status_filter(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(
+            db_service, project_id=project.id, task_statuses=[TaskStatus.ACTIVE, TaskStatus.REVIEW]
+        )
+
+        assert len(tree.work_items) == len(TREE)
+        assert [t.name for t in tree.all_tasks()] == ["Build", "Index", "Export"]
+        assert tree.get(tree_db["Billing"]).tasks == []
+
+    def test_unscoped_load_covers_all_projects(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(db_service, task_statuses=[TaskStatus.ACTIVE])
+
+        assert "Foreign" in [t.name for t in tree.all_tasks()]
+        assert "Foreign" not in [
+            t.name for t in project_tree.load_project_tree(db_service, project_id=project.id).all_tasks()
+        ]
+
+    def test_nested_relations(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(
+            db_service, project_id=project.id, include=project_tree.INCLUDE_ALL
+        )
+        tasks = {t.task.name: t for node in tree.work_items for t in node.tasks}
+
+        assert [d.depends_on_task_id for d in tasks["Build"].dependencies] == [tree_db["Design"]]
+        assert [b.blocker_description for b in tasks["Query"].unresolved_blockers] == ["Awaiting API key"]
+        assert len(tasks["Export"].blockers) == 1 and tasks["Export"].unresolved_blockers == []
+        assert [d.depends_on_work_item_id for d in tree.get(tree_db["Reports"]).dependencies] == [
+            tree_db["Checkout"]
+        ]
+
+    def test_relations_not_loaded_unless_included(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(db_service, project_id=project.id)
+
+        assert all(not t.dependencies and not t.blockers for node in tree.work_items for t in node.tasks)
+        assert all(not node.dependencies for node in tree.work_items)
+
+    def test_work_items_only(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(db_service, project_id=project.id, include=())
+
+        assert len(tree.work_items) == len(TREE)
+        assert tree.all_tasks() == []
+
+    def test_column_projection(self, db_service, project, tree_db):
+        tree = project_tree.load_project_tree(
+            db_service, project_id=project.id, work_item_columns=(), task_columns=("effort_hours",)
+        )
+        task = tree.get(tree_db["Checkout"]).tasks[0].task
+
+        assert task.name == "Build"
+        assert task.effort_hours == 2.5
+        assert task.created_at is None  # not selected
+
+    def test_invalid_arguments_rejected(self, db_service, project):
+        with pytest.raises(ValueError):
+            project_tree.load_project_tree(db_service, include=("subtasks",))
+        with pytest.raises(ValueError):
+            project_tree.load_project_tree(db_service, task_columns=("name; DROP TABLE tasks",))
+
+
+class TestQueryCount:
+    """Test that the number of queries does not grow with the tree."""
+
+    def test_fixed_query_count(self, db_service, project, tree_db, monkeypatch):
+        statements = _count_queries(monkeypatch, db_service)
+
+        project_tree.load_project_tree(db_service, project_id=project.id, include=project_tree.INCLUDE_ALL)
+
+        assert len(statements) == 5  # work items, tasks, dependencies, blockers, WI dependencies
+
+    def test_query_count_independent_of_size(self, db_service, project, tree_db, monkeypatch):
+        with db_service.connect() as conn:
+            for i in range(50):
+                wi = conn.execute(
+                    "INSERT INTO work_items (project_id, name, type, status) VALUES (?, ?, 'feature', 'active')",
+                    (project.id, f"Bulk {i}")
+                ).lastrowid
+                conn.execute(
+                    "INSERT INTO tasks (work_item_id, name, type, status) VALUES (?, 'Bulk task', 'implementation', 'active')",
+                    (wi,)
+                )
+            conn.commit()
+        statements = _count_queries(monkeypatch, db_service)
+
+        tree = project_tree.load_project_tree(db_service, project_id=project.id)
+
+        assert len(tree.work_items) == len(TREE) + 50
+        assert len(statements) == 2
@@ -0,0 +1,240 @@
+"""
+Unit tests for fast-path row hydration (utils/hydration.py).
+
+Covers:
+- Parity of hydrate='trusted' with validated models for tasks, work items and documents
+- Row views: enum coercion, lazy JSON decoding, column projection, read-only access
+- Argument validation
+- Micro-benchmark of rows/second per mode on 50k tasks (slow)
+"""
+
+import json
+import time
+
+import pytest
+
+from agentpm.core.database.enums import (
+    DocumentType,
+    EntityType,
+    Phase,
+    TaskStatus,
+    TaskType,
+    WorkItemStatus,
+    WorkItemType,
+)
+from agentpm.core.database.methods import document_references as doc_methods
+from agentpm.core.database.methods import tasks as task_methods
+from agentpm.core.database.methods import work_items as wi_methods
+from agentpm.core.database.models import DocumentReference
+from agentpm.core.database.utils import hydration
+
+
+@pytest.fixture
+def populated(db_service, project):
+    """Work items and tasks covering NULLs, JSON metadata and continuous types."""
+    with db_service.connect() as conn:
+        feature = conn.execute(
+            "INSERT INTO work_items (project_id, name, type, status, priority, phase, metadata, due_date) "
+            "VALUES (?, 'Checkout', 'feature', 'active', 1, 'I1_implementation', '{\"owner\": \"team-a\"}', "
+            "'2025-03-01T09:30:00')",
+            (project.id,)
+        ).lastrowid
+        conn.execute(
+            "INSERT INTO work_items (project_id, name, type, status, priority) "
+            "VALUES (?, 'Upkeep', 'maintenance', 'draft', 3)",
+            (project.id,)
+        )
+        conn.execute(
+            "INSERT INTO tasks (work_item_id, name, type, status, priority, effort_hours, quality_metadata, assigned_to) "
+            "VALUES (?, 'Build', 'implementation', 'active', 1, 3, ?, 'python-developer')",
+            (feature, json.dumps({"acceptance_criteria": ["works"], "tests_passing": True}))
+        )
+        conn.execute(
+            "INSERT INTO tasks (work_item_id, name, type, status, priority, quality_metadata) "
+            "VALUES (?, 'Review', 'review', 'draft', 2, '{}')",
+            (feature,)
+        )
+        conn.execute(
+            "INSERT INTO tasks (work_item_id, name, type, status, priority, due_date) "
+            "VALUES (?, 'Document', 'documentation', 'done', 4, '2025-04-01 12:00:00')",
+            (feature,)
+        )
+        conn.commit()
+    return feature
+
+
+@pytest.fixture
+def documents(db_service, work_item):
+    """Document references with tags and inline content."""
+    for name, tags in (("design", ["api", "checkout"]), ("notes", [])):
+        doc_methods.create_document_reference(db_service, DocumentReference(
+            entity_type=EntityType.WORK_ITEM,
+            entity_id=work_item.id,
+            file_path=f"docs/architecture/design/{name}.md",
+            category="architecture",
+            document_type=DocumentType.DESIGN_DOC,
+            title=name.title(),
+            tags=tags,
+            content=f"# {name}\n\nBody",
+        ))
+
+
+class TestTrustedParity:
+    """hydrate='trusted' must produce the same models as validated hydration."""
+
+    def test_tasks(self, db_service, populated):
+        validated = task_methods.list_tasks(db_service)
+        trusted = task_methods.list_tasks(db_service, hydrate='trusted')
+
+        assert len(trusted) == 3
+        assert trusted == validated
+        assert [t.model_dump() for t in trusted] == [t.model_dump() for t in validated]
+
+    def test_work_items(self, db_service, project, populated):
+        validated = wi_methods.list_work_items(db_service, project_id=project.id)
+        trusted = wi_methods.list_work_items(db_service, project_id=project.id, hydrate='trusted')
+
+        assert trusted == validated
+        upkeep = next(wi for wi in trusted if wi.name == "Upkeep")
+        assert upkeep.is_continuous is True  # enforced by the model validator on the checked path
+
+    def test_documents(self, db_service, documents):
+        validated = doc_methods.list_document_references(db_service)
+        trusted = doc_methods.list_document_references(db_service, hydrate='trusted')
+
+        assert trusted == validated
+        assert trusted[0].content.startswith("# ")
+
+    def test_filters_apply(self, db_service, populated):
+        trusted = task_methods.list_tasks(db_service, status=TaskStatus.ACTIVE, hydrate='trusted')
+
+        assert [t.name for t in trusted] == ["Build"]
+        assert trusted[0].type is TaskType.IMPLEMENTATION
+
+
+class TestRowViews:
+    """hydrate='view' returns lightweight read-only rows."""
+
+    def test_task_views_match_models(self, db_service, populated):
+        models = task_methods.list_tasks(db_service)
+        views = task_methods.list_tasks(db_service, hydrate='view')
+
+        assert [v.id for v in views] == [m.id for m in models]
+        assert [v.status for v in views] == [m.status for m in models]
+        assert views[0].quality_metadata == models[0].quality_metadata
+        assert views[0].type is TaskType.IMPLEMENTATION
+
+    def test_json_decoded_lazily(self, db_service, populated):
+        view = task_methods.list_tasks(db_service, status=TaskStatus.ACTIVE, hydrate='view')[0]
+
+        with pytest.raises(AttributeError):
+            view._json_quality_metadata  # not decoded yet
+        assert view.quality_metadata["tests_passing"] is True
+        assert view._json_quality_metadata is view.quality_metadata
+
+    def test_projection(self, db_service, project, populated):
+        views = wi_methods.list_work_items(
+            db_service, project_id=project.id, hydrate='view', columns=('name', 'status', 'phase')
+        )
+
+        assert [v.name for v in views] == ["Checkout", "Upkeep"]
+        assert views[0].to_dict() == {
+            "id": populated, "name": "Checkout", "status": WorkItemStatus.ACTIVE,
+            "phase": Phase.I1_IMPLEMENTATION,
+        }
+        assert views[0].get("metadata") is None
+        with pytest.raises(AttributeError):
+            views[0].metadata
+
+    def test_views_are_slotted_and_read_only(self, db_service, populated):
+        view = task_methods.list_tasks(db_service, hydrate='view')[0]
+
+        assert not hasattr(view, '__dict__')
+        with pytest.raises(AttributeError):
+            view.name = "Renamed"
+
+    def test_document_views_exclude_content(self, db_service, documents):
+        views = doc_methods.list_document_references(db_service, hydrate='view')
+
+        assert views[0].entity_type is EntityType.WORK_ITEM
+        assert {v.title: v.tags for v in views} == {"Design": ["api", "checkout"], "Notes": None}
+        assert "content" not in views[0].to_dict()
+        projected = doc_methods.list_document_references(db_service, hydrate='view', columns=('title',))
+        assert set(projected[0].to_dict()) == {"id", "title"}
+
+    def test_document_content_cannot_be_projected(self, db_service, documents):
+        # Content is stored in content_blobs; the inline column is always NULL
+        with pytest.raises(ValueError, match="content"):
+            doc_methods.list_document_references(db_service, hydrate='view', columns=('title', 'content'))
+
+    def test_view_class_reused(self, db_service, populated):
+        first = task_methods.list_tasks(db_service, hydrate='view', columns=('name',))
+        second = task_methods.list_tasks(db_service, hydrate='view', columns=('name',))
+
+        assert type(first[0]) is type(second[0])
+        assert first == second
+
+
+class TestArguments:
+    """Invalid hydration arguments are rejected before querying."""
+
+    def test_unknown_mode(self, db_service):
+        with pytest.raises(ValueError):
+            task_methods.list_tasks(db_service, hydrate='fast')
+
+    def test_projection_requires_views(self, db_service):
+        with pytest.raises(ValueError):
+            task_methods.list_tasks(db_service, hydrate='trusted', columns=('name',))
+
+    def test_invalid_column(self, db_service):
+        with pytest.raises(ValueError):
+            wi_methods.list_work_items(db_service, hydrate='view', columns=("name; DROP TABLE work_items",))
+
+    def test_enum_member_matches_constructor(self):
+        assert hydration.enum_member(WorkItemType, 'feature') is WorkItemType('feature')
+        assert hydration.enum_member(WorkItemType, None, WorkItemType.FEATURE) is WorkItemType.FEATURE
+        with pytest.raises(ValueError):
+            hydration.enum_member(WorkItemType, 'not-a-type')
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+class TestHydrationBenchmark:
+    """Rows/second per hydration mode on 50k tasks."""
+
+    ROWS = 50_000
+
+    def test_rows_per_second(self, db_service, work_item, capsys):
+        with db_service.connect() as conn:
+            conn.executemany(
+                "INSERT INTO tasks (work_item_id, name, type, status, priority, effort_hours, quality_metadata) "
+                "VALUES (?, ?, 'implementation', 'active', ?, 2, ?)",
+                [
+                    (work_item.id, f"Task {i}", i % 5 + 1, json.dumps({"acceptance_criteria": [f"AC {i}"]}))
+                    for i in range(self.ROWS)
+                ]
+            )
+            conn.commit()
+
+        rates = {}
+        for mode, kwargs in (
+            ('model', {}),
+            ('trusted', {'hydrate': 'trusted'}),
+            ('view', {'hydrate': 'view'}),
+            ('view (id, name, status)', {'hydrate': 'view', 'columns': ('name', 'status')}),
+        ):
+            best = float('inf')
+            for _ in range(2):
+                start = time.perf_counter()
+                rows = task_methods.list_tasks(db_service, work_item_id=work_item.id, **kwargs)
+                best = min(best, time.perf_counter() - start)
+            assert len(rows) == self.ROWS
+            rates[mode] = self.ROWS / best
+
+        with capsys.disabled():
+            print()
+            for mode, rate in rates.items():
+                print(f"  {mode:<24} {rate:>12,.0f} rows/s  ({rate / rates['model']:.1f}x)")
+
+        assert rates['trusted'] > rates['model']
+        assert rates['view'] > rates['model']
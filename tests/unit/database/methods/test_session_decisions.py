@@ -0,0 +1,222 @@
+"""
+Tests for the indexed session decision store (Migration 0059).
+
+Covers:
+- create_session / update_session / end_session mirror metadata decisions
+  into session_decisions (appends insert a single row)
+- search_decisions matches the previous parse-every-session implementation
+- get_session_stats SQL aggregates match the previous hydrate-and-count version
+- Backfill of existing sessions and FTS5 mirror maintenance
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agentpm.core.database.adapters.session import SessionAdapter
+from agentpm.core.database.methods import sessions
+from agentpm.core.database.migrations.files import migration_0059_session_decisions as migration
+from agentpm.core.database.models.session import Session, SessionMetadata, SessionStatus, SessionTool, SessionType
+
+
+def legacy_search_decisions(db, project_id, query):
+    """Previous implementation: json.loads every session, substring match in Python"""
+    with db.connect() as conn:
+        rows = conn.execute(
+            "SELECT session_id, metadata FROM sessions WHERE project_id = ? ORDER BY start_time DESC, id DESC",
+            (project_id,)
+        ).fetchall()
+    results = []
+    for row in rows:
+        metadata = json.loads(row['metadata']) if row['metadata'] else {}
+        for decision in metadata.get('decisions_made', []):
+            text = f"{decision.get('decision', '')} {decision.get('rationale', '')}".lower()
+            if query.lower() in text:
+                results.append({'session_id': row['session_id'], **decision})
+    return results
+
+
+def legacy_session_stats(db, project_id, days=30):
+    cutoff = datetime.now() - timedelta(days=days)
+    with db.connect() as conn:
+        rows = conn.execute(
+            "SELECT * FROM sessions WHERE project_id = ? AND start_time >= ?", (project_id, cutoff.isoformat())
+        ).fetchall()
+    loaded = [SessionAdapter.from_db(dict(row)) for row in rows]
+    durations = [s.duration_minutes for s in loaded if s.duration_minutes]
+    tools, types = {}, {}
+    for s in loaded:
+        tools[s.tool_name.value] = tools.get(s.tool_name.value, 0) + 1
+        types[s.session_type.value] = types.get(s.session_type.value, 0) + 1
+    return {
+        'total_sessions': len(loaded),
+        'active_sessions': sum(1 for s in loaded if s.is_active),
+        'avg_duration': round(sum(durations) / len(durations), 1) if durations else 0,
+        'total_duration': sum(durations),
+        'sessions_per_day': round(len(loaded) / days, 2),
+        'tool_distribution': tools,
+        'session_type_distribution': types,
+    }
+
+
+WORDS = "pydantic sqlite schema cache index migration adapter hook rollback fts5 trigram".split()
+
+
+def _populate(db, project_id, count=200, seed=3):
+    rng = random.Random(seed)
+    now = datetime.now()
+    rows = []
+    for i in range(count):
+        decisions = [
+            {'decision': f"Use {rng.choice(WORDS)} for {rng.choice(WORDS)}",
+             'rationale': f"{rng.choice(WORDS).upper()} keeps it simple", 'timestamp': f"2025-01-{i % 28 + 1:02d}"}
+            for _ in range(rng.randrange(0, 4))
+        ]
+        rows.append((
+            f"s-{i}", project_id, 'claude-code', (now - timedelta(days=rng.randrange(0, 45), minutes=i)).isoformat(),
+            rng.choice([None, 0, 30, 95]), rng.choice(['active', 'completed']), rng.choice(['coding', 'review']),
+            rng.choice(['Ada', 'Grace', None]), json.dumps({'decisions_made': decisions}),
+        ))
+    with db.connect() as conn:
+        conn.executemany(
+            "INSERT INTO sessions (session_id, project_id, tool_name, start_time, duration_minutes, status, "
+            "session_type, developer_name, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        for row in conn.execute("SELECT id, project_id, metadata FROM sessions").fetchall():
+            sessions.sync_session_decisions(conn, row[0], row[1], row[2])
+        conn.commit()
+
+
+def _decisions(db):
+    with db.connect() as conn:
+        return [tuple(row) for row in conn.execute(
+            "SELECT id, position, decision, rationale FROM session_decisions ORDER BY session_id, position"
+        )]
+
+
+def _new_session(project_id, decisions):
+    return Session(
+        session_id="session-1", project_id=project_id, tool_name=SessionTool.CLAUDE_CODE_LEGACY,
+        session_type=SessionType.CODING, started_at=(datetime.now() - timedelta(minutes=90)).isoformat(),
+        metadata=SessionMetadata(decisions_made=decisions, decisions=["Keep the CLI thin"]),
+    )
+
+
+class TestDecisionSync:
+    """Session methods keep session_decisions in step with metadata."""
+
+    def test_create_update_end(self, db_service, project):
+        created = sessions.create_session(db_service, _new_session(project.id, [
+            {'decision': "Use Pydantic for models", 'rationale': "Type safety", 'timestamp': "2025-01-01"},
+        ]))
+
+        assert [row[2] for row in _decisions(db_service)] == ["Use Pydantic for models", "Keep the CLI thin"]
+
+        session = sessions.get_session(db_service, created.session_id)
+        session.metadata.decisions.append("Prefer SQL aggregates")
+        sessions.update_session(db_service, session)
+        before = _decisions(db_service)
+
+        assert [row[2] for row in before][-1] == "Prefer SQL aggregates"
+
+        metadata = sessions.get_session(db_service, created.session_id).metadata
+        metadata.decisions_made[0]['rationale'] = "Validation"
+        ended = sessions.end_session(db_service, created.session_id, metadata, "done")
+        after = _decisions(db_service)
+
+        assert ended.status == SessionStatus.COMPLETED
+        assert 85 <= ended.duration_minutes <= 95
+        assert after[0][3] == "Validation"
+        assert len(after) == 3
+
+    def test_append_inserts_single_row(self, db_service, project):
+        created = sessions.create_session(db_service, _new_session(project.id, [{'decision': "First"}]))
+        before = _decisions(db_service)
+
+        session = sessions.get_session(db_service, created.session_id)
+        session.metadata.decisions.append("Second")
+        sessions.update_session(db_service, session)
+        after = _decisions(db_service)
+
+        assert after[:len(before)] == before  # unchanged rows keep their ids
+        assert after[-1][1:3] == (2, "Second")
+
+    def test_delete_cascades_to_search(self, db_service, project):
+        sessions.create_session(db_service, _new_session(project.id, [{'decision': "Use trigram index"}]))
+
+        assert sessions.search_decisions(db_service, project.id, "trigram")
+        sessions.delete_session(db_service, "session-1")
+        assert sessions.search_decisions(db_service, project.id, "trigram") == []
+        assert _decisions(db_service) == []
+
+
+class TestSearchParity:
+    """Indexed search matches the previous implementation."""
+
+    @pytest.mark.parametrize('query', ["pydantic", "SQLITE", "se tri", "keeps it", "cache for", "x", "%", "_", "zzz"])
+    def test_matches_legacy(self, db_service, project, query):
+        _populate(db_service, project.id)
+
+        assert sessions.search_decisions(db_service, project.id, query) == \
+            legacy_search_decisions(db_service, project.id, query)
+
+    def test_limit_and_all_projects(self, db_service, project):
+        _populate(db_service, project.id)
+
+        assert len(sessions.search_decisions(db_service, project.id, "use", limit=5)) == 5
+        assert sessions.search_decisions(db_service, None, "cache") == \
+            legacy_search_decisions(db_service, project.id, "cache")
+
+    def test_query_plan_uses_fts(self, db_service, project):
+        with db_service.connect() as conn:
+            plan = " ".join(row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT d.id FROM session_decisions_fts f "
+                "JOIN session_decisions d ON d.id = f.rowid WHERE f.decision LIKE '%pydantic%'"
+            ))
+
+        assert "VIRTUAL TABLE INDEX" in plan
+        assert "sessions" not in plan.replace("session_decisions", "")
+
+
+class TestSessionStats:
+    """SQL aggregates match the previous per-session computation."""
+
+    def test_matches_legacy(self, db_service, project):
+        _populate(db_service, project.id)
+
+        stats = sessions.get_session_stats(db_service, project.id, days=30)
+        legacy = legacy_session_stats(db_service, project.id, days=30)
+
+        assert {key: stats[key] for key in legacy} == legacy
+        assert sum(s['sessions'] for s in stats['developer_stats'].values()) == legacy['total_sessions']
+        assert set(stats['developer_stats']) <= {'Ada', 'Grace', 'unknown'}
+        assert stats['session_type_stats'].keys() == legacy['session_type_distribution'].keys()
+
+    def test_empty_project(self, db_service, project):
+        stats = sessions.get_session_stats(db_service, project.id)
+
+        assert stats['total_sessions'] == stats['active_sessions'] == 0
+        assert stats['avg_duration'] == stats['total_duration'] == 0
+        assert stats['developer_stats'] == {}
+
+
+def test_migration_backfills_existing_sessions(db_service, project):
+    with db_service.connect() as conn:
+        migration.downgrade(conn)
+        conn.commit()
+    _populate(db_service, project.id, count=50)
+
+    with db_service.connect() as conn:
+        migration.upgrade(conn)
+        conn.commit()
+
+    assert sessions.search_decisions(db_service, project.id, "index") == \
+        legacy_search_decisions(db_service, project.id, "index")
+    with db_service.connect() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM session_decisions").fetchone()[0]
+        metadata_count = sum(
+            len(json.loads(row[0])['decisions_made']) for row in conn.execute("SELECT metadata FROM sessions")
+        )
+    assert count == metadata_count
@@ -0,0 +1,204 @@
+"""
+Tests for set-based bulk task operations (methods/tasks.py).
+
+Covers:
+- bulk_update_tasks / bulk_delete_tasks in one transaction (all or nothing)
+- Missing ids reported, chunked IN statements, trigger-maintained timestamps
+- Optional workflow-validation pre-pass
+- One summarized event per batch
+- Batch lookups (get_tasks, count_tasks_by_work_item, list_tasks project filter)
+"""
+
+import pytest
+
+from agentpm.core.database.enums import TaskStatus
+from agentpm.core.database.methods import tasks
+from agentpm.core.database.service import TransactionError
+
+
+def _add_tasks(db, work_item_id, statuses):
+    with db.connect() as conn:
+        ids = [
+            conn.execute(
+                "INSERT INTO tasks (work_item_id, name, type, status, priority) VALUES (?, ?, 'implementation', ?, 3)",
+                (work_item_id, f"Task {i}", status)
+            ).lastrowid
+            for i, status in enumerate(statuses)
+        ]
+        conn.commit()
+    return ids
+
+
+def _rows(db, ids):
+    with db.connect() as conn:
+        return {
+            row['id']: dict(row) for row in conn.execute(
+                f"SELECT * FROM tasks WHERE id IN ({', '.join('?' * len(ids))})", ids
+            )
+        }
+
+
+class TestBulkUpdate:
+    """Set-based updates."""
+
+    def test_updates_all_and_reports_missing(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['draft', 'ready', 'active'])
+
+        result = tasks.bulk_update_tasks(db_service, ids + [9999, ids[0]], priority=1, assigned_to='qa')
+
+        assert result.applied
+        assert result.task_ids == ids
+        assert result.missing_ids == [9999]
+        assert all(row['priority'] == 1 and row['assigned_to'] == 'qa'
+                   for row in _rows(db_service, ids).values())
+
+    def test_constraint_failure_rolls_back_batch(self, db_service, work_item, monkeypatch):
+        ids = _add_tasks(db_service, work_item.id, ['draft'] * 5)
+        monkeypatch.setattr(tasks, 'BULK_CHUNK_SIZE', 2)  # several statements in one transaction
+
+        with pytest.raises(TransactionError):
+            tasks.bulk_update_tasks(db_service, ids, effort_hours=20)  # CHECK effort_hours <= 8
+
+        assert {row['effort_hours'] for row in _rows(db_service, ids).values()} == {None}
+
+    def test_chunked_statements(self, db_service, work_item, monkeypatch):
+        ids = _add_tasks(db_service, work_item.id, ['draft'] * 5)
+        monkeypatch.setattr(tasks, 'BULK_CHUNK_SIZE', 2)
+
+        result = tasks.bulk_update_tasks(db_service, ids, status=TaskStatus.READY)
+
+        assert result.count == 5
+        assert {row['status'] for row in _rows(db_service, ids).values()} == {'ready'}
+
+    def test_status_triggers_maintain_timestamps(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['review', 'ready'])
+
+        tasks.bulk_update_tasks(db_service, ids[:1], status=TaskStatus.DONE)
+        tasks.bulk_update_tasks(db_service, ids[1:], status=TaskStatus.ACTIVE)
+        rows = _rows(db_service, ids)
+
+        assert rows[ids[0]]['completed_at'] is not None
+        assert rows[ids[1]]['started_at'] is not None
+
+    def test_rejects_unknown_fields(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['draft'])
+
+        with pytest.raises(ValueError, match="name"):
+            tasks.bulk_update_tasks(db_service, ids, name="renamed")
+        with pytest.raises(ValueError):
+            tasks.bulk_update_tasks(db_service, ids)
+
+
+class TestWorkflowValidation:
+    """Optional per-task transition pre-pass."""
+
+    def test_invalid_transition_rejects_whole_batch(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['ready', 'draft', 'done'])
+
+        result = tasks.bulk_update_tasks(db_service, ids, validate_workflow=True, status=TaskStatus.ACTIVE)
+
+        assert not result.applied
+        assert result.count == 0
+        assert set(result.errors) == {ids[1], ids[2]}
+        assert "terminal" in result.errors[ids[2]]
+        assert [row['status'] for row in _rows(db_service, ids).values()] == ['ready', 'draft', 'done']
+
+    def test_valid_batch_applied(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['ready', 'active', 'blocked'])
+
+        result = tasks.bulk_update_tasks(db_service, ids, validate_workflow=True, status=TaskStatus.CANCELLED)
+
+        assert result.applied and result.count == 3
+
+    def test_blocked_requires_reason(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['active'])
+
+        assert tasks.bulk_update_tasks(
+            db_service, ids, validate_workflow=True, status=TaskStatus.BLOCKED
+        ).errors
+        assert tasks.bulk_update_tasks(
+            db_service, ids, validate_workflow=True, status=TaskStatus.BLOCKED, blocked_reason="API"
+        ).applied
+
+    def test_unvalidated_update_keeps_previous_behaviour(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['draft'])
+
+        assert tasks.bulk_update_tasks(db_service, ids, status=TaskStatus.DONE).applied
+
+
+class TestBulkDelete:
+    """Set-based deletes."""
+
+    def test_deletes_in_one_transaction(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['draft', 'ready'])
+        keep = _add_tasks(db_service, work_item.id, ['draft'])
+
+        result = tasks.bulk_delete_tasks(db_service, ids + [4242])
+
+        assert result.task_ids == ids
+        assert result.missing_ids == [4242]
+        assert list(_rows(db_service, ids + keep)) == keep
+
+
+class TestEvents:
+    """One summarized event per batch."""
+
+    @pytest.fixture
+    def emitted(self, monkeypatch):
+        from agentpm.core.database.methods import sessions
+        from agentpm.core.sessions import event_bus
+
+        events = []
+
+        class Bus:
+            def __init__(self, db):
+                pass
+
+            def emit(self, event):
+                events.append(event)
+
+        class Session:
+            id = 1
+            project_id = 1
+
+        monkeypatch.setattr(event_bus, 'EventBus', Bus)
+        monkeypatch.setattr(sessions, 'get_current_session', lambda db: Session())
+        return events
+
+    def test_single_event_for_status_batch(self, db_service, work_item, emitted):
+        ids = _add_tasks(db_service, work_item.id, ['review'] * 4)
+
+        tasks.bulk_update_tasks(db_service, ids, status=TaskStatus.DONE)
+
+        assert len(emitted) == 1
+        event = emitted[0]
+        assert event.event_type.value == 'task.completed'
+        assert event.event_data['count'] == 4
+        assert event.event_data['task_ids'] == ids
+        assert event.work_item_id == work_item.id
+
+    def test_no_event_without_mapped_status(self, db_service, work_item, emitted):
+        ids = _add_tasks(db_service, work_item.id, ['draft'])
+
+        tasks.bulk_update_tasks(db_service, ids, priority=2)
+        tasks.bulk_update_tasks(db_service, ids, status=TaskStatus.DONE, emit_event=False)
+        tasks.bulk_delete_tasks(db_service, ids)
+
+        assert emitted == []
+
+
+class TestBatchLookups:
+    """Queries replacing per-task and per-work-item loops."""
+
+    def test_get_tasks_in_requested_order(self, db_service, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['draft', 'ready', 'active'])
+
+        assert [task.id for task in tasks.get_tasks(db_service, [ids[2], 777, ids[0]])] == [ids[2], ids[0]]
+
+    def test_counts_and_project_filter(self, db_service, project, work_item):
+        ids = _add_tasks(db_service, work_item.id, ['draft', 'draft', 'ready'])
+
+        assert tasks.count_tasks_by_work_item(db_service, [work_item.id, 555]) == {work_item.id: 3, 555: 0}
+        drafts = tasks.list_tasks(db_service, project_id=project.id, status=TaskStatus.DRAFT)
+        assert sorted(task.id for task in drafts) == ids[:2]
+        assert tasks.list_tasks(db_service, project_id=project.id + 1) == []
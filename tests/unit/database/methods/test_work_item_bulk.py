@@ -0,0 +1,112 @@
+"""
+Tests for set-based bulk work item operations (methods/work_items.py).
+
+Covers:
+- bulk_update_work_items / bulk_delete_work_items in one transaction (all or nothing)
+- Missing ids reported, chunked IN statements, delete cascading to tasks
+- get_work_items batch lookup
+"""
+
+import pytest
+
+from agentpm.core.database.enums import WorkItemStatus, Phase
+from agentpm.core.database.methods import tasks, work_items
+from agentpm.core.database.service import TransactionError
+
+
+def _add_work_items(db, project_id, count):
+    with db.connect() as conn:
+        ids = [
+            conn.execute(
+                "INSERT INTO work_items (project_id, name, type, status, priority) VALUES (?, ?, 'feature', 'draft', 3)",
+                (project_id, f"Work item {i}")
+            ).lastrowid
+            for i in range(count)
+        ]
+        conn.commit()
+    return ids
+
+
+def _rows(db, ids):
+    with db.connect() as conn:
+        return {
+            row['id']: dict(row) for row in conn.execute(
+                f"SELECT * FROM work_items WHERE id IN ({', '.join('?' * len(ids))})", ids
+            )
+        }
+
+
+class TestBulkUpdate:
+    """Set-based updates."""
+
+    def test_updates_all_and_reports_missing(self, db_service, project):
+        ids = _add_work_items(db_service, project.id, 3)
+
+        result = work_items.bulk_update_work_items(
+            db_service, ids + [9999, ids[0]], status=WorkItemStatus.READY, priority=1, phase=Phase.P1_PLAN
+        )
+
+        assert result.applied
+        assert result.count == 3
+        assert result.work_item_ids == ids
+        assert result.missing_ids == [9999]
+        assert all(row['status'] == 'ready' and row['priority'] == 1 and row['phase'] == 'P1_plan'
+                   for row in _rows(db_service, ids).values())
+
+    def test_constraint_failure_rolls_back_batch(self, db_service, project, monkeypatch):
+        ids = _add_work_items(db_service, project.id, 5)
+        monkeypatch.setattr(tasks, 'BULK_CHUNK_SIZE', 2)  # several statements in one transaction
+
+        with pytest.raises(TransactionError):
+            work_items.bulk_update_work_items(db_service, ids, priority=9)  # CHECK priority <= 5
+
+        assert all(row['priority'] == 3 for row in _rows(db_service, ids).values())
+
+    def test_chunked_statements(self, db_service, project, monkeypatch):
+        ids = _add_work_items(db_service, project.id, 5)
+        monkeypatch.setattr(tasks, 'BULK_CHUNK_SIZE', 2)
+
+        result = work_items.bulk_update_work_items(db_service, ids, priority=2)
+
+        assert result.count == 5
+        assert all(row['priority'] == 2 for row in _rows(db_service, ids).values())
+
+    def test_rejects_unknown_fields(self, db_service, project):
+        ids = _add_work_items(db_service, project.id, 1)
+
+        with pytest.raises(ValueError):
+            work_items.bulk_update_work_items(db_service, ids, name='renamed')
+        with pytest.raises(ValueError):
+            work_items.bulk_update_work_items(db_service, ids)
+
+
+class TestBulkDelete:
+    """Set-based deletes."""
+
+    def test_deletes_in_one_transaction_with_tasks(self, db_service, project):
+        ids = _add_work_items(db_service, project.id, 2)
+        keep = _add_work_items(db_service, project.id, 1)
+        with db_service.connect() as conn:
+            conn.execute(
+                "INSERT INTO tasks (work_item_id, name, type, status, priority) VALUES (?, 'Task', 'implementation', 'draft', 3)",
+                (ids[0],)
+            )
+            conn.commit()
+
+        result = work_items.bulk_delete_work_items(db_service, ids + [4242])
+
+        assert result.work_item_ids == ids
+        assert result.missing_ids == [4242]
+        assert list(_rows(db_service, ids + keep)) == keep
+        assert tasks.count_tasks_by_work_item(db_service, ids) == {ids[0]: 0, ids[1]: 0}
+
+
+class TestBatchLookups:
+    """Queries replacing per-work-item loops."""
+
+    def test_get_work_items_in_requested_order(self, db_service, project):
+        ids = _add_work_items(db_service, project.id, 3)
+
+        found = work_items.get_work_items(db_service, [ids[2], 777, ids[0]])
+
+        assert [wi.id for wi in found] == [ids[2], ids[0]]
@@ -0,0 +1,78 @@
+"""
+Unit tests for the heading-aware document chunker (Migration 0051 content index).
+"""
+
+from agentpm.core.database.utils.document_chunker import (
+    chunk_document,
+    compute_index_hash,
+)
+
+
+class TestChunkDocument:
+    """Test chunk_document splitting rules."""
+
+    def test_empty_content_has_no_chunks(self):
+        assert chunk_document(None) == []
+        assert chunk_document("   \n\n") == []
+
+    def test_plain_text_is_single_chunk(self):
+        chunks = chunk_document("Just some text.\n\nAnother paragraph.")
+
+        assert len(chunks) == 1
+        assert chunks[0].heading_path == ""
+        assert chunks[0].start_offset == 0
+
+    def test_headings_build_hierarchical_paths(self):
+        content = "# Guide\n\nIntro\n\n## Install\n\nSteps\n\n### Linux\n\napt\n\n## Usage\n\nRun"
+
+        chunks = chunk_document(content)
+
+        assert [c.heading_path for c in chunks] == [
+            "Guide",
+            "Guide > Install",
+            "Guide > Install > Linux",
+            "Guide > Usage",
+        ]
+        assert [c.chunk_index for c in chunks] == [0, 1, 2, 3]
+
+    def test_chunk_offsets_point_into_source(self):
+        content = "Preamble\n\n# Section\n\nBody text"
+
+        for chunk in chunk_document(content):
+            assert content[chunk.start_offset:].startswith(chunk.content)
+
+    def test_headings_inside_code_fences_are_ignored(self):
+        content = "# Real\n\n```bash\n# not a heading\necho hi\n```\n"
+
+        chunks = chunk_document(content)
+
+        assert len(chunks) == 1
+        assert "# not a heading" in chunks[0].content
+
+    def test_oversized_section_splits_on_paragraphs(self):
+        paragraphs = [f"Paragraph {i} " + "word " * 30 for i in range(10)]
+        content = "# Big\n\n" + "\n\n".join(paragraphs)
+
+        chunks = chunk_document(content, max_chars=400)
+
+        assert len(chunks) > 1
+        assert all(len(c.content) <= 400 for c in chunks)
+        assert all(c.heading_path == "Big" for c in chunks)
+        assert "".join(c.content for c in chunks).count("Paragraph") == 10
+
+    def test_oversized_paragraph_is_hard_split(self):
+        chunks = chunk_document("x" * 1000, max_chars=300)
+
+        assert len(chunks) == 4
+        assert sum(len(c.content) for c in chunks) == 1000
+
+
+class TestComputeIndexHash:
+    """Test compute_index_hash change detection."""
+
+    def test_hash_changes_with_title_or_content(self):
+        base = compute_index_hash("Title", "Body")
+
+        assert base == compute_index_hash("Title", "Body")
+        assert base != compute_index_hash("Other", "Body")
+        assert base != compute_index_hash("Title", "Other")
@@ -0,0 +1,154 @@
+"""
+Tests for migration 0056 (composite indexes, tag join tables) and the index advisor.
+
+Covers:
+- Tag join tables follow inserts, tag updates and deletes, and are backfilled
+- Tag filters in search_documents_by_metadata / list_ideas use the join tables
+- Hot list shapes are planned on the new indexes
+- Advisor flags filtered full scans, ignores unfiltered lists, suggests indexes
+"""
+
+import json
+
+import pytest
+
+from agentpm.core.database.methods import document_references, ideas
+from agentpm.core.database.migrations.files import migration_0056_covering_indexes as migration
+from agentpm.core.database.service import DatabaseService
+from agentpm.core.database.utils import index_advisor
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseService(str(tmp_path / "advisor.db"))
+    with db.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'Advisor', '/tmp/advisor')")
+        conn.executemany(
+            "INSERT INTO document_references (id, entity_type, entity_id, file_path, title, tags) "
+            "VALUES (?, 'project', 1, ?, ?, ?)",
+            [
+                (1, 'docs/guides/user_guide/a.md', 'A', '["api", "rest"]'),
+                (2, 'docs/guides/user_guide/b.md', 'B', '["API"]'),
+                (3, 'docs/guides/user_guide/c.md', 'C', '["restful"]'),
+                (4, 'docs/guides/user_guide/d.md', 'D', 'not json'),
+            ]
+        )
+        conn.execute("INSERT INTO ideas (id, project_id, title, source, tags) VALUES (1, 1, 'Tagged idea', 'user', '[\"backend\"]')")
+        conn.commit()
+    return db
+
+
+def _document_tags(conn):
+    return sorted(tuple(row) for row in conn.execute("SELECT tag, document_id FROM document_tags"))
+
+
+class TestTagTables:
+    """document_tags / idea_tags mirror the JSON tags columns."""
+
+    def test_insert_update_delete(self, db):
+        with db.connect() as conn:
+            assert _document_tags(conn) == [('API', 2), ('api', 1), ('rest', 1), ('restful', 3)]
+
+            conn.execute("UPDATE document_references SET tags = '[\"grpc\"]' WHERE id = 1")
+            conn.execute("DELETE FROM document_references WHERE id = 3")
+            assert _document_tags(conn) == [('API', 2), ('grpc', 1)]
+
+    def test_backfill_existing_rows(self, db):
+        with db.connect() as conn:
+            migration.downgrade(conn)
+            assert conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'document_tags'"
+            ).fetchone() is None
+
+            migration.upgrade(conn)
+            assert _document_tags(conn) == [('API', 2), ('api', 1), ('rest', 1), ('restful', 3)]
+            assert [tuple(row) for row in conn.execute("SELECT tag, idea_id FROM idea_tags")] == [('backend', 1)]
+
+    def test_document_tag_filter(self, db):
+        docs = document_references.search_documents_by_metadata(db, tags=['api'])
+        rest = document_references.search_documents_by_metadata(db, tags=['rest', 'missing'])
+
+        # Whole tags only (LIKE '%"rest"%' semantics), case-insensitive
+        assert sorted(doc.id for doc in docs) == [1, 2]
+        assert [doc.id for doc in rest] == [1]
+
+    def test_idea_tag_filter(self, db):
+        assert [idea.id for idea in ideas.list_ideas(db, tags=['Backend'])] == [1]
+        assert ideas.list_ideas(db, tags=['frontend']) == []
+
+
+class TestIndexes:
+    """Hot list shapes are planned on the composite indexes."""
+
+    @pytest.mark.parametrize('sql, index', [
+        ("SELECT * FROM tasks WHERE work_item_id = ? AND status = ? ORDER BY priority ASC, created_at DESC",
+         'idx_tasks_work_item_status_priority'),
+        ("SELECT * FROM document_references WHERE entity_type = ? AND entity_id = ? ORDER BY created_at DESC",
+         'idx_document_references_entity'),
+        ("SELECT * FROM contexts WHERE entity_type = ? AND entity_id = ?", 'idx_contexts_entity_type'),
+    ])
+    def test_plan_uses_index(self, db, sql, index):
+        with db.connect() as conn:
+            advice = index_advisor.advise_fingerprint(conn, sql)
+
+        assert not advice.flagged
+        assert not advice.temp_sort
+        assert any(index in step for step in advice.plan)
+
+
+class TestAdvisor:
+    """advise() flags filtered full scans."""
+
+    def test_filtered_full_scan_flagged_with_suggestion(self, db):
+        with db.connect() as conn:
+            advice = index_advisor.advise_fingerprint(
+                conn, "SELECT * FROM tasks WHERE assigned_to = ? ORDER BY created_at DESC"
+            )
+
+        assert advice.flagged
+        assert advice.full_scans == ['tasks']
+        assert advice.suggestion == "CREATE INDEX idx_tasks_assigned_to_created_at ON tasks(assigned_to, created_at DESC)"
+
+    def test_unfiltered_list_not_flagged(self, db):
+        with db.connect() as conn:
+            advice = index_advisor.advise_fingerprint(conn, "SELECT * FROM projects WHERE ?=? ORDER BY created_at DESC")
+
+        assert advice.full_scans == ['projects']
+        assert advice.temp_sort
+        assert not advice.flagged
+
+    def test_replays_collapsed_in_lists(self, db):
+        with db.connect() as conn:
+            advice = index_advisor.advise_fingerprint(conn, "SELECT * FROM tasks WHERE id IN (?+)")
+
+        assert advice.error is None
+        assert not advice.flagged
+
+    def test_unexplainable_statement(self, db):
+        with db.connect() as conn:
+            advice = index_advisor.advise_fingerprint(conn, "SELECT * FROM missing_table WHERE x = ?")
+
+        assert advice.error
+        assert not advice.flagged
+
+    def test_workload_fingerprints_use_indexes(self, db):
+        profiler = db.enable_profiling()
+        errors = index_advisor.run_read_workload(db)
+        db.disable_profiling()
+
+        with db.connect() as conn:
+            results = index_advisor.advise(conn, [s.fingerprint for s in profiler.stats()])
+
+        assert 'tasks_by_status' not in errors
+        assert [advice.fingerprint for advice in results if advice.flagged] == []
+
+    def test_load_fingerprints(self, tmp_path):
+        report = tmp_path / "profile.json"
+        report.write_text(json.dumps({'profile': {'queries': [{'fingerprint': 'SELECT * FROM tasks WHERE id = ?'}]}}))
+        statements = tmp_path / "statements.sql"
+        statements.write_text("SELECT * FROM tasks WHERE id = 7\n\nSELECT 1 FROM t WHERE x IN (1, 2)\n")
+
+        assert index_advisor.load_fingerprints(report) == ['SELECT * FROM tasks WHERE id = ?']
+        assert index_advisor.load_fingerprints(statements) == [
+            'SELECT * FROM tasks WHERE id = ?', 'SELECT ? FROM t WHERE x IN (?+)'
+        ]
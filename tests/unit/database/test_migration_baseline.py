@@ -0,0 +1,151 @@
+"""
+Unit tests for the squashed schema baseline (migrations/baseline.py).
+
+Covers:
+- New databases built from the baseline match a full migration replay
+- Snapshot generation is deterministic and verifies via SchemaDiffer
+- Migrations newer than the baseline are replayed on top of it
+- A broken baseline falls back to replaying every migration
+"""
+
+import pytest
+
+from agentpm.core.database.service import DatabaseService
+from agentpm.core.database.migrations import SchemaDiffer
+from agentpm.core.database.migrations import baseline
+
+
+def _schema(service):
+    with service.connect() as conn:
+        return {
+            (row[0], row[1]): ' '.join(row[2].split())
+            for row in conn.execute(
+                "SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL"
+            )
+        }
+
+
+def _applied_versions(service):
+    with service.connect() as conn:
+        return [
+            row[0] for row in conn.execute(
+                "SELECT version FROM schema_migrations WHERE rollback_at IS NULL ORDER BY version"
+            )
+        ]
+
+
+@pytest.fixture(scope="module")
+def replayed(tmp_path_factory):
+    """Reference database built by replaying every migration."""
+    return baseline.replay_migrations(tmp_path_factory.mktemp("replay") / "replay.db")
+
+
+@pytest.fixture(scope="module")
+def snapshot_sql(replayed):
+    with replayed.connect() as conn:
+        return baseline.dump_baseline(conn, baseline.compute_source_checksum())
+
+
+class TestBaselineSnapshot:
+    """Test snapshot generation and verification."""
+
+    def test_packaged_baseline_is_loadable(self):
+        snapshot = baseline.load_baseline()
+
+        assert snapshot is not None
+        assert snapshot.version
+        assert {'tables', 'data', 'indexes', 'triggers', 'migrations'} <= set(snapshot.sections)
+
+    def test_dump_is_deterministic(self, replayed, snapshot_sql):
+        with replayed.connect() as conn:
+            again = baseline.dump_baseline(conn, baseline.compute_source_checksum())
+
+        assert again == snapshot_sql
+
+    def test_dump_excludes_fts_shadow_tables(self, snapshot_sql):
+        snapshot = baseline.parse_baseline(snapshot_sql)
+
+        assert "CREATE VIRTUAL TABLE" in snapshot.sections['tables']
+        assert "_fts_data" not in snapshot.sections['tables']
+        assert "_fts_docsize" not in snapshot.sections['tables']
+
+    def test_schema_differ_finds_no_changes(self, replayed, snapshot_sql):
+        changes = SchemaDiffer(replayed).compare_schemas(baseline.parse_baseline(snapshot_sql).ddl)
+
+        assert changes == []
+
+    def test_verify_against_replay(self, replayed, snapshot_sql, tmp_path):
+        verification = baseline.verify_baseline(
+            replayed, baseline.parse_baseline(snapshot_sql), tmp_path
+        )
+
+        assert verification.is_equal, verification.differences
+
+    def test_verify_reports_missing_objects(self, replayed, snapshot_sql, tmp_path):
+        broken = snapshot_sql.replace(
+            "CREATE TRIGGER content_blobs_release", "CREATE TRIGGER renamed_release"
+        )
+
+        verification = baseline.verify_baseline(replayed, baseline.parse_baseline(broken), tmp_path)
+
+        assert not verification.is_equal
+        assert "trigger content_blobs_release missing from snapshot" in verification.differences
+
+    def test_missing_version_header_rejected(self):
+        with pytest.raises(baseline.BaselineError):
+            baseline.parse_baseline("BEGIN;\nCOMMIT;\n")
+
+
+class TestNewDatabaseFromBaseline:
+    """Test DatabaseService schema initialization from the baseline."""
+
+    def test_matches_full_replay(self, replayed, tmp_path):
+        db = DatabaseService(tmp_path / "fresh.db")
+
+        assert _schema(db) == _schema(replayed)
+        assert _applied_versions(db) == _applied_versions(replayed)
+
+    def test_seed_data_loaded(self, replayed, tmp_path):
+        db = DatabaseService(tmp_path / "fresh.db")
+
+        with db.connect() as conn, replayed.connect() as ref:
+            count = conn.execute("SELECT COUNT(*) FROM document_visibility_policies").fetchone()[0]
+            expected = ref.execute("SELECT COUNT(*) FROM document_visibility_policies").fetchone()[0]
+            stamped = conn.execute(
+                "SELECT COUNT(*) FROM document_visibility_policies WHERE created_at IS NULL"
+            ).fetchone()[0]
+
+        assert count == expected > 0
+        assert stamped == 0  # creation timestamps filled in at load time
+
+    def test_post_baseline_migrations_replayed(self, snapshot_sql, tmp_path, monkeypatch):
+        latest = baseline.parse_baseline(snapshot_sql).version
+        # Keep every migration row except the latest
+        rows = [
+            line for line in snapshot_sql.splitlines()
+            if line.startswith('INSERT INTO "schema_migrations"') and f"'{latest}'" not in line
+        ]
+        older = "\n".join(
+            line for line in snapshot_sql.splitlines()
+            if not line.startswith('INSERT INTO "schema_migrations"')
+        ).replace("\nCOMMIT;", "\n" + "\n".join(rows) + "\nCOMMIT;")
+        path = tmp_path / "schema_baseline.sql"
+        path.write_text(older, encoding="utf-8")
+        monkeypatch.setattr(baseline, "BASELINE_FILE", path)
+
+        db = DatabaseService(tmp_path / "fresh.db")
+
+        assert latest in _applied_versions(db)
+
+    def test_broken_baseline_falls_back_to_replay(self, replayed, tmp_path, monkeypatch):
+        path = tmp_path / "schema_baseline.sql"
+        path.write_text(
+            "-- baseline-version: 9999\nBEGIN;\nCREATE TABLE projects (id INTEGER);\n"
+            "INSERT INTO missing_table VALUES (1);\nCOMMIT;\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(baseline, "BASELINE_FILE", path)
+
+        db = DatabaseService(tmp_path / "fresh.db")
+
+        assert _schema(db) == _schema(replayed)
@@ -0,0 +1,147 @@
+"""
+Tests for opt-in query profiling (utils/query_profiler.py) and database stats.
+
+Covers:
+- Fingerprint normalization of literals, placeholders and IN lists
+- Counts, percentiles and fetch time attributed to the statement
+- EXPLAIN QUERY PLAN captured for slow statements only
+- Profiling off by default (plain sqlite3 connections)
+- Storage statistics and row counts from SQLite
+"""
+
+import sqlite3
+
+import pytest
+
+from agentpm.core.database.methods import database_stats
+from agentpm.core.database.service import DatabaseService
+from agentpm.core.database.utils.query_profiler import (
+    ProfiledConnection,
+    QueryProfiler,
+    fingerprint,
+    percentile,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseService(str(tmp_path / "profile.db"))
+    with db.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'Profile', '/tmp/profile')")
+        conn.execute(
+            "INSERT INTO work_items (id, project_id, name, type, status, priority) "
+            "VALUES (1, 1, 'Queries', 'feature', 'active', 1)"
+        )
+        conn.executemany(
+            "INSERT INTO tasks (work_item_id, name, type, status, priority) VALUES (1, ?, 'implementation', 'draft', 2)",
+            [(f"Task {i}",) for i in range(40)]
+        )
+        conn.commit()
+    return db
+
+
+class TestFingerprint:
+    """Statements differing only in literals share a fingerprint."""
+
+    def test_literals_and_placeholders(self):
+        assert fingerprint("SELECT * FROM tasks WHERE id = 42 AND name = 'it''s'") == \
+            fingerprint("SELECT * FROM tasks WHERE id = :id AND name = ?")
+        assert fingerprint("SELECT * FROM tasks WHERE id = 42") == "SELECT * FROM tasks WHERE id = ?"
+        assert fingerprint("SELECT * FROM tasks WHERE name = 'x' -- note\n") == "SELECT * FROM tasks WHERE name = ?"
+
+    def test_in_lists_collapse(self):
+        assert fingerprint("SELECT 1 FROM t WHERE id IN (1, 2, 3)") == \
+            fingerprint("SELECT 1 FROM t WHERE id IN (?,?)") == "SELECT ? FROM t WHERE id IN (?+)"
+
+    def test_identifiers_with_digits_kept(self):
+        assert fingerprint("SELECT col2 FROM t1") == "SELECT col2 FROM t1"
+
+
+class TestQueryProfiler:
+    """Profiled connections record every statement."""
+
+    def test_counts_and_percentiles(self, db):
+        profiler = db.enable_profiling()
+        for task_id in range(1, 21):
+            with db.connect() as conn:
+                conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+
+        report = profiler.report()
+        query = next(q for q in report['queries'] if q['fingerprint'] == "SELECT * FROM tasks WHERE id = ?")
+        assert query['count'] == 20
+        assert 0 < query['p50_ms'] <= query['p95_ms'] <= query['max_ms']
+        assert query['plan'] is None
+
+    def test_fetch_time_attributed_to_statement(self, db):
+        profiler = db.enable_profiling()
+        with db.connect() as conn:
+            cursor = conn.execute("SELECT * FROM tasks")
+            before = profiler.stats()[0].total_ms
+            assert len(list(cursor)) == 40
+
+        stats = {s.fingerprint: s for s in profiler.stats()}
+        assert stats["SELECT * FROM tasks"].total_ms > before
+
+    def test_slow_statements_explained(self, db):
+        profiler = db.enable_profiling(slow_ms=0)
+        with db.connect() as conn:
+            conn.execute("SELECT * FROM tasks WHERE work_item_id = ?", (1,)).fetchall()
+            report = profiler.report(conn)
+
+        query = next(q for q in report['queries'] if 'work_item_id' in q['fingerprint'])
+        assert query['slow'] is True
+        assert any('tasks' in step for step in query['plan'])
+
+    def test_disabled_by_default(self, db):
+        with db.connect() as conn:
+            assert type(conn) is sqlite3.Connection
+
+        db.enable_profiling()
+        with db.connect() as conn:
+            assert isinstance(conn, ProfiledConnection)
+
+        db.disable_profiling()
+        with db.connect() as conn:
+            assert type(conn) is sqlite3.Connection
+
+    def test_reset(self):
+        profiler = QueryProfiler()
+        profiler.add(profiler.start("SELECT 1", ()), 1.0)
+
+        profiler.reset()
+
+        assert profiler.report()['statements'] == 0
+
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile([], 95) == 0.0
+
+
+class TestDatabaseStats:
+    """get_database_stats reads sizes and counts from SQLite."""
+
+    def test_exact_counts(self, db):
+        stats = database_stats.get_database_stats(db)
+        tables = {t['name']: t for t in stats['tables']}
+
+        assert tables['tasks']['rows'] == 40
+        assert tables['tasks']['rows_estimated'] is False
+        assert stats['page_count'] * stats['page_size'] <= stats['size_bytes']
+        assert stats['free_bytes'] == stats['freelist_count'] * stats['page_size']
+
+    def test_estimates_from_analyze(self, db):
+        with db.connect() as conn:
+            conn.execute("ANALYZE")
+            conn.commit()
+
+        tables = {t['name']: t for t in database_stats.get_database_stats(db)['tables']}
+        exact = {t['name']: t for t in database_stats.get_database_stats(db, exact=True)['tables']}
+
+        assert tables['tasks'] == {**tables['tasks'], 'rows': 40, 'rows_estimated': True}
+        assert exact['tasks']['rows_estimated'] is False
+
+    def test_quick_check(self, db):
+        assert database_stats.get_database_stats(db, quick_check=True)['integrity'] == 'ok'
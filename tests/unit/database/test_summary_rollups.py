@@ -0,0 +1,357 @@
+"""
+Tests for hierarchical summary rollups (Migration 0058, methods/summary_rollups.py).
+
+Covers:
+- Compaction of 10k synthetic session summaries into daily / weekly /
+  per-work-item rollups (row counts per level, deterministic output)
+- Complete source-id lineage and merged key_decisions / next_steps
+- Raw rows archived (Migration 0060), caps opt-in and recorded
+- Idempotent re-runs; late summaries merge into existing rollups
+- Loader reads newest raw rows and falls back to rollups
+- summary_level filter for the polymorphic summaries search
+"""
+
+import json
+import random
+from collections import defaultdict
+from datetime import date, timedelta
+
+import pytest
+
+from agentpm.core.context.temporal_loader import TemporalContextLoader
+from agentpm.core.database.enums import EntityType, SummaryLevel
+from agentpm.core.database.methods import summaries, summary_rollups, work_item_summaries
+from agentpm.core.database.methods.summary_rollups import RollupPolicy, compact_summaries, merge_rollup
+from agentpm.core.database.migrations.files import migration_0058_summary_rollups as migration
+from agentpm.core.database.service import DatabaseService
+
+TODAY = date(2025, 12, 31)
+WORK_ITEMS = range(1, 6)
+SUMMARY_COUNT = 10_000
+
+
+def _synthetic_rows(seed: int = 42):
+    """10k session summaries over two years, plus milestones that stay raw"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(1, SUMMARY_COUNT + 1):
+        day = TODAY - timedelta(days=rng.randrange(0, 730))
+        metadata = {
+            'key_decisions': [f"decision {i}"] if i % 7 == 0 else [],
+            'next_steps': [f"step {i % 50}"],
+        }
+        rows.append((
+            i, rng.choice(WORK_ITEMS), day.isoformat(), 1.5,
+            f"## Session {i}\n\nWorked on part {i % 13} of the feature.", json.dumps(metadata), 'session'
+        ))
+    for i in range(SUMMARY_COUNT + 1, SUMMARY_COUNT + 11):
+        rows.append((i, 1, '2024-02-01', None, f"Milestone {i} reached", None, 'milestone'))
+    return rows
+
+
+def _make_db(path, rows):
+    db = DatabaseService(str(path))
+    with db.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'Rollups', '/tmp/rollups')")
+        conn.executemany(
+            "INSERT INTO work_items (id, project_id, name, type, status, priority) "
+            "VALUES (?, 1, ?, 'feature', 'active', 1)",
+            [(wi, f"Work item {wi}") for wi in WORK_ITEMS]
+        )
+        conn.executemany(
+            "INSERT INTO work_item_summaries (id, work_item_id, session_date, session_duration_hours, "
+            "summary_text, context_metadata, summary_type) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        conn.commit()
+    return db
+
+
+def _table(db):
+    with db.connect() as conn:
+        return [dict(row) for row in conn.execute(
+            "SELECT work_item_id, session_date, session_duration_hours, summary_text, context_metadata, "
+            "summary_type, summary_level, source_ids FROM work_item_summaries "
+            "ORDER BY work_item_id, summary_level, session_date, summary_text"
+        )]
+
+
+def _expected_levels(rows):
+    """Independent model of the default policy: rows per level"""
+    sessions = [row for row in rows if row[6] == 'session']
+    raw = sum(1 for row in sessions if row[2] >= (TODAY - timedelta(days=14)).isoformat())
+    days = {(row[1], row[2]) for row in sessions if row[2] < (TODAY - timedelta(days=14)).isoformat()}
+    daily = {key for key in days if key[1] >= (TODAY - timedelta(days=60)).isoformat()}
+    weeks = defaultdict(list)
+    for wi, day in days - daily:
+        monday = date.fromisoformat(day) - timedelta(days=date.fromisoformat(day).weekday())
+        weeks[(wi, monday)].append(day)
+    cutoff = (TODAY - timedelta(days=365)).isoformat()
+    weekly = {key for key, week_days in weeks.items() if min(week_days) >= cutoff}
+    work_item = {wi for (wi, _), week_days in weeks.items() if min(week_days) < cutoff}
+    return {'session': raw + 10, 'daily': len(daily), 'weekly': len(weekly), 'work_item': len(work_item)}
+
+
+@pytest.fixture(scope='module')
+def compacted(tmp_path_factory):
+    rows = _synthetic_rows()
+    db = _make_db(tmp_path_factory.mktemp('rollups') / 'rollups.db', rows)
+    report = compact_summaries(db, today=TODAY)
+    return db, rows, report
+
+
+class TestCompaction:
+    """Compaction of 10k synthetic summaries."""
+
+    def test_rows_per_level(self, compacted):
+        db, rows, report = compacted
+
+        with db.connect() as conn:
+            levels = dict(conn.execute(
+                "SELECT summary_level, COUNT(*) FROM work_item_summaries GROUP BY summary_level"
+            ).fetchall())
+
+        assert levels == _expected_levels(rows)
+        assert report.rows_before['work_item_summaries'] == SUMMARY_COUNT + 10
+        assert report.rows_after['work_item_summaries'] == sum(levels.values()) < 1000
+        assert report.created['work_item'] == levels['work_item'] == len(WORK_ITEMS)
+
+    def test_lineage_complete(self, compacted):
+        db, rows, _report = compacted
+
+        lineage = []
+        for row in _table(db):
+            if row['summary_level'] == 'session':
+                continue
+            source_ids = json.loads(row['source_ids'])
+            assert source_ids == sorted(source_ids)
+            assert json.loads(row['context_metadata'])['session_count'] == len(source_ids)
+            lineage.extend(source_ids)
+        with db.connect() as conn:
+            raw_ids = [r[0] for r in conn.execute(
+                "SELECT id FROM work_item_summaries WHERE summary_level = 'session' AND summary_type = 'session'"
+            )]
+
+        assert len(lineage) == len(set(lineage))
+        assert sorted(lineage + raw_ids) == list(range(1, SUMMARY_COUNT + 1))
+
+    def test_merged_decisions_and_next_steps(self, compacted):
+        db, rows, _report = compacted
+        by_id = {row[0]: row for row in rows}
+
+        for row in _table(db):
+            if row['summary_level'] != 'daily':
+                continue
+            metadata = json.loads(row['context_metadata'])
+            sources = sorted(json.loads(row['source_ids']), key=lambda i: (by_id[i][2], i))
+            assert metadata['key_decisions'] == [f"decision {i}" for i in sources if i % 7 == 0]
+            newest_first = [f"step {i % 50}" for i in reversed(sources)]
+            assert metadata['next_steps'] == list(dict.fromkeys(newest_first))
+            assert metadata['period_start'] == metadata['period_end'] == row['session_date']
+            assert row['session_duration_hours'] == 1.5 * len(sources)
+            assert row['summary_text'].startswith(f"Daily rollup of {len(sources)} session")
+
+        work_item = [row for row in _table(db) if row['summary_level'] == 'work_item'][0]
+        metadata = json.loads(work_item['context_metadata'])
+        source_ids = json.loads(work_item['source_ids'])
+        assert sorted(metadata['key_decisions']) == sorted(f"decision {i}" for i in source_ids if i % 7 == 0)
+        assert len(metadata['headlines']) == len(source_ids)
+        assert 'dropped' not in metadata
+        assert work_item['summary_text'].count("\n- 20") == RollupPolicy().max_headlines
+        assert f"- … {len(source_ids) - RollupPolicy().max_headlines} earlier sessions" in work_item['summary_text']
+
+    def test_raw_rows_archived(self, compacted):
+        db, rows, report = compacted
+        by_id = {row[0]: row for row in rows}
+        lineage = [i for row in _table(db) if row['source_ids'] for i in json.loads(row['source_ids'])]
+
+        archived = summary_rollups.get_archived_summaries(db, 'work_item_summaries', lineage)
+
+        assert report.archived['work_item_summaries'] == len(lineage) == len(archived)
+        assert [row['id'] for row in archived] == sorted(lineage)
+        for row in archived[:50]:
+            assert (row['work_item_id'], row['session_date'], row['summary_text']) == by_id[row['id']][1:3] + (by_id[row['id']][4],)
+            assert row['summary_level'] == 'session'
+
+    def test_milestones_stay_raw(self, compacted):
+        db, _rows, _report = compacted
+
+        with db.connect() as conn:
+            milestones = conn.execute(
+                "SELECT COUNT(*) FROM work_item_summaries WHERE summary_type = 'milestone' AND summary_level = 'session'"
+            ).fetchone()[0]
+
+        assert milestones == 10
+
+    def test_deterministic_and_idempotent(self, compacted, tmp_path):
+        db, rows, _report = compacted
+        again = _make_db(tmp_path / 'again.db', list(reversed(rows)))
+        compact_summaries(again, today=TODAY)
+
+        assert _table(again) == _table(db)
+
+        rerun = compact_summaries(again, today=TODAY)
+        assert sum(rerun.created.values()) == 0
+        assert _table(again) == _table(db)
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        rows = _synthetic_rows()[:500]
+        db = _make_db(tmp_path / 'dry.db', rows)
+
+        report = compact_summaries(db, today=TODAY, dry_run=True)
+
+        assert report.rows_after['work_item_summaries'] < 500
+        assert len(_table(db)) == 500
+        with db.connect() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM summary_archive").fetchone()[0] == 0
+
+    def test_late_summary_merges_into_existing_rollup(self, tmp_path):
+        rows = [(i, 1, '2025-12-01', None, f"Session {i} on Monday", None, 'session') for i in (1, 2)]
+        db = _make_db(tmp_path / 'late.db', rows)
+        compact_summaries(db, today=TODAY)
+        with db.connect() as conn:
+            late_id = conn.execute(
+                "INSERT INTO work_item_summaries (work_item_id, session_date, summary_text, summary_type) "
+                "VALUES (1, '2025-12-01', 'Late session notes', 'session')"
+            ).lastrowid
+            conn.commit()
+
+        report = compact_summaries(db, today=TODAY)
+        daily = [row for row in _table(db) if row['summary_level'] == 'daily']
+
+        assert report.created['daily'] == 1
+        assert len(daily) == 1
+        assert json.loads(daily[0]['source_ids']) == [1, 2, late_id]
+        assert daily[0]['summary_text'].endswith("- 2025-12-01: Late session notes")
+        assert [row['id'] for row in summary_rollups.get_archived_summaries(db, 'work_item_summaries', [1, 2, late_id])] \
+            == [1, 2, late_id]
+
+    def test_skipped_without_archive(self, tmp_path):
+        db = _make_db(tmp_path / 'no-archive.db', _synthetic_rows()[:100])
+        with db.connect() as conn:
+            conn.execute("DROP TABLE summary_archive")
+            conn.commit()
+
+        report = compact_summaries(db, today=TODAY)
+
+        assert sum(report.created.values()) == 0
+        assert len(_table(db)) == 100
+
+
+class TestMergeRollup:
+    """Pure merge of member rows."""
+
+    def test_uncapped_by_default(self):
+        members = [
+            {'id': i, 'day': '2025-01-01', 'session_duration_hours': 1.0, 'summary_level': 'session',
+             'summary_text': "x" * 500, 'source_ids': None,
+             'context_metadata': {'key_decisions': [f"d{i}"], 'next_steps': [f"n{i}"]}}
+            for i in range(1, 201)
+        ]
+
+        metadata = merge_rollup(members, SummaryLevel.DAILY)['context_metadata']
+
+        assert len(metadata['key_decisions']) == len(metadata['next_steps']) == 200
+        assert metadata['headlines'][0] == ['2025-01-01', "x" * 500]
+        assert 'dropped' not in metadata
+
+    def test_caps_and_dedupe(self):
+        members = [
+            {'id': i, 'day': f"2025-01-0{i}", 'session_duration_hours': None, 'summary_level': 'session',
+             'summary_text': f"# Session {i}\nbody", 'source_ids': None,
+             'context_metadata': {'key_decisions': ["shared", f"d{i}"], 'next_steps': ["shared", f"n{i}"]}}
+            for i in range(1, 6)
+        ]
+
+        merged = merge_rollup(members, SummaryLevel.WEEKLY, RollupPolicy(max_decisions=3, max_next_steps=2,
+                                                                          max_headlines=2))
+
+        assert merged['context_metadata']['key_decisions'] == ["d3", "d4", "d5"]
+        assert merged['context_metadata']['next_steps'] == ["shared", "n5"]
+        assert merged['context_metadata']['dropped'] == {'key_decisions': 3, 'next_steps': 4}
+        assert len(merged['context_metadata']['headlines']) == 5
+        assert merged['session_duration_hours'] is None
+        assert merged['summary_text'] == (
+            "Weekly rollup of 5 sessions (2025-01-01 to 2025-01-05)\n\n"
+            "- … 3 earlier sessions\n- 2025-01-04: Session 4\n- 2025-01-05: Session 5"
+        )
+
+
+class TestLoaderFallback:
+    """Newest raw rows first, then rollups."""
+
+    def test_recent_raw_then_rollups(self, compacted):
+        db, _rows, _report = compacted
+        with db.connect() as conn:
+            raw = conn.execute(
+                "SELECT COUNT(*) FROM work_item_summaries WHERE work_item_id = 2 AND summary_level = 'session'"
+            ).fetchone()[0]
+
+        recent = work_item_summaries.get_recent_summaries(db, work_item_id=2, limit=raw + 3)
+
+        assert [s.summary_level for s in recent] == ['session'] * raw + ['daily'] * 3
+        dailies = [s.session_date for s in recent[raw:]]
+        assert dailies == sorted(dailies, reverse=True)
+
+    def test_falls_back_through_levels(self, compacted):
+        db, _rows, _report = compacted
+
+        everything = work_item_summaries.get_recent_summaries(db, work_item_id=3, limit=10_000)
+        levels = [s.summary_level for s in everything]
+
+        assert levels == sorted(levels, key=summary_rollups.LEVEL_ORDER.index)
+        assert levels[-1] == 'work_item'
+
+    def test_temporal_loader_marks_rollups(self, tmp_path):
+        rows = [(1, 1, '2025-11-01', 2.0, "Old session text", json.dumps({'key_decisions': ["use WAL"]}), 'session'),
+                (2, 1, '2025-12-30', 1.0, "Recent session text", None, 'session')]
+        db = _make_db(tmp_path / 'loader.db', rows)
+        compact_summaries(db, today=TODAY)
+        loader = TemporalContextLoader(db)
+
+        loaded = loader.load_recent_summaries(work_item_id=1, limit=3)
+
+        assert [(s['summary_level'], s['source_ids']) for s in loaded] == [('session', None), ('daily', [1])]
+        assert loaded[1]['metadata']['key_decisions'] == ["use WAL"]
+        assert "### Session 2: daily rollup" in loader.format_for_agent(loaded)
+
+
+class TestPolymorphicSummaries:
+    """summaries table: work item progress is compacted, search filters by level."""
+
+    def test_compact_and_search_by_level(self, tmp_path):
+        db = _make_db(tmp_path / 'poly.db', [])
+        with db.connect() as conn:
+            conn.executemany(
+                "INSERT INTO summaries (entity_type, entity_id, summary_type, summary_text, created_by, session_date) "
+                "VALUES (?, ?, ?, ?, 'tester', ?)",
+                [('work_item', 1, 'work_item_progress', f"Progress on parser {i}", f"2025-10-0{i}") for i in range(1, 4)]
+                + [('work_item', 1, 'work_item_decision', "Decision on parser design", '2025-10-01'),
+                   ('project', 1, 'project_milestone', "Project milestone parser", '2025-10-01')]
+            )
+            conn.commit()
+
+        compact_summaries(db, today=TODAY)
+
+        rollups = summaries.search_summaries(db, "parser", summary_level=SummaryLevel.WEEKLY)
+        raw = summaries.search_summaries(db, "parser", summary_level=SummaryLevel.SESSION)
+        assert len(rollups) == 1
+        assert rollups[0].source_ids == [1, 2, 3]
+        assert rollups[0].entity_type == EntityType.WORK_ITEM
+        assert rollups[0].created_by == summary_rollups.ROLLUP_AUTHOR
+        assert sorted(s.summary_type.value for s in raw) == ['project_milestone', 'work_item_decision']
+
+
+def test_migration_downgrade_keeps_rollups(tmp_path):
+    db = _make_db(tmp_path / 'down.db', _synthetic_rows()[:200])
+    compact_summaries(db, today=TODAY)
+    rows_after = len(_table(db))
+
+    with db.connect() as conn:
+        migration.downgrade(conn)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(work_item_summaries)")]
+        count = conn.execute("SELECT COUNT(*) FROM work_item_summaries").fetchone()[0]
+        migration.upgrade(conn)
+
+    assert 'summary_level' not in columns
+    assert count == rows_after
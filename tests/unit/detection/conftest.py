@@ -0,0 +1,13 @@
+"""
+Shared fixtures for detection tests.
+"""
+
+import pytest
+
+from agentpm.core.detection.analysis import service as analysis_service
+
+
+@pytest.fixture(autouse=True)
+def isolated_analysis_cache(tmp_path, monkeypatch):
+    """Keep the default analysis cache out of the working tree"""
+    monkeypatch.setattr(analysis_service, "DEFAULT_CACHE_DIR", tmp_path / "analysis-cache")
@@ -0,0 +1,281 @@
+"""
+Tests for the shared TTL LRU cache (core/performance/cache.py).
+
+Covers:
+- O(1) LRU order, TTL expiry, entry and byte-weight limits, counters
+- Tag invalidation per cache and across CACHE_REGISTRY
+- cached_method per-instance memoization
+- Caches migrated onto TTLCache (optimizer, plugins, SOPs, policies, graphs)
+"""
+
+import gc
+import threading
+import time
+
+from agentpm.core.performance import CACHE_REGISTRY, TTLCache, cached_method
+from agentpm.core.performance.optimizer import LRUCache, MultiLevelCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Core cache behaviour."""
+
+    def test_lru_eviction_order(self):
+        cache = TTLCache(maxsize=3)
+        for key in "abc":
+            cache.set(key, key.upper())
+
+        cache.get("a")          # a becomes most recently used
+        cache.set("d", "D")     # evicts b
+
+        assert cache.keys() == ["c", "a", "d"]
+        assert cache.get("b") is None
+        assert cache.stats()['evictions'] == 1
+
+    def test_resize_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=4)
+        for key in "abcd":
+            cache.set(key, key)
+        cache.get("a")
+
+        cache.resize(2)
+
+        assert cache.keys() == ["d", "a"]
+        assert cache.maxsize == 2
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("short", 1, ttl=1)
+        cache.set("default", 2)
+        cache.set("forever", 3, ttl=None)
+
+        clock.now = 5
+        assert cache.get("short") is None
+        assert cache.get("default") == 2
+
+        clock.now = 100
+        assert cache.expire() == 1
+        assert cache.keys() == ["forever"]
+        assert cache.stats()['expirations'] == 2
+
+    def test_byte_weight_limit(self):
+        cache = TTLCache(maxsize=None, max_bytes=10, weigh=len)
+        cache.set("a", "xxxx")
+        cache.set("b", "yyyy")
+        cache.set("c", "zzzz")      # 12 bytes: evicts a
+        cache.set("huge", "w" * 11)  # larger than the cache: not stored
+
+        assert cache.keys() == ["b", "c"]
+        assert cache.stats()['bytes'] == 8
+
+    def test_none_values_and_counters(self):
+        cache = TTLCache()
+        calls = []
+
+        for _ in range(3):
+            cache.get_or_set("k", lambda: calls.append(1))
+
+        assert len(calls) == 1  # cached None is a hit
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['hit_rate']) == (2, 1, 0.6667)
+
+    def test_tag_invalidation(self):
+        cache = TTLCache()
+        cache.set("python", 1, tags=["plugins", "plugin:python"])
+        cache.set("pytest", 2, tags=["plugins", "plugin:pytest"])
+        cache.set("other", 3)
+
+        assert cache.invalidate_tag("plugin:python") == 1
+        assert cache.keys() == ["pytest", "other"]
+        assert cache.invalidate_tag("plugins") == 1
+        assert cache.keys() == ["other"]
+
+    def test_overwrite_replaces_tags(self):
+        cache = TTLCache()
+        cache.set("k", 1, tags=["old"])
+        cache.set("k", 2, tags=["new"])
+
+        assert cache.invalidate_tag("old") == 0
+        assert cache.get("k") == 2
+
+    def test_large_cache_operations_stay_constant_time(self):
+        def timed(size):
+            cache = TTLCache(maxsize=size)
+            for i in range(size):
+                cache.set(i, i)
+            start = time.perf_counter()
+            for i in range(20000):
+                cache.get(i % size)
+                cache.set(size + i, i)
+            return time.perf_counter() - start
+
+        # The list-ordered LRUCache was ~100x slower at 50k entries than at 500
+        assert timed(50000) < timed(500) * 5
+
+    def test_thread_safety(self):
+        cache = TTLCache(maxsize=100)
+
+        def worker(offset):
+            for i in range(2000):
+                cache.set((offset, i % 150), i)
+                cache.get((offset, (i * 7) % 150))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 100
+        assert len(cache.keys()) == 100
+
+
+class TestRegistry:
+    """CACHE_REGISTRY reporting and invalidation."""
+
+    def test_stats_grouped_by_name(self):
+        first = TTLCache('test.grouped')
+        second = TTLCache('test.grouped')
+        first.set("a", 1)
+        second.set("b", 2)
+        first.get("a")
+        second.get("missing")
+
+        stats = CACHE_REGISTRY.stats()['test.grouped']
+
+        assert stats['instances'] == 2
+        assert stats['size'] == 2
+        assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+
+    def test_caches_held_weakly(self):
+        TTLCache('test.transient').set("a", 1)
+        gc.collect()
+
+        assert 'test.transient' not in CACHE_REGISTRY.stats()
+
+    def test_invalidate_across_caches(self):
+        first, second = TTLCache('test.tags.a'), TTLCache('test.tags.b')
+        first.set("x", 1, tags=["shared"])
+        second.set("y", 2, tags=["shared"])
+
+        assert CACHE_REGISTRY.invalidate_tag("shared") == 2
+        assert len(first) == len(second) == 0
+
+    def test_unnamed_caches_not_registered(self):
+        cache = TTLCache()
+
+        assert cache not in CACHE_REGISTRY.caches()
+
+
+class Repository:
+    def __init__(self):
+        self.loads = 0
+
+    @cached_method(name='test.repository', ttl=60, tags=lambda self, kind, key: [f"kind:{kind}"])
+    def load(self, kind, key):
+        self.loads += 1
+        return f"{kind}/{key}"
+
+
+class TestCachedMethod:
+    """Per-instance method memoization with tags."""
+
+    def test_memoizes_per_instance(self):
+        first, second = Repository(), Repository()
+
+        assert first.load("rule", 1) == first.load("rule", 1) == "rule/1"
+        second.load("rule", 1)
+
+        assert first.loads == second.loads == 1
+        assert Repository.load.cache(first).stats()['hits'] == 1
+
+    def test_invalidate_by_tag(self):
+        repo = Repository()
+        repo.load("rule", 1)
+        repo.load("policy", 1)
+
+        assert repo.load.invalidate_tag(repo, "kind:rule") == 1
+        repo.load("rule", 1)
+        repo.load("policy", 1)
+
+        assert repo.loads == 3
+
+    def test_registry_invalidation_reaches_instances(self):
+        repo = Repository()
+        repo.load("sop", "dev")
+
+        CACHE_REGISTRY.invalidate_tag("kind:sop")
+        repo.load("sop", "dev")
+
+        assert repo.loads == 2
+
+
+class TestMigratedCaches:
+    """Existing caches now backed by TTLCache."""
+
+    def test_lru_cache_keeps_api(self):
+        cache = LRUCache(size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.stats()['max_size'] == 2
+
+    def test_multi_level_cache_registered(self):
+        cache = MultiLevelCache(name='test.multi')
+        cache.set("k", "v")
+        cache.get("k")
+
+        stats = CACHE_REGISTRY.stats()
+        assert stats['test.multi.l1']['hits'] == 1
+        assert {'test.multi.l2', 'test.multi.l3'} <= stats.keys()
+
+    def test_plugin_registry(self):
+        from agentpm.core.plugins.registry import PluginRegistry
+
+        registry = PluginRegistry()
+        plugin = registry.get_plugin('python')
+
+        assert registry.get_plugin('python') is plugin
+        assert registry.get_plugin('cobol') is None
+        registry.get_plugin.invalidate_tag(registry, 'plugin:python')
+        assert registry.get_plugin('python') is not plugin
+
+    def test_sop_injector_revalidates_mtime(self, tmp_path):
+        import os
+        from agentpm.core.context.sop_injector import AgentSOPInjector
+
+        sop = tmp_path / '.claude' / 'agents' / 'dev.md'
+        sop.parent.mkdir(parents=True)
+        sop.write_text("v1")
+        injector = AgentSOPInjector(tmp_path)
+
+        assert injector.load_sop(1, 'dev') == "v1"
+        sop.write_text("v2")
+        os.utime(sop, (1, 1))
+
+        assert injector.load_sop(1, 'dev') == "v2"
+        assert injector.sop_cache.stats()['hits'] == 1
+
+    def test_graph_cache_per_pattern(self, tmp_path):
+        from agentpm.core.detection.graphs.service import DependencyGraphService
+
+        (tmp_path / "a.py").write_text("import b\n")
+        (tmp_path / "b.py").write_text("")
+        service = DependencyGraphService(tmp_path)
+
+        full = service.build_graph()
+        only_a = service.build_graph(file_pattern="a.py")
+
+        assert only_a is not full
+        assert service.build_graph() is full
@@ -0,0 +1,247 @@
+"""
+Unit tests for concurrent plugin execution.
+
+Covers:
+- run_plugins ordering, failure isolation, per-plugin timeouts and budget
+- PluginOrchestrator.enrich_context concurrency, merge order and timings
+- DetectionOrchestrator._detect_with_plugins concurrency and timeouts
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from agentpm.core.detection.models import DetectionResult, TechnologyMatch
+from agentpm.core.detection.orchestrator import DetectionOrchestrator
+from agentpm.core.plugins.base import BasePlugin, PluginCategory
+from agentpm.core.plugins.base.execution import (
+    STATUS_FAILED,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+    run_plugins,
+)
+from agentpm.core.plugins.orchestrator import PluginOrchestrator
+
+
+class FakePlugin(BasePlugin):
+    """Plugin whose work is a sleep (stands in for file I/O)."""
+
+    def __init__(self, tech: str, delay: float = 0.0, confidence: float = 0.9, fail: bool = False):
+        self._tech = tech
+        self.delay = delay
+        self.confidence = confidence
+        self.fail = fail
+
+    @property
+    def plugin_id(self) -> str:
+        return f"test:{self._tech}"
+
+    @property
+    def enriches(self) -> str:
+        return self._tech
+
+    @property
+    def category(self) -> PluginCategory:
+        return PluginCategory.LANGUAGE
+
+    def detect(self, project_path: Path) -> float:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("detect exploded")
+        return self.confidence
+
+    def extract_project_facts(self, project_path: Path) -> Dict[str, Any]:
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("extract exploded")
+        return {'technology': self._tech}
+
+    def generate_code_amalgamations(self, project_path: Path) -> Dict[str, str]:
+        return {'classes': f"# {self._tech} classes\nclass {self._tech.title()}:\n    pass\n"}
+
+
+def _detection(*techs):
+    return DetectionResult(
+        matches={
+            tech: TechnologyMatch(technology=tech, confidence=0.9, evidence=[], evidence_types=[])
+            for tech in techs
+        },
+        scan_time_ms=1.0,
+        project_path="/tmp/project"
+    )
+
+
+class TestRunPlugins:
+    """Test the run_plugins execution helper."""
+
+    def test_results_keep_input_order(self):
+        delays = [0.15, 0.0, 0.08, 0.02]
+
+        runs = run_plugins(delays, lambda delay, cancel: time.sleep(delay) or delay)
+
+        assert [run.value for run in runs] == delays
+        assert all(run.status == STATUS_OK for run in runs)
+
+    def test_runs_concurrently(self):
+        start = time.perf_counter()
+
+        run_plugins([0.2] * 5, lambda delay, cancel: time.sleep(delay))
+
+        assert time.perf_counter() - start < 0.6  # sequential would take 1.0s
+
+    def test_failure_is_isolated(self):
+        def work(item, cancel):
+            if item == 'bad':
+                raise ValueError("broken plugin")
+            return item
+
+        runs = run_plugins(['a', 'bad', 'c'], work)
+
+        assert [run.status for run in runs] == [STATUS_OK, STATUS_FAILED, STATUS_OK]
+        assert runs[1].error == "broken plugin"
+        assert runs[1].value is None
+
+    def test_slow_plugin_times_out(self):
+        start = time.perf_counter()
+
+        runs = run_plugins([0.0, 2.0], lambda delay, cancel: time.sleep(delay), timeout_s=0.2)
+
+        assert time.perf_counter() - start < 1.0
+        assert runs[0].status == STATUS_OK
+        assert runs[1].status == STATUS_TIMEOUT
+        assert runs[1].cancel.is_set()
+        assert runs[1].duration_ms >= 200
+
+    def test_budget_caps_whole_run(self):
+        start = time.perf_counter()
+
+        runs = run_plugins([2.0, 2.0, 0.0], lambda delay, cancel: time.sleep(delay), budget_s=0.2)
+
+        assert time.perf_counter() - start < 1.0
+        assert [run.status for run in runs] == [STATUS_TIMEOUT, STATUS_TIMEOUT, STATUS_OK]
+
+    def test_single_worker_runs_inline(self):
+        import threading
+
+        runs = run_plugins(['x', 'y'], lambda item, cancel: threading.current_thread(), max_workers=1)
+
+        assert all(run.value is threading.main_thread() for run in runs)
+
+    def test_empty_input(self):
+        assert run_plugins([], lambda item, cancel: item) == []
+
+
+class TestPluginOrchestratorConcurrency:
+    """Test concurrent enrichment in PluginOrchestrator."""
+
+    @pytest.fixture
+    def orchestrator(self, monkeypatch):
+        def _make(plugins, **kwargs):
+            orchestrator = PluginOrchestrator(**kwargs)
+            monkeypatch.setattr(orchestrator, 'load_plugins_for', lambda detection: list(plugins))
+            return orchestrator
+        return _make
+
+    def test_enrichment_bounded_by_slowest_plugin(self, orchestrator, tmp_path):
+        plugins = [FakePlugin(f"tech{i}", delay=0.2) for i in range(6)]
+
+        result = orchestrator(plugins).enrich_context(tmp_path, _detection())
+
+        assert result.total_plugins == 6
+        assert result.enrichment_time_ms < 900  # sequential would take 1200ms+
+
+    def test_deltas_merged_in_plugin_id_order(self, orchestrator, tmp_path):
+        plugins = [
+            FakePlugin("zeta", delay=0.0),
+            FakePlugin("alpha", delay=0.15),
+            FakePlugin("mid", delay=0.05),
+        ]
+
+        result = orchestrator(plugins).enrich_context(tmp_path, _detection())
+
+        assert [d.plugin_id for d in result.deltas] == ["test:alpha", "test:mid", "test:zeta"]
+        assert [t.plugin_id for t in result.plugin_timings] == ["test:alpha", "test:mid", "test:zeta"]
+
+    def test_timings_record_failures_and_timeouts(self, orchestrator, tmp_path):
+        plugins = [
+            FakePlugin("ok", delay=0.0),
+            FakePlugin("broken", fail=True),
+            FakePlugin("slow", delay=2.0),
+        ]
+
+        result = orchestrator(plugins, plugin_timeout_s=0.3).enrich_context(tmp_path, _detection())
+        timings = {t.plugin_id: t for t in result.plugin_timings}
+
+        assert [d.plugin_id for d in result.deltas] == ["test:ok"]
+        assert timings["test:ok"].status == "ok"
+        assert timings["test:broken"].status == "failed"
+        assert timings["test:broken"].error == "extract exploded"
+        assert timings["test:slow"].status == "timeout"
+        assert result.get_slowest_plugin().plugin_id == "test:slow"
+
+    def test_amalgamation_files_written(self, orchestrator, tmp_path):
+        result = orchestrator([FakePlugin("python")]).enrich_context(tmp_path, _detection())
+
+        files = result.deltas[0].additions['amalgamation_files']
+        assert (tmp_path / files['classes']).read_text().startswith("# python classes")
+
+    def test_timed_out_plugin_writes_no_files(self, orchestrator, tmp_path):
+        orchestrator([FakePlugin("slow", delay=0.5)], plugin_timeout_s=0.1).enrich_context(
+            tmp_path, _detection()
+        )
+        time.sleep(0.8)  # let the abandoned worker finish
+
+        assert not (tmp_path / ".agentpm" / "contexts" / "test_slow_classes.txt").exists()
+
+    def test_sequential_mode_matches_concurrent(self, orchestrator, tmp_path):
+        plugins = [FakePlugin("b"), FakePlugin("a"), FakePlugin("c")]
+
+        concurrent = orchestrator(plugins).enrich_context(tmp_path, _detection())
+        sequential = orchestrator(plugins, max_workers=1).enrich_context(tmp_path, _detection())
+
+        assert [d.model_dump() for d in concurrent.deltas] == [d.model_dump() for d in sequential.deltas]
+
+
+class TestDetectionOrchestratorConcurrency:
+    """Test concurrent Phase 2 detection in DetectionOrchestrator."""
+
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        def _make(plugins, **kwargs):
+            orchestrator = DetectionOrchestrator(**kwargs)
+            monkeypatch.setattr(orchestrator, '_load_plugins', lambda candidates: list(plugins))
+            return orchestrator
+        return _make
+
+    def test_detection_bounded_by_slowest_plugin(self, detector, tmp_path):
+        plugins = [FakePlugin(f"tech{i}", delay=0.2) for i in range(6)]
+        orchestrator = detector(plugins)
+
+        start = time.perf_counter()
+        matches = orchestrator._detect_with_plugins(tmp_path, {p.enriches for p in plugins})
+
+        assert time.perf_counter() - start < 0.9
+        assert sorted(matches) == [f"tech{i}" for i in range(6)]
+
+    def test_failed_and_slow_plugins_not_matched(self, detector, tmp_path):
+        plugins = [
+            FakePlugin("fast"),
+            FakePlugin("broken", fail=True),
+            FakePlugin("slow", delay=2.0),
+            FakePlugin("weak", confidence=0.1),
+        ]
+        orchestrator = detector(plugins, plugin_timeout_s=0.3)
+
+        matches = orchestrator._detect_with_plugins(tmp_path, set())
+
+        assert list(matches) == ["fast"]
+        assert set(orchestrator._last_plugin_times) == {"fast", "broken", "slow", "weak"}
+
+    def test_load_plugins_is_deterministic(self):
+        orchestrator = DetectionOrchestrator()
+
+        plugins = orchestrator._load_plugins({'pytest', 'python', 'django', 'click'})
+
+        assert [p.enriches for p in plugins] == sorted(p.enriches for p in plugins)
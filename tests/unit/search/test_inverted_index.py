@@ -0,0 +1,297 @@
+"""
+Tests for the inverted index behind TextSearchEngine (core/search/methods.py).
+
+Covers:
+- Postings, document lengths and cached IDF
+- calculate_tf_idf / tf_idf_scores parity with the previous per-call corpus scan
+- BM25 top-k order matches a brute-force scorer; rank() over SearchResults
+- Index reuse per snapshot and rebuild when entity versions change
+- BM25 ranking of the LIKE fallback search
+- Benchmark: ranking 5k candidates
+"""
+
+import math
+import random
+import re
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from agentpm.core.database.enums import EntityType
+from agentpm.core.database.service import DatabaseService
+from agentpm.core.search.fts5_service import FTS5SearchService
+from agentpm.core.database.models.search_result import SearchResult, SearchResultType
+from agentpm.core.search.methods import InvertedIndex, TextSearchEngine
+from agentpm.core.search.models import SearchConfig, SearchQuery
+
+
+WORDS = (
+    "database migration schema cache index search ranking workflow agent session task "
+    "pipeline deploy review context summary token budget plugin detection rollback"
+).split()
+
+
+def _corpus(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randrange(3, 40)))
+        for _ in range(count)
+    ]
+
+
+def legacy_tokenize(engine, text):
+    if not text:
+        return []
+    text = re.sub(r'[^\w\s]', ' ', text.lower())
+    return [word for word in text.split() if word not in engine.stop_words and len(word) > 2]
+
+
+def legacy_tf_idf(engine, term, document, corpus):
+    """Previous implementation: tokenizes the whole corpus on every call"""
+    doc_words = legacy_tokenize(engine, document)
+    tf = doc_words.count(term.lower()) / len(doc_words) if doc_words else 0
+    doc_freq = sum(1 for doc in corpus if term.lower() in legacy_tokenize(engine, doc))
+    idf = 1.0 if doc_freq == 0 else len(corpus) / doc_freq
+    return tf * idf
+
+
+def brute_force_bm25(documents, terms, k1=1.2, b=0.75):
+    """Reference BM25 straight from the formula"""
+    avg = sum(len(doc) for doc in documents) / len(documents)
+    df = {term: sum(1 for doc in documents if term in doc) for term in set(terms)}
+    scores = {}
+    for position, doc in enumerate(documents):
+        score = 0.0
+        for term in set(terms):
+            tf = doc.count(term)
+            if not tf:
+                continue
+            idf = math.log(1 + (len(documents) - df[term] + 0.5) / (df[term] + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(doc) / avg))
+        if score:
+            scores[position] = score
+    return sorted(scores, key=lambda position: (-scores[position], position))
+
+
+def _results(texts, updated_at=None):
+    now = updated_at or datetime(2025, 1, 1)
+    return [
+        SearchResult(
+            id=i + 1, entity_type=EntityType.TASK, entity_id=i + 1, result_type=SearchResultType.TASK,
+            title=f"Task {i + 1}", content=text, relevance_score=0.5, match_type="fuzzy",
+            search_query="q", updated_at=now,
+        )
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def engine():
+    return TextSearchEngine(SearchConfig())
+
+
+class TestInvertedIndex:
+    """Index structure."""
+
+    def test_postings_lengths_and_idf(self):
+        index = InvertedIndex([
+            ("a", ["cache", "index", "cache"]),
+            ("b", ["index"]),
+            ("c", []),
+        ])
+
+        assert index.postings["cache"] == {"a": 2}
+        assert index.document_frequency("index") == 2
+        assert index.term_frequency("cache", "b") == 0
+        assert index.doc_lengths == {"a": 3, "b": 1, "c": 0}
+        assert index.avg_doc_length == pytest.approx(4 / 3)
+        assert index.idf("cache") == pytest.approx(math.log(1 + 2.5 / 1.5))
+        assert index.idf("cache") is index.idf("cache")  # cached
+
+    def test_corpus_index_reused_without_rereading(self, engine):
+        corpus = _corpus(100)
+        engine.calculate_tf_idf("cache", corpus[0], corpus)
+        index = engine._indexes.get('corpus')
+
+        with patch.object(engine, 'build_index', side_effect=AssertionError("rebuilt")):
+            engine.tf_idf_scores(["cache"], corpus)
+            engine.calculate_tf_idf("index", corpus[1], corpus)
+
+        assert engine._indexes.get('corpus') is index
+        corpus.append("cache cache")
+        assert engine.tf_idf_scores(["cache"], corpus)[-1] > 0  # length change rebuilds
+        assert engine.calculate_tf_idf("cache", "cache", corpus, corpus_version=1) == \
+            engine.calculate_tf_idf("cache", "cache", list(corpus), corpus_version=1)
+
+    def test_in_place_edit_same_length_rebuilds(self, engine):
+        corpus = ["cache index", "index only"]
+        assert engine.tf_idf_scores(["cache"], corpus)[1] == 0
+
+        corpus[1] = "cache cache"  # same list, same length
+
+        assert engine.tf_idf_scores(["cache"], corpus)[1] > 0
+
+    def test_token_cache_not_keyed_by_text(self, engine):
+        text = "database migration " * 200
+        engine.calculate_relevance("migration", text)
+
+        assert all(not isinstance(key, str) for key in engine._token_cache._entries)
+
+    def test_top_k_ties_follow_corpus_order(self):
+        index = InvertedIndex([(key, ["same"]) for key in "xyz"])
+
+        assert [key for key, _ in index.top_k(["same"], 2)] == ["x", "y"]
+        assert index.top_k(["missing"], 5) == []
+
+
+class TestParity:
+    """Index-backed scoring matches the previous and reference implementations."""
+
+    def test_tf_idf_matches_legacy(self, engine):
+        corpus = _corpus(150) + ["", "the and of"]
+
+        for term in ("cache", "INDEX", "rollback", "missing", "the"):
+            for document in corpus[:40] + corpus[-2:]:
+                assert engine.calculate_tf_idf(term, document, corpus) == \
+                    pytest.approx(legacy_tf_idf(engine, term, document, corpus))
+
+    def test_tf_idf_top_k_order(self, engine):
+        corpus = _corpus(200, seed=11)
+        terms = ["deploy", "Cache"]
+
+        def top(scores):
+            return sorted(range(len(corpus)), key=lambda i: (-scores[i], i))[:10]
+
+        legacy = [sum(legacy_tf_idf(engine, term, doc, corpus) for term in terms) for doc in corpus]
+        scores = engine.tf_idf_scores(terms, corpus)
+
+        assert scores == pytest.approx(legacy)
+        assert top(scores) == top(legacy)
+
+    @pytest.mark.parametrize("query", ["cache", "schema migration rollback", "agent token budget plugin"])
+    def test_bm25_top_k_order(self, engine, query):
+        corpus = _corpus(5000, seed=3)
+        documents = [engine.tokenize(text) for text in corpus]
+        index = engine.build_index(enumerate(corpus))
+
+        expected = brute_force_bm25(documents, engine.tokenize(query))[:20]
+
+        assert [position for position, _ in index.top_k(engine.tokenize(query), 20)] == expected
+
+    def test_highlight_and_relevance_unchanged(self, engine):
+        text = "Rebuild the Search index. Search ranking uses the index."
+
+        assert engine.highlight_matches(text, "search") == \
+            "Rebuild the **search** index. **search** ranking uses the index."
+        assert engine.highlight_matches("a\\d b", "\\d") == "a**\\d** b"
+        assert engine.calculate_relevance("ranking index", "index cache ranking") == pytest.approx(2 / 3)
+
+
+class TestRank:
+    """BM25 ranking of SearchResults with snapshot invalidation."""
+
+    def test_orders_and_normalizes(self, engine):
+        results = _results([
+            "cache warmup",
+            "cache cache index",
+            "unrelated words",
+            "index alongside several longer unrelated padding words",
+        ])
+
+        ranked = engine.rank("cache index", results)
+
+        assert [r.entity_id for r in ranked] == [2, 1, 4, 3]
+        assert ranked[0].relevance_score == 1.0
+        assert 0.0 < ranked[1].relevance_score < 1.0
+        assert ranked[-1].relevance_score == 0.0
+        assert [r.entity_id for r in engine.rank("cache index", results, limit=2)] == [2, 1]
+
+    def test_index_reused_until_entity_version_changes(self, engine):
+        results = _results(_corpus(50))
+
+        engine.rank("cache", results)
+        first = engine._indexes.get('results')
+        engine.rank("index", results)
+
+        assert engine._indexes.get('results') is first
+
+        results[3].updated_at += timedelta(minutes=1)
+        results[3].content = "rollback rollback rollback"
+        ranked = engine.rank("rollback", results)
+
+        assert engine._indexes.get('results') is not first
+        assert ranked[0].entity_id == 4
+
+
+class TestFallbackSearch:
+    """LIKE fallback results are ranked with BM25."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        db = DatabaseService(str(tmp_path / "search.db"))
+        with db.connect() as conn:
+            conn.executemany(
+                "INSERT INTO search_index (entity_id, entity_type, title, content, tags, metadata) "
+                "VALUES (?, 'task', ?, ?, '', '{}')",
+                [
+                    (1, "Cache notes", "Unrelated padding words about the deploy pipeline and review"),
+                    (2, "Schema", "nothing relevant here at all"),
+                    (3, "Cache cache", "cache invalidation and cache warmup"),
+                ],
+            )
+            conn.commit()
+        with patch.object(FTS5SearchService, '_check_fts5_availability', return_value=False):
+            yield FTS5SearchService(db)
+
+    def test_ranked_by_bm25_then_paginated(self, service):
+        results = service.search(SearchQuery(query="cache", limit=1))
+
+        assert results.total_results == 2
+        assert [r.entity_id for r in results.results] == [3]
+        assert results.results[0].relevance_score == 1.0
+        assert [r.entity_id for r in service.search(SearchQuery(query="cache", limit=5, offset=1)).results] == [1]
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+class TestRankingBenchmark:
+    """Ranking 5k candidates: previous TF-IDF scan vs inverted index."""
+
+    CANDIDATES = 5000
+    LEGACY_CANDIDATES = 250  # the previous path is quadratic; 5k takes minutes
+
+    def test_rank_5k_candidates(self, engine, capsys):
+        corpus = _corpus(self.CANDIDATES, seed=5)
+        legacy_corpus = corpus[:self.LEGACY_CANDIDATES]
+        terms = ["schema", "rollback", "budget"]
+
+        start = time.perf_counter()
+        for doc in legacy_corpus:
+            sum(legacy_tf_idf(engine, term, doc, legacy_corpus) for term in terms)
+        legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine.tf_idf_scores(terms, corpus)
+        tf_idf = time.perf_counter() - start
+
+        results = _results(corpus)
+        start = time.perf_counter()
+        engine.rank(" ".join(terms), results, limit=20)
+        cold = time.perf_counter() - start
+        warm = cold
+        for _ in range(3):  # fastest warm run, so a GC pause cannot flip the comparison
+            start = time.perf_counter()
+            engine.rank(" ".join(terms), results, limit=20)
+            warm = min(warm, time.perf_counter() - start)
+
+        with capsys.disabled():
+            print()
+            print(f"  legacy tf-idf   {self.LEGACY_CANDIDATES:>5} docs  {legacy * 1000:>9.1f} ms")
+            print(f"  indexed tf-idf  {self.CANDIDATES:>5} docs  {tf_idf * 1000:>9.1f} ms")
+            print(f"  bm25 rank cold  {self.CANDIDATES:>5} docs  {cold * 1000:>9.1f} ms")
+            print(f"  bm25 rank warm  {self.CANDIDATES:>5} docs  {warm * 1000:>9.1f} ms")
+
+        assert tf_idf < legacy  # 20x the candidates in less time
+        assert warm < cold
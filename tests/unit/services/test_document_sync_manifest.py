@@ -0,0 +1,342 @@
+"""
+Tests for manifest-driven DocumentPublisher.sync_all
+
+Covers:
+- Unchanged files are not re-hashed on later runs
+- Missing and changed public copies are re-published atomically
+- Check mode (dry_run) reports drift without writing files or manifest
+- Pruning of files sync published whose source is gone
+- Manifest survives interrupted and corrupted runs
+- Paths are anchored to the project root, not the working directory
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from agentpm.core.database.enums import (
+    DocumentFormat,
+    DocumentLifecycle,
+    DocumentType,
+    DocumentVisibility,
+    EntityType,
+    StorageMode,
+    SyncStatus,
+)
+from agentpm.core.database.methods import document_references as doc_methods
+from agentpm.core.database.models.document_reference import DocumentReference
+from agentpm.core.database.service import DatabaseService
+from agentpm.core.services import document_publisher
+from agentpm.core.services.document_publisher import (
+    DocumentPublisher,
+    PublishManifest,
+    TEMP_SUFFIX,
+)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Run in a temporary project directory"""
+    (tmp_path / ".agentpm").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def db(workspace):
+    return DatabaseService(workspace / "test.db")
+
+
+@pytest.fixture
+def publisher(db):
+    return DocumentPublisher(db)
+
+
+def _published_doc(db, name, content="# Guide\n\nBody.", write_source=True):
+    doc = DocumentReference(
+        entity_type=EntityType.WORK_ITEM,
+        entity_id=1,
+        category="guides",
+        document_type=DocumentType.USER_GUIDE,
+        filename=f"{name}.md",
+        file_path=f"docs/guides/user_guide/{name}.md",
+        title=name,
+        format=DocumentFormat.MARKDOWN,
+        content=content,
+        storage_mode=StorageMode.HYBRID,
+        sync_status=SyncStatus.SYNCED,
+        created_by="test-user",
+    )
+    doc.lifecycle_stage = DocumentLifecycle.PUBLISHED.value
+    doc.visibility = DocumentVisibility.PUBLIC.value
+    doc.published_path = f"site/{name}.md"
+    created = doc_methods.create_document_reference(db, doc)
+
+    if write_source and content is not None:
+        source = Path(created.computed_path)
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text(content, encoding="utf-8")
+    return created
+
+
+@pytest.fixture
+def docs(db):
+    return [_published_doc(db, f"guide-{i}", f"# Guide {i}\n") for i in range(5)]
+
+
+def _manifest(publisher):
+    return json.loads(publisher.manifest_path.read_text(encoding="utf-8"))
+
+
+class TestIncrementalSync:
+    """Unchanged files skip hashing; drift is re-published"""
+
+    def test_first_sync_publishes_and_records_manifest(self, publisher, docs):
+        result = publisher.sync_all()
+
+        assert len(result.stats["missing_dest"]) == 5
+        assert Path("site/guide-3.md").read_text(encoding="utf-8") == "# Guide 3\n"
+        assert set(_manifest(publisher)["published"]) == {f"site/guide-{i}.md" for i in range(5)}
+        assert not list(Path("site").glob(f"*{TEMP_SUFFIX}"))
+
+    def test_unchanged_files_are_not_rehashed(self, publisher, docs):
+        publisher.sync_all()
+
+        result = publisher.sync_all()
+
+        assert result.stats["hashed"] == 0
+        assert result.stats["synced"] == 5
+        assert not result.has_drift
+
+    def test_changed_public_copy_is_restored(self, publisher, docs):
+        publisher.sync_all()
+        Path("site/guide-1.md").write_text("edited by hand", encoding="utf-8")
+
+        result = publisher.sync_all()
+
+        assert result.stats["hashed"] == 1
+        assert [m["dest"] for m in result.stats["content_mismatch"]] == ["site/guide-1.md"]
+        assert Path("site/guide-1.md").read_text(encoding="utf-8") == "# Guide 1\n"
+        assert publisher.sync_all().stats["hashed"] == 0
+
+    def test_source_file_hashed_only_when_changed(self, publisher, db):
+        doc = _published_doc(db, "file-only", content=None)
+        source = Path(doc.computed_path)
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text("v1", encoding="utf-8")
+
+        publisher.sync_all()
+        assert publisher.sync_all().stats["hashed"] == 0
+
+        source.write_text("version 2", encoding="utf-8")
+        result = publisher.sync_all()
+
+        assert result.stats["hashed"] == 1  # destination still matches its cached entry
+        assert Path("site/file-only.md").read_text(encoding="utf-8") == "version 2"
+
+    def test_edited_source_is_republished(self, publisher, docs):
+        publisher.sync_all()
+        Path(docs[3].computed_path).write_text("# Guide 3, revised\n", encoding="utf-8")
+
+        assert publisher.sync_all(dry_run=True).has_drift
+        result = publisher.sync_all()
+
+        assert result.stats["hashed"] == 1  # only the edited source
+        assert [m["dest"] for m in result.stats["content_mismatch"]] == ["site/guide-3.md"]
+        assert Path("site/guide-3.md").read_text(encoding="utf-8") == "# Guide 3, revised\n"
+        assert not publisher.sync_all(dry_run=True).has_drift
+
+    def test_source_file_wins_over_database_content(self, publisher, docs):
+        publisher.sync_all()
+        source = Path(docs[0].computed_path)
+        source.write_text("# Guide 0, edited\n", encoding="utf-8")
+        Path("site/guide-0.md").write_text("# Guide 0, edited\n", encoding="utf-8")  # as publish() copies it
+
+        assert not publisher.sync_all(dry_run=True).has_drift
+        publisher.sync_all()
+
+        assert Path("site/guide-0.md").read_text(encoding="utf-8") == "# Guide 0, edited\n"
+
+    def test_missing_source_restored_from_database(self, publisher, docs):
+        publisher.sync_all()
+        Path(docs[2].computed_path).unlink()
+
+        result = publisher.sync_all()
+
+        assert result.stats["missing_source"] == [docs[2].computed_path]
+        assert Path(docs[2].computed_path).read_text(encoding="utf-8") == "# Guide 2\n"
+        assert result.stats["pruned"] == []
+
+    def test_parallel_copies(self, publisher, db):
+        for i in range(40):
+            _published_doc(db, f"bulk-{i}", f"# Bulk {i}\n")
+
+        result = publisher.sync_all(max_workers=4)
+
+        assert len(result.stats["synced_files"]) == 40
+        assert all(Path(f"site/bulk-{i}.md").read_text(encoding="utf-8") == f"# Bulk {i}\n" for i in range(40))
+
+
+class TestCheckMode:
+    """dry_run reports drift and writes nothing"""
+
+    def test_reports_drift_without_writing(self, publisher, docs):
+        publisher.sync_all()
+        before = publisher.manifest_path.read_bytes()
+        Path("site/guide-0.md").unlink()
+        Path("site/guide-4.md").write_text("stale", encoding="utf-8")
+        doc_methods.delete_document_reference(publisher.db, docs[1].id)
+
+        result = publisher.sync_all(dry_run=True)
+
+        assert result.has_drift
+        assert result.stats["missing_dest"] == ["site/guide-0.md"]
+        assert [m["dest"] for m in result.stats["content_mismatch"]] == ["site/guide-4.md"]
+        assert result.stats["pruned"] == ["site/guide-1.md"]
+        assert not Path("site/guide-0.md").exists()
+        assert Path("site/guide-4.md").read_text(encoding="utf-8") == "stale"
+        assert Path("site/guide-1.md").exists()
+        assert publisher.manifest_path.read_bytes() == before
+
+    def test_in_sync_has_no_drift(self, publisher, docs):
+        publisher.sync_all()
+
+        assert not publisher.sync_all(dry_run=True).has_drift
+
+
+class TestPruning:
+    """Only files sync published are removed"""
+
+    def test_prunes_published_copy_of_removed_document(self, publisher, docs):
+        publisher.sync_all()
+        Path("site/handwritten.md").write_text("not managed", encoding="utf-8")
+        doc_methods.delete_document_reference(publisher.db, docs[3].id)
+
+        result = publisher.sync_all()
+
+        assert result.stats["pruned"] == ["site/guide-3.md"]
+        assert not Path("site/guide-3.md").exists()
+        assert Path("site/handwritten.md").exists()
+        assert "site/guide-3.md" not in _manifest(publisher)["published"]
+
+    def test_prunes_when_source_gone_and_no_content(self, publisher, db):
+        doc = _published_doc(db, "file-only", content=None)
+        source = Path(doc.computed_path)
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text("text", encoding="utf-8")
+        publisher.sync_all()
+
+        source.unlink()
+        result = publisher.sync_all()
+
+        assert result.stats["missing_source"] == [str(source)]
+        assert result.stats["pruned"] == ["site/file-only.md"]
+        assert not Path("site/file-only.md").exists()
+
+
+class TestInterruptedRuns:
+    """Manifest stays valid across failures"""
+
+    def test_completed_copies_survive_failed_run(self, publisher, docs, monkeypatch):
+        real_write = document_publisher._atomic_write
+
+        def failing_write(dest, source=None, data=None):
+            if dest.match("site/guide-2.md"):
+                raise OSError("disk full")
+            return real_write(dest, source=source, data=data)
+
+        monkeypatch.setattr(document_publisher, "_atomic_write", failing_write)
+        with pytest.raises(OSError):
+            publisher.sync_all(max_workers=1)
+
+        published = _manifest(publisher)["published"]
+        assert "site/guide-2.md" not in published
+        assert len(published) == 4  # every other copy finished and was saved
+
+        monkeypatch.setattr(document_publisher, "_atomic_write", real_write)
+        result = publisher.sync_all()
+
+        assert result.stats["missing_dest"] == ["site/guide-2.md"]
+        assert result.stats["hashed"] == 0
+
+    def test_leftover_temp_files_are_swept(self, publisher, docs):
+        publisher.sync_all()
+        leftover = Path(f"site/.guide-0.md.abc123{TEMP_SUFFIX}")
+        leftover.write_text("partial", encoding="utf-8")
+        Path("site/guide-0.md").unlink()
+
+        publisher.sync_all()
+
+        assert not leftover.exists()
+
+    def test_leftover_source_and_manifest_temp_files_are_swept(self, publisher, docs):
+        publisher.sync_all()
+        source = Path(docs[0].computed_path)
+        leftovers = [
+            source.parent / f".{source.name}.abc123{TEMP_SUFFIX}",
+            publisher.manifest_path.parent / f".{publisher.manifest_path.name}.abc123{TEMP_SUFFIX}",
+        ]
+        for leftover in leftovers:
+            leftover.write_text("partial", encoding="utf-8")
+
+        publisher.sync_all()
+
+        assert not any(leftover.exists() for leftover in leftovers)
+
+    def test_corrupt_manifest_is_rebuilt(self, publisher, docs):
+        publisher.sync_all()
+        publisher.manifest_path.write_text('{"version": 1, "files": {', encoding="utf-8")
+
+        result = publisher.sync_all()
+
+        assert result.stats["hashed"] == 10  # every source and published copy
+        assert not result.has_drift
+        assert len(_manifest(publisher)["files"]) == 10
+
+
+def test_manifest_hash_keyed_by_size_and_mtime(workspace):
+    path = workspace / "file.md"
+    path.write_text("abc", encoding="utf-8")
+    manifest = PublishManifest(workspace / "manifest.json")
+
+    first = manifest.file_hash(path)
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns))
+    manifest.file_hash(path)
+    assert manifest.hashed == 1
+
+    stat = path.stat()
+    path.write_text("xyz", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert manifest.file_hash(path) != first
+    assert manifest.hashed == 2
+    assert manifest.file_hash(workspace / "missing.md") is None
+
+
+class TestProjectRoot:
+    """Runs from anywhere in the project share one manifest"""
+
+    def test_sync_from_subdirectory(self, workspace, db, docs, monkeypatch):
+        DocumentPublisher(db).sync_all()
+        monkeypatch.chdir(workspace / "site")
+
+        publisher = DocumentPublisher(db)
+        result = publisher.sync_all()
+
+        assert publisher.manifest_path == workspace / ".agentpm" / "publish_manifest.json"
+        assert result.stats["hashed"] == 0
+        assert not result.has_drift
+        assert not (workspace / "site" / ".agentpm").exists()
+        assert not (workspace / "site" / "site").exists()
+
+    def test_root_follows_database_location(self, tmp_path, monkeypatch):
+        data_dir = tmp_path / "project" / ".agentpm" / "data"
+        data_dir.mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+
+        publisher = DocumentPublisher(DatabaseService(data_dir / "agentpm.db"))
+
+        assert publisher.project_root == tmp_path / "project"
+        assert publisher.manifest_path == tmp_path / "project" / ".agentpm" / "publish_manifest.json"
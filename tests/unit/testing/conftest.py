@@ -0,0 +1,84 @@
+"""
+Fixture project for the test-impact runner.
+
+A small package with its own pytest suite, written to a temporary directory:
+
+    calc/arith.py       add, sub
+    calc/geometry.py    perimeter (uses arith.add)
+    calc/strings.py     shout
+    tests/test_arith.py, tests/test_geometry.py, tests/test_strings.py
+"""
+
+import pytest
+
+
+IMPACT_PROJECT = {
+    "conftest.py": "",
+    "calc/__init__.py": "",
+    "calc/arith.py": (
+        "def add(a, b):\n"
+        "    return a + b\n"
+        "\n"
+        "\n"
+        "def sub(a, b):\n"
+        "    return a - b\n"
+    ),
+    "calc/geometry.py": (
+        "from calc.arith import add\n"
+        "\n"
+        "\n"
+        "def perimeter(width, height):\n"
+        "    return 2 * add(width, height)\n"
+    ),
+    "calc/strings.py": (
+        "def shout(text):\n"
+        "    return text.upper() + '!'\n"
+    ),
+    "tests/test_arith.py": (
+        "from calc.arith import add, sub\n"
+        "\n"
+        "\n"
+        "def test_add():\n"
+        "    assert add(2, 3) == 5\n"
+        "\n"
+        "\n"
+        "def test_sub():\n"
+        "    assert sub(5, 3) == 2\n"
+    ),
+    "tests/test_geometry.py": (
+        "from calc.geometry import perimeter\n"
+        "\n"
+        "\n"
+        "def test_perimeter():\n"
+        "    assert perimeter(2, 3) == 10\n"
+    ),
+    "tests/test_strings.py": (
+        "import pytest\n"
+        "\n"
+        "from calc.strings import shout\n"
+        "\n"
+        "\n"
+        "@pytest.mark.parametrize('text', ['hi', 'yo'])\n"
+        "def test_shout(text):\n"
+        "    assert shout(text) == text.upper() + '!'\n"
+    ),
+}
+
+ALL_TESTS = {
+    "tests/test_arith.py::test_add",
+    "tests/test_arith.py::test_sub",
+    "tests/test_geometry.py::test_perimeter",
+    "tests/test_strings.py::test_shout[hi]",
+    "tests/test_strings.py::test_shout[yo]",
+}
+
+
+@pytest.fixture
+def impact_project(tmp_path):
+    """Write the fixture project and return its root"""
+    root = tmp_path / "project"
+    for rel_path, content in IMPACT_PROJECT.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
@@ -0,0 +1,183 @@
+"""
+Tests for the test-impact coverage runner (core/testing/impact.py).
+
+Runs the fixture project's suite under coverage and checks that later
+runs select only the tests affected by changed files.
+"""
+
+import os
+
+import pytest
+
+from agentpm.core.testing import CategoryCoverageCalculator, ImpactRunner
+
+from .conftest import ALL_TESTS
+
+
+def _edit(root, rel_path, old, new):
+    path = root / rel_path
+    path.write_text(path.read_text().replace(old, new))
+
+
+@pytest.fixture
+def runner(impact_project):
+    return ImpactRunner(str(impact_project), pytest_args=['-p', 'no:cacheprovider'])
+
+
+@pytest.fixture
+def recorded(runner):
+    result = runner.run()
+    assert result.success
+    return runner
+
+
+class TestRecording:
+    """First run records per-test lines"""
+
+    def test_first_run_is_full_and_maps_every_test(self, runner):
+        result = runner.run()
+
+        assert result.selection.full_run
+        assert result.tests_recorded == len(ALL_TESTS)
+        assert runner.impact_map.tests_touching(["calc/strings.py"]) == {
+            "tests/test_strings.py::test_shout[hi]", "tests/test_strings.py::test_shout[yo]",
+        }
+
+    def test_lines_recorded_per_test(self, recorded):
+        add_lines = recorded.impact_map.lines_for("tests/test_arith.py::test_add")["calc/arith.py"]
+        sub_lines = recorded.impact_map.lines_for("tests/test_arith.py::test_sub")["calc/arith.py"]
+
+        assert 2 in add_lines and 6 not in add_lines
+        assert 6 in sub_lines and 2 not in sub_lines
+
+    def test_coverage_report_shape(self, recorded):
+        files = recorded.impact_map.coverage_report()['files']
+
+        assert files["calc/arith.py"]['summary']['num_statements'] == 4
+        assert files["calc/arith.py"]['summary']['covered_lines'] == 4
+
+
+class TestSelection:
+    """Later runs select only affected tests"""
+
+    def test_nothing_changed(self, recorded):
+        os.utime(recorded.project_path / "calc/arith.py")  # touched, same content
+
+        selection = recorded.select()
+
+        assert not selection.full_run
+        assert selection.changed_files == []
+        assert not selection.has_work
+
+    def test_changed_source_selects_touching_tests(self, recorded):
+        _edit(recorded.project_path, "calc/strings.py", "'!'", "'!!'")
+
+        selection = recorded.select()
+
+        assert selection.changed_files == ["calc/strings.py"]
+        assert set(selection.targets) == {
+            "tests/test_strings.py::test_shout[hi]", "tests/test_strings.py::test_shout[yo]",
+        }
+
+    def test_transitive_use_is_selected(self, recorded):
+        _edit(recorded.project_path, "calc/arith.py", "return a + b", "return b + a")
+
+        assert set(recorded.select().targets) == {
+            "tests/test_arith.py::test_add",
+            "tests/test_arith.py::test_sub",
+            "tests/test_geometry.py::test_perimeter",
+        }
+
+    def test_changed_test_file_runs_whole_file(self, recorded):
+        _edit(recorded.project_path, "tests/test_arith.py", "def test_sub", "def test_subtract")
+
+        result = recorded.run()
+
+        assert result.selection.targets == ["tests/test_arith.py"]
+        assert result.tests_recorded == 2
+        assert recorded.impact_map.tests_touching(["tests/test_arith.py"]) == {
+            "tests/test_arith.py::test_add", "tests/test_arith.py::test_subtract",
+        }
+
+    def test_new_and_deleted_test_files(self, recorded):
+        (recorded.project_path / "tests/test_extra.py").write_text(
+            "from calc.arith import sub\n\n\ndef test_extra():\n    assert sub(1, 1) == 0\n"
+        )
+        (recorded.project_path / "tests/test_geometry.py").unlink()
+
+        result = recorded.run()
+
+        assert result.selection.targets == ["tests/test_extra.py"]
+        touching = recorded.impact_map.tests_touching(["calc/arith.py"])
+        assert "tests/test_extra.py::test_extra" in touching
+        assert "tests/test_geometry.py::test_perimeter" not in touching
+
+    def test_run_updates_hashes(self, recorded):
+        _edit(recorded.project_path, "calc/strings.py", "'!'", "'!!'")
+        _edit(recorded.project_path, "tests/test_strings.py", "'!'", "'!!'")
+
+        assert recorded.run().success
+        assert not recorded.select().has_work
+
+    def test_import_time_only_change_runs_everything(self, runner):
+        root = runner.project_path
+        (root / "calc/consts.py").write_text("FACTOR = 2\n")
+        _edit(root, "calc/geometry.py", "return 2 * add", "return FACTOR * add")
+        _edit(root, "calc/geometry.py", "from calc.arith import add\n",
+              "from calc.arith import add\nfrom calc.consts import FACTOR\n")
+        assert runner.run().success
+
+        _edit(root, "calc/consts.py", "FACTOR = 2", "FACTOR = 3")
+        selection = runner.select()
+
+        assert selection.full_run
+        assert "calc/consts.py" in selection.full_run_reason
+        result = runner.run()
+        assert not result.success  # test_perimeter now fails
+        assert runner.select().full_run  # and is selected again
+
+    def test_conftest_change_runs_everything(self, recorded):
+        (recorded.project_path / "conftest.py").write_text("import pytest\n")
+
+        selection = recorded.select()
+
+        assert selection.full_run
+        assert "conftest.py" in selection.full_run_reason
+
+    def test_failed_run_is_selected_again(self, recorded):
+        _edit(recorded.project_path, "calc/strings.py", "'!'", "'?'")
+
+        first = recorded.run()
+        again = recorded.select()
+
+        assert not first.success
+        assert set(again.targets) == set(first.selection.targets)
+
+
+class TestWorkers:
+    """Selected tests split across processes, data combined"""
+
+    def test_parallel_full_run(self, runner):
+        result = runner.run(workers=3)
+
+        assert result.success
+        assert result.workers == 3
+        assert result.tests_recorded == len(ALL_TESTS)
+
+    def test_parallel_incremental_run(self, recorded):
+        _edit(recorded.project_path, "calc/arith.py", "return a + b", "return b + a")
+
+        result = recorded.run(workers=2)
+
+        assert result.workers == 2
+        assert result.tests_recorded == 3
+        assert len(recorded.impact_map.tests_touching(["calc/arith.py"])) == 3
+
+
+def test_category_coverage_reads_impact_map(impact_project):
+    calculator = CategoryCoverageCalculator(str(impact_project))
+
+    data = calculator._run_impact_command()
+
+    assert data['files']["calc/geometry.py"]['summary'] == {'covered_lines': 3, 'num_statements': 3}
+    assert ImpactRunner(str(impact_project)).select().changed_files == []
@@ -0,0 +1,187 @@
+"""
+Tests for conditional GETs driven by table change versions.
+
+Covers:
+- table_versions counters bumped by insert/update/delete triggers (migration 0055)
+- conditional_view: ETag/Last-Modified emission, 304 while unchanged,
+  invalidation on writes to dependent tables only, HTMX fragments keyed separately,
+  daily views keyed by date
+"""
+
+from datetime import date
+
+import pytest
+from flask import Flask, flash
+
+from agentpm.core.database.methods import table_versions
+from agentpm.core.database.service import DatabaseService
+from agentpm.web.blueprints import utils as blueprint_utils
+from agentpm.web.blueprints.utils import conditional_view
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseService(str(tmp_path / "versions.db"))
+
+
+@pytest.fixture
+def project_id(db):
+    with db.connect() as conn:
+        project_id = conn.execute(
+            "INSERT INTO projects (name, path) VALUES ('Versions', '/tmp/versions')"
+        ).lastrowid
+        conn.commit()
+    return project_id
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """Minimal app with conditional views over projects and rules."""
+    monkeypatch.setattr(blueprint_utils, 'get_database_service', lambda: db)
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    renders = []
+
+    @app.route('/projects')
+    @conditional_view('projects')
+    def projects_view():
+        renders.append('projects')
+        return 'projects'
+
+    @app.route('/flash')
+    @conditional_view('projects')
+    def flash_view():
+        flash('saved')
+        return 'flashed'
+
+    @app.route('/daily')
+    @conditional_view('projects', daily=True)
+    def daily_view():
+        renders.append('daily')
+        return 'daily'
+
+    @app.route('/missing')
+    @conditional_view('projects', 'not_tracked')
+    def missing_view():
+        renders.append('missing')
+        return 'missing'
+
+    client = app.test_client()
+    client.renders = renders
+    return client
+
+
+def _bump(db, table, sql, params=()):
+    before = table_versions.get_table_version(db, table)
+    with db.connect() as conn:
+        conn.execute(sql, params)
+        conn.commit()
+    return table_versions.get_table_version(db, table) - before
+
+
+class TestTableVersions:
+    """Triggers maintain per-table change counters."""
+
+    def test_writes_bump_version(self, db, project_id):
+        # updated_at triggers re-update the row, so one statement may bump more than once
+        assert _bump(db, 'projects', "UPDATE projects SET name = 'Renamed' WHERE id = ?", (project_id,)) >= 1
+        assert _bump(db, 'ideas', "INSERT INTO ideas (project_id, title) VALUES (?, 'Idea')", (project_id,)) == 1
+        assert _bump(db, 'ideas', "DELETE FROM ideas WHERE project_id = ?", (project_id,)) == 1
+
+    def test_other_tables_unchanged(self, db, project_id):
+        before = table_versions.get_table_versions(db, ['rules', 'tasks'])
+
+        _bump(db, 'projects', "UPDATE projects SET name = 'Renamed' WHERE id = ?", (project_id,))
+
+        assert table_versions.get_table_versions(db, ['rules', 'tasks']) == before
+
+    def test_untracked_table_omitted(self, db):
+        assert table_versions.get_table_versions(db, ['projects', 'not_tracked']).keys() == {'projects'}
+        assert table_versions.get_table_version(db, 'not_tracked') is None
+
+
+class TestConditionalView:
+    """conditional_view answers revalidation with 304 while tables are unchanged."""
+
+    def test_emits_validators(self, client, project_id):
+        response = client.get('/projects')
+
+        assert response.status_code == 200
+        assert response.headers['ETag'].startswith('W/"')
+        assert response.headers['Last-Modified']
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert 'HX-Request' in response.headers['Vary']
+
+    def test_not_modified_skips_view(self, client, project_id):
+        etag = client.get('/projects').headers['ETag']
+
+        response = client.get('/projects', headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+        assert client.renders == ['projects']
+
+    def test_write_invalidates(self, client, db, project_id):
+        etag = client.get('/projects').headers['ETag']
+        _bump(db, 'projects', "UPDATE projects SET name = 'Renamed' WHERE id = ?", (project_id,))
+
+        response = client.get('/projects', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_unrelated_write_keeps_etag(self, client, db, project_id):
+        etag = client.get('/projects').headers['ETag']
+        with db.connect() as conn:
+            conn.execute("DELETE FROM rules")
+            conn.commit()
+
+        assert client.get('/projects', headers={'If-None-Match': etag}).status_code == 304
+
+    def test_htmx_fragment_keyed_separately(self, client, project_id):
+        page = client.get('/projects').headers['ETag']
+        fragment = client.get('/projects', headers={'HX-Request': 'true'}).headers['ETag']
+
+        assert page != fragment
+        assert client.get('/projects', headers={'If-None-Match': fragment}).status_code == 200
+
+    def test_query_string_keyed_separately(self, client, project_id):
+        etag = client.get('/projects?status=active').headers['ETag']
+
+        assert client.get('/projects?status=done', headers={'If-None-Match': etag}).status_code == 200
+
+    def test_untracked_table_serves_uncached(self, client, project_id):
+        first = client.get('/missing')
+        second = client.get('/missing', headers={'If-None-Match': '*'})
+
+        assert 'ETag' not in first.headers
+        assert second.status_code == 200
+        assert client.renders == ['missing', 'missing']
+
+    def test_pending_flash_serves_uncached(self, client, project_id):
+        client.get('/flash')
+
+        response = client.get('/projects', headers={'If-None-Match': '*'})
+
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+
+    def test_daily_view_changes_with_date(self, client, project_id, monkeypatch):
+        class Today(date):
+            current = date(2026, 10, 19)
+
+            @classmethod
+            def today(cls):
+                return cls.current
+
+        monkeypatch.setattr(blueprint_utils, 'date', Today)
+        etag = client.get('/daily').headers['ETag']
+        assert client.get('/daily', headers={'If-None-Match': etag}).status_code == 304
+
+        Today.current = date(2026, 10, 20)
+        response = client.get('/daily', headers={'If-None-Match': etag})
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert client.renders == ['daily', 'daily']
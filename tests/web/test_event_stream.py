@@ -0,0 +1,201 @@
+"""
+Tests for the live session event stream (web/utils/event_stream.py).
+
+Covers:
+- Incremental tail of session_events by last-seen id (get_events_after)
+- Hub fan-out with per-subscriber filters, skipped queries while unchanged
+- Backfill on reconnect (Last-Event-ID) and overflow reset
+- SSE endpoint framing and argument validation
+"""
+
+import json
+
+import pytest
+from flask import Flask
+
+from agentpm.core.database.methods import events as event_methods
+from agentpm.core.events.models import EventCategory
+from agentpm.core.database.service import DatabaseService
+from agentpm.web.utils import event_stream
+from agentpm.web.utils.event_stream import EventFilter, EventStreamHub
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseService(str(tmp_path / "events.db"))
+    with db.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'Live', '/tmp/live')")
+        conn.execute(
+            "INSERT INTO sessions (id, session_id, project_id, tool_name, start_time) "
+            "VALUES (1, 'session-1', 1, 'manual', CURRENT_TIMESTAMP)"
+        )
+        conn.commit()
+    return db
+
+
+@pytest.fixture
+def hub(db):
+    hub = EventStreamHub(heartbeat_interval=0.01)
+    hub.configure(database=lambda: db)
+    return hub
+
+
+def _record(db, count=1, category='workflow', event_type='task.started', task_id=None):
+    with db.connect() as conn:
+        for _ in range(count):
+            conn.execute(
+                "INSERT INTO session_events (project_id, event_type, event_category, event_severity, "
+                "session_id, timestamp, source, event_data, task_id) "
+                "VALUES (1, ?, ?, 'info', 1, CURRENT_TIMESTAMP, 'test', '{}', ?)",
+                (event_type, category, task_id)
+            )
+        conn.commit()
+
+
+class TestEventsAfter:
+    """get_events_after reads only rows newer than the last id seen."""
+
+    def test_tail_in_id_order(self, db):
+        _record(db, 3)
+
+        first = event_methods.get_events_after(db, 0, limit=2)
+        rest = event_methods.get_events_after(db, first[-1].id)
+
+        assert [e.id for e in first + rest] == [1, 2, 3]
+        assert event_methods.get_latest_event_id(db) == 3
+
+    def test_filters(self, db):
+        _record(db, 1, task_id=None)
+        _record(db, 1, category='error', event_type='error.encountered')
+
+        assert len(event_methods.get_events_after(db, 0, task_id=None)) == 2
+        errors = event_methods.get_events_after(db, 0, event_categories=[EventCategory.ERROR])
+        assert [e.id for e in errors] == [2]
+        assert event_methods.get_events_after(db, 0, up_to_event_id=1)[0].id == 1
+
+
+class TestEventStreamHub:
+    """One shared poll fans new events out to matching subscribers."""
+
+    def test_dispatch_to_matching_subscribers(self, hub, db):
+        everything = hub.subscribe(EventFilter(), start=False)
+        errors = hub.subscribe(EventFilter(categories=frozenset({'error'})), start=False)
+
+        _record(db, 2)
+        _record(db, 1, category='error', event_type='error.encountered')
+        assert hub.poll_once() == 3
+
+        assert [e.id for e in everything.get(timeout=0)] == [1, 2, 3]
+        assert [e.id for e in errors.get(timeout=0)] == [3]
+
+    def test_only_new_events_delivered(self, hub, db):
+        _record(db, 2)
+        subscription = hub.subscribe(EventFilter(), start=False)
+
+        _record(db, 1)
+        hub.poll_once()
+
+        assert [e.id for e in subscription.get(timeout=0)] == [3]
+
+    def test_unchanged_version_skips_query(self, hub, db):
+        hub.subscribe(EventFilter(), start=False)
+        _record(db, 1)
+        hub.poll_once()
+        queries = hub.queries
+
+        for _ in range(5):
+            assert hub.poll_once() == 0
+
+        assert hub.queries == queries
+        assert hub.stats()['polls'] == 6
+
+    def test_reconnect_backfills_from_last_event_id(self, hub, db):
+        hub.subscribe(EventFilter(), start=False)
+        _record(db, 4)
+        hub.poll_once()
+
+        resumed = hub.subscribe(EventFilter(), last_event_id=2, start=False)
+        _record(db, 1)
+        hub.poll_once()
+
+        assert [e.id for e in resumed.get(timeout=0)] == [3, 4, 5]
+
+    def test_slow_subscriber_overflows(self, db):
+        hub = EventStreamHub(queue_size=2)
+        hub.configure(database=lambda: db)
+        subscription = hub.subscribe(EventFilter(), start=False)
+
+        _record(db, 3)
+        hub.poll_once()
+
+        assert subscription.overflowed
+        stream = event_stream.stream_events(subscription, hub)
+        messages = [next(stream) for _ in range(4)]
+        assert messages[-1].startswith("event: reset")
+        assert next(stream, None) is None
+        assert hub.stats()['subscribers'] == 0
+
+    def test_unsubscribe(self, hub):
+        subscription = hub.subscribe(EventFilter(), start=False)
+
+        hub.unsubscribe(subscription)
+
+        assert hub.stats()['subscribers'] == 0
+
+
+class TestStreamEndpoint:
+    """/context/events/stream serves text/event-stream."""
+
+    @pytest.fixture
+    def client(self, hub, monkeypatch):
+        from agentpm.web.blueprints.context import context_bp, events
+
+        monkeypatch.setattr(events, 'event_hub', hub)
+        monkeypatch.setattr(event_stream, 'event_hub', hub)
+        app = Flask(__name__)
+        app.register_blueprint(context_bp)
+        return app.test_client()
+
+    def test_streams_backfilled_events(self, client, hub, db):
+        hub.subscribe(EventFilter(), start=False)
+        _record(db, 2, task_id=None)
+        hub.poll_once()
+
+        response = client.get('/context/events/stream?project_id=1', headers={'Last-Event-ID': '0'})
+        chunks = response.response
+        assert response.mimetype == 'text/event-stream'
+        assert next(chunks).decode().startswith('retry:')
+        message = next(chunks).decode()
+        response.close()
+
+        assert message.startswith('id: 1\nevent: workflow\n')
+        data = json.loads(message.split('data: ', 1)[1])
+        assert data['event_type'] == 'task.started'
+        assert data['project_id'] == 1
+
+    def test_idle_stream_sends_keep_alive(self, client):
+        response = client.get('/context/events/stream')
+        chunks = response.response
+        next(chunks)
+
+        assert next(chunks) == b': keep-alive\n\n'
+        response.close()
+
+    def test_category_filter(self, client, hub, db):
+        hub.subscribe(EventFilter(), start=False)
+        _record(db, 1)
+        _record(db, 1, category='tool_usage', event_type='tool.read_file')
+        hub.poll_once()
+
+        response = client.get('/context/events/stream?category=tool_usage&last_event_id=0')
+        chunks = response.response
+        next(chunks)
+        message = next(chunks).decode()
+        response.close()
+
+        assert message.startswith('id: 2\nevent: tool_usage\n')
+
+    def test_unknown_category_rejected(self, client):
+        response = client.get('/context/events/stream?category=nonsense')
+
+        assert response.status_code == 400
@@ -0,0 +1,159 @@
+"""
+Tests for the streaming list APIs (row_pages + web/utils/json_stream.py).
+
+Covers:
+- Keyset pages of projected row views and their validation
+- JSON and NDJSON bodies, field projection, cursor walk, gzip encoding
+- Document content excluded from list payloads
+"""
+
+import gzip
+import json
+
+import pytest
+from flask import Flask
+
+from agentpm.core.database.methods import row_pages
+from agentpm.core.database.service import DatabaseService
+from agentpm.web.blueprints import utils as blueprint_utils
+from agentpm.web.utils.json_stream import decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseService(str(tmp_path / "api.db"))
+    with db.connect() as conn:
+        conn.execute("INSERT INTO projects (id, name, path) VALUES (1, 'API', '/tmp/api')")
+        conn.execute(
+            "INSERT INTO work_items (id, project_id, name, type, status, priority) "
+            "VALUES (1, 1, 'Checkout', 'feature', 'active', 1)"
+        )
+        conn.executemany(
+            "INSERT INTO tasks (work_item_id, name, type, status, priority) VALUES (1, ?, 'implementation', ?, 2)",
+            [(f"Task {i}", 'active' if i % 2 else 'draft') for i in range(25)]
+        )
+        conn.executemany(
+            "INSERT INTO document_references (entity_type, entity_id, file_path, title, content) "
+            "VALUES ('work_item', 1, ?, ?, ?)",
+            [(f"docs/planning/requirements/doc-{i}.md", f"Doc {i}", "x" * 10_000) for i in range(3)]
+        )
+        conn.execute("INSERT INTO ideas (project_id, title, tags) VALUES (1, 'Faster lists', '[\"perf\"]')")
+        conn.commit()
+    return db
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from agentpm.web.blueprints.documents import documents_bp
+    from agentpm.web.blueprints.ideas import ideas_bp
+    from agentpm.web.blueprints.tasks import tasks_bp
+    from agentpm.web.blueprints.work_items import work_items_bp
+
+    monkeypatch.setattr(blueprint_utils, 'get_database_service', lambda: db)
+    app = Flask(__name__)
+    for blueprint in (documents_bp, ideas_bp, tasks_bp, work_items_bp):
+        app.register_blueprint(blueprint)
+    return app.test_client()
+
+
+class TestRowPages:
+    """page_rows returns keyset pages of row views."""
+
+    def test_pages_cover_all_rows_once(self, db):
+        seen, after = [], 0
+        while after is not None:
+            rows, after = row_pages.page_rows(db, 'tasks', after_id=after, limit=10)
+            seen.extend(row.id for row in rows)
+
+        assert seen == list(range(1, 26))
+
+    def test_filters_and_projection(self, db):
+        rows, after = row_pages.page_rows(db, 'tasks', {'status': 'active'}, columns=('name',))
+
+        assert after is None
+        assert len(rows) == 12
+        assert set(rows[0].to_dict()) == {'id', 'name'}
+
+    @pytest.mark.parametrize('kwargs', [
+        {'entity': 'secrets'},
+        {'entity': 'tasks', 'limit': 0},
+        {'entity': 'tasks', 'columns': ('name; DROP TABLE tasks',)},
+        {'entity': 'tasks', 'filters': {'nope': 1}},
+        {'entity': 'documents', 'columns': ('content',)},
+    ])
+    def test_invalid_arguments(self, db, kwargs):
+        with pytest.raises(ValueError):
+            row_pages.page_rows(db, **kwargs)
+
+
+class TestCursor:
+    """Cursors are opaque and validated."""
+
+    def test_round_trip(self):
+        assert decode_cursor(encode_cursor(42)) == 42
+        assert decode_cursor(None) == 0
+        assert encode_cursor(None) is None
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            decode_cursor('not-a-cursor')
+
+
+class TestListApis:
+    """List endpoints stream projected pages."""
+
+    def test_documents_exclude_content(self, client):
+        response = client.get('/documents/api/documents')
+        body = response.get_json()
+
+        assert body['success'] is True
+        assert body['count'] == 3
+        assert body['next_cursor'] is None
+        assert 'content' not in body['documents'][0]
+        assert body['documents'][0]['entity_type'] == 'work_item'
+        assert len(response.data) < 3 * 10_000
+
+    def test_field_projection(self, client):
+        body = client.get('/documents/api/documents?fields=title,updated_at').get_json()
+
+        assert set(body['documents'][0]) == {'id', 'title', 'updated_at'}
+
+    def test_cursor_walk(self, client):
+        names, url = [], '/tasks/api/tasks?limit=10&fields=name'
+        while url:
+            response = client.get(url)
+            body = response.get_json()
+            names.extend(task['name'] for task in body['tasks'])
+            url = response.headers.get('Link', '').partition('<')[2].partition('>')[0]
+            assert bool(url) == bool(body['next_cursor'])
+
+        assert len(names) == 25
+
+    def test_ndjson(self, client):
+        response = client.get('/tasks/api/tasks?status=active&limit=5&format=ndjson')
+        lines = response.data.decode().splitlines()
+
+        assert response.mimetype == 'application/x-ndjson'
+        assert len(lines) == 5
+        assert json.loads(lines[0])['status'] == 'active'
+        assert response.headers['X-Next-Cursor']
+
+    def test_ndjson_by_accept_header(self, client):
+        response = client.get('/ideas/api/ideas', headers={'Accept': 'application/x-ndjson'})
+
+        assert json.loads(response.data)['tags'] == ['perf']
+
+    def test_gzip(self, client):
+        response = client.get('/work-items/api/work-items', headers={'Accept-Encoding': 'gzip'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(response.data))['work_items'][0]['name'] == 'Checkout'
+        assert 'Content-Encoding' not in client.get('/work-items/api/work-items?gzip=0',
+                                                    headers={'Accept-Encoding': 'gzip'}).headers
+
+    @pytest.mark.parametrize('query', ['fields=secret', 'cursor=bogus', 'limit=5000', 'limit=ten'])
+    def test_invalid_parameters(self, client, query):
+        response = client.get(f'/tasks/api/tasks?{query}')
+
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
@@ -0,0 +1,205 @@
+"""
+Tests for the markdown render cache (web/utils/markdown.py).
+
+Covers:
+- Cached renders match uncached renders and are not re-rendered
+- LRU eviction, variants keyed separately, hit-rate statistics
+- Registered in CACHE_REGISTRY as 'web.markdown_render'
+- Markdown instance reuse across renders (reset() state isolation)
+- Persistent rendered_markdown layer: prerender on write, read on miss
+- Renderer version in the cache key; throttled pruning
+"""
+
+import pytest
+
+from agentpm.core.database.methods import rendered_markdown
+from agentpm.core.database.service import DatabaseService
+from agentpm.core.performance import CACHE_REGISTRY
+from agentpm.web.utils import markdown as md_utils
+
+
+SOURCE = """# Design
+
+```python
+def handler(event):
+    return event
+```
+
+| Column | Value |
+|--------|-------|
+| a      | 1     |
+
+Detail[^1]
+
+[^1]: Footnote
+"""
+
+
+@pytest.fixture(autouse=True)
+def render_cache(monkeypatch):
+    """Fresh, in-process only render cache per test."""
+    cache = md_utils.MarkdownRenderCache(maxsize=8)
+    monkeypatch.setattr(md_utils, 'render_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def db(tmp_path):
+    return DatabaseService(str(tmp_path / "render.db"))
+
+
+def _count_renders(monkeypatch):
+    calls = []
+    original = md_utils._render_html
+    monkeypatch.setattr(
+        md_utils, '_render_html',
+        lambda text, safe_mode, prose_class: calls.append(text) or original(text, safe_mode, prose_class)
+    )
+    return calls
+
+
+class TestRenderCache:
+    """Test in-process caching of rendered markdown."""
+
+    def test_cached_render_matches_uncached(self, render_cache):
+        first = md_utils.render_markdown(SOURCE)
+        second = md_utils.render_markdown(SOURCE)
+
+        assert first == second
+        assert str(first) == md_utils._render_html(SOURCE, False, "prose prose-slate max-w-none")
+        assert 'class="highlight"' in first
+
+    def test_repeated_render_skips_markdown(self, render_cache, monkeypatch):
+        calls = _count_renders(monkeypatch)
+
+        for _ in range(5):
+            md_utils.render_markdown(SOURCE)
+
+        assert len(calls) == 1
+        assert render_cache.stats()['hits'] == 4
+        assert render_cache.stats()['hit_rate'] == 0.8
+
+    def test_variants_cached_separately(self, render_cache):
+        default = md_utils.render_markdown(SOURCE)
+        large = md_utils.render_markdown_large(SOURCE)
+        toc = md_utils.get_markdown_toc(SOURCE)
+
+        assert default != large
+        assert "prose-lg" in large
+        assert 'href="#design"' in toc
+        assert render_cache.stats()['size'] == 3
+
+    def test_lru_eviction(self, render_cache, monkeypatch):
+        calls = _count_renders(monkeypatch)
+        for i in range(10):
+            md_utils.render_markdown(f"Paragraph {i}")
+
+        md_utils.render_markdown("Paragraph 9")  # most recent - cached
+        md_utils.render_markdown("Paragraph 0")  # evicted - rendered again
+
+        assert render_cache.stats()['size'] == 8
+        assert calls.count("Paragraph 9") == 1
+        assert calls.count("Paragraph 0") == 2
+
+    def test_reported_in_cache_registry(self, render_cache):
+        md_utils.render_markdown("Registered")
+        md_utils.render_markdown("Registered")
+
+        stats = CACHE_REGISTRY.stats()['web.markdown_render']
+        assert stats['hits'] >= 1
+        assert render_cache.stats()['hits'] == 1
+
+    def test_configure_shrinks_cache(self, render_cache):
+        for i in range(8):
+            md_utils.render_markdown(f"Paragraph {i}")
+
+        md_utils.configure_render_cache(maxsize=3)
+
+        assert render_cache.stats()['size'] == 3
+        assert render_cache.stats()['maxsize'] == 3
+
+    def test_markdown_instances_reset_between_renders(self):
+        first = md_utils._render_html(SOURCE, False, "p")
+        second = md_utils._render_html(SOURCE, False, "p")
+
+        # Footnote ids and TOC state do not leak from the previous conversion
+        assert first == second
+        assert first.count('id="fn:1"') == 1
+
+
+class TestPersistentLayer:
+    """Test the rendered_markdown table as second cache level."""
+
+    def test_prerender_stores_large_variant(self, render_cache, db):
+        render_cache.configure(database=lambda: db)
+
+        md_utils.prerender_markdown(SOURCE)
+
+        stored = rendered_markdown.get_rendered_html(
+            db, *md_utils._cache_key(SOURCE, md_utils._variant(md_utils._LARGE_PROSE_CLASS, False))
+        )
+        assert stored == str(md_utils.render_markdown_large(SOURCE))
+        assert render_cache.stats()['hits'] == 1
+
+    def test_persistent_hit_after_restart(self, db, monkeypatch):
+        first = md_utils.MarkdownRenderCache()
+        first.configure(database=lambda: db)
+        monkeypatch.setattr(md_utils, 'render_cache', first)
+        md_utils.prerender_markdown(SOURCE)
+
+        # New process: empty in-process cache, same database
+        restarted = md_utils.MarkdownRenderCache()
+        restarted.configure(database=lambda: db)
+        monkeypatch.setattr(md_utils, 'render_cache', restarted)
+        calls = _count_renders(monkeypatch)
+
+        html = md_utils.render_markdown_large(SOURCE)
+
+        assert calls == []
+        assert 'prose-lg' in html
+        assert restarted.stats()['persistent_hits'] == 1
+
+    def test_renderer_version_bump_misses_stored_html(self, db, monkeypatch):
+        stale = md_utils.MarkdownRenderCache()
+        stale.configure(database=lambda: db)
+        monkeypatch.setattr(md_utils, 'render_cache', stale)
+        md_utils.prerender_markdown(SOURCE)
+
+        monkeypatch.setattr(md_utils, 'RENDER_VERSION', md_utils.RENDER_VERSION + '-next')
+        upgraded = md_utils.MarkdownRenderCache()
+        upgraded.configure(database=lambda: db)
+        monkeypatch.setattr(md_utils, 'render_cache', upgraded)
+        calls = _count_renders(monkeypatch)
+
+        md_utils.render_markdown_large(SOURCE)
+
+        assert calls == [SOURCE]
+        assert upgraded.stats()['persistent_hits'] == 0
+
+    def test_prune_throttled(self, db, monkeypatch):
+        prunes = []
+        monkeypatch.setattr(rendered_markdown, 'prune_rendered_html', lambda service: prunes.append(service))
+        cache = md_utils.MarkdownRenderCache(prune_every=3)
+        cache.configure(database=lambda: db)
+
+        for i in range(8):
+            cache.store(f"doc {i}", "v", f"<p>{i}</p>", persist=True)
+
+        assert len(prunes) == 3  # writes 1, 4 and 7
+        assert rendered_markdown.get_rendered_html_stats(db)['entries'] == 8
+
+    def test_prune_keeps_newest(self, db):
+        for i in range(5):
+            rendered_markdown.put_rendered_html(db, f"{i:064d}", "v", f"<p>{i}</p>")
+
+        assert rendered_markdown.prune_rendered_html(db, max_entries=3) == 2
+        assert rendered_markdown.get_rendered_html_stats(db)['entries'] == 3
+
+    def test_unavailable_store_falls_back_to_rendering(self, render_cache):
+        def broken():
+            raise RuntimeError("no database")
+
+        render_cache.configure(database=broken)
+
+        assert "<h1" in md_utils.render_markdown(SOURCE)
+        md_utils.prerender_markdown(SOURCE)  # logged, not raised